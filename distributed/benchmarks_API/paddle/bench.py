@@ -0,0 +1,20 @@
+#!/bin/env python
+# -*- coding: utf-8 -*-
+"""
+bench: 一次启动执行config.yaml中全部api的全部case
+"""
+import all_gather  # noqa: F401
+import all_reduce  # noqa: F401
+import alltoall  # noqa: F401
+import alltoall_single  # noqa: F401
+import broadcast  # noqa: F401
+import reduce  # noqa: F401
+import reduce_scatter  # noqa: F401
+import scatter  # noqa: F401
+import send_recv  # noqa: F401
+
+from bench_core import main
+
+
+if __name__ == "__main__":
+    main()
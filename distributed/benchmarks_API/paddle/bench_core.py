@@ -0,0 +1,172 @@
+#!/bin/env python
+# -*- coding: utf-8 -*-
+"""
+bench_core: 集合通信benchmark公共逻辑, 各api脚本只负责构造单步通信函数
+"""
+import argparse
+import time
+import yaml
+
+import paddle
+import paddle.distributed as dist
+
+# api名 -> build(config, n_ele, nranks, rank), 返回执行一次通信的函数
+BUILDERS = {}
+
+# busbw = 实际通信字节数 / cost * factor, 与nccl-tests的换算方式一致
+BUS_FACTOR = {
+    "all_reduce": lambda n: 2.0 * (n - 1) / n,
+    "all_gather": lambda n: (n - 1) / n,
+    "reduce_scatter": lambda n: (n - 1) / n,
+    "alltoall": lambda n: (n - 1) / n,
+    "alltoall_single": lambda n: (n - 1) / n,
+    "scatter": lambda n: (n - 1) / n,
+    "broadcast": lambda n: 1.0,
+    "reduce": lambda n: 1.0,
+    "send_recv": lambda n: 1.0,
+}
+
+# 这些api每个rank只有n_ele个元素(b / nranks字节), busbw按实际通信的字节数计算
+# all_gather等api的总数据量为b字节, 按b计算; algbw保持legacy的b / cost, 与base_value可比
+PER_RANK_BUFFER = ("all_reduce", "broadcast", "reduce", "send_recv")
+
+
+def register(api):
+    """注册api的build函数"""
+
+    def wrapper(build):
+        BUILDERS[api] = build
+        return build
+
+    return wrapper
+
+
+def payload(shape, value=0, dtype="float32"):
+    """直接在设备上分配通信数据, 避免先构造python list"""
+    if isinstance(shape, int):
+        shape = [shape]
+    if value == 0:
+        return paddle.zeros(shape, dtype=dtype)
+    return paddle.full(shape, value, dtype=dtype)
+
+
+def byte_sweep(begin=1024, end=1 << 30):
+    """begin到end之间2的幂次的字节数"""
+    res = []
+    b = begin
+    while b <= end:
+        res.append(b)
+        b *= 2
+    return res
+
+
+def size_name(b):
+    """字节数显示名, 与base_value中的key保持一致"""
+    if b < 1048576:  # 1MB
+        return str(b // 1024) + "KB"
+    return str(b // 1024 // 1024) + "MB"
+
+
+def synchronize():
+    """等待设备上的计算完成, cpu(gloo)下无需同步"""
+    if paddle.is_compiled_with_cuda() and paddle.get_device().startswith("gpu"):
+        paddle.device.cuda.synchronize()
+
+
+def _wait(task):
+    """异步通信返回task时等待其完成"""
+    if task is not None and hasattr(task, "wait"):
+        task.wait()
+
+
+def timeit(step, warms, epochs):
+    """
+    :return: 单次通信的平均耗时(秒)
+    """
+    task = None
+    for _ in range(warms):
+        task = step()
+    _wait(task)
+    synchronize()
+    dist.barrier()
+
+    start = time.perf_counter()
+    for _ in range(epochs):
+        task = step()
+    _wait(task)
+    synchronize()
+    return (time.perf_counter() - start) / epochs
+
+
+def run_case(api, case, config, byte_to_test, warms, epochs):
+    """
+    执行单个case的字节数扫描
+    :return: {case: {size_name: {"time": 秒, "algbw": GB/s, "busbw": GB/s}}}
+    """
+    nranks = dist.get_world_size()
+    rank = dist.get_rank()
+    factor = BUS_FACTOR[api](nranks)
+
+    time_list = {case: {}}
+    for b in byte_to_test:
+        n_ele = b // 4 // nranks
+        step = BUILDERS[api](config, n_ele, nranks, rank)
+        cost = timeit(step, warms, epochs)
+        algbw = b / 1_000_000_000 / cost
+        moved = n_ele * 4 if api in PER_RANK_BUFFER else b
+        busbw = moved / 1_000_000_000 / cost * factor
+        time_list[case][size_name(b)] = {"time": cost, "algbw": algbw, "busbw": busbw}
+        del step
+    return time_list
+
+
+def _skip_reason(api, config, device, nranks):
+    """当前环境下无法执行的case"""
+    if device == "cpu" and config.get("use_calc_stream") is True:
+        return "use_calc_stream is not supported on cpu"
+    if api == "send_recv" and nranks % 2 != 0:
+        return "send_recv requires an even number of ranks"
+    if api in ("broadcast", "scatter") and nranks < 2:
+        return "src=1 requires at least 2 ranks"
+    return None
+
+
+def main(apis=None):
+    """
+    一次启动执行config.yaml中指定api的全部case, rank 0每个case输出一行结果
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--api", default=None, help="逗号分隔的api名, 默认全部")
+    parser.add_argument("--case_name", default=None, help="只执行指定case, 默认全部")
+    parser.add_argument("--config", default="config.yaml")
+    parser.add_argument("--device", default="gpu", help="gpu(nccl) 或 cpu(gloo)")
+    parser.add_argument("--begin", type=int, default=1024)  # 1KB
+    parser.add_argument("--end", type=int, default=1 << 30)  # 1GB
+    parser.add_argument("--warms", type=int, default=5)
+    parser.add_argument("--epochs", type=int, default=20)
+    args = parser.parse_args()
+
+    with open(args.config, "rb") as f:
+        yaml_config = yaml.load(f, Loader=yaml.FullLoader)
+    if args.api is not None:
+        apis = args.api.split(",")
+    elif apis is None:
+        apis = [api for api in yaml_config if api in BUILDERS]
+
+    paddle.set_device(args.device)
+    dist.init_parallel_env()
+    nranks = dist.get_world_size()
+    byte_to_test = byte_sweep(args.begin, args.end)
+
+    for api in apis:
+        for case, config in yaml_config[api].items():
+            if args.case_name is not None and case != args.case_name:
+                continue
+            reason = _skip_reason(api, config, args.device, nranks)
+            if reason is not None:
+                if dist.get_rank() == 0:
+                    print(f"skip {case}: {reason}", flush=True)
+                continue
+            res = run_case(api, case, config, byte_to_test, args.warms, args.epochs)
+            if dist.get_rank() == 0:
+                print(res, flush=True)
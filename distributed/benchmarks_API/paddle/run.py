@@ -3,6 +3,7 @@
 """
 run.py
 """
+import argparse
 import subprocess
 import os
 
@@ -34,18 +35,17 @@ def get_average(file_loops, case):
             for key, value in eval(line).items():
                 for num, item in value.items():
                     if num not in counters:
-                        counters[num] = {"time": 1, "algbw": 1}
-                        averages[num] = {"time": item["time"], "algbw": item["algbw"]}
+                        counters[num] = 1
+                        averages[num] = dict(item)
                     else:
-                        counters[num]["time"] += 1
-                        counters[num]["algbw"] += 1
-                        averages[num]["time"] += item["time"]
-                        averages[num]["algbw"] += item["algbw"]
+                        counters[num] += 1
+                        for metric, v in item.items():
+                            averages[num][metric] += v
 
-    # 计算每个数字对应的平均值
+    # 计算每个数字对应的平均值, time/algbw/busbw均取均值
     for key, value in counters.items():
-        averages[key]["time"] /= counters[key]["time"]
-        averages[key]["algbw"] /= counters[key]["algbw"]
+        for metric in averages[key]:
+            averages[key][metric] /= value
 
     # 关闭文件
     f.close()
@@ -56,7 +56,6 @@ def get_average(file_loops, case):
         f.write(str(avg_res) + "\n")
         f.flush()
 
-    os.system("rm -rf ./log")
     return avg_res
 
 
@@ -72,6 +71,9 @@ def compare(case, res_dict):
     diff_exp = {}
     for key, value in res_dict.items():
         for num, item in value.items():
+            # 基线只记录了部分字节数, 其余字节数只输出结果不做对比
+            if num not in base_dict[key]:
+                continue
             time_diff = round((item["time"] - base_dict[key][num]["time"]) / base_dict[key][num]["time"] * 100, 2)
             algbw_diff = round((item["algbw"] - base_dict[key][num]["algbw"]) / base_dict[key][num]["algbw"] * 100, 2)
             diff_dict[num] = {"time": str(time_diff) + "%", "algbw": str(algbw_diff) + "%"}
@@ -109,8 +111,8 @@ def gather_dict(case):
             if line.find("'" + case + "'") != -1:
                 all_dict[key] = eval(line.strip("\n"))[case]
                 for num, item in all_dict[key].items():
-                    all_dict[key][num]["time_" + key] = all_dict[key][num].pop("time")
-                    all_dict[key][num]["algbw_" + key] = all_dict[key][num].pop("algbw")
+                    for metric in list(item):
+                        item[metric + "_" + key] = item.pop(metric)
     f.close()
     # print(all_dict)
 
@@ -140,26 +142,43 @@ def gather_dict(case):
 
 def main():
     """main"""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--device", default="gpu", help="gpu(nccl) 或 cpu(gloo)")
+    parser.add_argument("--devices", default="0,1,2,3,4,5,6,7", help="gpu卡号")
+    parser.add_argument("--nproc", type=int, default=4, help="cpu下的进程数")
+    parser.add_argument("--end", type=int, default=1 << 30, help="最大测试字节数")
+    args = parser.parse_args()
+
     f = open("config.yaml", "rb")
     yaml_config = yaml.load(f, Loader=yaml.FullLoader)
 
+    # 每轮只启动一次分布式任务, 执行全部api的全部case
+    if args.device == "cpu":
+        launch = "python -m paddle.distributed.launch --nproc_per_node={} ".format(args.nproc)
+    else:
+        launch = "python -m paddle.distributed.launch --devices={} ".format(args.devices)
+    cmd = launch + "bench.py --device {} --end {}".format(args.device, args.end)
+    print(cmd)
+    for i in range(loops):
+        pro = subprocess.Popen(cmd, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        out, err = pro.communicate()
+        print(out)
+        pro.wait()
+        pro.returncode == 0
+
     for key, value in yaml_config.items():
         if key in api_list:
             for case in value.keys():
-                cmd = "python -m paddle.distributed.launch --devices=0,1,2,3,4,5,6,7 " + key + ".py --case_name " + case
-                print(cmd)
-                for i in range(loops):
-                    pro = subprocess.Popen(cmd, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-                    out, err = pro.communicate()
-                    print(out)
-                    pro.wait()
-                    pro.returncode == 0
                 # 求均值，写入文件mylog/log_avg
                 avg_res = get_average("./log/workerlog.0", case)
+                if not avg_res[case]:
+                    print("no result for " + case)
+                    continue
                 # 求diff，写入文件mylog/log_diff
                 compare(case, avg_res)
                 # 得出汇总结果，写入mylog/log_result
                 gather_dict(case)
+    os.system("rm -rf ./log")
 
 
 if __name__ == "__main__":
@@ -22,6 +22,8 @@ class TestRelu(APIBase):
         implement
         """
         self.types = [np.float32, np.float64]
+        # elementwise api, numeric grad can be batched
+        self.batch_grad = "stack"
         # self.debug = True
         # self.static = True
         # enable check grad
@@ -50,6 +50,10 @@ class APIBase(object):
         self.delta = 1e-6
         self.gap = 0.001
         self.rtol = 1e-7
+        # batched numeric grad, "stack" or "concat", None means scalar loop
+        # only for apis which compute every sample along axis 0 independently
+        self.batch_grad = None
+        self.grad_chunk = 64
         # choose layertypes [functional or classional]
         self._layertypes(func)
         # run hook, use user define vars and initials
@@ -488,10 +492,15 @@ class APIBase(object):
         if data is None:
             for k, v in self.kwargs.items():
                 if isinstance(v, paddle.Tensor) and k not in self.no_grad_var:
+                    batch_grad = self._batch_numeric_grad(k, v.numpy())
+                    if batch_grad is not None:
+                        numeric_grad[k] = batch_grad
+                        continue
                     grad = []
                     shape = v.numpy(False).shape
-                    for i in range(len(v.numpy().flatten())):
-                        tmp = v.numpy().flatten()
+                    flat_v = v.numpy().flatten()
+                    for i in range(len(flat_v)):
+                        tmp = flat_v.copy()
                         tmp[i] = tmp[i] + self.gap
                         tmp = tmp.reshape(shape)
                         # print(tmp)
@@ -509,25 +518,100 @@ class APIBase(object):
         else:
             # change data to correct dtype
             data = data.astype(self.dtype)
-            grad = []
-            shape = data.shape
-            for i in range(len(data.flatten())):
-                tmp = copy.deepcopy(data.flatten())
-                tmp[i] = tmp[i] + self.gap
-                tmp = tmp.reshape(shape)
-                self.data = to_tensor(tmp.astype(self.dtype))
-                # enable compute gradient
-                if self.enable_backward is True:
-                    self.data.stop_gradient = False
-                loss_delta = self._numeric_grad()
-                g = (loss_delta - loss) / self.gap
-                grad.append(g.item())
-                # recover v to self.kwargs
-                self.data = data
-            numeric_grad["data"] = np.array(grad).reshape(shape)
+            batch_grad = self._batch_numeric_grad("data", data)
+            if batch_grad is not None:
+                numeric_grad["data"] = batch_grad
+            else:
+                grad = []
+                shape = data.shape
+                for i in range(len(data.flatten())):
+                    tmp = copy.deepcopy(data.flatten())
+                    tmp[i] = tmp[i] + self.gap
+                    tmp = tmp.reshape(shape)
+                    self.data = to_tensor(tmp.astype(self.dtype))
+                    # enable compute gradient
+                    if self.enable_backward is True:
+                        self.data.stop_gradient = False
+                    loss_delta = self._numeric_grad()
+                    g = (loss_delta - loss) / self.gap
+                    grad.append(g.item())
+                    # recover v to self.kwargs
+                    self.data = data
+                numeric_grad["data"] = np.array(grad).reshape(shape)
         paddle.enable_static()
         return numeric_grad
 
+    def _batch_numeric_grad(self, k, x):
+        """batched central difference numeric grad
+
+        Args:
+            k (str): [name of perturbed input in self.kwargs, "data" means self.data]
+            x ([numpy]): [value of perturbed input]
+
+        Returns:
+            [numpy|None]: [numeric grad, None if the api can not be batched]
+        """
+        if self.batch_grad not in ("stack", "concat"):
+            return None
+        x = np.asarray(x).astype(self.dtype)
+        shape = x.shape
+        if self.batch_grad == "concat" and len(shape) == 0:
+            return None
+        flat = x.reshape(-1)
+        origin = self.data if k == "data" else self.kwargs[k]
+        grad = np.empty(flat.size, dtype=np.float64)
+        try:
+            for start in range(0, flat.size, self.grad_chunk):
+                idx = np.arange(start, min(start + self.grad_chunk, flat.size))
+                num = len(idx)
+                rows = np.arange(num)
+                # 前num行为+gap扰动, 后num行为-gap扰动
+                batch = np.tile(flat, (2 * num, 1))
+                batch[rows, idx] += self.gap
+                batch[rows + num, idx] -= self.gap
+                if self.batch_grad == "stack":
+                    batch = batch.reshape((2 * num,) + shape)
+                else:
+                    batch = batch.reshape((2 * num * shape[0],) + shape[1:])
+                tensor = to_tensor(batch)
+                # enable compute gradient
+                if self.enable_backward is True:
+                    tensor.stop_gradient = False
+                if k == "data":
+                    self.data = tensor
+                else:
+                    self.kwargs[k] = tensor
+                out = self._numeric_batch_forward()
+                if len(out.shape) == 0 or out.shape[0] % (2 * num) != 0:
+                    raise ValueError("output shape {} can not be split into {} samples".format(out.shape, 2 * num))
+                loss = paddle.mean(paddle.reshape(out, [2 * num, -1]), axis=1).numpy().astype(np.float64)
+                grad[idx] = (loss[:num] - loss[num:]) / self.gap / 2
+        except Exception as e:
+            logging.info("[grad] batch numeric grad is not supported, use scalar loop: " + str(e))
+            return None
+        finally:
+            # recover origin input
+            if k == "data":
+                self.data = origin
+            else:
+                self.kwargs[k] = origin
+        return grad.reshape(shape)
+
+    def _numeric_batch_forward(self):
+        """
+        _numeric_batch_forward
+        Returns:
+            output used for batched loss
+        """
+        if self.__layertype == "func":
+            res = self.func(**self.kwargs)
+        else:
+            obj = self.func(**self.kwargs)
+            res = obj(self.data)
+        if isinstance(res, (list, tuple)):
+            res = res[0]
+        return res
+
     def _numeric_grad(self):
         """
         _numeric_grad
@@ -20,6 +20,8 @@ class Test(APIBase):
         implement
         """
         self.types = [np.float32, np.float64]
+        # elementwise api, numeric grad can be batched
+        self.batch_grad = "stack"
         # self.debug = True
         # self.static = True
         # enable check grad
@@ -5,6 +5,7 @@
 conftest
 """
 import os
+import sys
 import pytest
 import allure
 
@@ -43,3 +44,13 @@ def testing(request):
 def device_place_id(request):
     """testing"""
     return request.config.getoption("--device_place_id")
+
+
+def pytest_terminal_summary(terminalreporter):
+    """输出动转静program缓存与case输入/参数缓存的命中统计"""
+    e2e_case_table = sys.modules.get("tools.e2e_case_table")
+    if e2e_case_table is not None:
+        terminalreporter.write_line(f"e2e program cache: {e2e_case_table.PROGRAM_CACHE.stats()}")
+    builder_cache = sys.modules.get("generator.builder_cache")
+    if builder_cache is not None and builder_cache.cache_enabled():
+        terminalreporter.write_line(f"case cache: {builder_cache.CASE_CACHE.stats()}")
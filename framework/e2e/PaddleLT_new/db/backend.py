@@ -0,0 +1,109 @@
+#!/bin/env python3
+# -*- coding: utf-8 -*-
+# encoding=utf-8 vi:ts=4:sw=4:expandtab:ft=python
+"""
+db backend: 屏蔽mysql与sqlite的差异, 供DB类使用
+"""
+
+import os
+import sqlite3
+
+
+class MysqlBackend(object):
+    """pymysql后端"""
+
+    placeholder = "%s"
+
+    def __init__(self, host, port, user, password, database):
+        import pymysql
+
+        self.pymysql = pymysql
+        self.conn = pymysql.connect(
+            host=host, port=port, user=user, password=password, database=database, charset="utf8"
+        )
+
+    def cursor(self):
+        """普通cursor"""
+        return self.conn.cursor()
+
+    def stream_cursor(self):
+        """服务端cursor, 结果逐行从服务端读取"""
+        return self.conn.cursor(self.pymysql.cursors.SSCursor)
+
+    def last_id(self, cursor):
+        """最近一次插入的id"""
+        return self.conn.insert_id()
+
+    def ensure_table(self, table, data):
+        """mysql表结构由平台维护, 不做处理"""
+        pass
+
+    def ping(self):
+        """断线重连"""
+        self.conn.ping(True)
+
+
+class SqliteBackend(object):
+    """sqlite后端, 用于无mysql服务的离线环境, 表和列在首次写入时自动创建"""
+
+    placeholder = "?"
+
+    def __init__(self, path):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self._columns = {}
+
+    def cursor(self):
+        """普通cursor"""
+        return self.conn.cursor()
+
+    def stream_cursor(self):
+        """sqlite cursor本身即按需逐行读取"""
+        return self.conn.cursor()
+
+    def last_id(self, cursor):
+        """最近一次插入的id"""
+        return cursor.lastrowid
+
+    def ensure_table(self, table, data):
+        """
+        表不存在时创建, 缺少的列按首次写入的值类型自动补齐
+        列带类型亲和性, 保证 "base = '1'" 这类条件与mysql行为一致
+        """
+        if table not in self._columns:
+            self.conn.execute("CREATE TABLE IF NOT EXISTS `{}` (`id` INTEGER PRIMARY KEY AUTOINCREMENT)".format(table))
+            self._columns[table] = {row[1] for row in self.conn.execute("PRAGMA table_info(`{}`)".format(table))}
+        for column, value in data.items():
+            if column not in self._columns[table]:
+                if isinstance(value, (bool, int)):
+                    column_type = "INTEGER"
+                elif isinstance(value, float):
+                    column_type = "REAL"
+                else:
+                    column_type = "TEXT"
+                self.conn.execute("ALTER TABLE `{}` ADD COLUMN `{}` {}".format(table, column, column_type))
+                self._columns[table].add(column)
+
+    def ping(self):
+        """本地文件无需重连"""
+        pass
+
+
+def connect(backend, msg_dict):
+    """
+    :param backend: "mysql" 或 "sqlite"
+    :param msg_dict: 配置信息, mysql需要host/port/user/password/db_name, sqlite需要path
+    """
+    if backend == "sqlite":
+        return SqliteBackend(msg_dict.get("path", "benchmark.db"))
+    if backend == "mysql":
+        return MysqlBackend(
+            host=msg_dict.get("host"),
+            port=msg_dict.get("port"),
+            user=msg_dict.get("user"),
+            password=msg_dict.get("password"),
+            database=msg_dict.get("db_name"),
+        )
+    raise Exception("unknown db backend: {}, only support mysql or sqlite".format(backend))
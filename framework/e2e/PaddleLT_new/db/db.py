@@ -6,11 +6,13 @@
 db object
 """
 
+import os
 import json
 import traceback
 from datetime import datetime
 import yaml
-import pymysql
+
+from db.backend import connect
 
 # from utils.logger import logger
 
@@ -22,25 +24,30 @@ class DB(object):
 
     def __init__(self, storage="storage.yaml"):
         self.storage = storage
-        host, port, user, password, database = self.load_storge()
-        self.db = pymysql.connect(host=host, port=port, user=user, password=password, database=database, charset="utf8")
-        self.cursor = self.db.cursor()
+        backend, msg_dict = self.load_storge()
+        self.backend = connect(backend, msg_dict)
+        self.db = self.backend.conn
+        self.cursor = self.backend.cursor()
+        self.p = self.backend.placeholder
         # self.now_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
     def load_storge(self):
         """
-        解析storage.yaml的内容添加到self.db
+        解析storage.yaml的内容, 返回(后端类型, 连接信息)
+        PLT_DB_BACKEND=sqlite时使用本地sqlite文件, 配置缺失时默认写入layer_benchmark.db
         """
-        with open(self.storage, "r") as f:
-            data = yaml.safe_load(f)
-        msg_dict = data.get("Config").get("layer_benchmark").get("MYSQL")
-        # msg_dict = data.get("Config").get("layer_benchmark").get("DEV")
-        host = msg_dict.get("host")
-        port = msg_dict.get("port")
-        user = msg_dict.get("user")
-        password = msg_dict.get("password")
-        database = msg_dict.get("db_name")
-        return host, port, user, password, database
+        backend = os.environ.get("PLT_DB_BACKEND", "mysql")
+        data = {}
+        if os.path.exists(self.storage):
+            with open(self.storage, "r") as f:
+                data = yaml.safe_load(f)
+        elif backend != "sqlite":
+            raise FileNotFoundError(self.storage)
+        config = data.get("Config", {}).get("layer_benchmark", {})
+        if backend == "sqlite":
+            return backend, config.get("SQLITE", {"path": "layer_benchmark.db"})
+        return backend, config.get("MYSQL")
+        # return backend, config.get("DEV")
 
     def timestamp(self):
         """
@@ -54,30 +61,61 @@ class DB(object):
         sql_table = "`" + table + "`"
         ls = [(k, data[k]) for k in data if data[k] is not None]
         keys = ",".join(("`" + i[0] + "`") for i in ls)
-        values = ",".join("%r" % i[1] for i in ls)
+        values = ",".join(self.p for _ in ls)
 
         sql = "INSERT INTO {table}({keys}) VALUES ({values})".format(table=sql_table, keys=keys, values=values)
         try:
-            self.cursor.execute(sql)
-            id = self.db.insert_id()
+            self.backend.ensure_table(table, dict(ls))
+            self.cursor.execute(sql, [i[1] for i in ls])
+            id = self.backend.last_id(self.cursor)
             self.db.commit()
         except Exception as e:
             # print(traceback.format_exc())
             print(e)
         return id
 
+    def insert_many(self, table, data_list, retry=3):
+        """
+        参数化executemany批量插入, 全部数据在同一个事务中提交
+        :param data_list: list[dict], 各dict的key相同
+        :return: 插入行数, 失败返回-1
+        """
+        if not data_list:
+            return 0
+        keys = list(data_list[0])
+        sql = "INSERT INTO `{table}`({keys}) VALUES ({values})".format(
+            table=table, keys=",".join("`" + k + "`" for k in keys), values=",".join(self.p for _ in keys)
+        )
+        rows = [[data[k] for k in keys] for data in data_list]
+        for i in range(retry):
+            try:
+                self.backend.ensure_table(table, data_list[0])
+                self.cursor.executemany(sql, rows)
+                self.db.commit()
+                return len(rows)
+            except Exception as e:
+                print(e)
+                try:
+                    self.db.rollback()
+                except Exception:
+                    pass
+                print("db ping again~~~")
+                self.backend.ping()
+                self.cursor = self.backend.cursor()
+        return -1
+
     def update(self, table, data, data_condition):
         """按照data_condition 更新数据"""
         sql_table = "`" + table + "`"
         sql = (
             "UPDATE %s SET " % sql_table
-            + ",".join("%s=%r" % (("`" + k + "`"), data[k]) for k in data)
+            + ",".join("%s=%s" % (("`" + k + "`"), self.p) for k in data)
             + " WHERE "
-            + " AND ".join("%s=%r" % (("`" + k + "`"), data_condition[k]) for k in data_condition)
+            + " AND ".join("%s=%s" % (("`" + k + "`"), self.p) for k in data_condition)
         )
 
         try:
-            self.cursor.execute(sql)
+            self.cursor.execute(sql, list(data.values()) + list(data_condition.values()))
             self.db.commit()
         except Exception as e:
             print(traceback.format_exc())
@@ -85,37 +123,29 @@ class DB(object):
 
     def update_by_id(self, table, data, id):
         """按照id 更新数据"""
-        sql_table = "`" + table + "`"
-        sql = (
-            "UPDATE %s SET " % sql_table
-            + ",".join("%s=%r" % (("`" + k + "`"), data[k]) for k in data)
-            + " WHERE "
-            + "%s=%r" % ("`id`", id)
-        )
+        self.update(table=table, data=data, data_condition={"id": id})
 
+    def select_iter(self, table, condition_list, params=()):
+        """
+        按照condition_list 查询数据, 通过流式cursor逐行返回dict, 不一次性加载全部结果
+        :param params: condition_list中占位符对应的参数
+        """
+        sql_table = "`" + table + "`"
+        sql = "SELECT * FROM %s " % sql_table + " WHERE " + " AND ".join("%s" % k for k in condition_list)
+        cursor = self.backend.stream_cursor()
         try:
-            self.cursor.execute(sql)
-            self.db.commit()
-        except Exception as e:
-            print(traceback.format_exc())
-            print(e)
+            cursor.execute(sql, params)
+            index_list = [column[0] for column in cursor.description]
+            for row in cursor:
+                yield dict(zip(index_list, row))
+        finally:
+            cursor.close()
 
     def select(self, table, condition_list):
         """按照condition_list 查询数据"""
         results = []
-        sql_table = "`" + table + "`"
-        sql = "SELECT * FROM %s " % sql_table + " WHERE " + " AND ".join("%s" % k for k in condition_list)
-
         try:
-            self.cursor.execute(sql)
-            res = self.cursor.fetchall()
-
-            index_list = self.show_list(table=table)
-            for row in res:
-                tmp = {}
-                for i, v in enumerate(row):
-                    tmp[index_list[i]] = row[i]
-                results.append(tmp)
+            results = list(self.select_iter(table=table, condition_list=condition_list))
         except Exception as e:
             print(traceback.format_exc())
             print(e)
@@ -124,19 +154,8 @@ class DB(object):
     def select_by_id(self, table, id):
         """按照id 查询数据"""
         results = []
-        sql_table = "`" + table + "`"
-        sql = "SELECT * FROM %s " % sql_table + " WHERE " + "%s=%r" % ("`id`", id)
-
         try:
-            self.cursor.execute(sql)
-            res = self.cursor.fetchall()
-
-            tmp = {}
-            index_list = self.show_list(table=table)
-            for row in res:
-                for i, v in enumerate(row):
-                    tmp[index_list[i]] = row[i]
-                results.append(tmp)
+            results = list(self.select_iter(table=table, condition_list=["`id`=" + self.p], params=(id,)))
         except Exception as e:
             print(traceback.format_exc())
             print(e)
@@ -197,7 +216,7 @@ class DB(object):
                 case_id = self.insert(table="layer_case", data=data)
                 if case_id == -1:
                     print("db ping again~~~")
-                    self.db.ping(True)
+                    self.backend.ping()
                     continue
                 else:
                     break
@@ -206,6 +225,18 @@ class DB(object):
             print(traceback.format_exc())
             print(e)
 
+    def insert_cases(self, jid, cases, create_time):
+        """
+        向case表中批量录入数据, 一个job的全部case在同一事务中写入
+        :param cases: {case_name: result}
+        """
+        data_list = [
+            {"jid": jid, "case_name": case_name, "result": result, "create_time": create_time}
+            for case_name, result in cases.items()
+        ]
+        if self.insert_many(table="layer_case", data_list=data_list) == -1:
+            raise Exception("insert layer_case failed, job id: {}".format(jid))
+
     def update_job(self, id, status, update_time):
         """数据录入完成后更新job表中的部分字段"""
         data = {"status": status, "update_time": update_time}
@@ -229,10 +260,10 @@ class DB(object):
         """返回table中的列list"""
         results = []
         sql_table = "`" + table + "`"
-        sql = "SHOW COLUMNS from {}".format(sql_table)
+        sql = "SELECT * FROM {} LIMIT 0".format(sql_table)
         try:
             self.cursor.execute(sql)
-            results = [column[0] for column in self.cursor.fetchall()]
+            results = [column[0] for column in self.cursor.description]
         except Exception as e:
             print(traceback.format_exc())
             print(e)
@@ -125,8 +125,11 @@ class LayerBenchmarkDB(object):
         self.logger.get_log().info("性能测试job_id: {}".format(latest_id))
 
         # 插入layer_case
-        for title, perf_dict in data_dict.items():
-            db.insert_case(jid=latest_id, case_name=title, result=json.dumps(perf_dict), create_time=self.now_time)
+        db.insert_cases(
+            jid=latest_id,
+            cases={title: json.dumps(perf_dict) for title, perf_dict in data_dict.items()},
+            create_time=self.now_time,
+        )
 
         if bool(error_list):
             db.update_job(id=latest_id, status="done", update_time=self.now_time)
@@ -144,9 +147,8 @@ class LayerBenchmarkDB(object):
         baseline_job = db.select_baseline_job(comment=self.baseline_comment, base=1, ci=self.ci, md5_id=self.md5_id)
         baseline_id = baseline_job["id"]
         baseline_layer_type = baseline_job["layer_type"]
-        baseline_list = db.select(table="layer_case", condition_list=["jid = {}".format(baseline_id)])
         baseline_dict = {}
-        for i in baseline_list:
+        for i in db.select_iter(table="layer_case", condition_list=["jid = " + db.p], params=(baseline_id,)):
             baseline_dict[i["case_name"]] = i
         return baseline_dict, baseline_layer_type
 
@@ -181,8 +183,11 @@ class LayerBenchmarkDB(object):
         self.logger.get_log().info("性能测试job_id: {}".format(basleine_id))
 
         # 插入layer_case
-        for title, perf_dict in data_dict.items():
-            db.insert_case(jid=basleine_id, case_name=title, result=json.dumps(perf_dict), create_time=self.now_time)
+        db.insert_cases(
+            jid=basleine_id,
+            cases={title: json.dumps(perf_dict) for title, perf_dict in data_dict.items()},
+            create_time=self.now_time,
+        )
 
         if bool(error_list):
             db.update_job(id=basleine_id, status="done", update_time=self.now_time)
@@ -47,13 +47,13 @@ class LayerEvalBM(object):
         paddle.set_default_dtype(self.model_dtype)
 
         self.layerfile = layerfile
-        self.data = BuildData(layerfile=self.layerfile).get_single_tensor()
+        self.data = BuildData(layerfile=self.layerfile, seed=self.seed).get_single_tensor()
         self.logger = Logger("LayerEvalBM")
 
     def _net_instant(self):
         """get net and data"""
         reset(self.seed)
-        net = BuildLayer(layerfile=self.layerfile).get_layer()
+        net = BuildLayer(layerfile=self.layerfile, seed=self.seed).get_layer()
         return net
 
     def _set_cinn_flags(self):
@@ -45,13 +45,13 @@ class LayerTrain(object):
     def _net_input(self):
         """get input"""
         reset(self.seed)
-        data = BuildData(layerfile=self.layerfile).get_single_data()
+        data = BuildData(layerfile=self.layerfile, seed=self.seed).get_single_data()
         return data
 
     def _net_instant(self):
         """get net"""
         reset(self.seed)
-        net = BuildLayer(layerfile=self.layerfile).get_layer()
+        net = BuildLayer(layerfile=self.layerfile, seed=self.seed).get_layer()
         return net
 
     def _net_optimizer(self):
@@ -73,19 +73,19 @@ class LayerTrain(object):
     def _net_input_and_spec(self):
         """get input and inputspec"""
         reset(self.seed)
-        data, input_spec = BuildData(layerfile=self.layerfile).get_single_input_and_spec()
+        data, input_spec = BuildData(layerfile=self.layerfile, seed=self.seed).get_single_input_and_spec()
         return data, input_spec
 
     def _net_input_and_static_spec(self):
         """get input and static inputspec"""
         reset(self.seed)
-        data, input_spec = BuildData(layerfile=self.layerfile).get_single_input_and_static_spec()
+        data, input_spec = BuildData(layerfile=self.layerfile, seed=self.seed).get_single_input_and_static_spec()
         return data, input_spec
 
     def _net_input_and_multi_spec(self):
         """get input and multi inputspec"""
         reset(self.seed)
-        data, spec_gen = BuildData(layerfile=self.layerfile).get_single_input_and_multi_spec()
+        data, spec_gen = BuildData(layerfile=self.layerfile, seed=self.seed).get_single_input_and_multi_spec()
         return data, spec_gen
 
     # def _get_instant(self):
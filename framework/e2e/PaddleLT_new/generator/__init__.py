@@ -4,6 +4,7 @@
 """
 __init__
 """
+import generator.builder_cache
 import generator.builder_data
 import generator.builder_layer
 import generator.builder_loss
@@ -0,0 +1,134 @@
+#!/bin/env python
+# -*- coding: utf-8 -*-
+# encoding=utf-8 vi:ts=4:sw=4:expandtab:ft=python
+"""
+case级输入与初始参数缓存: 同一子图的多个执行器(dy_eval, dy_train, dy2st_eval_cinn...)
+共用一次生成的输入和一次初始化的参数
+"""
+
+import os
+from collections import OrderedDict
+
+import numpy as np
+
+if os.environ.get("FRAMEWORK") == "paddle":
+    import paddle
+
+# 每个执行器都会改写输入(梯度累加、inplace算子)与参数(optimizer), 缓存中只保存numpy原件
+CACHE_SIZE = int(os.environ.get("PLT_CASE_CACHE_SIZE", "1"))
+
+
+def cache_enabled():
+    """PLT_CASE_CACHE=False时关闭缓存, 仅用于排查缓存相关问题"""
+    return os.environ.get("FRAMEWORK") == "paddle" and os.environ.get("PLT_CASE_CACHE") != "False"
+
+
+def _get_rng_state():
+    """numpy与paddle随机数状态"""
+    state = {"numpy": np.random.get_state(), "cpu": paddle.get_rng_state("cpu")}
+    if paddle.is_compiled_with_cuda():
+        state["cuda"] = paddle.get_cuda_rng_state()
+    return state
+
+
+def _set_rng_state(state):
+    """恢复随机数状态, 使缓存命中后的后续计算(如dropout)与重新生成时一致"""
+    np.random.set_state(state["numpy"])
+    paddle.set_rng_state(state["cpu"], "cpu")
+    if "cuda" in state:
+        paddle.set_cuda_rng_state(state["cuda"])
+
+
+def _snapshot_tensor(value):
+    """
+    tensor转为numpy原件, numpy无法表示的类型(如bfloat16)保留一份设备上的副本
+    """
+    if not isinstance(value, paddle.Tensor):
+        return ("raw", value, None)
+    array = value.numpy()
+    if str(array.dtype) != str(value.dtype).replace("paddle.", ""):
+        return ("clone", value.detach().clone(), value.stop_gradient)
+    return ("numpy", array, value.stop_gradient)
+
+
+def _restore_tensor(item):
+    """由原件构造执行器独占的tensor"""
+    kind, value, stop_gradient = item
+    if kind == "raw":
+        return value
+    if kind == "clone":
+        tensor = value.clone()
+    else:
+        tensor = paddle.to_tensor(value)
+    tensor.stop_gradient = stop_gradient
+    return tensor
+
+
+class CaseCache(object):
+    """
+    进程级缓存, key为(layerfile, seed, device, default_dtype)
+    命中的前提是调用方刚以seed执行过reset, 结果与重新生成逐位一致:
+    输入与参数恢复为首次生成的值, 随机数状态恢复为首次生成结束时的状态
+    """
+
+    def __init__(self, size=CACHE_SIZE):
+        """initialize"""
+        self.size = size
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _entry(self, layerfile, seed):
+        """获取case对应的缓存项, 超出容量时淘汰最早的case"""
+        key = (layerfile, seed, paddle.get_device(), paddle.get_default_dtype())
+        if key in self.entries:
+            self.entries.move_to_end(key)
+        else:
+            self.entries[key] = {}
+            while len(self.entries) > self.size:
+                self.entries.popitem(last=False)
+        return self.entries[key]
+
+    def data(self, layerfile, seed, name, build):
+        """
+        :param name: 生成方式, 如get_single_data/get_single_tensor, 不同方式分别缓存
+        :param build: 未命中时生成输入的函数, 返回list
+        """
+        entry = self._entry(layerfile, seed)
+        if name in entry:
+            self.hits += 1
+            items, rng_state = entry[name]
+            _set_rng_state(rng_state)
+            return [_restore_tensor(item) for item in items]
+        self.misses += 1
+        data = build()
+        entry[name] = ([_snapshot_tensor(value) for value in data], _get_rng_state())
+        return data
+
+    def layer(self, layerfile, seed, build):
+        """
+        :param build: 构建网络的函数
+        首次构建后保存初始state_dict, 之后在LazyGuard下构建网络跳过参数初始化, 再写回初始参数
+        """
+        entry = self._entry(layerfile, seed)
+        if "layer" in entry:
+            self.hits += 1
+            state_dict, rng_state = entry["layer"]
+            with paddle.LazyGuard():
+                net = build()
+            net.set_state_dict({name: _restore_tensor(item) for name, item in state_dict.items()})
+            _set_rng_state(rng_state)
+        else:
+            self.misses += 1
+            net = build()
+            # bfloat16等参数经numpy会变为uint16, 与输入相同按_snapshot_tensor保存
+            state_dict = {name: _snapshot_tensor(value) for name, value in net.state_dict().items()}
+            entry["layer"] = (state_dict, _get_rng_state())
+        return net
+
+    def stats(self):
+        """命中统计"""
+        return {"hits": self.hits, "misses": self.misses, "cases": len(self.entries)}
+
+
+CASE_CACHE = CaseCache()
@@ -19,17 +19,28 @@ elif os.environ.get("FRAMEWORK") == "torch":
     import layerTorchcase
 
 import tools.np_tool as tool
+from generator.builder_cache import CASE_CACHE, cache_enabled
 
 
 class BuildData(object):
     """BuildData"""
 
-    def __init__(self, layerfile):
-        """init"""
+    def __init__(self, layerfile, seed=None):
+        """
+        init
+        :param seed: 调用方刚以该seed执行过reset时传入, 同一case的多个执行器共用一次生成的输入
+        """
         self.layerfile = layerfile
         self.layer_module = eval(self.layerfile)
+        self.seed = seed
 
     def get_single_data(self):
+        """get data"""
+        if self.seed is not None and cache_enabled():
+            return CASE_CACHE.data(self.layerfile, self.seed, "get_single_data", self._get_single_data)
+        return self._get_single_data()
+
+    def _get_single_data(self):
         """get data"""
         if hasattr(self.layer_module, "create_numpy_inputs"):
             # dataname = self.layerfile + ".create_numpy_inputs()"
@@ -52,6 +63,12 @@ class BuildData(object):
         return data
 
     def get_single_tensor(self):
+        """get data"""
+        if self.seed is not None and cache_enabled():
+            return CASE_CACHE.data(self.layerfile, self.seed, "get_single_tensor", self._get_single_tensor)
+        return self._get_single_tensor()
+
+    def _get_single_tensor(self):
         """get data"""
         # dataname = self.layerfile + ".create_tensor_inputs()"
         data = []
@@ -16,15 +16,24 @@ elif os.environ.get("FRAMEWORK") == "torch":
     import torch
     import layerTorchcase
 
+from generator.builder_cache import CASE_CACHE, cache_enabled
+
 
 class BuildLayer(object):
     """BuildLayer"""
 
-    def __init__(self, layerfile):
-        """init"""
+    def __init__(self, layerfile, seed=None):
+        """
+        init
+        :param seed: 调用方刚以该seed执行过reset时传入, 同一case的多个执行器共用一次初始化的参数
+        """
+        self.layerfile = layerfile
         self.layername = layerfile + ".LayerCase"
+        self.seed = seed
 
     def get_layer(self):
         """get_layer"""
+        if self.seed is not None and cache_enabled():
+            return CASE_CACHE.layer(self.layerfile, self.seed, eval(self.layername))
         layer = eval(self.layername)()
         return layer
@@ -1,3027 +1,19 @@
 import os
-os.environ['FLAGS_cinn_new_group_scheduler'] = '1'
-os.environ['FLAGS_group_schedule_tiling_first'] = '1'
-os.environ['FLAGS_prim_all'] = 'true'
-os.environ['FLAGS_prim_enable_dynamic'] = '1'
-os.environ['FLAGS_enable_pir_api'] = '1'
-os.environ['FLAGS_cinn_bucket_compile'] = '1'
+import sys
 
-import unittest
-import numpy as np
-import paddle
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir))
+from tools.e2e_case_table import E2ECaseTable, CinnTestBase  # noqa: E402
 
-def GetEnvVarEnableJit():
-    enable_jit = os.getenv('PADDLE_DEBUG_ENABLE_JIT')
-    return enable_jit not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
+table = E2ECaseTable(__file__)
 
-def GetEnvVarEnableCinn():
-    enable_cinn = os.getenv('PADDLE_DEBUG_ENABLE_CINN')
-    return enable_cinn not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
 
+def pytest_generate_tests(metafunc):
+    table.parametrize(metafunc)
 
-def GetTolerance(dtype):
-    if dtype == np.float16:
-        return GetFloat16Tolerance()
-    if dtype == np.float32:
-        return GetFloat32Tolerance()
-    return 1e-6
 
-def GetFloat16Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT16_TOL'))
-    except:
-        return 1e-3
+class TestPrimitiveOp(CinnTestBase):
+    table = table
 
-def GetFloat32Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT32_TOL'))
-    except:
-        return 1e-6
 
-def IsInteger(dtype):
-    return np.dtype(dtype).char in np.typecodes['AllInteger']
-
-
-class TestBase:
-    def setUp(self):
-        paddle.seed(2024)
-        self.prepare_data()
-
-    def test_train(self):
-        dy_outs = self.train(use_cinn=False)
-        cinn_outs = self.train(use_cinn=GetEnvVarEnableCinn())
-
-        for cinn_out, dy_out in zip(cinn_outs, dy_outs):
-          if type(cinn_out) is list and type(dy_out) is list:
-            for x, y in zip(cinn_out, dy_out):
-              self.assert_all_close(x, y)
-          else:
-            self.assert_all_close(cinn_out, dy_out)
-
-    def assert_all_close(self, x, y):
-        if (hasattr(x, "numpy") and hasattr(y, "numpy")):
-            x_numpy = x.numpy()
-            y_numpy = y.numpy()
-            assert x_numpy.dtype == y_numpy.dtype
-            if IsInteger(x_numpy.dtype):
-                np.testing.assert_equal(x_numpy, y_numpy)
-            else:
-                tol = GetTolerance(x_numpy.dtype)
-                np.testing.assert_allclose(x_numpy, y_numpy, atol=tol, rtol=tol)
-        else:
-            assert x == y
-
-
-
-class PrimitiveOp0(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp0(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([0, 4], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[None, 4], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp0()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp1(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp1(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([0], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[None], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp1()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp2(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp2(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([551, 80], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[551, 80], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp2()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp3(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp3(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([70, 80], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[70, 80], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp3()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp4(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp4(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([0, 4], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[None, 4], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp4()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp5(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp5(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 46, 46, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 46, 46, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp5()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp6(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp6(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 24, 24, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 24, 24, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp6()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp7(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp7(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([6, 28, 28], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[6, 28, 28], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp7()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp8(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp8(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([4096, 5], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[4096, 5], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp8()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp9(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp9(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([0, 4], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[None, 4], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp9()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp10(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp10(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 21, 21, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 21, 21, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp10()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp11(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp11(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1024, 5], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1024, 5], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp11()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp12(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp12(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([3800, 80], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[3800, 80], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp12()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp13(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp13(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([256], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[256], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp13()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp14(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp14(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([84, 4], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[84, 4], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp14()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp15(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp15(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([0], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[None], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp15()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp16(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp16(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([64, 5], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[64, 5], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp16()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp17(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp17(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([0, 4], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[None, 4], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp17()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp18(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp18(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([8816, 80], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[8816, 80], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp18()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp19(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp19(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 84, 84, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 84, 84, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp19()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp20(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp20(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([3, 28, 28], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[3, 28, 28], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp20()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp21(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp21(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([256], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[256], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp21()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp22(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp22(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([6, 4], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[6, 4], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp22()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp23(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp23(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([256], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[256], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp23()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp24(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp24(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([6, 4], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[6, 4], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp24()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp25(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp25(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([256], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[256], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp25()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp26(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp26(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([7, 4], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[7, 4], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp26()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp27(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp27(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([256], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[256], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp27()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp28(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp28(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([7, 4], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[7, 4], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp28()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp29(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp29(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 22, 22, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 22, 22, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp29()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp30(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp30(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([15200, 80], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[15200, 80], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp30()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp31(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp31(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([256], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[256], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp31()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp32(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp32(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([10, 4], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[10, 4], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp32()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp33(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp33(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([256], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[256], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp33()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp34(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp34(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([8, 4], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[8, 4], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp34()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp35(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp35(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 76, 76, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 76, 76, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp35()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp36(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp36(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 1, 32, 32], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 1, 32, 32], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp36()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp37(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp37(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 1, 8, 8], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 1, 8, 8], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp37()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp38(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp38(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([40, 80], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[40, 80], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp38()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp39(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp39(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([256], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[256], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp39()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp40(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp40(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([5, 4], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[5, 4], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp40()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp41(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp41(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([256], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[256], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp41()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp42(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp42(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([103, 4], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[103, 4], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp42()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp43(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp43(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 44, 44, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 44, 44, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp43()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp44(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp44(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([300, 2, 4], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[300, 2, 4], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp44()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp45(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp45(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([4, 28, 28], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[4, 28, 28], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp45()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp46(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp46(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([256, 5], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[256, 5], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp46()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp47(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp47(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([256], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[256], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp47()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp48(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp48(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([4, 4], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[4, 4], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp48()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp49(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp49(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([256], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[256], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp49()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp50(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp50(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([5, 4], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[5, 4], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp50()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp51(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp51(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([150, 80], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[150, 80], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp51()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp52(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp52(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([0, 4], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[None, 4], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp52()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp53(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp53(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 1, 128, 128], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 1, 128, 128], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp53()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp54(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp54(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([0, 4], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[None, 4], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp54()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp55(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp55(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([3800, 80], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[3800, 80], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp55()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp56(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp56(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([256], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[256], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp56()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp57(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp57(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([5, 4], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[5, 4], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp57()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp58(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp58(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([2204, 80], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2204, 80], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp58()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp59(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp59(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 92, 92, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 92, 92, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp59()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp60(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp60(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 38, 38, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 38, 38, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp60()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp61(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp61(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([247, 80], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[247, 80], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp61()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp62(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp62(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 11, 11, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 11, 11, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp62()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp63(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp63(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 12, 12, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 12, 12, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp63()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp64(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp64(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([0, 4], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[None, 4], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp64()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp65(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp65(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 19, 19, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 19, 19, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp65()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp66(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp66(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 42, 42, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 42, 42, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp66()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp67(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp67(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([16384, 5], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[16384, 5], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp67()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp68(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp68(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([950, 80], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[950, 80], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp68()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp69(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp69(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([0, 4], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[None, 4], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp69()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp70(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp70(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 23, 23, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 23, 23, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp70()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp71(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp71(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 1, 64, 64], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 1, 64, 64], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp71()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp72(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp72(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([256], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[256], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp72()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp73(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp73(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([5, 4], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[5, 4], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp73()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp74(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp74(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([100, 2, 4], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[100, 2, 4], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp74()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp75(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp75(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([0, 4], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[None, 4], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp75()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp76(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp76(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([2, 28, 28], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2, 28, 28], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp76()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp77(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp77(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 48, 48, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 48, 48, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp77()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp78(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp78(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([0, 4], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[None, 4], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp78()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp79(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp79(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([256], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[256], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp79()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp80(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp80(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([7, 4], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[7, 4], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp80()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp81(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp81(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 1, 16, 16], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 1, 16, 16], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp81()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp82(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp82(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([0, 4], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[None, 4], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp82()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp83(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.abs(input_0)
-
-class TestPrimitiveOp83(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([0, 4], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[None, 4], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp83()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+if __name__ == "__main__":
+    sys.exit(table.main(__file__))
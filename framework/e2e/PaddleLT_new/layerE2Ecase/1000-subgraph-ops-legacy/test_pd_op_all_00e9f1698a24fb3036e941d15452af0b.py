@@ -1,157 +1,19 @@
 import os
-os.environ['FLAGS_cinn_new_group_scheduler'] = '1'
-os.environ['FLAGS_group_schedule_tiling_first'] = '1'
-os.environ['FLAGS_prim_all'] = 'true'
-os.environ['FLAGS_prim_enable_dynamic'] = '1'
-os.environ['FLAGS_enable_pir_api'] = '1'
-os.environ['FLAGS_cinn_bucket_compile'] = '1'
+import sys
 
-import unittest
-import numpy as np
-import paddle
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir))
+from tools.e2e_case_table import E2ECaseTable, CinnTestBase  # noqa: E402
 
-def GetEnvVarEnableJit():
-    enable_jit = os.getenv('PADDLE_DEBUG_ENABLE_JIT')
-    return enable_jit not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
+table = E2ECaseTable(__file__)
 
-def GetEnvVarEnableCinn():
-    enable_cinn = os.getenv('PADDLE_DEBUG_ENABLE_CINN')
-    return enable_cinn not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
 
+def pytest_generate_tests(metafunc):
+    table.parametrize(metafunc)
 
-def GetTolerance(dtype):
-    if dtype == np.float16:
-        return GetFloat16Tolerance()
-    if dtype == np.float32:
-        return GetFloat32Tolerance()
-    return 1e-6
 
-def GetFloat16Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT16_TOL'))
-    except:
-        return 1e-3
+class TestPrimitiveOp(CinnTestBase):
+    table = table
 
-def GetFloat32Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT32_TOL'))
-    except:
-        return 1e-6
 
-def IsInteger(dtype):
-    return np.dtype(dtype).char in np.typecodes['AllInteger']
-
-
-class TestBase:
-    def setUp(self):
-        paddle.seed(2024)
-        self.prepare_data()
-
-    def test_train(self):
-        dy_outs = self.train(use_cinn=False)
-        cinn_outs = self.train(use_cinn=GetEnvVarEnableCinn())
-
-        for cinn_out, dy_out in zip(cinn_outs, dy_outs):
-          if type(cinn_out) is list and type(dy_out) is list:
-            for x, y in zip(cinn_out, dy_out):
-              self.assert_all_close(x, y)
-          else:
-            self.assert_all_close(cinn_out, dy_out)
-
-    def assert_all_close(self, x, y):
-        if (hasattr(x, "numpy") and hasattr(y, "numpy")):
-            x_numpy = x.numpy()
-            y_numpy = y.numpy()
-            assert x_numpy.dtype == y_numpy.dtype
-            if IsInteger(x_numpy.dtype):
-                np.testing.assert_equal(x_numpy, y_numpy)
-            else:
-                tol = GetTolerance(x_numpy.dtype)
-                np.testing.assert_allclose(x_numpy, y_numpy, atol=tol, rtol=tol)
-        else:
-            assert x == y
-
-
-
-class PrimitiveOp0(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.all(input_0, [], False)
-
-class TestPrimitiveOp0(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.zeros([2], dtype='bool'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='bool'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp0()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp1(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return paddle._C_ops.all(input_0, [], False)
-
-class TestPrimitiveOp1(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.zeros([2], dtype='bool'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='bool'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp1()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+if __name__ == "__main__":
+    sys.exit(table.main(__file__))
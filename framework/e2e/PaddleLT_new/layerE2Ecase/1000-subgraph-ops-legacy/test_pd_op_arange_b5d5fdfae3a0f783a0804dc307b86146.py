@@ -1,2037 +1,19 @@
 import os
-os.environ['FLAGS_cinn_new_group_scheduler'] = '1'
-os.environ['FLAGS_group_schedule_tiling_first'] = '1'
-os.environ['FLAGS_prim_all'] = 'true'
-os.environ['FLAGS_prim_enable_dynamic'] = '1'
-os.environ['FLAGS_enable_pir_api'] = '1'
-os.environ['FLAGS_cinn_bucket_compile'] = '1'
+import sys
 
-import unittest
-import numpy as np
-import paddle
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir))
+from tools.e2e_case_table import E2ECaseTable, CinnTestBase  # noqa: E402
 
-def GetEnvVarEnableJit():
-    enable_jit = os.getenv('PADDLE_DEBUG_ENABLE_JIT')
-    return enable_jit not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
+table = E2ECaseTable(__file__)
 
-def GetEnvVarEnableCinn():
-    enable_cinn = os.getenv('PADDLE_DEBUG_ENABLE_CINN')
-    return enable_cinn not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
 
+def pytest_generate_tests(metafunc):
+    table.parametrize(metafunc)
 
-def GetTolerance(dtype):
-    if dtype == np.float16:
-        return GetFloat16Tolerance()
-    if dtype == np.float32:
-        return GetFloat32Tolerance()
-    return 1e-6
 
-def GetFloat16Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT16_TOL'))
-    except:
-        return 1e-3
+class TestPrimitiveOp(CinnTestBase):
+    table = table
 
-def GetFloat32Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT32_TOL'))
-    except:
-        return 1e-6
 
-def IsInteger(dtype):
-    return np.dtype(dtype).char in np.typecodes['AllInteger']
-
-
-class TestBase:
-    def setUp(self):
-        paddle.seed(2024)
-        self.prepare_data()
-
-    def test_train(self):
-        dy_outs = self.train(use_cinn=False)
-        cinn_outs = self.train(use_cinn=GetEnvVarEnableCinn())
-
-        for cinn_out, dy_out in zip(cinn_outs, dy_outs):
-          if type(cinn_out) is list and type(dy_out) is list:
-            for x, y in zip(cinn_out, dy_out):
-              self.assert_all_close(x, y)
-          else:
-            self.assert_all_close(cinn_out, dy_out)
-
-    def assert_all_close(self, x, y):
-        if (hasattr(x, "numpy") and hasattr(y, "numpy")):
-            x_numpy = x.numpy()
-            y_numpy = y.numpy()
-            assert x_numpy.dtype == y_numpy.dtype
-            if IsInteger(x_numpy.dtype):
-                np.testing.assert_equal(x_numpy, y_numpy)
-            else:
-                tol = GetTolerance(x_numpy.dtype)
-                np.testing.assert_allclose(x_numpy, y_numpy, atol=tol, rtol=tol)
-        else:
-            assert x == y
-
-
-
-class PrimitiveOp0(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle.arange(input_0, input_1, input_2, dtype=paddle.int64)
-
-class TestPrimitiveOp0(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp0()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp1(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle.arange(input_0, input_1, input_2, dtype=paddle.int64)
-
-class TestPrimitiveOp1(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp1()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp2(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle.arange(input_0, input_1, input_2, dtype=paddle.int64)
-
-class TestPrimitiveOp2(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp2()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp3(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle.arange(input_0, input_1, input_2, dtype=paddle.int64)
-
-class TestPrimitiveOp3(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp3()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp4(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle.arange(input_0, input_1, input_2, dtype=paddle.int64)
-
-class TestPrimitiveOp4(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp4()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp5(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle.arange(input_0, input_1, input_2, dtype=paddle.int64)
-
-class TestPrimitiveOp5(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp5()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp6(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle.arange(input_0, input_1, input_2, dtype=paddle.int32)
-
-class TestPrimitiveOp6(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([0], dtype='int32'),
-            paddle.to_tensor([6], dtype='int32'),
-            paddle.to_tensor([1], dtype='int32'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int32'),
-            paddle.static.InputSpec(shape=[1], dtype='int32'),
-            paddle.static.InputSpec(shape=[1], dtype='int32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp6()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp7(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle.arange(input_0, input_1, input_2, dtype=paddle.int64)
-
-class TestPrimitiveOp7(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp7()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp8(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle.arange(input_0, input_1, input_2, dtype=paddle.int64)
-
-class TestPrimitiveOp8(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp8()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp9(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle.arange(input_0, input_1, input_2, dtype=paddle.int64)
-
-class TestPrimitiveOp9(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp9()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp10(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle.arange(input_0, input_1, input_2, dtype=paddle.int64)
-
-class TestPrimitiveOp10(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp10()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp11(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle.arange(input_0, input_1, input_2, dtype=paddle.int64)
-
-class TestPrimitiveOp11(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp11()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp12(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle.arange(input_0, input_1, input_2, dtype=paddle.int64)
-
-class TestPrimitiveOp12(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp12()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp13(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle.arange(input_0, input_1, input_2, dtype=paddle.int64)
-
-class TestPrimitiveOp13(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp13()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp14(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle.arange(input_0, input_1, input_2, dtype=paddle.int64)
-
-class TestPrimitiveOp14(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp14()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp15(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle.arange(input_0, input_1, input_2, dtype=paddle.int64)
-
-class TestPrimitiveOp15(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp15()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp16(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle.arange(input_0, input_1, input_2, dtype=paddle.int64)
-
-class TestPrimitiveOp16(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp16()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp17(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle.arange(input_0, input_1, input_2, dtype=paddle.int64)
-
-class TestPrimitiveOp17(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp17()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp18(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle.arange(input_0, input_1, input_2, dtype=paddle.int32)
-
-class TestPrimitiveOp18(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([0], dtype='int32'),
-            paddle.to_tensor([3], dtype='int32'),
-            paddle.to_tensor([1], dtype='int32'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int32'),
-            paddle.static.InputSpec(shape=[1], dtype='int32'),
-            paddle.static.InputSpec(shape=[1], dtype='int32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp18()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp19(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle.arange(input_0, input_1, input_2, dtype=paddle.int64)
-
-class TestPrimitiveOp19(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp19()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp20(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle.arange(input_0, input_1, input_2, dtype=paddle.int64)
-
-class TestPrimitiveOp20(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp20()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp21(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle.arange(input_0, input_1, input_2, dtype=paddle.int64)
-
-class TestPrimitiveOp21(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp21()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp22(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle.arange(input_0, input_1, input_2, dtype=paddle.int64)
-
-class TestPrimitiveOp22(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp22()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp23(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle.arange(input_0, input_1, input_2, dtype=paddle.int64)
-
-class TestPrimitiveOp23(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp23()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp24(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle.arange(input_0, input_1, input_2, dtype=paddle.int64)
-
-class TestPrimitiveOp24(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp24()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp25(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle.arange(input_0, input_1, input_2, dtype=paddle.int32)
-
-class TestPrimitiveOp25(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([0], dtype='int32'),
-            paddle.to_tensor([4], dtype='int32'),
-            paddle.to_tensor([1], dtype='int32'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int32'),
-            paddle.static.InputSpec(shape=[1], dtype='int32'),
-            paddle.static.InputSpec(shape=[1], dtype='int32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp25()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp26(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle.arange(input_0, input_1, input_2, dtype=paddle.int64)
-
-class TestPrimitiveOp26(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp26()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp27(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle.arange(input_0, input_1, input_2, dtype=paddle.int64)
-
-class TestPrimitiveOp27(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp27()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp28(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle.arange(input_0, input_1, input_2, dtype=paddle.int64)
-
-class TestPrimitiveOp28(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp28()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp29(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle.arange(input_0, input_1, input_2, dtype=paddle.float32)
-
-class TestPrimitiveOp29(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp29()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp30(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle.arange(input_0, input_1, input_2, dtype=paddle.int64)
-
-class TestPrimitiveOp30(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp30()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp31(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle.arange(input_0, input_1, input_2, dtype=paddle.int64)
-
-class TestPrimitiveOp31(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp31()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp32(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle.arange(input_0, input_1, input_2, dtype=paddle.int64)
-
-class TestPrimitiveOp32(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp32()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp33(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle.arange(input_0, input_1, input_2, dtype=paddle.int64)
-
-class TestPrimitiveOp33(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp33()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp34(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle.arange(input_0, input_1, input_2, dtype=paddle.int64)
-
-class TestPrimitiveOp34(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp34()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp35(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle.arange(input_0, input_1, input_2, dtype=paddle.int64)
-
-class TestPrimitiveOp35(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp35()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp36(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle.arange(input_0, input_1, input_2, dtype=paddle.int64)
-
-class TestPrimitiveOp36(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp36()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp37(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle.arange(input_0, input_1, input_2, dtype=paddle.int64)
-
-class TestPrimitiveOp37(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp37()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp38(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle.arange(input_0, input_1, input_2, dtype=paddle.int64)
-
-class TestPrimitiveOp38(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp38()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp39(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle.arange(input_0, input_1, input_2, dtype=paddle.int64)
-
-class TestPrimitiveOp39(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp39()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp40(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle.arange(input_0, input_1, input_2, dtype=paddle.int64)
-
-class TestPrimitiveOp40(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp40()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp41(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle.arange(input_0, input_1, input_2, dtype=paddle.int64)
-
-class TestPrimitiveOp41(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp41()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp42(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle.arange(input_0, input_1, input_2, dtype=paddle.int64)
-
-class TestPrimitiveOp42(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp42()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp43(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle.arange(input_0, input_1, input_2, dtype=paddle.int64)
-
-class TestPrimitiveOp43(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp43()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp44(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle.arange(input_0, input_1, input_2, dtype=paddle.int64)
-
-class TestPrimitiveOp44(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp44()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp45(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle.arange(input_0, input_1, input_2, dtype=paddle.int64)
-
-class TestPrimitiveOp45(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp45()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp46(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle.arange(input_0, input_1, input_2, dtype=paddle.int64)
-
-class TestPrimitiveOp46(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp46()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp47(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle.arange(input_0, input_1, input_2, dtype=paddle.int64)
-
-class TestPrimitiveOp47(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp47()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp48(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle.arange(input_0, input_1, input_2, dtype=paddle.int64)
-
-class TestPrimitiveOp48(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp48()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp49(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle.arange(input_0, input_1, input_2, dtype=paddle.int32)
-
-class TestPrimitiveOp49(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([0], dtype='int32'),
-            paddle.to_tensor([2], dtype='int32'),
-            paddle.to_tensor([1], dtype='int32'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int32'),
-            paddle.static.InputSpec(shape=[1], dtype='int32'),
-            paddle.static.InputSpec(shape=[1], dtype='int32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp49()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+if __name__ == "__main__":
+    sys.exit(table.main(__file__))
@@ -1,22697 +1,19 @@
 import os
-os.environ['FLAGS_cinn_new_group_scheduler'] = '1'
-os.environ['FLAGS_group_schedule_tiling_first'] = '1'
-os.environ['FLAGS_prim_all'] = 'true'
-os.environ['FLAGS_prim_enable_dynamic'] = '1'
-os.environ['FLAGS_enable_pir_api'] = '1'
-os.environ['FLAGS_cinn_bucket_compile'] = '1'
+import sys
 
-import unittest
-import numpy as np
-import paddle
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir))
+from tools.e2e_case_table import E2ECaseTable, CinnTestBase  # noqa: E402
 
-def GetEnvVarEnableJit():
-    enable_jit = os.getenv('PADDLE_DEBUG_ENABLE_JIT')
-    return enable_jit not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
+table = E2ECaseTable(__file__)
 
-def GetEnvVarEnableCinn():
-    enable_cinn = os.getenv('PADDLE_DEBUG_ENABLE_CINN')
-    return enable_cinn not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
 
+def pytest_generate_tests(metafunc):
+    table.parametrize(metafunc)
 
-def GetTolerance(dtype):
-    if dtype == np.float16:
-        return GetFloat16Tolerance()
-    if dtype == np.float32:
-        return GetFloat32Tolerance()
-    return 1e-6
 
-def GetFloat16Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT16_TOL'))
-    except:
-        return 1e-3
+class TestPrimitiveOp(CinnTestBase):
+    table = table
 
-def GetFloat32Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT32_TOL'))
-    except:
-        return 1e-6
 
-def IsInteger(dtype):
-    return np.dtype(dtype).char in np.typecodes['AllInteger']
-
-
-class TestBase:
-    def setUp(self):
-        paddle.seed(2024)
-        self.prepare_data()
-
-    def test_train(self):
-        dy_outs = self.train(use_cinn=False)
-        cinn_outs = self.train(use_cinn=GetEnvVarEnableCinn())
-
-        for cinn_out, dy_out in zip(cinn_outs, dy_outs):
-          if type(cinn_out) is list and type(dy_out) is list:
-            for x, y in zip(cinn_out, dy_out):
-              self.assert_all_close(x, y)
-          else:
-            self.assert_all_close(cinn_out, dy_out)
-
-    def assert_all_close(self, x, y):
-        if (hasattr(x, "numpy") and hasattr(y, "numpy")):
-            x_numpy = x.numpy()
-            y_numpy = y.numpy()
-            assert x_numpy.dtype == y_numpy.dtype
-            if IsInteger(x_numpy.dtype):
-                np.testing.assert_equal(x_numpy, y_numpy)
-            else:
-                tol = GetTolerance(x_numpy.dtype)
-                np.testing.assert_allclose(x_numpy, y_numpy, atol=tol, rtol=tol)
-        else:
-            assert x == y
-
-
-
-class PrimitiveOp0(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp0(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp0()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp1(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp1(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([-1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp1()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp2(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp2(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([-1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp2()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp3(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp3(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([-1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp3()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp4(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp4(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[0], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp4()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp5(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp5(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[0], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp5()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp6(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp6(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[0], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp6()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp7(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp7(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp7()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp8(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp8(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp8()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp9(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp9(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([551, 80], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[551, 80], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp9()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp10(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp10(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([6804, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[6804, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp10()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp11(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp11(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp11()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp12(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp12(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([2], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp12()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp13(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp13(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp13()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp14(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp14(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp14()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp15(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp15(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp15()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp16(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp16(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp16()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp17(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp17(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp17()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp18(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp18(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp18()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp19(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp19(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([6069, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[6069, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp19()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp20(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp20(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([28, 28], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp20()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp21(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp21(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([28, 28], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp21()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp22(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp22(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([28, 28], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp22()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp23(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp23(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([28, 28], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp23()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp24(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp24(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([28, 28], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp24()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp25(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp25(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([28, 28], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp25()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp26(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp26(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([28, 28], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp26()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp27(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp27(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([70, 80], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[70, 80], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp27()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp28(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp28(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 512, 4096], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 512, 4096], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp28()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp29(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp29(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp29()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp30(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp30(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([-1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp30()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp31(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp31(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([-1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp31()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp32(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp32(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([-1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp32()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp33(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp33(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[0], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp33()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp34(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp34(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[0], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp34()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp35(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp35(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[0], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp35()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp36(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp36(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp36()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp37(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp37(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 46, 46, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 46, 46, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp37()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp38(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp38(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 46, 46, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 46, 46, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp38()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp39(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp39(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 46, 46, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 46, 46, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp39()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp40(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp40(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 46, 46, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 46, 46, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp40()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp41(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp41(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 46, 46, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 46, 46, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp41()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp42(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp42(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 46, 46, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 46, 46, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp42()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp43(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp43(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 24, 24, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 24, 24, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp43()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp44(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp44(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 24, 24, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 24, 24, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp44()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp45(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp45(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 24, 24, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 24, 24, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp45()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp46(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp46(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 24, 24, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 24, 24, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp46()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp47(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp47(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 24, 24, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 24, 24, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp47()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp48(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp48(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 24, 24, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 24, 24, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp48()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp49(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp49(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp49()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp50(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp50(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp50()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp51(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp51(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp51()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp52(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp52(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp52()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp53(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp53(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([22, 120, 14, 14], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[22, 120, 14, 14], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp53()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp54(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp54(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([22, 120, 14, 14], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[22, 120, 14, 14], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp54()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp55(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp55(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([0], dtype='int32'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp55()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp56(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp56(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([6], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[6], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp56()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp57(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp57(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([6], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[6], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp57()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp58(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp58(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([6], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[6], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp58()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp59(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp59(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([6], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[6], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp59()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp60(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp60(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([6], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[6], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp60()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp61(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp61(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([6], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[6], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp61()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp62(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp62(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp62()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp63(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp63(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([-1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp63()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp64(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp64(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([-1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp64()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp65(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp65(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([-1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp65()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp66(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp66(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[0], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp66()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp67(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp67(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[0], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp67()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp68(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp68(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[0], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp68()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp69(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp69(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 11, 11, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 11, 11, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp69()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp70(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp70(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 11, 11, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 11, 11, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp70()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp71(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp71(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 11, 11, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 11, 11, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp71()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp72(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp72(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 11, 11, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 11, 11, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp72()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp73(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp73(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 11, 11, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 11, 11, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp73()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp74(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp74(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 11, 11, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 11, 11, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp74()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp75(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp75(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp75()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp76(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp76(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp76()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp77(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp77(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp77()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp78(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp78(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([22, 8, 112, 112], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[22, 8, 112, 112], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp78()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp79(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp79(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([22, 8, 112, 112], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[22, 8, 112, 112], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp79()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp80(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp80(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 21, 21, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 21, 21, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp80()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp81(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp81(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 21, 21, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 21, 21, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp81()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp82(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp82(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 21, 21, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 21, 21, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp82()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp83(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp83(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 21, 21, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 21, 21, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp83()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp84(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp84(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 21, 21, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 21, 21, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp84()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp85(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp85(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 21, 21, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 21, 21, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp85()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp86(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp86(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp86()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp87(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp87(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp87()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp88(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp88(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([0], dtype='int32'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp88()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp89(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp89(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp89()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp90(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp90(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([22, 40, 14, 14], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[22, 40, 14, 14], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp90()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp91(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp91(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([22, 40, 14, 14], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[22, 40, 14, 14], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp91()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp92(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp92(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 46, 46, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 46, 46, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp92()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp93(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp93(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 46, 46, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 46, 46, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp93()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp94(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp94(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 46, 46, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 46, 46, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp94()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp95(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp95(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 46, 46, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 46, 46, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp95()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp96(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp96(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 46, 46, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 46, 46, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp96()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp97(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp97(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 46, 46, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 46, 46, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp97()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp98(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp98(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp98()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp99(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp99(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([22, 80, 28, 28], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[22, 80, 28, 28], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp99()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp100(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp100(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([22, 80, 28, 28], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[22, 80, 28, 28], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp100()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp101(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp101(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([22, 80, 28, 28], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[22, 80, 28, 28], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp101()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp102(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp102(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp102()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp103(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp103(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 38, 38, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 38, 38, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp103()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp104(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp104(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 38, 38, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 38, 38, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp104()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp105(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp105(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 38, 38, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 38, 38, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp105()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp106(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp106(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 38, 38, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 38, 38, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp106()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp107(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp107(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 38, 38, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 38, 38, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp107()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp108(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp108(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 38, 38, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 38, 38, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp108()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp109(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp109(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([0], dtype='int32'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp109()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp110(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp110(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp110()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp111(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp111(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([0], dtype='int32'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp111()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp112(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp112(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([2], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp112()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp113(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp113(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp113()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp114(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp114(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp114()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp115(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp115(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([14, 14], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp115()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp116(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp116(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([14, 14], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp116()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp117(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp117(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([14, 14], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp117()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp118(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp118(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([14, 14], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp118()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp119(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp119(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([14, 14], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp119()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp120(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp120(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([14, 14], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp120()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp121(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp121(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([14, 14], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp121()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp122(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp122(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([3800, 80], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[3800, 80], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp122()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp123(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp123(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([22, 48, 56, 56], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[22, 48, 56, 56], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp123()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp124(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp124(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([22, 48, 56, 56], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[22, 48, 56, 56], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp124()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp125(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp125(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([22, 12, 56, 56], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[22, 12, 56, 56], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp125()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp126(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp126(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([22, 12, 56, 56], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[22, 12, 56, 56], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp126()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp127(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp127(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp127()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp128(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp128(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp128()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp129(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp129(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([1], dtype='int32'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp129()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp130(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp130(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([4, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[4, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp130()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp131(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp131(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([4, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[4, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp131()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp132(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp132(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 19, 1, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 19, 1, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp132()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp133(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp133(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp133()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp134(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp134(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([-1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp134()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp135(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp135(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([-1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp135()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp136(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp136(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([-1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp136()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp137(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp137(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[0], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp137()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp138(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp138(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[0], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp138()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp139(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp139(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[0], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp139()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp140(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp140(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp140()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp141(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp141(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp141()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp142(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp142(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([8816, 80], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[8816, 80], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp142()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp143(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp143(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp143()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp144(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp144(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp144()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp145(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp145(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 84, 84, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 84, 84, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp145()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp146(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp146(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 84, 84, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 84, 84, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp146()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp147(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp147(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 84, 84, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 84, 84, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp147()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp148(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp148(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 84, 84, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 84, 84, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp148()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp149(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp149(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 84, 84, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 84, 84, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp149()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp150(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp150(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 84, 84, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 84, 84, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp150()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp151(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp151(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 48, 48, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 48, 48, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp151()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp152(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp152(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 48, 48, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 48, 48, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp152()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp153(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp153(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 48, 48, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 48, 48, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp153()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp154(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp154(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 48, 48, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 48, 48, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp154()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp155(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp155(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 48, 48, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 48, 48, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp155()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp156(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp156(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 48, 48, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 48, 48, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp156()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp157(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp157(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([22, 300, 7, 7], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[22, 300, 7, 7], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp157()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp158(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp158(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([22, 300, 7, 7], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[22, 300, 7, 7], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp158()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp159(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp159(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([22, 300, 7, 7], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[22, 300, 7, 7], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp159()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp160(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp160(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([22, 300, 7, 7], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[22, 300, 7, 7], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp160()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp161(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp161(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp161()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp162(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp162(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp162()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp163(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp163(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp163()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp164(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp164(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([0], dtype='int32'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp164()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp165(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp165(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([1, 1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp165()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp166(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp166(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([1, 1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp166()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp167(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp167(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([1, 1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp167()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp168(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp168(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([1, 1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp168()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp169(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp169(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([1, 1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp169()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp170(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp170(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([1, 1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp170()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp171(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp171(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([1, 1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp171()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp172(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp172(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp172()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp173(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp173(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp173()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp174(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp174(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp174()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp175(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp175(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp175()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp176(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp176(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp176()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp177(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp177(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp177()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp178(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp178(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp178()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp179(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp179(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp179()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp180(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp180(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp180()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp181(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp181(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp181()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp182(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp182(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp182()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp183(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp183(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp183()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp184(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp184(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp184()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp185(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp185(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp185()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp186(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp186(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp186()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp187(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp187(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp187()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp188(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp188(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp188()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp189(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp189(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp189()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp190(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp190(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp190()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp191(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp191(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp191()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp192(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp192(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp192()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp193(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp193(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp193()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp194(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp194(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([0], dtype='int32'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp194()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp195(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp195(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp195()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp196(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp196(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([2], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp196()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp197(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp197(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp197()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp198(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp198(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp198()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp199(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp199(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 21, 21, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 21, 21, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp199()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp200(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp200(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 21, 21, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 21, 21, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp200()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp201(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp201(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 21, 21, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 21, 21, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp201()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp202(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp202(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 21, 21, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 21, 21, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp202()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp203(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp203(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 21, 21, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 21, 21, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp203()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp204(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp204(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 21, 21, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 21, 21, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp204()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp205(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp205(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp205()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp206(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp206(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp206()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp207(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp207(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([1], dtype='int32'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp207()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp208(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp208(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp208()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp209(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp209(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp209()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp210(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp210(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([22, 20, 28, 28], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[22, 20, 28, 28], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp210()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp211(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp211(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([22, 20, 28, 28], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[22, 20, 28, 28], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp211()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp212(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp212(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp212()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp213(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp213(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([0], dtype='int32'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp213()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp214(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp214(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp214()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp215(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp215(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 22, 22, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 22, 22, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp215()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp216(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp216(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 22, 22, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 22, 22, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp216()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp217(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp217(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 22, 22, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 22, 22, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp217()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp218(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp218(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 22, 22, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 22, 22, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp218()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp219(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp219(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 22, 22, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 22, 22, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp219()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp220(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp220(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 22, 22, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 22, 22, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp220()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp221(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp221(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp221()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp222(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp222(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([15200, 80], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[15200, 80], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp222()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp223(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp223(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([2], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp223()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp224(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp224(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp224()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp225(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp225(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp225()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp226(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp226(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp226()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp227(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp227(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([1], dtype='int32'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp227()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp228(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp228(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([1], dtype='int32'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp228()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp229(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp229(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([1], dtype='int32'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp229()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp230(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp230(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([22, 60, 14, 14], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[22, 60, 14, 14], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp230()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp231(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp231(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([22, 60, 14, 14], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[22, 60, 14, 14], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp231()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp232(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp232(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp232()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp233(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp233(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp233()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp234(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp234(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp234()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp235(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp235(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp235()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp236(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp236(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp236()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp237(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp237(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([0], dtype='int32'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp237()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp238(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp238(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp238()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp239(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp239(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 512, 8192], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 512, 8192], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp239()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp240(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp240(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp240()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp241(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp241(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([0], dtype='int32'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp241()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp242(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp242(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp242()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp243(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp243(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 76, 76, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 76, 76, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp243()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp244(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp244(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 76, 76, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 76, 76, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp244()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp245(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp245(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 76, 76, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 76, 76, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp245()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp246(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp246(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 76, 76, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 76, 76, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp246()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp247(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp247(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 76, 76, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 76, 76, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp247()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp248(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp248(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 76, 76, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 76, 76, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp248()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp249(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp249(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([22, 36, 56, 56], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[22, 36, 56, 56], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp249()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp250(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp250(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([22, 36, 56, 56], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[22, 36, 56, 56], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp250()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp251(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp251(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([1], dtype='int32'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp251()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp252(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp252(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([6, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[6, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp252()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp253(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp253(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([6, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[6, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp253()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp254(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp254(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([2], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp254()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp255(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp255(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp255()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp256(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp256(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp256()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp257(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp257(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp257()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp258(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp258(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([22, 144, 14, 14], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[22, 144, 14, 14], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp258()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp259(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp259(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([22, 144, 14, 14], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[22, 144, 14, 14], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp259()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp260(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp260(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([22, 144, 14, 14], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[22, 144, 14, 14], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp260()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp261(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp261(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([22, 144, 14, 14], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[22, 144, 14, 14], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp261()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp262(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp262(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([22, 144, 14, 14], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[22, 144, 14, 14], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp262()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp263(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp263(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp263()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp264(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp264(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp264()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp265(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp265(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp265()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp266(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp266(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 76, 76, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 76, 76, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp266()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp267(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp267(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 76, 76, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 76, 76, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp267()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp268(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp268(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 76, 76, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 76, 76, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp268()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp269(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp269(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 76, 76, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 76, 76, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp269()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp270(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp270(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 76, 76, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 76, 76, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp270()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp271(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp271(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 76, 76, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 76, 76, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp271()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp272(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp272(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp272()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp273(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp273(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([5376, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[5376, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp273()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp274(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp274(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([300, 4], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[300, 4], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp274()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp275(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp275(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 300, 256], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 300, 256], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp275()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp276(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp276(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([3, 3], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp276()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp277(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp277(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([3, 3], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp277()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp278(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp278(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp278()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp279(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp279(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([0], dtype='int32'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp279()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp280(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp280(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([0], dtype='int32'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp280()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp281(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp281(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp281()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp282(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp282(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp282()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp283(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp283(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp283()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp284(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp284(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp284()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp285(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp285(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 42, 42, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 42, 42, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp285()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp286(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp286(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 42, 42, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 42, 42, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp286()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp287(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp287(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 42, 42, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 42, 42, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp287()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp288(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp288(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 42, 42, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 42, 42, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp288()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp289(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp289(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 42, 42, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 42, 42, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp289()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp290(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp290(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 42, 42, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 42, 42, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp290()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp291(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp291(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp291()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp292(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp292(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp292()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp293(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp293(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp293()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp294(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp294(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([40, 80], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[40, 80], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp294()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp295(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp295(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp295()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp296(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp296(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([22, 90, 14, 14], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[22, 90, 14, 14], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp296()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp297(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp297(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([22, 90, 14, 14], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[22, 90, 14, 14], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp297()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp298(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp298(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([22, 90, 14, 14], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[22, 90, 14, 14], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp298()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp299(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp299(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([22, 90, 14, 14], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[22, 90, 14, 14], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp299()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp300(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp300(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp300()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp301(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp301(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([0], dtype='int32'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp301()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp302(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp302(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp302()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp303(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp303(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 44, 44, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 44, 44, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp303()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp304(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp304(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 44, 44, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 44, 44, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp304()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp305(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp305(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 44, 44, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 44, 44, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp305()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp306(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp306(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 44, 44, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 44, 44, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp306()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp307(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp307(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 44, 44, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 44, 44, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp307()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp308(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp308(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 44, 44, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 44, 44, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp308()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp309(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp309(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([0], dtype='int32'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp309()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp310(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp310(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 23, 23, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 23, 23, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp310()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp311(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp311(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 23, 23, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 23, 23, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp311()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp312(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp312(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 23, 23, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 23, 23, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp312()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp313(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp313(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 23, 23, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 23, 23, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp313()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp314(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp314(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 23, 23, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 23, 23, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp314()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp315(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp315(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 23, 23, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 23, 23, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp315()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp316(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp316(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([0], dtype='int32'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp316()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp317(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp317(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp317()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp318(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp318(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([300, 80], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[300, 80], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp318()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp319(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp319(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp319()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp320(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp320(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([2], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp320()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp321(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp321(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp321()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp322(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp322(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp322()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp323(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp323(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 12, 12, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 12, 12, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp323()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp324(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp324(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 12, 12, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 12, 12, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp324()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp325(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp325(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 12, 12, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 12, 12, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp325()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp326(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp326(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 12, 12, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 12, 12, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp326()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp327(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp327(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 12, 12, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 12, 12, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp327()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp328(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp328(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 12, 12, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 12, 12, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp328()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp329(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp329(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([2], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp329()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp330(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp330(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp330()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp331(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp331(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp331()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp332(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp332(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp332()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp333(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp333(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp333()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp334(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp334(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 21, 1, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 21, 1, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp334()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp335(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp335(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp335()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp336(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp336(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([1], dtype='int32'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp336()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp337(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp337(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([5, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[5, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp337()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp338(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp338(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([5, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[5, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp338()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp339(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp339(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([0], dtype='int32'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp339()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp340(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp340(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 19, 19, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 19, 19, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp340()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp341(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp341(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 19, 19, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 19, 19, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp341()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp342(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp342(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 19, 19, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 19, 19, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp342()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp343(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp343(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 19, 19, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 19, 19, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp343()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp344(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp344(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 19, 19, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 19, 19, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp344()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp345(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp345(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 19, 19, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 19, 19, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp345()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp346(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp346(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([150, 80], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[150, 80], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp346()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp347(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp347(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([2, 2], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp347()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp348(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp348(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([2, 2], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp348()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp349(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp349(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([2, 2], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp349()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp350(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp350(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp350()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp351(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp351(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp351()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp352(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp352(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([0], dtype='int32'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp352()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp353(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp353(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([1], dtype='int32'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp353()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp354(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp354(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp354()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp355(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp355(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([22, 600, 7, 7], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[22, 600, 7, 7], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp355()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp356(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp356(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([22, 600, 7, 7], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[22, 600, 7, 7], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp356()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp357(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp357(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp357()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp358(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp358(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 92, 92, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 92, 92, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp358()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp359(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp359(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 92, 92, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 92, 92, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp359()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp360(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp360(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 92, 92, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 92, 92, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp360()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp361(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp361(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 92, 92, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 92, 92, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp361()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp362(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp362(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 92, 92, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 92, 92, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp362()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp363(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp363(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 92, 92, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 92, 92, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp363()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp364(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp364(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([-1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp364()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp365(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp365(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([-1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp365()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp366(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp366(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([-1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp366()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp367(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp367(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[0], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp367()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp368(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp368(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[0], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp368()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp369(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp369(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[0], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp369()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp370(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp370(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp370()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp371(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp371(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp371()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp372(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp372(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([28, 28], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp372()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp373(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp373(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([28, 28], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp373()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp374(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp374(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([28, 28], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp374()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp375(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp375(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([28, 28], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp375()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp376(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp376(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([28, 28], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp376()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp377(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp377(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([28, 28], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp377()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp378(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp378(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([28, 28], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp378()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp379(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp379(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([-1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp379()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp380(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp380(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([-1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp380()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp381(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp381(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([-1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp381()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp382(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp382(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[0], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp382()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp383(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp383(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[0], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp383()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp384(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp384(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[0], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp384()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp385(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp385(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([7, 7], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp385()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp386(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp386(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([7, 7], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp386()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp387(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp387(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([7, 7], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp387()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp388(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp388(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([7, 7], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp388()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp389(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp389(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([7, 7], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp389()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp390(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp390(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([7, 7], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp390()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp391(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp391(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([7, 7], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp391()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp392(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp392(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp392()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp393(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp393(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([0], dtype='int32'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp393()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp394(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp394(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp394()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp395(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp395(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([2], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp395()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp396(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp396(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp396()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp397(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp397(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp397()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp398(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp398(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([3800, 80], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[3800, 80], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp398()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp399(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp399(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp399()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp400(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp400(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp400()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp401(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp401(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([1], dtype='int32'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp401()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp402(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp402(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([2204, 80], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2204, 80], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp402()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp403(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp403(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([-1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp403()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp404(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp404(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp404()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp405(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp405(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 92, 92, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 92, 92, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp405()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp406(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp406(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 92, 92, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 92, 92, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp406()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp407(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp407(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 92, 92, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 92, 92, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp407()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp408(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp408(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 92, 92, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 92, 92, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp408()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp409(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp409(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 92, 92, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 92, 92, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp409()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp410(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp410(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 92, 92, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 92, 92, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp410()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp411(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp411(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([0], dtype='int32'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp411()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp412(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp412(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp412()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp413(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp413(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp413()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp414(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp414(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([22, 180, 14, 14], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[22, 180, 14, 14], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp414()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp415(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp415(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([22, 180, 14, 14], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[22, 180, 14, 14], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp415()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp416(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp416(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp416()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp417(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp417(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([22, 160, 14, 14], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[22, 160, 14, 14], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp417()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp418(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp418(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([22, 160, 14, 14], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[22, 160, 14, 14], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp418()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp419(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp419(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([22, 160, 14, 14], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[22, 160, 14, 14], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp419()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp420(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp420(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp420()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp421(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp421(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 38, 38, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 38, 38, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp421()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp422(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp422(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 38, 38, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 38, 38, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp422()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp423(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp423(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 38, 38, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 38, 38, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp423()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp424(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp424(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 38, 38, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 38, 38, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp424()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp425(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp425(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 38, 38, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 38, 38, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp425()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp426(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp426(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 38, 38, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 38, 38, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp426()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp427(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp427(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([3, 3], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp427()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp428(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp428(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([3, 3], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp428()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp429(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp429(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([247, 80], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[247, 80], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp429()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp430(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp430(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([2], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp430()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp431(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp431(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp431()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp432(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp432(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp432()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp433(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp433(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp433()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp434(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp434(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([3, 3], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp434()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp435(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp435(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([3, 3], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp435()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp436(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp436(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp436()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp437(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp437(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([0], dtype='int32'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp437()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp438(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp438(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([2], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp438()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp439(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp439(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp439()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp440(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp440(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp440()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp441(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp441(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 11, 11, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 11, 11, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp441()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp442(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp442(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 11, 11, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 11, 11, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp442()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp443(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp443(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 11, 11, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 11, 11, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp443()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp444(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp444(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 11, 11, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 11, 11, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp444()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp445(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp445(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 11, 11, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 11, 11, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp445()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp446(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp446(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 11, 11, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 11, 11, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp446()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp447(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp447(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 12, 12, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 12, 12, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp447()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp448(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp448(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 12, 12, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 12, 12, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp448()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp449(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp449(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 12, 12, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 12, 12, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp449()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp450(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp450(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 12, 12, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 12, 12, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp450()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp451(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp451(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 12, 12, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 12, 12, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp451()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp452(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp452(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 12, 12, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 12, 12, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp452()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp453(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp453(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([0], dtype='int32'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp453()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp454(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp454(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp454()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp455(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp455(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp455()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp456(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp456(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp456()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp457(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp457(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 84, 84, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 84, 84, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp457()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp458(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp458(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 84, 84, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 84, 84, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp458()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp459(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp459(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 84, 84, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 84, 84, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp459()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp460(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp460(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 84, 84, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 84, 84, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp460()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp461(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp461(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 84, 84, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 84, 84, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp461()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp462(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp462(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 84, 84, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 84, 84, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp462()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp463(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp463(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([3, 3], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp463()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp464(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp464(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([3, 3], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp464()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp465(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp465(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([22, 120, 28, 28], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[22, 120, 28, 28], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp465()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp466(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp466(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([22, 120, 28, 28], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[22, 120, 28, 28], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp466()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp467(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp467(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp467()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp468(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp468(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp468()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp469(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp469(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([2], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp469()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp470(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp470(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([-1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp470()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp471(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp471(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([-1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp471()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp472(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp472(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([-1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp472()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp473(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp473(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[0], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp473()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp474(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp474(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[0], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp474()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp475(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp475(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[0], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp475()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp476(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp476(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([0], dtype='int32'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp476()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp477(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp477(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp477()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp478(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp478(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp478()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp479(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp479(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 19, 19, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 19, 19, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp479()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp480(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp480(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 19, 19, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 19, 19, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp480()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp481(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp481(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 19, 19, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 19, 19, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp481()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp482(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp482(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 19, 19, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 19, 19, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp482()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp483(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp483(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 19, 19, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 19, 19, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp483()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp484(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp484(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 19, 19, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 19, 19, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp484()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp485(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp485(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([0], dtype='int32'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp485()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp486(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp486(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([22, 240, 14, 14], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[22, 240, 14, 14], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp486()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp487(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp487(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([22, 240, 14, 14], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[22, 240, 14, 14], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp487()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp488(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp488(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([8400, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[8400, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp488()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp489(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp489(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp489()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp490(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp490(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 42, 42, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 42, 42, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp490()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp491(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp491(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 42, 42, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 42, 42, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp491()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp492(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp492(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 42, 42, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 42, 42, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp492()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp493(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp493(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 42, 42, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 42, 42, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp493()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp494(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp494(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 42, 42, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 42, 42, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp494()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp495(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp495(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 42, 42, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 42, 42, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp495()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp496(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp496(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([0], dtype='int32'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp496()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp497(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp497(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp497()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp498(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp498(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp498()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp499(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp499(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp499()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp500(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp500(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([1], dtype='int32'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp500()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp501(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp501(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([950, 80], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[950, 80], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp501()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp502(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp502(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp502()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp503(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp503(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp503()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp504(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp504(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp504()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp505(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp505(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([-1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp505()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp506(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp506(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([-1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp506()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp507(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp507(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([-1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp507()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp508(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp508(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[0], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp508()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp509(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp509(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[0], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp509()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp510(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp510(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[0], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp510()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp511(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp511(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp511()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp512(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp512(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 22, 22, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 22, 22, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp512()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp513(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp513(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 22, 22, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 22, 22, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp513()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp514(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp514(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 22, 22, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 22, 22, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp514()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp515(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp515(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 22, 22, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 22, 22, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp515()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp516(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp516(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 22, 22, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 22, 22, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp516()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp517(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp517(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 22, 22, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 22, 22, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp517()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp518(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp518(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([1], dtype='int32'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp518()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp519(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp519(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp519()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp520(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp520(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([1, 1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp520()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp521(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp521(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([1, 1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp521()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp522(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp522(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 23, 23, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 23, 23, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp522()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp523(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp523(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 23, 23, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 23, 23, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp523()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp524(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp524(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 23, 23, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 23, 23, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp524()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp525(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp525(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 23, 23, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 23, 23, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp525()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp526(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp526(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 23, 23, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 23, 23, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp526()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp527(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp527(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 23, 23, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 23, 23, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp527()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp528(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp528(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp528()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp529(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp529(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp529()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp530(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp530(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([12096, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[12096, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp530()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp531(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp531(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([0], dtype='int32'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp531()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp532(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp532(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([1, 1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp532()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp533(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp533(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([1, 1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp533()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp534(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp534(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([1, 1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp534()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp535(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp535(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([1, 1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp535()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp536(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp536(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp536()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp537(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp537(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([100, 80], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[100, 80], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp537()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp538(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp538(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp538()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp539(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp539(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 24, 24, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 24, 24, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp539()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp540(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp540(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 24, 24, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 24, 24, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp540()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp541(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp541(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 24, 24, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 24, 24, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp541()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp542(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp542(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 24, 24, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 24, 24, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp542()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp543(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp543(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 24, 24, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 24, 24, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp543()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp544(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp544(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 24, 24, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 24, 24, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp544()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp545(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp545(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([22, 48, 56, 56], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[22, 48, 56, 56], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp545()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp546(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp546(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([22, 48, 56, 56], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[22, 48, 56, 56], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp546()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp547(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp547(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([22, 48, 56, 56], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[22, 48, 56, 56], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp547()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp548(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp548(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([1], dtype='int32'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp548()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp549(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp549(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([9, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[9, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp549()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp550(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp550(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([9, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[9, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp550()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp551(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp551(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp551()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp552(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp552(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp552()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp553(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp553(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp553()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp554(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp554(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp554()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp555(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp555(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([0], dtype='int32'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp555()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp556(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp556(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([1, 1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp556()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp557(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp557(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([1, 1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp557()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp558(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp558(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([1, 1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp558()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp559(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp559(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([1, 1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp559()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp560(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp560(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([1, 1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp560()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp561(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp561(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([1, 1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp561()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp562(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp562(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([1, 1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp562()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp563(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp563(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp563()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp564(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp564(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp564()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp565(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp565(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp565()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp566(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp566(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp566()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp567(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp567(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp567()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp568(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp568(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp568()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp569(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp569(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp569()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp570(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp570(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp570()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp571(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp571(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp571()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp572(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp572(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp572()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp573(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp573(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp573()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp574(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp574(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp574()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp575(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp575(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp575()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp576(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp576(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp576()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp577(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp577(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp577()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp578(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp578(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp578()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp579(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp579(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp579()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp580(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp580(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp580()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp581(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp581(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp581()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp582(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp582(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp582()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp583(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp583(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp583()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp584(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp584(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp584()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp585(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp585(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([-1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp585()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp586(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp586(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([-1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp586()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp587(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp587(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([-1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp587()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp588(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp588(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[0], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp588()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp589(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp589(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[0], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp589()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp590(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp590(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[0], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp590()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp591(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp591(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp591()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp592(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp592(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp592()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp593(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp593(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 48, 48, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 48, 48, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp593()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp594(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp594(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 48, 48, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 48, 48, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp594()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp595(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp595(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 48, 48, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 48, 48, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp595()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp596(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp596(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 48, 48, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 48, 48, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp596()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp597(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp597(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 48, 48, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 48, 48, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp597()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp598(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp598(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 48, 48, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 48, 48, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp598()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp599(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp599(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([-1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp599()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp600(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp600(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([-1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp600()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp601(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp601(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([-1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp601()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp602(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp602(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[0], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp602()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp603(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp603(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[0], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp603()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp604(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp604(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[0], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp604()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp605(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp605(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp605()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp606(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp606(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([0], dtype='int32'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp606()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp607(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp607(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp607()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp608(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp608(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp608()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp609(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp609(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp609()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp610(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp610(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([0], dtype='int32'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp610()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp611(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp611(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp611()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp612(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp612(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp612()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp613(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp613(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([1], dtype='int32'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp613()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp614(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp614(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([1], dtype='int32'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp614()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp615(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp615(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp615()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp616(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp616(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp616()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp617(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp617(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([-1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp617()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp618(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp618(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([-1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp618()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp619(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp619(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([-1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp619()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp620(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp620(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[0], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp620()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp621(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp621(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[0], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp621()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp622(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp622(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[0], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp622()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp623(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp623(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp623()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp624(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp624(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([2], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp624()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp625(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp625(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp625()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp626(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp626(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp626()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp627(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp627(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([0], dtype='int32'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp627()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp628(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp628(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 44, 44, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 44, 44, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp628()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp629(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp629(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 44, 44, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 44, 44, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp629()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp630(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp630(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 44, 44, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 44, 44, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp630()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp631(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp631(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 44, 44, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 44, 44, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp631()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp632(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp632(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 44, 44, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 44, 44, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp632()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp633(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp633(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([1, 3, 44, 44, 1], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1, 3, 44, 44, 1], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp633()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp634(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp634(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([-1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp634()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp635(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp635(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([-1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp635()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp636(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp636(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([-1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp636()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp637(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp637(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[0], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp637()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp638(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp638(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[0], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp638()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp639(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp639(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[0], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp639()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp640(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp640(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp640()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp641(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp641(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp641()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp642(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp642(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.uniform([], dtype='float32', min=-0.5, max=0.5),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp642()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp643(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp643(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([2], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp643()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp644(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp644(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp644()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-class PrimitiveOp645(paddle.nn.Layer):
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0):
-        return input_0
-
-class TestPrimitiveOp645(TestBase, unittest.TestCase):
-    def prepare_data(self):
-        self.inputs = [
-            paddle.to_tensor([1], dtype='int64'),
-        ]
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def apply_to_static(self, net, use_cinn):
-        build_strategy = paddle.static.BuildStrategy()
-        input_spec = [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        build_strategy.build_cinn_pass = use_cinn
-        return paddle.jit.to_static(
-            net,
-            input_spec=input_spec,
-            build_strategy=build_strategy,
-            full_graph=True,
-        )
-
-    def train(self, use_cinn):
-        net = PrimitiveOp645()
-        if GetEnvVarEnableJit():
-            net = self.apply_to_static(net, use_cinn)
-        out = net(*self.inputs)
-        return out
-
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+if __name__ == "__main__":
+    sys.exit(table.main(__file__))
@@ -1,9900 +1,28 @@
 import os
-os.environ['FLAGS_cinn_new_group_scheduler'] = '1'
-os.environ['FLAGS_group_schedule_tiling_first'] = '1'
-os.environ['FLAGS_enable_pir_api'] = '1'
-os.environ['FLAGS_cinn_bucket_compile'] = '1'
 import sys
-import unittest
-import numpy as np
-from dataclasses import dataclass
-import typing as t
 
-@dataclass
-class Stage:
-    name: str
-    env_vars: t.Dict[str, str]
+import pytest
 
-cinn_stages = [
-    Stage(
-        name="dynamic_to_static",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=False,
-            FLAGS_prim_all=False,
-            FLAGS_prim_enable_dynamic=False,
-        ),
-    ),
-    Stage(
-        name="prim",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=False,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-        ),
-    ),
-    Stage(
-        name="infer_symbolic",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=False,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-            FLAGS_use_cinn=False,
-            FLAGS_check_infer_symbolic=True,
-        ),
-    ),
-	Stage(
-        name="frontend",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=True,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-            FLAGS_use_cinn=True,
-            FLAGS_check_infer_symbolic=False,
-            FLAGS_enable_fusion_fallback=True,
-        ), 
-    ),
-    Stage(
-        name="backend",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=True,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-            FLAGS_use_cinn=True,
-            FLAGS_check_infer_symbolic=False,
-            FLAGS_enable_fusion_fallback=False,
-        ), 
-    ),
-]
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir, os.pardir))
+from tools.e2e_case_stage import CinnStages  # noqa: E402
 
-def GetCinnStageByName(name):
-    for stage in cinn_stages:
-        if stage.name == name:
-            return stage
-    return None
+stages = CinnStages(__file__)
 
-def GetCurrentCinnStage():
-    name = os.getenv('PADDLE_DEBUG_CINN_STAGE_NAME')
-    if name is None:
-        return None
-    stage_names = [stage.name for stage in cinn_stages]
-    assert name in stage_names, (
-        f"PADDLE_DEBUG_CINN_STAGE_NAME should be in {stage_names}"
-    )
-    return GetCinnStageByName(name)
+from tools.e2e_case_table import E2ECaseTable, CinnTestBase  # noqa: E402
 
-def GetPrevCinnStage(stage):
-    for i in range(1, len(cinn_stages)):
-        if stage is cinn_stages[i]:
-            return cinn_stages[i - 1]
-    return None
+stages.apply()
+table = E2ECaseTable(__file__)
+last_stage_failed = stages.last_stage_failed()
 
-def IsCinnStageEnableDiff():
-    value = os.getenv('PADDLE_DEBUG_CINN_STAGE_ENABLE_DIFF')
-    enabled = value in {
-        '1',
-        'true',
-        'True',
-    }
-    if enabled:
-        assert GetCurrentCinnStage() is not None
-    return enabled
 
-last_cinn_stage_exit_code = None
-def LastCINNStageFailed():
-    global last_cinn_stage_exit_code
-    if last_cinn_stage_exit_code is not None:
-        return last_cinn_stage_exit_code != 0
-    last_stage = GetPrevCinnStage(GetCurrentCinnStage())
-    if last_stage is None:
-        return False
-    env_vars = dict(
-        PADDLE_DEBUG_CINN_STAGE_NAME=last_stage.name,
-        PADDLE_DEBUG_CINN_STAGE_ENABLE_DIFF='0',
-    )
-    env_vars_str = " ".join(
-        f"{env_var}={value}"
-        for env_var, value in env_vars.items()
-    )
-    last_cinn_stage_exit_code = os.system(
-        f"{env_vars_str} {sys.executable} {__file__} > /dev/null 2>&1"
-    )
-    return last_cinn_stage_exit_code != 0
+def pytest_generate_tests(metafunc):
+    table.parametrize(metafunc)
 
-def SetDefaultEnv(**env_var2value):
-    for env_var, value in env_var2value.items():
-        if os.getenv(env_var) is None:
-            os.environ[env_var] = str(value)
 
-SetDefaultEnv(
-    PADDLE_DEBUG_CINN_STAGE_NAME="backend",
-    PADDLE_DEBUG_CINN_STAGE_ENABLE_DIFF=False,
-    PADDLE_DEBUG_ENABLE_CINN=True,
-    FLAGS_enable_pir_api=True,
-    FLAGS_prim_all=True,
-    FLAGS_prim_enable_dynamic=True,
-    FLAGS_use_cinn=False,
-    FLAGS_check_infer_symbolic=False,
-    FLAGS_enable_fusion_fallback=False,
-)
+@pytest.mark.skipif(last_stage_failed, reason="last stage failed")
+class TestPrimitiveOp(CinnTestBase):
+    table = table
 
-import paddle
 
-def SetEnvVar(env_var2value):
-    for env_var, value in env_var2value.items():
-        os.environ[env_var] = str(value)
-    paddle.set_flags({
-        env_var:value
-        for env_var, value in env_var2value.items()
-        if env_var.startswith('FLAGS_')
-    })
-
-if GetCurrentCinnStage() is not None:
-    SetEnvVar(GetCurrentCinnStage().env_vars)
-
-def GetEnvVarEnableJit():
-    enable_jit = os.getenv('PADDLE_DEBUG_ENABLE_JIT')
-    return enable_jit not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
-
-def GetEnvVarEnableCinn():
-    enable_cinn = os.getenv('PADDLE_DEBUG_ENABLE_CINN')
-    if enable_cinn is None:
-        return True
-    return enable_cinn not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
-
-
-def GetTolerance(dtype):
-    if dtype == np.float16:
-        return GetFloat16Tolerance()
-    if dtype == np.float32:
-        return GetFloat32Tolerance()
-    return 1e-6
-
-def GetFloat16Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT16_TOL'))
-    except:
-        return 1e-3
-
-def GetFloat32Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT32_TOL'))
-    except:
-        return 1e-6
-
-def IsInteger(dtype):
-    return np.dtype(dtype).char in np.typecodes['AllInteger']
-
-def ApplyToStatic(net, use_cinn):
-    build_strategy = paddle.static.BuildStrategy()
-    build_strategy.build_cinn_pass = use_cinn
-    return paddle.jit.to_static(
-        net,
-        input_spec=net.get_input_spec(),
-        build_strategy=build_strategy,
-        full_graph=True,
-    )
-
-class InstanceTrait:
-
-    @classmethod
-    def instance(cls):
-        if cls.instance_ is None:
-            cls.instance_ = cls()
-        return cls.instance_
-
-    @classmethod
-    def static_instance_with_cinn(cls):
-        if cls.static_instance_with_cinn_ is None:
-            cls.static_instance_with_cinn_ = ApplyToStatic(
-                cls.instance(),
-                use_cinn=True
-            )
-        return cls.static_instance_with_cinn_
-
-    @classmethod
-    def static_instance_without_cinn(cls):
-        if cls.static_instance_without_cinn_ is None:
-            cls.static_instance_without_cinn_ = ApplyToStatic(
-                cls.instance(),
-                use_cinn=False
-            )
-        return cls.static_instance_without_cinn_
-
-
-class CinnTestBase:
-
-    def setUp(self):
-        paddle.seed(2024)
-        self.prepare_data()
-
-    def test_train(self):
-        dy_outs = self.train(use_cinn=False)
-        cinn_outs = self.train(use_cinn=GetEnvVarEnableCinn())
-
-        for cinn_out, dy_out in zip(cinn_outs, dy_outs):
-          if type(cinn_out) is list and type(dy_out) is list:
-            for x, y in zip(cinn_out, dy_out):
-              self.assert_all_close(x, y)
-          else:
-            self.assert_all_close(cinn_out, dy_out)
-
-    def train(self, use_cinn):
-        if GetEnvVarEnableJit():
-            net = self.prepare_static_net(use_cinn)
-        else:
-            net = self.prepare_net()
-        paddle.seed(2024)
-        out = net(*self.inputs)
-        return out
-    
-    def prepare_data(self):
-        self.inputs = self.get_inputs()
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def prepare_net(self):
-        return self.get_test_class().instance()
-
-    def prepare_static_net(self, use_cinn):
-        if use_cinn:
-            return self.get_test_class().static_instance_with_cinn()
-        else:
-            return self.get_test_class().static_instance_without_cinn()
-
-    def assert_all_close(self, x, y):
-        if (hasattr(x, "numpy") and hasattr(y, "numpy")):
-            x_numpy = x.numpy()
-            y_numpy = y.numpy()
-            assert x_numpy.dtype == y_numpy.dtype
-            if IsInteger(x_numpy.dtype):
-                np.testing.assert_equal(x_numpy, y_numpy)
-            else:
-                tol = GetTolerance(x_numpy.dtype)
-                np.testing.assert_allclose(x_numpy, y_numpy, atol=tol, rtol=tol)
-        else:
-            assert x == y
-
-
-
-
-
-last_stage_failed = (IsCinnStageEnableDiff() and LastCINNStageFailed())
-class PrimitiveOp_1848e60d49960e74b723e5f73421c99d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1):
-        input_0 = [arg_0_0, arg_0_1]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bb4ed6179b2a01843f7b0404f8c4d82d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1848e60d49960e74b723e5f73421c99d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 21504, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 21504, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1):
-        input_0 = [arg_0_0, arg_0_1]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_88bc0c57e668f9e2df7223998fb5ca57(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([24, 36], dtype='float32', min=0, max=0.5),
-            paddle.uniform([24, 36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_9474a7d4d5a85165199c02bcc1cf1bb7(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1, arg_0_2, arg_0_3):
-        input_0 = [arg_0_0, arg_0_1, arg_0_2, arg_0_3]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 4], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 4], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 4], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 4], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_72c239abbbaca8cf2c19e6e35ade7786(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9474a7d4d5a85165199c02bcc1cf1bb7
-    def get_inputs(self):
-        return [
-            paddle.uniform([300, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-        ]
-
-
-
-class PrimitiveOp_c94fdf92a6bffb44756955b6d8df0b87(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1, arg_0_2, arg_0_3):
-        input_0 = [arg_0_0, arg_0_1, arg_0_2, arg_0_3]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None], dtype='int32'),
-            paddle.static.InputSpec(shape=[None], dtype='int32'),
-            paddle.static.InputSpec(shape=[None], dtype='int32'),
-            paddle.static.InputSpec(shape=[None], dtype='int32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cd8413f40117fe087071a90c85e9eb53(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c94fdf92a6bffb44756955b6d8df0b87
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([300], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-
-class PrimitiveOp_f106e9dda5232c93243dff7fc2676c69(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1):
-        input_0 = [arg_0_0, arg_0_1]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 18, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 9, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_44124b1631ce8b732a6280243ef6e81e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f106e9dda5232c93243dff7fc2676c69
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 24, 36], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 24, 36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7d8e9bcd2df434a2ee27726613b97239(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9474a7d4d5a85165199c02bcc1cf1bb7
-    def get_inputs(self):
-        return [
-            paddle.uniform([8, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4c0d35f3b5a0f30e8f44d6221d391b98(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c94fdf92a6bffb44756955b6d8df0b87
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([8], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5edc119b2f8149f398662a8d2645efde(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9474a7d4d5a85165199c02bcc1cf1bb7
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.42679834365844727, 0.23651418089866638, 0.21780942380428314, 0.3397963345050812], [0.17834825813770294, 0.1380310207605362, 0.3761334717273712, 0.03816692531108856]], dtype='float32').reshape([2, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_97e60f0d8187517dbccc2e56bc869089(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c94fdf92a6bffb44756955b6d8df0b87
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([2], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-
-class PrimitiveOp_1457086f8118f6ae44c94f8b23f05743(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1):
-        input_0 = [arg_0_0, arg_0_1]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 2], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, 2], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c52b5fc607993875a61bf26722edbc5b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1457086f8118f6ae44c94f8b23f05743
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3549, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3549, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_092a8d62914230a463eeb9d7215936c4(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1):
-        input_0 = [arg_0_0, arg_0_1]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_edba7fda5fe10881888a3f3b2ba969ea(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 16, 16], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_144ad015232a4ec9babf8748384970a2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([32, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_959ccfa6b5df262a29ac321871188c90(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([64, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6e49408cda69bce22d03907e6a4ad98e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([128, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4d39cebbb9ce8b420f2268eb38ce6406(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9474a7d4d5a85165199c02bcc1cf1bb7
-    def get_inputs(self):
-        return [
-            paddle.uniform([100, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_690b381e3831f63d2c4d59a651a79570(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c94fdf92a6bffb44756955b6d8df0b87
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([100], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_70bb88f93de413821c8609aac9786df4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f106e9dda5232c93243dff7fc2676c69
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 112, 160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 112, 160], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_9392b30c0e30f025725ed475fb5621b9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1):
-        input_0 = [arg_0_0, arg_0_1]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 80, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 32, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_dc551b7c1c58b70a0dd7762fcf26dba3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9392b30c0e30f025725ed475fb5621b9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 6, 6], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 6, 6], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7c31944942426a78ec58610628e274a0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9392b30c0e30f025725ed475fb5621b9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 52, 52], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 52, 52], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f711307187e6a459aa52e55d4d96254e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_8d508cf2cbc394b8467027eb29c340e5(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1):
-        input_0 = [arg_0_0, arg_0_1]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[96, 96], dtype='float32'),
-            paddle.static.InputSpec(shape=[96, 96], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0510205a9c7efdd4d2de55a77f5418b1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8d508cf2cbc394b8467027eb29c340e5
-    def get_inputs(self):
-        return [
-            paddle.uniform([96, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_58d1fc007f768492e002012cdf5c79e9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1):
-        input_0 = [arg_0_0, arg_0_1]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[48, 48], dtype='float32'),
-            paddle.static.InputSpec(shape=[48, 48], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a8ccc9c595004109166c3fae8d05cdc4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_58d1fc007f768492e002012cdf5c79e9
-    def get_inputs(self):
-        return [
-            paddle.uniform([48, 48], dtype='float32', min=0, max=0.5),
-            paddle.uniform([48, 48], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_0a4b9c90c22e6ec6569fdb099c53a9f1(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1):
-        input_0 = [arg_0_0, arg_0_1]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[24, 24], dtype='float32'),
-            paddle.static.InputSpec(shape=[24, 24], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1701b798f38005fd8e96c92e7e1e32af(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0a4b9c90c22e6ec6569fdb099c53a9f1
-    def get_inputs(self):
-        return [
-            paddle.uniform([24, 24], dtype='float32', min=0, max=0.5),
-            paddle.uniform([24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5c828b0cc0c36d336ec79f8430d27e58(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1848e60d49960e74b723e5f73421c99d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 12096, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 12096, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0510205a9c7efdd4d2de55a77f5418b1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8d508cf2cbc394b8467027eb29c340e5
-    def get_inputs(self):
-        return [
-            paddle.uniform([96, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a8ccc9c595004109166c3fae8d05cdc4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_58d1fc007f768492e002012cdf5c79e9
-    def get_inputs(self):
-        return [
-            paddle.uniform([48, 48], dtype='float32', min=0, max=0.5),
-            paddle.uniform([48, 48], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1701b798f38005fd8e96c92e7e1e32af(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0a4b9c90c22e6ec6569fdb099c53a9f1
-    def get_inputs(self):
-        return [
-            paddle.uniform([24, 24], dtype='float32', min=0, max=0.5),
-            paddle.uniform([24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_353cef533498117db7a6e1f950fb36af(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9392b30c0e30f025725ed475fb5621b9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 60, 60], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 60, 60], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8c6f2b983f9d859f3383c79a15bbeee4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f106e9dda5232c93243dff7fc2676c69
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 24, 24], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7b754fd89cd1714facabcab6a67ce3f3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9392b30c0e30f025725ed475fb5621b9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 11, 11], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 11, 11], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2cc80236ac0ea62e1a1396636437ef6b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9474a7d4d5a85165199c02bcc1cf1bb7
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.2619287967681885, 0.2820969820022583, 0.3830491006374359, 0.33446410298347473], [0.15669028460979462, 0.27159908413887024, 0.19021214544773102, 0.32523876428604126]], dtype='float32').reshape([2, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_97e60f0d8187517dbccc2e56bc869089(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c94fdf92a6bffb44756955b6d8df0b87
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([2], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-
-class PrimitiveOp_536554d4068550f339721ff7091de2ab(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1, arg_0_2):
-        input_0 = [arg_0_0, arg_0_1, arg_0_2]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 48, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 48, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 48, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_738ad3ab4bec68e89c6e3dbf4fc36676(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_536554d4068550f339721ff7091de2ab
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 48, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 48, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 48, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c1782ba106b739e0998af469f53e9819(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f106e9dda5232c93243dff7fc2676c69
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 30, 50], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 30, 50], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_747308f836dc0eb5fd5914713203fec5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9392b30c0e30f025725ed475fb5621b9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 9, 9], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 9, 9], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_b2129367263bf0a2cc9c6b900b6f92dc(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1, arg_0_2, arg_0_3):
-        input_0 = [arg_0_0, arg_0_1, arg_0_2, arg_0_3]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_75faab608a83945414e01dcdb67da3f9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b2129367263bf0a2cc9c6b900b6f92dc
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[0.358097106218338, 0.35106879472732544]], [[0.4313538074493408, 0.08216709643602371]], [[0.05587208271026611, 0.3657324016094208]], [[0.31227242946624756, 0.3250352442264557]], [[0.4644756019115448, 0.35592329502105713]], [[0.12418679893016815, 0.4918902516365051]]]], dtype='float32').reshape([1, 6, 1, 2]),
-            paddle.to_tensor([[[[0.009778277017176151, 0.02429402805864811]], [[0.0029977455269545317, 0.20873524248600006]], [[0.46495717763900757, 0.0797295793890953]], [[0.39304178953170776, 0.019942941144108772]], [[0.1783885955810547, 0.41458258032798767]], [[0.47772762179374695, 0.20179226994514465]]]], dtype='float32').reshape([1, 6, 1, 2]),
-            paddle.to_tensor([[[[0.38811081647872925, 0.3460862338542938]], [[0.4325200915336609, 0.31605264544487]], [[0.17037074267864227, 0.4002247750759125]], [[0.02829047478735447, 0.1041380912065506]], [[0.44935834407806396, 0.04506528005003929]], [[0.24431096017360687, 0.3555302619934082]]]], dtype='float32').reshape([1, 6, 1, 2]),
-            paddle.to_tensor([[[[0.3234972059726715, 0.20493970811367035]], [[0.3132672607898712, 0.17412687838077545]], [[0.014389144256711006, 0.3884662687778473]], [[0.3867090344429016, 0.06462222337722778]], [[0.17619918286800385, 0.07482553273439407]], [[0.027263877913355827, 0.33704501390457153]]]], dtype='float32').reshape([1, 6, 1, 2]),
-        ]
-
-
-
-class PrimitiveOp_6a175d0c0530a3c5162117bbcd513875(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1, arg_0_2):
-        input_0 = [arg_0_0, arg_0_1, arg_0_2]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3637723aca3c0cc64ee09071c63d7956(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a175d0c0530a3c5162117bbcd513875
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[0.29133909940719604, 0.4853375554084778], [0.36761757731437683, 0.4571003019809723], [0.46794551610946655, 0.1688530147075653], [0.2670198976993561, 0.1982056200504303], [0.12026780098676682, 0.48663008213043213], [0.2773101329803467, 0.48897823691368103]]], dtype='float32').reshape([1, 6, 2]),
-            paddle.to_tensor([[[0.4026823937892914, 0.4708717167377472], [0.22823500633239746, 0.07231664657592773], [0.4897056519985199, 0.011129551567137241], [0.37206071615219116, 0.07582680135965347], [0.40325236320495605, 0.4095800518989563], [0.458786278963089, 0.13427451252937317]]], dtype='float32').reshape([1, 6, 2]),
-            paddle.to_tensor([[[0.1645549237728119], [0.058689385652542114], [0.36124107241630554], [0.27911141514778137], [0.4413716495037079], [0.3439434766769409]]], dtype='float32').reshape([1, 6, 1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_07971b1ceb2a33e1f71089fbe82aab1d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9392b30c0e30f025725ed475fb5621b9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d1b2370ecbb4efe49164afd11ec0b4bc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9392b30c0e30f025725ed475fb5621b9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 24, 24], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7d4b4b7a886369b5abf5c9b7038c96f2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9392b30c0e30f025725ed475fb5621b9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 12, 12], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 12, 12], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ce85f41b5f7c8bbf70e0eba5b553d1ae(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9474a7d4d5a85165199c02bcc1cf1bb7
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.2063712179660797, 0.3073878884315491, 0.20581398904323578, 0.009677620604634285], [0.07508716732263565, 0.22653378546237946, 0.4011777937412262, 0.2833462059497833]], dtype='float32').reshape([2, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_97e60f0d8187517dbccc2e56bc869089(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c94fdf92a6bffb44756955b6d8df0b87
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([2], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c6f323ffac33f8de847925ea46a7253e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f106e9dda5232c93243dff7fc2676c69
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 16, 16], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7d8e9bcd2df434a2ee27726613b97239(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9474a7d4d5a85165199c02bcc1cf1bb7
-    def get_inputs(self):
-        return [
-            paddle.uniform([8, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4c0d35f3b5a0f30e8f44d6221d391b98(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c94fdf92a6bffb44756955b6d8df0b87
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([8], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_dc93c5815c78619d759c2645eef014e0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1457086f8118f6ae44c94f8b23f05743
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 7581, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 7581, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_5c3ae42c817ec934892ae13bad46f641(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1, arg_0_2, arg_0_3):
-        input_0 = [arg_0_0, arg_0_1, arg_0_2, arg_0_3]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[300], dtype='float32'),
-            paddle.static.InputSpec(shape=[300], dtype='float32'),
-            paddle.static.InputSpec(shape=[300], dtype='float32'),
-            paddle.static.InputSpec(shape=[300], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_adeaa095b592912bbd3a3f841506a5a7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c3ae42c817ec934892ae13bad46f641
-    def get_inputs(self):
-        return [
-            paddle.uniform([300], dtype='float32', min=0, max=0.5),
-            paddle.uniform([300], dtype='float32', min=0, max=0.5),
-            paddle.uniform([300], dtype='float32', min=0, max=0.5),
-            paddle.uniform([300], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_94acec3b8c48b789729b93f51dc717e9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1):
-        input_0 = [arg_0_0, arg_0_1]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 40, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 40, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e5982e2aec6679593f25fdd4d8b48319(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_94acec3b8c48b789729b93f51dc717e9
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 40, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 40, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_979426c7c8aa6341f1f78e034608ae3f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([25, 38], dtype='float32', min=0, max=0.5),
-            paddle.uniform([25, 38], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_12bf2ac8c534ef4d25941c2dc1369827(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 24, 24], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cc65f589714792b7d937f9e9ec521abe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1457086f8118f6ae44c94f8b23f05743
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4725, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 4725, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_07971b1ceb2a33e1f71089fbe82aab1d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9392b30c0e30f025725ed475fb5621b9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c7d6a2ce7bf0245f9bed82faedd832d0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9392b30c0e30f025725ed475fb5621b9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 15, 15], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 15, 15], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_58ff7aa29e7c894b62adecece32e7017(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 12, 12], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 64, 12, 12], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_45753d63be77e5a306508a8b2d5e948f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 36, 36], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 36, 36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8c6f2b983f9d859f3383c79a15bbeee4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f106e9dda5232c93243dff7fc2676c69
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 24, 24], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_69a3489015c06588a98698e2063d474b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1, arg_0_2, arg_0_3):
-        input_0 = [arg_0_0, arg_0_1, arg_0_2, arg_0_3]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bed8d840c219e52ffb89fdba3f405322(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_69a3489015c06588a98698e2063d474b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1777, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1777, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1777, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1777, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bed8d840c219e52ffb89fdba3f405322(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_69a3489015c06588a98698e2063d474b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1777, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1777, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1777, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1777, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_05b8bde67313b7d9c11fce33ea18321d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1848e60d49960e74b723e5f73421c99d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3549, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3549, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b4ab8938db859088e381c651a072219d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 8, 8], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 64, 8, 8], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_103c1f0030162dfbc30c343714668a20(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1457086f8118f6ae44c94f8b23f05743
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8400, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 8400, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_632825a5440eead2cdfc0d10e827dc22(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([20, 30], dtype='float32', min=0, max=0.5),
-            paddle.uniform([20, 30], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_6a94b94f403500d4ee1dde12643c597d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1):
-        input_0 = [arg_0_0, arg_0_1]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[64, 64], dtype='float32'),
-            paddle.static.InputSpec(shape=[64, 64], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0d20f1964c4888a17821a1a626aea80e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a94b94f403500d4ee1dde12643c597d
-    def get_inputs(self):
-        return [
-            paddle.uniform([64, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_093122e485d209c87b4a878cf06c16f4(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1):
-        input_0 = [arg_0_0, arg_0_1]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[32, 32], dtype='float32'),
-            paddle.static.InputSpec(shape=[32, 32], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_88631d0e73f108117223f60cdea95a67(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_093122e485d209c87b4a878cf06c16f4
-    def get_inputs(self):
-        return [
-            paddle.uniform([32, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_b63825d1a4ae907c88ba57f8f5b33c40(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1):
-        input_0 = [arg_0_0, arg_0_1]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[16, 16], dtype='float32'),
-            paddle.static.InputSpec(shape=[16, 16], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_25051e3f9454a43e201351daa822d29c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b63825d1a4ae907c88ba57f8f5b33c40
-    def get_inputs(self):
-        return [
-            paddle.uniform([16, 16], dtype='float32', min=0, max=0.5),
-            paddle.uniform([16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_068144b324fbc9d974dcb67738c5cad6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1848e60d49960e74b723e5f73421c99d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 5376, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 5376, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0d20f1964c4888a17821a1a626aea80e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a94b94f403500d4ee1dde12643c597d
-    def get_inputs(self):
-        return [
-            paddle.uniform([64, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_88631d0e73f108117223f60cdea95a67(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_093122e485d209c87b4a878cf06c16f4
-    def get_inputs(self):
-        return [
-            paddle.uniform([32, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_25051e3f9454a43e201351daa822d29c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b63825d1a4ae907c88ba57f8f5b33c40
-    def get_inputs(self):
-        return [
-            paddle.uniform([16, 16], dtype='float32', min=0, max=0.5),
-            paddle.uniform([16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ca06e326663f0c79728d5a2cb1fd4e4a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9474a7d4d5a85165199c02bcc1cf1bb7
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.06533878296613693, 0.3481195271015167, 0.24883194267749786, 0.20702722668647766], [0.2230253666639328, 0.34996768832206726, 0.4861466884613037, 0.13386943936347961], [0.30274221301078796, 0.3233219087123871, 0.3567175567150116, 0.4390983283519745], [0.46446141600608826, 0.3582879900932312, 0.3432950973510742, 0.4376503527164459], [0.17208008468151093, 0.10273945331573486, 0.30130621790885925, 0.48919835686683655], [0.012808924540877342, 0.03297838196158409, 0.20926563441753387, 0.185565784573555], [0.033298660069704056, 0.21981042623519897, 0.06827296316623688, 0.3866482675075531]], dtype='float32').reshape([7, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5f2a9a34d9ce095a6d373a978df49d93(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c94fdf92a6bffb44756955b6d8df0b87
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([7], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4f0f87da5d1e5a66cd8e407e42a08944(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9392b30c0e30f025725ed475fb5621b9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 48, 48], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 48, 48], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0bf89928138f5b24110587c67e8fa6e7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f106e9dda5232c93243dff7fc2676c69
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 48, 72], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 48, 72], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c52b5fc607993875a61bf26722edbc5b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1457086f8118f6ae44c94f8b23f05743
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3549, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3549, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_34b5bfe351392a61a4919e8b0fb9b096(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1, arg_0_2, arg_0_3, arg_0_4, arg_0_5, arg_0_6, arg_0_7):
-        input_0 = [arg_0_0, arg_0_1, arg_0_2, arg_0_3, arg_0_4, arg_0_5, arg_0_6, arg_0_7]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_dda2a47081d8eb070b1881dc1fd6993a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_34b5bfe351392a61a4919e8b0fb9b096
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 28, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 28, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 28, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 28, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 28, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 28, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 28, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 28, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_e734ca0b10721d7d688a261329cb981a(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1, arg_0_2, arg_0_3):
-        input_0 = [arg_0_0, arg_0_1, arg_0_2, arg_0_3]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_de5fb3bbccce1bbe51dfdfd3e1c144e6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.39208778738975525], [0.2094176560640335], [0.1283661276102066], [0.27551141381263733], [0.03479340672492981], [0.3570266664028168], [0.11812948435544968], [0.2456916868686676], [0.48227444291114807]], dtype='float32').reshape([9, 1]),
-            paddle.to_tensor([[0.49722179770469666], [0.4310191571712494], [0.3834795355796814], [0.30722612142562866], [0.2178652435541153], [0.11710164695978165], [0.23001685738563538], [0.22062554955482483], [0.498458594083786]], dtype='float32').reshape([9, 1]),
-            paddle.to_tensor([[0.36820653080940247], [0.03848660737276077], [0.08805205672979355], [0.03780742734670639], [0.23160281777381897], [0.18210230767726898], [0.21688763797283173], [0.009429873898625374], [0.23962129652500153]], dtype='float32').reshape([9, 1]),
-            paddle.to_tensor([[0.39371946454048157], [0.050644610077142715], [0.09682576358318329], [0.37938541173934937], [0.37218934297561646], [0.31943804025650024], [0.009334404021501541], [0.027887742966413498], [0.1417359560728073]], dtype='float32').reshape([9, 1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9e7b78a17b390b150c65dfcfdbfbdc11(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.1547079086303711], [0.3591558635234833], [0.15294159948825836], [0.019754718989133835], [0.2135521024465561], [0.2554653286933899], [0.3142800033092499], [0.4077095687389374], [0.42899003624916077]], dtype='float32').reshape([9, 1]),
-            paddle.to_tensor([[0.39656439423561096], [0.12202204018831253], [0.0054341829381883144], [0.014495838433504105], [0.0013494952581822872], [0.28443190455436707], [0.2855451703071594], [0.20876038074493408], [0.38022154569625854]], dtype='float32').reshape([9, 1]),
-            paddle.to_tensor([[0.08568544685840607], [0.1383717805147171], [0.2306109517812729], [0.03215041384100914], [0.05588645488023758], [0.1058163195848465], [0.12910811603069305], [0.02052994631230831], [0.24312002956867218]], dtype='float32').reshape([9, 1]),
-            paddle.to_tensor([[0.08652636408805847], [0.38375985622406006], [0.22444428503513336], [0.3983890116214752], [0.28843000531196594], [0.07827463001012802], [0.3716101050376892], [0.20676524937152863], [0.260421484708786]], dtype='float32').reshape([9, 1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3f92a555e56ec4598276ce514961795b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f106e9dda5232c93243dff7fc2676c69
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 60, 100], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 60, 100], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6933fc52eaa223c14c2741bab6c14bb2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 20, 128, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 20, 128, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a584fcd652d89ea075bfce9f2062e1b3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 40, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 40, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f395f03fafee203c555a94643e375026(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 32, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 80, 32, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f6d6a9ddb8f95fbf71f1c24be8d10219(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 16, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 160, 16, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9702dd4de525a1a0e32240c2d0e4d5a8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9392b30c0e30f025725ed475fb5621b9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 4, 4], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 4, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e071bdf646921666e1dba8eb6bf9999b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_69a3489015c06588a98698e2063d474b
-    def get_inputs(self):
-        return [
-            paddle.uniform([5480, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([5480, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([5480, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([5480, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e071bdf646921666e1dba8eb6bf9999b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_69a3489015c06588a98698e2063d474b
-    def get_inputs(self):
-        return [
-            paddle.uniform([5480, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([5480, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([5480, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([5480, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b5f7f362f5ad5b569ecb7d82e6494e97(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1848e60d49960e74b723e5f73421c99d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 11109, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 11109, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fd63e9365b1931d59162ae47dc77e0b5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f106e9dda5232c93243dff7fc2676c69
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 36, 36], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 36, 36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d99719fd530fb13467ed5098e5a74563(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9474a7d4d5a85165199c02bcc1cf1bb7
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.0744657814502716, 0.12276715785264969, 0.35531410574913025, 0.48441699147224426], [0.3495769500732422, 0.41702592372894287, 0.4514731168746948, 0.1187334656715393], [0.08253531157970428, 0.12003565579652786, 0.47612228989601135, 0.23035909235477448], [0.2246844619512558, 0.05810641497373581, 0.18594786524772644, 0.02734232135117054], [0.0647694543004036, 0.20631584525108337, 0.4361419379711151, 0.3645848035812378], [0.18269386887550354, 0.03176182508468628, 0.43640458583831787, 0.15800030529499054]], dtype='float32').reshape([6, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3af90ab907c9af06442c56824c7738ad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c94fdf92a6bffb44756955b6d8df0b87
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([6], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3f92a555e56ec4598276ce514961795b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f106e9dda5232c93243dff7fc2676c69
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 60, 100], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 60, 100], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7f6b8896b417264f9f0afe8e219cefe9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9392b30c0e30f025725ed475fb5621b9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_eeb0b9bab044b09395736d2a9f87a00e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1):
-        input_0 = [arg_0_0, arg_0_1]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 8, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 8, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f124bab359a957b381a6b58944d87fde(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_eeb0b9bab044b09395736d2a9f87a00e
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 8, 112, 112], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 8, 112, 112], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_521b3532a5cf474d80a43a789797cc1d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1):
-        input_0 = [arg_0_0, arg_0_1]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 48, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 48, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5c160a65581f855c57038ac0613bde1d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_521b3532a5cf474d80a43a789797cc1d
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 48, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 48, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ea933872bf753e770dfbcef807033200(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9474a7d4d5a85165199c02bcc1cf1bb7
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.4612564742565155, 0.11859863251447678, 0.24108052253723145, 0.22271811962127686], [0.3189566135406494, 0.4748760163784027, 0.2607230246067047, 0.26097407937049866], [0.11517703533172607, 0.30200156569480896, 0.4437040686607361, 0.34151124954223633]], dtype='float32').reshape([3, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ddc5f29dbd04067f08de4222dfec09e2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c94fdf92a6bffb44756955b6d8df0b87
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([3], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4a1124fc591ac9867819bf737c738110(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 34, 34], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 34, 34], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_119b12e7f83ba8739a2ea9c81b0d1603(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f106e9dda5232c93243dff7fc2676c69
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 7, 10], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 7, 10], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_24d21c474b6d10b419d2aa8de3ff16f1(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1):
-        input_0 = [arg_0_0, arg_0_1]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 120, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 120, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7fcaf03c4a02d1b0253f5797aedc251f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_24d21c474b6d10b419d2aa8de3ff16f1
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 120, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 120, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_372b53cca9711d495286672dc7f1828b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9392b30c0e30f025725ed475fb5621b9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 44, 44], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 44, 44], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f0740cf76dfcc5c2cbf7abd4fdc48a1c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_34b5bfe351392a61a4919e8b0fb9b096
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 28, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 28, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 28, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 28, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 28, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 28, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 28, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 28, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d4bb432e730ad8ef66231d92c5203859(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 18, 18], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 18, 18], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_499fbde81d3808b6ea0a46a48f40c6f4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 17, 17], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 17, 17], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_37cf37afe65d5db7a40d6a8556820c90(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_24d21c474b6d10b419d2aa8de3ff16f1
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 120, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 120, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9e1538baf0702a5a965023a2fbe99923(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_34b5bfe351392a61a4919e8b0fb9b096
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 28, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 28, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 28, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 28, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 28, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 28, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 28, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 28, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cac049235f5ed539d2fc14f4aa46d3e7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9392b30c0e30f025725ed475fb5621b9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 22, 22], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 22, 22], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_d5dc53de0d2688a5b4748447c9855df4(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1, arg_0_2, arg_0_3):
-        input_0 = [arg_0_0, arg_0_1, arg_0_2, arg_0_3]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_36520a4c2af733671005fc214daea88e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d5dc53de0d2688a5b4748447c9855df4
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.1027945876121521, 0.3881237208843231, 0.152043879032135, 0.21335071325302124, 0.38008421659469604, 0.12074317038059235], dtype='float32').reshape([6]),
-            paddle.to_tensor([0.2527327835559845, 0.1542942374944687, 0.470980703830719, 0.32545068860054016, 0.27355799078941345, 0.35376250743865967], dtype='float32').reshape([6]),
-            paddle.to_tensor([0.2608264982700348, 0.4725295603275299, 0.30785173177719116, 0.08038189262151718, 0.0575774721801281, 0.3921468257904053], dtype='float32').reshape([6]),
-            paddle.to_tensor([0.4957810342311859, 0.08107513189315796, 0.33436471223831177, 0.4922436773777008, 0.36378422379493713, 0.13394984602928162], dtype='float32').reshape([6]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e80f6c32f1e85d4482b01912eb33a052(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d5dc53de0d2688a5b4748447c9855df4
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.2304920107126236, 0.0650036409497261, 0.457919716835022, 0.030212104320526123, 0.35011738538742065, 0.12877273559570312], dtype='float32').reshape([6]),
-            paddle.to_tensor([0.23068910837173462, 0.1622818112373352, 0.3164260983467102, 0.16976673901081085, 0.15035927295684814, 0.22009573876857758], dtype='float32').reshape([6]),
-            paddle.to_tensor([0.24978351593017578, 0.11446373909711838, 0.06451474130153656, 0.04623079672455788, 0.3613818883895874, 0.4987070560455322], dtype='float32').reshape([6]),
-            paddle.to_tensor([0.2845926582813263, 0.16627027094364166, 0.25496557354927063, 0.29948753118515015, 0.21094956994056702, 0.2771330177783966], dtype='float32').reshape([6]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4de6feb48f84a273110c7f3b6775010c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_69a3489015c06588a98698e2063d474b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1742, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1742, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1742, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1742, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4de6feb48f84a273110c7f3b6775010c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_69a3489015c06588a98698e2063d474b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1742, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1742, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1742, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1742, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_05b8bde67313b7d9c11fce33ea18321d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1848e60d49960e74b723e5f73421c99d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3549, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3549, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a5853ed03cf16091682292f1bb647ce3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9392b30c0e30f025725ed475fb5621b9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 5, 5], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 5, 5], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_de007bd9a6ceecee7266f8c81ecb4d7c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1, arg_0_2):
-        input_0 = [arg_0_0, arg_0_1, arg_0_2]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 768], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, 768], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, 768], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e933cadd3d66798db273d8805dd117f9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_de007bd9a6ceecee7266f8c81ecb4d7c
-    def get_inputs(self):
-        return [
-            paddle.uniform([4, 144, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4, 144, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4, 144, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8c6f2b983f9d859f3383c79a15bbeee4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f106e9dda5232c93243dff7fc2676c69
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 24, 24], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6933fc52eaa223c14c2741bab6c14bb2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 20, 128, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 20, 128, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a584fcd652d89ea075bfce9f2062e1b3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 40, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 40, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f395f03fafee203c555a94643e375026(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 32, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 80, 32, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c6f323ffac33f8de847925ea46a7253e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f106e9dda5232c93243dff7fc2676c69
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 16, 16], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_dc844f09affc2a2f8c6d538a1a1e657f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9474a7d4d5a85165199c02bcc1cf1bb7
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.03657087683677673, 0.15358947217464447, 0.007713953498750925, 0.257577121257782], [0.035585466772317886, 0.49221542477607727, 0.17263424396514893, 0.29923829436302185]], dtype='float32').reshape([2, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_97e60f0d8187517dbccc2e56bc869089(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c94fdf92a6bffb44756955b6d8df0b87
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([2], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b2f66766bb20ccfa8fb08852128e9249(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1457086f8118f6ae44c94f8b23f05743
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4116, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 4116, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_06f0ef03f1faaf219cd1e58c686c60ec(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9474a7d4d5a85165199c02bcc1cf1bb7
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.4721968472003937, 0.46351638436317444, 0.43057215213775635, 0.4704304039478302]], dtype='float32').reshape([1, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c451a4630aa40476f8c12a2dd8b667f1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c94fdf92a6bffb44756955b6d8df0b87
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([1], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a00e76e3ff79a2bd5e025d26b6a16aa9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 17, 128, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 17, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_64a159158ae7661df5ba7e3ad51dc217(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9392b30c0e30f025725ed475fb5621b9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 26, 26], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_67bd6782fa2a543cd39bf781531d17db(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1):
-        input_0 = [arg_0_0, arg_0_1]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[80, 80], dtype='float32'),
-            paddle.static.InputSpec(shape=[80, 80], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fae74374c8409a262a23a3b7cc999dd8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_67bd6782fa2a543cd39bf781531d17db
-    def get_inputs(self):
-        return [
-            paddle.uniform([80, 80], dtype='float32', min=0, max=0.5),
-            paddle.uniform([80, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_15ec87db4e5f15620d1e1a3ba7cb20cb(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1):
-        input_0 = [arg_0_0, arg_0_1]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[40, 40], dtype='float32'),
-            paddle.static.InputSpec(shape=[40, 40], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5a1259edcf78f64e65cb4acab5d68ec5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_15ec87db4e5f15620d1e1a3ba7cb20cb
-    def get_inputs(self):
-        return [
-            paddle.uniform([40, 40], dtype='float32', min=0, max=0.5),
-            paddle.uniform([40, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_0a80ba214ef30b26b24f63ad9db0f30c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1):
-        input_0 = [arg_0_0, arg_0_1]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[20, 20], dtype='float32'),
-            paddle.static.InputSpec(shape=[20, 20], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_68971d2d93a35cc4a967696a965e7b3e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0a80ba214ef30b26b24f63ad9db0f30c
-    def get_inputs(self):
-        return [
-            paddle.uniform([20, 20], dtype='float32', min=0, max=0.5),
-            paddle.uniform([20, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_70b9d3bbbd752904d5da78c302fc4f5e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1848e60d49960e74b723e5f73421c99d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8400, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 8400, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fae74374c8409a262a23a3b7cc999dd8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_67bd6782fa2a543cd39bf781531d17db
-    def get_inputs(self):
-        return [
-            paddle.uniform([80, 80], dtype='float32', min=0, max=0.5),
-            paddle.uniform([80, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5a1259edcf78f64e65cb4acab5d68ec5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_15ec87db4e5f15620d1e1a3ba7cb20cb
-    def get_inputs(self):
-        return [
-            paddle.uniform([40, 40], dtype='float32', min=0, max=0.5),
-            paddle.uniform([40, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_68971d2d93a35cc4a967696a965e7b3e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0a80ba214ef30b26b24f63ad9db0f30c
-    def get_inputs(self):
-        return [
-            paddle.uniform([20, 20], dtype='float32', min=0, max=0.5),
-            paddle.uniform([20, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_475f1705db145005d19fd6cad5a379b3(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1, arg_0_2):
-        input_0 = [arg_0_0, arg_0_1, arg_0_2]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[22, 49, 8, 16], dtype='float32'),
-            paddle.static.InputSpec(shape=[22, 49, 8, 16], dtype='float32'),
-            paddle.static.InputSpec(shape=[22, 49, 8, 32], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e14024133ec17691379f3028a0523d7f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_475f1705db145005d19fd6cad5a379b3
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 49, 8, 16], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 49, 8, 16], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 49, 8, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7f0363af6fdb977e9199522a6ccfaa97(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9392b30c0e30f025725ed475fb5621b9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 13, 13], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 13, 13], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_b2a7fb5cf0c88681876d3b0e6adc45f4(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1, arg_0_2):
-        input_0 = [arg_0_0, arg_0_1, arg_0_2]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 160, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 160, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 160, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c305886d3a6f8da17ef9467f6ff7c6fc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b2a7fb5cf0c88681876d3b0e6adc45f4
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 160, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 160, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 160, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6a1b3a1c6e2bc037d94413a40c69bf45(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9392b30c0e30f025725ed475fb5621b9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 36, 36], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 36, 36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1dcedba4fb0f6e11120f19dc6dca36ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f106e9dda5232c93243dff7fc2676c69
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 12, 12], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 12, 12], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a88937a4ba4b9baec3388c0967dd94bd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_34b5bfe351392a61a4919e8b0fb9b096
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 112, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 112, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 112, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 112, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 112, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 112, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 112, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 112, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cc54c9821270174de1a21835190105e5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f106e9dda5232c93243dff7fc2676c69
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 40, 40], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 40, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4f0f87da5d1e5a66cd8e407e42a08944(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9392b30c0e30f025725ed475fb5621b9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 48, 48], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 48, 48], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_144ad015232a4ec9babf8748384970a2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([32, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_959ccfa6b5df262a29ac321871188c90(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([64, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6e49408cda69bce22d03907e6a4ad98e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([128, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_69ef002098dbedb69e95fad437de154f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1457086f8118f6ae44c94f8b23f05743
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 6069, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 6069, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3c7d167eb1adf217d195c4914bd154ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_69a3489015c06588a98698e2063d474b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1527, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1527, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1527, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1527, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3c7d167eb1adf217d195c4914bd154ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_69a3489015c06588a98698e2063d474b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1527, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1527, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1527, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1527, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4233c14a8059d68bd80d489a3d3ae3a6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1848e60d49960e74b723e5f73421c99d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3024, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3024, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6c0cc4c22ad720106d9d330841ac38a0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9392b30c0e30f025725ed475fb5621b9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 30, 30], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 30, 30], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_77bc556f36c2162ce7909f25b18d7ccb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_34b5bfe351392a61a4919e8b0fb9b096
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 56, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 56, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 56, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 56, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 56, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 56, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 56, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 56, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a8ee227b89bd78c486de5501a2540dce(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9474a7d4d5a85165199c02bcc1cf1bb7
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.07563749700784683, 0.24206598103046417, 0.385073184967041, 0.10971993207931519], [0.2720660865306854, 0.4351181089878082, 0.3442555069923401, 0.2988447844982147], [0.12328121066093445, 0.2558436691761017, 0.04545897990465164, 0.0779871866106987], [0.1755024641752243, 0.26999571919441223, 0.14806866645812988, 0.07825171202421188], [0.3740345537662506, 0.4112735390663147, 0.23452633619308472, 0.06603209674358368], [0.20097699761390686, 0.30600640177726746, 0.06423215568065643, 0.3307529091835022], [0.3834092319011688, 0.01032618060708046, 0.32125118374824524, 0.1412786841392517]], dtype='float32').reshape([7, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5f2a9a34d9ce095a6d373a978df49d93(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c94fdf92a6bffb44756955b6d8df0b87
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([7], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9afca1820f7f8006cfd8606548e92db9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9474a7d4d5a85165199c02bcc1cf1bb7
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.13273146748542786, 0.17586477100849152, 0.22157639265060425, 0.061416372656822205]], dtype='float32').reshape([1, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c451a4630aa40476f8c12a2dd8b667f1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c94fdf92a6bffb44756955b6d8df0b87
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([1], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5047874ce14665dd3653812dce54ca6b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_34b5bfe351392a61a4919e8b0fb9b096
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 14, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 14, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 14, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 14, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 14, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 14, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 14, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 14, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_a8c97900aa90cbd9ed273fb452623471(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1, arg_0_2):
-        input_0 = [arg_0_0, arg_0_1, arg_0_2]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 80, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 80, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 80, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f51834900e58625088829918fdebb71c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a8c97900aa90cbd9ed273fb452623471
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 80, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 80, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 80, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cc54c9821270174de1a21835190105e5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f106e9dda5232c93243dff7fc2676c69
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 40, 40], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 40, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_411e2d73ef12668e5066a6d564ddb115(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.2977246940135956]], dtype='float32').reshape([1, 1]),
-            paddle.to_tensor([[0.45340871810913086]], dtype='float32').reshape([1, 1]),
-            paddle.to_tensor([[0.33794644474983215]], dtype='float32').reshape([1, 1]),
-            paddle.to_tensor([[0.12983585894107819]], dtype='float32').reshape([1, 1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0fd31c305d5c6cf2f67fc751dc2bf290(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.3555246889591217]], dtype='float32').reshape([1, 1]),
-            paddle.to_tensor([[0.43772584199905396]], dtype='float32').reshape([1, 1]),
-            paddle.to_tensor([[0.11903903633356094]], dtype='float32').reshape([1, 1]),
-            paddle.to_tensor([[0.0831770971417427]], dtype='float32').reshape([1, 1]),
-        ]
-
-
-
-class PrimitiveOp_71067eebaf355996c10a9d4e28f761ca(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1):
-        input_0 = [arg_0_0, arg_0_1]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[22, 196, 8, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[22, 196, 8, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_36c6ebb7c0a3c180ff8d91f173024381(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71067eebaf355996c10a9d4e28f761ca
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 196, 8, 16], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 196, 8, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_85ecfcb8c8d3b7f4bf8eda7322bff530(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.15491808950901031], [0.16919776797294617], [0.1292070597410202], [0.12714418768882751], [0.33482757210731506], [0.2098187357187271]], dtype='float32').reshape([6, 1]),
-            paddle.to_tensor([[0.4103717803955078], [0.39778658747673035], [0.40150901675224304], [0.42183321714401245], [0.09941722452640533], [0.25498807430267334]], dtype='float32').reshape([6, 1]),
-            paddle.to_tensor([[0.20998290181159973], [0.4498758018016815], [0.24683597683906555], [0.20288529992103577], [0.21599259972572327], [0.19651634991168976]], dtype='float32').reshape([6, 1]),
-            paddle.to_tensor([[0.4901370406150818], [0.2509276866912842], [0.2429288774728775], [0.06132770702242851], [0.08567338436841965], [0.23274247348308563]], dtype='float32').reshape([6, 1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2767547805bf632cfafc133a101e33fb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.3895230293273926], [0.4666270613670349], [0.17671829462051392], [0.3581591248512268], [0.42263373732566833], [0.24344341456890106]], dtype='float32').reshape([6, 1]),
-            paddle.to_tensor([[0.1010279506444931], [0.2909882366657257], [0.2298392504453659], [0.29276591539382935], [0.1773831695318222], [0.48681026697158813]], dtype='float32').reshape([6, 1]),
-            paddle.to_tensor([[0.22682112455368042], [0.18442489206790924], [0.1968512237071991], [0.46012169122695923], [0.40794169902801514], [0.4862612187862396]], dtype='float32').reshape([6, 1]),
-            paddle.to_tensor([[0.4151418209075928], [0.3606884777545929], [0.13929075002670288], [0.03818127512931824], [0.28175589442253113], [0.3325986862182617]], dtype='float32').reshape([6, 1]),
-        ]
-
-
-
-class PrimitiveOp_8757ff1dd8a466f4187c9c52f922399a(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1, arg_0_2, arg_0_3):
-        input_0 = [arg_0_0, arg_0_1, arg_0_2, arg_0_3]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 300, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 300, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 300, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 300, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_136526e4ae24988a63676be828cf4c52(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8757ff1dd8a466f4187c9c52f922399a
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 300, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 300, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 300, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 300, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_dc551b7c1c58b70a0dd7762fcf26dba3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9392b30c0e30f025725ed475fb5621b9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 6, 6], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 6, 6], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_8b04bb0e505aa517ac1b97d645951e0b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1):
-        input_0 = [arg_0_0, arg_0_1]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[14, 14], dtype='float32'),
-            paddle.static.InputSpec(shape=[14, 14], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b64fa05dc9ef1967fa01e4f1472f7157(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8b04bb0e505aa517ac1b97d645951e0b
-    def get_inputs(self):
-        return [
-            paddle.uniform([14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_514e2b7832361ee7ba5c03c69f8f57fa(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1):
-        input_0 = [arg_0_0, arg_0_1]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[28, 28], dtype='float32'),
-            paddle.static.InputSpec(shape=[28, 28], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0b5fa6b219c737bfe92a8959930f84ad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_514e2b7832361ee7ba5c03c69f8f57fa
-    def get_inputs(self):
-        return [
-            paddle.uniform([28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_21554e657e43f93a58b530ef9ae88388(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1):
-        input_0 = [arg_0_0, arg_0_1]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[56, 56], dtype='float32'),
-            paddle.static.InputSpec(shape=[56, 56], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3a34f249e62c4bb3fadf15c55c13b01e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21554e657e43f93a58b530ef9ae88388
-    def get_inputs(self):
-        return [
-            paddle.uniform([56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_e6b1002cf5bd85949783ef2c25a960e4(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1, arg_0_2):
-        input_0 = [arg_0_0, arg_0_1, arg_0_2]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 384], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, 384], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, 384], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7541237d00e1f42ae5579df35ad46461(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6b1002cf5bd85949783ef2c25a960e4
-    def get_inputs(self):
-        return [
-            paddle.uniform([4, 576, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4, 576, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4, 576, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_16f467c540e90b8d1b2b841df1e46fde(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9392b30c0e30f025725ed475fb5621b9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e2ca200d89b00372cb30928b724a4fb0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9474a7d4d5a85165199c02bcc1cf1bb7
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.1197030246257782, 0.12258951365947723, 0.47334030270576477, 0.4889293611049652], [0.04961347207427025, 0.17199668288230896, 0.26389777660369873, 0.3503299355506897], [0.4987875819206238, 0.3148815631866455, 0.08101204037666321, 0.1202988401055336], [0.03471033647656441, 0.17305532097816467, 0.3287604749202728, 0.4935028851032257], [0.2583658695220947, 0.46363237500190735, 0.05257610231637955, 0.4554295539855957]], dtype='float32').reshape([5, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8d33ee0f7804e19ae5fa954d05146406(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c94fdf92a6bffb44756955b6d8df0b87
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([5], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ab39db093db4615dfec3dc2afe9e2dc4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9474a7d4d5a85165199c02bcc1cf1bb7
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.3263397812843323, 0.25497326254844666, 0.4833052158355713, 0.006029351148754358], [0.01641535945236683, 0.3863627314567566, 0.2172834575176239, 0.07637519389390945], [0.22629611194133759, 0.19287849962711334, 0.014730019494891167, 0.393351674079895], [0.3637615740299225, 0.25450533628463745, 0.33932405710220337, 0.43694356083869934], [0.3050724267959595, 0.02311766892671585, 0.20481741428375244, 0.26305362582206726], [0.46263688802719116, 0.4497365951538086, 0.4610375463962555, 0.47209975123405457], [0.06414810568094254, 0.29436615109443665, 0.2422768473625183, 0.33959126472473145]], dtype='float32').reshape([7, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5f2a9a34d9ce095a6d373a978df49d93(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c94fdf92a6bffb44756955b6d8df0b87
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([7], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cc54c9821270174de1a21835190105e5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f106e9dda5232c93243dff7fc2676c69
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 40, 40], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 40, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_90ae227aacaf9fef62cf74319bf9f9a1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9474a7d4d5a85165199c02bcc1cf1bb7
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.38261204957962036, 0.04909217357635498, 0.08167355507612228, 0.09969377517700195], [0.27192261815071106, 0.0985708013176918, 0.1131369099020958, 0.48550352454185486], [0.2861417233943939, 0.21686436235904694, 0.1679471731185913, 0.48392459750175476], [0.14770331978797913, 0.2055833488702774, 0.21170517802238464, 0.3795926570892334], [0.014819027855992317, 0.1987682580947876, 0.030129656195640564, 0.12573571503162384], [0.2726563513278961, 0.18826104700565338, 0.058112744241952896, 0.24436795711517334], [0.15637606382369995, 0.38363125920295715, 0.2127828747034073, 0.43630972504615784]], dtype='float32').reshape([7, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5f2a9a34d9ce095a6d373a978df49d93(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c94fdf92a6bffb44756955b6d8df0b87
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([7], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0e04b5c38fcf5d2371528b137bc751e6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 96, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 96, 96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2f0cb283597fffeb5d2ffb37286cedd3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9392b30c0e30f025725ed475fb5621b9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 88, 88], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 88, 88], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_35f0c58e03a6bcee9b9238f787fd51e7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9474a7d4d5a85165199c02bcc1cf1bb7
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.40654340386390686, 0.14714907109737396, 0.07348904013633728, 0.17775322496891022]], dtype='float32').reshape([1, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c451a4630aa40476f8c12a2dd8b667f1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c94fdf92a6bffb44756955b6d8df0b87
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([1], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_72c239abbbaca8cf2c19e6e35ade7786(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9474a7d4d5a85165199c02bcc1cf1bb7
-    def get_inputs(self):
-        return [
-            paddle.uniform([300, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cd8413f40117fe087071a90c85e9eb53(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c94fdf92a6bffb44756955b6d8df0b87
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([300], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-
-class PrimitiveOp_8681c1a1016d2414d6f73dfd91b7dc98(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1, arg_0_2):
-        input_0 = [arg_0_0, arg_0_1, arg_0_2]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 192], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, 192], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, 192], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7877e551beef61234d148b30b57aefa1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8681c1a1016d2414d6f73dfd91b7dc98
-    def get_inputs(self):
-        return [
-            paddle.uniform([4, 2304, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4, 2304, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4, 2304, 192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f3ca06e9d4e684c2f9d147a77d4cb5c6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 80, 80], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 80, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_32b061be730ca93a89f53a8ccde3a2cc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_69a3489015c06588a98698e2063d474b
-    def get_inputs(self):
-        return [
-            paddle.uniform([2066, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2066, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2066, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2066, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_32b061be730ca93a89f53a8ccde3a2cc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_69a3489015c06588a98698e2063d474b
-    def get_inputs(self):
-        return [
-            paddle.uniform([2066, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2066, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2066, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2066, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_31f3771d77b3eb287bde90ee8b122515(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1848e60d49960e74b723e5f73421c99d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4116, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 4116, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_5b94c1e4afa16f5d606b25312e3a9502(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1, arg_0_2, arg_0_3):
-        input_0 = [arg_0_0, arg_0_1, arg_0_2, arg_0_3]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 90, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 90, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 90, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 90, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ff089a0cf0b96f549c98387124297839(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5b94c1e4afa16f5d606b25312e3a9502
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 90, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 90, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 90, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 90, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1701b798f38005fd8e96c92e7e1e32af(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0a4b9c90c22e6ec6569fdb099c53a9f1
-    def get_inputs(self):
-        return [
-            paddle.uniform([24, 24], dtype='float32', min=0, max=0.5),
-            paddle.uniform([24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bea112607e2311e80da5e571a9c86161(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 40, 40], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 40, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_17d05eb6382d2ea58862dbdb8e9865f1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_34b5bfe351392a61a4919e8b0fb9b096
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 14, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 14, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 14, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 14, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 14, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 14, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 14, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 14, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_84833a8c576c88ad654afd914b4c47a9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1, arg_0_2, arg_0_3, arg_0_4):
-        input_0 = [arg_0_0, arg_0_1, arg_0_2, arg_0_3, arg_0_4]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 144, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 144, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 144, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 144, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 144, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2edb5833cb02b40945ae785e965f66e8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_84833a8c576c88ad654afd914b4c47a9
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 144, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 144, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 144, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 144, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 144, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d1b2370ecbb4efe49164afd11ec0b4bc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9392b30c0e30f025725ed475fb5621b9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 24, 24], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bbb157e9fb3c8670e375403109a87f32(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_69a3489015c06588a98698e2063d474b
-    def get_inputs(self):
-        return [
-            paddle.uniform([4586, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4586, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4586, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4586, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bbb157e9fb3c8670e375403109a87f32(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_69a3489015c06588a98698e2063d474b
-    def get_inputs(self):
-        return [
-            paddle.uniform([4586, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4586, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4586, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4586, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_78bad22fe49e21cec6a67e7126a6ddd7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1848e60d49960e74b723e5f73421c99d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9261, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9261, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9694e6ff00cb6491a017396a14f18581(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 17, 160, 160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 17, 160, 160], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_bf825eb8319922fafc68039371329d21(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1):
-        input_0 = [arg_0_0, arg_0_1]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 600, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 600, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_74bf508f92c72f41168fb4bfb8cc4118(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bf825eb8319922fafc68039371329d21
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 600, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 600, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_80f44824fca4d405ad400df4470d8a21(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9474a7d4d5a85165199c02bcc1cf1bb7
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.2836782932281494, 0.30620822310447693, 0.37035006284713745, 0.057763535529375076], [0.10409702360630035, 0.18112534284591675, 0.08620662242174149, 0.44886669516563416], [0.13950517773628235, 0.4202529191970825, 0.005039406009018421, 0.33990785479545593], [0.26290255784988403, 0.12213823944330215, 0.4939698874950409, 0.4407085180282593], [0.3204594552516937, 0.48117324709892273, 0.27943259477615356, 0.29908043146133423]], dtype='float32').reshape([5, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8d33ee0f7804e19ae5fa954d05146406(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c94fdf92a6bffb44756955b6d8df0b87
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([5], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0bf89928138f5b24110587c67e8fa6e7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f106e9dda5232c93243dff7fc2676c69
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 48, 72], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 48, 72], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c5a67033f51697a16fe56d12a58fb4f0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_69a3489015c06588a98698e2063d474b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1073, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1073, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1073, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1073, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c5a67033f51697a16fe56d12a58fb4f0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_69a3489015c06588a98698e2063d474b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1073, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1073, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1073, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1073, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c63d5f01dedb07a889a46f7cc76af9ed(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1848e60d49960e74b723e5f73421c99d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2100, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 2100, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c6f323ffac33f8de847925ea46a7253e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f106e9dda5232c93243dff7fc2676c69
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 16, 16], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f4e6ed5bdb7d782bc788cf9d057035bf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b693a8b44c9655702db6377742531e94(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f106e9dda5232c93243dff7fc2676c69
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 15, 25], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 15, 25], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f9a9c6107356ebb24be6f20dab5ae6cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1457086f8118f6ae44c94f8b23f05743
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9261, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9261, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9ac88113545a0a3ec925f82b1167737d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f106e9dda5232c93243dff7fc2676c69
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 96, 144], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 96, 144], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b5d5b2483abbdf6f0c72379f92925368(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f106e9dda5232c93243dff7fc2676c69
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 192, 288], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 192, 288], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ca132ebf48f034a1a571349add59d0e8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_34b5bfe351392a61a4919e8b0fb9b096
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 56, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 56, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 56, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 56, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 56, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 56, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 56, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 56, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e061998d06205e4f99bd1202bd6bb114(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_de007bd9a6ceecee7266f8c81ecb4d7c
-    def get_inputs(self):
-        return [
-            paddle.uniform([6, 144, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([6, 144, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([6, 144, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_f8e2dc07edfa99a53f8b4224f798d8ab(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1):
-        input_0 = [arg_0_0, arg_0_1]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[68, 68], dtype='float32'),
-            paddle.static.InputSpec(shape=[68, 68], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3dde0d1425551a91ebae0bfc1a0d75bb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f8e2dc07edfa99a53f8b4224f798d8ab
-    def get_inputs(self):
-        return [
-            paddle.uniform([68, 68], dtype='float32', min=0, max=0.5),
-            paddle.uniform([68, 68], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_ccead173ab5dc2a7a8b05130fcaeff4f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1):
-        input_0 = [arg_0_0, arg_0_1]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[34, 34], dtype='float32'),
-            paddle.static.InputSpec(shape=[34, 34], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_86690e4a23c10710502f19ad4e2f19e7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ccead173ab5dc2a7a8b05130fcaeff4f
-    def get_inputs(self):
-        return [
-            paddle.uniform([34, 34], dtype='float32', min=0, max=0.5),
-            paddle.uniform([34, 34], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_1febda3a454828d94ffc748cf89b0a08(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1):
-        input_0 = [arg_0_0, arg_0_1]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[17, 17], dtype='float32'),
-            paddle.static.InputSpec(shape=[17, 17], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ef330fbb9b0bd025328a7ebcf9019ece(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1febda3a454828d94ffc748cf89b0a08
-    def get_inputs(self):
-        return [
-            paddle.uniform([17, 17], dtype='float32', min=0, max=0.5),
-            paddle.uniform([17, 17], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d5c47e276a7632be0d355052650efdf3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1848e60d49960e74b723e5f73421c99d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 6069, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 6069, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3dde0d1425551a91ebae0bfc1a0d75bb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f8e2dc07edfa99a53f8b4224f798d8ab
-    def get_inputs(self):
-        return [
-            paddle.uniform([68, 68], dtype='float32', min=0, max=0.5),
-            paddle.uniform([68, 68], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_86690e4a23c10710502f19ad4e2f19e7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ccead173ab5dc2a7a8b05130fcaeff4f
-    def get_inputs(self):
-        return [
-            paddle.uniform([34, 34], dtype='float32', min=0, max=0.5),
-            paddle.uniform([34, 34], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ef330fbb9b0bd025328a7ebcf9019ece(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1febda3a454828d94ffc748cf89b0a08
-    def get_inputs(self):
-        return [
-            paddle.uniform([17, 17], dtype='float32', min=0, max=0.5),
-            paddle.uniform([17, 17], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_78759dd858fbef84eebd59fa72f5bdad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.3776218891143799], [0.017230553552508354], [0.12865380942821503], [0.0789160430431366], [0.29648688435554504]], dtype='float32').reshape([5, 1]),
-            paddle.to_tensor([[0.04191706329584122], [0.1894516497850418], [0.11870089173316956], [0.0004433089052326977], [0.28320610523223877]], dtype='float32').reshape([5, 1]),
-            paddle.to_tensor([[0.3077138066291809], [0.21676185727119446], [0.36836960911750793], [0.01315593346953392], [0.1262916475534439]], dtype='float32').reshape([5, 1]),
-            paddle.to_tensor([[0.39167019724845886], [0.046127624809741974], [0.13554736971855164], [0.2480829954147339], [0.17310704290866852]], dtype='float32').reshape([5, 1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_255fcd9e1960448b91d8e9c320197362(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.4706946909427643], [0.39319300651550293], [0.19910383224487305], [0.3212777376174927], [0.27562597393989563]], dtype='float32').reshape([5, 1]),
-            paddle.to_tensor([[0.16876435279846191], [0.1280040442943573], [0.3004133403301239], [0.4173230230808258], [0.3782731890678406]], dtype='float32').reshape([5, 1]),
-            paddle.to_tensor([[0.27102693915367126], [0.3185052275657654], [0.3153221905231476], [0.430990993976593], [0.4189223051071167]], dtype='float32').reshape([5, 1]),
-            paddle.to_tensor([[0.4086301028728485], [0.391907662153244], [0.04106692224740982], [0.014858669601380825], [0.4931931793689728]], dtype='float32').reshape([5, 1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a37b3aea9abfc780e29f7c0964c59137(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9474a7d4d5a85165199c02bcc1cf1bb7
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.36098194122314453, 0.36900797486305237, 0.21059876680374146, 0.4295063018798828]], dtype='float32').reshape([1, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c451a4630aa40476f8c12a2dd8b667f1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c94fdf92a6bffb44756955b6d8df0b87
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([1], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8ee462787e16133403b927ba886fa509(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 68, 68], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 68, 68], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9ac88113545a0a3ec925f82b1167737d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f106e9dda5232c93243dff7fc2676c69
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 96, 144], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 96, 144], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6e49408cda69bce22d03907e6a4ad98e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([128, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_959ccfa6b5df262a29ac321871188c90(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([64, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_144ad015232a4ec9babf8748384970a2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([32, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f60c81c970ad1c48f24c5a7d5db3dd2a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([16, 16], dtype='float32', min=0, max=0.5),
-            paddle.uniform([16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_379b64667ba43ad8a6303d8f433aa279(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([8, 8], dtype='float32', min=0, max=0.5),
-            paddle.uniform([8, 8], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_63cb58fa23a3f6d184ec8519e1128f95(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 72, 72], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 72, 72], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_ef8c2878092d3cbb853a14c2d58ae1d9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1):
-        input_0 = [arg_0_0, arg_0_1]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 36, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 36, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9d682f7195787490ff249f1494355d0a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ef8c2878092d3cbb853a14c2d58ae1d9
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 36, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 36, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7140e540c850cc1ae5872af22c014961(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1457086f8118f6ae44c94f8b23f05743
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2100, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 2100, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_60649a0a13347a8bfb315367c178d719(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1, arg_0_2):
-        input_0 = [arg_0_0, arg_0_1, arg_0_2]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 96], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, 96], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, 96], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e4f42f414a63e386f3d1dda92eda8838(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_60649a0a13347a8bfb315367c178d719
-    def get_inputs(self):
-        return [
-            paddle.uniform([4, 9216, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4, 9216, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4, 9216, 96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_715d31ab33200caceb33d78602eb679e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 12, 12], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 128, 12, 12], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7157cce6130650c7b97c0c29b9bb6791(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9474a7d4d5a85165199c02bcc1cf1bb7
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.258802205324173, 0.4104510545730591, 0.17734280228614807, 0.4375358819961548]], dtype='float32').reshape([1, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c451a4630aa40476f8c12a2dd8b667f1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c94fdf92a6bffb44756955b6d8df0b87
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([1], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4870f1f9e7f83a33bff195cb6b8129b6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([15, 25], dtype='float32', min=0, max=0.5),
-            paddle.uniform([15, 25], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_14fc5f240e2cb1646d1c5230c304e9b1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_34b5bfe351392a61a4919e8b0fb9b096
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 112, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 112, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 112, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 112, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 112, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 112, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 112, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 112, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_30587f9d020322e5eafbabc22a4dd1d2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_69a3489015c06588a98698e2063d474b
-    def get_inputs(self):
-        return [
-            paddle.uniform([2383, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2383, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2383, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2383, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_30587f9d020322e5eafbabc22a4dd1d2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_69a3489015c06588a98698e2063d474b
-    def get_inputs(self):
-        return [
-            paddle.uniform([2383, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2383, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2383, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2383, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b608b7e54c3e9c0db3bd2ae1327a0621(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1848e60d49960e74b723e5f73421c99d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4725, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 4725, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1dcedba4fb0f6e11120f19dc6dca36ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f106e9dda5232c93243dff7fc2676c69
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 12, 12], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 12, 12], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7d8e9bcd2df434a2ee27726613b97239(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9474a7d4d5a85165199c02bcc1cf1bb7
-    def get_inputs(self):
-        return [
-            paddle.uniform([8, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4c0d35f3b5a0f30e8f44d6221d391b98(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c94fdf92a6bffb44756955b6d8df0b87
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([8], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f09e228aba5630116e4ad509e4c2f7b4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_69a3489015c06588a98698e2063d474b
-    def get_inputs(self):
-        return [
-            paddle.uniform([3030, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([3030, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([3030, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([3030, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f09e228aba5630116e4ad509e4c2f7b4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_69a3489015c06588a98698e2063d474b
-    def get_inputs(self):
-        return [
-            paddle.uniform([3030, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([3030, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([3030, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([3030, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d5c47e276a7632be0d355052650efdf3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1848e60d49960e74b723e5f73421c99d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 6069, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 6069, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8e154e29c86c07c2c0cd7dfcea88d5bf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_69a3489015c06588a98698e2063d474b
-    def get_inputs(self):
-        return [
-            paddle.uniform([3787, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([3787, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([3787, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([3787, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8e154e29c86c07c2c0cd7dfcea88d5bf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_69a3489015c06588a98698e2063d474b
-    def get_inputs(self):
-        return [
-            paddle.uniform([3787, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([3787, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([3787, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([3787, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_72aa8d8d05456e8611725c8efe07ea3f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1848e60d49960e74b723e5f73421c99d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 7581, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 7581, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_50b11169d450c2e8042c278fb9a30ee4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f106e9dda5232c93243dff7fc2676c69
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 28, 40], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 28, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4d39cebbb9ce8b420f2268eb38ce6406(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9474a7d4d5a85165199c02bcc1cf1bb7
-    def get_inputs(self):
-        return [
-            paddle.uniform([100, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_690b381e3831f63d2c4d59a651a79570(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c94fdf92a6bffb44756955b6d8df0b87
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([100], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7638bc76aa3f42d0111457b599af47a1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9392b30c0e30f025725ed475fb5621b9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 16, 16], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f6e7168907dce2d12d67d4fbce67080e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f106e9dda5232c93243dff7fc2676c69
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 120, 200], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 120, 200], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f773928d2200a734db0124a0490e22aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1457086f8118f6ae44c94f8b23f05743
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 11109, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 11109, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_f3be89c0f277058286c2fbf26294dd39(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1):
-        input_0 = [arg_0_0, arg_0_1]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 60, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 60, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e903aa8ad1302fdfacbf8ac819f259d5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f3be89c0f277058286c2fbf26294dd39
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 60, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 60, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4300d7297bfb51346fc8301b61699730(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_60649a0a13347a8bfb315367c178d719
-    def get_inputs(self):
-        return [
-            paddle.uniform([6, 9216, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([6, 9216, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([6, 9216, 96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_49fb5a5c53121cbbb077d9fc04b4a1f9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9392b30c0e30f025725ed475fb5621b9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 8, 8], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 8, 8], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_a083461fb796b4c517d430f84e62c368(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1):
-        input_0 = [arg_0_0, arg_0_1]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 2, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 1, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a725b002c841ebd7195bbdc91c89a0c5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a083461fb796b4c517d430f84e62c368
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 120, 200], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 120, 200], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_a960e4682b5a2a5cd89abd5a92f7ec0c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1):
-        input_0 = [arg_0_0, arg_0_1]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[100, 152], dtype='float32'),
-            paddle.static.InputSpec(shape=[100, 152], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_68a484dfb118a85792a5944760044614(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a960e4682b5a2a5cd89abd5a92f7ec0c
-    def get_inputs(self):
-        return [
-            paddle.uniform([100, 152], dtype='float32', min=0, max=0.5),
-            paddle.uniform([100, 152], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_b174ab41add4daa07f58a0cded01a098(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1):
-        input_0 = [arg_0_0, arg_0_1]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[50, 76], dtype='float32'),
-            paddle.static.InputSpec(shape=[50, 76], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f69fe0dca67c823514b6686719aad70d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b174ab41add4daa07f58a0cded01a098
-    def get_inputs(self):
-        return [
-            paddle.uniform([50, 76], dtype='float32', min=0, max=0.5),
-            paddle.uniform([50, 76], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_2c0afdcbc127a986d0493e5e53870e69(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1):
-        input_0 = [arg_0_0, arg_0_1]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[25, 38], dtype='float32'),
-            paddle.static.InputSpec(shape=[25, 38], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ad4ee6922c92d223e5a85d91b92d75ba(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2c0afdcbc127a986d0493e5e53870e69
-    def get_inputs(self):
-        return [
-            paddle.uniform([25, 38], dtype='float32', min=0, max=0.5),
-            paddle.uniform([25, 38], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_55304ee151add2b9bba22e1d623bdd68(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1):
-        input_0 = [arg_0_0, arg_0_1]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[13, 19], dtype='float32'),
-            paddle.static.InputSpec(shape=[13, 19], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9f06df5683fd3fbc3918ebd050c18780(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_55304ee151add2b9bba22e1d623bdd68
-    def get_inputs(self):
-        return [
-            paddle.uniform([13, 19], dtype='float32', min=0, max=0.5),
-            paddle.uniform([13, 19], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_117b0b37907192d9279457a2b34eae69(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1):
-        input_0 = [arg_0_0, arg_0_1]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[7, 10], dtype='float32'),
-            paddle.static.InputSpec(shape=[7, 10], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d672b9189d715a0db51923590733cf4f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_117b0b37907192d9279457a2b34eae69
-    def get_inputs(self):
-        return [
-            paddle.uniform([7, 10], dtype='float32', min=0, max=0.5),
-            paddle.uniform([7, 10], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_c5ae14ceab59c880c270d07936a63665(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1, arg_0_2, arg_0_3, arg_0_4):
-        input_0 = [arg_0_0, arg_0_1, arg_0_2, arg_0_3, arg_0_4]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[15200, 2], dtype='float32'),
-            paddle.static.InputSpec(shape=[3800, 2], dtype='float32'),
-            paddle.static.InputSpec(shape=[950, 2], dtype='float32'),
-            paddle.static.InputSpec(shape=[247, 2], dtype='float32'),
-            paddle.static.InputSpec(shape=[70, 2], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d63d90da3d59f84d4bfcae533bc0add3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c5ae14ceab59c880c270d07936a63665
-    def get_inputs(self):
-        return [
-            paddle.uniform([15200, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([3800, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([950, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([247, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([70, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cadbf52be64784c09df1a2d074e92f13(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 20, 20], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 20, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d2d9fb0efc0941188e0fa11827d94709(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9392b30c0e30f025725ed475fb5621b9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fd63e9365b1931d59162ae47dc77e0b5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f106e9dda5232c93243dff7fc2676c69
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 36, 36], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 36, 36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_eaa0b3ce2a1281c6e4185372b36da52e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1):
-        input_0 = [arg_0_0, arg_0_1]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 20, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 20, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_019177d611734a910ae150bc64680359(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_eaa0b3ce2a1281c6e4185372b36da52e
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 20, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 20, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1ff139d5e53b954fa27f5eaa97d74e14(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9392b30c0e30f025725ed475fb5621b9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_144ad015232a4ec9babf8748384970a2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([32, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_959ccfa6b5df262a29ac321871188c90(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([64, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6e49408cda69bce22d03907e6a4ad98e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([128, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7d4b4b7a886369b5abf5c9b7038c96f2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9392b30c0e30f025725ed475fb5621b9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 12, 12], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 12, 12], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1dcedba4fb0f6e11120f19dc6dca36ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f106e9dda5232c93243dff7fc2676c69
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 12, 12], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 12, 12], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_1a77cb9f3adb8f9d9229879f5d13bfc1(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1):
-        input_0 = [arg_0_0, arg_0_1]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 12, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 12, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e85f8c49fcfc1674f75cea147fa8b7a6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1a77cb9f3adb8f9d9229879f5d13bfc1
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 12, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 12, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7b863a86ec53ab56f01ee47f912f9365(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8681c1a1016d2414d6f73dfd91b7dc98
-    def get_inputs(self):
-        return [
-            paddle.uniform([6, 2304, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([6, 2304, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([6, 2304, 192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_c9b45179d377f41c8513985e207940e1(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1):
-        input_0 = [arg_0_0, arg_0_1]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 180, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 180, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1c442672e4d473cb753011571d4b82c8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c9b45179d377f41c8513985e207940e1
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 180, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 180, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8ebda17c1601464a6bbc4224d1a7156b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9474a7d4d5a85165199c02bcc1cf1bb7
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.4508846402168274, 0.3680139482021332, 0.10928935557603836, 0.2164817601442337]], dtype='float32').reshape([1, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c451a4630aa40476f8c12a2dd8b667f1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c94fdf92a6bffb44756955b6d8df0b87
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([1], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_98781ba9a7b7f08d54d7fb2d716b74e9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.4710065722465515], [0.27305787801742554], [0.1443967968225479], [0.18359437584877014]], dtype='float32').reshape([4, 1]),
-            paddle.to_tensor([[0.3558596074581146], [0.24631327390670776], [0.38240188360214233], [0.43209323287010193]], dtype='float32').reshape([4, 1]),
-            paddle.to_tensor([[0.1317010074853897], [0.1832035928964615], [0.005624867510050535], [0.382903516292572]], dtype='float32').reshape([4, 1]),
-            paddle.to_tensor([[0.407511442899704], [0.41122034192085266], [0.36212438344955444], [0.47452500462532043]], dtype='float32').reshape([4, 1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4f096bff403975ca4837596d00077da3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.11861217021942139], [0.1668710708618164], [0.37650251388549805], [0.3584076464176178]], dtype='float32').reshape([4, 1]),
-            paddle.to_tensor([[0.17836087942123413], [0.34534937143325806], [0.45495909452438354], [0.29443272948265076]], dtype='float32').reshape([4, 1]),
-            paddle.to_tensor([[0.21841885149478912], [0.4341205954551697], [0.17934243381023407], [0.48898959159851074]], dtype='float32').reshape([4, 1]),
-            paddle.to_tensor([[0.2849007844924927], [0.1524905115365982], [0.386353075504303], [0.4171924889087677]], dtype='float32').reshape([4, 1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_68594b557b2db00ca3dd682d3e60e2e9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f106e9dda5232c93243dff7fc2676c69
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 56, 80], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 56, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fd63e9365b1931d59162ae47dc77e0b5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f106e9dda5232c93243dff7fc2676c69
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 36, 36], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 36, 36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2c7087483d6a7edb614a72ef92dfc338(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6b1002cf5bd85949783ef2c25a960e4
-    def get_inputs(self):
-        return [
-            paddle.uniform([6, 576, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([6, 576, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([6, 576, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_49fb5a5c53121cbbb077d9fc04b4a1f9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9392b30c0e30f025725ed475fb5621b9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 8, 8], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 8, 8], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ec7c6ade46a343c6a0c391b5b352a8c2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_69a3489015c06588a98698e2063d474b
-    def get_inputs(self):
-        return [
-            paddle.uniform([2084, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2084, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2084, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2084, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ec7c6ade46a343c6a0c391b5b352a8c2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_69a3489015c06588a98698e2063d474b
-    def get_inputs(self):
-        return [
-            paddle.uniform([2084, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2084, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2084, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2084, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_31f3771d77b3eb287bde90ee8b122515(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1848e60d49960e74b723e5f73421c99d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4116, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 4116, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c1782ba106b739e0998af469f53e9819(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f106e9dda5232c93243dff7fc2676c69
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 30, 50], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 30, 50], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3d4f109297c9f109d6ad3d8aeec19c0b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1457086f8118f6ae44c94f8b23f05743
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3024, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3024, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_ac91c718cafc4d70d922717cfe40d71f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1, arg_0_2):
-        input_0 = [arg_0_0, arg_0_1, arg_0_2]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[22, 196, 4, 16], dtype='float32'),
-            paddle.static.InputSpec(shape=[22, 196, 4, 16], dtype='float32'),
-            paddle.static.InputSpec(shape=[22, 196, 4, 32], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0f03d9df43b037b3cb01aeda9ca8e4f2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ac91c718cafc4d70d922717cfe40d71f
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 196, 4, 16], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 196, 4, 16], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 196, 4, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_9a9a2119522180997a70051854b22786(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1):
-        input_0 = [arg_0_0, arg_0_1]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[72, 72], dtype='float32'),
-            paddle.static.InputSpec(shape=[72, 72], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_62fccef12a052df23954020672006d85(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9a9a2119522180997a70051854b22786
-    def get_inputs(self):
-        return [
-            paddle.uniform([72, 72], dtype='float32', min=0, max=0.5),
-            paddle.uniform([72, 72], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_ea4e995872996f08c2e0ddf127ce8f8d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1):
-        input_0 = [arg_0_0, arg_0_1]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[36, 36], dtype='float32'),
-            paddle.static.InputSpec(shape=[36, 36], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7a7f813f2defd56a4ec6ed0e7bd1eba2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ea4e995872996f08c2e0ddf127ce8f8d
-    def get_inputs(self):
-        return [
-            paddle.uniform([36, 36], dtype='float32', min=0, max=0.5),
-            paddle.uniform([36, 36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_dcefb85597ca23d8362580812deb084a(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1):
-        input_0 = [arg_0_0, arg_0_1]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[18, 18], dtype='float32'),
-            paddle.static.InputSpec(shape=[18, 18], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9c3ed92d5802b6502c303f20d596a8a5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_dcefb85597ca23d8362580812deb084a
-    def get_inputs(self):
-        return [
-            paddle.uniform([18, 18], dtype='float32', min=0, max=0.5),
-            paddle.uniform([18, 18], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_805263bdb92fe1c58cb0d47d23a100c8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1848e60d49960e74b723e5f73421c99d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 6804, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 6804, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_62fccef12a052df23954020672006d85(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9a9a2119522180997a70051854b22786
-    def get_inputs(self):
-        return [
-            paddle.uniform([72, 72], dtype='float32', min=0, max=0.5),
-            paddle.uniform([72, 72], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7a7f813f2defd56a4ec6ed0e7bd1eba2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ea4e995872996f08c2e0ddf127ce8f8d
-    def get_inputs(self):
-        return [
-            paddle.uniform([36, 36], dtype='float32', min=0, max=0.5),
-            paddle.uniform([36, 36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9c3ed92d5802b6502c303f20d596a8a5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_dcefb85597ca23d8362580812deb084a
-    def get_inputs(self):
-        return [
-            paddle.uniform([18, 18], dtype='float32', min=0, max=0.5),
-            paddle.uniform([18, 18], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_50bc6f8d04b6f3f17ca313dd335cf748(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1):
-        input_0 = [arg_0_0, arg_0_1]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 240, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 240, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e1a4dd60c6b56635d4c9571f0f8abad1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_50bc6f8d04b6f3f17ca313dd335cf748
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 240, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 240, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_138f0ee51b3230e45d32ed40b249ddc0(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1, arg_0_2):
-        input_0 = [arg_0_0, arg_0_1, arg_0_2]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[22, 16, 12, 16], dtype='float32'),
-            paddle.static.InputSpec(shape=[22, 16, 12, 16], dtype='float32'),
-            paddle.static.InputSpec(shape=[22, 16, 12, 32], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9003d27dd0c23eb731b000709f87b3f8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_138f0ee51b3230e45d32ed40b249ddc0
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 16, 12, 16], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 16, 12, 16], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 16, 12, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f4440d5093b18b5508df98b435bc89b8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9392b30c0e30f025725ed475fb5621b9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 18, 18], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 18, 18], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_419eabf62d96aab28e5ef4fbde7c66c2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f106e9dda5232c93243dff7fc2676c69
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 14, 20], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 14, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b09719fba1c8851eb89c963f8670262b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 48, 48], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 48, 48], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6b7e9e1ef3d577a711ccc8192d3fc420(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_69a3489015c06588a98698e2063d474b
-    def get_inputs(self):
-        return [
-            paddle.uniform([4260, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4260, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4260, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4260, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6b7e9e1ef3d577a711ccc8192d3fc420(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_69a3489015c06588a98698e2063d474b
-    def get_inputs(self):
-        return [
-            paddle.uniform([4260, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4260, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4260, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4260, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_70b9d3bbbd752904d5da78c302fc4f5e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1848e60d49960e74b723e5f73421c99d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8400, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 8400, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_144ad015232a4ec9babf8748384970a2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([32, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_959ccfa6b5df262a29ac321871188c90(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([64, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6e49408cda69bce22d03907e6a4ad98e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([128, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_340ff3a558b36275353a3b36cf736090(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9474a7d4d5a85165199c02bcc1cf1bb7
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.026255913078784943, 0.13178516924381256, 0.3967527747154236, 0.1426066756248474], [0.034072209149599075, 0.32437801361083984, 0.4085710942745209, 0.44272541999816895], [0.29807794094085693, 0.4807213544845581, 0.1041869968175888, 0.05750097706913948], [0.14768928289413452, 0.19507895410060883, 0.13148096203804016, 0.44643715023994446], [0.4279450476169586, 0.1642186939716339, 0.02514742687344551, 0.2158036082983017], [0.4850026071071625, 0.02126377820968628, 0.2537267208099365, 0.3879244029521942], [0.4881133437156677, 0.1497897207736969, 0.39538252353668213, 0.403257817029953]], dtype='float32').reshape([7, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5f2a9a34d9ce095a6d373a978df49d93(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c94fdf92a6bffb44756955b6d8df0b87
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([7], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8b30f9a059d341495ebe68df4e17c7cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9474a7d4d5a85165199c02bcc1cf1bb7
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.4429657757282257, 0.47139474749565125, 0.27933281660079956, 0.44871142506599426], [0.3590521216392517, 0.3183683753013611, 0.10797044634819031, 0.43915653228759766], [0.1250833421945572, 0.309425413608551, 0.11987120658159256, 0.11405402421951294], [0.2093142420053482, 0.20165832340717316, 0.08155534416437149, 0.024641428142786026], [0.40514639019966125, 0.28172576427459717, 0.3951146602630615, 0.057342011481523514], [0.03951010853052139, 0.14917805790901184, 0.320764422416687, 0.10585435479879379]], dtype='float32').reshape([6, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3af90ab907c9af06442c56824c7738ad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c94fdf92a6bffb44756955b6d8df0b87
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([6], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b389237df845b14ae35a31353be929d5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a083461fb796b4c517d430f84e62c368
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 192, 288], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 192, 288], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_df0a61246424ee1fb2573328ee1fa968(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1):
-        input_0 = [arg_0_0, arg_0_1]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[22, 49, 16, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[22, 49, 16, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c4d58ff896ab581cd9c89a9a50f42b0d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_df0a61246424ee1fb2573328ee1fa968
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 49, 16, 16], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 49, 16, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bb4ed6179b2a01843f7b0404f8c4d82d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1848e60d49960e74b723e5f73421c99d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 21504, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 21504, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_88bc0c57e668f9e2df7223998fb5ca57(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([24, 36], dtype='float32', min=0, max=0.5),
-            paddle.uniform([24, 36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1dc29ff3e00161fc6a324b0d49f2136b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.uniform([300, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cd8413f40117fe087071a90c85e9eb53(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c94fdf92a6bffb44756955b6d8df0b87
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([300], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c775f226a8b2b694c6dba8eb98444794(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 24, 36], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 24, 36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a81a43d3a597908b508deaae85c43d9a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.uniform([8, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4c0d35f3b5a0f30e8f44d6221d391b98(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c94fdf92a6bffb44756955b6d8df0b87
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([8], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fba97a8eaebb625f27773e5c15e722b1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.42679834365844727, 0.23651418089866638, 0.21780942380428314, 0.3397963345050812], [0.17834825813770294, 0.1380310207605362, 0.3761334717273712, 0.03816692531108856]], dtype='float32').reshape([2, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_97e60f0d8187517dbccc2e56bc869089(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c94fdf92a6bffb44756955b6d8df0b87
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([2], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_05b8bde67313b7d9c11fce33ea18321d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1848e60d49960e74b723e5f73421c99d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3549, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3549, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_edba7fda5fe10881888a3f3b2ba969ea(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 16, 16], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_144ad015232a4ec9babf8748384970a2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([32, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_959ccfa6b5df262a29ac321871188c90(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([64, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6e49408cda69bce22d03907e6a4ad98e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([128, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cca586620806f9812960aa2a71b76721(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.uniform([100, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_690b381e3831f63d2c4d59a651a79570(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c94fdf92a6bffb44756955b6d8df0b87
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([100], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3bab8179aa3694797c877d3b359028b8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 112, 160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 112, 160], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e659c0e79600def1c3a8d34b28716f9a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 6, 6], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 6, 6], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_61f43a31ca5da36e676a6ff28ff71b21(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 52, 52], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 52, 52], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f711307187e6a459aa52e55d4d96254e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1f2eafe799c9e741dde083e76a9c66de(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([96, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_240cd57f8d226b2bdfadfe5f4ae41924(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([48, 48], dtype='float32', min=0, max=0.5),
-            paddle.uniform([48, 48], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_56d69b5b0bcbfad9b50f41c85652f5e3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([24, 24], dtype='float32', min=0, max=0.5),
-            paddle.uniform([24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5c828b0cc0c36d336ec79f8430d27e58(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1848e60d49960e74b723e5f73421c99d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 12096, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 12096, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1f2eafe799c9e741dde083e76a9c66de(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([96, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_240cd57f8d226b2bdfadfe5f4ae41924(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([48, 48], dtype='float32', min=0, max=0.5),
-            paddle.uniform([48, 48], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_56d69b5b0bcbfad9b50f41c85652f5e3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([24, 24], dtype='float32', min=0, max=0.5),
-            paddle.uniform([24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_19d110fc29f042d2c5506bd7fa43bfa2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 60, 60], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 60, 60], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4386e65e3847411e1b8a1382e02f3ddc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 24, 24], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_082d50bed6d2d2deb2b22cb0f7e145ba(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 11, 11], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 11, 11], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6c06cf9d09bdc38100db1919e4f16179(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.2619287967681885, 0.2820969820022583, 0.3830491006374359, 0.33446410298347473], [0.15669028460979462, 0.27159908413887024, 0.19021214544773102, 0.32523876428604126]], dtype='float32').reshape([2, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_97e60f0d8187517dbccc2e56bc869089(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c94fdf92a6bffb44756955b6d8df0b87
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([2], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-
-class PrimitiveOp_41364762b0d90a75a6eda5186e6f0202(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1, arg_0_2):
-        input_0 = [arg_0_0, arg_0_1, arg_0_2]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2597f29bf1b5e3789e6c900f08d6c468(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_41364762b0d90a75a6eda5186e6f0202
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 48, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 48, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 48, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cf61bf4af558c4a79a30a62f8b82e16b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 30, 50], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 30, 50], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_961792c66c633a0620e72d153f6e63fa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 9, 9], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 9, 9], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_75faab608a83945414e01dcdb67da3f9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b2129367263bf0a2cc9c6b900b6f92dc
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[0.358097106218338, 0.35106879472732544]], [[0.4313538074493408, 0.08216709643602371]], [[0.05587208271026611, 0.3657324016094208]], [[0.31227242946624756, 0.3250352442264557]], [[0.4644756019115448, 0.35592329502105713]], [[0.12418679893016815, 0.4918902516365051]]]], dtype='float32').reshape([1, 6, 1, 2]),
-            paddle.to_tensor([[[[0.009778277017176151, 0.02429402805864811]], [[0.0029977455269545317, 0.20873524248600006]], [[0.46495717763900757, 0.0797295793890953]], [[0.39304178953170776, 0.019942941144108772]], [[0.1783885955810547, 0.41458258032798767]], [[0.47772762179374695, 0.20179226994514465]]]], dtype='float32').reshape([1, 6, 1, 2]),
-            paddle.to_tensor([[[[0.38811081647872925, 0.3460862338542938]], [[0.4325200915336609, 0.31605264544487]], [[0.17037074267864227, 0.4002247750759125]], [[0.02829047478735447, 0.1041380912065506]], [[0.44935834407806396, 0.04506528005003929]], [[0.24431096017360687, 0.3555302619934082]]]], dtype='float32').reshape([1, 6, 1, 2]),
-            paddle.to_tensor([[[[0.3234972059726715, 0.20493970811367035]], [[0.3132672607898712, 0.17412687838077545]], [[0.014389144256711006, 0.3884662687778473]], [[0.3867090344429016, 0.06462222337722778]], [[0.17619918286800385, 0.07482553273439407]], [[0.027263877913355827, 0.33704501390457153]]]], dtype='float32').reshape([1, 6, 1, 2]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3637723aca3c0cc64ee09071c63d7956(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a175d0c0530a3c5162117bbcd513875
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[0.29133909940719604, 0.4853375554084778], [0.36761757731437683, 0.4571003019809723], [0.46794551610946655, 0.1688530147075653], [0.2670198976993561, 0.1982056200504303], [0.12026780098676682, 0.48663008213043213], [0.2773101329803467, 0.48897823691368103]]], dtype='float32').reshape([1, 6, 2]),
-            paddle.to_tensor([[[0.4026823937892914, 0.4708717167377472], [0.22823500633239746, 0.07231664657592773], [0.4897056519985199, 0.011129551567137241], [0.37206071615219116, 0.07582680135965347], [0.40325236320495605, 0.4095800518989563], [0.458786278963089, 0.13427451252937317]]], dtype='float32').reshape([1, 6, 2]),
-            paddle.to_tensor([[[0.1645549237728119], [0.058689385652542114], [0.36124107241630554], [0.27911141514778137], [0.4413716495037079], [0.3439434766769409]]], dtype='float32').reshape([1, 6, 1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_74c6c37652caafcb9ffba3c1e0587aa4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7a32f6f08b9ebf9769240cea6e858a64(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 24, 24], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ab6171e1d9ea31c6c02f10ec574dd0dc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 12, 12], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 12, 12], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c26b767cc8f832cbf9e9eb3af292a4bd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.2063712179660797, 0.3073878884315491, 0.20581398904323578, 0.009677620604634285], [0.07508716732263565, 0.22653378546237946, 0.4011777937412262, 0.2833462059497833]], dtype='float32').reshape([2, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_97e60f0d8187517dbccc2e56bc869089(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c94fdf92a6bffb44756955b6d8df0b87
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([2], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_43083f02af5d39f7b67d7ee0c0c0260c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 16, 16], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a81a43d3a597908b508deaae85c43d9a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.uniform([8, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4c0d35f3b5a0f30e8f44d6221d391b98(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c94fdf92a6bffb44756955b6d8df0b87
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([8], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_72aa8d8d05456e8611725c8efe07ea3f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1848e60d49960e74b723e5f73421c99d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 7581, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 7581, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_89161b457bd2a2bc6708b5c78c1eaa8e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d5dc53de0d2688a5b4748447c9855df4
-    def get_inputs(self):
-        return [
-            paddle.uniform([300], dtype='float32', min=0, max=0.5),
-            paddle.uniform([300], dtype='float32', min=0, max=0.5),
-            paddle.uniform([300], dtype='float32', min=0, max=0.5),
-            paddle.uniform([300], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ea47b32c79f402891afd52bdc17c1919(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 40, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 40, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_979426c7c8aa6341f1f78e034608ae3f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([25, 38], dtype='float32', min=0, max=0.5),
-            paddle.uniform([25, 38], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_12bf2ac8c534ef4d25941c2dc1369827(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 24, 24], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b608b7e54c3e9c0db3bd2ae1327a0621(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1848e60d49960e74b723e5f73421c99d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4725, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 4725, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_74c6c37652caafcb9ffba3c1e0587aa4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d72736ee64e7806324ddc10902ba3424(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 15, 15], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 15, 15], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_58ff7aa29e7c894b62adecece32e7017(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 12, 12], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 64, 12, 12], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_45753d63be77e5a306508a8b2d5e948f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 36, 36], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 36, 36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4386e65e3847411e1b8a1382e02f3ddc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 24, 24], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c77f882f347e1b64996b0850f54cdaff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1777, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1777, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1777, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1777, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c77f882f347e1b64996b0850f54cdaff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1777, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1777, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1777, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1777, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_05b8bde67313b7d9c11fce33ea18321d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1848e60d49960e74b723e5f73421c99d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3549, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3549, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b4ab8938db859088e381c651a072219d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 8, 8], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 64, 8, 8], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_70b9d3bbbd752904d5da78c302fc4f5e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1848e60d49960e74b723e5f73421c99d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8400, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 8400, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_632825a5440eead2cdfc0d10e827dc22(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([20, 30], dtype='float32', min=0, max=0.5),
-            paddle.uniform([20, 30], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_959ccfa6b5df262a29ac321871188c90(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([64, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_144ad015232a4ec9babf8748384970a2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([32, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f60c81c970ad1c48f24c5a7d5db3dd2a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([16, 16], dtype='float32', min=0, max=0.5),
-            paddle.uniform([16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_068144b324fbc9d974dcb67738c5cad6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1848e60d49960e74b723e5f73421c99d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 5376, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 5376, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_959ccfa6b5df262a29ac321871188c90(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([64, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_144ad015232a4ec9babf8748384970a2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([32, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f60c81c970ad1c48f24c5a7d5db3dd2a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([16, 16], dtype='float32', min=0, max=0.5),
-            paddle.uniform([16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ecee971c8f1ac4859a960b9bbc6c85e9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.06533878296613693, 0.3481195271015167, 0.24883194267749786, 0.20702722668647766], [0.2230253666639328, 0.34996768832206726, 0.4861466884613037, 0.13386943936347961], [0.30274221301078796, 0.3233219087123871, 0.3567175567150116, 0.4390983283519745], [0.46446141600608826, 0.3582879900932312, 0.3432950973510742, 0.4376503527164459], [0.17208008468151093, 0.10273945331573486, 0.30130621790885925, 0.48919835686683655], [0.012808924540877342, 0.03297838196158409, 0.20926563441753387, 0.185565784573555], [0.033298660069704056, 0.21981042623519897, 0.06827296316623688, 0.3866482675075531]], dtype='float32').reshape([7, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5f2a9a34d9ce095a6d373a978df49d93(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c94fdf92a6bffb44756955b6d8df0b87
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([7], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_11c9f70cbe998840308baa5ba8c1dbd8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 48, 48], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 48, 48], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b38f7c0d5748f90ac42d1cfceb596f6d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 48, 72], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 48, 72], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_05b8bde67313b7d9c11fce33ea18321d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1848e60d49960e74b723e5f73421c99d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3549, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3549, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_dda2a47081d8eb070b1881dc1fd6993a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_34b5bfe351392a61a4919e8b0fb9b096
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 28, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 28, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 28, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 28, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 28, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 28, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 28, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 28, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_de5fb3bbccce1bbe51dfdfd3e1c144e6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.39208778738975525], [0.2094176560640335], [0.1283661276102066], [0.27551141381263733], [0.03479340672492981], [0.3570266664028168], [0.11812948435544968], [0.2456916868686676], [0.48227444291114807]], dtype='float32').reshape([9, 1]),
-            paddle.to_tensor([[0.49722179770469666], [0.4310191571712494], [0.3834795355796814], [0.30722612142562866], [0.2178652435541153], [0.11710164695978165], [0.23001685738563538], [0.22062554955482483], [0.498458594083786]], dtype='float32').reshape([9, 1]),
-            paddle.to_tensor([[0.36820653080940247], [0.03848660737276077], [0.08805205672979355], [0.03780742734670639], [0.23160281777381897], [0.18210230767726898], [0.21688763797283173], [0.009429873898625374], [0.23962129652500153]], dtype='float32').reshape([9, 1]),
-            paddle.to_tensor([[0.39371946454048157], [0.050644610077142715], [0.09682576358318329], [0.37938541173934937], [0.37218934297561646], [0.31943804025650024], [0.009334404021501541], [0.027887742966413498], [0.1417359560728073]], dtype='float32').reshape([9, 1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9e7b78a17b390b150c65dfcfdbfbdc11(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.1547079086303711], [0.3591558635234833], [0.15294159948825836], [0.019754718989133835], [0.2135521024465561], [0.2554653286933899], [0.3142800033092499], [0.4077095687389374], [0.42899003624916077]], dtype='float32').reshape([9, 1]),
-            paddle.to_tensor([[0.39656439423561096], [0.12202204018831253], [0.0054341829381883144], [0.014495838433504105], [0.0013494952581822872], [0.28443190455436707], [0.2855451703071594], [0.20876038074493408], [0.38022154569625854]], dtype='float32').reshape([9, 1]),
-            paddle.to_tensor([[0.08568544685840607], [0.1383717805147171], [0.2306109517812729], [0.03215041384100914], [0.05588645488023758], [0.1058163195848465], [0.12910811603069305], [0.02052994631230831], [0.24312002956867218]], dtype='float32').reshape([9, 1]),
-            paddle.to_tensor([[0.08652636408805847], [0.38375985622406006], [0.22444428503513336], [0.3983890116214752], [0.28843000531196594], [0.07827463001012802], [0.3716101050376892], [0.20676524937152863], [0.260421484708786]], dtype='float32').reshape([9, 1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cbc4d7cd667c46d47f21de001c4e895c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 60, 100], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 60, 100], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6933fc52eaa223c14c2741bab6c14bb2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 20, 128, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 20, 128, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a584fcd652d89ea075bfce9f2062e1b3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 40, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 40, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f395f03fafee203c555a94643e375026(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 32, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 80, 32, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f6d6a9ddb8f95fbf71f1c24be8d10219(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 16, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 160, 16, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7778eed994216c0e5523a822369834e5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 4, 4], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 4, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e2f0970f8551305ea28aedac67b5f4f2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.uniform([5480, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([5480, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([5480, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([5480, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e2f0970f8551305ea28aedac67b5f4f2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.uniform([5480, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([5480, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([5480, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([5480, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b5f7f362f5ad5b569ecb7d82e6494e97(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1848e60d49960e74b723e5f73421c99d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 11109, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 11109, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ae021050230c6fdaa1d738576612010d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 36, 36], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 36, 36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a3a298b505cb0515164295ec0708199b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.0744657814502716, 0.12276715785264969, 0.35531410574913025, 0.48441699147224426], [0.3495769500732422, 0.41702592372894287, 0.4514731168746948, 0.1187334656715393], [0.08253531157970428, 0.12003565579652786, 0.47612228989601135, 0.23035909235477448], [0.2246844619512558, 0.05810641497373581, 0.18594786524772644, 0.02734232135117054], [0.0647694543004036, 0.20631584525108337, 0.4361419379711151, 0.3645848035812378], [0.18269386887550354, 0.03176182508468628, 0.43640458583831787, 0.15800030529499054]], dtype='float32').reshape([6, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3af90ab907c9af06442c56824c7738ad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c94fdf92a6bffb44756955b6d8df0b87
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([6], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cbc4d7cd667c46d47f21de001c4e895c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 60, 100], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 60, 100], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0257890e925a139b16372a5d1da55ec8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6dec380f21e65c9fcb0a4d619a1cc373(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 8, 112, 112], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 8, 112, 112], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_90c72ac2fc530513aef7cd3da0785a30(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 48, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 48, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4180b76d46cb79f3c0cd00443ce29931(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.4612564742565155, 0.11859863251447678, 0.24108052253723145, 0.22271811962127686], [0.3189566135406494, 0.4748760163784027, 0.2607230246067047, 0.26097407937049866], [0.11517703533172607, 0.30200156569480896, 0.4437040686607361, 0.34151124954223633]], dtype='float32').reshape([3, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ddc5f29dbd04067f08de4222dfec09e2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c94fdf92a6bffb44756955b6d8df0b87
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([3], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4a1124fc591ac9867819bf737c738110(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 34, 34], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 34, 34], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_17043484afab04c36688a2001e6f7b9d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 7, 10], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 7, 10], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7ed4049586f80e8798ec3607daf8ed92(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 120, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 120, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_dea896ef235528715b6a2535f02076e1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 44, 44], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 44, 44], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f0740cf76dfcc5c2cbf7abd4fdc48a1c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_34b5bfe351392a61a4919e8b0fb9b096
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 28, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 28, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 28, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 28, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 28, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 28, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 28, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 28, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d4bb432e730ad8ef66231d92c5203859(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 18, 18], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 18, 18], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_499fbde81d3808b6ea0a46a48f40c6f4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 17, 17], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 17, 17], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f607bff1041daf3617005641d1e80184(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 120, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 120, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9e1538baf0702a5a965023a2fbe99923(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_34b5bfe351392a61a4919e8b0fb9b096
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 28, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 28, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 28, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 28, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 28, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 28, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 28, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 28, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_21353360348922b803268b71dc2366a3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 22, 22], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 22, 22], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_36520a4c2af733671005fc214daea88e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d5dc53de0d2688a5b4748447c9855df4
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.1027945876121521, 0.3881237208843231, 0.152043879032135, 0.21335071325302124, 0.38008421659469604, 0.12074317038059235], dtype='float32').reshape([6]),
-            paddle.to_tensor([0.2527327835559845, 0.1542942374944687, 0.470980703830719, 0.32545068860054016, 0.27355799078941345, 0.35376250743865967], dtype='float32').reshape([6]),
-            paddle.to_tensor([0.2608264982700348, 0.4725295603275299, 0.30785173177719116, 0.08038189262151718, 0.0575774721801281, 0.3921468257904053], dtype='float32').reshape([6]),
-            paddle.to_tensor([0.4957810342311859, 0.08107513189315796, 0.33436471223831177, 0.4922436773777008, 0.36378422379493713, 0.13394984602928162], dtype='float32').reshape([6]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e80f6c32f1e85d4482b01912eb33a052(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d5dc53de0d2688a5b4748447c9855df4
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.2304920107126236, 0.0650036409497261, 0.457919716835022, 0.030212104320526123, 0.35011738538742065, 0.12877273559570312], dtype='float32').reshape([6]),
-            paddle.to_tensor([0.23068910837173462, 0.1622818112373352, 0.3164260983467102, 0.16976673901081085, 0.15035927295684814, 0.22009573876857758], dtype='float32').reshape([6]),
-            paddle.to_tensor([0.24978351593017578, 0.11446373909711838, 0.06451474130153656, 0.04623079672455788, 0.3613818883895874, 0.4987070560455322], dtype='float32').reshape([6]),
-            paddle.to_tensor([0.2845926582813263, 0.16627027094364166, 0.25496557354927063, 0.29948753118515015, 0.21094956994056702, 0.2771330177783966], dtype='float32').reshape([6]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4f59f8c513803d37de76182365c23563(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1742, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1742, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1742, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1742, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4f59f8c513803d37de76182365c23563(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1742, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1742, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1742, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1742, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_05b8bde67313b7d9c11fce33ea18321d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1848e60d49960e74b723e5f73421c99d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3549, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3549, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fa0722a8bef29126a25f5a0594a17d14(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 5, 5], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 5, 5], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_aae150eb0fc942f51c08117b5ecb1d71(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a175d0c0530a3c5162117bbcd513875
-    def get_inputs(self):
-        return [
-            paddle.uniform([4, 144, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4, 144, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4, 144, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4386e65e3847411e1b8a1382e02f3ddc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 24, 24], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6933fc52eaa223c14c2741bab6c14bb2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 20, 128, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 20, 128, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a584fcd652d89ea075bfce9f2062e1b3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 40, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 40, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f395f03fafee203c555a94643e375026(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 32, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 80, 32, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_43083f02af5d39f7b67d7ee0c0c0260c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 16, 16], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_38766d5b43b329871c07d7a669bfde2b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.03657087683677673, 0.15358947217464447, 0.007713953498750925, 0.257577121257782], [0.035585466772317886, 0.49221542477607727, 0.17263424396514893, 0.29923829436302185]], dtype='float32').reshape([2, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_97e60f0d8187517dbccc2e56bc869089(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c94fdf92a6bffb44756955b6d8df0b87
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([2], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_31f3771d77b3eb287bde90ee8b122515(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1848e60d49960e74b723e5f73421c99d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4116, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 4116, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_058d960ba3d387999483d22f3cd0998f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.4721968472003937, 0.46351638436317444, 0.43057215213775635, 0.4704304039478302]], dtype='float32').reshape([1, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c451a4630aa40476f8c12a2dd8b667f1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c94fdf92a6bffb44756955b6d8df0b87
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([1], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a00e76e3ff79a2bd5e025d26b6a16aa9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 17, 128, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 17, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_30cc89538f842dbc1ec95e3f6bef6063(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 26, 26], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b9dea30d0cbeb10588a5bd833f33b1e7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([80, 80], dtype='float32', min=0, max=0.5),
-            paddle.uniform([80, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_373feead1a9fbbed37952fe0804f5e40(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([40, 40], dtype='float32', min=0, max=0.5),
-            paddle.uniform([40, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bcbe28e378696ed8518cfa7a8a7b580f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([20, 20], dtype='float32', min=0, max=0.5),
-            paddle.uniform([20, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_70b9d3bbbd752904d5da78c302fc4f5e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1848e60d49960e74b723e5f73421c99d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8400, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 8400, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b9dea30d0cbeb10588a5bd833f33b1e7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([80, 80], dtype='float32', min=0, max=0.5),
-            paddle.uniform([80, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_373feead1a9fbbed37952fe0804f5e40(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([40, 40], dtype='float32', min=0, max=0.5),
-            paddle.uniform([40, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bcbe28e378696ed8518cfa7a8a7b580f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([20, 20], dtype='float32', min=0, max=0.5),
-            paddle.uniform([20, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_47ff3884c46ce473bca1559ef26f47ea(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_41364762b0d90a75a6eda5186e6f0202
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 49, 8, 16], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 49, 8, 16], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 49, 8, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d6ceac466e65ed955a6a19d648edaff9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 13, 13], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 13, 13], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ee48c8e4f066a56ab10cb0112564321f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_41364762b0d90a75a6eda5186e6f0202
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 160, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 160, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 160, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4c7e8a203eec421bfdb121d3019855c9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 36, 36], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 36, 36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a51d1c57ef055c27da9ed5f2f70ba499(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 12, 12], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 12, 12], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a88937a4ba4b9baec3388c0967dd94bd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_34b5bfe351392a61a4919e8b0fb9b096
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 112, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 112, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 112, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 112, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 112, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 112, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 112, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 112, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e547a28ba2aa7721d42891e822f7d708(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 40, 40], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 40, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_11c9f70cbe998840308baa5ba8c1dbd8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 48, 48], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 48, 48], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_144ad015232a4ec9babf8748384970a2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([32, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_959ccfa6b5df262a29ac321871188c90(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([64, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6e49408cda69bce22d03907e6a4ad98e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([128, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d5c47e276a7632be0d355052650efdf3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1848e60d49960e74b723e5f73421c99d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 6069, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 6069, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d38ccbed067bbfc07f9429baf4c5d1c2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1527, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1527, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1527, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1527, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d38ccbed067bbfc07f9429baf4c5d1c2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1527, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1527, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1527, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1527, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4233c14a8059d68bd80d489a3d3ae3a6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1848e60d49960e74b723e5f73421c99d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3024, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3024, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8c5f3c7843830a001e0e98f85b5f618f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 30, 30], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 30, 30], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_77bc556f36c2162ce7909f25b18d7ccb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_34b5bfe351392a61a4919e8b0fb9b096
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 56, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 56, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 56, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 56, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 56, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 56, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 56, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 56, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6e88c0d8d067253b9cd8d4ae1c91b33e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.07563749700784683, 0.24206598103046417, 0.385073184967041, 0.10971993207931519], [0.2720660865306854, 0.4351181089878082, 0.3442555069923401, 0.2988447844982147], [0.12328121066093445, 0.2558436691761017, 0.04545897990465164, 0.0779871866106987], [0.1755024641752243, 0.26999571919441223, 0.14806866645812988, 0.07825171202421188], [0.3740345537662506, 0.4112735390663147, 0.23452633619308472, 0.06603209674358368], [0.20097699761390686, 0.30600640177726746, 0.06423215568065643, 0.3307529091835022], [0.3834092319011688, 0.01032618060708046, 0.32125118374824524, 0.1412786841392517]], dtype='float32').reshape([7, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5f2a9a34d9ce095a6d373a978df49d93(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c94fdf92a6bffb44756955b6d8df0b87
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([7], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e30439916c6dcbfe2507b0737135e198(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.13273146748542786, 0.17586477100849152, 0.22157639265060425, 0.061416372656822205]], dtype='float32').reshape([1, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c451a4630aa40476f8c12a2dd8b667f1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c94fdf92a6bffb44756955b6d8df0b87
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([1], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5047874ce14665dd3653812dce54ca6b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_34b5bfe351392a61a4919e8b0fb9b096
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 14, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 14, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 14, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 14, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 14, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 14, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 14, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 14, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7da23b76417507432cf3a3bcb410c56b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_41364762b0d90a75a6eda5186e6f0202
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 80, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 80, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 80, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e547a28ba2aa7721d42891e822f7d708(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 40, 40], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 40, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_411e2d73ef12668e5066a6d564ddb115(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.2977246940135956]], dtype='float32').reshape([1, 1]),
-            paddle.to_tensor([[0.45340871810913086]], dtype='float32').reshape([1, 1]),
-            paddle.to_tensor([[0.33794644474983215]], dtype='float32').reshape([1, 1]),
-            paddle.to_tensor([[0.12983585894107819]], dtype='float32').reshape([1, 1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0fd31c305d5c6cf2f67fc751dc2bf290(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.3555246889591217]], dtype='float32').reshape([1, 1]),
-            paddle.to_tensor([[0.43772584199905396]], dtype='float32').reshape([1, 1]),
-            paddle.to_tensor([[0.11903903633356094]], dtype='float32').reshape([1, 1]),
-            paddle.to_tensor([[0.0831770971417427]], dtype='float32').reshape([1, 1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_aa24ae4a2f5342072d0366048128381e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 196, 8, 16], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 196, 8, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_85ecfcb8c8d3b7f4bf8eda7322bff530(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.15491808950901031], [0.16919776797294617], [0.1292070597410202], [0.12714418768882751], [0.33482757210731506], [0.2098187357187271]], dtype='float32').reshape([6, 1]),
-            paddle.to_tensor([[0.4103717803955078], [0.39778658747673035], [0.40150901675224304], [0.42183321714401245], [0.09941722452640533], [0.25498807430267334]], dtype='float32').reshape([6, 1]),
-            paddle.to_tensor([[0.20998290181159973], [0.4498758018016815], [0.24683597683906555], [0.20288529992103577], [0.21599259972572327], [0.19651634991168976]], dtype='float32').reshape([6, 1]),
-            paddle.to_tensor([[0.4901370406150818], [0.2509276866912842], [0.2429288774728775], [0.06132770702242851], [0.08567338436841965], [0.23274247348308563]], dtype='float32').reshape([6, 1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2767547805bf632cfafc133a101e33fb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.3895230293273926], [0.4666270613670349], [0.17671829462051392], [0.3581591248512268], [0.42263373732566833], [0.24344341456890106]], dtype='float32').reshape([6, 1]),
-            paddle.to_tensor([[0.1010279506444931], [0.2909882366657257], [0.2298392504453659], [0.29276591539382935], [0.1773831695318222], [0.48681026697158813]], dtype='float32').reshape([6, 1]),
-            paddle.to_tensor([[0.22682112455368042], [0.18442489206790924], [0.1968512237071991], [0.46012169122695923], [0.40794169902801514], [0.4862612187862396]], dtype='float32').reshape([6, 1]),
-            paddle.to_tensor([[0.4151418209075928], [0.3606884777545929], [0.13929075002670288], [0.03818127512931824], [0.28175589442253113], [0.3325986862182617]], dtype='float32').reshape([6, 1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_56eec34e495f7f3c2c307499df1c6cb7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b2129367263bf0a2cc9c6b900b6f92dc
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 300, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 300, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 300, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 300, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e659c0e79600def1c3a8d34b28716f9a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 6, 6], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 6, 6], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d28d1ebe3696cca2ecbb0aa214b7cd23(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_da2bac44525413c24a709f2eee72de2b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_77b5f380ded411bbb99efe60e054cb8f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_014fe8222e4aca10d895aef341bbbb40(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a175d0c0530a3c5162117bbcd513875
-    def get_inputs(self):
-        return [
-            paddle.uniform([4, 576, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4, 576, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4, 576, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fd838c0c16315be90fb5ddba34cc6997(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_73e0ee8603adf28d83dc9647badf085d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.1197030246257782, 0.12258951365947723, 0.47334030270576477, 0.4889293611049652], [0.04961347207427025, 0.17199668288230896, 0.26389777660369873, 0.3503299355506897], [0.4987875819206238, 0.3148815631866455, 0.08101204037666321, 0.1202988401055336], [0.03471033647656441, 0.17305532097816467, 0.3287604749202728, 0.4935028851032257], [0.2583658695220947, 0.46363237500190735, 0.05257610231637955, 0.4554295539855957]], dtype='float32').reshape([5, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8d33ee0f7804e19ae5fa954d05146406(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c94fdf92a6bffb44756955b6d8df0b87
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([5], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7963f2ba6c34ff58b705eb4de4b625ca(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.3263397812843323, 0.25497326254844666, 0.4833052158355713, 0.006029351148754358], [0.01641535945236683, 0.3863627314567566, 0.2172834575176239, 0.07637519389390945], [0.22629611194133759, 0.19287849962711334, 0.014730019494891167, 0.393351674079895], [0.3637615740299225, 0.25450533628463745, 0.33932405710220337, 0.43694356083869934], [0.3050724267959595, 0.02311766892671585, 0.20481741428375244, 0.26305362582206726], [0.46263688802719116, 0.4497365951538086, 0.4610375463962555, 0.47209975123405457], [0.06414810568094254, 0.29436615109443665, 0.2422768473625183, 0.33959126472473145]], dtype='float32').reshape([7, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5f2a9a34d9ce095a6d373a978df49d93(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c94fdf92a6bffb44756955b6d8df0b87
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([7], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e547a28ba2aa7721d42891e822f7d708(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 40, 40], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 40, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_60d8f88a0fb56259fa495c0d51486779(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.38261204957962036, 0.04909217357635498, 0.08167355507612228, 0.09969377517700195], [0.27192261815071106, 0.0985708013176918, 0.1131369099020958, 0.48550352454185486], [0.2861417233943939, 0.21686436235904694, 0.1679471731185913, 0.48392459750175476], [0.14770331978797913, 0.2055833488702774, 0.21170517802238464, 0.3795926570892334], [0.014819027855992317, 0.1987682580947876, 0.030129656195640564, 0.12573571503162384], [0.2726563513278961, 0.18826104700565338, 0.058112744241952896, 0.24436795711517334], [0.15637606382369995, 0.38363125920295715, 0.2127828747034073, 0.43630972504615784]], dtype='float32').reshape([7, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5f2a9a34d9ce095a6d373a978df49d93(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c94fdf92a6bffb44756955b6d8df0b87
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([7], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0e04b5c38fcf5d2371528b137bc751e6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 96, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 96, 96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1982626b5b29898e572e3cb7cce23925(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 88, 88], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 88, 88], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_39198d9429956a0cff249c9e6ee02d3a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.40654340386390686, 0.14714907109737396, 0.07348904013633728, 0.17775322496891022]], dtype='float32').reshape([1, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c451a4630aa40476f8c12a2dd8b667f1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c94fdf92a6bffb44756955b6d8df0b87
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([1], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1dc29ff3e00161fc6a324b0d49f2136b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.uniform([300, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cd8413f40117fe087071a90c85e9eb53(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c94fdf92a6bffb44756955b6d8df0b87
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([300], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e36ed182d8f298a6b0709ece386d4533(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a175d0c0530a3c5162117bbcd513875
-    def get_inputs(self):
-        return [
-            paddle.uniform([4, 2304, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4, 2304, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4, 2304, 192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f3ca06e9d4e684c2f9d147a77d4cb5c6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 80, 80], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 80, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5c0d129fcaf49c9d5141be80da5721b4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.uniform([2066, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2066, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2066, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2066, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5c0d129fcaf49c9d5141be80da5721b4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.uniform([2066, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2066, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2066, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2066, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_31f3771d77b3eb287bde90ee8b122515(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1848e60d49960e74b723e5f73421c99d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4116, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 4116, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4db40d33bb75ea13a6fcf54ed493f21f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b2129367263bf0a2cc9c6b900b6f92dc
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 90, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 90, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 90, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 90, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_56d69b5b0bcbfad9b50f41c85652f5e3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([24, 24], dtype='float32', min=0, max=0.5),
-            paddle.uniform([24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bea112607e2311e80da5e571a9c86161(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 40, 40], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 40, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_17d05eb6382d2ea58862dbdb8e9865f1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_34b5bfe351392a61a4919e8b0fb9b096
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 14, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 14, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 14, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 14, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 14, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 14, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 14, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 14, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_dadacece982240c8744107d28c88cd17(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1, arg_0_2, arg_0_3, arg_0_4):
-        input_0 = [arg_0_0, arg_0_1, arg_0_2, arg_0_3, arg_0_4]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_77a70d4deb03de21ad869269414b83cc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_dadacece982240c8744107d28c88cd17
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 144, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 144, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 144, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 144, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 144, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7a32f6f08b9ebf9769240cea6e858a64(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 24, 24], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_65e7f60f06a3f33deed25b3bd9bc69ed(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.uniform([4586, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4586, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4586, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4586, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_65e7f60f06a3f33deed25b3bd9bc69ed(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.uniform([4586, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4586, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4586, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4586, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_78bad22fe49e21cec6a67e7126a6ddd7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1848e60d49960e74b723e5f73421c99d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9261, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9261, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9694e6ff00cb6491a017396a14f18581(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 17, 160, 160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 17, 160, 160], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6311ec15e87a13a412f88d561891c7c3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 600, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 600, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ff6ba9747e5601bf836c0d20146a5908(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.2836782932281494, 0.30620822310447693, 0.37035006284713745, 0.057763535529375076], [0.10409702360630035, 0.18112534284591675, 0.08620662242174149, 0.44886669516563416], [0.13950517773628235, 0.4202529191970825, 0.005039406009018421, 0.33990785479545593], [0.26290255784988403, 0.12213823944330215, 0.4939698874950409, 0.4407085180282593], [0.3204594552516937, 0.48117324709892273, 0.27943259477615356, 0.29908043146133423]], dtype='float32').reshape([5, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8d33ee0f7804e19ae5fa954d05146406(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c94fdf92a6bffb44756955b6d8df0b87
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([5], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b38f7c0d5748f90ac42d1cfceb596f6d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 48, 72], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 48, 72], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9e69605f26e51748e0168e881812297e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1073, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1073, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1073, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1073, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9e69605f26e51748e0168e881812297e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1073, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1073, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1073, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1073, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c63d5f01dedb07a889a46f7cc76af9ed(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1848e60d49960e74b723e5f73421c99d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2100, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 2100, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_43083f02af5d39f7b67d7ee0c0c0260c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 16, 16], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f4e6ed5bdb7d782bc788cf9d057035bf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_871a86c50ec55a304be42675abf7d075(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 15, 25], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 15, 25], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_78bad22fe49e21cec6a67e7126a6ddd7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1848e60d49960e74b723e5f73421c99d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9261, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9261, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_abe25245c08fed1e8471d926e0887bb2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 96, 144], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 96, 144], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c61df594738380170c139198793e8c14(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 192, 288], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 192, 288], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ca132ebf48f034a1a571349add59d0e8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_34b5bfe351392a61a4919e8b0fb9b096
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 56, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 56, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 56, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 56, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 56, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 56, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 56, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 56, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_419ba98224dc93f12ae7fb3713e0baa6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a175d0c0530a3c5162117bbcd513875
-    def get_inputs(self):
-        return [
-            paddle.uniform([6, 144, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([6, 144, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([6, 144, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3e5058132190a639d5d26cd388a876ad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([68, 68], dtype='float32', min=0, max=0.5),
-            paddle.uniform([68, 68], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_16d86ea15b393d4a480f7fa28100d85d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([34, 34], dtype='float32', min=0, max=0.5),
-            paddle.uniform([34, 34], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1f945e2bca3413828b3e004f7913a906(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([17, 17], dtype='float32', min=0, max=0.5),
-            paddle.uniform([17, 17], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d5c47e276a7632be0d355052650efdf3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1848e60d49960e74b723e5f73421c99d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 6069, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 6069, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3e5058132190a639d5d26cd388a876ad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([68, 68], dtype='float32', min=0, max=0.5),
-            paddle.uniform([68, 68], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_16d86ea15b393d4a480f7fa28100d85d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([34, 34], dtype='float32', min=0, max=0.5),
-            paddle.uniform([34, 34], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1f945e2bca3413828b3e004f7913a906(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([17, 17], dtype='float32', min=0, max=0.5),
-            paddle.uniform([17, 17], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_78759dd858fbef84eebd59fa72f5bdad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.3776218891143799], [0.017230553552508354], [0.12865380942821503], [0.0789160430431366], [0.29648688435554504]], dtype='float32').reshape([5, 1]),
-            paddle.to_tensor([[0.04191706329584122], [0.1894516497850418], [0.11870089173316956], [0.0004433089052326977], [0.28320610523223877]], dtype='float32').reshape([5, 1]),
-            paddle.to_tensor([[0.3077138066291809], [0.21676185727119446], [0.36836960911750793], [0.01315593346953392], [0.1262916475534439]], dtype='float32').reshape([5, 1]),
-            paddle.to_tensor([[0.39167019724845886], [0.046127624809741974], [0.13554736971855164], [0.2480829954147339], [0.17310704290866852]], dtype='float32').reshape([5, 1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_255fcd9e1960448b91d8e9c320197362(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.4706946909427643], [0.39319300651550293], [0.19910383224487305], [0.3212777376174927], [0.27562597393989563]], dtype='float32').reshape([5, 1]),
-            paddle.to_tensor([[0.16876435279846191], [0.1280040442943573], [0.3004133403301239], [0.4173230230808258], [0.3782731890678406]], dtype='float32').reshape([5, 1]),
-            paddle.to_tensor([[0.27102693915367126], [0.3185052275657654], [0.3153221905231476], [0.430990993976593], [0.4189223051071167]], dtype='float32').reshape([5, 1]),
-            paddle.to_tensor([[0.4086301028728485], [0.391907662153244], [0.04106692224740982], [0.014858669601380825], [0.4931931793689728]], dtype='float32').reshape([5, 1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2ed53434a1df082217b3491a9f6b9be6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.36098194122314453, 0.36900797486305237, 0.21059876680374146, 0.4295063018798828]], dtype='float32').reshape([1, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c451a4630aa40476f8c12a2dd8b667f1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c94fdf92a6bffb44756955b6d8df0b87
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([1], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8ee462787e16133403b927ba886fa509(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 68, 68], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 68, 68], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_abe25245c08fed1e8471d926e0887bb2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 96, 144], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 96, 144], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6e49408cda69bce22d03907e6a4ad98e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([128, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_959ccfa6b5df262a29ac321871188c90(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([64, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_144ad015232a4ec9babf8748384970a2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([32, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f60c81c970ad1c48f24c5a7d5db3dd2a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([16, 16], dtype='float32', min=0, max=0.5),
-            paddle.uniform([16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_379b64667ba43ad8a6303d8f433aa279(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([8, 8], dtype='float32', min=0, max=0.5),
-            paddle.uniform([8, 8], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_63cb58fa23a3f6d184ec8519e1128f95(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 72, 72], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 72, 72], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3a46aebaabcd91c85fde2923b84824f8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 36, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 36, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c63d5f01dedb07a889a46f7cc76af9ed(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1848e60d49960e74b723e5f73421c99d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2100, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 2100, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_856ee7559a12dee65d21e7b25fc57236(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a175d0c0530a3c5162117bbcd513875
-    def get_inputs(self):
-        return [
-            paddle.uniform([4, 9216, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4, 9216, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4, 9216, 96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_715d31ab33200caceb33d78602eb679e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 12, 12], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 128, 12, 12], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e92396131c653c7d57ec9dd593f775d9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.258802205324173, 0.4104510545730591, 0.17734280228614807, 0.4375358819961548]], dtype='float32').reshape([1, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c451a4630aa40476f8c12a2dd8b667f1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c94fdf92a6bffb44756955b6d8df0b87
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([1], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4870f1f9e7f83a33bff195cb6b8129b6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([15, 25], dtype='float32', min=0, max=0.5),
-            paddle.uniform([15, 25], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_14fc5f240e2cb1646d1c5230c304e9b1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_34b5bfe351392a61a4919e8b0fb9b096
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 112, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 112, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 112, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 112, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 112, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 112, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 112, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 112, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a2a6efd98c33743061934cdc0f971455(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.uniform([2383, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2383, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2383, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2383, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a2a6efd98c33743061934cdc0f971455(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.uniform([2383, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2383, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2383, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2383, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b608b7e54c3e9c0db3bd2ae1327a0621(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1848e60d49960e74b723e5f73421c99d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4725, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 4725, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a51d1c57ef055c27da9ed5f2f70ba499(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 12, 12], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 12, 12], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a81a43d3a597908b508deaae85c43d9a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.uniform([8, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4c0d35f3b5a0f30e8f44d6221d391b98(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c94fdf92a6bffb44756955b6d8df0b87
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([8], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ebf976fcaaac789828523c3ae9d649f7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.uniform([3030, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([3030, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([3030, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([3030, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ebf976fcaaac789828523c3ae9d649f7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.uniform([3030, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([3030, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([3030, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([3030, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d5c47e276a7632be0d355052650efdf3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1848e60d49960e74b723e5f73421c99d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 6069, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 6069, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d45c72f2ce9b5abc615ed734369c0428(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.uniform([3787, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([3787, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([3787, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([3787, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d45c72f2ce9b5abc615ed734369c0428(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.uniform([3787, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([3787, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([3787, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([3787, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_72aa8d8d05456e8611725c8efe07ea3f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1848e60d49960e74b723e5f73421c99d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 7581, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 7581, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1e3f1ed672a768d70e7236e2eba48e55(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 28, 40], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 28, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cca586620806f9812960aa2a71b76721(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.uniform([100, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_690b381e3831f63d2c4d59a651a79570(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c94fdf92a6bffb44756955b6d8df0b87
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([100], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4ffee4989e420692e825f235cfe14206(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 16, 16], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6043f2ed5775e2fe5e86d512dd5ec4cb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 120, 200], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 120, 200], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b5f7f362f5ad5b569ecb7d82e6494e97(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1848e60d49960e74b723e5f73421c99d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 11109, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 11109, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_56e1566c86f681cde1f2f08c29e2357f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 60, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 60, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fa60117ce2008ebdaf0ff637a39e04aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a175d0c0530a3c5162117bbcd513875
-    def get_inputs(self):
-        return [
-            paddle.uniform([6, 9216, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([6, 9216, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([6, 9216, 96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_55a07bccdf4f629b02a8223851564ca8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 8, 8], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 8, 8], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1d28e17ba3d110c98ad3d3fcbc282d5a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 120, 200], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 120, 200], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ee1367c7bf949c3dc1f32605fa8f568c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([100, 152], dtype='float32', min=0, max=0.5),
-            paddle.uniform([100, 152], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4d24e06693772dd9aa359672efd4e391(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([50, 76], dtype='float32', min=0, max=0.5),
-            paddle.uniform([50, 76], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_979426c7c8aa6341f1f78e034608ae3f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([25, 38], dtype='float32', min=0, max=0.5),
-            paddle.uniform([25, 38], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e4a9bfed4497c1a883828138252bdc96(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([13, 19], dtype='float32', min=0, max=0.5),
-            paddle.uniform([13, 19], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d7fb66e666b52b25a9cf3332d74459d0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([7, 10], dtype='float32', min=0, max=0.5),
-            paddle.uniform([7, 10], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_1d4039695f3562fdf95293b9ad4f83a7(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0_0, arg_0_1, arg_0_2, arg_0_3, arg_0_4):
-        input_0 = [arg_0_0, arg_0_1, arg_0_2, arg_0_3, arg_0_4]
-        return input_0
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_aeebba240e2521aa78ec7a295229e9e3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1d4039695f3562fdf95293b9ad4f83a7
-    def get_inputs(self):
-        return [
-            paddle.uniform([15200, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([3800, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([950, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([247, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([70, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cadbf52be64784c09df1a2d074e92f13(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 20, 20], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 20, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4a3d21c9c23d377f912866c3f5c0347a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ae021050230c6fdaa1d738576612010d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 36, 36], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 36, 36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_129481c0f4a5ab099c4bd60676ef6c7e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 20, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 20, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b47fc31c8da2676010f14764861aa462(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_144ad015232a4ec9babf8748384970a2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([32, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_959ccfa6b5df262a29ac321871188c90(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([64, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6e49408cda69bce22d03907e6a4ad98e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([128, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ab6171e1d9ea31c6c02f10ec574dd0dc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 12, 12], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 12, 12], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a51d1c57ef055c27da9ed5f2f70ba499(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 12, 12], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 12, 12], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7afb92e405eb5eb06ec82660d818de6d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 12, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 12, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5ef31bd6ee7d4c1ba6cabdcde218f435(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a175d0c0530a3c5162117bbcd513875
-    def get_inputs(self):
-        return [
-            paddle.uniform([6, 2304, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([6, 2304, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([6, 2304, 192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9028ffbe315a6dbd44c2306d17844906(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 180, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 180, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_82da1905d325888fb5e3e4dfdb46e44b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.4508846402168274, 0.3680139482021332, 0.10928935557603836, 0.2164817601442337]], dtype='float32').reshape([1, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c451a4630aa40476f8c12a2dd8b667f1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c94fdf92a6bffb44756955b6d8df0b87
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([1], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_98781ba9a7b7f08d54d7fb2d716b74e9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.4710065722465515], [0.27305787801742554], [0.1443967968225479], [0.18359437584877014]], dtype='float32').reshape([4, 1]),
-            paddle.to_tensor([[0.3558596074581146], [0.24631327390670776], [0.38240188360214233], [0.43209323287010193]], dtype='float32').reshape([4, 1]),
-            paddle.to_tensor([[0.1317010074853897], [0.1832035928964615], [0.005624867510050535], [0.382903516292572]], dtype='float32').reshape([4, 1]),
-            paddle.to_tensor([[0.407511442899704], [0.41122034192085266], [0.36212438344955444], [0.47452500462532043]], dtype='float32').reshape([4, 1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4f096bff403975ca4837596d00077da3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.11861217021942139], [0.1668710708618164], [0.37650251388549805], [0.3584076464176178]], dtype='float32').reshape([4, 1]),
-            paddle.to_tensor([[0.17836087942123413], [0.34534937143325806], [0.45495909452438354], [0.29443272948265076]], dtype='float32').reshape([4, 1]),
-            paddle.to_tensor([[0.21841885149478912], [0.4341205954551697], [0.17934243381023407], [0.48898959159851074]], dtype='float32').reshape([4, 1]),
-            paddle.to_tensor([[0.2849007844924927], [0.1524905115365982], [0.386353075504303], [0.4171924889087677]], dtype='float32').reshape([4, 1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_514e19c9737cb70487638acb2aece79b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 56, 80], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 56, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ae021050230c6fdaa1d738576612010d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 36, 36], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 36, 36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f3ac1a218a0edb0ea3abdb0a18ad5c3f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a175d0c0530a3c5162117bbcd513875
-    def get_inputs(self):
-        return [
-            paddle.uniform([6, 576, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([6, 576, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([6, 576, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_55a07bccdf4f629b02a8223851564ca8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 8, 8], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 8, 8], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a1653bb51288f203dcf64bee0025669a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.uniform([2084, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2084, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2084, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2084, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a1653bb51288f203dcf64bee0025669a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.uniform([2084, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2084, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2084, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2084, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_31f3771d77b3eb287bde90ee8b122515(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1848e60d49960e74b723e5f73421c99d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4116, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 4116, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cf61bf4af558c4a79a30a62f8b82e16b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 30, 50], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 30, 50], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4233c14a8059d68bd80d489a3d3ae3a6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1848e60d49960e74b723e5f73421c99d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3024, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3024, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b94255054c2a003ede54f61a4dce5267(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_41364762b0d90a75a6eda5186e6f0202
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 196, 4, 16], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 196, 4, 16], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 196, 4, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f4d7fcc96d9d3a873694636b98456990(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([72, 72], dtype='float32', min=0, max=0.5),
-            paddle.uniform([72, 72], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_caaecd4c0edc0e3690ae17e823aa4c76(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([36, 36], dtype='float32', min=0, max=0.5),
-            paddle.uniform([36, 36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_de783c1c948fa237947766dc25da6dce(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([18, 18], dtype='float32', min=0, max=0.5),
-            paddle.uniform([18, 18], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_805263bdb92fe1c58cb0d47d23a100c8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1848e60d49960e74b723e5f73421c99d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 6804, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 6804, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f4d7fcc96d9d3a873694636b98456990(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([72, 72], dtype='float32', min=0, max=0.5),
-            paddle.uniform([72, 72], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_caaecd4c0edc0e3690ae17e823aa4c76(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([36, 36], dtype='float32', min=0, max=0.5),
-            paddle.uniform([36, 36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_de783c1c948fa237947766dc25da6dce(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([18, 18], dtype='float32', min=0, max=0.5),
-            paddle.uniform([18, 18], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0e1194733ca52015955f5b7f5a03be9a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 240, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 240, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_96ca494ba9ac9edbada9de7554cd80d8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_41364762b0d90a75a6eda5186e6f0202
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 16, 12, 16], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 16, 12, 16], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 16, 12, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3fcd0b0eaa8cefc8603c73bd42fe3dfa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 18, 18], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 32, 18, 18], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4b98b19fca2e17973d4f230a12ba61dd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 14, 20], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 9, 14, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b09719fba1c8851eb89c963f8670262b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 48, 48], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 48, 48], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_34a910a17567d3963d1170ffde973225(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.uniform([4260, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4260, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4260, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4260, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_34a910a17567d3963d1170ffde973225(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.uniform([4260, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4260, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4260, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4260, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_70b9d3bbbd752904d5da78c302fc4f5e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1848e60d49960e74b723e5f73421c99d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8400, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 8400, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_144ad015232a4ec9babf8748384970a2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([32, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_959ccfa6b5df262a29ac321871188c90(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([64, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6e49408cda69bce22d03907e6a4ad98e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9928c1d7db2e4cadcefca5f88e7e5150
-    def get_inputs(self):
-        return [
-            paddle.uniform([128, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_776b78908067b4995b9cd9929cdcc259(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.026255913078784943, 0.13178516924381256, 0.3967527747154236, 0.1426066756248474], [0.034072209149599075, 0.32437801361083984, 0.4085710942745209, 0.44272541999816895], [0.29807794094085693, 0.4807213544845581, 0.1041869968175888, 0.05750097706913948], [0.14768928289413452, 0.19507895410060883, 0.13148096203804016, 0.44643715023994446], [0.4279450476169586, 0.1642186939716339, 0.02514742687344551, 0.2158036082983017], [0.4850026071071625, 0.02126377820968628, 0.2537267208099365, 0.3879244029521942], [0.4881133437156677, 0.1497897207736969, 0.39538252353668213, 0.403257817029953]], dtype='float32').reshape([7, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5f2a9a34d9ce095a6d373a978df49d93(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c94fdf92a6bffb44756955b6d8df0b87
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([7], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b884e3c564491df4a94aaf3e933ea9c8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e734ca0b10721d7d688a261329cb981a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.4429657757282257, 0.47139474749565125, 0.27933281660079956, 0.44871142506599426], [0.3590521216392517, 0.3183683753013611, 0.10797044634819031, 0.43915653228759766], [0.1250833421945572, 0.309425413608551, 0.11987120658159256, 0.11405402421951294], [0.2093142420053482, 0.20165832340717316, 0.08155534416437149, 0.024641428142786026], [0.40514639019966125, 0.28172576427459717, 0.3951146602630615, 0.057342011481523514], [0.03951010853052139, 0.14917805790901184, 0.320764422416687, 0.10585435479879379]], dtype='float32').reshape([6, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-            paddle.to_tensor([], dtype='float32').reshape([0, 4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3af90ab907c9af06442c56824c7738ad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c94fdf92a6bffb44756955b6d8df0b87
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([6], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_46bcbd4c4302e9485e730ae9d92c692c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 192, 288], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 192, 288], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_529990e39fbc574e0b8f6e8e56d16b87(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_092a8d62914230a463eeb9d7215936c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 49, 16, 16], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 49, 16, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+if __name__ == "__main__":
+    sys.exit(table.main(__file__))
@@ -1,15357 +1,28 @@
 import os
-os.environ['FLAGS_cinn_new_group_scheduler'] = '1'
-os.environ['FLAGS_group_schedule_tiling_first'] = '1'
-os.environ['FLAGS_enable_pir_api'] = '1'
-os.environ['FLAGS_cinn_bucket_compile'] = '1'
 import sys
-import unittest
-import numpy as np
-from dataclasses import dataclass
-import typing as t
 
-@dataclass
-class Stage:
-    name: str
-    env_vars: t.Dict[str, str]
+import pytest
 
-cinn_stages = [
-    Stage(
-        name="dynamic_to_static",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=False,
-            FLAGS_prim_all=False,
-            FLAGS_prim_enable_dynamic=False,
-        ),
-    ),
-    Stage(
-        name="prim",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=False,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-        ),
-    ),
-    Stage(
-        name="infer_symbolic",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=False,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-            FLAGS_use_cinn=False,
-            FLAGS_check_infer_symbolic=True,
-        ),
-    ),
-	Stage(
-        name="frontend",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=True,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-            FLAGS_use_cinn=True,
-            FLAGS_check_infer_symbolic=False,
-            FLAGS_enable_fusion_fallback=True,
-        ), 
-    ),
-    Stage(
-        name="backend",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=True,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-            FLAGS_use_cinn=True,
-            FLAGS_check_infer_symbolic=False,
-            FLAGS_enable_fusion_fallback=False,
-        ), 
-    ),
-]
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir, os.pardir))
+from tools.e2e_case_stage import CinnStages  # noqa: E402
 
-def GetCinnStageByName(name):
-    for stage in cinn_stages:
-        if stage.name == name:
-            return stage
-    return None
+stages = CinnStages(__file__)
 
-def GetCurrentCinnStage():
-    name = os.getenv('PADDLE_DEBUG_CINN_STAGE_NAME')
-    if name is None:
-        return None
-    stage_names = [stage.name for stage in cinn_stages]
-    assert name in stage_names, (
-        f"PADDLE_DEBUG_CINN_STAGE_NAME should be in {stage_names}"
-    )
-    return GetCinnStageByName(name)
+from tools.e2e_case_table import E2ECaseTable, CinnTestBase  # noqa: E402
 
-def GetPrevCinnStage(stage):
-    for i in range(1, len(cinn_stages)):
-        if stage is cinn_stages[i]:
-            return cinn_stages[i - 1]
-    return None
+stages.apply()
+table = E2ECaseTable(__file__)
+last_stage_failed = stages.last_stage_failed()
 
-def IsCinnStageEnableDiff():
-    value = os.getenv('PADDLE_DEBUG_CINN_STAGE_ENABLE_DIFF')
-    enabled = value in {
-        '1',
-        'true',
-        'True',
-    }
-    if enabled:
-        assert GetCurrentCinnStage() is not None
-    return enabled
 
-last_cinn_stage_exit_code = None
-def LastCINNStageFailed():
-    global last_cinn_stage_exit_code
-    if last_cinn_stage_exit_code is not None:
-        return last_cinn_stage_exit_code != 0
-    last_stage = GetPrevCinnStage(GetCurrentCinnStage())
-    if last_stage is None:
-        return False
-    env_vars = dict(
-        PADDLE_DEBUG_CINN_STAGE_NAME=last_stage.name,
-        PADDLE_DEBUG_CINN_STAGE_ENABLE_DIFF='0',
-    )
-    env_vars_str = " ".join(
-        f"{env_var}={value}"
-        for env_var, value in env_vars.items()
-    )
-    last_cinn_stage_exit_code = os.system(
-        f"{env_vars_str} {sys.executable} {__file__} > /dev/null 2>&1"
-    )
-    return last_cinn_stage_exit_code != 0
+def pytest_generate_tests(metafunc):
+    table.parametrize(metafunc)
 
-def SetDefaultEnv(**env_var2value):
-    for env_var, value in env_var2value.items():
-        if os.getenv(env_var) is None:
-            os.environ[env_var] = str(value)
 
-SetDefaultEnv(
-    PADDLE_DEBUG_CINN_STAGE_NAME="backend",
-    PADDLE_DEBUG_CINN_STAGE_ENABLE_DIFF=False,
-    PADDLE_DEBUG_ENABLE_CINN=True,
-    FLAGS_enable_pir_api=True,
-    FLAGS_prim_all=True,
-    FLAGS_prim_enable_dynamic=True,
-    FLAGS_use_cinn=False,
-    FLAGS_check_infer_symbolic=False,
-    FLAGS_enable_fusion_fallback=False,
-)
+@pytest.mark.skipif(last_stage_failed, reason="last stage failed")
+class TestPrimitiveOp(CinnTestBase):
+    table = table
 
-import paddle
 
-def SetEnvVar(env_var2value):
-    for env_var, value in env_var2value.items():
-        os.environ[env_var] = str(value)
-    paddle.set_flags({
-        env_var:value
-        for env_var, value in env_var2value.items()
-        if env_var.startswith('FLAGS_')
-    })
-
-if GetCurrentCinnStage() is not None:
-    SetEnvVar(GetCurrentCinnStage().env_vars)
-
-def GetEnvVarEnableJit():
-    enable_jit = os.getenv('PADDLE_DEBUG_ENABLE_JIT')
-    return enable_jit not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
-
-def GetEnvVarEnableCinn():
-    enable_cinn = os.getenv('PADDLE_DEBUG_ENABLE_CINN')
-    if enable_cinn is None:
-        return True
-    return enable_cinn not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
-
-
-def GetTolerance(dtype):
-    if dtype == np.float16:
-        return GetFloat16Tolerance()
-    if dtype == np.float32:
-        return GetFloat32Tolerance()
-    return 1e-6
-
-def GetFloat16Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT16_TOL'))
-    except:
-        return 1e-3
-
-def GetFloat32Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT32_TOL'))
-    except:
-        return 1e-6
-
-def IsInteger(dtype):
-    return np.dtype(dtype).char in np.typecodes['AllInteger']
-
-def ApplyToStatic(net, use_cinn):
-    build_strategy = paddle.static.BuildStrategy()
-    build_strategy.build_cinn_pass = use_cinn
-    return paddle.jit.to_static(
-        net,
-        input_spec=net.get_input_spec(),
-        build_strategy=build_strategy,
-        full_graph=True,
-    )
-
-class InstanceTrait:
-
-    @classmethod
-    def instance(cls):
-        if cls.instance_ is None:
-            cls.instance_ = cls()
-        return cls.instance_
-
-    @classmethod
-    def static_instance_with_cinn(cls):
-        if cls.static_instance_with_cinn_ is None:
-            cls.static_instance_with_cinn_ = ApplyToStatic(
-                cls.instance(),
-                use_cinn=True
-            )
-        return cls.static_instance_with_cinn_
-
-    @classmethod
-    def static_instance_without_cinn(cls):
-        if cls.static_instance_without_cinn_ is None:
-            cls.static_instance_without_cinn_ = ApplyToStatic(
-                cls.instance(),
-                use_cinn=False
-            )
-        return cls.static_instance_without_cinn_
-
-
-class CinnTestBase:
-
-    def setUp(self):
-        paddle.seed(2024)
-        self.prepare_data()
-
-    def test_train(self):
-        dy_outs = self.train(use_cinn=False)
-        cinn_outs = self.train(use_cinn=GetEnvVarEnableCinn())
-
-        for cinn_out, dy_out in zip(cinn_outs, dy_outs):
-          if type(cinn_out) is list and type(dy_out) is list:
-            for x, y in zip(cinn_out, dy_out):
-              self.assert_all_close(x, y)
-          else:
-            self.assert_all_close(cinn_out, dy_out)
-
-    def train(self, use_cinn):
-        if GetEnvVarEnableJit():
-            net = self.prepare_static_net(use_cinn)
-        else:
-            net = self.prepare_net()
-        paddle.seed(2024)
-        out = net(*self.inputs)
-        return out
-    
-    def prepare_data(self):
-        self.inputs = self.get_inputs()
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def prepare_net(self):
-        return self.get_test_class().instance()
-
-    def prepare_static_net(self, use_cinn):
-        if use_cinn:
-            return self.get_test_class().static_instance_with_cinn()
-        else:
-            return self.get_test_class().static_instance_without_cinn()
-
-    def assert_all_close(self, x, y):
-        if (hasattr(x, "numpy") and hasattr(y, "numpy")):
-            x_numpy = x.numpy()
-            y_numpy = y.numpy()
-            assert x_numpy.dtype == y_numpy.dtype
-            if IsInteger(x_numpy.dtype):
-                np.testing.assert_equal(x_numpy, y_numpy)
-            else:
-                tol = GetTolerance(x_numpy.dtype)
-                np.testing.assert_allclose(x_numpy, y_numpy, atol=tol, rtol=tol)
-        else:
-            assert x == y
-
-
-
-
-
-last_stage_failed = (IsCinnStageEnableDiff() and LastCINNStageFailed())
-class PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.int64)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[], dtype='int32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-
-class PrimitiveOp_7f6615c5229a7534546d987897e2e10b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.int32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_266df809b494c30b217cad22c49ce736(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7f6615c5229a7534546d987897e2e10b
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([300.0], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_52d07ef3f28f8a30ffb53a7ec69ddb48(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(11, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7ad8f541211f06f17a35c0dfc017aeb6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(43, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bfeabe0363c1b085c0075773bb8d1c93(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(16, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6611a02d3fcfb3e6d952da12429fbad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1b86c402ee45cf52b21d8aa3c0059e12(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(3549, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6611a02d3fcfb3e6d952da12429fbad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-        ]
-
-
-
-class PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_133332b4c3119b5a5bbb6c560c40c15d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[32], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6611a02d3fcfb3e6d952da12429fbad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_133332b4c3119b5a5bbb6c560c40c15d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[32], dtype='int64'),
-        ]
-
-
-
-class PrimitiveOp_6ba9e75e85bd5813f56971726f1f40f8(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 2], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_85875b8b4665e5a3dfe11d8866c152b2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6ba9e75e85bd5813f56971726f1f40f8
-    def get_inputs(self):
-        return [
-            paddle.uniform([32, 32, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f648e68fc972d1365d7c6b9595ec3171(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1024, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_13650f9d7296959ada5b18a19e58449e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[64], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_13650f9d7296959ada5b18a19e58449e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[64], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ea1606fdd5858d71e72d0fb25ea694d5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6ba9e75e85bd5813f56971726f1f40f8
-    def get_inputs(self):
-        return [
-            paddle.uniform([64, 64, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fb12293a9353d872695e9aa75b3788f6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(4096, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d80fd9fb5e3ef5578823f433b141d7ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[128], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d80fd9fb5e3ef5578823f433b141d7ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[128], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f0fcbc92ac903176b5cf27aff42f8454(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6ba9e75e85bd5813f56971726f1f40f8
-    def get_inputs(self):
-        return [
-            paddle.uniform([128, 128, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f4819d164dd4e886677407a7fcb7b765(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(16384, dtype='int32').reshape([]),
-        ]
-
-
-
-class PrimitiveOp_2b17edfc50f520e3f303168fb91dc244(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None], dtype='int32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6ef4ff870c81b2e43a1e98ddc1d833e0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2b17edfc50f520e3f303168fb91dc244
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[4, 28, 28], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8deff480f71c3e840ad1ab2dbf554b65(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7f6615c5229a7534546d987897e2e10b
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([100.0], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5b5363b86281e4f1a18d7c381d088dac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(256, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-
-class PrimitiveOp_00e2797fbe2ef2fac8eedf2ac1a26359(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.int32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None], dtype='bool'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_691f0d3bce9cf0e2ef64b1c590a4435a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_00e2797fbe2ef2fac8eedf2ac1a26359
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 2100], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_691f0d3bce9cf0e2ef64b1c590a4435a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_00e2797fbe2ef2fac8eedf2ac1a26359
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 2100], dtype='int32'), 'bool'),
-        ]
-
-
-
-class PrimitiveOp_edac6074a0f8522f545d23ca717a1482(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.bool)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 2100], dtype='int32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fe291ec5fb057a7ee9d2c083d65ae597(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_edac6074a0f8522f545d23ca717a1482
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 2100], dtype='int32'),
-        ]
-
-
-
-class PrimitiveOp_0b2ec03b1669ac41e4ec1b4e36189116(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.int64)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1], dtype='int32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c80dd0d28717f45b762d03188d8f48a8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0b2ec03b1669ac41e4ec1b4e36189116
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([128], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ddfbccfe80d16db2d30a7507f15b79f4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0b2ec03b1669ac41e4ec1b4e36189116
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([16], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a2e3b974c86ddee449d50e5a23e42555(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0b2ec03b1669ac41e4ec1b4e36189116
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([8], dtype='int32').reshape([1]),
-        ]
-
-
-
-class PrimitiveOp_cf8f6be3788514f2794a298ba8407821(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[96], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cbf0074b8a11c399ade0d5d3f374c584(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cf8f6be3788514f2794a298ba8407821
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[96], dtype='int64'),
-        ]
-
-
-
-class PrimitiveOp_7a90c01ffa7256fdea1553f08da506b4(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[48], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c826679905464530ef113f07ff7a72aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7a90c01ffa7256fdea1553f08da506b4
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[48], dtype='int64'),
-        ]
-
-
-
-class PrimitiveOp_cf36475dc737e98d68c7fe86b9f6ae85(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[24], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_058775927359fed6f83ecf0e4dfdd2d9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cf36475dc737e98d68c7fe86b9f6ae85
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23], dtype='int64').reshape([24]),
-        ]
-
-
-
-class PrimitiveOp_c069ebd6759ad9848ff4359a42913758(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[12096, 2], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_adccb924307f80bf37174445fbaa7489(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c069ebd6759ad9848ff4359a42913758
-    def get_inputs(self):
-        return [
-            paddle.uniform([12096, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_adccb924307f80bf37174445fbaa7489(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c069ebd6759ad9848ff4359a42913758
-    def get_inputs(self):
-        return [
-            paddle.uniform([12096, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7ad8f541211f06f17a35c0dfc017aeb6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(43, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5fca79cd1781a879705ca6a9cb5c9439(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(512, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f648e68fc972d1365d7c6b9595ec3171(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1024, dtype='int32').reshape([]),
-        ]
-
-
-
-class PrimitiveOp_50c7b804da30f9ba7b79d3984ce13590(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None], dtype='bool'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_23f42a96082670844dd9c82a2dd7dbbd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_50c7b804da30f9ba7b79d3984ce13590
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 8732, 1], dtype='int32'), 'bool'),
-        ]
-
-
-
-class PrimitiveOp_b377df355601dae692d7974c45b237c6(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None], dtype='int32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bcf51f8e578add903686757efa71b995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b377df355601dae692d7974c45b237c6
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[256], dtype='int32'),
-        ]
-
-
-
-class PrimitiveOp_9c941da58e044eb566a7a32a0eedb4f1(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.int64)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None], dtype='int32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0a2a7eb3d44db1a52801850635fa2a28(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9c941da58e044eb566a7a32a0eedb4f1
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([2], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f14e5f5e027eecedf7c518b8fe5a3642(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(4, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0eb3ac1bcfd2e86b1a127edb02ba782e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(13, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0eb3ac1bcfd2e86b1a127edb02ba782e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(13, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7ad8f541211f06f17a35c0dfc017aeb6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(43, dtype='int32').reshape([]),
-        ]
-
-
-
-class PrimitiveOp_3fbf9f9a66566327de9078e8f4e8a701(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.int64)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bd61cfc1aff98fe98b02c3fab4bc945e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3fbf9f9a66566327de9078e8f4e8a701
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.3780723512172699, 0.10681550204753876, 0.21278166770935059, 0.23138809204101562, 0.32906362414360046, 0.22839735448360443, 0.13309429585933685, 0.0206376351416111, 0.05156761035323143, 0.46504005789756775, 0.13148869574069977, 0.449235200881958, 0.08905600011348724, 0.015455592423677444, 0.3863491714000702, 0.4747481942176819], dtype='float32').reshape([16]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d3fbb178b68f82066f3ff51a81feaf91(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1], dtype='int64').reshape([16]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ac63116036e33a869b96c7dc307b33cd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0], dtype='int64').reshape([16]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_dcfd53889f0b36684a773fc516f9c10b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(7581, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_31060c9f7d4a4e29a85799de90f5b9dd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(22, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c39b84bcf63cada8ca8a1a6c48bdd865(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(6, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_22590296fba2344c3485304fe9db11f8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(8, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bfeabe0363c1b085c0075773bb8d1c93(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(16, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_72a2893dc60583dd2459980f65067f6b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(4725, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_22590296fba2344c3485304fe9db11f8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(8, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bfeabe0363c1b085c0075773bb8d1c93(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(16, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_767f91e5ec059c95525bd610ee4eec5b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2b17edfc50f520e3f303168fb91dc244
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[3, 28, 28], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_acefc62a87e6fe2b638fd671f9605a86(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(577, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f69e9d036e4eecad5a5607cfc993d8ef(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7ad8f541211f06f17a35c0dfc017aeb6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(43, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bfeabe0363c1b085c0075773bb8d1c93(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(16, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_32a0d8ea25dc3a1627b401c33ef5e912(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([2], dtype='int64').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f14e5f5e027eecedf7c518b8fe5a3642(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(4, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7ad8f541211f06f17a35c0dfc017aeb6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(43, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5b5363b86281e4f1a18d7c381d088dac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(256, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bfeabe0363c1b085c0075773bb8d1c93(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(16, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6611a02d3fcfb3e6d952da12429fbad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d6d146908d3e858b80664fbb32bf1a05(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_00e2797fbe2ef2fac8eedf2ac1a26359
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 3549], dtype='int32'), 'bool'),
-        ]
-
-
-
-class PrimitiveOp_1f4061c336b6699ff4ebf9337c7c1f47(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.bool)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 4], dtype='int32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2cd51b493498503db52f354e4a5bd923(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1f4061c336b6699ff4ebf9337c7c1f47
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 3549, 4], dtype='int32'),
-        ]
-
-
-
-class PrimitiveOp_805195d8be5cb7361392f1ad761000f1(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.int32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 1], dtype='bool'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_63f8eceffd3da622976f4072727c5c3d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_805195d8be5cb7361392f1ad761000f1
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 3549, 1], dtype='int32'), 'bool'),
-        ]
-
-
-
-class PrimitiveOp_ceed749ead402595568cf3aab34bc9fe(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.bool)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 68], dtype='int32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6710394433415133fb267fe167f481f2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ceed749ead402595568cf3aab34bc9fe
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 3549, 68], dtype='int32'),
-        ]
-
-
-
-class PrimitiveOp_77cafb057f19b4e5aa2273f50de29bf9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.int64)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 4], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2b2662abb4709421f3f327bb843be606(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_77cafb057f19b4e5aa2273f50de29bf9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1777, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_089fb029c97cf35de54f3c1950a8016e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 4], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5c61ab9868f3d3cfb05cebd1aa5ad670(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_089fb029c97cf35de54f3c1950a8016e
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1777, 4], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_53315e13144326ac7f8a7ceff16f6dd2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([8], dtype='int64').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d4b1252ac81e9cbad922449e66ee7ab2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(8400, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_52d07ef3f28f8a30ffb53a7ec69ddb48(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(11, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_52d07ef3f28f8a30ffb53a7ec69ddb48(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(11, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bcf51f8e578add903686757efa71b995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b377df355601dae692d7974c45b237c6
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[256], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7ad8f541211f06f17a35c0dfc017aeb6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(43, dtype='int32').reshape([]),
-        ]
-
-
-
-class PrimitiveOp_3cfc2b86e915a6d5f3faef0e2d38aa6e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[64], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_879072b26c83309bb674980a8c82c8f3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3cfc2b86e915a6d5f3faef0e2d38aa6e
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[64], dtype='int64'),
-        ]
-
-
-
-class PrimitiveOp_264660eef03e5dce8798fa2925a104c6(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[32], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e2d6493cba3385bfe374d57450acbfbb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_264660eef03e5dce8798fa2925a104c6
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[32], dtype='int64'),
-        ]
-
-
-
-class PrimitiveOp_7f3e3068b52dc52b8207e97f8c1c9d98(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[16], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_45cbb2a5df0f22dd1b63e0ea907d0754(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7f3e3068b52dc52b8207e97f8c1c9d98
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15], dtype='int64').reshape([16]),
-        ]
-
-
-
-class PrimitiveOp_08a93136d27df60fcbb91bd6d4cb15c2(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[5376, 2], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_86b11373be9744b77ae5a615b82f2dcb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_08a93136d27df60fcbb91bd6d4cb15c2
-    def get_inputs(self):
-        return [
-            paddle.uniform([5376, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_86b11373be9744b77ae5a615b82f2dcb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_08a93136d27df60fcbb91bd6d4cb15c2
-    def get_inputs(self):
-        return [
-            paddle.uniform([5376, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bcf51f8e578add903686757efa71b995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b377df355601dae692d7974c45b237c6
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[256], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7ad8f541211f06f17a35c0dfc017aeb6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(43, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_22590296fba2344c3485304fe9db11f8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(8, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6611a02d3fcfb3e6d952da12429fbad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5fca79cd1781a879705ca6a9cb5c9439(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(512, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f648e68fc972d1365d7c6b9595ec3171(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1024, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1b86c402ee45cf52b21d8aa3c0059e12(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(3549, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-
-class PrimitiveOp_edf307f3b255fdfdc3ebf7e93983f4fb(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e67dfc411c761f22e54a5a3a12ac9850(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_edf307f3b255fdfdc3ebf7e93983f4fb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 128, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_bdd8bef35bb323fed05b1e0cfa82b4cc(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 1, 1], dtype='bool'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c2cf0eb2eae253718cc808f96457f240(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bdd8bef35bb323fed05b1e0cfa82b4cc
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 64, 1, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_26414015ccec278fcd7832860e8132c8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_00e2797fbe2ef2fac8eedf2ac1a26359
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 11109], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b4b00b6c7cc02af78810d1ba61162c4e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1f4061c336b6699ff4ebf9337c7c1f47
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 11109, 4], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d07220e91bcd8cf3d40c24e06f7ba150(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_805195d8be5cb7361392f1ad761000f1
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 11109, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ad24da3640da8a474ddc1a5d11ffefc3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ceed749ead402595568cf3aab34bc9fe
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 11109, 68], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3c83b5d0a03aa1588ee6ee594a805f44(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_77cafb057f19b4e5aa2273f50de29bf9
-    def get_inputs(self):
-        return [
-            paddle.uniform([5480, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_504b21647f9261a4d79574ac3657d6e3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_089fb029c97cf35de54f3c1950a8016e
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[5480, 4], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5fca79cd1781a879705ca6a9cb5c9439(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(512, dtype='int32').reshape([]),
-        ]
-
-
-
-class PrimitiveOp_8f0434c8f9fe1dd85fca1c43d28b586a(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 512, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2d2008a22f86ad6d014737fa98455838(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8f0434c8f9fe1dd85fca1c43d28b586a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7a1a8d5fcde1f910839ddcffc9b5cf71(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bdd8bef35bb323fed05b1e0cfa82b4cc
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 512, 1, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7ad8f541211f06f17a35c0dfc017aeb6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(43, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fc086359045358acdd7cb829ff70c8c0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(10, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_84baef41300e80e9ae5d704e7c9c6fb2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(2, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_423e15003ea8bf70b9d4947922ca5c61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(98, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ae453b1b14b64f13413f82a9284d8131(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(99, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bcf51f8e578add903686757efa71b995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b377df355601dae692d7974c45b237c6
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[256], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bac61d297e5cd2d2a3ea9b37efa4a224(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3fbf9f9a66566327de9078e8f4e8a701
-    def get_inputs(self):
-        return [
-            paddle.uniform([36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_270e8fa185afdbd11ed0c92e77e5a135(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[36], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_270e8fa185afdbd11ed0c92e77e5a135(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[36], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6dc6683ebdfe1f323996a12ea50880bf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(192, dtype='int32').reshape([]),
-        ]
-
-
-
-class PrimitiveOp_c437e4acd90d6981837cdcab1fd7f5e3(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 192, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ed02d5f3218a8e7d8c6a4d001a8388c3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c437e4acd90d6981837cdcab1fd7f5e3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7f37ae93fcbe9a62adc08b662d343c64(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bdd8bef35bb323fed05b1e0cfa82b4cc
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 192, 1, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_52d07ef3f28f8a30ffb53a7ec69ddb48(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(11, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6611a02d3fcfb3e6d952da12429fbad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c39b84bcf63cada8ca8a1a6c48bdd865(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(6, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1574d807fc35f867658115b47557c353(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9c941da58e044eb566a7a32a0eedb4f1
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([7], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bcf51f8e578add903686757efa71b995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b377df355601dae692d7974c45b237c6
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[256], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_31060c9f7d4a4e29a85799de90f5b9dd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(22, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f14e5f5e027eecedf7c518b8fe5a3642(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(4, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c39b84bcf63cada8ca8a1a6c48bdd865(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(6, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5fca79cd1781a879705ca6a9cb5c9439(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(512, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e67dfc411c761f22e54a5a3a12ac9850(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_edf307f3b255fdfdc3ebf7e93983f4fb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 128, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c2cf0eb2eae253718cc808f96457f240(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bdd8bef35bb323fed05b1e0cfa82b4cc
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 64, 1, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c39b84bcf63cada8ca8a1a6c48bdd865(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(6, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fc086359045358acdd7cb829ff70c8c0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(10, dtype='int32').reshape([]),
-        ]
-
-
-
-class PrimitiveOp_d90f9d3ea1353bf1e7a57f7b5e369afd(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None], dtype='bool'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9bfc98dbc1d3693bbb3cbfc7047607ce(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d90f9d3ea1353bf1e7a57f7b5e369afd
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([True, False, False, False, False, True], dtype='bool').reshape([6]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8cfe35cdfe3c53e9ac7a712a51400a68(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d90f9d3ea1353bf1e7a57f7b5e369afd
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([True, False, False, False, False, False], dtype='bool').reshape([6]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d6d146908d3e858b80664fbb32bf1a05(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_00e2797fbe2ef2fac8eedf2ac1a26359
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 3549], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2cd51b493498503db52f354e4a5bd923(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1f4061c336b6699ff4ebf9337c7c1f47
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 3549, 4], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_63f8eceffd3da622976f4072727c5c3d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_805195d8be5cb7361392f1ad761000f1
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 3549, 1], dtype='int32'), 'bool'),
-        ]
-
-
-
-class PrimitiveOp_7e878278e6e2a7065eb696abbd27a294(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.bool)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 76], dtype='int32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5d93f7dd314c3d7be34a976adfac8491(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7e878278e6e2a7065eb696abbd27a294
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 3549, 76], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_df85568d45dfe1ab6368c1a929ecee08(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_77cafb057f19b4e5aa2273f50de29bf9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1742, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6e54877f5ec03b4c6ee1f5a0be373b06(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_089fb029c97cf35de54f3c1950a8016e
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1742, 4], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5b5363b86281e4f1a18d7c381d088dac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(256, dtype='int32').reshape([]),
-        ]
-
-
-
-class PrimitiveOp_1aefc774341009da5b0e5bfcbabf4310(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 256, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c11be941d1282453271ab97b43aed6fc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1aefc774341009da5b0e5bfcbabf4310
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cb1bbd7993daede03db85c91b2e3485e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bdd8bef35bb323fed05b1e0cfa82b4cc
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 256, 1, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5b5363b86281e4f1a18d7c381d088dac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(256, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_81575b5a1fd8812387520d53b83a51c1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1aefc774341009da5b0e5bfcbabf4310
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 256, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cb1bbd7993daede03db85c91b2e3485e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bdd8bef35bb323fed05b1e0cfa82b4cc
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 256, 1, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_31060c9f7d4a4e29a85799de90f5b9dd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(22, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1eb24f8f2728f33e0945d0117dd35853(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(28, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_446065aad997ce0cfe9ebf5017666e70(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(50, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c02c843a46346601ac8411bce73e5e58(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([4], dtype='int64').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2b62ec57691946d435e0ad984482c554(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(4116, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_69df9c1811b42675bacbbdbb373f51ee(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_edf307f3b255fdfdc3ebf7e93983f4fb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_eb65435641e6840c1d256277fbd3e58c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bdd8bef35bb323fed05b1e0cfa82b4cc
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 128, 1, 1], dtype='int32'), 'bool'),
-        ]
-
-
-
-class PrimitiveOp_ac0679e1d52eb8b3e753f91a54f4e006(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[80], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ad87ca21631f9eb78177d8259cb681eb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ac0679e1d52eb8b3e753f91a54f4e006
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[80], dtype='int64'),
-        ]
-
-
-
-class PrimitiveOp_169267e749352bb7567bdf2d6b9528fe(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[40], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c05d6cb652127d870ddb399905c46472(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_169267e749352bb7567bdf2d6b9528fe
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[40], dtype='int64'),
-        ]
-
-
-
-class PrimitiveOp_97c54625af140358fc0f0fb338ae7ba8(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[20], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2da0875403be41fa75121f347c489612(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_97c54625af140358fc0f0fb338ae7ba8
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19], dtype='int64').reshape([20]),
-        ]
-
-
-
-class PrimitiveOp_54384c0baf85f46e7d37766beb4714b9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[8400, 2], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_02a1f759d856cd41b8c66dda1369bf10(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_54384c0baf85f46e7d37766beb4714b9
-    def get_inputs(self):
-        return [
-            paddle.uniform([8400, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_02a1f759d856cd41b8c66dda1369bf10(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_54384c0baf85f46e7d37766beb4714b9
-    def get_inputs(self):
-        return [
-            paddle.uniform([8400, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_563955f6eeadb9bed0cb96b1ec7df0d1(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.int32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[2], dtype='int32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_934544b0498c0006cb33d07b966f3a62(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_563955f6eeadb9bed0cb96b1ec7df0d1
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([128, 128], dtype='int32').reshape([2]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5fca79cd1781a879705ca6a9cb5c9439(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(512, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f648e68fc972d1365d7c6b9595ec3171(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1024, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7ad8f541211f06f17a35c0dfc017aeb6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(43, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9d769bf410e66d626f2c65fb46ef5748(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3fbf9f9a66566327de9078e8f4e8a701
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.16727307438850403, 0.29837217926979065, 0.19894284009933472, 0.48071572184562683, 0.3676881194114685, 0.4198280870914459, 0.17023754119873047, 0.16682079434394836, 0.41211000084877014, 0.27952146530151367, 0.03478027507662773, 0.25146594643592834, 0.3347516655921936, 0.07699854671955109, 0.16147416830062866, 0.18425174057483673, 0.1390560418367386, 0.17906422913074493, 0.1935458481311798, 0.2319454848766327, 0.13256007432937622, 0.057637352496385574, 0.14197881519794464, 0.27830740809440613], dtype='float32').reshape([24]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8a4913a8c2dc1073f76e2f3f263b3742(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1], dtype='int64').reshape([24]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_aa7f20a9b9f0c6277002b85e24830eca(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0], dtype='int64').reshape([24]),
-        ]
-
-
-
-class PrimitiveOp_41dc28ce30e245c4be63ccbe573faabd(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float64)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b232f327a64877577d5f8e8e9737ea3e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_41dc28ce30e245c4be63ccbe573faabd
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.6781011819839478], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6611a02d3fcfb3e6d952da12429fbad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_133332b4c3119b5a5bbb6c560c40c15d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[32], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6611a02d3fcfb3e6d952da12429fbad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_133332b4c3119b5a5bbb6c560c40c15d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[32], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_85875b8b4665e5a3dfe11d8866c152b2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6ba9e75e85bd5813f56971726f1f40f8
-    def get_inputs(self):
-        return [
-            paddle.uniform([32, 32, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f648e68fc972d1365d7c6b9595ec3171(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1024, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_13650f9d7296959ada5b18a19e58449e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[64], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_13650f9d7296959ada5b18a19e58449e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[64], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ea1606fdd5858d71e72d0fb25ea694d5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6ba9e75e85bd5813f56971726f1f40f8
-    def get_inputs(self):
-        return [
-            paddle.uniform([64, 64, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fb12293a9353d872695e9aa75b3788f6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(4096, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d80fd9fb5e3ef5578823f433b141d7ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[128], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d80fd9fb5e3ef5578823f433b141d7ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[128], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f0fcbc92ac903176b5cf27aff42f8454(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6ba9e75e85bd5813f56971726f1f40f8
-    def get_inputs(self):
-        return [
-            paddle.uniform([128, 128, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f4819d164dd4e886677407a7fcb7b765(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(16384, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3bc3bba123b2d054968dad96ae2a9796(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(6069, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0ed8b16c1d1ea483cd9566882b4dcd7d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_00e2797fbe2ef2fac8eedf2ac1a26359
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 3024], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_554a743aae417bb2834fc467ae6f1a3e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1f4061c336b6699ff4ebf9337c7c1f47
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 3024, 4], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e9c6a1cb1c86cf0871093bc9ec864083(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_805195d8be5cb7361392f1ad761000f1
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 3024, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b5324e834e2f886eaeabed18ff376459(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ceed749ead402595568cf3aab34bc9fe
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 3024, 68], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7fe1094fae8dc7df8a960cea007bdff2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_77cafb057f19b4e5aa2273f50de29bf9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1527, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a70851e97fbe311ddb49dd938689e759(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_089fb029c97cf35de54f3c1950a8016e
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1527, 4], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d6d146908d3e858b80664fbb32bf1a05(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_00e2797fbe2ef2fac8eedf2ac1a26359
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 3549], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d6d146908d3e858b80664fbb32bf1a05(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_00e2797fbe2ef2fac8eedf2ac1a26359
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 3549], dtype='int32'), 'bool'),
-        ]
-
-
-
-class PrimitiveOp_8ab993b8693c8167cedfc04cf6713533(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.bool)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 3549], dtype='int32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_460a40d8aaf0f3a612444ba2995647be(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8ab993b8693c8167cedfc04cf6713533
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 3549], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1781a72dc305a69fc530ebdc2cfa8b62(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_563955f6eeadb9bed0cb96b1ec7df0d1
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([8, 2], dtype='int32').reshape([2]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_52d07ef3f28f8a30ffb53a7ec69ddb48(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(11, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5fca79cd1781a879705ca6a9cb5c9439(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(512, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f14e5f5e027eecedf7c518b8fe5a3642(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(4, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bfeabe0363c1b085c0075773bb8d1c93(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(16, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e9505ce7f70f3c23c8eafbd05ce44305(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3fbf9f9a66566327de9078e8f4e8a701
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.09576865285634995, 0.21895988285541534, 0.47236356139183044, 0.28012216091156006], dtype='float32').reshape([4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c4495f64bc4934c3212c40db4f2883c3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([1, 1, 1, 1], dtype='int64').reshape([4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_97bf5f464bc62f9f266f4b7041dbe358(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0, 0, 0, 0], dtype='int64').reshape([4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_22590296fba2344c3485304fe9db11f8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(8, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bb7615e0279392def6b82b610ccc2cf5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(52, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b03328c5fc33f4f2b16dce27dc4a5f81(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(202, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bcf51f8e578add903686757efa71b995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b377df355601dae692d7974c45b237c6
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[256], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bcf51f8e578add903686757efa71b995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b377df355601dae692d7974c45b237c6
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[256], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_42cb6565d7e34784f6524ea7c22bffb4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1025, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bcf51f8e578add903686757efa71b995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b377df355601dae692d7974c45b237c6
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[256], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_52d07ef3f28f8a30ffb53a7ec69ddb48(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(11, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bfeabe0363c1b085c0075773bb8d1c93(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(16, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-
-class PrimitiveOp_7a1b58333cf44dc08e55b11b27d0568a(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[14], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_26436bc502563496e7beb04f62194b6b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7a1b58333cf44dc08e55b11b27d0568a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13], dtype='int64').reshape([14]),
-        ]
-
-
-
-class PrimitiveOp_4350783c680e34322727db0154d818e5(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[14, 14, 4], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d9e6dc345d6a9a75ee57940cff63205a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4350783c680e34322727db0154d818e5
-    def get_inputs(self):
-        return [
-            paddle.uniform([14, 14, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_515720589b296e92f354eb37a581baae(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[14, 14, 2], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9c078fa5a55ae36b892963498e998675(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_515720589b296e92f354eb37a581baae
-    def get_inputs(self):
-        return [
-            paddle.uniform([14, 14, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_b0ae5bd3bb6136ca4623e78983062f2d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[28], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0821153690ace9a6c2d050f6dd7f74cc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b0ae5bd3bb6136ca4623e78983062f2d
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27], dtype='int64').reshape([28]),
-        ]
-
-
-
-class PrimitiveOp_150b4e0d4101a6bb2b2bac77667b7918(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[28, 28, 4], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e4f22cfc678ddeb05681c0b98c5cab3d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_150b4e0d4101a6bb2b2bac77667b7918
-    def get_inputs(self):
-        return [
-            paddle.uniform([28, 28, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_c221305b1e399158fe7597395def1856(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[28, 28, 2], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_26b5047f95099383e13ae3e08cc58c9e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c221305b1e399158fe7597395def1856
-    def get_inputs(self):
-        return [
-            paddle.uniform([28, 28, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_718ea1c11a0170ccaefd871fa2fa1746(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[56], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7a7382107b227a1a3f969320f818507e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_718ea1c11a0170ccaefd871fa2fa1746
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[56], dtype='int64'),
-        ]
-
-
-
-class PrimitiveOp_411bd163232ef6563f6755e160f1991b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[56, 56, 4], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f4d108cd7b0c6e426106450d3344e554(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_411bd163232ef6563f6755e160f1991b
-    def get_inputs(self):
-        return [
-            paddle.uniform([56, 56, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_379cde6840a389f395e3636c78ba0ca7(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[56, 56, 2], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2b33a21972938260fb5e21219d2a9abc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_379cde6840a389f395e3636c78ba0ca7
-    def get_inputs(self):
-        return [
-            paddle.uniform([56, 56, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f14e5f5e027eecedf7c518b8fe5a3642(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(4, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bfeabe0363c1b085c0075773bb8d1c93(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(16, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5fca79cd1781a879705ca6a9cb5c9439(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(512, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6611a02d3fcfb3e6d952da12429fbad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7ad8f541211f06f17a35c0dfc017aeb6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(43, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0eb3ac1bcfd2e86b1a127edb02ba782e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(13, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0eb3ac1bcfd2e86b1a127edb02ba782e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(13, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5fca79cd1781a879705ca6a9cb5c9439(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(512, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3c6f3a3db5ea7558a6bbd69cb8dc32d4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(104, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3c6f3a3db5ea7558a6bbd69cb8dc32d4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(104, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0e11c850f1a4a15b674f9d1e887c6f16(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_00e2797fbe2ef2fac8eedf2ac1a26359
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 4116], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0e11c850f1a4a15b674f9d1e887c6f16(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_00e2797fbe2ef2fac8eedf2ac1a26359
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 4116], dtype='int32'), 'bool'),
-        ]
-
-
-
-class PrimitiveOp_d58f6fd5ce9789fc7d9a570c68c7999d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.bool)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 4116], dtype='int32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8776781b06be86f5f5e8ce791799af0a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d58f6fd5ce9789fc7d9a570c68c7999d
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 4116], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6611a02d3fcfb3e6d952da12429fbad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-
-class PrimitiveOp_15eeb991b05d6e4820291506fd85de8c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_797837c384067968c17e0618b73c355e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_15eeb991b05d6e4820291506fd85de8c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(4, dtype='int64').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_653aee2827c14da1581fd6e82c30cd66(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_15eeb991b05d6e4820291506fd85de8c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(7, dtype='int64').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f648e68fc972d1365d7c6b9595ec3171(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1024, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bcf51f8e578add903686757efa71b995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b377df355601dae692d7974c45b237c6
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[256], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bfeabe0363c1b085c0075773bb8d1c93(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(16, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6611a02d3fcfb3e6d952da12429fbad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bfeabe0363c1b085c0075773bb8d1c93(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(16, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6611a02d3fcfb3e6d952da12429fbad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5b5363b86281e4f1a18d7c381d088dac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(256, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bcf51f8e578add903686757efa71b995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b377df355601dae692d7974c45b237c6
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[256], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5fca79cd1781a879705ca6a9cb5c9439(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(512, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_266df809b494c30b217cad22c49ce736(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7f6615c5229a7534546d987897e2e10b
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([300.0], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7b69d0fa1a2d45d864e4134483cbdb21(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([7], dtype='int64').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c02c843a46346601ac8411bce73e5e58(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([4], dtype='int64').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0e11c850f1a4a15b674f9d1e887c6f16(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_00e2797fbe2ef2fac8eedf2ac1a26359
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 4116], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_285e53e304b0114c646a16d58e83a320(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1f4061c336b6699ff4ebf9337c7c1f47
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 4116, 4], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6d65d970b8d7305ed2b1263d83839ad5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_805195d8be5cb7361392f1ad761000f1
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 4116, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ec4387ad7094190df1503565dd979e66(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ceed749ead402595568cf3aab34bc9fe
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 4116, 68], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bdf341554a28506d596f9c1a3c909717(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_77cafb057f19b4e5aa2273f50de29bf9
-    def get_inputs(self):
-        return [
-            paddle.uniform([2066, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6e00b1ee2cec067b2856212ac1125029(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_089fb029c97cf35de54f3c1950a8016e
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[2066, 4], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_22590296fba2344c3485304fe9db11f8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(8, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bfeabe0363c1b085c0075773bb8d1c93(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(16, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6611a02d3fcfb3e6d952da12429fbad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_52d07ef3f28f8a30ffb53a7ec69ddb48(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(11, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f14e5f5e027eecedf7c518b8fe5a3642(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(4, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bcf51f8e578add903686757efa71b995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b377df355601dae692d7974c45b237c6
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[256], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_42be2b35a08259894437c5acf5b55a8f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(14, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8ec1676e537048b23eb360867766b50e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(25, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f14e5f5e027eecedf7c518b8fe5a3642(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(4, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f14e5f5e027eecedf7c518b8fe5a3642(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(4, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bfeabe0363c1b085c0075773bb8d1c93(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(16, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_52d07ef3f28f8a30ffb53a7ec69ddb48(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(11, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7eba2122378dc5e373bcdd2644c6b5f5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_00e2797fbe2ef2fac8eedf2ac1a26359
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 9261], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_21bf72110b879c595273996310ba7673(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1f4061c336b6699ff4ebf9337c7c1f47
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 9261, 4], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6c4a4eba20005c55f41f13b359885e99(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_805195d8be5cb7361392f1ad761000f1
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 9261, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a5b5826415f0295234a596765b439a78(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ceed749ead402595568cf3aab34bc9fe
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 9261, 68], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_548f16ded38eed2c4cf10c21215b51ad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_77cafb057f19b4e5aa2273f50de29bf9
-    def get_inputs(self):
-        return [
-            paddle.uniform([4586, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e2362970cb649786fff1d28a0d2ea346(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_089fb029c97cf35de54f3c1950a8016e
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[4586, 4], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_02045f2af8a17cc45c234c4cb8482f2a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2b17edfc50f520e3f303168fb91dc244
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[6, 28, 28], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6f4c13d9db67d0c15cff6e8793ad18de(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_50c7b804da30f9ba7b79d3984ce13590
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 2434, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_691f0d3bce9cf0e2ef64b1c590a4435a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_00e2797fbe2ef2fac8eedf2ac1a26359
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 2100], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6386b5d173a2162f95676ab49e30a36a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1f4061c336b6699ff4ebf9337c7c1f47
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 2100, 4], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a1f3fc8a74b4e8936742bb0d22ccf1b6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_805195d8be5cb7361392f1ad761000f1
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 2100, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_51db5ee59197ccfdc8dd0f449ac52c26(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ceed749ead402595568cf3aab34bc9fe
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 2100, 68], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7a618c963ce9053e62befdf94723fcae(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_77cafb057f19b4e5aa2273f50de29bf9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1073, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_115411fd310aeb09261ff3c0386ce07c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_089fb029c97cf35de54f3c1950a8016e
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1073, 4], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5b5363b86281e4f1a18d7c381d088dac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(256, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bfeabe0363c1b085c0075773bb8d1c93(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(16, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bcf51f8e578add903686757efa71b995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b377df355601dae692d7974c45b237c6
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[256], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_72a33ba16ed7516a083269c12bbe6581(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(9261, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fc086359045358acdd7cb829ff70c8c0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(10, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f14e5f5e027eecedf7c518b8fe5a3642(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(4, dtype='int32').reshape([]),
-        ]
-
-
-
-class PrimitiveOp_fe9bb54b71bb986b24bf8621a1372d62(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[68], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2d0a8179eac114fb63b3f1bdaa3e9bc6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fe9bb54b71bb986b24bf8621a1372d62
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[68], dtype='int64'),
-        ]
-
-
-
-class PrimitiveOp_e91b5ddfcefdbf64bfb8836a6e294664(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[34], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2b591b575efdabc3ff553601a5857944(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e91b5ddfcefdbf64bfb8836a6e294664
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[34], dtype='int64'),
-        ]
-
-
-
-class PrimitiveOp_46cbf3c94b072481e7a6e77196efd132(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[17], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9b987db2fc3706675a22701bf6276071(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_46cbf3c94b072481e7a6e77196efd132
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16], dtype='int64').reshape([17]),
-        ]
-
-
-
-class PrimitiveOp_43b4de9cbd33ef8848c346c7e4fdebfc(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[6069, 2], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3e560629631f470f14369d849477b20b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_43b4de9cbd33ef8848c346c7e4fdebfc
-    def get_inputs(self):
-        return [
-            paddle.uniform([6069, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3e560629631f470f14369d849477b20b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_43b4de9cbd33ef8848c346c7e4fdebfc
-    def get_inputs(self):
-        return [
-            paddle.uniform([6069, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5fca79cd1781a879705ca6a9cb5c9439(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(512, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2d2008a22f86ad6d014737fa98455838(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8f0434c8f9fe1dd85fca1c43d28b586a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7a1a8d5fcde1f910839ddcffc9b5cf71(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bdd8bef35bb323fed05b1e0cfa82b4cc
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 512, 1, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5fca79cd1781a879705ca6a9cb5c9439(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(512, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2d2008a22f86ad6d014737fa98455838(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8f0434c8f9fe1dd85fca1c43d28b586a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7a1a8d5fcde1f910839ddcffc9b5cf71(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bdd8bef35bb323fed05b1e0cfa82b4cc
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 512, 1, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5fca79cd1781a879705ca6a9cb5c9439(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(512, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2d2008a22f86ad6d014737fa98455838(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8f0434c8f9fe1dd85fca1c43d28b586a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7a1a8d5fcde1f910839ddcffc9b5cf71(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bdd8bef35bb323fed05b1e0cfa82b4cc
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 512, 1, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_25bd671770e98851cec886e11081b15b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(2048, dtype='int32').reshape([]),
-        ]
-
-
-
-class PrimitiveOp_bd2a3060888aa007387aa4bd6a83c4e9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 2048, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_22824b276361efbc819985d392e9d1ca(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bd2a3060888aa007387aa4bd6a83c4e9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2048, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bc881dee6c2121e6059caf899ac75df2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bdd8bef35bb323fed05b1e0cfa82b4cc
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 2048, 1, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_52d07ef3f28f8a30ffb53a7ec69ddb48(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(11, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d80fd9fb5e3ef5578823f433b141d7ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[128], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d80fd9fb5e3ef5578823f433b141d7ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[128], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f0fcbc92ac903176b5cf27aff42f8454(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6ba9e75e85bd5813f56971726f1f40f8
-    def get_inputs(self):
-        return [
-            paddle.uniform([128, 128, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f4819d164dd4e886677407a7fcb7b765(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(16384, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_13650f9d7296959ada5b18a19e58449e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[64], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_13650f9d7296959ada5b18a19e58449e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[64], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ea1606fdd5858d71e72d0fb25ea694d5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6ba9e75e85bd5813f56971726f1f40f8
-    def get_inputs(self):
-        return [
-            paddle.uniform([64, 64, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fb12293a9353d872695e9aa75b3788f6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(4096, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6611a02d3fcfb3e6d952da12429fbad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_133332b4c3119b5a5bbb6c560c40c15d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[32], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6611a02d3fcfb3e6d952da12429fbad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_133332b4c3119b5a5bbb6c560c40c15d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[32], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_85875b8b4665e5a3dfe11d8866c152b2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6ba9e75e85bd5813f56971726f1f40f8
-    def get_inputs(self):
-        return [
-            paddle.uniform([32, 32, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f648e68fc972d1365d7c6b9595ec3171(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1024, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bfeabe0363c1b085c0075773bb8d1c93(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(16, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fc1521072614be32d36926bc84af5d33(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15], dtype='int64').reshape([16]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bfeabe0363c1b085c0075773bb8d1c93(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(16, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fc1521072614be32d36926bc84af5d33(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15], dtype='int64').reshape([16]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8903111dafed066e92e74e00ba1f6f15(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6ba9e75e85bd5813f56971726f1f40f8
-    def get_inputs(self):
-        return [
-            paddle.uniform([16, 16, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5b5363b86281e4f1a18d7c381d088dac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(256, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_22590296fba2344c3485304fe9db11f8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(8, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_23632fc1b44a03a2e57495994e27c1c1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0, 1, 2, 3, 4, 5, 6, 7], dtype='int64').reshape([8]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_22590296fba2344c3485304fe9db11f8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(8, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_23632fc1b44a03a2e57495994e27c1c1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0, 1, 2, 3, 4, 5, 6, 7], dtype='int64').reshape([8]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a3517f3ae8d7947c2db8979291e3a1f4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6ba9e75e85bd5813f56971726f1f40f8
-    def get_inputs(self):
-        return [
-            paddle.uniform([8, 8, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6611a02d3fcfb3e6d952da12429fbad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_87110a98c87b0ac359d9998d868b22b3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(2100, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5fca79cd1781a879705ca6a9cb5c9439(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(512, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5b503e847bc1ff8a6b93e602b7113ec4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8f0434c8f9fe1dd85fca1c43d28b586a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7a1a8d5fcde1f910839ddcffc9b5cf71(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bdd8bef35bb323fed05b1e0cfa82b4cc
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 512, 1, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5fca79cd1781a879705ca6a9cb5c9439(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(512, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5b503e847bc1ff8a6b93e602b7113ec4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8f0434c8f9fe1dd85fca1c43d28b586a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7a1a8d5fcde1f910839ddcffc9b5cf71(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bdd8bef35bb323fed05b1e0cfa82b4cc
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 512, 1, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5fca79cd1781a879705ca6a9cb5c9439(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(512, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5b503e847bc1ff8a6b93e602b7113ec4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8f0434c8f9fe1dd85fca1c43d28b586a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7a1a8d5fcde1f910839ddcffc9b5cf71(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bdd8bef35bb323fed05b1e0cfa82b4cc
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 512, 1, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_25bd671770e98851cec886e11081b15b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(2048, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_14b0552a16aef61ebbe77acce5c31975(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bd2a3060888aa007387aa4bd6a83c4e9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2048, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bc881dee6c2121e6059caf899ac75df2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bdd8bef35bb323fed05b1e0cfa82b4cc
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 2048, 1, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_52d07ef3f28f8a30ffb53a7ec69ddb48(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(11, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7ad8f541211f06f17a35c0dfc017aeb6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(43, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_42cb6565d7e34784f6524ea7c22bffb4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1025, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8627a5fb9dd1bc82f04b09b09ccf1afe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_00e2797fbe2ef2fac8eedf2ac1a26359
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 4725], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_56459b28972ad1f00eb43399608998af(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1f4061c336b6699ff4ebf9337c7c1f47
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 4725, 4], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e94b0130362f6ff8539415b0b7a0deb1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_805195d8be5cb7361392f1ad761000f1
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 4725, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2ea32729d7c8d7a53c3c90d2caf1ffb7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ceed749ead402595568cf3aab34bc9fe
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 4725, 68], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2cc71ba9b8d5145f1082521b043b726b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_77cafb057f19b4e5aa2273f50de29bf9
-    def get_inputs(self):
-        return [
-            paddle.uniform([2383, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_eb68e3f44004704a06e85b088bded8c5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_089fb029c97cf35de54f3c1950a8016e
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[2383, 4], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_31060c9f7d4a4e29a85799de90f5b9dd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(22, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ae23c767130b4e6ab108b86a4a791076(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_00e2797fbe2ef2fac8eedf2ac1a26359
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 6069], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_19916e95dd6c0da254d6119b13b7cf67(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1f4061c336b6699ff4ebf9337c7c1f47
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 6069, 4], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_305eb0e56f8cd89561cc459207bba603(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_805195d8be5cb7361392f1ad761000f1
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 6069, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_40e49073471e191167e1145e424224da(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ceed749ead402595568cf3aab34bc9fe
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 6069, 68], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2f203e4b9fdd7415d16274a40eedf244(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_77cafb057f19b4e5aa2273f50de29bf9
-    def get_inputs(self):
-        return [
-            paddle.uniform([3030, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5dbbfe8e564530f295fd92b3893150b6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_089fb029c97cf35de54f3c1950a8016e
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[3030, 4], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9bb9cf1228fbf06cd00edbc08299059e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_00e2797fbe2ef2fac8eedf2ac1a26359
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 7581], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_92b647ded681ca3efb911ac66dfba808(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1f4061c336b6699ff4ebf9337c7c1f47
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 7581, 4], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fc2ec61a83af2a947bdd260006a8bc8c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_805195d8be5cb7361392f1ad761000f1
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 7581, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1d77de8a5af9257902c4b013b21db273(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ceed749ead402595568cf3aab34bc9fe
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 7581, 68], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cc737df7f1b68fc7ae08384561e23d38(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_77cafb057f19b4e5aa2273f50de29bf9
-    def get_inputs(self):
-        return [
-            paddle.uniform([3787, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5e8a37886abc7159e68b33e94909313b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_089fb029c97cf35de54f3c1950a8016e
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[3787, 4], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_52d07ef3f28f8a30ffb53a7ec69ddb48(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(11, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_52d07ef3f28f8a30ffb53a7ec69ddb48(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(11, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8deff480f71c3e840ad1ab2dbf554b65(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7f6615c5229a7534546d987897e2e10b
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([100.0], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f648e68fc972d1365d7c6b9595ec3171(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1024, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a3cec10c1907c73f5d2222dd2278b627(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(11109, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c95e648d8c727f6a21cb88d499d62139(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([3], dtype='int64').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6611a02d3fcfb3e6d952da12429fbad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7ad8f541211f06f17a35c0dfc017aeb6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(43, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_52d07ef3f28f8a30ffb53a7ec69ddb48(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(11, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f490e105dea430853d7a17e6cc13fcb4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2b17edfc50f520e3f303168fb91dc244
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[2, 28, 28], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0e190e1bf633ad03ff1510fee7aa04f8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0b2ec03b1669ac41e4ec1b4e36189116
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([4], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_386f02d95d207716963a1f4c4d25879b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0b2ec03b1669ac41e4ec1b4e36189116
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([11], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_20990d175b51a6ea7f519876a6e2fe3b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0b2ec03b1669ac41e4ec1b4e36189116
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([384], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1cf6034bb2c99c70a875d096234ae7ac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0b2ec03b1669ac41e4ec1b4e36189116
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([28], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_00f4b5a46811f940a97642b4d0518ef8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0b2ec03b1669ac41e4ec1b4e36189116
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([77], dtype='int32').reshape([1]),
-        ]
-
-
-
-class PrimitiveOp_77ca43ced5a20071dbfce8e02dab0251(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[152], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_48a1946a70f5a10ce9359502b8269159(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_77ca43ced5a20071dbfce8e02dab0251
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[152], dtype='int64'),
-        ]
-
-
-
-class PrimitiveOp_20c3c636df3d76ba93eab2caf9031420(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[100], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f672ce611c4dd53335a525b221d631f5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_20c3c636df3d76ba93eab2caf9031420
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[100], dtype='int64'),
-        ]
-
-
-
-class PrimitiveOp_fcd420449a97775672fce0c5642ff71c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[100, 152, 4], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_06e300dc9bef950698ace4232eefc078(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fcd420449a97775672fce0c5642ff71c
-    def get_inputs(self):
-        return [
-            paddle.uniform([100, 152, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_600e2c94799d3a962d9fefaeda5af886(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[100, 152, 2], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_256d6c8fa776723ec53f55c0cfb10afd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_600e2c94799d3a962d9fefaeda5af886
-    def get_inputs(self):
-        return [
-            paddle.uniform([100, 152, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_f7dcf940d5008a855912861e1a9821f1(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[76], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c43259b42b938adb4e7332b72268a28b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f7dcf940d5008a855912861e1a9821f1
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[76], dtype='int64'),
-        ]
-
-
-
-class PrimitiveOp_f81d1cc582329a12557202faa25c464c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[50], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5de41d777f123643956686b631aefa42(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f81d1cc582329a12557202faa25c464c
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[50], dtype='int64'),
-        ]
-
-
-
-class PrimitiveOp_02e6327cfc577e0654219e861167dd19(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[50, 76, 4], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3fa60e5c5bdfe288cfbc312e1f16d0c2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_02e6327cfc577e0654219e861167dd19
-    def get_inputs(self):
-        return [
-            paddle.uniform([50, 76, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_fbbac6d94e4c2f7b4b067b815135c6cd(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[50, 76, 2], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e08822e2be4ea962c0fe1b8db17dff0d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fbbac6d94e4c2f7b4b067b815135c6cd
-    def get_inputs(self):
-        return [
-            paddle.uniform([50, 76, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_abc9f9ece8053cb9e81f22d32de04041(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[38], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_165acc6cc6a087b7635561d3dcddc120(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_abc9f9ece8053cb9e81f22d32de04041
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[38], dtype='int64'),
-        ]
-
-
-
-class PrimitiveOp_7b23ee58e6e5d9c099a91cac73c58505(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[25], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3723425d79eac67beabd25e1731e77ef(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b23ee58e6e5d9c099a91cac73c58505
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24], dtype='int64').reshape([25]),
-        ]
-
-
-
-class PrimitiveOp_0ef2aeba0b03500904e1b057e7a975b4(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[25, 38, 4], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c23329d3e4295f6c576834b1ceb0414d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ef2aeba0b03500904e1b057e7a975b4
-    def get_inputs(self):
-        return [
-            paddle.uniform([25, 38, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_f0c194e4b35e8b6082d1208e10e2ad58(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[25, 38, 2], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b839d8344186d1bc0a09d9560da83136(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f0c194e4b35e8b6082d1208e10e2ad58
-    def get_inputs(self):
-        return [
-            paddle.uniform([25, 38, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_e8d70da6b61bd27853540e7bc933f026(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[19], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1230cdaaf3a5c22aed4207e1f48cce3f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e8d70da6b61bd27853540e7bc933f026
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18], dtype='int64').reshape([19]),
-        ]
-
-
-
-class PrimitiveOp_2d05e8518aff0433df1593b429834d1e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[13], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_84383c715c06bf5ff735c9fb27b67012(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2d05e8518aff0433df1593b429834d1e
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12], dtype='int64').reshape([13]),
-        ]
-
-
-
-class PrimitiveOp_b556f3bab68dd4813eb84806769f3307(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[13, 19, 4], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c77036b5096aa4b18bc8058c77b28502(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b556f3bab68dd4813eb84806769f3307
-    def get_inputs(self):
-        return [
-            paddle.uniform([13, 19, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_c0b5c6e12f73381d8028ce9b75d973a9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[13, 19, 2], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_316226909d0877f498c3c8a288290eb2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c0b5c6e12f73381d8028ce9b75d973a9
-    def get_inputs(self):
-        return [
-            paddle.uniform([13, 19, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_8aaec25a5c1d826c9e668eac8c9f5b3b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[10], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4a5dfc00bc3ad56ac4df860d0d7a2290(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8aaec25a5c1d826c9e668eac8c9f5b3b
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0, 1, 2, 3, 4, 5, 6, 7, 8, 9], dtype='int64').reshape([10]),
-        ]
-
-
-
-class PrimitiveOp_b4ead91e308e14cd64f98010e3120a46(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[7], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_06d9758ea5504efdffeb455626fec6ca(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b4ead91e308e14cd64f98010e3120a46
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0, 1, 2, 3, 4, 5, 6], dtype='int64').reshape([7]),
-        ]
-
-
-
-class PrimitiveOp_f5d79147bbe930b476b462cb3de4ad30(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[7, 10, 4], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8e439f06d14a90342e99436bfd80e518(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f5d79147bbe930b476b462cb3de4ad30
-    def get_inputs(self):
-        return [
-            paddle.uniform([7, 10, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_088f05b48c67f96129dfb0be636b846f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[7, 10, 2], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8d9e3f27e0488787a8b81d4ea308fdde(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_088f05b48c67f96129dfb0be636b846f
-    def get_inputs(self):
-        return [
-            paddle.uniform([7, 10, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-
-class PrimitiveOp_5fe97bcc1071b436eb17589feae48aff(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 128, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_eb8e29fae163a024abced0579e114f05(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5fe97bcc1071b436eb17589feae48aff
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_eb65435641e6840c1d256277fbd3e58c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bdd8bef35bb323fed05b1e0cfa82b4cc
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 128, 1, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5b5363b86281e4f1a18d7c381d088dac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(256, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_55ea9c421b2c9eccfbdc944bb691e721(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1aefc774341009da5b0e5bfcbabf4310
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cb1bbd7993daede03db85c91b2e3485e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bdd8bef35bb323fed05b1e0cfa82b4cc
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 256, 1, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c39b84bcf63cada8ca8a1a6c48bdd865(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(6, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_de95beac2c031bcb98bd30f0fa591198(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3fbf9f9a66566327de9078e8f4e8a701
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.4473949074745178, 0.08388441801071167, 0.17490623891353607, 0.2467467337846756, 0.14741015434265137, 0.14820529520511627, 0.4406585693359375, 0.37450501322746277, 0.04052567854523659, 0.48126161098480225, 0.4376707375049591, 0.2969852685928345, 0.2029794454574585, 0.15935193002223969, 0.2048863172531128, 0.25172749161720276, 0.38391077518463135, 0.35427677631378174, 0.34242749214172363, 0.49203726649284363], dtype='float32').reshape([20]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9f15af7f9cd9a4028a8dc4fc93a9702e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1], dtype='int64').reshape([20]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0664c06661216637b4081b1b759a9021(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0], dtype='int64').reshape([20]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6611a02d3fcfb3e6d952da12429fbad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6611a02d3fcfb3e6d952da12429fbad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5b5363b86281e4f1a18d7c381d088dac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(256, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6611a02d3fcfb3e6d952da12429fbad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6611a02d3fcfb3e6d952da12429fbad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_133332b4c3119b5a5bbb6c560c40c15d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[32], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6611a02d3fcfb3e6d952da12429fbad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_133332b4c3119b5a5bbb6c560c40c15d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[32], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_85875b8b4665e5a3dfe11d8866c152b2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6ba9e75e85bd5813f56971726f1f40f8
-    def get_inputs(self):
-        return [
-            paddle.uniform([32, 32, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f648e68fc972d1365d7c6b9595ec3171(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1024, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_13650f9d7296959ada5b18a19e58449e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[64], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_13650f9d7296959ada5b18a19e58449e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[64], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ea1606fdd5858d71e72d0fb25ea694d5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6ba9e75e85bd5813f56971726f1f40f8
-    def get_inputs(self):
-        return [
-            paddle.uniform([64, 64, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fb12293a9353d872695e9aa75b3788f6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(4096, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d80fd9fb5e3ef5578823f433b141d7ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[128], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d80fd9fb5e3ef5578823f433b141d7ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[128], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f0fcbc92ac903176b5cf27aff42f8454(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6ba9e75e85bd5813f56971726f1f40f8
-    def get_inputs(self):
-        return [
-            paddle.uniform([128, 128, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f4819d164dd4e886677407a7fcb7b765(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(16384, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5fca79cd1781a879705ca6a9cb5c9439(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(512, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7ad8f541211f06f17a35c0dfc017aeb6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(43, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7b69d0fa1a2d45d864e4134483cbdb21(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([7], dtype='int64').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6611a02d3fcfb3e6d952da12429fbad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7ad8f541211f06f17a35c0dfc017aeb6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(43, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7ad8f541211f06f17a35c0dfc017aeb6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(43, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0e11c850f1a4a15b674f9d1e887c6f16(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_00e2797fbe2ef2fac8eedf2ac1a26359
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 4116], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_285e53e304b0114c646a16d58e83a320(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1f4061c336b6699ff4ebf9337c7c1f47
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 4116, 4], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6d65d970b8d7305ed2b1263d83839ad5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_805195d8be5cb7361392f1ad761000f1
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 4116, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ec4387ad7094190df1503565dd979e66(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ceed749ead402595568cf3aab34bc9fe
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 4116, 68], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b079fb2050f569958b053501a2945e68(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_77cafb057f19b4e5aa2273f50de29bf9
-    def get_inputs(self):
-        return [
-            paddle.uniform([2084, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_01fd31efc0182c1bb2568f7f4cd326cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_089fb029c97cf35de54f3c1950a8016e
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[2084, 4], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5b5363b86281e4f1a18d7c381d088dac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(256, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6611a02d3fcfb3e6d952da12429fbad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5b5363b86281e4f1a18d7c381d088dac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(256, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5fca79cd1781a879705ca6a9cb5c9439(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(512, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_075eb5f0c79e00b80e2ff421b91a152d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8f0434c8f9fe1dd85fca1c43d28b586a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 97, 97], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7a1a8d5fcde1f910839ddcffc9b5cf71(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bdd8bef35bb323fed05b1e0cfa82b4cc
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 512, 1, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f14e5f5e027eecedf7c518b8fe5a3642(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(4, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bfeabe0363c1b085c0075773bb8d1c93(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(16, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5b5363b86281e4f1a18d7c381d088dac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(256, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f14e5f5e027eecedf7c518b8fe5a3642(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(4, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_22590296fba2344c3485304fe9db11f8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(8, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_52d07ef3f28f8a30ffb53a7ec69ddb48(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(11, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ac40968db87550ca1b85025af92f931d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(3024, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f69e9d036e4eecad5a5607cfc993d8ef(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-
-class PrimitiveOp_83606b7d43f107c419dfdd9f3c1dfa59(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[72], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1e99ba9146d313ed32a9360346a552c7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_83606b7d43f107c419dfdd9f3c1dfa59
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[72], dtype='int64'),
-        ]
-
-
-
-class PrimitiveOp_63e5dfb6936ecadf7bce2ad5ec57ffcd(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[36], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6cd2b451101ab365f1b27af960cd75d7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_63e5dfb6936ecadf7bce2ad5ec57ffcd
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[36], dtype='int64'),
-        ]
-
-
-
-class PrimitiveOp_b8e297a4cfaa9b164d1e9e6b76f89dda(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[18], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8f655019c0f250a51494a2250d961701(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b8e297a4cfaa9b164d1e9e6b76f89dda
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17], dtype='int64').reshape([18]),
-        ]
-
-
-
-class PrimitiveOp_271c2c482c9061be4a6560f43ed4e733(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[6804, 2], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0285addcdaf6b2ebc0cdeeb96cbf3c53(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_271c2c482c9061be4a6560f43ed4e733
-    def get_inputs(self):
-        return [
-            paddle.uniform([6804, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0285addcdaf6b2ebc0cdeeb96cbf3c53(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_271c2c482c9061be4a6560f43ed4e733
-    def get_inputs(self):
-        return [
-            paddle.uniform([6804, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bcf51f8e578add903686757efa71b995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b377df355601dae692d7974c45b237c6
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[256], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b0b75d64ff326f8a3091a4479d01e4b2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1174, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_446b54e39bba5d21759c25b7c8f1a21e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9c941da58e044eb566a7a32a0eedb4f1
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([8], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d9afdcd8aac90503a91812a7a9a6a317(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0], dtype='int64').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5fca79cd1781a879705ca6a9cb5c9439(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(512, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5b503e847bc1ff8a6b93e602b7113ec4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8f0434c8f9fe1dd85fca1c43d28b586a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7a1a8d5fcde1f910839ddcffc9b5cf71(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bdd8bef35bb323fed05b1e0cfa82b4cc
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 512, 1, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7b69d0fa1a2d45d864e4134483cbdb21(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([7], dtype='int64').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f14e5f5e027eecedf7c518b8fe5a3642(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(4, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bfeabe0363c1b085c0075773bb8d1c93(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(16, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6611a02d3fcfb3e6d952da12429fbad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_69df9c1811b42675bacbbdbb373f51ee(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_edf307f3b255fdfdc3ebf7e93983f4fb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_eb65435641e6840c1d256277fbd3e58c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bdd8bef35bb323fed05b1e0cfa82b4cc
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 128, 1, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_93f48835c25312676428ef4f62257135(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_00e2797fbe2ef2fac8eedf2ac1a26359
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 8400], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_aaed5d730a4d996755ba6eda88e1337f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1f4061c336b6699ff4ebf9337c7c1f47
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 8400, 4], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_55d968e63ec9b15788866d96f6157117(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_805195d8be5cb7361392f1ad761000f1
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 8400, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5bfa0f0703d5cfcdf10bb8b654ed679b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ceed749ead402595568cf3aab34bc9fe
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 8400, 68], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e9e5d7a7db73cf69fccffc66ea7e15dc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_77cafb057f19b4e5aa2273f50de29bf9
-    def get_inputs(self):
-        return [
-            paddle.uniform([4260, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d5613af605b57322c7b2d70a4d2e7d50(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_089fb029c97cf35de54f3c1950a8016e
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[4260, 4], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b0b75d64ff326f8a3091a4479d01e4b2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1174, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5fca79cd1781a879705ca6a9cb5c9439(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(512, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bcf51f8e578add903686757efa71b995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b377df355601dae692d7974c45b237c6
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[256], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6611a02d3fcfb3e6d952da12429fbad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_133332b4c3119b5a5bbb6c560c40c15d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[32], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6611a02d3fcfb3e6d952da12429fbad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_133332b4c3119b5a5bbb6c560c40c15d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[32], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_85875b8b4665e5a3dfe11d8866c152b2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6ba9e75e85bd5813f56971726f1f40f8
-    def get_inputs(self):
-        return [
-            paddle.uniform([32, 32, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f648e68fc972d1365d7c6b9595ec3171(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1024, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_13650f9d7296959ada5b18a19e58449e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[64], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_13650f9d7296959ada5b18a19e58449e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[64], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ea1606fdd5858d71e72d0fb25ea694d5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6ba9e75e85bd5813f56971726f1f40f8
-    def get_inputs(self):
-        return [
-            paddle.uniform([64, 64, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fb12293a9353d872695e9aa75b3788f6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(4096, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d80fd9fb5e3ef5578823f433b141d7ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[128], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d80fd9fb5e3ef5578823f433b141d7ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[128], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f0fcbc92ac903176b5cf27aff42f8454(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6ba9e75e85bd5813f56971726f1f40f8
-    def get_inputs(self):
-        return [
-            paddle.uniform([128, 128, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f4819d164dd4e886677407a7fcb7b765(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(16384, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_52d07ef3f28f8a30ffb53a7ec69ddb48(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(11, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-
-class PrimitiveOp_c2dd05783d694e78b7c427ad338cfaab(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.int32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4026306aa1d1bfd1dee6ccc61594c9a5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c2dd05783d694e78b7c427ad338cfaab
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([300.0], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_52d07ef3f28f8a30ffb53a7ec69ddb48(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(11, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7ad8f541211f06f17a35c0dfc017aeb6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(43, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bfeabe0363c1b085c0075773bb8d1c93(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(16, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6611a02d3fcfb3e6d952da12429fbad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1b86c402ee45cf52b21d8aa3c0059e12(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(3549, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6611a02d3fcfb3e6d952da12429fbad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_133332b4c3119b5a5bbb6c560c40c15d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[32], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6611a02d3fcfb3e6d952da12429fbad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_133332b4c3119b5a5bbb6c560c40c15d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[32], dtype='int64'),
-        ]
-
-
-
-class PrimitiveOp_ffc968cccab76204233726edd75681d3(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6dc920b66dd8b8ddf57c5e725251e3d4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ffc968cccab76204233726edd75681d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([32, 32, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f648e68fc972d1365d7c6b9595ec3171(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1024, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_13650f9d7296959ada5b18a19e58449e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[64], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_13650f9d7296959ada5b18a19e58449e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[64], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0fa0cf0dd45b3905ff8f22f5f1d77944(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ffc968cccab76204233726edd75681d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([64, 64, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fb12293a9353d872695e9aa75b3788f6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(4096, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d80fd9fb5e3ef5578823f433b141d7ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[128], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d80fd9fb5e3ef5578823f433b141d7ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[128], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8528ddb471533631c9bf0731177e9532(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ffc968cccab76204233726edd75681d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([128, 128, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f4819d164dd4e886677407a7fcb7b765(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(16384, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6ef4ff870c81b2e43a1e98ddc1d833e0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2b17edfc50f520e3f303168fb91dc244
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[4, 28, 28], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e6401e0833b8e4aadf0f3ebfa85aa402(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c2dd05783d694e78b7c427ad338cfaab
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([100.0], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5b5363b86281e4f1a18d7c381d088dac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(256, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_691f0d3bce9cf0e2ef64b1c590a4435a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_00e2797fbe2ef2fac8eedf2ac1a26359
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 2100], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_691f0d3bce9cf0e2ef64b1c590a4435a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_00e2797fbe2ef2fac8eedf2ac1a26359
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 2100], dtype='int32'), 'bool'),
-        ]
-
-
-
-class PrimitiveOp_8a1b22b85f1249178b8a808090d16bbf(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.bool)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None], dtype='int32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4ecc2649242298fe701577dbb6d44eeb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8a1b22b85f1249178b8a808090d16bbf
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 2100], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_09903583799276cb315126842105841b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9c941da58e044eb566a7a32a0eedb4f1
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([128], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e2a0de1b85626fcb7007913eea531151(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9c941da58e044eb566a7a32a0eedb4f1
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([16], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_446b54e39bba5d21759c25b7c8f1a21e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9c941da58e044eb566a7a32a0eedb4f1
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([8], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c39c0dc15288f2be54e4fb74a9c4d4b3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[96], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_32eb784e7e19dd1665180073c2db24d0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[48], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e6ee42cba8322fbe821d422f39afc1b9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23], dtype='int64').reshape([24]),
-        ]
-
-
-
-class PrimitiveOp_da0f1905ed74babe3d8548df461febc8(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f6dc3ba15e5687e776b46b3cf4029e3f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_da0f1905ed74babe3d8548df461febc8
-    def get_inputs(self):
-        return [
-            paddle.uniform([12096, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f6dc3ba15e5687e776b46b3cf4029e3f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_da0f1905ed74babe3d8548df461febc8
-    def get_inputs(self):
-        return [
-            paddle.uniform([12096, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7ad8f541211f06f17a35c0dfc017aeb6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(43, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5fca79cd1781a879705ca6a9cb5c9439(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(512, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f648e68fc972d1365d7c6b9595ec3171(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1024, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_23f42a96082670844dd9c82a2dd7dbbd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_50c7b804da30f9ba7b79d3984ce13590
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 8732, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bcf51f8e578add903686757efa71b995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b377df355601dae692d7974c45b237c6
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[256], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0a2a7eb3d44db1a52801850635fa2a28(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9c941da58e044eb566a7a32a0eedb4f1
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([2], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f14e5f5e027eecedf7c518b8fe5a3642(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(4, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0eb3ac1bcfd2e86b1a127edb02ba782e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(13, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0eb3ac1bcfd2e86b1a127edb02ba782e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(13, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7ad8f541211f06f17a35c0dfc017aeb6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(43, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bd61cfc1aff98fe98b02c3fab4bc945e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3fbf9f9a66566327de9078e8f4e8a701
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.3780723512172699, 0.10681550204753876, 0.21278166770935059, 0.23138809204101562, 0.32906362414360046, 0.22839735448360443, 0.13309429585933685, 0.0206376351416111, 0.05156761035323143, 0.46504005789756775, 0.13148869574069977, 0.449235200881958, 0.08905600011348724, 0.015455592423677444, 0.3863491714000702, 0.4747481942176819], dtype='float32').reshape([16]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d3fbb178b68f82066f3ff51a81feaf91(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1], dtype='int64').reshape([16]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ac63116036e33a869b96c7dc307b33cd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0], dtype='int64').reshape([16]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_dcfd53889f0b36684a773fc516f9c10b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(7581, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_31060c9f7d4a4e29a85799de90f5b9dd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(22, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c39b84bcf63cada8ca8a1a6c48bdd865(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(6, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_22590296fba2344c3485304fe9db11f8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(8, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bfeabe0363c1b085c0075773bb8d1c93(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(16, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_72a2893dc60583dd2459980f65067f6b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(4725, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_22590296fba2344c3485304fe9db11f8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(8, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bfeabe0363c1b085c0075773bb8d1c93(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(16, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_767f91e5ec059c95525bd610ee4eec5b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2b17edfc50f520e3f303168fb91dc244
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[3, 28, 28], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_acefc62a87e6fe2b638fd671f9605a86(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(577, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f69e9d036e4eecad5a5607cfc993d8ef(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7ad8f541211f06f17a35c0dfc017aeb6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(43, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bfeabe0363c1b085c0075773bb8d1c93(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(16, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_32a0d8ea25dc3a1627b401c33ef5e912(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([2], dtype='int64').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f14e5f5e027eecedf7c518b8fe5a3642(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(4, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7ad8f541211f06f17a35c0dfc017aeb6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(43, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5b5363b86281e4f1a18d7c381d088dac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(256, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bfeabe0363c1b085c0075773bb8d1c93(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(16, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6611a02d3fcfb3e6d952da12429fbad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d6d146908d3e858b80664fbb32bf1a05(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_00e2797fbe2ef2fac8eedf2ac1a26359
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 3549], dtype='int32'), 'bool'),
-        ]
-
-
-
-class PrimitiveOp_a55d2607617dc8b7cccc994e8f785a3b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.bool)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None], dtype='int32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2d5d293e518ed55ddda94f6fa88f8c20(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a55d2607617dc8b7cccc994e8f785a3b
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 3549, 4], dtype='int32'),
-        ]
-
-
-
-class PrimitiveOp_61d4d796b40a4b68fbeaf46b28a60b80(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.int32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None], dtype='bool'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5ef57a2537bf1318dee2fb93ed81e57f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_61d4d796b40a4b68fbeaf46b28a60b80
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 3549, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0c4a7b98d4262b8631c64787421d1902(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a55d2607617dc8b7cccc994e8f785a3b
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 3549, 68], dtype='int32'),
-        ]
-
-
-
-class PrimitiveOp_1e5ec1a049147a82d47e29bbc6d9cffe(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.int64)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_13f380055acec661ed245a663632d68e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1e5ec1a049147a82d47e29bbc6d9cffe
-    def get_inputs(self):
-        return [
-            paddle.uniform([1777, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_83311269cb5ff5783f3d5cc1facdf36f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b36ccd2a12d2aa8a9f9be5cffa562822(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_83311269cb5ff5783f3d5cc1facdf36f
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1777, 4], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_53315e13144326ac7f8a7ceff16f6dd2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([8], dtype='int64').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d4b1252ac81e9cbad922449e66ee7ab2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(8400, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_52d07ef3f28f8a30ffb53a7ec69ddb48(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(11, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_52d07ef3f28f8a30ffb53a7ec69ddb48(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(11, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bcf51f8e578add903686757efa71b995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b377df355601dae692d7974c45b237c6
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[256], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7ad8f541211f06f17a35c0dfc017aeb6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(43, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_13650f9d7296959ada5b18a19e58449e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[64], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_133332b4c3119b5a5bbb6c560c40c15d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[32], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fc1521072614be32d36926bc84af5d33(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15], dtype='int64').reshape([16]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a65ca0bed68e267dd3c9f6b71c31cbb3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_da0f1905ed74babe3d8548df461febc8
-    def get_inputs(self):
-        return [
-            paddle.uniform([5376, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a65ca0bed68e267dd3c9f6b71c31cbb3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_da0f1905ed74babe3d8548df461febc8
-    def get_inputs(self):
-        return [
-            paddle.uniform([5376, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bcf51f8e578add903686757efa71b995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b377df355601dae692d7974c45b237c6
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[256], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7ad8f541211f06f17a35c0dfc017aeb6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(43, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_22590296fba2344c3485304fe9db11f8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(8, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6611a02d3fcfb3e6d952da12429fbad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5fca79cd1781a879705ca6a9cb5c9439(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(512, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f648e68fc972d1365d7c6b9595ec3171(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1024, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1b86c402ee45cf52b21d8aa3c0059e12(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(3549, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e67dfc411c761f22e54a5a3a12ac9850(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_edf307f3b255fdfdc3ebf7e93983f4fb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 128, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_95b63cae156737648eb9d53567f1cdd9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='bool'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6477f9e66fa529c820d9de4aecba0925(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_95b63cae156737648eb9d53567f1cdd9
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 64, 1, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_26414015ccec278fcd7832860e8132c8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_00e2797fbe2ef2fac8eedf2ac1a26359
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 11109], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_aed0c01d35f6f859512e258655cb3772(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a55d2607617dc8b7cccc994e8f785a3b
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 11109, 4], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8fef16164f678effe8c5979f84683470(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_61d4d796b40a4b68fbeaf46b28a60b80
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 11109, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_80939c6cf55109c3537053004828ec2f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a55d2607617dc8b7cccc994e8f785a3b
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 11109, 68], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_aea4a5bd08ede4c71aec6974cb14302e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1e5ec1a049147a82d47e29bbc6d9cffe
-    def get_inputs(self):
-        return [
-            paddle.uniform([5480, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_855a48bd4e056fb2ef156006944eb56b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_83311269cb5ff5783f3d5cc1facdf36f
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[5480, 4], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5fca79cd1781a879705ca6a9cb5c9439(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(512, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0ed99b820878b0dc1d4426f713fc1a3c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_edf307f3b255fdfdc3ebf7e93983f4fb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6ac4a3846c8bf4a8665b7617f52aac33(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_95b63cae156737648eb9d53567f1cdd9
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 512, 1, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7ad8f541211f06f17a35c0dfc017aeb6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(43, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fc086359045358acdd7cb829ff70c8c0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(10, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_84baef41300e80e9ae5d704e7c9c6fb2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(2, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_423e15003ea8bf70b9d4947922ca5c61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(98, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ae453b1b14b64f13413f82a9284d8131(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(99, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bcf51f8e578add903686757efa71b995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b377df355601dae692d7974c45b237c6
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[256], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bac61d297e5cd2d2a3ea9b37efa4a224(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3fbf9f9a66566327de9078e8f4e8a701
-    def get_inputs(self):
-        return [
-            paddle.uniform([36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_270e8fa185afdbd11ed0c92e77e5a135(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[36], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_270e8fa185afdbd11ed0c92e77e5a135(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[36], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6dc6683ebdfe1f323996a12ea50880bf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(192, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e70a1b2ceefa58fb55af6f04b15200db(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_edf307f3b255fdfdc3ebf7e93983f4fb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cc91ef097f3115756d7381edc8693d05(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_95b63cae156737648eb9d53567f1cdd9
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 192, 1, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_52d07ef3f28f8a30ffb53a7ec69ddb48(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(11, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6611a02d3fcfb3e6d952da12429fbad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c39b84bcf63cada8ca8a1a6c48bdd865(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(6, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1574d807fc35f867658115b47557c353(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9c941da58e044eb566a7a32a0eedb4f1
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([7], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bcf51f8e578add903686757efa71b995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b377df355601dae692d7974c45b237c6
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[256], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_31060c9f7d4a4e29a85799de90f5b9dd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(22, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f14e5f5e027eecedf7c518b8fe5a3642(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(4, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c39b84bcf63cada8ca8a1a6c48bdd865(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(6, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5fca79cd1781a879705ca6a9cb5c9439(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(512, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e67dfc411c761f22e54a5a3a12ac9850(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_edf307f3b255fdfdc3ebf7e93983f4fb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 128, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6477f9e66fa529c820d9de4aecba0925(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_95b63cae156737648eb9d53567f1cdd9
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 64, 1, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c39b84bcf63cada8ca8a1a6c48bdd865(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(6, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fc086359045358acdd7cb829ff70c8c0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(10, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9bfc98dbc1d3693bbb3cbfc7047607ce(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d90f9d3ea1353bf1e7a57f7b5e369afd
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([True, False, False, False, False, True], dtype='bool').reshape([6]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8cfe35cdfe3c53e9ac7a712a51400a68(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d90f9d3ea1353bf1e7a57f7b5e369afd
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([True, False, False, False, False, False], dtype='bool').reshape([6]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d6d146908d3e858b80664fbb32bf1a05(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_00e2797fbe2ef2fac8eedf2ac1a26359
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 3549], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2d5d293e518ed55ddda94f6fa88f8c20(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a55d2607617dc8b7cccc994e8f785a3b
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 3549, 4], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5ef57a2537bf1318dee2fb93ed81e57f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_61d4d796b40a4b68fbeaf46b28a60b80
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 3549, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2ff51a1c31c3f73cecfd7869d764854e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a55d2607617dc8b7cccc994e8f785a3b
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 3549, 76], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_afb62bbb85167ed24529834f4c1bff23(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1e5ec1a049147a82d47e29bbc6d9cffe
-    def get_inputs(self):
-        return [
-            paddle.uniform([1742, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_814cef1471092c872f465a18658013af(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_83311269cb5ff5783f3d5cc1facdf36f
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1742, 4], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5b5363b86281e4f1a18d7c381d088dac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(256, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_22f8e14b5b18cfb9bfc1e362a362dfa5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_edf307f3b255fdfdc3ebf7e93983f4fb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e785af884855ef83d15b119752f267d4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_95b63cae156737648eb9d53567f1cdd9
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 256, 1, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5b5363b86281e4f1a18d7c381d088dac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(256, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7993994e30fc310ccb7601b148674cc5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_edf307f3b255fdfdc3ebf7e93983f4fb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 256, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e785af884855ef83d15b119752f267d4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_95b63cae156737648eb9d53567f1cdd9
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 256, 1, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_31060c9f7d4a4e29a85799de90f5b9dd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(22, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1eb24f8f2728f33e0945d0117dd35853(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(28, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_446065aad997ce0cfe9ebf5017666e70(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(50, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c02c843a46346601ac8411bce73e5e58(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([4], dtype='int64').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2b62ec57691946d435e0ad984482c554(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(4116, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_69df9c1811b42675bacbbdbb373f51ee(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_edf307f3b255fdfdc3ebf7e93983f4fb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3a351ce994f4c8d7573b38071d871394(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_95b63cae156737648eb9d53567f1cdd9
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 128, 1, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_94b6ff59ea190bbfc344b5fad653d102(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[80], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4720c8b5d5e103ffaf7afd879602e4d5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[40], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8ae372e07c8c55a63024a9989b037530(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19], dtype='int64').reshape([20]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ceb96a06fac6fad7e8812f2b9378ce74(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_da0f1905ed74babe3d8548df461febc8
-    def get_inputs(self):
-        return [
-            paddle.uniform([8400, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ceb96a06fac6fad7e8812f2b9378ce74(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_da0f1905ed74babe3d8548df461febc8
-    def get_inputs(self):
-        return [
-            paddle.uniform([8400, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_845105d16b85f06389fd425eb641b818(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.int32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None], dtype='int32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_30c8af4cd493a8e6f4b7006a13220606(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_845105d16b85f06389fd425eb641b818
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([128, 128], dtype='int32').reshape([2]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5fca79cd1781a879705ca6a9cb5c9439(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(512, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f648e68fc972d1365d7c6b9595ec3171(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1024, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7ad8f541211f06f17a35c0dfc017aeb6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(43, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9d769bf410e66d626f2c65fb46ef5748(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3fbf9f9a66566327de9078e8f4e8a701
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.16727307438850403, 0.29837217926979065, 0.19894284009933472, 0.48071572184562683, 0.3676881194114685, 0.4198280870914459, 0.17023754119873047, 0.16682079434394836, 0.41211000084877014, 0.27952146530151367, 0.03478027507662773, 0.25146594643592834, 0.3347516655921936, 0.07699854671955109, 0.16147416830062866, 0.18425174057483673, 0.1390560418367386, 0.17906422913074493, 0.1935458481311798, 0.2319454848766327, 0.13256007432937622, 0.057637352496385574, 0.14197881519794464, 0.27830740809440613], dtype='float32').reshape([24]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8a4913a8c2dc1073f76e2f3f263b3742(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1], dtype='int64').reshape([24]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_aa7f20a9b9f0c6277002b85e24830eca(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0], dtype='int64').reshape([24]),
-        ]
-
-
-
-class PrimitiveOp_9c3ec74dd8e5a1e6f1feb971562bb59e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.cast(input_0, paddle.float64)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8519986e712220b4f2bfe7d7e8ad0074(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9c3ec74dd8e5a1e6f1feb971562bb59e
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.6781011819839478], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6611a02d3fcfb3e6d952da12429fbad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_133332b4c3119b5a5bbb6c560c40c15d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[32], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6611a02d3fcfb3e6d952da12429fbad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_133332b4c3119b5a5bbb6c560c40c15d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[32], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6dc920b66dd8b8ddf57c5e725251e3d4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ffc968cccab76204233726edd75681d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([32, 32, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f648e68fc972d1365d7c6b9595ec3171(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1024, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_13650f9d7296959ada5b18a19e58449e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[64], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_13650f9d7296959ada5b18a19e58449e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[64], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0fa0cf0dd45b3905ff8f22f5f1d77944(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ffc968cccab76204233726edd75681d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([64, 64, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fb12293a9353d872695e9aa75b3788f6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(4096, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d80fd9fb5e3ef5578823f433b141d7ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[128], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d80fd9fb5e3ef5578823f433b141d7ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[128], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8528ddb471533631c9bf0731177e9532(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ffc968cccab76204233726edd75681d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([128, 128, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f4819d164dd4e886677407a7fcb7b765(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(16384, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3bc3bba123b2d054968dad96ae2a9796(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(6069, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0ed8b16c1d1ea483cd9566882b4dcd7d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_00e2797fbe2ef2fac8eedf2ac1a26359
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 3024], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_25d8d3862fe149b4849621887f1bf4aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a55d2607617dc8b7cccc994e8f785a3b
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 3024, 4], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_26d2504df561e8dbf0d305084ec6c572(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_61d4d796b40a4b68fbeaf46b28a60b80
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 3024, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_236b2973188678f53d2723c164f6ef62(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a55d2607617dc8b7cccc994e8f785a3b
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 3024, 68], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b0033b3a1790e3527a561a01c4e02531(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1e5ec1a049147a82d47e29bbc6d9cffe
-    def get_inputs(self):
-        return [
-            paddle.uniform([1527, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0f086190ec538d59b8c74cb44a94e53e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_83311269cb5ff5783f3d5cc1facdf36f
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1527, 4], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d6d146908d3e858b80664fbb32bf1a05(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_00e2797fbe2ef2fac8eedf2ac1a26359
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 3549], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d6d146908d3e858b80664fbb32bf1a05(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_00e2797fbe2ef2fac8eedf2ac1a26359
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 3549], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_59f655520dd90fb6685c644bf3ab7740(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8a1b22b85f1249178b8a808090d16bbf
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 3549], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e77543c6ea381188e67b2c48663d0be9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_845105d16b85f06389fd425eb641b818
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([8, 2], dtype='int32').reshape([2]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_52d07ef3f28f8a30ffb53a7ec69ddb48(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(11, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5fca79cd1781a879705ca6a9cb5c9439(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(512, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f14e5f5e027eecedf7c518b8fe5a3642(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(4, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bfeabe0363c1b085c0075773bb8d1c93(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(16, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e9505ce7f70f3c23c8eafbd05ce44305(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3fbf9f9a66566327de9078e8f4e8a701
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.09576865285634995, 0.21895988285541534, 0.47236356139183044, 0.28012216091156006], dtype='float32').reshape([4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c4495f64bc4934c3212c40db4f2883c3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([1, 1, 1, 1], dtype='int64').reshape([4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_97bf5f464bc62f9f266f4b7041dbe358(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0, 0, 0, 0], dtype='int64').reshape([4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_22590296fba2344c3485304fe9db11f8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(8, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bb7615e0279392def6b82b610ccc2cf5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(52, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b03328c5fc33f4f2b16dce27dc4a5f81(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(202, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bcf51f8e578add903686757efa71b995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b377df355601dae692d7974c45b237c6
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[256], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bcf51f8e578add903686757efa71b995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b377df355601dae692d7974c45b237c6
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[256], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_42cb6565d7e34784f6524ea7c22bffb4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1025, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bcf51f8e578add903686757efa71b995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b377df355601dae692d7974c45b237c6
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[256], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_52d07ef3f28f8a30ffb53a7ec69ddb48(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(11, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bfeabe0363c1b085c0075773bb8d1c93(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(16, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0d16ce0b46781e254f7bc590fc7231b5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13], dtype='int64').reshape([14]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0f9579ba4b23cd44d611ad80111c4e18(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ffc968cccab76204233726edd75681d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([14, 14, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ae38dd59e550e019b7cd4464fd05c6f5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ffc968cccab76204233726edd75681d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([14, 14, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e3d30a27f0e0e1116fca969e4bb5e4e4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27], dtype='int64').reshape([28]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a388089284510cf98d82efe5bb10468c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ffc968cccab76204233726edd75681d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([28, 28, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7a19af15742c057db3433232abf20ecd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ffc968cccab76204233726edd75681d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([28, 28, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_444f4b1d0fb71b1f295c4ed92dc9faac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[56], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_27659dd4127690ad5f18da49a17e448e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ffc968cccab76204233726edd75681d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([56, 56, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_51c1966a773d2cfe6eb42f19dfef4c20(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ffc968cccab76204233726edd75681d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([56, 56, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f14e5f5e027eecedf7c518b8fe5a3642(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(4, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bfeabe0363c1b085c0075773bb8d1c93(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(16, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5fca79cd1781a879705ca6a9cb5c9439(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(512, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6611a02d3fcfb3e6d952da12429fbad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7ad8f541211f06f17a35c0dfc017aeb6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(43, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0eb3ac1bcfd2e86b1a127edb02ba782e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(13, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0eb3ac1bcfd2e86b1a127edb02ba782e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(13, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5fca79cd1781a879705ca6a9cb5c9439(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(512, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3c6f3a3db5ea7558a6bbd69cb8dc32d4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(104, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3c6f3a3db5ea7558a6bbd69cb8dc32d4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(104, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0e11c850f1a4a15b674f9d1e887c6f16(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_00e2797fbe2ef2fac8eedf2ac1a26359
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 4116], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0e11c850f1a4a15b674f9d1e887c6f16(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_00e2797fbe2ef2fac8eedf2ac1a26359
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 4116], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0a9fcf1615d59c78b9fa67924220e6ba(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8a1b22b85f1249178b8a808090d16bbf
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 4116], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6611a02d3fcfb3e6d952da12429fbad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_797837c384067968c17e0618b73c355e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_15eeb991b05d6e4820291506fd85de8c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(4, dtype='int64').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_653aee2827c14da1581fd6e82c30cd66(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_15eeb991b05d6e4820291506fd85de8c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(7, dtype='int64').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f648e68fc972d1365d7c6b9595ec3171(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1024, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bcf51f8e578add903686757efa71b995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b377df355601dae692d7974c45b237c6
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[256], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bfeabe0363c1b085c0075773bb8d1c93(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(16, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6611a02d3fcfb3e6d952da12429fbad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bfeabe0363c1b085c0075773bb8d1c93(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(16, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6611a02d3fcfb3e6d952da12429fbad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5b5363b86281e4f1a18d7c381d088dac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(256, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bcf51f8e578add903686757efa71b995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b377df355601dae692d7974c45b237c6
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[256], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5fca79cd1781a879705ca6a9cb5c9439(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(512, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4026306aa1d1bfd1dee6ccc61594c9a5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c2dd05783d694e78b7c427ad338cfaab
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([300.0], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7b69d0fa1a2d45d864e4134483cbdb21(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([7], dtype='int64').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c02c843a46346601ac8411bce73e5e58(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([4], dtype='int64').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0e11c850f1a4a15b674f9d1e887c6f16(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_00e2797fbe2ef2fac8eedf2ac1a26359
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 4116], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_11e36618edd494b7e36f40f960969fcc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a55d2607617dc8b7cccc994e8f785a3b
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 4116, 4], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b0763790665da53a17254fa4cbf3c80c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_61d4d796b40a4b68fbeaf46b28a60b80
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 4116, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_65a9c9fe0215b2ef1e9b948dc6ae1e04(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a55d2607617dc8b7cccc994e8f785a3b
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 4116, 68], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_95e6d2c6c050ec70225e23508f25a060(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1e5ec1a049147a82d47e29bbc6d9cffe
-    def get_inputs(self):
-        return [
-            paddle.uniform([2066, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5ab0f2b28b35b4df87ec2e7a016fb74c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_83311269cb5ff5783f3d5cc1facdf36f
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[2066, 4], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_22590296fba2344c3485304fe9db11f8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(8, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bfeabe0363c1b085c0075773bb8d1c93(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(16, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6611a02d3fcfb3e6d952da12429fbad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_52d07ef3f28f8a30ffb53a7ec69ddb48(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(11, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f14e5f5e027eecedf7c518b8fe5a3642(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(4, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bcf51f8e578add903686757efa71b995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b377df355601dae692d7974c45b237c6
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[256], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_42be2b35a08259894437c5acf5b55a8f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(14, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8ec1676e537048b23eb360867766b50e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(25, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f14e5f5e027eecedf7c518b8fe5a3642(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(4, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f14e5f5e027eecedf7c518b8fe5a3642(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(4, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bfeabe0363c1b085c0075773bb8d1c93(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(16, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_52d07ef3f28f8a30ffb53a7ec69ddb48(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(11, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7eba2122378dc5e373bcdd2644c6b5f5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_00e2797fbe2ef2fac8eedf2ac1a26359
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 9261], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8bad54a77aeda70f2b9b0d7794b55780(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a55d2607617dc8b7cccc994e8f785a3b
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 9261, 4], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_01714fd35b4a8c5d9809f811111ec6e0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_61d4d796b40a4b68fbeaf46b28a60b80
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 9261, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1e1fd75ab85271cda17abc76ed0a1409(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a55d2607617dc8b7cccc994e8f785a3b
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 9261, 68], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_318cda10303b5b8886d8af7c58ebc344(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1e5ec1a049147a82d47e29bbc6d9cffe
-    def get_inputs(self):
-        return [
-            paddle.uniform([4586, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_589a529f53fde60e9c9b114b0c59843a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_83311269cb5ff5783f3d5cc1facdf36f
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[4586, 4], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_02045f2af8a17cc45c234c4cb8482f2a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2b17edfc50f520e3f303168fb91dc244
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[6, 28, 28], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6f4c13d9db67d0c15cff6e8793ad18de(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_50c7b804da30f9ba7b79d3984ce13590
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 2434, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_691f0d3bce9cf0e2ef64b1c590a4435a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_00e2797fbe2ef2fac8eedf2ac1a26359
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 2100], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_790929d64d4500b7da2eedef3adb4d3d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a55d2607617dc8b7cccc994e8f785a3b
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 2100, 4], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_70c3114b3d131873867a0713220e448f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_61d4d796b40a4b68fbeaf46b28a60b80
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 2100, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ce516925d206ef93248a2c60352c4211(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a55d2607617dc8b7cccc994e8f785a3b
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 2100, 68], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3226b31f0b238247d1e65acf0bd8291e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1e5ec1a049147a82d47e29bbc6d9cffe
-    def get_inputs(self):
-        return [
-            paddle.uniform([1073, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b44e2419cc1edeb656b5ee4157d2f27b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_83311269cb5ff5783f3d5cc1facdf36f
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1073, 4], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5b5363b86281e4f1a18d7c381d088dac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(256, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bfeabe0363c1b085c0075773bb8d1c93(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(16, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bcf51f8e578add903686757efa71b995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b377df355601dae692d7974c45b237c6
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[256], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_72a33ba16ed7516a083269c12bbe6581(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(9261, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fc086359045358acdd7cb829ff70c8c0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(10, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f14e5f5e027eecedf7c518b8fe5a3642(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(4, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d46e4bdec92b907dd4831e8bb3274560(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[68], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_04a6625284e547d230d92d92aec483e5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[34], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_eada91f49da41206a8009187da0f87c3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16], dtype='int64').reshape([17]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4806db5298676b6d9b593f1219fba6fb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_da0f1905ed74babe3d8548df461febc8
-    def get_inputs(self):
-        return [
-            paddle.uniform([6069, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4806db5298676b6d9b593f1219fba6fb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_da0f1905ed74babe3d8548df461febc8
-    def get_inputs(self):
-        return [
-            paddle.uniform([6069, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5fca79cd1781a879705ca6a9cb5c9439(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(512, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0ed99b820878b0dc1d4426f713fc1a3c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_edf307f3b255fdfdc3ebf7e93983f4fb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6ac4a3846c8bf4a8665b7617f52aac33(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_95b63cae156737648eb9d53567f1cdd9
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 512, 1, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5fca79cd1781a879705ca6a9cb5c9439(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(512, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0ed99b820878b0dc1d4426f713fc1a3c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_edf307f3b255fdfdc3ebf7e93983f4fb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6ac4a3846c8bf4a8665b7617f52aac33(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_95b63cae156737648eb9d53567f1cdd9
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 512, 1, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5fca79cd1781a879705ca6a9cb5c9439(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(512, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0ed99b820878b0dc1d4426f713fc1a3c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_edf307f3b255fdfdc3ebf7e93983f4fb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6ac4a3846c8bf4a8665b7617f52aac33(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_95b63cae156737648eb9d53567f1cdd9
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 512, 1, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_25bd671770e98851cec886e11081b15b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(2048, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_80cff4176c37a9172b1adc847c64816b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_edf307f3b255fdfdc3ebf7e93983f4fb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2048, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6d7fcb9bebc62fa03153babf85b70783(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_95b63cae156737648eb9d53567f1cdd9
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 2048, 1, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_52d07ef3f28f8a30ffb53a7ec69ddb48(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(11, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d80fd9fb5e3ef5578823f433b141d7ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[128], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d80fd9fb5e3ef5578823f433b141d7ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[128], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8528ddb471533631c9bf0731177e9532(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ffc968cccab76204233726edd75681d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([128, 128, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f4819d164dd4e886677407a7fcb7b765(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(16384, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_13650f9d7296959ada5b18a19e58449e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[64], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_13650f9d7296959ada5b18a19e58449e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[64], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0fa0cf0dd45b3905ff8f22f5f1d77944(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ffc968cccab76204233726edd75681d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([64, 64, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fb12293a9353d872695e9aa75b3788f6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(4096, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6611a02d3fcfb3e6d952da12429fbad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_133332b4c3119b5a5bbb6c560c40c15d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[32], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6611a02d3fcfb3e6d952da12429fbad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_133332b4c3119b5a5bbb6c560c40c15d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[32], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6dc920b66dd8b8ddf57c5e725251e3d4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ffc968cccab76204233726edd75681d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([32, 32, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f648e68fc972d1365d7c6b9595ec3171(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1024, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bfeabe0363c1b085c0075773bb8d1c93(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(16, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fc1521072614be32d36926bc84af5d33(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15], dtype='int64').reshape([16]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bfeabe0363c1b085c0075773bb8d1c93(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(16, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fc1521072614be32d36926bc84af5d33(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15], dtype='int64').reshape([16]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_33b59baa55c31df53af0aeb18cbd61d9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ffc968cccab76204233726edd75681d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([16, 16, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5b5363b86281e4f1a18d7c381d088dac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(256, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_22590296fba2344c3485304fe9db11f8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(8, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_23632fc1b44a03a2e57495994e27c1c1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0, 1, 2, 3, 4, 5, 6, 7], dtype='int64').reshape([8]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_22590296fba2344c3485304fe9db11f8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(8, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_23632fc1b44a03a2e57495994e27c1c1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0, 1, 2, 3, 4, 5, 6, 7], dtype='int64').reshape([8]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8c1dba345e40b8d9d83d23d01c595d62(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ffc968cccab76204233726edd75681d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([8, 8, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6611a02d3fcfb3e6d952da12429fbad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_87110a98c87b0ac359d9998d868b22b3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(2100, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5fca79cd1781a879705ca6a9cb5c9439(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(512, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_07640cfb6d53c2e1e787af433b79b0bd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_edf307f3b255fdfdc3ebf7e93983f4fb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6ac4a3846c8bf4a8665b7617f52aac33(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_95b63cae156737648eb9d53567f1cdd9
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 512, 1, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5fca79cd1781a879705ca6a9cb5c9439(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(512, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_07640cfb6d53c2e1e787af433b79b0bd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_edf307f3b255fdfdc3ebf7e93983f4fb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6ac4a3846c8bf4a8665b7617f52aac33(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_95b63cae156737648eb9d53567f1cdd9
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 512, 1, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5fca79cd1781a879705ca6a9cb5c9439(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(512, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_07640cfb6d53c2e1e787af433b79b0bd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_edf307f3b255fdfdc3ebf7e93983f4fb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6ac4a3846c8bf4a8665b7617f52aac33(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_95b63cae156737648eb9d53567f1cdd9
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 512, 1, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_25bd671770e98851cec886e11081b15b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(2048, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f324dc7fbc6bc2da8e57b22c0100c682(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_edf307f3b255fdfdc3ebf7e93983f4fb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2048, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6d7fcb9bebc62fa03153babf85b70783(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_95b63cae156737648eb9d53567f1cdd9
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 2048, 1, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_52d07ef3f28f8a30ffb53a7ec69ddb48(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(11, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7ad8f541211f06f17a35c0dfc017aeb6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(43, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_42cb6565d7e34784f6524ea7c22bffb4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1025, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8627a5fb9dd1bc82f04b09b09ccf1afe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_00e2797fbe2ef2fac8eedf2ac1a26359
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 4725], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d0d9e93a1a7fed1645409af92d6fa363(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a55d2607617dc8b7cccc994e8f785a3b
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 4725, 4], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_68c8670a429411471b98d8bf4ef13a56(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_61d4d796b40a4b68fbeaf46b28a60b80
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 4725, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_27d73ace51e68c2e934f071d8955bb4c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a55d2607617dc8b7cccc994e8f785a3b
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 4725, 68], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d6fa963fab45ca4c2bb7acdc718e91bb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1e5ec1a049147a82d47e29bbc6d9cffe
-    def get_inputs(self):
-        return [
-            paddle.uniform([2383, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9c11912e610d1e94658493e64800b5da(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_83311269cb5ff5783f3d5cc1facdf36f
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[2383, 4], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_31060c9f7d4a4e29a85799de90f5b9dd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(22, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ae23c767130b4e6ab108b86a4a791076(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_00e2797fbe2ef2fac8eedf2ac1a26359
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 6069], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_73677c5f530aff43a1391a5bbc2d70c0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a55d2607617dc8b7cccc994e8f785a3b
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 6069, 4], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_470e974f220d1f64f2ba0517e6824aa3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_61d4d796b40a4b68fbeaf46b28a60b80
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 6069, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b198470d08db3267b95c6b7ac4ccdbe2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a55d2607617dc8b7cccc994e8f785a3b
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 6069, 68], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b7a335a915455027a7d75bff27704e6e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1e5ec1a049147a82d47e29bbc6d9cffe
-    def get_inputs(self):
-        return [
-            paddle.uniform([3030, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8c4672d8b152ec94869c5eb0fd3f00fd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_83311269cb5ff5783f3d5cc1facdf36f
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[3030, 4], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9bb9cf1228fbf06cd00edbc08299059e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_00e2797fbe2ef2fac8eedf2ac1a26359
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 7581], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ea9c9feaa1a52ac184910a8172becb45(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a55d2607617dc8b7cccc994e8f785a3b
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 7581, 4], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_73f7c5beb9dfbd24cd3ee24740fec923(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_61d4d796b40a4b68fbeaf46b28a60b80
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 7581, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_406769825c682ca8f3ac3eedfe190e74(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a55d2607617dc8b7cccc994e8f785a3b
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 7581, 68], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_89c0a0bc7710ac88fc7570e2db816c6c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1e5ec1a049147a82d47e29bbc6d9cffe
-    def get_inputs(self):
-        return [
-            paddle.uniform([3787, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a530afc98cbf234246655e133bd01a14(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_83311269cb5ff5783f3d5cc1facdf36f
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[3787, 4], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_52d07ef3f28f8a30ffb53a7ec69ddb48(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(11, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_52d07ef3f28f8a30ffb53a7ec69ddb48(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(11, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e6401e0833b8e4aadf0f3ebfa85aa402(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c2dd05783d694e78b7c427ad338cfaab
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([100.0], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f648e68fc972d1365d7c6b9595ec3171(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1024, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a3cec10c1907c73f5d2222dd2278b627(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(11109, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c95e648d8c727f6a21cb88d499d62139(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([3], dtype='int64').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6611a02d3fcfb3e6d952da12429fbad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7ad8f541211f06f17a35c0dfc017aeb6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(43, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_52d07ef3f28f8a30ffb53a7ec69ddb48(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(11, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f490e105dea430853d7a17e6cc13fcb4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2b17edfc50f520e3f303168fb91dc244
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[2, 28, 28], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f2751c019c6a5a1972af0ba6b62654ec(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9c941da58e044eb566a7a32a0eedb4f1
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([4], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_261d30b925d4c0d87630500cd7e35b19(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9c941da58e044eb566a7a32a0eedb4f1
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([11], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_942bcaf22cf42860325dc285827f1cb6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9c941da58e044eb566a7a32a0eedb4f1
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([384], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_18cf19ca7b8ddda91af8f243ab372711(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9c941da58e044eb566a7a32a0eedb4f1
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([28], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1bf5b062ce812290c05b3d78330dff6f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9c941da58e044eb566a7a32a0eedb4f1
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([77], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c70c82d21ccc0a898b8897879b42652f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[152], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_07a80a278877327ec420efc10bef6c55(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[100], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_dac90311393d30f0a19e50562b493be4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ffc968cccab76204233726edd75681d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([100, 152, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_67658fd49e39a2df53aa774a376f0ae6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ffc968cccab76204233726edd75681d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([100, 152, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3a8a4d4c0eac87b0ad5fddfc88e04364(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[76], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2b59655fc1debd47c2890f7eeb94a80e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[50], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fb5b506cd6aea00742d29ba55cae38c1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ffc968cccab76204233726edd75681d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([50, 76, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1db5cf6e131be3aa16c506b0af352e1b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ffc968cccab76204233726edd75681d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([50, 76, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_602e88a0e1c4a544007a9b7c73b2915d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[38], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_acd8d0f203de1a275eeb1b63f4f701a9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24], dtype='int64').reshape([25]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_03c972fa7406ef6fec7213a2b920af25(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ffc968cccab76204233726edd75681d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([25, 38, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a9c35bb3c036d73e83f9625103e080ca(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ffc968cccab76204233726edd75681d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([25, 38, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_71beb3f79e3670a557bc342b62f9891c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18], dtype='int64').reshape([19]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_33ed60696680a8074c826935fa5eedfb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12], dtype='int64').reshape([13]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0436253c1b5070341bb7996937ebfa9b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ffc968cccab76204233726edd75681d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([13, 19, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5f1ea6224838da0f0a28488f615fc46d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ffc968cccab76204233726edd75681d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([13, 19, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_801dfbc1a54d955f8ffac862bb6a207b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0, 1, 2, 3, 4, 5, 6, 7, 8, 9], dtype='int64').reshape([10]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_543b3585993a5b5deb3d3d812df769ab(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0, 1, 2, 3, 4, 5, 6], dtype='int64').reshape([7]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c2091ca39065e2ce1e19220cd7ae30e2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ffc968cccab76204233726edd75681d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([7, 10, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0e18f72a61cfa08632e63c8eb369a08d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ffc968cccab76204233726edd75681d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([7, 10, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bd11113f486c2fa3e5f4e3911dad88da(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_edf307f3b255fdfdc3ebf7e93983f4fb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3a351ce994f4c8d7573b38071d871394(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_95b63cae156737648eb9d53567f1cdd9
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 128, 1, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5b5363b86281e4f1a18d7c381d088dac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(256, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_39b288b9f25305d28a40d5776dbdcf2f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_edf307f3b255fdfdc3ebf7e93983f4fb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e785af884855ef83d15b119752f267d4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_95b63cae156737648eb9d53567f1cdd9
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 256, 1, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c39b84bcf63cada8ca8a1a6c48bdd865(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(6, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_de95beac2c031bcb98bd30f0fa591198(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3fbf9f9a66566327de9078e8f4e8a701
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.4473949074745178, 0.08388441801071167, 0.17490623891353607, 0.2467467337846756, 0.14741015434265137, 0.14820529520511627, 0.4406585693359375, 0.37450501322746277, 0.04052567854523659, 0.48126161098480225, 0.4376707375049591, 0.2969852685928345, 0.2029794454574585, 0.15935193002223969, 0.2048863172531128, 0.25172749161720276, 0.38391077518463135, 0.35427677631378174, 0.34242749214172363, 0.49203726649284363], dtype='float32').reshape([20]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9f15af7f9cd9a4028a8dc4fc93a9702e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1], dtype='int64').reshape([20]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0664c06661216637b4081b1b759a9021(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0], dtype='int64').reshape([20]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6611a02d3fcfb3e6d952da12429fbad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6611a02d3fcfb3e6d952da12429fbad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5b5363b86281e4f1a18d7c381d088dac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(256, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6611a02d3fcfb3e6d952da12429fbad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6611a02d3fcfb3e6d952da12429fbad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_133332b4c3119b5a5bbb6c560c40c15d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[32], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6611a02d3fcfb3e6d952da12429fbad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_133332b4c3119b5a5bbb6c560c40c15d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[32], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6dc920b66dd8b8ddf57c5e725251e3d4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ffc968cccab76204233726edd75681d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([32, 32, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f648e68fc972d1365d7c6b9595ec3171(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1024, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_13650f9d7296959ada5b18a19e58449e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[64], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_13650f9d7296959ada5b18a19e58449e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[64], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0fa0cf0dd45b3905ff8f22f5f1d77944(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ffc968cccab76204233726edd75681d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([64, 64, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fb12293a9353d872695e9aa75b3788f6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(4096, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d80fd9fb5e3ef5578823f433b141d7ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[128], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d80fd9fb5e3ef5578823f433b141d7ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[128], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8528ddb471533631c9bf0731177e9532(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ffc968cccab76204233726edd75681d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([128, 128, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f4819d164dd4e886677407a7fcb7b765(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(16384, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5fca79cd1781a879705ca6a9cb5c9439(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(512, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7ad8f541211f06f17a35c0dfc017aeb6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(43, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7b69d0fa1a2d45d864e4134483cbdb21(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([7], dtype='int64').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6611a02d3fcfb3e6d952da12429fbad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7ad8f541211f06f17a35c0dfc017aeb6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(43, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7ad8f541211f06f17a35c0dfc017aeb6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(43, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0e11c850f1a4a15b674f9d1e887c6f16(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_00e2797fbe2ef2fac8eedf2ac1a26359
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 4116], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_11e36618edd494b7e36f40f960969fcc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a55d2607617dc8b7cccc994e8f785a3b
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 4116, 4], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b0763790665da53a17254fa4cbf3c80c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_61d4d796b40a4b68fbeaf46b28a60b80
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 4116, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_65a9c9fe0215b2ef1e9b948dc6ae1e04(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a55d2607617dc8b7cccc994e8f785a3b
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 4116, 68], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_88e577c11ec1faa4acfd8c5679eee1b0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1e5ec1a049147a82d47e29bbc6d9cffe
-    def get_inputs(self):
-        return [
-            paddle.uniform([2084, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0c1bdaee58a4c2f0e63a5b0f2fc1a558(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_83311269cb5ff5783f3d5cc1facdf36f
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[2084, 4], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5b5363b86281e4f1a18d7c381d088dac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(256, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6611a02d3fcfb3e6d952da12429fbad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5b5363b86281e4f1a18d7c381d088dac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(256, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5fca79cd1781a879705ca6a9cb5c9439(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(512, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0e2c3ab943a8e811a69135511cf660f0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_edf307f3b255fdfdc3ebf7e93983f4fb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 97, 97], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6ac4a3846c8bf4a8665b7617f52aac33(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_95b63cae156737648eb9d53567f1cdd9
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 512, 1, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f14e5f5e027eecedf7c518b8fe5a3642(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(4, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bfeabe0363c1b085c0075773bb8d1c93(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(16, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5b5363b86281e4f1a18d7c381d088dac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(256, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f14e5f5e027eecedf7c518b8fe5a3642(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(4, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_22590296fba2344c3485304fe9db11f8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(8, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_52d07ef3f28f8a30ffb53a7ec69ddb48(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(11, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ac40968db87550ca1b85025af92f931d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(3024, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f69e9d036e4eecad5a5607cfc993d8ef(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_dbeaa1704fe6b69063747cb065f5809f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[72], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_270e8fa185afdbd11ed0c92e77e5a135(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[36], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ed8a7d0583fc1f348d3db3abd1166a5a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17], dtype='int64').reshape([18]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_77058de1d15cd28977ad20eaf0cc8fb0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_da0f1905ed74babe3d8548df461febc8
-    def get_inputs(self):
-        return [
-            paddle.uniform([6804, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_77058de1d15cd28977ad20eaf0cc8fb0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_da0f1905ed74babe3d8548df461febc8
-    def get_inputs(self):
-        return [
-            paddle.uniform([6804, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bcf51f8e578add903686757efa71b995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b377df355601dae692d7974c45b237c6
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[256], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b0b75d64ff326f8a3091a4479d01e4b2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1174, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_446b54e39bba5d21759c25b7c8f1a21e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9c941da58e044eb566a7a32a0eedb4f1
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([8], dtype='int32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d9afdcd8aac90503a91812a7a9a6a317(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0], dtype='int64').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5fca79cd1781a879705ca6a9cb5c9439(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(512, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_07640cfb6d53c2e1e787af433b79b0bd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_edf307f3b255fdfdc3ebf7e93983f4fb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6ac4a3846c8bf4a8665b7617f52aac33(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_95b63cae156737648eb9d53567f1cdd9
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 512, 1, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7b69d0fa1a2d45d864e4134483cbdb21(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([7], dtype='int64').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f14e5f5e027eecedf7c518b8fe5a3642(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(4, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bfeabe0363c1b085c0075773bb8d1c93(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(16, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6611a02d3fcfb3e6d952da12429fbad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_69df9c1811b42675bacbbdbb373f51ee(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_edf307f3b255fdfdc3ebf7e93983f4fb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3a351ce994f4c8d7573b38071d871394(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_95b63cae156737648eb9d53567f1cdd9
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 128, 1, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_028e5edc797b7e3278e2fbc5d4f8c5aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_93f48835c25312676428ef4f62257135(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_00e2797fbe2ef2fac8eedf2ac1a26359
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 8400], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5e1dfa11e027fd6220adcc7d1dad908d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a55d2607617dc8b7cccc994e8f785a3b
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 8400, 4], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2a70890e3fc04e6a83a85f157689f55b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_61d4d796b40a4b68fbeaf46b28a60b80
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 8400, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d884f63ca4ad770c9dbe70b944aae71d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a55d2607617dc8b7cccc994e8f785a3b
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 8400, 68], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a448e6f3351bd3ab5cda36536cced9fb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1e5ec1a049147a82d47e29bbc6d9cffe
-    def get_inputs(self):
-        return [
-            paddle.uniform([4260, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2541936fc1687887a7ee0de5c89cd9d5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_83311269cb5ff5783f3d5cc1facdf36f
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[4260, 4], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b0b75d64ff326f8a3091a4479d01e4b2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1174, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5fca79cd1781a879705ca6a9cb5c9439(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(512, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bcf51f8e578add903686757efa71b995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b377df355601dae692d7974c45b237c6
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[256], dtype='int32'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6611a02d3fcfb3e6d952da12429fbad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_133332b4c3119b5a5bbb6c560c40c15d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[32], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6611a02d3fcfb3e6d952da12429fbad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_133332b4c3119b5a5bbb6c560c40c15d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[32], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6dc920b66dd8b8ddf57c5e725251e3d4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ffc968cccab76204233726edd75681d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([32, 32, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f648e68fc972d1365d7c6b9595ec3171(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1024, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_13650f9d7296959ada5b18a19e58449e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[64], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29371c272484ac5c05e6a18268a805a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_13650f9d7296959ada5b18a19e58449e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[64], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0fa0cf0dd45b3905ff8f22f5f1d77944(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ffc968cccab76204233726edd75681d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([64, 64, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fb12293a9353d872695e9aa75b3788f6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(4096, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d80fd9fb5e3ef5578823f433b141d7ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[128], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f128aba6aade3be20d279c633e4e2b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d80fd9fb5e3ef5578823f433b141d7ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060f61bf875a59c5f4d8d5b628ebffae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[128], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8528ddb471533631c9bf0731177e9532(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ffc968cccab76204233726edd75681d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([128, 128, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f4819d164dd4e886677407a7fcb7b765(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(16384, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_52d07ef3f28f8a30ffb53a7ec69ddb48(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56bcb0e5ebb96bda7c194c3983b662bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(11, dtype='int32').reshape([]),
-        ]
-
-
-
-
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+if __name__ == "__main__":
+    sys.exit(table.main(__file__))
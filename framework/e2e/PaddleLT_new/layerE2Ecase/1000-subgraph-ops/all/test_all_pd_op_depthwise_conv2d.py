@@ -1,3517 +1,28 @@
 import os
-os.environ['FLAGS_cinn_new_group_scheduler'] = '1'
-os.environ['FLAGS_group_schedule_tiling_first'] = '1'
-os.environ['FLAGS_enable_pir_api'] = '1'
-os.environ['FLAGS_cinn_bucket_compile'] = '1'
 import sys
-import unittest
-import numpy as np
-from dataclasses import dataclass
-import typing as t
 
-@dataclass
-class Stage:
-    name: str
-    env_vars: t.Dict[str, str]
+import pytest
 
-cinn_stages = [
-    Stage(
-        name="dynamic_to_static",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=False,
-            FLAGS_prim_all=False,
-            FLAGS_prim_enable_dynamic=False,
-        ),
-    ),
-    Stage(
-        name="prim",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=False,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-        ),
-    ),
-    Stage(
-        name="infer_symbolic",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=False,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-            FLAGS_use_cinn=False,
-            FLAGS_check_infer_symbolic=True,
-        ),
-    ),
-	Stage(
-        name="frontend",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=True,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-            FLAGS_use_cinn=True,
-            FLAGS_check_infer_symbolic=False,
-            FLAGS_enable_fusion_fallback=True,
-        ), 
-    ),
-    Stage(
-        name="backend",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=True,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-            FLAGS_use_cinn=True,
-            FLAGS_check_infer_symbolic=False,
-            FLAGS_enable_fusion_fallback=False,
-        ), 
-    ),
-]
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir, os.pardir))
+from tools.e2e_case_stage import CinnStages  # noqa: E402
 
-def GetCinnStageByName(name):
-    for stage in cinn_stages:
-        if stage.name == name:
-            return stage
-    return None
+stages = CinnStages(__file__)
 
-def GetCurrentCinnStage():
-    name = os.getenv('PADDLE_DEBUG_CINN_STAGE_NAME')
-    if name is None:
-        return None
-    stage_names = [stage.name for stage in cinn_stages]
-    assert name in stage_names, (
-        f"PADDLE_DEBUG_CINN_STAGE_NAME should be in {stage_names}"
-    )
-    return GetCinnStageByName(name)
+from tools.e2e_case_table import E2ECaseTable, CinnTestBase  # noqa: E402
 
-def GetPrevCinnStage(stage):
-    for i in range(1, len(cinn_stages)):
-        if stage is cinn_stages[i]:
-            return cinn_stages[i - 1]
-    return None
+stages.apply()
+table = E2ECaseTable(__file__)
+last_stage_failed = stages.last_stage_failed()
 
-def IsCinnStageEnableDiff():
-    value = os.getenv('PADDLE_DEBUG_CINN_STAGE_ENABLE_DIFF')
-    enabled = value in {
-        '1',
-        'true',
-        'True',
-    }
-    if enabled:
-        assert GetCurrentCinnStage() is not None
-    return enabled
 
-last_cinn_stage_exit_code = None
-def LastCINNStageFailed():
-    global last_cinn_stage_exit_code
-    if last_cinn_stage_exit_code is not None:
-        return last_cinn_stage_exit_code != 0
-    last_stage = GetPrevCinnStage(GetCurrentCinnStage())
-    if last_stage is None:
-        return False
-    env_vars = dict(
-        PADDLE_DEBUG_CINN_STAGE_NAME=last_stage.name,
-        PADDLE_DEBUG_CINN_STAGE_ENABLE_DIFF='0',
-    )
-    env_vars_str = " ".join(
-        f"{env_var}={value}"
-        for env_var, value in env_vars.items()
-    )
-    last_cinn_stage_exit_code = os.system(
-        f"{env_vars_str} {sys.executable} {__file__} > /dev/null 2>&1"
-    )
-    return last_cinn_stage_exit_code != 0
+def pytest_generate_tests(metafunc):
+    table.parametrize(metafunc)
 
-def SetDefaultEnv(**env_var2value):
-    for env_var, value in env_var2value.items():
-        if os.getenv(env_var) is None:
-            os.environ[env_var] = str(value)
 
-SetDefaultEnv(
-    PADDLE_DEBUG_CINN_STAGE_NAME="backend",
-    PADDLE_DEBUG_CINN_STAGE_ENABLE_DIFF=False,
-    PADDLE_DEBUG_ENABLE_CINN=True,
-    FLAGS_enable_pir_api=True,
-    FLAGS_prim_all=True,
-    FLAGS_prim_enable_dynamic=True,
-    FLAGS_use_cinn=False,
-    FLAGS_check_infer_symbolic=False,
-    FLAGS_enable_fusion_fallback=False,
-)
+@pytest.mark.skipif(last_stage_failed, reason="last stage failed")
+class TestPrimitiveOp(CinnTestBase):
+    table = table
 
-import paddle
 
-def SetEnvVar(env_var2value):
-    for env_var, value in env_var2value.items():
-        os.environ[env_var] = str(value)
-    paddle.set_flags({
-        env_var:value
-        for env_var, value in env_var2value.items()
-        if env_var.startswith('FLAGS_')
-    })
-
-if GetCurrentCinnStage() is not None:
-    SetEnvVar(GetCurrentCinnStage().env_vars)
-
-def GetEnvVarEnableJit():
-    enable_jit = os.getenv('PADDLE_DEBUG_ENABLE_JIT')
-    return enable_jit not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
-
-def GetEnvVarEnableCinn():
-    enable_cinn = os.getenv('PADDLE_DEBUG_ENABLE_CINN')
-    if enable_cinn is None:
-        return True
-    return enable_cinn not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
-
-
-def GetTolerance(dtype):
-    if dtype == np.float16:
-        return GetFloat16Tolerance()
-    if dtype == np.float32:
-        return GetFloat32Tolerance()
-    return 1e-6
-
-def GetFloat16Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT16_TOL'))
-    except:
-        return 1e-3
-
-def GetFloat32Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT32_TOL'))
-    except:
-        return 1e-6
-
-def IsInteger(dtype):
-    return np.dtype(dtype).char in np.typecodes['AllInteger']
-
-def ApplyToStatic(net, use_cinn):
-    build_strategy = paddle.static.BuildStrategy()
-    build_strategy.build_cinn_pass = use_cinn
-    return paddle.jit.to_static(
-        net,
-        input_spec=net.get_input_spec(),
-        build_strategy=build_strategy,
-        full_graph=True,
-    )
-
-class InstanceTrait:
-
-    @classmethod
-    def instance(cls):
-        if cls.instance_ is None:
-            cls.instance_ = cls()
-        return cls.instance_
-
-    @classmethod
-    def static_instance_with_cinn(cls):
-        if cls.static_instance_with_cinn_ is None:
-            cls.static_instance_with_cinn_ = ApplyToStatic(
-                cls.instance(),
-                use_cinn=True
-            )
-        return cls.static_instance_with_cinn_
-
-    @classmethod
-    def static_instance_without_cinn(cls):
-        if cls.static_instance_without_cinn_ is None:
-            cls.static_instance_without_cinn_ = ApplyToStatic(
-                cls.instance(),
-                use_cinn=False
-            )
-        return cls.static_instance_without_cinn_
-
-
-class CinnTestBase:
-
-    def setUp(self):
-        paddle.seed(2024)
-        self.prepare_data()
-
-    def test_train(self):
-        dy_outs = self.train(use_cinn=False)
-        cinn_outs = self.train(use_cinn=GetEnvVarEnableCinn())
-
-        for cinn_out, dy_out in zip(cinn_outs, dy_outs):
-          if type(cinn_out) is list and type(dy_out) is list:
-            for x, y in zip(cinn_out, dy_out):
-              self.assert_all_close(x, y)
-          else:
-            self.assert_all_close(cinn_out, dy_out)
-
-    def train(self, use_cinn):
-        if GetEnvVarEnableJit():
-            net = self.prepare_static_net(use_cinn)
-        else:
-            net = self.prepare_net()
-        paddle.seed(2024)
-        out = net(*self.inputs)
-        return out
-    
-    def prepare_data(self):
-        self.inputs = self.get_inputs()
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def prepare_net(self):
-        return self.get_test_class().instance()
-
-    def prepare_static_net(self, use_cinn):
-        if use_cinn:
-            return self.get_test_class().static_instance_with_cinn()
-        else:
-            return self.get_test_class().static_instance_without_cinn()
-
-    def assert_all_close(self, x, y):
-        if (hasattr(x, "numpy") and hasattr(y, "numpy")):
-            x_numpy = x.numpy()
-            y_numpy = y.numpy()
-            assert x_numpy.dtype == y_numpy.dtype
-            if IsInteger(x_numpy.dtype):
-                np.testing.assert_equal(x_numpy, y_numpy)
-            else:
-                tol = GetTolerance(x_numpy.dtype)
-                np.testing.assert_allclose(x_numpy, y_numpy, atol=tol, rtol=tol)
-        else:
-            assert x == y
-
-
-
-
-
-last_stage_failed = (IsCinnStageEnableDiff() and LastCINNStageFailed())
-class PrimitiveOp_c6ae1f5687dd78f6a32d2805a0300af5(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [2, 2], [1, 1], 'EXPLICIT', 48, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 48, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[48, 1, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_28985f19f71d195dce229900b2f7e689(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6ae1f5687dd78f6a32d2805a0300af5
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 48, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([48, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_00adf27a966f8a5813f52bd69ef678f2(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [2, 2], [2, 2], 'EXPLICIT', 48, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 48, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[48, 1, 5, 5], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ff353c04a4b8edb09d81fb033f0118e6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_00adf27a966f8a5813f52bd69ef678f2
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 48, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([48, 1, 5, 5], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_f969cd7942a792c7f9c89d7949df1145(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [2, 2], [3, 3], 'EXPLICIT', 48, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 48, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[48, 1, 7, 7], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2c78702ee01adc21a37aa8a90849333e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f969cd7942a792c7f9c89d7949df1145
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 48, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([48, 1, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_fb32e3cf1969c0662afc74cb7ec84885(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [1, 1], [0, 0], 'SAME', 128, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 128, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[128, 1, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1c4e756c14b539a6638192f17773860a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fb32e3cf1969c0662afc74cb7ec84885
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 32, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1c4e756c14b539a6638192f17773860a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fb32e3cf1969c0662afc74cb7ec84885
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 32, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_7f02052a9649fd368a4f1f86a3cf4580(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [1, 1], [0, 0], 'SAME', 128, [2, 2], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 128, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[128, 1, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1243358a1263806433f812037cd5de71(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7f02052a9649fd368a4f1f86a3cf4580
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 32, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_8218d3759d0c9a47bd5ee6789ff4bd23(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [1, 1], [0, 0], 'SAME', 128, [3, 3], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 128, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[128, 1, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_980e6c8ec33b384151e177d15ae9a401(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8218d3759d0c9a47bd5ee6789ff4bd23
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 32, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_0a5bf74730be63060f890aecd29e8373(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', 1280, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 1280, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1280, 1, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0f8337732f3c65540ad8f3f7ea6a9f77(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0a5bf74730be63060f890aecd29e8373
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1280, 32, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1280, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_e5a4150016c0eb250569daeda563b7e9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [1, 1], [0, 0], 'SAME', 64, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 64, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[64, 1, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_62d60413f59faf94b69e8805266082cd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e5a4150016c0eb250569daeda563b7e9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_aad37c4da1112e36c430005e47037f1a(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [1, 1], [0, 0], 'SAME', 64, [2, 2], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 64, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[64, 1, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_595c1462afeb5b9ad3420eb6c8e6c302(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_aad37c4da1112e36c430005e47037f1a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_e8b8d05bd7e7bdb276988918fae8bcb1(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [1, 1], [0, 0], 'SAME', 64, [3, 3], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 64, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[64, 1, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_621c92325161c52f52593f65e35c8d52(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e8b8d05bd7e7bdb276988918fae8bcb1
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_c436b9b6336172c8fba91b6f9f39473c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [1, 1], [0, 0], 'SAME', 64, [4, 4], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 64, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[64, 1, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_148372186a9eaeed2e302adb51ba7b0a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c436b9b6336172c8fba91b6f9f39473c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_2c3f6fd153eb82ddb432a02cb6c5a363(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', 160, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 160, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[160, 1, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_874c2db1f2b8f9e761a92c55430c96f5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2c3f6fd153eb82ddb432a02cb6c5a363
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 160, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_4f74c43d19d96ff52001aa1854e67655(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [1, 1], [2, 2], 'EXPLICIT', 160, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 160, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[160, 1, 5, 5], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d0c19198b8ec9b4a8c6fd31b22a583b9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4f74c43d19d96ff52001aa1854e67655
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 160, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160, 1, 5, 5], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_a850fb2a90d1bb2e570473743ed65a85(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [1, 1], [3, 3], 'EXPLICIT', 160, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 160, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[160, 1, 7, 7], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4a93f569a3ed7038e38e1ece9d73f254(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a850fb2a90d1bb2e570473743ed65a85
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 160, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160, 1, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_0333f4694f72ebba8b2fb2092c0d0778(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', 192, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[43, 192, 28, 28], dtype='float32'),
-            paddle.static.InputSpec(shape=[192, 1, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4fe3ffb85909e5efc6f280ec829a84b9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0333f4694f72ebba8b2fb2092c0d0778
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 192, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_a8096f621ed90ffae4b5d63b872f3b25(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', 384, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[43, 384, 14, 14], dtype='float32'),
-            paddle.static.InputSpec(shape=[384, 1, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_416bf355fad55b04e57771bbbea1b2c5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a8096f621ed90ffae4b5d63b872f3b25
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 384, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_ed1c2fd5200af5f6fcc8667edd830443(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [2, 2], [1, 1], 'EXPLICIT', 80, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 80, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[80, 1, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8019669b7636f2ece8b47f09cac5394b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ed1c2fd5200af5f6fcc8667edd830443
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 80, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([80, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_a113ed635cefe217e636441d112528e0(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [2, 2], [2, 2], 'EXPLICIT', 80, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 80, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[80, 1, 5, 5], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ed2f8ce374ac7b38cc8bf46f408e9f1d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a113ed635cefe217e636441d112528e0
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 80, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([80, 1, 5, 5], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_b96abd4825f908351eb278c9fa4597f3(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [2, 2], [3, 3], 'EXPLICIT', 80, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 80, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[80, 1, 7, 7], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0a255b8231e5ea5fd407e778f216a323(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b96abd4825f908351eb278c9fa4597f3
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 80, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([80, 1, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_40e58d09c530a82efceaca6adb4e9a4c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', 300, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 300, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[300, 1, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9680a7f57f43ccb3426e54cae3521e3b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_40e58d09c530a82efceaca6adb4e9a4c
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 300, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([300, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_92f51296d985f7a863f95cc866ae5724(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [1, 1], [2, 2], 'EXPLICIT', 300, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 300, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[300, 1, 5, 5], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_81a84456c589f8645723cefcd2ca4034(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_92f51296d985f7a863f95cc866ae5724
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 300, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([300, 1, 5, 5], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_e4c5e4d7069165a90e9e625750a2b75a(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [1, 1], [3, 3], 'EXPLICIT', 300, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 300, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[300, 1, 7, 7], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_09a0a9658d20fd84ad362904784f005e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e4c5e4d7069165a90e9e625750a2b75a
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 300, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([300, 1, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_0495afc43e958317310cef51a8ee5cc7(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [1, 1], [4, 4], 'EXPLICIT', 300, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 300, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[300, 1, 9, 9], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b4898fc4decdbabc65ff8f7eb97a723e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0495afc43e958317310cef51a8ee5cc7
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 300, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([300, 1, 9, 9], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_8c72b3919fff2b45f82838f8f86e35d6(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', 96, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[11, 96, 56, 56], dtype='float32'),
-            paddle.static.InputSpec(shape=[96, 1, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_83b4992fb9633cb4f27282c8f11d828e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8c72b3919fff2b45f82838f8f86e35d6
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 96, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_922bbccdc55c69cf1ef79135fa7bac91(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', 90, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 90, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[90, 1, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_34899c669449c50e9cab0d76bfd5efca(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_922bbccdc55c69cf1ef79135fa7bac91
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 90, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([90, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_6739cb5ca5b6cb2ca61841a3a3672b18(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [1, 1], [2, 2], 'EXPLICIT', 90, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 90, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[90, 1, 5, 5], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_65e435b6a71c988beb47a4e32aa46bed(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6739cb5ca5b6cb2ca61841a3a3672b18
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 90, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([90, 1, 5, 5], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_f07a42203d8372d236db0fa6c5fce96f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [1, 1], [3, 3], 'EXPLICIT', 90, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 90, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[90, 1, 7, 7], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d030a277fe29f34c6851a210d977d877(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f07a42203d8372d236db0fa6c5fce96f
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 90, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([90, 1, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_f0630fc358e99bbe4ce696c6e0dd1243(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [1, 1], [4, 4], 'EXPLICIT', 90, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 90, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[90, 1, 9, 9], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d1d91b4fb308c26b176cf0700ed40c1d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f0630fc358e99bbe4ce696c6e0dd1243
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 90, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([90, 1, 9, 9], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_41ee189babc9a55aa612502433be53ee(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', 384, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[11, 384, 14, 14], dtype='float32'),
-            paddle.static.InputSpec(shape=[384, 1, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_dd1773f6aa8aa06ba141a78ed7241189(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_41ee189babc9a55aa612502433be53ee
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 384, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_8dde170376da3abe00d1bb9a68904444(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [2, 2], [1, 1], 'EXPLICIT', 144, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 144, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[144, 1, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f649ad8003a7bbbe6f5da1bf84b50efa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8dde170376da3abe00d1bb9a68904444
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 144, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([144, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_d9c92a13ed28c7fa82b2d1935d31db2c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [2, 2], [2, 2], 'EXPLICIT', 144, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 144, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[144, 1, 5, 5], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b59378cd712e7866e5bd6273a01f8d42(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d9c92a13ed28c7fa82b2d1935d31db2c
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 144, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([144, 1, 5, 5], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_33daabe73ddab2a352027b5231a0b1cc(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [2, 2], [3, 3], 'EXPLICIT', 144, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 144, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[144, 1, 7, 7], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e87e0468f921e4c4c9ee52d642421682(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_33daabe73ddab2a352027b5231a0b1cc
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 144, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([144, 1, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_198c4200ea145deaab4f218dacac3138(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [2, 2], [4, 4], 'EXPLICIT', 144, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 144, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[144, 1, 9, 9], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_56a7469c6a6acd0e16446b1cd8aba847(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_198c4200ea145deaab4f218dacac3138
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 144, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([144, 1, 9, 9], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_286ab88b8193fd95fd76a962c90f2731(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [2, 2], [5, 5], 'EXPLICIT', 144, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 144, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[144, 1, 11, 11], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c30023606d4a4dfaed06fad4dd0a3e88(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_286ab88b8193fd95fd76a962c90f2731
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 144, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([144, 1, 11, 11], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_b1679d966bc80ff4f615f9b692c23bc1(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', 768, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[11, 768, 7, 7], dtype='float32'),
-            paddle.static.InputSpec(shape=[768, 1, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e8cec61b8f4f15f91a998f7f6f2fb4a0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1679d966bc80ff4f615f9b692c23bc1
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 768, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e66817249c39f72d230a697087c3a287(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0a5bf74730be63060f890aecd29e8373
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1280, 32, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1280, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_d82012df2fca7815e33b88fd1c13461f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', 768, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[43, 768, 7, 7], dtype='float32'),
-            paddle.static.InputSpec(shape=[768, 1, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0044d5f2781963d99cd5d779f185bd42(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d82012df2fca7815e33b88fd1c13461f
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 768, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_ab3fc01188c90a79de5e08189498ae3e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [2, 2], [0, 0], 'SAME', 24, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 24, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[24, 1, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c1bc3523b1b5023668cc84bb75e04bd9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ab3fc01188c90a79de5e08189498ae3e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 24, 256, 512], dtype='float32', min=0, max=0.5),
-            paddle.uniform([24, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_f0c03bc7bdbc58fdcf2239c73fdae868(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [2, 2], [0, 0], 'SAME', 24, [2, 2], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 24, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[24, 1, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_53bce84328e155f0b1b4ae17fc5b1b29(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f0c03bc7bdbc58fdcf2239c73fdae868
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 24, 256, 512], dtype='float32', min=0, max=0.5),
-            paddle.uniform([24, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_93b6125286c929c5382112493b7c74c4(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [2, 2], [0, 0], 'SAME', 24, [3, 3], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 24, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[24, 1, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ffb60c4a1aeaf7284e1cbb0908c0dea7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_93b6125286c929c5382112493b7c74c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 24, 256, 512], dtype='float32', min=0, max=0.5),
-            paddle.uniform([24, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_3f76eb2ed63259f1f959bb983bb0c725(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [2, 2], [0, 0], 'SAME', 24, [4, 4], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 24, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[24, 1, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_45323554fd6ca8c47a1ef4b9b80253c8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3f76eb2ed63259f1f959bb983bb0c725
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 24, 256, 512], dtype='float32', min=0, max=0.5),
-            paddle.uniform([24, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_9068fa3fb07042cf617d87e741c99673(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [2, 2], [0, 0], 'SAME', 32, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 32, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[32, 1, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7f108b6df022aebe00316dc0b3c279ac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9068fa3fb07042cf617d87e741c99673
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 32, 128, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_ef3cd5d24cb10018408d4828a2416de0(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [2, 2], [0, 0], 'SAME', 32, [2, 2], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 32, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[32, 1, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5a43c61628ecb1834aae6b8f66808298(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ef3cd5d24cb10018408d4828a2416de0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 32, 128, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_ac0b5168a6d6424f4322e850b74c6ef0(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [2, 2], [0, 0], 'SAME', 32, [3, 3], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 32, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[32, 1, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_315005446f16e1cb0f04c2915a84b0bb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ac0b5168a6d6424f4322e850b74c6ef0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 32, 128, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_a4ffd96c76e4344470e86ddaa537fec0(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [2, 2], [0, 0], 'SAME', 32, [4, 4], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 32, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[32, 1, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_83fda3dbfea1ef6ee3c2af9776b56a32(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a4ffd96c76e4344470e86ddaa537fec0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 32, 128, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_34b5118d2d6955c665a2a04d02e766af(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', 192, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[11, 192, 28, 28], dtype='float32'),
-            paddle.static.InputSpec(shape=[192, 1, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cda58e0f9243d1fc5b854281f2954c0b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_34b5118d2d6955c665a2a04d02e766af
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 192, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_6c6c7afd7b2464216ddd004e2c9b651b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', 240, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 240, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[240, 1, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fb2264f3967ae596dd9f85795f561c6b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6c6c7afd7b2464216ddd004e2c9b651b
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 240, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([240, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_7ae767629e2af1533258a1def2c80ca2(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [1, 1], [2, 2], 'EXPLICIT', 240, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 240, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[240, 1, 5, 5], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7c26f63449a454ef6e04dba32e23deab(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7ae767629e2af1533258a1def2c80ca2
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 240, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([240, 1, 5, 5], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_04fa34bcdf7fd915943a24b8e7da602f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', 96, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[43, 96, 56, 56], dtype='float32'),
-            paddle.static.InputSpec(shape=[96, 1, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9d6e13364313fa9590fe805e259cbbd3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_04fa34bcdf7fd915943a24b8e7da602f
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 96, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_f0be0daffa05460552e31a18c17178d0(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [2, 2], [1, 1], 'EXPLICIT', 48, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_de9d250547e2afe305d6909736564b32(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f0be0daffa05460552e31a18c17178d0
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 48, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([48, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_3d3616c63569e2914127592e8b995562(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [2, 2], [2, 2], 'EXPLICIT', 48, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1af18883f4687569705e7c0d8a98a2b1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3d3616c63569e2914127592e8b995562
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 48, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([48, 1, 5, 5], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_98e630ca9e26cabf0d176ea75953a25b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [2, 2], [3, 3], 'EXPLICIT', 48, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_53d8b65ac6b549decb6a4ee398755c34(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_98e630ca9e26cabf0d176ea75953a25b
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 48, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([48, 1, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_7231276762680ffa22e853308dc37f27(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [1, 1], [0, 0], 'SAME', 128, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2367c99711140a9dd1f8572d402c6828(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7231276762680ffa22e853308dc37f27
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 32, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2367c99711140a9dd1f8572d402c6828(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7231276762680ffa22e853308dc37f27
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 32, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_228f42a8bfc428b26ed930520a5df4b3(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [1, 1], [0, 0], 'SAME', 128, [2, 2], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_061b7001cb0357527af13163cb5005b0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228f42a8bfc428b26ed930520a5df4b3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 32, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_b4d5d5cd2d5871b3e31540c935b670b8(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [1, 1], [0, 0], 'SAME', 128, [3, 3], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6b9dca98fd35a8e55503a23cb35d4d3d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b4d5d5cd2d5871b3e31540c935b670b8
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 32, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_4d0d875d06335edfa292637f36824655(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', 1280, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d6708b0a48f4846bb66803b539b7b734(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4d0d875d06335edfa292637f36824655
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1280, 32, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1280, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_21ed442ca4b056d1ff9992a0f038ec14(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [1, 1], [0, 0], 'SAME', 64, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0c406a9d6bd9924e9ca0676a7c941a6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21ed442ca4b056d1ff9992a0f038ec14
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_2926afb203a8a159d67712e1b2a6866c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [1, 1], [0, 0], 'SAME', 64, [2, 2], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8424b5d33446773005e8e314544ffc72(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2926afb203a8a159d67712e1b2a6866c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_5158d33f822303be2daf7485ff4fafa3(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [1, 1], [0, 0], 'SAME', 64, [3, 3], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e114e0f82eddd882e33834b51ecccf66(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5158d33f822303be2daf7485ff4fafa3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_72d29721f8309ee8591c1053393c1c8a(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [1, 1], [0, 0], 'SAME', 64, [4, 4], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0addd084dea1e96400749a5ceb243505(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_72d29721f8309ee8591c1053393c1c8a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_2fb3394e0a2657a48f5ac415180f7e88(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', 160, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_95b2666aef32b6096ab1fe006e1ae544(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2fb3394e0a2657a48f5ac415180f7e88
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 160, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_2e7675b577ba5c08154bd53a67147355(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [1, 1], [2, 2], 'EXPLICIT', 160, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e281366ec371fd44e41bf3517d3d2d63(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2e7675b577ba5c08154bd53a67147355
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 160, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160, 1, 5, 5], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_18f9ee26abf4d666e64f2f721ff5ad28(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [1, 1], [3, 3], 'EXPLICIT', 160, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_91d7439b6e04777a24affa5696b2c7ed(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_18f9ee26abf4d666e64f2f721ff5ad28
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 160, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160, 1, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_cef797b4637446d0ed0ca21d3d245b53(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', 192, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bb5e4e0549b29386ac957d6a06cdb097(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cef797b4637446d0ed0ca21d3d245b53
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 192, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_e07acead241cb564d5406fab9d302918(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', 384, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c88f1df5eb8db308627b2522a65d3766(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e07acead241cb564d5406fab9d302918
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 384, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_959cd76073a3eaaa811d0bb710709c9f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [2, 2], [1, 1], 'EXPLICIT', 80, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_74f3e2791c19ed6b0430465100a13c6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_959cd76073a3eaaa811d0bb710709c9f
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 80, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([80, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_e210ebe807e20b40204655a277d106bd(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [2, 2], [2, 2], 'EXPLICIT', 80, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_90036991211776041076adfe353a0147(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e210ebe807e20b40204655a277d106bd
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 80, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([80, 1, 5, 5], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_8d3634b2fb9b4bff73b33d98863fbcce(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [2, 2], [3, 3], 'EXPLICIT', 80, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3d519dafa136e399811a1970af7c3c18(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8d3634b2fb9b4bff73b33d98863fbcce
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 80, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([80, 1, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_5012f038499fb5e4fd885ddadb830c1e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', 300, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bc7151458058dd3f621391ee14214a7a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5012f038499fb5e4fd885ddadb830c1e
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 300, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([300, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_21a52d9c7ae47d0692d6e15b9cb0953b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [1, 1], [2, 2], 'EXPLICIT', 300, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ec5fda6ea6b34afd8ac5ac66de045a3d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21a52d9c7ae47d0692d6e15b9cb0953b
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 300, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([300, 1, 5, 5], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_f82aa600c11856e1b8a9649680095088(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [1, 1], [3, 3], 'EXPLICIT', 300, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9cbb39431b90c5c23b8971bc9de4871b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f82aa600c11856e1b8a9649680095088
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 300, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([300, 1, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_72557ac93e9ac351a75fe52451863988(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [1, 1], [4, 4], 'EXPLICIT', 300, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bfb28433dddea17cc1e4b7efa261529b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_72557ac93e9ac351a75fe52451863988
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 300, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([300, 1, 9, 9], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_0b60e222087524dd3e84e010a45e8603(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', 96, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4d11c9e79e0248370a0c774de2ba0933(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0b60e222087524dd3e84e010a45e8603
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 96, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_f3fc911307c5f1fa15da1c2523ac37a9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', 90, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_25327bcdfb33d5f43d0bd699c9735ed3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f3fc911307c5f1fa15da1c2523ac37a9
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 90, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([90, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_8d429fbb6028249284dd29f3a5d6cf1e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [1, 1], [2, 2], 'EXPLICIT', 90, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4e7a23a9ffe832a2973b05e4784afbc8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8d429fbb6028249284dd29f3a5d6cf1e
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 90, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([90, 1, 5, 5], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_b43bd45a799975079a259a5351390c35(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [1, 1], [3, 3], 'EXPLICIT', 90, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_88c95d13444a07316e7f8a7084872f57(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b43bd45a799975079a259a5351390c35
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 90, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([90, 1, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_e37ada3865dce094f5ac1b363f13c770(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [1, 1], [4, 4], 'EXPLICIT', 90, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0b7ec29f8b77f6fdc9cab3356739a1a5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e37ada3865dce094f5ac1b363f13c770
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 90, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([90, 1, 9, 9], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_69b40f664006d996450b9bf579edbd33(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e07acead241cb564d5406fab9d302918
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 384, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_7c0bd1ddc43d72abecc12ba8ae122a9e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [2, 2], [1, 1], 'EXPLICIT', 144, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_28774556032f005486ef1b5004bc19b3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7c0bd1ddc43d72abecc12ba8ae122a9e
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 144, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([144, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_e8ba6b6190f00f5b0451235e67723093(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [2, 2], [2, 2], 'EXPLICIT', 144, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_165c702894a77aeb46160dd10320191e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e8ba6b6190f00f5b0451235e67723093
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 144, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([144, 1, 5, 5], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_ad5791defda79a8c3454b5b7bf109589(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [2, 2], [3, 3], 'EXPLICIT', 144, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_42166ff7d3de98a16a4967016ecd2ecf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ad5791defda79a8c3454b5b7bf109589
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 144, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([144, 1, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_7090458e022759268e6724b5937dbebf(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [2, 2], [4, 4], 'EXPLICIT', 144, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1a008addf3298e92632a12fcdf220489(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7090458e022759268e6724b5937dbebf
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 144, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([144, 1, 9, 9], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_7c4241aa8e9c4f417ad54c46dbe2a922(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [2, 2], [5, 5], 'EXPLICIT', 144, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2167bf57761c73a60a348e4b16bf8492(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7c4241aa8e9c4f417ad54c46dbe2a922
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 144, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([144, 1, 11, 11], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_d3a6dafec28a1b48c3653faa48dfe938(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', 768, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ffbf308981ba01a4875f8a10d54178ed(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d3a6dafec28a1b48c3653faa48dfe938
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 768, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_eca51cbb161c741f1e13d42465f32ce8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4d0d875d06335edfa292637f36824655
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1280, 32, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1280, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_493e22a01cd342fdfa89e01b28a75c8f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d3a6dafec28a1b48c3653faa48dfe938
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 768, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_e1d0b8f85a37573e88c6f1c553f48d19(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [2, 2], [0, 0], 'SAME', 24, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b9a22fbbd2e3734fb6c70764763cd5c7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e1d0b8f85a37573e88c6f1c553f48d19
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 24, 256, 512], dtype='float32', min=0, max=0.5),
-            paddle.uniform([24, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_857d1a9915829e438fdcdbcdaad1ab44(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [2, 2], [0, 0], 'SAME', 24, [2, 2], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4460a5622c8e5f866248fa853ad5564f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_857d1a9915829e438fdcdbcdaad1ab44
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 24, 256, 512], dtype='float32', min=0, max=0.5),
-            paddle.uniform([24, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_9c18f30b9fa14fec3383de70f79ee83c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [2, 2], [0, 0], 'SAME', 24, [3, 3], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f803c627b596a7696bf66172d8d67f58(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9c18f30b9fa14fec3383de70f79ee83c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 24, 256, 512], dtype='float32', min=0, max=0.5),
-            paddle.uniform([24, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_0972256fafebfbf8f669d8e5b2fd19cc(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [2, 2], [0, 0], 'SAME', 24, [4, 4], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9e7c0a22e86b2c98f33579eadac268ac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0972256fafebfbf8f669d8e5b2fd19cc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 24, 256, 512], dtype='float32', min=0, max=0.5),
-            paddle.uniform([24, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_b8df5fe42d91c88469af001ff16fb4b3(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [2, 2], [0, 0], 'SAME', 32, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2824d67d174ff2221fdc9acbcb8d78fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b8df5fe42d91c88469af001ff16fb4b3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 32, 128, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_40176945d96fd8e3dd64ca52022ccec2(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [2, 2], [0, 0], 'SAME', 32, [2, 2], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6afed7a4596c4e21ac79d9373968ceda(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_40176945d96fd8e3dd64ca52022ccec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 32, 128, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_0ba8927cf09ae0fd07db687683e1198e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [2, 2], [0, 0], 'SAME', 32, [3, 3], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f20b8221077130946c9a7c80c702b8f7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ba8927cf09ae0fd07db687683e1198e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 32, 128, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_fae38a50fa860f46f8d3b73dfefea0c7(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [2, 2], [0, 0], 'SAME', 32, [4, 4], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_69cc6e8302f5176d6c27dbb4a23737dd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fae38a50fa860f46f8d3b73dfefea0c7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 32, 128, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_47803c631ecc9098715f3df0a135b486(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cef797b4637446d0ed0ca21d3d245b53
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 192, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_b86bcc355ed33c663b51f2cc7612e6f1(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', 240, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1c0abb48ce61d92b23bb81aa08f31c71(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b86bcc355ed33c663b51f2cc7612e6f1
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 240, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([240, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_2e52eec7f4cba33fc7dc85f765ca969f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.depthwise_conv2d(input_0, input_1, [1, 1], [2, 2], 'EXPLICIT', 240, [1, 1], 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3a22a75ffd6e67e66995ed79a3c1d7f4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2e52eec7f4cba33fc7dc85f765ca969f
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 240, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([240, 1, 5, 5], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2349da69b8fe5b2a363a119cc53517f7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0b60e222087524dd3e84e010a45e8603
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 96, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 1, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+if __name__ == "__main__":
+    sys.exit(table.main(__file__))
@@ -1,3875 +1,28 @@
 import os
-os.environ['FLAGS_cinn_new_group_scheduler'] = '1'
-os.environ['FLAGS_group_schedule_tiling_first'] = '1'
-os.environ['FLAGS_enable_pir_api'] = '1'
-os.environ['FLAGS_cinn_bucket_compile'] = '1'
 import sys
-import unittest
-import numpy as np
-from dataclasses import dataclass
-import typing as t
 
-@dataclass
-class Stage:
-    name: str
-    env_vars: t.Dict[str, str]
+import pytest
 
-cinn_stages = [
-    Stage(
-        name="dynamic_to_static",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=False,
-            FLAGS_prim_all=False,
-            FLAGS_prim_enable_dynamic=False,
-        ),
-    ),
-    Stage(
-        name="prim",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=False,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-        ),
-    ),
-    Stage(
-        name="infer_symbolic",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=False,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-            FLAGS_use_cinn=False,
-            FLAGS_check_infer_symbolic=True,
-        ),
-    ),
-	Stage(
-        name="frontend",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=True,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-            FLAGS_use_cinn=True,
-            FLAGS_check_infer_symbolic=False,
-            FLAGS_enable_fusion_fallback=True,
-        ), 
-    ),
-    Stage(
-        name="backend",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=True,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-            FLAGS_use_cinn=True,
-            FLAGS_check_infer_symbolic=False,
-            FLAGS_enable_fusion_fallback=False,
-        ), 
-    ),
-]
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir, os.pardir))
+from tools.e2e_case_stage import CinnStages  # noqa: E402
 
-def GetCinnStageByName(name):
-    for stage in cinn_stages:
-        if stage.name == name:
-            return stage
-    return None
+stages = CinnStages(__file__)
 
-def GetCurrentCinnStage():
-    name = os.getenv('PADDLE_DEBUG_CINN_STAGE_NAME')
-    if name is None:
-        return None
-    stage_names = [stage.name for stage in cinn_stages]
-    assert name in stage_names, (
-        f"PADDLE_DEBUG_CINN_STAGE_NAME should be in {stage_names}"
-    )
-    return GetCinnStageByName(name)
+from tools.e2e_case_table import E2ECaseTable, CinnTestBase  # noqa: E402
 
-def GetPrevCinnStage(stage):
-    for i in range(1, len(cinn_stages)):
-        if stage is cinn_stages[i]:
-            return cinn_stages[i - 1]
-    return None
+stages.apply()
+table = E2ECaseTable(__file__)
+last_stage_failed = stages.last_stage_failed()
 
-def IsCinnStageEnableDiff():
-    value = os.getenv('PADDLE_DEBUG_CINN_STAGE_ENABLE_DIFF')
-    enabled = value in {
-        '1',
-        'true',
-        'True',
-    }
-    if enabled:
-        assert GetCurrentCinnStage() is not None
-    return enabled
 
-last_cinn_stage_exit_code = None
-def LastCINNStageFailed():
-    global last_cinn_stage_exit_code
-    if last_cinn_stage_exit_code is not None:
-        return last_cinn_stage_exit_code != 0
-    last_stage = GetPrevCinnStage(GetCurrentCinnStage())
-    if last_stage is None:
-        return False
-    env_vars = dict(
-        PADDLE_DEBUG_CINN_STAGE_NAME=last_stage.name,
-        PADDLE_DEBUG_CINN_STAGE_ENABLE_DIFF='0',
-    )
-    env_vars_str = " ".join(
-        f"{env_var}={value}"
-        for env_var, value in env_vars.items()
-    )
-    last_cinn_stage_exit_code = os.system(
-        f"{env_vars_str} {sys.executable} {__file__} > /dev/null 2>&1"
-    )
-    return last_cinn_stage_exit_code != 0
+def pytest_generate_tests(metafunc):
+    table.parametrize(metafunc)
 
-def SetDefaultEnv(**env_var2value):
-    for env_var, value in env_var2value.items():
-        if os.getenv(env_var) is None:
-            os.environ[env_var] = str(value)
 
-SetDefaultEnv(
-    PADDLE_DEBUG_CINN_STAGE_NAME="backend",
-    PADDLE_DEBUG_CINN_STAGE_ENABLE_DIFF=False,
-    PADDLE_DEBUG_ENABLE_CINN=True,
-    FLAGS_enable_pir_api=True,
-    FLAGS_prim_all=True,
-    FLAGS_prim_enable_dynamic=True,
-    FLAGS_use_cinn=False,
-    FLAGS_check_infer_symbolic=False,
-    FLAGS_enable_fusion_fallback=False,
-)
+@pytest.mark.skipif(last_stage_failed, reason="last stage failed")
+class TestPrimitiveOp(CinnTestBase):
+    table = table
 
-import paddle
 
-def SetEnvVar(env_var2value):
-    for env_var, value in env_var2value.items():
-        os.environ[env_var] = str(value)
-    paddle.set_flags({
-        env_var:value
-        for env_var, value in env_var2value.items()
-        if env_var.startswith('FLAGS_')
-    })
-
-if GetCurrentCinnStage() is not None:
-    SetEnvVar(GetCurrentCinnStage().env_vars)
-
-def GetEnvVarEnableJit():
-    enable_jit = os.getenv('PADDLE_DEBUG_ENABLE_JIT')
-    return enable_jit not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
-
-def GetEnvVarEnableCinn():
-    enable_cinn = os.getenv('PADDLE_DEBUG_ENABLE_CINN')
-    if enable_cinn is None:
-        return True
-    return enable_cinn not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
-
-
-def GetTolerance(dtype):
-    if dtype == np.float16:
-        return GetFloat16Tolerance()
-    if dtype == np.float32:
-        return GetFloat32Tolerance()
-    return 1e-6
-
-def GetFloat16Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT16_TOL'))
-    except:
-        return 1e-3
-
-def GetFloat32Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT32_TOL'))
-    except:
-        return 1e-6
-
-def IsInteger(dtype):
-    return np.dtype(dtype).char in np.typecodes['AllInteger']
-
-def ApplyToStatic(net, use_cinn):
-    build_strategy = paddle.static.BuildStrategy()
-    build_strategy.build_cinn_pass = use_cinn
-    return paddle.jit.to_static(
-        net,
-        input_spec=net.get_input_spec(),
-        build_strategy=build_strategy,
-        full_graph=True,
-    )
-
-class InstanceTrait:
-
-    @classmethod
-    def instance(cls):
-        if cls.instance_ is None:
-            cls.instance_ = cls()
-        return cls.instance_
-
-    @classmethod
-    def static_instance_with_cinn(cls):
-        if cls.static_instance_with_cinn_ is None:
-            cls.static_instance_with_cinn_ = ApplyToStatic(
-                cls.instance(),
-                use_cinn=True
-            )
-        return cls.static_instance_with_cinn_
-
-    @classmethod
-    def static_instance_without_cinn(cls):
-        if cls.static_instance_without_cinn_ is None:
-            cls.static_instance_without_cinn_ = ApplyToStatic(
-                cls.instance(),
-                use_cinn=False
-            )
-        return cls.static_instance_without_cinn_
-
-
-class CinnTestBase:
-
-    def setUp(self):
-        paddle.seed(2024)
-        self.prepare_data()
-
-    def test_train(self):
-        dy_outs = self.train(use_cinn=False)
-        cinn_outs = self.train(use_cinn=GetEnvVarEnableCinn())
-
-        for cinn_out, dy_out in zip(cinn_outs, dy_outs):
-          if type(cinn_out) is list and type(dy_out) is list:
-            for x, y in zip(cinn_out, dy_out):
-              self.assert_all_close(x, y)
-          else:
-            self.assert_all_close(cinn_out, dy_out)
-
-    def train(self, use_cinn):
-        if GetEnvVarEnableJit():
-            net = self.prepare_static_net(use_cinn)
-        else:
-            net = self.prepare_net()
-        paddle.seed(2024)
-        out = net(*self.inputs)
-        return out
-    
-    def prepare_data(self):
-        self.inputs = self.get_inputs()
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def prepare_net(self):
-        return self.get_test_class().instance()
-
-    def prepare_static_net(self, use_cinn):
-        if use_cinn:
-            return self.get_test_class().static_instance_with_cinn()
-        else:
-            return self.get_test_class().static_instance_without_cinn()
-
-    def assert_all_close(self, x, y):
-        if (hasattr(x, "numpy") and hasattr(y, "numpy")):
-            x_numpy = x.numpy()
-            y_numpy = y.numpy()
-            assert x_numpy.dtype == y_numpy.dtype
-            if IsInteger(x_numpy.dtype):
-                np.testing.assert_equal(x_numpy, y_numpy)
-            else:
-                tol = GetTolerance(x_numpy.dtype)
-                np.testing.assert_allclose(x_numpy, y_numpy, atol=tol, rtol=tol)
-        else:
-            assert x == y
-
-
-
-
-
-last_stage_failed = (IsCinnStageEnableDiff() and LastCINNStageFailed())
-class PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return input_0 / input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8af2b94ad69e503cb9b248227a80e28d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 23, 23, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 23, 23, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8bc148db5d1868af7ef15bf4c7209676(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 11, 11, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 11, 11, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_6869b440549846553242dab458ee42b6(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return input_0 / input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2cbb084c882e81e1c589181d85360f36(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6869b440549846553242dab458ee42b6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 2100], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[[0.2437746524810791]]], dtype='float32').reshape([1, 1, 1]),
-        ]
-
-
-
-class PrimitiveOp_25d97c980116915b97d7f1dd8630de8d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return input_0 / input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[12096, 2], dtype='float32'),
-            paddle.static.InputSpec(shape=[12096, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_77c5d87ca6d7e40a8ca31b0c9c1912e2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_25d97c980116915b97d7f1dd8630de8d
-    def get_inputs(self):
-        return [
-            paddle.uniform([12096, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([12096, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7f2410859a0475f8ba1e59ebe88a3107(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 24, 24, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 24, 24, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_926863dabbe694f2c349b4c63553e89c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 42, 42, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 42, 42, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_603d97710ed6a19cc34142e06ccee4c9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return input_0 / input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None], dtype='float32'),
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_73c6c0742dcd54a77553300afceed010(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_603d97710ed6a19cc34142e06ccee4c9
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([1086.810546875], dtype='float32').reshape([1]),
-            paddle.to_tensor(8732.0, dtype='float32').reshape([]),
-        ]
-
-
-
-class PrimitiveOp_6291b528d04c1a686a627623cddccfb6(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return input_0 / input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_97425f754cf0d2f7aff75ae168c72e5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6291b528d04c1a686a627623cddccfb6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 6, 21824], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[[0.04387051612138748], [0.006444364320486784], [0.0013840912142768502], [0.002383661922067404], [0.010043814778327942], [0.012843224219977856]]], dtype='float32').reshape([1, 6, 1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_03e307baa06a8c5d6ac14c953ea21244(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6291b528d04c1a686a627623cddccfb6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 6, 21824], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[[0.0013636649819090962], [0.00024246115935966372], [1.1790663165811566e-06], [0.0015065179904922843], [0.026322603225708008], [0.0008185587357729673]]], dtype='float32').reshape([1, 6, 1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4c34d54a48bda19b0536c0c5b63ed7b3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6869b440549846553242dab458ee42b6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 6, 21824], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[[0.21084406971931458], [0.03786491975188255], [0.0058274222537875175], [0.03970283269882202], [0.21114251017570496], [0.07030598819255829]]], dtype='float32').reshape([1, 6, 1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_545d921ce54972722f299efa19089ae2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 46, 46, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 46, 46, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2efe02dd038765fcf805744686e8bba8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 12, 12, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 12, 12, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8af2b94ad69e503cb9b248227a80e28d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 23, 23, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 23, 23, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_128f67565db93e81675dd337049efee6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 84, 84, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 84, 84, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return input_0 / input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-            paddle.static.InputSpec(shape=[None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_853db930b30daec2ae58a4e7c8f2552a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(8.484230041503906, dtype='float32').reshape([]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a3faaff244fa86bc74d5b0ff446f23c0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(2.7180092334747314, dtype='float32').reshape([]),
-            paddle.to_tensor([2.0], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_df13a428be372fa1e867c6ad008050a7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 38, 38, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 38, 38, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_d038adfdf55cd8f949a8fe4193c0f2c2(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return input_0 / input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_313881ff421ded0a2d361d5d55e92eb7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d038adfdf55cd8f949a8fe4193c0f2c2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1777, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1777, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_313881ff421ded0a2d361d5d55e92eb7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d038adfdf55cd8f949a8fe4193c0f2c2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1777, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1777, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e1fc689b8d7d5e80772cbcba96b642a3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(346003.25, dtype='float32').reshape([]),
-            paddle.to_tensor([0.19013376533985138], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9a90f111d3731a0070cb8db764af6733(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(101033.2890625, dtype='float32').reshape([]),
-            paddle.to_tensor([0.19013376533985138], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_921098ca62331b205732568a445790ce(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(958.122314453125, dtype='float32').reshape([]),
-            paddle.to_tensor([8.0], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c6bf680b69490fe029e977c78d66dc6d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 48, 48, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 48, 48, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c8eb03c9b06c9642e62120859f5de760(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 21, 21, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 21, 21, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_60f5a98ea45ebadb60b7305290c14e0a(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return input_0 / input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[5376, 2], dtype='float32'),
-            paddle.static.InputSpec(shape=[5376, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_600dc942a0e746b736df49ab662fa096(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_60f5a98ea45ebadb60b7305290c14e0a
-    def get_inputs(self):
-        return [
-            paddle.uniform([5376, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([5376, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4850c1e2e60ea7a945cff314249a9a4c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 44, 44, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 44, 44, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e1651d47886b31cc4d74a01c4a69a08e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 92, 92, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 92, 92, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_4e0e1e41ebece0ab9d4c052a641f0081(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return input_0 / input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7c9352859535e97563b44268e35e7f4e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e0e1e41ebece0ab9d4c052a641f0081
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0]], dtype='float32').reshape([9, 1]),
-            paddle.to_tensor([[0.023871352896094322], [0.0072302743792533875], [0.028566552326083183], [-0.012393927201628685], [-0.014890296384692192], [-0.004542335867881775], [-0.037730999290943146], [0.046309053897857666], [0.10882711410522461]], dtype='float32').reshape([9, 1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8246227336be39ec1e26fb63f4bd5b75(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e0e1e41ebece0ab9d4c052a641f0081
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[-0.024478740990161896], [-0.02582566812634468], [-0.006173903122544289], [0.01932423934340477], [0.08787506818771362], [-0.010301673784852028], [0.05171448737382889], [-0.04585982486605644], [-0.08655987679958344]], dtype='float32').reshape([9, 1]),
-            paddle.to_tensor([[-0.000607388443313539], [-0.018595393747091293], [0.022392649203538895], [0.00693031121045351], [0.07298476994037628], [-0.014844009652733803], [0.013983488082885742], [0.00044922734377905726], [0.022267237305641174]], dtype='float32').reshape([9, 1]),
-        ]
-
-
-
-class PrimitiveOp_ecb18185dc865f9a1072115911e91a52(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return input_0 / input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 1, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8b20352d5f052d6b312af0608d77a37e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ecb18185dc865f9a1072115911e91a52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 8, 8], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.09322686493396759], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b4e2f492a71375dfa09727b12566f9c2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d038adfdf55cd8f949a8fe4193c0f2c2
-    def get_inputs(self):
-        return [
-            paddle.uniform([5480, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([5480, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b4e2f492a71375dfa09727b12566f9c2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d038adfdf55cd8f949a8fe4193c0f2c2
-    def get_inputs(self):
-        return [
-            paddle.uniform([5480, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([5480, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_228375fea0084968cd1fde3b2df5734a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(4180.6708984375, dtype='float32').reshape([]),
-            paddle.to_tensor([0.43763113021850586], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ba880e7d579a37f105322444b3763c4e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(3885.515625, dtype='float32').reshape([]),
-            paddle.to_tensor([0.43763113021850586], dtype='float32').reshape([1]),
-        ]
-
-
-
-class PrimitiveOp_5e8106aa512a8da9fae679f4b94ae655(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return input_0 / input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6aca0e5f55e8895dcb00516fc66aa8df(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5e8106aa512a8da9fae679f4b94ae655
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0006146249361336231, 0.0, 0.0, 0.0, 0.0, -0.0], dtype='float32').reshape([6]),
-            paddle.to_tensor([0.03883463516831398, 0.00019726970640476793, 0.024178875610232353, 0.002077957382425666, 0.0006825196905992925, 0.02110004797577858], dtype='float32').reshape([6]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_dfd93f7e9da2aaa51da7f4df70edb08f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5e8106aa512a8da9fae679f4b94ae655
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.017001358792185783, 0.11817431449890137, 0.014661362394690514, 0.04215633124113083, 0.03779536485671997, 0.003305346705019474], dtype='float32').reshape([6]),
-            paddle.to_tensor([0.09524781256914139, 0.1662207990884781, 0.04816321283578873, 0.137531116604805, 0.04644821956753731, 0.1607235223054886], dtype='float32').reshape([6]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cf2594d47c192a296e47a83022fd8d1f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5e8106aa512a8da9fae679f4b94ae655
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.019291505217552185, 0.04946009814739227, -0.3934049606323242, 0.016018692404031754, 0.011264503002166748, 0.3699343204498291], dtype='float32').reshape([6]),
-            paddle.to_tensor([0.053903549909591675, 0.0039884597063064575, -0.061460524797439575, 0.1297207921743393, 0.06059029698371887, 0.05703727900981903], dtype='float32').reshape([6]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_18ec6063aad8b9202eab8d32099dd15f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5e8106aa512a8da9fae679f4b94ae655
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.1580319106578827, 0.08440583944320679, 0.15580785274505615, -0.13296881318092346, -0.32250675559043884, 0.2714036703109741], dtype='float32').reshape([6]),
-            paddle.to_tensor([0.24304825067520142, -0.07321910560131073, -0.13661599159240723, 0.16679298877716064, 0.09022623300552368, -0.21981266140937805], dtype='float32').reshape([6]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_88ce3d7fff92115a8256324c63bcf361(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5e8106aa512a8da9fae679f4b94ae655
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.021971477195620537, 2.231677532196045, 2.0824294090270996, 0.2567308843135834, 0.8899200558662415, 2.1586368083953857], dtype='float32').reshape([6]),
-            paddle.to_tensor([1.0061447620391846, 3.231677532196045, 3.0824294090270996, 1.2567309141159058, 1.8899199962615967, 3.1586368083953857], dtype='float32').reshape([6]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1397806f38efa7bf54d724149def003d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d038adfdf55cd8f949a8fe4193c0f2c2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1742, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1742, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1397806f38efa7bf54d724149def003d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d038adfdf55cd8f949a8fe4193c0f2c2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1742, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1742, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bcfa7f87d8563450c50a9e4136340bf8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(35792.1875, dtype='float32').reshape([]),
-            paddle.to_tensor([0.27057820558547974], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4d12731118a83726911b49afd9984606(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(102936.0, dtype='float32').reshape([]),
-            paddle.to_tensor([0.27057820558547974], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_08d20d088bbb008f1174a4fcaa99b9d3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(964.3115844726562, dtype='float32').reshape([]),
-            paddle.to_tensor([4.0], dtype='float32').reshape([1]),
-        ]
-
-
-
-class PrimitiveOp_3df0b87d8aa6daf297efe06a6e629ab3(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return input_0 / input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[8400, 2], dtype='float32'),
-            paddle.static.InputSpec(shape=[8400, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_04093335fce749ec1a0e1a09ab326edd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3df0b87d8aa6daf297efe06a6e629ab3
-    def get_inputs(self):
-        return [
-            paddle.uniform([8400, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([8400, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_bbdc3ff9f0a348b18d59d65d7a016467(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return input_0 / input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 512, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 1, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_404e76c972f50620d043d72d23b27502(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bbdc3ff9f0a348b18d59d65d7a016467
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 38, 38], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 38, 38], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_926863dabbe694f2c349b4c63553e89c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 42, 42, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 42, 42, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c8eb03c9b06c9642e62120859f5de760(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 21, 21, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 21, 21, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5c1f96bae3904ee734dc55bd3baec337(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d038adfdf55cd8f949a8fe4193c0f2c2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1527, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1527, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5c1f96bae3904ee734dc55bd3baec337(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d038adfdf55cd8f949a8fe4193c0f2c2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1527, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1527, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9ed1039e09b8bda6a55458abf7292420(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(-3337835.75, dtype='float32').reshape([]),
-            paddle.to_tensor([0.4929847717285156], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ce868fd553249b33c225ce5f3c72d922(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(86924.4765625, dtype='float32').reshape([]),
-            paddle.to_tensor([0.4929847717285156], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f0cfcf7c52af478e9f0d70b11dae8626(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6869b440549846553242dab458ee42b6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 3549], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[[0.2430911511182785], [0.23496943712234497]]], dtype='float32').reshape([1, 2, 1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2efe02dd038765fcf805744686e8bba8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 12, 12, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 12, 12, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8bc148db5d1868af7ef15bf4c7209676(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 11, 11, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 11, 11, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_df466c703154fcf478fcd1e4aa862d2d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e0e1e41ebece0ab9d4c052a641f0081
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.0]], dtype='float32').reshape([1, 1]),
-            paddle.to_tensor([[0.07083103060722351]], dtype='float32').reshape([1, 1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fa547a5c8f4ce84af3378ad0acec48bc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e0e1e41ebece0ab9d4c052a641f0081
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[-0.0832149088382721]], dtype='float32').reshape([1, 1]),
-            paddle.to_tensor([[-0.012383874505758286]], dtype='float32').reshape([1, 1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fd1283ab1d0e259cd5bdf9e5ca6abadf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e0e1e41ebece0ab9d4c052a641f0081
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.0], [0.0], [0.0], [0.0], [0.0], [0.0]], dtype='float32').reshape([6, 1]),
-            paddle.to_tensor([[-0.0467146635055542], [-0.060889631509780884], [-0.02047661691904068], [-0.05326319485902786], [9.980086178984493e-05], [-0.037149399518966675]], dtype='float32').reshape([6, 1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fdc9ba2ccf5339d5cf646086aebd1918(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e0e1e41ebece0ab9d4c052a641f0081
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.07469278573989868], [0.08045295625925064], [0.022016335278749466], [-0.023800522089004517], [0.013231731951236725], [0.058604270219802856]], dtype='float32').reshape([6, 1]),
-            paddle.to_tensor([[0.02797812409698963], [0.019563326612114906], [0.0015397188253700733], [-0.07706371694803238], [0.01333153247833252], [0.021454868838191032]], dtype='float32').reshape([6, 1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_92e167218c43ace3b631d9dd09c368c1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6869b440549846553242dab458ee42b6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 4116], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[[0.24354983866214752]]], dtype='float32').reshape([1, 1, 1]),
-        ]
-
-
-
-class PrimitiveOp_1252e93a0fedea11d028fadaaa588f5e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return input_0 / input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b28f7def5aa4b7ff00ac21ea08192327(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1252e93a0fedea11d028fadaaa588f5e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 19, 34], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 256, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c6bf680b69490fe029e977c78d66dc6d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 48, 48, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 48, 48, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7f2410859a0475f8ba1e59ebe88a3107(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 24, 24, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 24, 24, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1f055f33f8efa5bf16b05d83d48e9ea8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(56.545597076416016, dtype='float32').reshape([]),
-            paddle.to_tensor([7.0], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0e64dc21abaf3c01d9ea8964e81cf86c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(545.627197265625, dtype='float32').reshape([]),
-            paddle.to_tensor([4.0], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e598f62b9476ea8576bc5226c3832981(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d038adfdf55cd8f949a8fe4193c0f2c2
-    def get_inputs(self):
-        return [
-            paddle.uniform([2066, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2066, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e598f62b9476ea8576bc5226c3832981(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d038adfdf55cd8f949a8fe4193c0f2c2
-    def get_inputs(self):
-        return [
-            paddle.uniform([2066, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2066, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8de5242d3db1d209b1651f77ecd4e1cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(-179738.40625, dtype='float32').reshape([]),
-            paddle.to_tensor([0.428290992975235], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_972e8af54a970760c3caea145efbca02(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(117560.5234375, dtype='float32').reshape([]),
-            paddle.to_tensor([0.428290992975235], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_72c6f96f4bb201ca2238f704ef7b4447(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1252e93a0fedea11d028fadaaa588f5e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 152, 272], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_65b0c45d8679112e282521cae5d40f45(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 22, 22, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 22, 22, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c2118170edcaa1fd898971c11bc2f4f6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ecb18185dc865f9a1072115911e91a52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.32611703872680664], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_77c0a2540cdede335b8b423bb823db7a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d038adfdf55cd8f949a8fe4193c0f2c2
-    def get_inputs(self):
-        return [
-            paddle.uniform([4586, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4586, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_77c0a2540cdede335b8b423bb823db7a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d038adfdf55cd8f949a8fe4193c0f2c2
-    def get_inputs(self):
-        return [
-            paddle.uniform([4586, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4586, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e3eb611026d4f01159dd5a978f4b0a6f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(98509.40625, dtype='float32').reshape([]),
-            paddle.to_tensor([0.47686129808425903], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b6c6314a5f556865609e0cdbb125ad4d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(260535.21875, dtype='float32').reshape([]),
-            paddle.to_tensor([0.47686129808425903], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d122d65ec821ad9b85a8e455cdbd1bad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_603d97710ed6a19cc34142e06ccee4c9
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([300.60748291015625], dtype='float32').reshape([1]),
-            paddle.to_tensor(2434.0, dtype='float32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ad6d6e1918bc8f91d21ebce96ffdd98a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d038adfdf55cd8f949a8fe4193c0f2c2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1073, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1073, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ad6d6e1918bc8f91d21ebce96ffdd98a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d038adfdf55cd8f949a8fe4193c0f2c2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1073, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1073, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f11bc5572007eb7661b687541d48b8f0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(-6115.4853515625, dtype='float32').reshape([]),
-            paddle.to_tensor([0.334965318441391], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b9c328aa7490eafa4c1ed21bfc8401ce(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(15250.294921875, dtype='float32').reshape([]),
-            paddle.to_tensor([0.334965318441391], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_545d921ce54972722f299efa19089ae2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 46, 46, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 46, 46, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_feebc6be97f13502b438ab14fe6e4a58(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return input_0 / input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[100, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ee1910fdb1d3b18c9af00c2b1ec3685e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_feebc6be97f13502b438ab14fe6e4a58
-    def get_inputs(self):
-        return [
-            paddle.uniform([100, 4], dtype='float32', min=0, max=0.5),
-            paddle.uniform([100, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8e5e3bdfe45d5c39fe7879d52fd92449(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e0e1e41ebece0ab9d4c052a641f0081
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.16988317668437958, 0.29789793491363525, 0.23560066521167755, 0.4314672648906708], [0.2816462516784668, 0.243896022439003, 0.2503424882888794, 0.0755721852183342]], dtype='float32').reshape([2, 4]),
-            paddle.to_tensor([[0.42665088176727295, 0.02386130951344967, 0.088722363114357, 0.25869640707969666], [0.14058004319667816, 0.16565299034118652, 0.2700630724430084, 0.4724760949611664]], dtype='float32').reshape([2, 4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4850c1e2e60ea7a945cff314249a9a4c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 44, 44, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 44, 44, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_f3be92c408228e6de64cd519300442cd(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return input_0 / input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[6069, 2], dtype='float32'),
-            paddle.static.InputSpec(shape=[6069, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b1b86298853875c59536bbb5bc0ac6f5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f3be92c408228e6de64cd519300442cd
-    def get_inputs(self):
-        return [
-            paddle.uniform([6069, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([6069, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_672487b7a61e3971e7c1d3df47671b15(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return input_0 / input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[300, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_aeec1bb5bdb11ad5988b9587b8fe1444(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_672487b7a61e3971e7c1d3df47671b15
-    def get_inputs(self):
-        return [
-            paddle.uniform([300, 4], dtype='float32', min=0, max=0.5),
-            paddle.uniform([300, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c2ab1245651d2e34e81c7672b537df70(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e0e1e41ebece0ab9d4c052a641f0081
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.45354074239730835, 0.03292285278439522, 0.034126121550798416, 0.32247722148895264], [0.44396650791168213, 0.4546058773994446, 0.3682691156864166, 0.03122006542980671]], dtype='float32').reshape([2, 4]),
-            paddle.to_tensor([[0.2552684545516968, 0.22010958194732666, 0.09707565605640411, 0.2051355540752411], [0.08977971225976944, 0.08192609995603561, 0.3293353021144867, 0.4342966675758362]], dtype='float32').reshape([2, 4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_203f1466da35cd2066a74ffe433143cb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e0e1e41ebece0ab9d4c052a641f0081
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.0], [0.0], [0.0], [0.0], [0.0]], dtype='float32').reshape([5, 1]),
-            paddle.to_tensor([[-0.07234402745962143], [-0.048308003693819046], [-0.026102447882294655], [-0.060440488159656525], [0.03520594909787178]], dtype='float32').reshape([5, 1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5100f17043453784e6b1e155867c88fb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e0e1e41ebece0ab9d4c052a641f0081
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.04670782387256622], [0.12781548500061035], [0.030140815302729607], [0.14762821793556213], [-0.005115572363138199]], dtype='float32').reshape([5, 1]),
-            paddle.to_tensor([[-0.025636205449700356], [0.07950747758150101], [0.0040383669547736645], [0.08718772977590561], [0.03009037673473358]], dtype='float32').reshape([5, 1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9ea75a2e3782be8760cb9940eb6caad7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ecb18185dc865f9a1072115911e91a52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 128, 128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.4519156515598297], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_df13a428be372fa1e867c6ad008050a7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 38, 38, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 38, 38, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e1651d47886b31cc4d74a01c4a69a08e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 92, 92, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 92, 92, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d558c26136203421c57b4b72437d23ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 19, 19, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 19, 19, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c07d5f785421b9fb6f0b8fa6d22e55ae(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d038adfdf55cd8f949a8fe4193c0f2c2
-    def get_inputs(self):
-        return [
-            paddle.uniform([2383, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2383, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c07d5f785421b9fb6f0b8fa6d22e55ae(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d038adfdf55cd8f949a8fe4193c0f2c2
-    def get_inputs(self):
-        return [
-            paddle.uniform([2383, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2383, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cc4cc13da51069c6d0af7c9c02246673(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1743.7763671875, dtype='float32').reshape([]),
-            paddle.to_tensor([0.26781216263771057], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7ef8e96ab966a07c6928c4ff652dcc30(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(135492.34375, dtype='float32').reshape([]),
-            paddle.to_tensor([0.26781216263771057], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1876387fb81c80751028d7d362631e4c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d038adfdf55cd8f949a8fe4193c0f2c2
-    def get_inputs(self):
-        return [
-            paddle.uniform([3030, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([3030, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1876387fb81c80751028d7d362631e4c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d038adfdf55cd8f949a8fe4193c0f2c2
-    def get_inputs(self):
-        return [
-            paddle.uniform([3030, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([3030, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3862d7f7156f3b053f5c939d16ab2291(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(-1502477.375, dtype='float32').reshape([]),
-            paddle.to_tensor([0.18685953319072723], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6c303dddf198beee11abe9d494c6ae7c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(172054.765625, dtype='float32').reshape([]),
-            paddle.to_tensor([0.18685953319072723], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a46ead407b4ee0f94165cc2674bf798e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d038adfdf55cd8f949a8fe4193c0f2c2
-    def get_inputs(self):
-        return [
-            paddle.uniform([3787, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([3787, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a46ead407b4ee0f94165cc2674bf798e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d038adfdf55cd8f949a8fe4193c0f2c2
-    def get_inputs(self):
-        return [
-            paddle.uniform([3787, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([3787, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e91859f6f2c942eb242212c0c3761157(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(-67997.0625, dtype='float32').reshape([]),
-            paddle.to_tensor([0.08696781098842621], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a8be83cb5d57d4138455f986564a79d6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(215375.921875, dtype='float32').reshape([]),
-            paddle.to_tensor([0.08696781098842621], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ba2b838bed886936f9fa2d63f8f04b73(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ecb18185dc865f9a1072115911e91a52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 16, 16], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.11829502135515213], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_65b0c45d8679112e282521cae5d40f45(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 22, 22, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 22, 22, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8e0c16fbc4a889482cd7151372399d69(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(16.038949966430664, dtype='float32').reshape([]),
-            paddle.to_tensor([3.0], dtype='float32').reshape([1]),
-        ]
-
-
-
-class PrimitiveOp_47d5926b1613ce642fc4550e8e7db757(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return input_0 / input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[20267, 2], dtype='float32'),
-            paddle.static.InputSpec(shape=[20267, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f7ece3b82da49f3f7b38af7f85c6d03e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_47d5926b1613ce642fc4550e8e7db757
-    def get_inputs(self):
-        return [
-            paddle.uniform([20267, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([20267, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_241c11bfaa1fc6680c7efe8991df61d7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e0e1e41ebece0ab9d4c052a641f0081
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.0], [0.0], [0.0], [0.0]], dtype='float32').reshape([4, 1]),
-            paddle.to_tensor([[-0.006892362609505653], [-0.06635904312133789], [0.016340315341949463], [0.024487247690558434]], dtype='float32').reshape([4, 1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1b704b1bfa361860fd5cd805ccc8c80c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e0e1e41ebece0ab9d4c052a641f0081
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.02976311929523945], [0.11043037474155426], [-0.016202237457036972], [0.030512070283293724]], dtype='float32').reshape([4, 1]),
-            paddle.to_tensor([[0.022870756685733795], [0.04407133534550667], [0.00013807702634949237], [0.05499931797385216]], dtype='float32').reshape([4, 1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fab0767e74b2bd58259b777dbdfb0fb9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(4.882774829864502, dtype='float32').reshape([]),
-            paddle.to_tensor([7.0], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_224b1521025f115b9b3b41560b65f339(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d038adfdf55cd8f949a8fe4193c0f2c2
-    def get_inputs(self):
-        return [
-            paddle.uniform([2084, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2084, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_224b1521025f115b9b3b41560b65f339(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d038adfdf55cd8f949a8fe4193c0f2c2
-    def get_inputs(self):
-        return [
-            paddle.uniform([2084, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2084, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6b0e3761d5df4e24478ed66a5c314b52(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(26287.50390625, dtype='float32').reshape([]),
-            paddle.to_tensor([0.027686407789587975], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f7720cae48630570d1c3627cc1faad6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(29784.08203125, dtype='float32').reshape([]),
-            paddle.to_tensor([0.027686407789587975], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7501eee4606c8e86f4ef1c70ba00bcb3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ecb18185dc865f9a1072115911e91a52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.062410056591033936], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5149009af52b3fe2d23fce9c38766da2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(34.84958267211914, dtype='float32').reshape([]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-
-class PrimitiveOp_543225686aaffea8a323086251667a86(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return input_0 / input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[6804, 2], dtype='float32'),
-            paddle.static.InputSpec(shape=[6804, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1bd0e6845022d3deae5d66ed1e8d4b23(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_543225686aaffea8a323086251667a86
-    def get_inputs(self):
-        return [
-            paddle.uniform([6804, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([6804, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d558c26136203421c57b4b72437d23ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 19, 19, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 19, 19, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4cd97501f4cdb92e7de37f8d0adadddc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(237.1583709716797, dtype='float32').reshape([]),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_aa6d62752ae16d1e111e83deacd4fa84(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(135.99273681640625, dtype='float32').reshape([]),
-            paddle.to_tensor([7.0], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_128f67565db93e81675dd337049efee6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 84, 84, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 84, 84, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_73ad1292c5bdfe6e4908735e0fa958d1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 76, 76, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 76, 76, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_471a9a5b230463650fada284158e3ac1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d038adfdf55cd8f949a8fe4193c0f2c2
-    def get_inputs(self):
-        return [
-            paddle.uniform([4260, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4260, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_471a9a5b230463650fada284158e3ac1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d038adfdf55cd8f949a8fe4193c0f2c2
-    def get_inputs(self):
-        return [
-            paddle.uniform([4260, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4260, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_af5d1fd558f9c58a2dd778133dae7dfb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(-247443.984375, dtype='float32').reshape([]),
-            paddle.to_tensor([0.29301708936691284], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2e080dc4d6cd4bb20f939d9e6c75952f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(242372.078125, dtype='float32').reshape([]),
-            paddle.to_tensor([0.29301708936691284], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_73ad1292c5bdfe6e4908735e0fa958d1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 76, 76, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 76, 76, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8af2b94ad69e503cb9b248227a80e28d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 23, 23, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 23, 23, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8bc148db5d1868af7ef15bf4c7209676(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 11, 11, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 11, 11, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_99246cc82315afff38306c4b837860a4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6291b528d04c1a686a627623cddccfb6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 2100], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[[0.2437746524810791]]], dtype='float32').reshape([1, 1, 1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6462ec02d8d2f3f158e978ae530ed59b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e0e1e41ebece0ab9d4c052a641f0081
-    def get_inputs(self):
-        return [
-            paddle.uniform([12096, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([12096, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7f2410859a0475f8ba1e59ebe88a3107(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 24, 24, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 24, 24, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_926863dabbe694f2c349b4c63553e89c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 42, 42, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 42, 42, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_73c6c0742dcd54a77553300afceed010(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_603d97710ed6a19cc34142e06ccee4c9
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([1086.810546875], dtype='float32').reshape([1]),
-            paddle.to_tensor(8732.0, dtype='float32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_97425f754cf0d2f7aff75ae168c72e5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6291b528d04c1a686a627623cddccfb6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 6, 21824], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[[0.04387051612138748], [0.006444364320486784], [0.0013840912142768502], [0.002383661922067404], [0.010043814778327942], [0.012843224219977856]]], dtype='float32').reshape([1, 6, 1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_03e307baa06a8c5d6ac14c953ea21244(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6291b528d04c1a686a627623cddccfb6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 6, 21824], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[[0.0013636649819090962], [0.00024246115935966372], [1.1790663165811566e-06], [0.0015065179904922843], [0.026322603225708008], [0.0008185587357729673]]], dtype='float32').reshape([1, 6, 1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5abbb7de1a00219eb949d7d3d475850f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6291b528d04c1a686a627623cddccfb6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 6, 21824], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[[0.21084406971931458], [0.03786491975188255], [0.0058274222537875175], [0.03970283269882202], [0.21114251017570496], [0.07030598819255829]]], dtype='float32').reshape([1, 6, 1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_545d921ce54972722f299efa19089ae2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 46, 46, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 46, 46, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2efe02dd038765fcf805744686e8bba8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 12, 12, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 12, 12, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8af2b94ad69e503cb9b248227a80e28d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 23, 23, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 23, 23, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_128f67565db93e81675dd337049efee6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 84, 84, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 84, 84, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_853db930b30daec2ae58a4e7c8f2552a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(8.484230041503906, dtype='float32').reshape([]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a3faaff244fa86bc74d5b0ff446f23c0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(2.7180092334747314, dtype='float32').reshape([]),
-            paddle.to_tensor([2.0], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_df13a428be372fa1e867c6ad008050a7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 38, 38, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 38, 38, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_eede5cab62e842c1ccbd4a47a7a31b71(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e0e1e41ebece0ab9d4c052a641f0081
-    def get_inputs(self):
-        return [
-            paddle.uniform([1777, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1777, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_eede5cab62e842c1ccbd4a47a7a31b71(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e0e1e41ebece0ab9d4c052a641f0081
-    def get_inputs(self):
-        return [
-            paddle.uniform([1777, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1777, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e1fc689b8d7d5e80772cbcba96b642a3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(346003.25, dtype='float32').reshape([]),
-            paddle.to_tensor([0.19013376533985138], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9a90f111d3731a0070cb8db764af6733(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(101033.2890625, dtype='float32').reshape([]),
-            paddle.to_tensor([0.19013376533985138], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_921098ca62331b205732568a445790ce(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(958.122314453125, dtype='float32').reshape([]),
-            paddle.to_tensor([8.0], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c6bf680b69490fe029e977c78d66dc6d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 48, 48, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 48, 48, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c8eb03c9b06c9642e62120859f5de760(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 21, 21, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 21, 21, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_af7c301f2d77ad067ca5b0651cc985e0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e0e1e41ebece0ab9d4c052a641f0081
-    def get_inputs(self):
-        return [
-            paddle.uniform([5376, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([5376, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4850c1e2e60ea7a945cff314249a9a4c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 44, 44, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 44, 44, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e1651d47886b31cc4d74a01c4a69a08e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 92, 92, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 92, 92, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7c9352859535e97563b44268e35e7f4e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e0e1e41ebece0ab9d4c052a641f0081
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0]], dtype='float32').reshape([9, 1]),
-            paddle.to_tensor([[0.023871352896094322], [0.0072302743792533875], [0.028566552326083183], [-0.012393927201628685], [-0.014890296384692192], [-0.004542335867881775], [-0.037730999290943146], [0.046309053897857666], [0.10882711410522461]], dtype='float32').reshape([9, 1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8246227336be39ec1e26fb63f4bd5b75(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e0e1e41ebece0ab9d4c052a641f0081
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[-0.024478740990161896], [-0.02582566812634468], [-0.006173903122544289], [0.01932423934340477], [0.08787506818771362], [-0.010301673784852028], [0.05171448737382889], [-0.04585982486605644], [-0.08655987679958344]], dtype='float32').reshape([9, 1]),
-            paddle.to_tensor([[-0.000607388443313539], [-0.018595393747091293], [0.022392649203538895], [0.00693031121045351], [0.07298476994037628], [-0.014844009652733803], [0.013983488082885742], [0.00044922734377905726], [0.022267237305641174]], dtype='float32').reshape([9, 1]),
-        ]
-
-
-
-class PrimitiveOp_11a6c2ce7213d45a7b8f7fce3e64d8a6(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return input_0 / input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4e932d49e4d116f227f29c4df224b793(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_11a6c2ce7213d45a7b8f7fce3e64d8a6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 8, 8], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.09322686493396759], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_92b09a8749f940c5679911b87b15196a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e0e1e41ebece0ab9d4c052a641f0081
-    def get_inputs(self):
-        return [
-            paddle.uniform([5480, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([5480, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_92b09a8749f940c5679911b87b15196a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e0e1e41ebece0ab9d4c052a641f0081
-    def get_inputs(self):
-        return [
-            paddle.uniform([5480, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([5480, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_228375fea0084968cd1fde3b2df5734a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(4180.6708984375, dtype='float32').reshape([]),
-            paddle.to_tensor([0.43763113021850586], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ba880e7d579a37f105322444b3763c4e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(3885.515625, dtype='float32').reshape([]),
-            paddle.to_tensor([0.43763113021850586], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6aca0e5f55e8895dcb00516fc66aa8df(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5e8106aa512a8da9fae679f4b94ae655
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0006146249361336231, 0.0, 0.0, 0.0, 0.0, -0.0], dtype='float32').reshape([6]),
-            paddle.to_tensor([0.03883463516831398, 0.00019726970640476793, 0.024178875610232353, 0.002077957382425666, 0.0006825196905992925, 0.02110004797577858], dtype='float32').reshape([6]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_dfd93f7e9da2aaa51da7f4df70edb08f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5e8106aa512a8da9fae679f4b94ae655
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.017001358792185783, 0.11817431449890137, 0.014661362394690514, 0.04215633124113083, 0.03779536485671997, 0.003305346705019474], dtype='float32').reshape([6]),
-            paddle.to_tensor([0.09524781256914139, 0.1662207990884781, 0.04816321283578873, 0.137531116604805, 0.04644821956753731, 0.1607235223054886], dtype='float32').reshape([6]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cf2594d47c192a296e47a83022fd8d1f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5e8106aa512a8da9fae679f4b94ae655
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.019291505217552185, 0.04946009814739227, -0.3934049606323242, 0.016018692404031754, 0.011264503002166748, 0.3699343204498291], dtype='float32').reshape([6]),
-            paddle.to_tensor([0.053903549909591675, 0.0039884597063064575, -0.061460524797439575, 0.1297207921743393, 0.06059029698371887, 0.05703727900981903], dtype='float32').reshape([6]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_18ec6063aad8b9202eab8d32099dd15f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5e8106aa512a8da9fae679f4b94ae655
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.1580319106578827, 0.08440583944320679, 0.15580785274505615, -0.13296881318092346, -0.32250675559043884, 0.2714036703109741], dtype='float32').reshape([6]),
-            paddle.to_tensor([0.24304825067520142, -0.07321910560131073, -0.13661599159240723, 0.16679298877716064, 0.09022623300552368, -0.21981266140937805], dtype='float32').reshape([6]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_88ce3d7fff92115a8256324c63bcf361(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5e8106aa512a8da9fae679f4b94ae655
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.021971477195620537, 2.231677532196045, 2.0824294090270996, 0.2567308843135834, 0.8899200558662415, 2.1586368083953857], dtype='float32').reshape([6]),
-            paddle.to_tensor([1.0061447620391846, 3.231677532196045, 3.0824294090270996, 1.2567309141159058, 1.8899199962615967, 3.1586368083953857], dtype='float32').reshape([6]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_16fda869c91fad5c8202f1486765dc3a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e0e1e41ebece0ab9d4c052a641f0081
-    def get_inputs(self):
-        return [
-            paddle.uniform([1742, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1742, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_16fda869c91fad5c8202f1486765dc3a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e0e1e41ebece0ab9d4c052a641f0081
-    def get_inputs(self):
-        return [
-            paddle.uniform([1742, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1742, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bcfa7f87d8563450c50a9e4136340bf8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(35792.1875, dtype='float32').reshape([]),
-            paddle.to_tensor([0.27057820558547974], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4d12731118a83726911b49afd9984606(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(102936.0, dtype='float32').reshape([]),
-            paddle.to_tensor([0.27057820558547974], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_08d20d088bbb008f1174a4fcaa99b9d3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(964.3115844726562, dtype='float32').reshape([]),
-            paddle.to_tensor([4.0], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fb02871ddcb4313c0b1c90f660858193(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e0e1e41ebece0ab9d4c052a641f0081
-    def get_inputs(self):
-        return [
-            paddle.uniform([8400, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([8400, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_67d7f8cfed71c4d3601fdbefae2a90db(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return input_0 / input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d5a7f87e8241495cb9482d5fec4d9830(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_67d7f8cfed71c4d3601fdbefae2a90db
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 38, 38], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 38, 38], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_926863dabbe694f2c349b4c63553e89c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 42, 42, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 42, 42, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c8eb03c9b06c9642e62120859f5de760(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 21, 21, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 21, 21, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ae9d16ed64fe30af3dd4c72721af5c1e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e0e1e41ebece0ab9d4c052a641f0081
-    def get_inputs(self):
-        return [
-            paddle.uniform([1527, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1527, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ae9d16ed64fe30af3dd4c72721af5c1e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e0e1e41ebece0ab9d4c052a641f0081
-    def get_inputs(self):
-        return [
-            paddle.uniform([1527, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1527, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9ed1039e09b8bda6a55458abf7292420(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(-3337835.75, dtype='float32').reshape([]),
-            paddle.to_tensor([0.4929847717285156], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ce868fd553249b33c225ce5f3c72d922(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(86924.4765625, dtype='float32').reshape([]),
-            paddle.to_tensor([0.4929847717285156], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_76a5a70e0b731e05316b7ff456341641(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6291b528d04c1a686a627623cddccfb6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 3549], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[[0.2430911511182785], [0.23496943712234497]]], dtype='float32').reshape([1, 2, 1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2efe02dd038765fcf805744686e8bba8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 12, 12, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 12, 12, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8bc148db5d1868af7ef15bf4c7209676(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 11, 11, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 11, 11, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_df466c703154fcf478fcd1e4aa862d2d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e0e1e41ebece0ab9d4c052a641f0081
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.0]], dtype='float32').reshape([1, 1]),
-            paddle.to_tensor([[0.07083103060722351]], dtype='float32').reshape([1, 1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fa547a5c8f4ce84af3378ad0acec48bc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e0e1e41ebece0ab9d4c052a641f0081
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[-0.0832149088382721]], dtype='float32').reshape([1, 1]),
-            paddle.to_tensor([[-0.012383874505758286]], dtype='float32').reshape([1, 1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fd1283ab1d0e259cd5bdf9e5ca6abadf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e0e1e41ebece0ab9d4c052a641f0081
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.0], [0.0], [0.0], [0.0], [0.0], [0.0]], dtype='float32').reshape([6, 1]),
-            paddle.to_tensor([[-0.0467146635055542], [-0.060889631509780884], [-0.02047661691904068], [-0.05326319485902786], [9.980086178984493e-05], [-0.037149399518966675]], dtype='float32').reshape([6, 1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fdc9ba2ccf5339d5cf646086aebd1918(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e0e1e41ebece0ab9d4c052a641f0081
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.07469278573989868], [0.08045295625925064], [0.022016335278749466], [-0.023800522089004517], [0.013231731951236725], [0.058604270219802856]], dtype='float32').reshape([6, 1]),
-            paddle.to_tensor([[0.02797812409698963], [0.019563326612114906], [0.0015397188253700733], [-0.07706371694803238], [0.01333153247833252], [0.021454868838191032]], dtype='float32').reshape([6, 1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3026ec2cb8b4d41a0fa2607d019f36ec(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6291b528d04c1a686a627623cddccfb6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 4116], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[[0.24354983866214752]]], dtype='float32').reshape([1, 1, 1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c68261dbce3e9f585b6d870b3c7076ca(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_67d7f8cfed71c4d3601fdbefae2a90db
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 19, 34], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 256, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c6bf680b69490fe029e977c78d66dc6d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 48, 48, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 48, 48, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7f2410859a0475f8ba1e59ebe88a3107(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 24, 24, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 24, 24, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1f055f33f8efa5bf16b05d83d48e9ea8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(56.545597076416016, dtype='float32').reshape([]),
-            paddle.to_tensor([7.0], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0e64dc21abaf3c01d9ea8964e81cf86c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(545.627197265625, dtype='float32').reshape([]),
-            paddle.to_tensor([4.0], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3ec4e62d982b300b33158b7b5974771e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e0e1e41ebece0ab9d4c052a641f0081
-    def get_inputs(self):
-        return [
-            paddle.uniform([2066, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2066, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3ec4e62d982b300b33158b7b5974771e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e0e1e41ebece0ab9d4c052a641f0081
-    def get_inputs(self):
-        return [
-            paddle.uniform([2066, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2066, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8de5242d3db1d209b1651f77ecd4e1cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(-179738.40625, dtype='float32').reshape([]),
-            paddle.to_tensor([0.428290992975235], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_972e8af54a970760c3caea145efbca02(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(117560.5234375, dtype='float32').reshape([]),
-            paddle.to_tensor([0.428290992975235], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b1b2fe400a1294adc1ce71812a6ac7f0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_67d7f8cfed71c4d3601fdbefae2a90db
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 152, 272], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_65b0c45d8679112e282521cae5d40f45(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 22, 22, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 22, 22, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9024fef891d250560ab3c70c82944a63(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_11a6c2ce7213d45a7b8f7fce3e64d8a6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.32611703872680664], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_852602b2c4fb110ddd7726ea3caa66b0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e0e1e41ebece0ab9d4c052a641f0081
-    def get_inputs(self):
-        return [
-            paddle.uniform([4586, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4586, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_852602b2c4fb110ddd7726ea3caa66b0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e0e1e41ebece0ab9d4c052a641f0081
-    def get_inputs(self):
-        return [
-            paddle.uniform([4586, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4586, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e3eb611026d4f01159dd5a978f4b0a6f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(98509.40625, dtype='float32').reshape([]),
-            paddle.to_tensor([0.47686129808425903], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b6c6314a5f556865609e0cdbb125ad4d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(260535.21875, dtype='float32').reshape([]),
-            paddle.to_tensor([0.47686129808425903], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d122d65ec821ad9b85a8e455cdbd1bad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_603d97710ed6a19cc34142e06ccee4c9
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([300.60748291015625], dtype='float32').reshape([1]),
-            paddle.to_tensor(2434.0, dtype='float32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6e9159f648648db4afa4a722e5b66395(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e0e1e41ebece0ab9d4c052a641f0081
-    def get_inputs(self):
-        return [
-            paddle.uniform([1073, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1073, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6e9159f648648db4afa4a722e5b66395(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e0e1e41ebece0ab9d4c052a641f0081
-    def get_inputs(self):
-        return [
-            paddle.uniform([1073, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1073, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f11bc5572007eb7661b687541d48b8f0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(-6115.4853515625, dtype='float32').reshape([]),
-            paddle.to_tensor([0.334965318441391], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b9c328aa7490eafa4c1ed21bfc8401ce(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(15250.294921875, dtype='float32').reshape([]),
-            paddle.to_tensor([0.334965318441391], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_545d921ce54972722f299efa19089ae2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 46, 46, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 46, 46, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b8e08c35b938a307e103ec0e962f34c9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e0e1e41ebece0ab9d4c052a641f0081
-    def get_inputs(self):
-        return [
-            paddle.uniform([100, 4], dtype='float32', min=0, max=0.5),
-            paddle.uniform([100, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8e5e3bdfe45d5c39fe7879d52fd92449(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e0e1e41ebece0ab9d4c052a641f0081
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.16988317668437958, 0.29789793491363525, 0.23560066521167755, 0.4314672648906708], [0.2816462516784668, 0.243896022439003, 0.2503424882888794, 0.0755721852183342]], dtype='float32').reshape([2, 4]),
-            paddle.to_tensor([[0.42665088176727295, 0.02386130951344967, 0.088722363114357, 0.25869640707969666], [0.14058004319667816, 0.16565299034118652, 0.2700630724430084, 0.4724760949611664]], dtype='float32').reshape([2, 4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4850c1e2e60ea7a945cff314249a9a4c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 44, 44, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 44, 44, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6d1d74352a5079d3dcd10e253979bfd7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e0e1e41ebece0ab9d4c052a641f0081
-    def get_inputs(self):
-        return [
-            paddle.uniform([6069, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([6069, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8f0dfb8de58d3a290a2101ce3e1e2a1a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e0e1e41ebece0ab9d4c052a641f0081
-    def get_inputs(self):
-        return [
-            paddle.uniform([300, 4], dtype='float32', min=0, max=0.5),
-            paddle.uniform([300, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c2ab1245651d2e34e81c7672b537df70(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e0e1e41ebece0ab9d4c052a641f0081
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.45354074239730835, 0.03292285278439522, 0.034126121550798416, 0.32247722148895264], [0.44396650791168213, 0.4546058773994446, 0.3682691156864166, 0.03122006542980671]], dtype='float32').reshape([2, 4]),
-            paddle.to_tensor([[0.2552684545516968, 0.22010958194732666, 0.09707565605640411, 0.2051355540752411], [0.08977971225976944, 0.08192609995603561, 0.3293353021144867, 0.4342966675758362]], dtype='float32').reshape([2, 4]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_203f1466da35cd2066a74ffe433143cb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e0e1e41ebece0ab9d4c052a641f0081
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.0], [0.0], [0.0], [0.0], [0.0]], dtype='float32').reshape([5, 1]),
-            paddle.to_tensor([[-0.07234402745962143], [-0.048308003693819046], [-0.026102447882294655], [-0.060440488159656525], [0.03520594909787178]], dtype='float32').reshape([5, 1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5100f17043453784e6b1e155867c88fb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e0e1e41ebece0ab9d4c052a641f0081
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.04670782387256622], [0.12781548500061035], [0.030140815302729607], [0.14762821793556213], [-0.005115572363138199]], dtype='float32').reshape([5, 1]),
-            paddle.to_tensor([[-0.025636205449700356], [0.07950747758150101], [0.0040383669547736645], [0.08718772977590561], [0.03009037673473358]], dtype='float32').reshape([5, 1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_19aba5cf48a578031bf00d61dac2a1cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_11a6c2ce7213d45a7b8f7fce3e64d8a6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 128, 128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.4519156515598297], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_df13a428be372fa1e867c6ad008050a7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 38, 38, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 38, 38, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e1651d47886b31cc4d74a01c4a69a08e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 92, 92, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 92, 92, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d558c26136203421c57b4b72437d23ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 19, 19, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 19, 19, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4d87d52648aa3d9c6ab9fda5beaeefc9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e0e1e41ebece0ab9d4c052a641f0081
-    def get_inputs(self):
-        return [
-            paddle.uniform([2383, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2383, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4d87d52648aa3d9c6ab9fda5beaeefc9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e0e1e41ebece0ab9d4c052a641f0081
-    def get_inputs(self):
-        return [
-            paddle.uniform([2383, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2383, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cc4cc13da51069c6d0af7c9c02246673(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1743.7763671875, dtype='float32').reshape([]),
-            paddle.to_tensor([0.26781216263771057], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7ef8e96ab966a07c6928c4ff652dcc30(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(135492.34375, dtype='float32').reshape([]),
-            paddle.to_tensor([0.26781216263771057], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2055ffb3105ca4affca77396959f6526(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e0e1e41ebece0ab9d4c052a641f0081
-    def get_inputs(self):
-        return [
-            paddle.uniform([3030, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([3030, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2055ffb3105ca4affca77396959f6526(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e0e1e41ebece0ab9d4c052a641f0081
-    def get_inputs(self):
-        return [
-            paddle.uniform([3030, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([3030, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3862d7f7156f3b053f5c939d16ab2291(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(-1502477.375, dtype='float32').reshape([]),
-            paddle.to_tensor([0.18685953319072723], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6c303dddf198beee11abe9d494c6ae7c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(172054.765625, dtype='float32').reshape([]),
-            paddle.to_tensor([0.18685953319072723], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e0519dad5f19f633f86f003947ad2708(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e0e1e41ebece0ab9d4c052a641f0081
-    def get_inputs(self):
-        return [
-            paddle.uniform([3787, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([3787, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e0519dad5f19f633f86f003947ad2708(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e0e1e41ebece0ab9d4c052a641f0081
-    def get_inputs(self):
-        return [
-            paddle.uniform([3787, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([3787, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e91859f6f2c942eb242212c0c3761157(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(-67997.0625, dtype='float32').reshape([]),
-            paddle.to_tensor([0.08696781098842621], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a8be83cb5d57d4138455f986564a79d6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(215375.921875, dtype='float32').reshape([]),
-            paddle.to_tensor([0.08696781098842621], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_aa89113bd9f266254e5e69e7d040054b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_11a6c2ce7213d45a7b8f7fce3e64d8a6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 16, 16], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.11829502135515213], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_65b0c45d8679112e282521cae5d40f45(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 22, 22, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 22, 22, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8e0c16fbc4a889482cd7151372399d69(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(16.038949966430664, dtype='float32').reshape([]),
-            paddle.to_tensor([3.0], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3999dd338e35ea7e376af8a1b9b43666(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e0e1e41ebece0ab9d4c052a641f0081
-    def get_inputs(self):
-        return [
-            paddle.uniform([20267, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([20267, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_241c11bfaa1fc6680c7efe8991df61d7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e0e1e41ebece0ab9d4c052a641f0081
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.0], [0.0], [0.0], [0.0]], dtype='float32').reshape([4, 1]),
-            paddle.to_tensor([[-0.006892362609505653], [-0.06635904312133789], [0.016340315341949463], [0.024487247690558434]], dtype='float32').reshape([4, 1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1b704b1bfa361860fd5cd805ccc8c80c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e0e1e41ebece0ab9d4c052a641f0081
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.02976311929523945], [0.11043037474155426], [-0.016202237457036972], [0.030512070283293724]], dtype='float32').reshape([4, 1]),
-            paddle.to_tensor([[0.022870756685733795], [0.04407133534550667], [0.00013807702634949237], [0.05499931797385216]], dtype='float32').reshape([4, 1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fab0767e74b2bd58259b777dbdfb0fb9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(4.882774829864502, dtype='float32').reshape([]),
-            paddle.to_tensor([7.0], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4bcbdbb36a57a7febb6055c9452bd5a6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e0e1e41ebece0ab9d4c052a641f0081
-    def get_inputs(self):
-        return [
-            paddle.uniform([2084, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2084, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4bcbdbb36a57a7febb6055c9452bd5a6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e0e1e41ebece0ab9d4c052a641f0081
-    def get_inputs(self):
-        return [
-            paddle.uniform([2084, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2084, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6b0e3761d5df4e24478ed66a5c314b52(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(26287.50390625, dtype='float32').reshape([]),
-            paddle.to_tensor([0.027686407789587975], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f7720cae48630570d1c3627cc1faad6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(29784.08203125, dtype='float32').reshape([]),
-            paddle.to_tensor([0.027686407789587975], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b31b338e9e57a91501cfd79ef0a455b4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_11a6c2ce7213d45a7b8f7fce3e64d8a6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.062410056591033936], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5149009af52b3fe2d23fce9c38766da2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(34.84958267211914, dtype='float32').reshape([]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0397f679ef047f77df7cf4861ef4eff1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e0e1e41ebece0ab9d4c052a641f0081
-    def get_inputs(self):
-        return [
-            paddle.uniform([6804, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([6804, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d558c26136203421c57b4b72437d23ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 19, 19, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 19, 19, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4cd97501f4cdb92e7de37f8d0adadddc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(237.1583709716797, dtype='float32').reshape([]),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_aa6d62752ae16d1e111e83deacd4fa84(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(135.99273681640625, dtype='float32').reshape([]),
-            paddle.to_tensor([7.0], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_128f67565db93e81675dd337049efee6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 84, 84, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 84, 84, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_73ad1292c5bdfe6e4908735e0fa958d1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 76, 76, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 76, 76, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c7011b49182073feeb10ac628503b9ee(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e0e1e41ebece0ab9d4c052a641f0081
-    def get_inputs(self):
-        return [
-            paddle.uniform([4260, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4260, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c7011b49182073feeb10ac628503b9ee(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e0e1e41ebece0ab9d4c052a641f0081
-    def get_inputs(self):
-        return [
-            paddle.uniform([4260, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4260, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_af5d1fd558f9c58a2dd778133dae7dfb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(-247443.984375, dtype='float32').reshape([]),
-            paddle.to_tensor([0.29301708936691284], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2e080dc4d6cd4bb20f939d9e6c75952f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2c98db0a4df011e0d88394462a48e3c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(242372.078125, dtype='float32').reshape([]),
-            paddle.to_tensor([0.29301708936691284], dtype='float32').reshape([1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_73ad1292c5bdfe6e4908735e0fa958d1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_891a275dac9f8869a5ead59ebd0cc998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 76, 76, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 76, 76, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+if __name__ == "__main__":
+    sys.exit(table.main(__file__))
@@ -1,817 +1,28 @@
 import os
-os.environ['FLAGS_cinn_new_group_scheduler'] = '1'
-os.environ['FLAGS_group_schedule_tiling_first'] = '1'
-os.environ['FLAGS_enable_pir_api'] = '1'
-os.environ['FLAGS_cinn_bucket_compile'] = '1'
 import sys
-import unittest
-import numpy as np
-from dataclasses import dataclass
-import typing as t
 
-@dataclass
-class Stage:
-    name: str
-    env_vars: t.Dict[str, str]
+import pytest
 
-cinn_stages = [
-    Stage(
-        name="dynamic_to_static",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=False,
-            FLAGS_prim_all=False,
-            FLAGS_prim_enable_dynamic=False,
-        ),
-    ),
-    Stage(
-        name="prim",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=False,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-        ),
-    ),
-    Stage(
-        name="infer_symbolic",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=False,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-            FLAGS_use_cinn=False,
-            FLAGS_check_infer_symbolic=True,
-        ),
-    ),
-	Stage(
-        name="frontend",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=True,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-            FLAGS_use_cinn=True,
-            FLAGS_check_infer_symbolic=False,
-            FLAGS_enable_fusion_fallback=True,
-        ), 
-    ),
-    Stage(
-        name="backend",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=True,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-            FLAGS_use_cinn=True,
-            FLAGS_check_infer_symbolic=False,
-            FLAGS_enable_fusion_fallback=False,
-        ), 
-    ),
-]
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir, os.pardir))
+from tools.e2e_case_stage import CinnStages  # noqa: E402
 
-def GetCinnStageByName(name):
-    for stage in cinn_stages:
-        if stage.name == name:
-            return stage
-    return None
+stages = CinnStages(__file__)
 
-def GetCurrentCinnStage():
-    name = os.getenv('PADDLE_DEBUG_CINN_STAGE_NAME')
-    if name is None:
-        return None
-    stage_names = [stage.name for stage in cinn_stages]
-    assert name in stage_names, (
-        f"PADDLE_DEBUG_CINN_STAGE_NAME should be in {stage_names}"
-    )
-    return GetCinnStageByName(name)
+from tools.e2e_case_table import E2ECaseTable, CinnTestBase  # noqa: E402
 
-def GetPrevCinnStage(stage):
-    for i in range(1, len(cinn_stages)):
-        if stage is cinn_stages[i]:
-            return cinn_stages[i - 1]
-    return None
+stages.apply()
+table = E2ECaseTable(__file__)
+last_stage_failed = stages.last_stage_failed()
 
-def IsCinnStageEnableDiff():
-    value = os.getenv('PADDLE_DEBUG_CINN_STAGE_ENABLE_DIFF')
-    enabled = value in {
-        '1',
-        'true',
-        'True',
-    }
-    if enabled:
-        assert GetCurrentCinnStage() is not None
-    return enabled
 
-last_cinn_stage_exit_code = None
-def LastCINNStageFailed():
-    global last_cinn_stage_exit_code
-    if last_cinn_stage_exit_code is not None:
-        return last_cinn_stage_exit_code != 0
-    last_stage = GetPrevCinnStage(GetCurrentCinnStage())
-    if last_stage is None:
-        return False
-    env_vars = dict(
-        PADDLE_DEBUG_CINN_STAGE_NAME=last_stage.name,
-        PADDLE_DEBUG_CINN_STAGE_ENABLE_DIFF='0',
-    )
-    env_vars_str = " ".join(
-        f"{env_var}={value}"
-        for env_var, value in env_vars.items()
-    )
-    last_cinn_stage_exit_code = os.system(
-        f"{env_vars_str} {sys.executable} {__file__} > /dev/null 2>&1"
-    )
-    return last_cinn_stage_exit_code != 0
+def pytest_generate_tests(metafunc):
+    table.parametrize(metafunc)
 
-def SetDefaultEnv(**env_var2value):
-    for env_var, value in env_var2value.items():
-        if os.getenv(env_var) is None:
-            os.environ[env_var] = str(value)
 
-SetDefaultEnv(
-    PADDLE_DEBUG_CINN_STAGE_NAME="backend",
-    PADDLE_DEBUG_CINN_STAGE_ENABLE_DIFF=False,
-    PADDLE_DEBUG_ENABLE_CINN=True,
-    FLAGS_enable_pir_api=True,
-    FLAGS_prim_all=True,
-    FLAGS_prim_enable_dynamic=True,
-    FLAGS_use_cinn=False,
-    FLAGS_check_infer_symbolic=False,
-    FLAGS_enable_fusion_fallback=False,
-)
+@pytest.mark.skipif(last_stage_failed, reason="last stage failed")
+class TestPrimitiveOp(CinnTestBase):
+    table = table
 
-import paddle
 
-def SetEnvVar(env_var2value):
-    for env_var, value in env_var2value.items():
-        os.environ[env_var] = str(value)
-    paddle.set_flags({
-        env_var:value
-        for env_var, value in env_var2value.items()
-        if env_var.startswith('FLAGS_')
-    })
-
-if GetCurrentCinnStage() is not None:
-    SetEnvVar(GetCurrentCinnStage().env_vars)
-
-def GetEnvVarEnableJit():
-    enable_jit = os.getenv('PADDLE_DEBUG_ENABLE_JIT')
-    return enable_jit not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
-
-def GetEnvVarEnableCinn():
-    enable_cinn = os.getenv('PADDLE_DEBUG_ENABLE_CINN')
-    if enable_cinn is None:
-        return True
-    return enable_cinn not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
-
-
-def GetTolerance(dtype):
-    if dtype == np.float16:
-        return GetFloat16Tolerance()
-    if dtype == np.float32:
-        return GetFloat32Tolerance()
-    return 1e-6
-
-def GetFloat16Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT16_TOL'))
-    except:
-        return 1e-3
-
-def GetFloat32Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT32_TOL'))
-    except:
-        return 1e-6
-
-def IsInteger(dtype):
-    return np.dtype(dtype).char in np.typecodes['AllInteger']
-
-def ApplyToStatic(net, use_cinn):
-    build_strategy = paddle.static.BuildStrategy()
-    build_strategy.build_cinn_pass = use_cinn
-    return paddle.jit.to_static(
-        net,
-        input_spec=net.get_input_spec(),
-        build_strategy=build_strategy,
-        full_graph=True,
-    )
-
-class InstanceTrait:
-
-    @classmethod
-    def instance(cls):
-        if cls.instance_ is None:
-            cls.instance_ = cls()
-        return cls.instance_
-
-    @classmethod
-    def static_instance_with_cinn(cls):
-        if cls.static_instance_with_cinn_ is None:
-            cls.static_instance_with_cinn_ = ApplyToStatic(
-                cls.instance(),
-                use_cinn=True
-            )
-        return cls.static_instance_with_cinn_
-
-    @classmethod
-    def static_instance_without_cinn(cls):
-        if cls.static_instance_without_cinn_ is None:
-            cls.static_instance_without_cinn_ = ApplyToStatic(
-                cls.instance(),
-                use_cinn=False
-            )
-        return cls.static_instance_without_cinn_
-
-
-class CinnTestBase:
-
-    def setUp(self):
-        paddle.seed(2024)
-        self.prepare_data()
-
-    def test_train(self):
-        dy_outs = self.train(use_cinn=False)
-        cinn_outs = self.train(use_cinn=GetEnvVarEnableCinn())
-
-        for cinn_out, dy_out in zip(cinn_outs, dy_outs):
-          if type(cinn_out) is list and type(dy_out) is list:
-            for x, y in zip(cinn_out, dy_out):
-              self.assert_all_close(x, y)
-          else:
-            self.assert_all_close(cinn_out, dy_out)
-
-    def train(self, use_cinn):
-        if GetEnvVarEnableJit():
-            net = self.prepare_static_net(use_cinn)
-        else:
-            net = self.prepare_net()
-        paddle.seed(2024)
-        out = net(*self.inputs)
-        return out
-    
-    def prepare_data(self):
-        self.inputs = self.get_inputs()
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def prepare_net(self):
-        return self.get_test_class().instance()
-
-    def prepare_static_net(self, use_cinn):
-        if use_cinn:
-            return self.get_test_class().static_instance_with_cinn()
-        else:
-            return self.get_test_class().static_instance_without_cinn()
-
-    def assert_all_close(self, x, y):
-        if (hasattr(x, "numpy") and hasattr(y, "numpy")):
-            x_numpy = x.numpy()
-            y_numpy = y.numpy()
-            assert x_numpy.dtype == y_numpy.dtype
-            if IsInteger(x_numpy.dtype):
-                np.testing.assert_equal(x_numpy, y_numpy)
-            else:
-                tol = GetTolerance(x_numpy.dtype)
-                np.testing.assert_allclose(x_numpy, y_numpy, atol=tol, rtol=tol)
-        else:
-            assert x == y
-
-
-
-
-
-last_stage_failed = (IsCinnStageEnableDiff() and LastCINNStageFailed())
-class PrimitiveOp_04da482c7547bd96a6f081454d6c94a3(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.equal(input_0, input_1)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None], dtype='int32'),
-            paddle.static.InputSpec(shape=[], dtype='int32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_34604584e46c6c0cbddbef4faa769055(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_04da482c7547bd96a6f081454d6c94a3
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[86970], dtype='int32'),
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_529b12190ebcf37e84225bde48a51bb8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_04da482c7547bd96a6f081454d6c94a3
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[242991], dtype='int32'),
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f22679b5c72f717929f9a0d91b7a896f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_04da482c7547bd96a6f081454d6c94a3
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[220968], dtype='int32'),
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f63d35b57920eb7b00f494a0f9025459(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_04da482c7547bd96a6f081454d6c94a3
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[153450], dtype='int32'),
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ddfbfe6e38f771e26ca8e8123fa4086d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_04da482c7547bd96a6f081454d6c94a3
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[2002], dtype='int32'),
-            paddle.to_tensor(0, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0511b85c42bf81b050adcaad159af7d5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_04da482c7547bd96a6f081454d6c94a3
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[2002], dtype='int32'),
-            paddle.to_tensor(-1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3f706fcbb4ae72d1b1c31f6ff7edd50e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_04da482c7547bd96a6f081454d6c94a3
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[185691], dtype='int32'),
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f7d48bc2d51c1436396208b324947f3e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_04da482c7547bd96a6f081454d6c94a3
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1021], dtype='int32'),
-            paddle.to_tensor(0, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ffb1c16a0f8f5ef7b2c6daca04ef449c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_04da482c7547bd96a6f081454d6c94a3
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1021], dtype='int32'),
-            paddle.to_tensor(-1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_31547b7dc9bdecb1ca26aa92162ccdf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_04da482c7547bd96a6f081454d6c94a3
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1002], dtype='int32'),
-            paddle.to_tensor(0, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3e0c980d05b57212d3a347b2a221702f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_04da482c7547bd96a6f081454d6c94a3
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1002], dtype='int32'),
-            paddle.to_tensor(-1, dtype='int32').reshape([]),
-        ]
-
-
-
-class PrimitiveOp_35243965b233551857a6f5ab23553235(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.equal(input_0, input_1)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[], dtype='int32'),
-            paddle.static.InputSpec(shape=[], dtype='int32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_55ef1a94dfe01459d2d6bb08c5852d60(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_35243965b233551857a6f5ab23553235
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1025, dtype='int32').reshape([]),
-            paddle.to_tensor(1025, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2ba8a94048a6a7dcf1164ec1089c8e1d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_04da482c7547bd96a6f081454d6c94a3
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[113061], dtype='int32'),
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_61e4a7dcd5ca18de46b692e3f1a49ee9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_04da482c7547bd96a6f081454d6c94a3
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[205923], dtype='int32'),
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4077f35f208e58b394b90cc4a75e4212(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_04da482c7547bd96a6f081454d6c94a3
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[123783], dtype='int32'),
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8ee61c139282781299ce9d91d6a6eea3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_04da482c7547bd96a6f081454d6c94a3
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[171888], dtype='int32'),
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f76e2f2c0de8b2d4a800278ae52eeb20(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_04da482c7547bd96a6f081454d6c94a3
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[217413], dtype='int32'),
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_658356b0b70835fbeeede3188a535c81(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_04da482c7547bd96a6f081454d6c94a3
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1027], dtype='int32'),
-            paddle.to_tensor(0, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_59e3326e9d662ef2a7857a3b3577208f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_04da482c7547bd96a6f081454d6c94a3
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1027], dtype='int32'),
-            paddle.to_tensor(-1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9cf49fe8063d22e9f9cfbbc20d91d055(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_04da482c7547bd96a6f081454d6c94a3
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[185658], dtype='int32'),
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_34604584e46c6c0cbddbef4faa769055(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_04da482c7547bd96a6f081454d6c94a3
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[86970], dtype='int32'),
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_529b12190ebcf37e84225bde48a51bb8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_04da482c7547bd96a6f081454d6c94a3
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[242991], dtype='int32'),
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f22679b5c72f717929f9a0d91b7a896f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_04da482c7547bd96a6f081454d6c94a3
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[220968], dtype='int32'),
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f63d35b57920eb7b00f494a0f9025459(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_04da482c7547bd96a6f081454d6c94a3
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[153450], dtype='int32'),
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ddfbfe6e38f771e26ca8e8123fa4086d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_04da482c7547bd96a6f081454d6c94a3
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[2002], dtype='int32'),
-            paddle.to_tensor(0, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0511b85c42bf81b050adcaad159af7d5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_04da482c7547bd96a6f081454d6c94a3
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[2002], dtype='int32'),
-            paddle.to_tensor(-1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3f706fcbb4ae72d1b1c31f6ff7edd50e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_04da482c7547bd96a6f081454d6c94a3
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[185691], dtype='int32'),
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f7d48bc2d51c1436396208b324947f3e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_04da482c7547bd96a6f081454d6c94a3
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1021], dtype='int32'),
-            paddle.to_tensor(0, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ffb1c16a0f8f5ef7b2c6daca04ef449c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_04da482c7547bd96a6f081454d6c94a3
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1021], dtype='int32'),
-            paddle.to_tensor(-1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_31547b7dc9bdecb1ca26aa92162ccdf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_04da482c7547bd96a6f081454d6c94a3
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1002], dtype='int32'),
-            paddle.to_tensor(0, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3e0c980d05b57212d3a347b2a221702f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_04da482c7547bd96a6f081454d6c94a3
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1002], dtype='int32'),
-            paddle.to_tensor(-1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_55ef1a94dfe01459d2d6bb08c5852d60(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_35243965b233551857a6f5ab23553235
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1025, dtype='int32').reshape([]),
-            paddle.to_tensor(1025, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2ba8a94048a6a7dcf1164ec1089c8e1d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_04da482c7547bd96a6f081454d6c94a3
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[113061], dtype='int32'),
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_61e4a7dcd5ca18de46b692e3f1a49ee9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_04da482c7547bd96a6f081454d6c94a3
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[205923], dtype='int32'),
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4077f35f208e58b394b90cc4a75e4212(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_04da482c7547bd96a6f081454d6c94a3
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[123783], dtype='int32'),
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8ee61c139282781299ce9d91d6a6eea3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_04da482c7547bd96a6f081454d6c94a3
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[171888], dtype='int32'),
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f76e2f2c0de8b2d4a800278ae52eeb20(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_04da482c7547bd96a6f081454d6c94a3
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[217413], dtype='int32'),
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_658356b0b70835fbeeede3188a535c81(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_04da482c7547bd96a6f081454d6c94a3
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1027], dtype='int32'),
-            paddle.to_tensor(0, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_59e3326e9d662ef2a7857a3b3577208f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_04da482c7547bd96a6f081454d6c94a3
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1027], dtype='int32'),
-            paddle.to_tensor(-1, dtype='int32').reshape([]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9cf49fe8063d22e9f9cfbbc20d91d055(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_04da482c7547bd96a6f081454d6c94a3
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[185658], dtype='int32'),
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-
-
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+if __name__ == "__main__":
+    sys.exit(table.main(__file__))
@@ -1,6625 +1,28 @@
 import os
-os.environ['FLAGS_cinn_new_group_scheduler'] = '1'
-os.environ['FLAGS_group_schedule_tiling_first'] = '1'
-os.environ['FLAGS_enable_pir_api'] = '1'
-os.environ['FLAGS_cinn_bucket_compile'] = '1'
 import sys
-import unittest
-import numpy as np
-from dataclasses import dataclass
-import typing as t
 
-@dataclass
-class Stage:
-    name: str
-    env_vars: t.Dict[str, str]
+import pytest
 
-cinn_stages = [
-    Stage(
-        name="dynamic_to_static",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=False,
-            FLAGS_prim_all=False,
-            FLAGS_prim_enable_dynamic=False,
-        ),
-    ),
-    Stage(
-        name="prim",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=False,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-        ),
-    ),
-    Stage(
-        name="infer_symbolic",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=False,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-            FLAGS_use_cinn=False,
-            FLAGS_check_infer_symbolic=True,
-        ),
-    ),
-	Stage(
-        name="frontend",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=True,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-            FLAGS_use_cinn=True,
-            FLAGS_check_infer_symbolic=False,
-            FLAGS_enable_fusion_fallback=True,
-        ), 
-    ),
-    Stage(
-        name="backend",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=True,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-            FLAGS_use_cinn=True,
-            FLAGS_check_infer_symbolic=False,
-            FLAGS_enable_fusion_fallback=False,
-        ), 
-    ),
-]
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir, os.pardir))
+from tools.e2e_case_stage import CinnStages  # noqa: E402
 
-def GetCinnStageByName(name):
-    for stage in cinn_stages:
-        if stage.name == name:
-            return stage
-    return None
+stages = CinnStages(__file__)
 
-def GetCurrentCinnStage():
-    name = os.getenv('PADDLE_DEBUG_CINN_STAGE_NAME')
-    if name is None:
-        return None
-    stage_names = [stage.name for stage in cinn_stages]
-    assert name in stage_names, (
-        f"PADDLE_DEBUG_CINN_STAGE_NAME should be in {stage_names}"
-    )
-    return GetCinnStageByName(name)
+from tools.e2e_case_table import E2ECaseTable, CinnTestBase  # noqa: E402
 
-def GetPrevCinnStage(stage):
-    for i in range(1, len(cinn_stages)):
-        if stage is cinn_stages[i]:
-            return cinn_stages[i - 1]
-    return None
+stages.apply()
+table = E2ECaseTable(__file__)
+last_stage_failed = stages.last_stage_failed()
 
-def IsCinnStageEnableDiff():
-    value = os.getenv('PADDLE_DEBUG_CINN_STAGE_ENABLE_DIFF')
-    enabled = value in {
-        '1',
-        'true',
-        'True',
-    }
-    if enabled:
-        assert GetCurrentCinnStage() is not None
-    return enabled
 
-last_cinn_stage_exit_code = None
-def LastCINNStageFailed():
-    global last_cinn_stage_exit_code
-    if last_cinn_stage_exit_code is not None:
-        return last_cinn_stage_exit_code != 0
-    last_stage = GetPrevCinnStage(GetCurrentCinnStage())
-    if last_stage is None:
-        return False
-    env_vars = dict(
-        PADDLE_DEBUG_CINN_STAGE_NAME=last_stage.name,
-        PADDLE_DEBUG_CINN_STAGE_ENABLE_DIFF='0',
-    )
-    env_vars_str = " ".join(
-        f"{env_var}={value}"
-        for env_var, value in env_vars.items()
-    )
-    last_cinn_stage_exit_code = os.system(
-        f"{env_vars_str} {sys.executable} {__file__} > /dev/null 2>&1"
-    )
-    return last_cinn_stage_exit_code != 0
+def pytest_generate_tests(metafunc):
+    table.parametrize(metafunc)
 
-def SetDefaultEnv(**env_var2value):
-    for env_var, value in env_var2value.items():
-        if os.getenv(env_var) is None:
-            os.environ[env_var] = str(value)
 
-SetDefaultEnv(
-    PADDLE_DEBUG_CINN_STAGE_NAME="backend",
-    PADDLE_DEBUG_CINN_STAGE_ENABLE_DIFF=False,
-    PADDLE_DEBUG_ENABLE_CINN=True,
-    FLAGS_enable_pir_api=True,
-    FLAGS_prim_all=True,
-    FLAGS_prim_enable_dynamic=True,
-    FLAGS_use_cinn=False,
-    FLAGS_check_infer_symbolic=False,
-    FLAGS_enable_fusion_fallback=False,
-)
+@pytest.mark.skipif(last_stage_failed, reason="last stage failed")
+class TestPrimitiveOp(CinnTestBase):
+    table = table
 
-import paddle
 
-def SetEnvVar(env_var2value):
-    for env_var, value in env_var2value.items():
-        os.environ[env_var] = str(value)
-    paddle.set_flags({
-        env_var:value
-        for env_var, value in env_var2value.items()
-        if env_var.startswith('FLAGS_')
-    })
-
-if GetCurrentCinnStage() is not None:
-    SetEnvVar(GetCurrentCinnStage().env_vars)
-
-def GetEnvVarEnableJit():
-    enable_jit = os.getenv('PADDLE_DEBUG_ENABLE_JIT')
-    return enable_jit not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
-
-def GetEnvVarEnableCinn():
-    enable_cinn = os.getenv('PADDLE_DEBUG_ENABLE_CINN')
-    if enable_cinn is None:
-        return True
-    return enable_cinn not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
-
-
-def GetTolerance(dtype):
-    if dtype == np.float16:
-        return GetFloat16Tolerance()
-    if dtype == np.float32:
-        return GetFloat32Tolerance()
-    return 1e-6
-
-def GetFloat16Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT16_TOL'))
-    except:
-        return 1e-3
-
-def GetFloat32Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT32_TOL'))
-    except:
-        return 1e-6
-
-def IsInteger(dtype):
-    return np.dtype(dtype).char in np.typecodes['AllInteger']
-
-def ApplyToStatic(net, use_cinn):
-    build_strategy = paddle.static.BuildStrategy()
-    build_strategy.build_cinn_pass = use_cinn
-    return paddle.jit.to_static(
-        net,
-        input_spec=net.get_input_spec(),
-        build_strategy=build_strategy,
-        full_graph=True,
-    )
-
-class InstanceTrait:
-
-    @classmethod
-    def instance(cls):
-        if cls.instance_ is None:
-            cls.instance_ = cls()
-        return cls.instance_
-
-    @classmethod
-    def static_instance_with_cinn(cls):
-        if cls.static_instance_with_cinn_ is None:
-            cls.static_instance_with_cinn_ = ApplyToStatic(
-                cls.instance(),
-                use_cinn=True
-            )
-        return cls.static_instance_with_cinn_
-
-    @classmethod
-    def static_instance_without_cinn(cls):
-        if cls.static_instance_without_cinn_ is None:
-            cls.static_instance_without_cinn_ = ApplyToStatic(
-                cls.instance(),
-                use_cinn=False
-            )
-        return cls.static_instance_without_cinn_
-
-
-class CinnTestBase:
-
-    def setUp(self):
-        paddle.seed(2024)
-        self.prepare_data()
-
-    def test_train(self):
-        dy_outs = self.train(use_cinn=False)
-        cinn_outs = self.train(use_cinn=GetEnvVarEnableCinn())
-
-        for cinn_out, dy_out in zip(cinn_outs, dy_outs):
-          if type(cinn_out) is list and type(dy_out) is list:
-            for x, y in zip(cinn_out, dy_out):
-              self.assert_all_close(x, y)
-          else:
-            self.assert_all_close(cinn_out, dy_out)
-
-    def train(self, use_cinn):
-        if GetEnvVarEnableJit():
-            net = self.prepare_static_net(use_cinn)
-        else:
-            net = self.prepare_net()
-        paddle.seed(2024)
-        out = net(*self.inputs)
-        return out
-    
-    def prepare_data(self):
-        self.inputs = self.get_inputs()
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def prepare_net(self):
-        return self.get_test_class().instance()
-
-    def prepare_static_net(self, use_cinn):
-        if use_cinn:
-            return self.get_test_class().static_instance_with_cinn()
-        else:
-            return self.get_test_class().static_instance_without_cinn()
-
-    def assert_all_close(self, x, y):
-        if (hasattr(x, "numpy") and hasattr(y, "numpy")):
-            x_numpy = x.numpy()
-            y_numpy = y.numpy()
-            assert x_numpy.dtype == y_numpy.dtype
-            if IsInteger(x_numpy.dtype):
-                np.testing.assert_equal(x_numpy, y_numpy)
-            else:
-                tol = GetTolerance(x_numpy.dtype)
-                np.testing.assert_allclose(x_numpy, y_numpy, atol=tol, rtol=tol)
-        else:
-            assert x == y
-
-
-
-
-
-last_stage_failed = (IsCinnStageEnableDiff() and LastCINNStageFailed())
-class PrimitiveOp_52c96b195887538f064dc04ec5c26172(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.flatten(input_0, 2, 3), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1984f029f6a8a94ec128fbc031bec3ec(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_be5b28a7afdb825e5c442879282288c0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_a37b49826d715dc38cd38a4f5ec67fa4(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.flatten(input_0, 2, 3), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 91, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_36fc359e1742e2a1352897803041c715(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a37b49826d715dc38cd38a4f5ec67fa4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 91, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_ab59596c6ae635f90a3d5e4ca9186d59(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.flatten(input_0, 2, 3), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 128, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cec30194a980377940fc007e35b7e834(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ab59596c6ae635f90a3d5e4ca9186d59
-    def get_inputs(self):
-        return [
-            paddle.uniform([16, 128, 16, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_4911a54b70db1dc1793704dce4626a2d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.flatten(input_0, 1, 3), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1f65a73722b14456ba6c4f199bee3efd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4911a54b70db1dc1793704dce4626a2d
-    def get_inputs(self):
-        return [
-            paddle.uniform([512, 256, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_05115f4b5fdf218b2545183d078e8238(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 84, 84], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_c4a01af4201024d2c415f774b0b24ab4(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.flatten(input_0, 2, 3), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 68, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e193bf30b695f868b99dcab75ec4b074(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c4a01af4201024d2c415f774b0b24ab4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 84, 84], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_db2a660f5ad0bbfd247219710f7d0605(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9ab4efaf9fa8f6e613c173e392eb72ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a7ead0a33e81f69c43cf4e62e55a3a34(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f78d5288b80eec555994a65a4c703c97(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_53b30735e3a20e10c297df4d17f5c6fb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c4a01af4201024d2c415f774b0b24ab4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f3785c447b64196ef22896559eaade93(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 48, 48], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0edbe3e29ccc6711d7b64a6bb210efd1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c4a01af4201024d2c415f774b0b24ab4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 48, 48], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0a9b9f0444e953dc379bef4fee4a2873(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 15, 15], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a2730de2105e09d26e4ba6ec0dad0d1e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c4a01af4201024d2c415f774b0b24ab4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 15, 15], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_8f180e22e585ae8e39095af0aa8018d4(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.flatten(input_0, 0, 2), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None], dtype='int32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_62b7eeace41ede2092c82ac4b988fdb8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8f180e22e585ae8e39095af0aa8018d4
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[3]]], dtype='int32').reshape([1, 1, 1]),
-        ]
-
-
-
-class PrimitiveOp_b6184482c031ffa67379d293190248fb(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.flatten(input_0, 0, 1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7bc3a655250ef26fb189962966f8e334(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b6184482c031ffa67379d293190248fb
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 2100], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6003da67c15c125f64a1be3ebf438425(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0c5bdd1cf8f5d1f1125526e70938ad1e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_82d14d7c450e22f7c39563c31ebab702(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_229150108fd9491c1ea602c6cdbba26d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.flatten(input_0, 2, 3), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 320, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_08f716236ed9ce2d180124fbefefc542(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_229150108fd9491c1ea602c6cdbba26d
-    def get_inputs(self):
-        return [
-            paddle.uniform([128, 320, 8, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3074696a60e775e8a57eae62a72f98a6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0c5bdd1cf8f5d1f1125526e70938ad1e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_df3ebc2dfd263649682377cf384624ab(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a37b49826d715dc38cd38a4f5ec67fa4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 91, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_25a872721f045afeea93e929e9bfad54(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 26, 26], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_3c4f2506bd6209945917f410abe95bdc(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.flatten(input_0, 2, 3), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 76, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_071acf6117671573433474f231cb5ae4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3c4f2506bd6209945917f410abe95bdc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 76, 26, 26], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_af39106d3835a4ddc4034c1884326bf1(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.flatten(input_0, 1, 3), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b94ce7e0693e548e96455830b9bb8dfb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_af39106d3835a4ddc4034c1884326bf1
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 2048, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_42d2fecc1377dda3587dcbf880f650dd(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.flatten(input_0, 1, 3), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 1000, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cb6012fd509d84e1c3730cc82a075f29(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_42d2fecc1377dda3587dcbf880f650dd
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1000, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_516b874796ff30ffe05b9fb75f03f32c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 30, 30], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d81b834f1d0267637822fb2ad68d4077(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c4a01af4201024d2c415f774b0b24ab4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 30, 30], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_34b8ebe2a5b46fa27fcf7159c214e9f2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 52, 52], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f00cee6780550e2f72ee85d165c5cc0e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c4a01af4201024d2c415f774b0b24ab4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 52, 52], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_649c0106f1836d9b143309359ce37410(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.flatten(input_0, 2, 3), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 15, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_10aa50dbf9016542433839de741a3b1e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_649c0106f1836d9b143309359ce37410
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 8, 8], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1261b64ce9f2363af6159c8d114bec8f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 13, 13], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5db0817ad14c30fd5dbba641d4545373(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3c4f2506bd6209945917f410abe95bdc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 76, 13, 13], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_125ec87d9980662ce276fb4a16e6b1f7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1c3f15fb6a922723f5b3e7db9f0486a0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d11477c78e126464c3e05202444bfea0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a37b49826d715dc38cd38a4f5ec67fa4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 91, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a960383ebed9953a120eb9d0995fd48b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 34, 34], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5f2cac9ad0dae5c63ab515e657a21305(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c4a01af4201024d2c415f774b0b24ab4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 34, 34], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_59b98566901b34bc6c323466a507247a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 76, 76], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_970f38fe69a189a7aa44bb82b7a92507(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c4a01af4201024d2c415f774b0b24ab4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 76, 76], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_e982038b875b2201396cc509646baabd(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.flatten(input_0, 0, 1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d62e02bfc6dfc7f53fe82b56d0a5eaa0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e982038b875b2201396cc509646baabd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f78d5288b80eec555994a65a4c703c97(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f8b5ab0487bc238f733fd9e809c0ff77(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_40f34b5b9b7c6ec2eb03afc6aebbc02c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b13bf505a486f586241c75c61d3123e8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_229150108fd9491c1ea602c6cdbba26d
-    def get_inputs(self):
-        return [
-            paddle.uniform([8, 320, 8, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_417e186623aa7a027a761699a05c2eb2(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.flatten(input_0, 2, 3), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 160, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_56cba956ce8202894686188e541710b2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_417e186623aa7a027a761699a05c2eb2
-    def get_inputs(self):
-        return [
-            paddle.uniform([8, 160, 8, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_19652adc55b3b34eb34570065ddd7f79(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 36, 36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_70b7b654962ed1d8cb69b140ffa15b97(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 36, 36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5db29724f754227f5ab5b082f2ad2b84(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 36, 36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_4d252269a28221c483c6d78ceb76eda9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.flatten(input_0, 2, 3), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 64, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5a21e2834d68d70338290e53bb2f7dc1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4d252269a28221c483c6d78ceb76eda9
-    def get_inputs(self):
-        return [
-            paddle.uniform([64, 64, 32, 8], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3ca343f6d488b413b4a1bf49f3e88aea(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_649c0106f1836d9b143309359ce37410
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_05a7e9770ceac056e25e08c41d0b4db5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_649c0106f1836d9b143309359ce37410
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_aabefa9e3bd6b66655a9c118fcca561d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ab59596c6ae635f90a3d5e4ca9186d59
-    def get_inputs(self):
-        return [
-            paddle.uniform([16, 128, 16, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1261b64ce9f2363af6159c8d114bec8f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 13, 13], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a330fa8476e8d608a0633205cb1b9842(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c4a01af4201024d2c415f774b0b24ab4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 13, 13], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a55e8914201bc364c0af1895808c38dd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4911a54b70db1dc1793704dce4626a2d
-    def get_inputs(self):
-        return [
-            paddle.uniform([390, 64, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a32412d9948cd5b8717a187afd5619d8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 20, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_543f8bf5bf5c8c84a37f9330b749f565(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c4a01af4201024d2c415f774b0b24ab4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 20, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_de38f5fbe49881a5562352e1f5994bcc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_417e186623aa7a027a761699a05c2eb2
-    def get_inputs(self):
-        return [
-            paddle.uniform([8, 160, 16, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_0173373a3f1c42550b46d3e5fda756b3(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.flatten(input_0, 1, 2), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 768, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_14f5e51ffa68a562d1d9556f1a7a1039(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0173373a3f1c42550b46d3e5fda756b3
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 768, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_f02931809498c1fe593fdae9ac0e5194(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.flatten(input_0, 2, 3), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 768, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_30fcf02e4f2a7b7bfe3e1bd116065ccd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f02931809498c1fe593fdae9ac0e5194
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 768, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_5cda5ad0f63541e9656e9c67dfe58372(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.flatten(input_0, 2, 3), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 96, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_daa4a8fbc5f227c3bd1d4c3366aa8ccf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5cda5ad0f63541e9656e9c67dfe58372
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 200, 304], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_ecd9c5c6d8be48f3927b12b64cec3ed8(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.flatten(input_0, 2, 3), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 96, 200, 304], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8dfe0c5fdbd46f01c4ac7bee3865d5d2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ecd9c5c6d8be48f3927b12b64cec3ed8
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 200, 304], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_fb4ebd027692d0213aa95c4db6d99170(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.flatten(input_0, 2, 3), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 5, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_91ebe8b714fe08fa1e3fb88db6f63e31(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fb4ebd027692d0213aa95c4db6d99170
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 5, 8, 8], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_396e040aa4e91df81b85157f4d8201b2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 40, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_aa02e3dcfb623d63d24ccb6c792c22a5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c4a01af4201024d2c415f774b0b24ab4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 40, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_03c4426262f9c200d4a7a742255af9ce(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_59447a42e6c557d3d4e7b45612de01ab(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c4a01af4201024d2c415f774b0b24ab4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f3785c447b64196ef22896559eaade93(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 48, 48], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0edbe3e29ccc6711d7b64a6bb210efd1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c4a01af4201024d2c415f774b0b24ab4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 48, 48], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fe8394c6a1341802caf0828f4e204b6b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 21, 21], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_58200d7e82851e4df2eb866a8439e5ac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c4a01af4201024d2c415f774b0b24ab4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 21, 21], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a960383ebed9953a120eb9d0995fd48b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 34, 34], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8d7dcfe1be303d6ad447b56891f83e92(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 34, 34], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f14187492e7532dc0efbc00444805277(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 34, 34], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_741866e54742fddb3359ab5f9c791423(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.flatten(input_0, 2, 3), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 1280, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7c43362d0fe05e3ab6015932b667826b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_741866e54742fddb3359ab5f9c791423
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1280, 32, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_941b5d8e86d017b806fb6b4342ab971e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.flatten(input_0, 2, 3), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 32, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3a8e4afbaf0b1f7e0075968caf41fe8e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_941b5d8e86d017b806fb6b4342ab971e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 32, 256, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8803150288e7876fea886c019bd3546d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 18, 18], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d6f29ba8c8dab5010c3c4e137d5cba4d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 18, 18], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_625a0b7aad3b028ca93ff82b9f9e22f3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 18, 18], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_61cb1a661eebb554ddbdabc68c8e6670(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_af39106d3835a4ddc4034c1884326bf1
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 2048, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a9615f236c1723506673f6b04552c608(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 17, 17], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_04b4e92ceea775458c55e958cec24ca5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 17, 17], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2b67c473e89f1bc93d4883a2db5344aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 17, 17], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_a0250733d7bea3e2e6e22b43f58ae623(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.flatten(input_0, 0, 1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e9ae5c6bc103b65bafcbf3045063477e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a0250733d7bea3e2e6e22b43f58ae623
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 100, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_aef4a4e63945f63fae28fb0f607ca742(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a0250733d7bea3e2e6e22b43f58ae623
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 100, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_98b6ea24f5caf044e471db64b2e8eb8c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5cda5ad0f63541e9656e9c67dfe58372
-    def get_inputs(self):
-        return [
-            paddle.uniform([6, 96, 96, 96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d2ba4feca4c635d9de747255bc42fbfa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0f5ee1cf0d7176b8e29512aceac2ee39(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c4a01af4201024d2c415f774b0b24ab4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3074696a60e775e8a57eae62a72f98a6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0c5bdd1cf8f5d1f1125526e70938ad1e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_df3ebc2dfd263649682377cf384624ab(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a37b49826d715dc38cd38a4f5ec67fa4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 91, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_eeafe469b9f744ca0b471c7845915e32(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 20, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_59447a42e6c557d3d4e7b45612de01ab(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c4a01af4201024d2c415f774b0b24ab4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_05c73f24c53f49e6ccd4efe53a7f4946(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a0250733d7bea3e2e6e22b43f58ae623
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 300, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_636ca0c0bfbdf952a97b36f0411b6df1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a0250733d7bea3e2e6e22b43f58ae623
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 300, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a9615f236c1723506673f6b04552c608(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 17, 17], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2ef460793b61619c48262e8a2f898628(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c4a01af4201024d2c415f774b0b24ab4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 17, 17], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_8d530d9122909f8bc2bde12d577871bb(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.flatten(input_0, 2, 3), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[43, 192, 28, 28], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_03dfff97abb2556313ca6c271d56ad91(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8d530d9122909f8bc2bde12d577871bb
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 192, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_14f7cdce2503ae6b3843a746893bfb75(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.flatten(input_0, 2, 3), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[43, 384, 14, 14], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e2036c775e04d00451d05f8ee5ccb81c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_14f7cdce2503ae6b3843a746893bfb75
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 384, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_f4234173750b5c0eb84a1d5e8187bec8(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.flatten(input_0, 2, 3), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 192, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2c2b56657e6915ffb076eb8041d3c998(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f4234173750b5c0eb84a1d5e8187bec8
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 192, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_96ec39e7915214cc4c8bf6ab6e2997c4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8f180e22e585ae8e39095af0aa8018d4
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[6], [6]]], dtype='int32').reshape([1, 2, 1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5aaa6d3d568f8905e269deae5ea12d0a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b6184482c031ffa67379d293190248fb
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 3549], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d62e02bfc6dfc7f53fe82b56d0a5eaa0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e982038b875b2201396cc509646baabd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_b7f9a96d976304fae24f2958d1aa0453(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.flatten(input_0, 1, 3), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 1, 1, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4fa1ae32d0589b202b28e14299782a76(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b7f9a96d976304fae24f2958d1aa0453
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1, 1, 2048], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ba6392cf7eb04c36d43a4c4c967c478e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 46, 46], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_96f397776cb6d42b987932f147987584(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c4a01af4201024d2c415f774b0b24ab4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 46, 46], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1984f029f6a8a94ec128fbc031bec3ec(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_be5b28a7afdb825e5c442879282288c0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_36fc359e1742e2a1352897803041c715(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a37b49826d715dc38cd38a4f5ec67fa4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 91, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d62e02bfc6dfc7f53fe82b56d0a5eaa0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e982038b875b2201396cc509646baabd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_eef6d9382e27987670ff2042547e4e8c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5cda5ad0f63541e9656e9c67dfe58372
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 96, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_edd8f5bccae5124b59df119598f7ec82(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.flatten(input_0, 2, 3), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 256, 2, 80], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e25d0266a38999bac74009483ced6012(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_edd8f5bccae5124b59df119598f7ec82
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 256, 2, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1984f029f6a8a94ec128fbc031bec3ec(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_be5b28a7afdb825e5c442879282288c0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_36fc359e1742e2a1352897803041c715(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a37b49826d715dc38cd38a4f5ec67fa4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 91, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_c2542d9617fc9e333cd93a7bcff6c7f1(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.flatten(input_0, 2, 3), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[11, 96, 56, 56], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_24745d2b71e30bb0fc1fa7f7e7826360(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c2542d9617fc9e333cd93a7bcff6c7f1
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 96, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_62b7eeace41ede2092c82ac4b988fdb8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8f180e22e585ae8e39095af0aa8018d4
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[3]]], dtype='int32').reshape([1, 1, 1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_73c53d8ab66c921b9e065cc69e567fd3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b6184482c031ffa67379d293190248fb
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 4116], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4fd380b02790cbb26ceede8d327ca4f3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 80, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_930b5a2b2fe8303dd38460c47cb27c04(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c4a01af4201024d2c415f774b0b24ab4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 80, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9a3cf8e2b6fc84c10156ee50cad7963b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 60, 60], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_09ac2778ae7d76d3d6d0feb50b9ead2b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c4a01af4201024d2c415f774b0b24ab4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 60, 60], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_941485796707c05ec713361eba7c8a33(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4d252269a28221c483c6d78ceb76eda9
-    def get_inputs(self):
-        return [
-            paddle.uniform([16, 64, 16, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_e691a0b440510c850e521f6bb8e53ab3(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.flatten(input_0, 2, 3), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 128, 4, 25], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2c5811b4dd7f94872b4738ba627e41e0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e691a0b440510c850e521f6bb8e53ab3
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 128, 4, 25], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4bf3aa5d72827225a74b7ef1f7d79a84(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 20, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0f5ee1cf0d7176b8e29512aceac2ee39(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c4a01af4201024d2c415f774b0b24ab4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1e24f1b3536fbca964101649b7e18cb6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_af39106d3835a4ddc4034c1884326bf1
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 2048, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_97b7e7183a5d8a337fb704f71f86d99a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 96, 96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_13313c9bc2fb47d86fe02cd259f10ce4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 96, 96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2dee2b1ef647879cc35ec660743cc8e3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 96, 96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_34b8ebe2a5b46fa27fcf7159c214e9f2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 52, 52], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5320f0d3e196e3dcd6f27e785f4cc037(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3c4f2506bd6209945917f410abe95bdc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 76, 52, 52], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_da78bcc15239d35d99a5836b87431d88(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_42d2fecc1377dda3587dcbf880f650dd
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1000, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a2c36004ea4a891bf2d963fd754dcac0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_941b5d8e86d017b806fb6b4342ab971e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 32, 128, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_0c36e8f99ab9ce733d7366537ab89764(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.flatten(input_0, 2, 3), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 128, 4, 80], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e22445046840ee78fcdc19f292677eb1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0c36e8f99ab9ce733d7366537ab89764
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 128, 4, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a784f492c2a2b4ee7d788e45b8c848a2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_649c0106f1836d9b143309359ce37410
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4fd380b02790cbb26ceede8d327ca4f3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 80, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_02f3655afee442840d553effae5e0574(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 80, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f33efaf6b72787b2e3c175b8b378733d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 80, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1261b64ce9f2363af6159c8d114bec8f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 13, 13], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a330fa8476e8d608a0633205cb1b9842(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c4a01af4201024d2c415f774b0b24ab4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 13, 13], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_534939d1e89787846213d308c7c1034a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f02931809498c1fe593fdae9ac0e5194
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 768, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_25a872721f045afeea93e929e9bfad54(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 26, 26], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_67e6deff068f852985bfb8ac88c45d65(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c4a01af4201024d2c415f774b0b24ab4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 26, 26], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f0ac844e03debde7537b12e8b133610a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 23, 23], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bff9a53dca1f9586435bc267f13be321(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c4a01af4201024d2c415f774b0b24ab4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 23, 23], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3074696a60e775e8a57eae62a72f98a6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0c5bdd1cf8f5d1f1125526e70938ad1e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_df3ebc2dfd263649682377cf384624ab(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a37b49826d715dc38cd38a4f5ec67fa4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 91, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_b1fe718c8533d8b08fac6cc365210eb0(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.flatten(input_0, 2, 3), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 256, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3be0effc2ec4c5eed8822a1066bce298(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1fe718c8533d8b08fac6cc365210eb0
-    def get_inputs(self):
-        return [
-            paddle.uniform([8, 256, 8, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_125ec87d9980662ce276fb4a16e6b1f7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1c3f15fb6a922723f5b3e7db9f0486a0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d11477c78e126464c3e05202444bfea0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a37b49826d715dc38cd38a4f5ec67fa4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 91, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_125ec87d9980662ce276fb4a16e6b1f7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1c3f15fb6a922723f5b3e7db9f0486a0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d11477c78e126464c3e05202444bfea0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a37b49826d715dc38cd38a4f5ec67fa4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 91, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_6b97abf6ebe625b52b209ed0d80dfd69(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.flatten(input_0, 0, 1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[24, 24], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_67802769a26cb0a5ed1ca4283b66bc77(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6b97abf6ebe625b52b209ed0d80dfd69
-    def get_inputs(self):
-        return [
-            paddle.uniform([24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_67802769a26cb0a5ed1ca4283b66bc77(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6b97abf6ebe625b52b209ed0d80dfd69
-    def get_inputs(self):
-        return [
-            paddle.uniform([24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_396e040aa4e91df81b85157f4d8201b2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 40, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_eb508839ddd4e4f4f1520aa1112923d6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 40, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bc86da47f5cbb109e5fb33d5998260f2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 40, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_8e4a879e03c38ef83a41612ea6759de8(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.flatten(input_0, 2, 3), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[11, 384, 14, 14], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_71e4b91ede2b2cdb8ad09dedd69c580d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8e4a879e03c38ef83a41612ea6759de8
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 384, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_887a9cf58ba8b9fa3511ef38c7fdd414(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fb4ebd027692d0213aa95c4db6d99170
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 5, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0b87b634cec192e1315548d55c9b7c1d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 19, 19], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4eacc5bc30f89393c01cb3f73e3b9800(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c4a01af4201024d2c415f774b0b24ab4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 19, 19], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1984f029f6a8a94ec128fbc031bec3ec(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_be5b28a7afdb825e5c442879282288c0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_36fc359e1742e2a1352897803041c715(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a37b49826d715dc38cd38a4f5ec67fa4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 91, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_12eb086376133eb0f17847b5a23285d1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_be5b28a7afdb825e5c442879282288c0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8fe06d9f0dfffd480ec93558f3bb5f43(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_1c6ff2f664c2ecdbd0c4b960caae721f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.flatten(input_0, 0, 1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 100, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_aa28d3ba1af4cbe5a00a80e0d1530912(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1c6ff2f664c2ecdbd0c4b960caae721f
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 100, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d659c70f89aadd16a70885698f40b5d2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0173373a3f1c42550b46d3e5fda756b3
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 768, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_67b90ed63f0a6f3f0d815595e5ced247(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.flatten(input_0, 2, 3), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 256, 2, 25], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a4f5819e1c3b017097babd5bb5634863(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_67b90ed63f0a6f3f0d815595e5ced247
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 256, 2, 25], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_97b03175142ab682cf0509e6c47a9bf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5cda5ad0f63541e9656e9c67dfe58372
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 136, 160], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_3ceb5cba8bab9d14e6eac87e8181e0a3(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.flatten(input_0, 2, 3), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 96, 136, 160], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_48c1a513dfaf415b8c0866fc90d5685c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3ceb5cba8bab9d14e6eac87e8181e0a3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 136, 160], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d62e02bfc6dfc7f53fe82b56d0a5eaa0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e982038b875b2201396cc509646baabd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_5b7460d97089ca3c4489d8c11f28e7e6(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.flatten(input_0, 0, 1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 300, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_05af5b84b884234b9b2273b10ba82fd0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5b7460d97089ca3c4489d8c11f28e7e6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 300, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_25a872721f045afeea93e929e9bfad54(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 26, 26], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_67e6deff068f852985bfb8ac88c45d65(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c4a01af4201024d2c415f774b0b24ab4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 26, 26], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_783a7a02da727c1da0237f58f9cc8924(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 68, 68], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ee37e74344618d9f184abca1341deb3d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 68, 68], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ca75e1e3dcf8a896fc9e75d70b8cdd70(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 68, 68], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cf491166a53a1b275266ac30e99857c2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4911a54b70db1dc1793704dce4626a2d
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 704, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_257e1f3bf86655549ae95ee265e92abb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 20, 40, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_aa02e3dcfb623d63d24ccb6c792c22a5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c4a01af4201024d2c415f774b0b24ab4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 40, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b53731ba3e74ff2157f31663ed5518c0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 72, 72], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3bbb73a0a0d12cb45724a4824877ebf9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 72, 72], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d4ccf6217fdfcf8d71e875720639adc1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 72, 72], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f896f89fe1a6eb2fa92947ec6a451a9e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fb4ebd027692d0213aa95c4db6d99170
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 5, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e98c454dda2a74a87ba11330c100873d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 20, 10, 10], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_01be3c62fc93ba6f2b558ccee2e12c36(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c4a01af4201024d2c415f774b0b24ab4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 10, 10], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_0d67b980d09b13498afcb091a6e58cf9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.flatten(input_0, 2, 3), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[11, 768, 7, 7], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_90d84bc127b983e8177ae6d41d7b5e96(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0d67b980d09b13498afcb091a6e58cf9
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 768, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c47ff7bb5533d2634bc476338de50b92(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5cda5ad0f63541e9656e9c67dfe58372
-    def get_inputs(self):
-        return [
-            paddle.uniform([4, 96, 96, 96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9591635a5f9e521482ad0a22b54678b1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 20, 20, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_543f8bf5bf5c8c84a37f9330b749f565(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c4a01af4201024d2c415f774b0b24ab4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 20, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3f5e1e02c5f83d4b9c9ceb91d587563b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f02931809498c1fe593fdae9ac0e5194
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 768, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f78d5288b80eec555994a65a4c703c97(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_53b30735e3a20e10c297df4d17f5c6fb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c4a01af4201024d2c415f774b0b24ab4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7dc282ea70a4c806253e1cb8310b973e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fb4ebd027692d0213aa95c4db6d99170
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 5, 16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_9e22c6b06d1ada57a0df4151d023380c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.flatten(input_0, 2, 3), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 384, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_60eedfbe100004aff3ba627f80034e43(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9e22c6b06d1ada57a0df4151d023380c
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 384, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b6b08e867fa2f02e09a4d4af4bc9088c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_741866e54742fddb3359ab5f9c791423
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1280, 32, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_79941b2b75652bf3ed2450d68dc04298(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.flatten(input_0, 2, 3), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[43, 768, 7, 7], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ff9234750f8d0a1fd3d9cde1fe2f360a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_79941b2b75652bf3ed2450d68dc04298
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 768, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_34b8ebe2a5b46fa27fcf7159c214e9f2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 52, 52], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f00cee6780550e2f72ee85d165c5cc0e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c4a01af4201024d2c415f774b0b24ab4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 52, 52], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f2e078eda71474b37a8e2b8c761ea9be(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_649c0106f1836d9b143309359ce37410
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a32412d9948cd5b8717a187afd5619d8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 20, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bb8eeadf69580ab11528e47fa8f420f8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 20, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8e0fe42779ad302baee1dc89be99b3af(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 20, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_11f84928300a7d334f56dd401e7f0845(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 92, 92], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9c74cb2e9f5ab62002bafd8a08b00921(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c4a01af4201024d2c415f774b0b24ab4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 92, 92], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_125ec87d9980662ce276fb4a16e6b1f7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1c3f15fb6a922723f5b3e7db9f0486a0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d11477c78e126464c3e05202444bfea0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a37b49826d715dc38cd38a4f5ec67fa4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 91, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3074696a60e775e8a57eae62a72f98a6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0c5bdd1cf8f5d1f1125526e70938ad1e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_df3ebc2dfd263649682377cf384624ab(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a37b49826d715dc38cd38a4f5ec67fa4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 91, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_29a286c33e72fbe8cfab25a6714d4a9b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 20, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8e2827f82f2f0209c122af9d1cb5f77d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c4a01af4201024d2c415f774b0b24ab4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f58ae35feae4fc942bba3034f1ef8853(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8e2827f82f2f0209c122af9d1cb5f77d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c4a01af4201024d2c415f774b0b24ab4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6494024c195b4855e287a5947e4448c1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9e22c6b06d1ada57a0df4151d023380c
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 384, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c40b164408dae6168c4675b58b48c838(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 38, 38], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b5720777a60c7bc126d75362932b5289(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c4a01af4201024d2c415f774b0b24ab4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 38, 38], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a3b9a346cd4e40f70a11c542bbb6cd93(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f4234173750b5c0eb84a1d5e8187bec8
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 192, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_464f6312e13ac7661d83d4f8d47bb566(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 42, 42], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0ccca637d39fd5749a564645ecd5bc6c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c4a01af4201024d2c415f774b0b24ab4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 42, 42], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_28d4f3e59599f40176876a861306bc52(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.flatten(input_0, 2, 3), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[11, 192, 28, 28], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_272870821e8d56e792d8c74033712d0b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_28d4f3e59599f40176876a861306bc52
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 192, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c6aa8e2e564600d12cf75217a192959e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 12, 12], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a26442acc1dee5ef06db0ae7d41f9307(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c4a01af4201024d2c415f774b0b24ab4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 12, 12], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_36e7d679857f21faaeb89a0872d13f6d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.flatten(input_0, 2, 3), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 512, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a65d3e070ab9d445a75af592182be534(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_36e7d679857f21faaeb89a0872d13f6d
-    def get_inputs(self):
-        return [
-            paddle.uniform([4, 512, 8, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_44b2a289dfd6a17f0f47dae3f8ff0311(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_36e7d679857f21faaeb89a0872d13f6d
-    def get_inputs(self):
-        return [
-            paddle.uniform([4, 512, 4, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_dcb7f2cc0903a16bbca5d43082d05711(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fb4ebd027692d0213aa95c4db6d99170
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 5, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b4cc6efbea4dad913571915fec0a4d3c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1fe718c8533d8b08fac6cc365210eb0
-    def get_inputs(self):
-        return [
-            paddle.uniform([4, 256, 8, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_783a7a02da727c1da0237f58f9cc8924(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 68, 68], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d7651826fa7bf3d52e863d378e274224(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c4a01af4201024d2c415f774b0b24ab4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 68, 68], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f3785c447b64196ef22896559eaade93(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 48, 48], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_186f11837741407bf80304bb90ac9411(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 48, 48], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a1ebd51f4b7ab371466d6e7f3f0d9769(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 48, 48], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bc8bffa57445d76807e1a114555c3ba8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4911a54b70db1dc1793704dce4626a2d
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 704, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a3a38830bc0f6515ebdee53bd79507dc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5cda5ad0f63541e9656e9c67dfe58372
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 96, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_0929ae87ccb1066d36ecf7c6343b42dc(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.flatten(input_0, 2, 3), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[43, 96, 56, 56], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bdbe88720af0ae9ebfcf12bff08d137a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0929ae87ccb1066d36ecf7c6343b42dc
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 96, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1984f029f6a8a94ec128fbc031bec3ec(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_be5b28a7afdb825e5c442879282288c0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5c37625352e1dc87b6d344d56d1a7b98(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 91, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3479164f4f775ec59b3f00881dbe008e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([16, 128, 16, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1f65a73722b14456ba6c4f199bee3efd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4911a54b70db1dc1793704dce4626a2d
-    def get_inputs(self):
-        return [
-            paddle.uniform([512, 256, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_05115f4b5fdf218b2545183d078e8238(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 84, 84], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e060be2f21138d316864acd829137d4d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 84, 84], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_db2a660f5ad0bbfd247219710f7d0605(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9ab4efaf9fa8f6e613c173e392eb72ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a7ead0a33e81f69c43cf4e62e55a3a34(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f78d5288b80eec555994a65a4c703c97(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_641bc3522ca72e1651deea98dcf05f7e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f3785c447b64196ef22896559eaade93(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 48, 48], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_99e001f9c3e63f34185761c805f1af75(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 48, 48], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0a9b9f0444e953dc379bef4fee4a2873(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 15, 15], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5b49d79be60646ec71cda9506447ee14(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 15, 15], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_62b7eeace41ede2092c82ac4b988fdb8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8f180e22e585ae8e39095af0aa8018d4
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[3]]], dtype='int32').reshape([1, 1, 1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7bc3a655250ef26fb189962966f8e334(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b6184482c031ffa67379d293190248fb
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 2100], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6003da67c15c125f64a1be3ebf438425(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0c5bdd1cf8f5d1f1125526e70938ad1e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_82d14d7c450e22f7c39563c31ebab702(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_70fdbbe171de1b40f9f40b27fab145f5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([128, 320, 8, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3074696a60e775e8a57eae62a72f98a6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0c5bdd1cf8f5d1f1125526e70938ad1e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_57c9e3d80bcb32e1636655871007aedf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 91, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_25a872721f045afeea93e929e9bfad54(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 26, 26], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8f1c7ecae34cf9894f6dca1337e4bfb6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 76, 26, 26], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a15495b5e321130187e10202ac47e193(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4911a54b70db1dc1793704dce4626a2d
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 2048, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d0d17eb7279f1f1d20b81de51f1cf696(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4911a54b70db1dc1793704dce4626a2d
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1000, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_516b874796ff30ffe05b9fb75f03f32c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 30, 30], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_babc6b51d2386d2b8609927513e4eb58(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 30, 30], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_34b8ebe2a5b46fa27fcf7159c214e9f2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 52, 52], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_374db6004bec147e03e9778bf625235c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 52, 52], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_17c83fbbb968b7a571874b8c3e760440(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 8, 8], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1261b64ce9f2363af6159c8d114bec8f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 13, 13], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bab9c88ab00b8277d62e3406ab579ad8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 76, 13, 13], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_125ec87d9980662ce276fb4a16e6b1f7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1c3f15fb6a922723f5b3e7db9f0486a0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1fdee521cbe7ec9c25b300dfa5b77198(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 91, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a960383ebed9953a120eb9d0995fd48b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 34, 34], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8f5039efcb7a9897e353c18513c124ad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 34, 34], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_59b98566901b34bc6c323466a507247a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 76, 76], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1d13e2c190ff2d93bea2b5f397c3b37a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 76, 76], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d62e02bfc6dfc7f53fe82b56d0a5eaa0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e982038b875b2201396cc509646baabd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f78d5288b80eec555994a65a4c703c97(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f8b5ab0487bc238f733fd9e809c0ff77(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_40f34b5b9b7c6ec2eb03afc6aebbc02c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fcc0e36cc8bbcf28c265d38d2664b13f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([8, 320, 8, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_72027d19dab1d8de19988dde31b96f37(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([8, 160, 8, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_19652adc55b3b34eb34570065ddd7f79(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 36, 36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_70b7b654962ed1d8cb69b140ffa15b97(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 36, 36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5db29724f754227f5ab5b082f2ad2b84(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 36, 36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0e92218e77e1b96050fc3dd3baf29796(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([64, 64, 32, 8], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0a81247d648caa33609c672f58fece70(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3074696a60e775e8a57eae62a72f98a6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_dd41b324dd8b51efda90d6bc667b3446(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([16, 128, 16, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1261b64ce9f2363af6159c8d114bec8f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 13, 13], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6c47a5beac67953a70be37dcf9985f8e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 13, 13], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a55e8914201bc364c0af1895808c38dd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4911a54b70db1dc1793704dce4626a2d
-    def get_inputs(self):
-        return [
-            paddle.uniform([390, 64, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a32412d9948cd5b8717a187afd5619d8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 20, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_74359704e953b8f63623d90f27b8fc95(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 20, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0fe0c99de661bcb32a815bdb5211a0d5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([8, 160, 16, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_554cd069b05d94dfba9fdf0e3106d8e4(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.flatten(input_0, 1, 2), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1a4ddff0df05facfb463893854adfbbb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_554cd069b05d94dfba9fdf0e3106d8e4
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 768, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_23f9585780b7f593129c78472acb072e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 768, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ef253f1a3a21234bfd441eaed6528999(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 200, 304], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ef253f1a3a21234bfd441eaed6528999(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 200, 304], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0c00ca0d177fe59b417d86fda0b3c4fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 5, 8, 8], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_396e040aa4e91df81b85157f4d8201b2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 40, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_364df2c551324b99c81eaf46af067b7d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 40, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_03c4426262f9c200d4a7a742255af9ce(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_784f7732e854b66d1ac503e5c3aff6a7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f3785c447b64196ef22896559eaade93(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 48, 48], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_99e001f9c3e63f34185761c805f1af75(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 48, 48], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fe8394c6a1341802caf0828f4e204b6b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 21, 21], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_54aaf9bcf9ca9b113583bd469cd056d0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 21, 21], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a960383ebed9953a120eb9d0995fd48b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 34, 34], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8d7dcfe1be303d6ad447b56891f83e92(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 34, 34], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f14187492e7532dc0efbc00444805277(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 34, 34], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b68f56f2475e530e9140364a1b73dc06(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1280, 32, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3f7a8bdf1e315f7fc847b82c15767d6f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 32, 256, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8803150288e7876fea886c019bd3546d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 18, 18], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d6f29ba8c8dab5010c3c4e137d5cba4d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 18, 18], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_625a0b7aad3b028ca93ff82b9f9e22f3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 18, 18], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a17977a7f893e890f6769c465bf1497f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4911a54b70db1dc1793704dce4626a2d
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 2048, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a9615f236c1723506673f6b04552c608(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 17, 17], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_04b4e92ceea775458c55e958cec24ca5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 17, 17], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2b67c473e89f1bc93d4883a2db5344aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 17, 17], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e9ae5c6bc103b65bafcbf3045063477e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a0250733d7bea3e2e6e22b43f58ae623
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 100, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_aef4a4e63945f63fae28fb0f607ca742(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a0250733d7bea3e2e6e22b43f58ae623
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 100, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2254c14e8c753d54e61a109f577b6daf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([6, 96, 96, 96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d2ba4feca4c635d9de747255bc42fbfa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_069c9764982ed5399ef535f9e8f6d801(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3074696a60e775e8a57eae62a72f98a6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0c5bdd1cf8f5d1f1125526e70938ad1e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_57c9e3d80bcb32e1636655871007aedf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 91, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_eeafe469b9f744ca0b471c7845915e32(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 20, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_784f7732e854b66d1ac503e5c3aff6a7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_05c73f24c53f49e6ccd4efe53a7f4946(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a0250733d7bea3e2e6e22b43f58ae623
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 300, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_636ca0c0bfbdf952a97b36f0411b6df1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a0250733d7bea3e2e6e22b43f58ae623
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 300, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a9615f236c1723506673f6b04552c608(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 17, 17], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cdc0aabe45b01692cb707ca87de624ad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 17, 17], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9556aa5f49c416ca04ff73afd4c8329b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 192, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_936eb8555c0136ddbaaf8ac90bdebf45(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 384, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a42a8161e944a4150a41dde49909dbd6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 192, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_96ec39e7915214cc4c8bf6ab6e2997c4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8f180e22e585ae8e39095af0aa8018d4
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[6], [6]]], dtype='int32').reshape([1, 2, 1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5aaa6d3d568f8905e269deae5ea12d0a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b6184482c031ffa67379d293190248fb
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 3549], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d62e02bfc6dfc7f53fe82b56d0a5eaa0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e982038b875b2201396cc509646baabd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9b8bd23fecd161c816d287b3cb5c3b7f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4911a54b70db1dc1793704dce4626a2d
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1, 1, 2048], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ba6392cf7eb04c36d43a4c4c967c478e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 46, 46], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e520fa92a00c30ee7a34840c14b83d7d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 46, 46], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1984f029f6a8a94ec128fbc031bec3ec(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_be5b28a7afdb825e5c442879282288c0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5c37625352e1dc87b6d344d56d1a7b98(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 91, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d62e02bfc6dfc7f53fe82b56d0a5eaa0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e982038b875b2201396cc509646baabd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9439356260fbe7e8e13b60425f0e5c0b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 96, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a11ec3d72bc7b16ad44fd20df16a2f89(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 256, 2, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1984f029f6a8a94ec128fbc031bec3ec(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_be5b28a7afdb825e5c442879282288c0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5c37625352e1dc87b6d344d56d1a7b98(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 91, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_649184ad6b37d3effbb2a1f053550c40(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 96, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_62b7eeace41ede2092c82ac4b988fdb8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8f180e22e585ae8e39095af0aa8018d4
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[3]]], dtype='int32').reshape([1, 1, 1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_73c53d8ab66c921b9e065cc69e567fd3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b6184482c031ffa67379d293190248fb
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 4116], dtype='int64'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4fd380b02790cbb26ceede8d327ca4f3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 80, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ebe5a863e8144be4f9f9d88aabcb393b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 80, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9a3cf8e2b6fc84c10156ee50cad7963b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 60, 60], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e41499c4aff980318de5af7ce11b7740(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 60, 60], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_348238c0be5d8b0875eec71d41811076(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([16, 64, 16, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_06350dc1bf187cc2218d944c938adaf5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 128, 4, 25], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4bf3aa5d72827225a74b7ef1f7d79a84(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 20, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_069c9764982ed5399ef535f9e8f6d801(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cf6eef43c7d043c50515ede49b11dff7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4911a54b70db1dc1793704dce4626a2d
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 2048, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_97b7e7183a5d8a337fb704f71f86d99a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 96, 96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_13313c9bc2fb47d86fe02cd259f10ce4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 96, 96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2dee2b1ef647879cc35ec660743cc8e3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 96, 96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_34b8ebe2a5b46fa27fcf7159c214e9f2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 52, 52], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_37d3ef120c0b3072b814e6491179d6f5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 76, 52, 52], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7c786f6834dfb805a1b17878e907e2e8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4911a54b70db1dc1793704dce4626a2d
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1000, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c58672a7c3ca29c813387dd75502168e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 32, 128, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7041eda82360d99bf2ccc53da4573452(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 128, 4, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1984f029f6a8a94ec128fbc031bec3ec(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4fd380b02790cbb26ceede8d327ca4f3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 80, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_02f3655afee442840d553effae5e0574(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 80, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f33efaf6b72787b2e3c175b8b378733d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 80, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1261b64ce9f2363af6159c8d114bec8f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 13, 13], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6c47a5beac67953a70be37dcf9985f8e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 13, 13], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e40c1d4cf535a0fb5dc720093c983959(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 768, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_25a872721f045afeea93e929e9bfad54(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 26, 26], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fabbf5bd0182b473eabcac9846310486(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 26, 26], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f0ac844e03debde7537b12e8b133610a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 23, 23], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_62dfae78a3bbf8182e7d2b17b68c32a1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 23, 23], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3074696a60e775e8a57eae62a72f98a6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0c5bdd1cf8f5d1f1125526e70938ad1e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_57c9e3d80bcb32e1636655871007aedf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 91, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d3e23c7f78894e66d981d85af18045e3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([8, 256, 8, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_125ec87d9980662ce276fb4a16e6b1f7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1c3f15fb6a922723f5b3e7db9f0486a0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1fdee521cbe7ec9c25b300dfa5b77198(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 91, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_125ec87d9980662ce276fb4a16e6b1f7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1c3f15fb6a922723f5b3e7db9f0486a0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1fdee521cbe7ec9c25b300dfa5b77198(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 91, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_04949820d511122ae57bba47c3846ea9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.flatten(input_0, 0, 1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2c9fa66b04fc07f6afef79302dbee635(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_04949820d511122ae57bba47c3846ea9
-    def get_inputs(self):
-        return [
-            paddle.uniform([24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2c9fa66b04fc07f6afef79302dbee635(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_04949820d511122ae57bba47c3846ea9
-    def get_inputs(self):
-        return [
-            paddle.uniform([24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_396e040aa4e91df81b85157f4d8201b2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 40, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_eb508839ddd4e4f4f1520aa1112923d6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 40, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bc86da47f5cbb109e5fb33d5998260f2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 40, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fbe9ec0990a1963fbaad5df8917562d3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 384, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d63ff815ebc474843d59dfbadce5a2ad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 5, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0b87b634cec192e1315548d55c9b7c1d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 19, 19], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_90a69b6b216e5b7ac155539781245316(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 19, 19], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1984f029f6a8a94ec128fbc031bec3ec(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_be5b28a7afdb825e5c442879282288c0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5c37625352e1dc87b6d344d56d1a7b98(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 91, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_12eb086376133eb0f17847b5a23285d1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_be5b28a7afdb825e5c442879282288c0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8fe06d9f0dfffd480ec93558f3bb5f43(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_aef4a4e63945f63fae28fb0f607ca742(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a0250733d7bea3e2e6e22b43f58ae623
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 100, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_87c397a58d41fceb7136fbb66b003160(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_554cd069b05d94dfba9fdf0e3106d8e4
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 768, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3fe408aa2bb5d6129fc8238ebe04e89e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 256, 2, 25], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_928142541d0c2c929377d021bc6f1b06(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 136, 160], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_928142541d0c2c929377d021bc6f1b06(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 136, 160], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d62e02bfc6dfc7f53fe82b56d0a5eaa0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e982038b875b2201396cc509646baabd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_636ca0c0bfbdf952a97b36f0411b6df1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a0250733d7bea3e2e6e22b43f58ae623
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 300, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_25a872721f045afeea93e929e9bfad54(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 26, 26], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fabbf5bd0182b473eabcac9846310486(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 26, 26], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_783a7a02da727c1da0237f58f9cc8924(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 68, 68], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ee37e74344618d9f184abca1341deb3d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 68, 68], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ca75e1e3dcf8a896fc9e75d70b8cdd70(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 68, 68], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cf491166a53a1b275266ac30e99857c2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4911a54b70db1dc1793704dce4626a2d
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 704, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_257e1f3bf86655549ae95ee265e92abb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 20, 40, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_364df2c551324b99c81eaf46af067b7d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 40, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b53731ba3e74ff2157f31663ed5518c0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 72, 72], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3bbb73a0a0d12cb45724a4824877ebf9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 72, 72], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d4ccf6217fdfcf8d71e875720639adc1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 72, 72], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_30be83ace734097a01d0f343d5c6db17(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 5, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e98c454dda2a74a87ba11330c100873d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 20, 10, 10], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7278b291b4b0729c7e8d0e28f2e427d0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 10, 10], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e40c1d4cf535a0fb5dc720093c983959(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 768, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1ef337efa893f1cc4f6b130689f0d37b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([4, 96, 96, 96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9591635a5f9e521482ad0a22b54678b1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 20, 20, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_74359704e953b8f63623d90f27b8fc95(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 20, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_49b118ddf62af183c04f99ce89288349(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 768, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f78d5288b80eec555994a65a4c703c97(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_641bc3522ca72e1651deea98dcf05f7e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_eb56a9e749e931b44d24a385e08ecf52(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 5, 16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_936eb8555c0136ddbaaf8ac90bdebf45(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 384, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5686b52a1cf293da56ac1f881950dad0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1280, 32, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_49b118ddf62af183c04f99ce89288349(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 768, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_34b8ebe2a5b46fa27fcf7159c214e9f2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 52, 52], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_374db6004bec147e03e9778bf625235c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 52, 52], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_125ec87d9980662ce276fb4a16e6b1f7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a32412d9948cd5b8717a187afd5619d8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 20, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bb8eeadf69580ab11528e47fa8f420f8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 20, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8e0fe42779ad302baee1dc89be99b3af(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 20, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_11f84928300a7d334f56dd401e7f0845(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 92, 92], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_003b08345f3aa357c53f80ac6b50e906(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 92, 92], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_125ec87d9980662ce276fb4a16e6b1f7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1c3f15fb6a922723f5b3e7db9f0486a0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1fdee521cbe7ec9c25b300dfa5b77198(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 91, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3074696a60e775e8a57eae62a72f98a6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0c5bdd1cf8f5d1f1125526e70938ad1e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_57c9e3d80bcb32e1636655871007aedf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 91, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_29a286c33e72fbe8cfab25a6714d4a9b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 20, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_44e6fde1d070a40a50b38e15fce22cce(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f58ae35feae4fc942bba3034f1ef8853(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_44e6fde1d070a40a50b38e15fce22cce(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fbe9ec0990a1963fbaad5df8917562d3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 384, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c40b164408dae6168c4675b58b48c838(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 38, 38], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ab666862e7cf4b1f151723c5fd61f1f3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 38, 38], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9556aa5f49c416ca04ff73afd4c8329b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 192, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_464f6312e13ac7661d83d4f8d47bb566(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 42, 42], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_39955ee3a381b47f601256d118d3d73b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 42, 42], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a42a8161e944a4150a41dde49909dbd6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 192, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c6aa8e2e564600d12cf75217a192959e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 12, 12], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_38ecab8983c590874f86c8e0d5390863(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 12, 12], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f3f7c876113d8f7c224473efe3dcb8f1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([4, 512, 8, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4e2ee43f2fe47dd1e7414ef0353ba0ec(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([4, 512, 4, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b2b52f9367b61e0dd393b40779a22c48(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 5, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_01fdcb4204a51be082d31ca32af34258(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([4, 256, 8, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_783a7a02da727c1da0237f58f9cc8924(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 68, 68], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_30f5d4c4a434c0d7c599cf6dd8c5bc7a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 68, 68], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f3785c447b64196ef22896559eaade93(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 48, 48], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_186f11837741407bf80304bb90ac9411(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 48, 48], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a1ebd51f4b7ab371466d6e7f3f0d9769(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 48, 48], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bc8bffa57445d76807e1a114555c3ba8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4911a54b70db1dc1793704dce4626a2d
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 704, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_649184ad6b37d3effbb2a1f053550c40(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 96, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9439356260fbe7e8e13b60425f0e5c0b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c96b195887538f064dc04ec5c26172
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 96, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+if __name__ == "__main__":
+    sys.exit(table.main(__file__))
@@ -1,4827 +1,28 @@
 import os
-os.environ['FLAGS_cinn_new_group_scheduler'] = '1'
-os.environ['FLAGS_group_schedule_tiling_first'] = '1'
-os.environ['FLAGS_enable_pir_api'] = '1'
-os.environ['FLAGS_cinn_bucket_compile'] = '1'
 import sys
-import unittest
-import numpy as np
-from dataclasses import dataclass
-import typing as t
 
-@dataclass
-class Stage:
-    name: str
-    env_vars: t.Dict[str, str]
+import pytest
 
-cinn_stages = [
-    Stage(
-        name="dynamic_to_static",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=False,
-            FLAGS_prim_all=False,
-            FLAGS_prim_enable_dynamic=False,
-        ),
-    ),
-    Stage(
-        name="prim",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=False,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-        ),
-    ),
-    Stage(
-        name="infer_symbolic",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=False,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-            FLAGS_use_cinn=False,
-            FLAGS_check_infer_symbolic=True,
-        ),
-    ),
-	Stage(
-        name="frontend",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=True,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-            FLAGS_use_cinn=True,
-            FLAGS_check_infer_symbolic=False,
-            FLAGS_enable_fusion_fallback=True,
-        ), 
-    ),
-    Stage(
-        name="backend",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=True,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-            FLAGS_use_cinn=True,
-            FLAGS_check_infer_symbolic=False,
-            FLAGS_enable_fusion_fallback=False,
-        ), 
-    ),
-]
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir, os.pardir))
+from tools.e2e_case_stage import CinnStages  # noqa: E402
 
-def GetCinnStageByName(name):
-    for stage in cinn_stages:
-        if stage.name == name:
-            return stage
-    return None
+stages = CinnStages(__file__)
 
-def GetCurrentCinnStage():
-    name = os.getenv('PADDLE_DEBUG_CINN_STAGE_NAME')
-    if name is None:
-        return None
-    stage_names = [stage.name for stage in cinn_stages]
-    assert name in stage_names, (
-        f"PADDLE_DEBUG_CINN_STAGE_NAME should be in {stage_names}"
-    )
-    return GetCinnStageByName(name)
+from tools.e2e_case_table import E2ECaseTable, CinnTestBase  # noqa: E402
 
-def GetPrevCinnStage(stage):
-    for i in range(1, len(cinn_stages)):
-        if stage is cinn_stages[i]:
-            return cinn_stages[i - 1]
-    return None
+stages.apply()
+table = E2ECaseTable(__file__)
+last_stage_failed = stages.last_stage_failed()
 
-def IsCinnStageEnableDiff():
-    value = os.getenv('PADDLE_DEBUG_CINN_STAGE_ENABLE_DIFF')
-    enabled = value in {
-        '1',
-        'true',
-        'True',
-    }
-    if enabled:
-        assert GetCurrentCinnStage() is not None
-    return enabled
 
-last_cinn_stage_exit_code = None
-def LastCINNStageFailed():
-    global last_cinn_stage_exit_code
-    if last_cinn_stage_exit_code is not None:
-        return last_cinn_stage_exit_code != 0
-    last_stage = GetPrevCinnStage(GetCurrentCinnStage())
-    if last_stage is None:
-        return False
-    env_vars = dict(
-        PADDLE_DEBUG_CINN_STAGE_NAME=last_stage.name,
-        PADDLE_DEBUG_CINN_STAGE_ENABLE_DIFF='0',
-    )
-    env_vars_str = " ".join(
-        f"{env_var}={value}"
-        for env_var, value in env_vars.items()
-    )
-    last_cinn_stage_exit_code = os.system(
-        f"{env_vars_str} {sys.executable} {__file__} > /dev/null 2>&1"
-    )
-    return last_cinn_stage_exit_code != 0
+def pytest_generate_tests(metafunc):
+    table.parametrize(metafunc)
 
-def SetDefaultEnv(**env_var2value):
-    for env_var, value in env_var2value.items():
-        if os.getenv(env_var) is None:
-            os.environ[env_var] = str(value)
 
-SetDefaultEnv(
-    PADDLE_DEBUG_CINN_STAGE_NAME="backend",
-    PADDLE_DEBUG_CINN_STAGE_ENABLE_DIFF=False,
-    PADDLE_DEBUG_ENABLE_CINN=True,
-    FLAGS_enable_pir_api=True,
-    FLAGS_prim_all=True,
-    FLAGS_prim_enable_dynamic=True,
-    FLAGS_use_cinn=False,
-    FLAGS_check_infer_symbolic=False,
-    FLAGS_enable_fusion_fallback=False,
-)
+@pytest.mark.skipif(last_stage_failed, reason="last stage failed")
+class TestPrimitiveOp(CinnTestBase):
+    table = table
 
-import paddle
 
-def SetEnvVar(env_var2value):
-    for env_var, value in env_var2value.items():
-        os.environ[env_var] = str(value)
-    paddle.set_flags({
-        env_var:value
-        for env_var, value in env_var2value.items()
-        if env_var.startswith('FLAGS_')
-    })
-
-if GetCurrentCinnStage() is not None:
-    SetEnvVar(GetCurrentCinnStage().env_vars)
-
-def GetEnvVarEnableJit():
-    enable_jit = os.getenv('PADDLE_DEBUG_ENABLE_JIT')
-    return enable_jit not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
-
-def GetEnvVarEnableCinn():
-    enable_cinn = os.getenv('PADDLE_DEBUG_ENABLE_CINN')
-    if enable_cinn is None:
-        return True
-    return enable_cinn not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
-
-
-def GetTolerance(dtype):
-    if dtype == np.float16:
-        return GetFloat16Tolerance()
-    if dtype == np.float32:
-        return GetFloat32Tolerance()
-    return 1e-6
-
-def GetFloat16Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT16_TOL'))
-    except:
-        return 1e-3
-
-def GetFloat32Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT32_TOL'))
-    except:
-        return 1e-6
-
-def IsInteger(dtype):
-    return np.dtype(dtype).char in np.typecodes['AllInteger']
-
-def ApplyToStatic(net, use_cinn):
-    build_strategy = paddle.static.BuildStrategy()
-    build_strategy.build_cinn_pass = use_cinn
-    return paddle.jit.to_static(
-        net,
-        input_spec=net.get_input_spec(),
-        build_strategy=build_strategy,
-        full_graph=True,
-    )
-
-class InstanceTrait:
-
-    @classmethod
-    def instance(cls):
-        if cls.instance_ is None:
-            cls.instance_ = cls()
-        return cls.instance_
-
-    @classmethod
-    def static_instance_with_cinn(cls):
-        if cls.static_instance_with_cinn_ is None:
-            cls.static_instance_with_cinn_ = ApplyToStatic(
-                cls.instance(),
-                use_cinn=True
-            )
-        return cls.static_instance_with_cinn_
-
-    @classmethod
-    def static_instance_without_cinn(cls):
-        if cls.static_instance_without_cinn_ is None:
-            cls.static_instance_without_cinn_ = ApplyToStatic(
-                cls.instance(),
-                use_cinn=False
-            )
-        return cls.static_instance_without_cinn_
-
-
-class CinnTestBase:
-
-    def setUp(self):
-        paddle.seed(2024)
-        self.prepare_data()
-
-    def test_train(self):
-        dy_outs = self.train(use_cinn=False)
-        cinn_outs = self.train(use_cinn=GetEnvVarEnableCinn())
-
-        for cinn_out, dy_out in zip(cinn_outs, dy_outs):
-          if type(cinn_out) is list and type(dy_out) is list:
-            for x, y in zip(cinn_out, dy_out):
-              self.assert_all_close(x, y)
-          else:
-            self.assert_all_close(cinn_out, dy_out)
-
-    def train(self, use_cinn):
-        if GetEnvVarEnableJit():
-            net = self.prepare_static_net(use_cinn)
-        else:
-            net = self.prepare_net()
-        paddle.seed(2024)
-        out = net(*self.inputs)
-        return out
-    
-    def prepare_data(self):
-        self.inputs = self.get_inputs()
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def prepare_net(self):
-        return self.get_test_class().instance()
-
-    def prepare_static_net(self, use_cinn):
-        if use_cinn:
-            return self.get_test_class().static_instance_with_cinn()
-        else:
-            return self.get_test_class().static_instance_without_cinn()
-
-    def assert_all_close(self, x, y):
-        if (hasattr(x, "numpy") and hasattr(y, "numpy")):
-            x_numpy = x.numpy()
-            y_numpy = y.numpy()
-            assert x_numpy.dtype == y_numpy.dtype
-            if IsInteger(x_numpy.dtype):
-                np.testing.assert_equal(x_numpy, y_numpy)
-            else:
-                tol = GetTolerance(x_numpy.dtype)
-                np.testing.assert_allclose(x_numpy, y_numpy, atol=tol, rtol=tol)
-        else:
-            assert x == y
-
-
-
-
-
-last_stage_failed = (IsCinnStageEnableDiff() and LastCINNStageFailed())
-class PrimitiveOp_f4e425c1ae9121967a682ca8bcf61772(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1, arg_2):
-        input_0 = arg_0
-        input_1 = arg_1
-        input_2 = arg_2
-        return paddle._C_ops.layer_norm(input_0, input_1, input_2, 1e-05, 2), None, None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[11, 49, 192], dtype='float32'),
-            paddle.static.InputSpec(shape=[192], dtype='float32'),
-            paddle.static.InputSpec(shape=[192], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8e90941deb5b00625db588601522a863(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f4e425c1ae9121967a682ca8bcf61772
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 49, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_29d0166949e84e6c168894146d2b8c27(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1, arg_2):
-        input_0 = arg_0
-        input_1 = arg_1
-        input_2 = arg_2
-        return paddle._C_ops.layer_norm(input_0, input_1, input_2, 1e-06, 2), None, None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 128], dtype='float32'),
-            paddle.static.InputSpec(shape=[128], dtype='float32'),
-            paddle.static.InputSpec(shape=[128], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_40193362fc0019764d6f99a1e5f32741(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_29d0166949e84e6c168894146d2b8c27
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 100, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_35a038a57e84c892cd775892014bd4a6(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1, arg_2):
-        input_0 = arg_0
-        input_1 = arg_1
-        input_2 = arg_2
-        return paddle._C_ops.layer_norm(input_0, input_1, input_2, 1e-06, 2), None, None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 192], dtype='float32'),
-            paddle.static.InputSpec(shape=[192], dtype='float32'),
-            paddle.static.InputSpec(shape=[192], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a984e13b4bbf3c1987c9ad1689a497f3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_35a038a57e84c892cd775892014bd4a6
-    def get_inputs(self):
-        return [
-            paddle.uniform([54, 198, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_c361add8437a0302699481aa0050ced8(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1, arg_2):
-        input_0 = arg_0
-        input_1 = arg_1
-        input_2 = arg_2
-        return paddle._C_ops.layer_norm(input_0, input_1, input_2, 1e-05, 2), None, None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[43, 49, 192], dtype='float32'),
-            paddle.static.InputSpec(shape=[192], dtype='float32'),
-            paddle.static.InputSpec(shape=[192], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_85c88febc6f269e0c492e754e0bf4378(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c361add8437a0302699481aa0050ced8
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 49, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_74571f72c1a52fe6276884fafdbeda11(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1, arg_2):
-        input_0 = arg_0
-        input_1 = arg_1
-        input_2 = arg_2
-        return paddle._C_ops.layer_norm(input_0, input_1, input_2, 1e-06, 2), None, None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 65536, 64], dtype='float32'),
-            paddle.static.InputSpec(shape=[64], dtype='float32'),
-            paddle.static.InputSpec(shape=[64], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9ec8aca07136c4458ef8f6cc33ca4827(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_74571f72c1a52fe6276884fafdbeda11
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 65536, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_9f61ab4d753150b74b7edbc1d086913e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1, arg_2):
-        input_0 = arg_0
-        input_1 = arg_1
-        input_2 = arg_2
-        return paddle._C_ops.layer_norm(input_0, input_1, input_2, 1e-05, 2), None, None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 128], dtype='float32'),
-            paddle.static.InputSpec(shape=[128], dtype='float32'),
-            paddle.static.InputSpec(shape=[128], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_210fc3a20d29677938f9be703b01af79(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9f61ab4d753150b74b7edbc1d086913e
-    def get_inputs(self):
-        return [
-            paddle.uniform([16, 1024, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_7955038eeaf69218077c04eac7f810d8(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1, arg_2):
-        input_0 = arg_0
-        input_1 = arg_1
-        input_2 = arg_2
-        return paddle._C_ops.layer_norm(input_0, input_1, input_2, 1e-05, 2), None, None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[43, 49, 384], dtype='float32'),
-            paddle.static.InputSpec(shape=[384], dtype='float32'),
-            paddle.static.InputSpec(shape=[384], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a7c7c57a290c27f5c016a7be54cb9137(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7955038eeaf69218077c04eac7f810d8
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 49, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_8f9c9eeb3f84acc39b32f5c1dba86473(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1, arg_2):
-        input_0 = arg_0
-        input_1 = arg_1
-        input_2 = arg_2
-        return paddle._C_ops.layer_norm(input_0, input_1, input_2, 1e-06, 2), None, None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 16384, 128], dtype='float32'),
-            paddle.static.InputSpec(shape=[128], dtype='float32'),
-            paddle.static.InputSpec(shape=[128], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_21775c1372e3f66b29bd65231e443c6c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8f9c9eeb3f84acc39b32f5c1dba86473
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 16384, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_27206f783234048e3fc856967ad54ca1(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1, arg_2):
-        input_0 = arg_0
-        input_1 = arg_1
-        input_2 = arg_2
-        return paddle._C_ops.layer_norm(input_0, input_1, input_2, 1e-05, 2), None, None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 320], dtype='float32'),
-            paddle.static.InputSpec(shape=[320], dtype='float32'),
-            paddle.static.InputSpec(shape=[320], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7cad9bfba76ee08b0ccb581fce1d8e10(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_27206f783234048e3fc856967ad54ca1
-    def get_inputs(self):
-        return [
-            paddle.uniform([128, 32, 320], dtype='float32', min=0, max=0.5),
-            paddle.uniform([320], dtype='float32', min=0, max=0.5),
-            paddle.uniform([320], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_8dbc45d1145bb49ceb04b0e72c3cc639(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1, arg_2):
-        input_0 = arg_0
-        input_1 = arg_1
-        input_2 = arg_2
-        return paddle._C_ops.layer_norm(input_0, input_1, input_2, 1e-05, 2), None, None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 768], dtype='float32'),
-            paddle.static.InputSpec(shape=[768], dtype='float32'),
-            paddle.static.InputSpec(shape=[768], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_843b000826ba5c4e02930bb0394ca38d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8dbc45d1145bb49ceb04b0e72c3cc639
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 49, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_329044eee92ab3f179c7027203db7446(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1, arg_2):
-        input_0 = arg_0
-        input_1 = arg_1
-        input_2 = arg_2
-        return paddle._C_ops.layer_norm(input_0, input_1, input_2, 1e-05, 2), None, None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[43, 49, 96], dtype='float32'),
-            paddle.static.InputSpec(shape=[96], dtype='float32'),
-            paddle.static.InputSpec(shape=[96], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d588a447f4e19fb82e4ea952700412be(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_329044eee92ab3f179c7027203db7446
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 49, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9e25743cb2ac3b1f2ce950d98e342f9a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_29d0166949e84e6c168894146d2b8c27
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 320, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_686e2c1532955643c645fb5b17ce02c7(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1, arg_2):
-        input_0 = arg_0
-        input_1 = arg_1
-        input_2 = arg_2
-        return paddle._C_ops.layer_norm(input_0, input_1, input_2, 1e-06, 2), None, None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 8192, 128], dtype='float32'),
-            paddle.static.InputSpec(shape=[128], dtype='float32'),
-            paddle.static.InputSpec(shape=[128], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4160daeb0dba47b21dc915304026af73(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_686e2c1532955643c645fb5b17ce02c7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8192, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ea86a52db1054fc9a5d514582fe5c67b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_27206f783234048e3fc856967ad54ca1
-    def get_inputs(self):
-        return [
-            paddle.uniform([8, 256, 320], dtype='float32', min=0, max=0.5),
-            paddle.uniform([320], dtype='float32', min=0, max=0.5),
-            paddle.uniform([320], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_62929276a3624a666184cb9ee9ff6d80(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1, arg_2):
-        input_0 = arg_0
-        input_1 = arg_1
-        input_2 = arg_2
-        return paddle._C_ops.layer_norm(input_0, input_1, input_2, 1e-06, 2), None, None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 8192, 64], dtype='float32'),
-            paddle.static.InputSpec(shape=[64], dtype='float32'),
-            paddle.static.InputSpec(shape=[64], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_de5c014d5358f77e7a58bbc40e9d7ec1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62929276a3624a666184cb9ee9ff6d80
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8192, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_1351470c9ef01cb3b7731abac3b9f447(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1, arg_2):
-        input_0 = arg_0
-        input_1 = arg_1
-        input_2 = arg_2
-        return paddle._C_ops.layer_norm(input_0, input_1, input_2, 1e-05, 2), None, None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 160], dtype='float32'),
-            paddle.static.InputSpec(shape=[160], dtype='float32'),
-            paddle.static.InputSpec(shape=[160], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_42c441c2b80ff1f8bdb917d9770c46d8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1351470c9ef01cb3b7731abac3b9f447
-    def get_inputs(self):
-        return [
-            paddle.uniform([8, 256, 160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_b8a094a5522aca1f92b804d446978ddc(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1, arg_2):
-        input_0 = arg_0
-        input_1 = arg_1
-        input_2 = arg_2
-        return paddle._C_ops.layer_norm(input_0, input_1, input_2, 1e-06, 2), None, None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 768], dtype='float32'),
-            paddle.static.InputSpec(shape=[768], dtype='float32'),
-            paddle.static.InputSpec(shape=[768], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_45bc3bb926ffe48c7bcd12d0f95cc6bd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b8a094a5522aca1f92b804d446978ddc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 577, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_4dbeed217bed2cd40492b87583288c3b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1, arg_2):
-        input_0 = arg_0
-        input_1 = arg_1
-        input_2 = arg_2
-        return paddle._C_ops.layer_norm(input_0, input_1, input_2, 1e-05, 2), None, None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 384], dtype='float32'),
-            paddle.static.InputSpec(shape=[384], dtype='float32'),
-            paddle.static.InputSpec(shape=[384], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e7dabbcd51d4bcf63cb9184d7a81d7b4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4dbeed217bed2cd40492b87583288c3b
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 196, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_66fbb5b0e7b339371303d2c662c317af(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1, arg_2):
-        input_0 = arg_0
-        input_1 = arg_1
-        input_2 = arg_2
-        return paddle._C_ops.layer_norm(input_0, input_1, input_2, 1e-06, 2), None, None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 65536, 32], dtype='float32'),
-            paddle.static.InputSpec(shape=[32], dtype='float32'),
-            paddle.static.InputSpec(shape=[32], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b284d1f6f108939f07178a5e6e100a57(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_66fbb5b0e7b339371303d2c662c317af
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 65536, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_f734db51114b22db226ab1c960db7e2b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1, arg_2):
-        input_0 = arg_0
-        input_1 = arg_1
-        input_2 = arg_2
-        return paddle._C_ops.layer_norm(input_0, input_1, input_2, 1e-05, 2), None, None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 64], dtype='float32'),
-            paddle.static.InputSpec(shape=[64], dtype='float32'),
-            paddle.static.InputSpec(shape=[64], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_35409082fc871f4203363a5fed9ebb85(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f734db51114b22db226ab1c960db7e2b
-    def get_inputs(self):
-        return [
-            paddle.uniform([64, 256, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_a093f24259ffd980e52d8d0a456150a8(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1, arg_2):
-        input_0 = arg_0
-        input_1 = arg_1
-        input_2 = arg_2
-        return paddle._C_ops.layer_norm(input_0, input_1, input_2, 1e-05, 2), None, None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 192], dtype='float32'),
-            paddle.static.InputSpec(shape=[192], dtype='float32'),
-            paddle.static.InputSpec(shape=[192], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f93d7fcd6bdf6a13b8e0aadfbca66ab3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a093f24259ffd980e52d8d0a456150a8
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 784, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_21775c1372e3f66b29bd65231e443c6c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8f9c9eeb3f84acc39b32f5c1dba86473
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 16384, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_3d915c33376c91d2cda0ed57d0ae2e85(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1, arg_2):
-        input_0 = arg_0
-        input_1 = arg_1
-        input_2 = arg_2
-        return paddle._C_ops.layer_norm(input_0, input_1, input_2, 1e-05, 2), None, None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, None, 128], dtype='float32'),
-            paddle.static.InputSpec(shape=[128], dtype='float32'),
-            paddle.static.InputSpec(shape=[128], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d5db2e0f8680cf1fc995fe2026e9be88(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3d915c33376c91d2cda0ed57d0ae2e85
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d588a447f4e19fb82e4ea952700412be(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_329044eee92ab3f179c7027203db7446
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 49, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_57afc9ae8956abcd66ea2d7f7661ef10(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1, arg_2):
-        input_0 = arg_0
-        input_1 = arg_1
-        input_2 = arg_2
-        return paddle._C_ops.layer_norm(input_0, input_1, input_2, 1e-06, 2), None, None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 32768, 64], dtype='float32'),
-            paddle.static.InputSpec(shape=[64], dtype='float32'),
-            paddle.static.InputSpec(shape=[64], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_811c217d3a2b895dad7aeb0e14778f54(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_57afc9ae8956abcd66ea2d7f7661ef10
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 32768, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_53d561c0ce8f31342cfa62c934bbfbd1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9f61ab4d753150b74b7edbc1d086913e
-    def get_inputs(self):
-        return [
-            paddle.uniform([16, 512, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_e7bf33ce4b1bacacc7ef4ed9ec35e1ea(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1, arg_2):
-        input_0 = arg_0
-        input_1 = arg_1
-        input_2 = arg_2
-        return paddle._C_ops.layer_norm(input_0, input_1, input_2, 1e-05, 2), None, None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 96], dtype='float32'),
-            paddle.static.InputSpec(shape=[96], dtype='float32'),
-            paddle.static.InputSpec(shape=[96], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8a15536672498ad01633711f2c4277f9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e7bf33ce4b1bacacc7ef4ed9ec35e1ea
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 3136, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_dd3e5bb0221c526af5f7c332830acaa8(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1, arg_2):
-        input_0 = arg_0
-        input_1 = arg_1
-        input_2 = arg_2
-        return paddle._C_ops.layer_norm(input_0, input_1, input_2, 1e-06, 2), None, None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 16384, 64], dtype='float32'),
-            paddle.static.InputSpec(shape=[64], dtype='float32'),
-            paddle.static.InputSpec(shape=[64], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0e9e1ac7f6b08ca93adec10a06c0831b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_dd3e5bb0221c526af5f7c332830acaa8
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 16384, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f937a0a16ded2dfad8b8194edb7313aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1351470c9ef01cb3b7731abac3b9f447
-    def get_inputs(self):
-        return [
-            paddle.uniform([8, 512, 160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_843b000826ba5c4e02930bb0394ca38d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8dbc45d1145bb49ceb04b0e72c3cc639
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 49, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_42fb1774e46a4c19d5fb7d780e907ec6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e7bf33ce4b1bacacc7ef4ed9ec35e1ea
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 60800, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_66e579651d4a001798f561e07a732645(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1, arg_2):
-        input_0 = arg_0
-        input_1 = arg_1
-        input_2 = arg_2
-        return paddle._C_ops.layer_norm(input_0, input_1, input_2, 1e-06, 2), None, None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 64], dtype='float32'),
-            paddle.static.InputSpec(shape=[64], dtype='float32'),
-            paddle.static.InputSpec(shape=[64], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4d4649593500fe70be04cb5cd74e1891(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_66e579651d4a001798f561e07a732645
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 640, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ac17b4f205b0bea7ecd4d5971b1636ba(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_35a038a57e84c892cd775892014bd4a6
-    def get_inputs(self):
-        return [
-            paddle.uniform([86, 198, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_12ea376184e2ce823feefd9b69c7e809(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1, arg_2):
-        input_0 = arg_0
-        input_1 = arg_1
-        input_2 = arg_2
-        return paddle._C_ops.layer_norm(input_0, input_1, input_2, 1e-05, 2), None, None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[11, 49, 96], dtype='float32'),
-            paddle.static.InputSpec(shape=[96], dtype='float32'),
-            paddle.static.InputSpec(shape=[96], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_57e23a12195cb667bfc4df0dd13a8fc4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_12ea376184e2ce823feefd9b69c7e809
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 49, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_cd3e236ddf4629a1fcf58d9d605d3d90(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1, arg_2):
-        input_0 = arg_0
-        input_1 = arg_1
-        input_2 = arg_2
-        return paddle._C_ops.layer_norm(input_0, input_1, input_2, 1e-05, 2), None, None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 1024], dtype='float32'),
-            paddle.static.InputSpec(shape=[1024], dtype='float32'),
-            paddle.static.InputSpec(shape=[1024], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6c83f6c8257ebe7cf4e7f18bbf9b8cf3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cd3e236ddf4629a1fcf58d9d605d3d90
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 169, 1024], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1024], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6c83f6c8257ebe7cf4e7f18bbf9b8cf3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cd3e236ddf4629a1fcf58d9d605d3d90
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 169, 1024], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1024], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_acd63c0cd09e446cb813a61e905feb3e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8dbc45d1145bb49ceb04b0e72c3cc639
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 49, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_ba0caf4b2aed82861ed3b951495b1e36(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1, arg_2):
-        input_0 = arg_0
-        input_1 = arg_1
-        input_2 = arg_2
-        return paddle._C_ops.layer_norm(input_0, input_1, input_2, 1e-05, 2), None, None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 32], dtype='float32'),
-            paddle.static.InputSpec(shape=[32], dtype='float32'),
-            paddle.static.InputSpec(shape=[32], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_59f1abe1c377a13854752facfd674b7d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ba0caf4b2aed82861ed3b951495b1e36
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 65536, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_dabcafeef984bba1406c509ca0da5649(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e7bf33ce4b1bacacc7ef4ed9ec35e1ea
-    def get_inputs(self):
-        return [
-            paddle.uniform([6, 9216, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_562c78b85dd96df6136b5bd23a122060(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1, arg_2):
-        input_0 = arg_0
-        input_1 = arg_1
-        input_2 = arg_2
-        return paddle._C_ops.layer_norm(input_0, input_1, input_2, 1e-06, 2), None, None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 256], dtype='float32'),
-            paddle.static.InputSpec(shape=[256], dtype='float32'),
-            paddle.static.InputSpec(shape=[256], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8dd38bf0068c81bac804cd7a2a912a15(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_562c78b85dd96df6136b5bd23a122060
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_5810f89c7a68afa1a1956aa60e5fffcb(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1, arg_2):
-        input_0 = arg_0
-        input_1 = arg_1
-        input_2 = arg_2
-        return paddle._C_ops.layer_norm(input_0, input_1, input_2, 1e-05, 2), None, None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[11, 49, 384], dtype='float32'),
-            paddle.static.InputSpec(shape=[384], dtype='float32'),
-            paddle.static.InputSpec(shape=[384], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_43d4e5aa38298f126bf03f46c0b146b4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5810f89c7a68afa1a1956aa60e5fffcb
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 49, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_40193362fc0019764d6f99a1e5f32741(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_29d0166949e84e6c168894146d2b8c27
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 100, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0ce777aaf05734ac934322f4ae741fb2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8dbc45d1145bb49ceb04b0e72c3cc639
-    def get_inputs(self):
-        return [
-            paddle.uniform([4, 144, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8a15536672498ad01633711f2c4277f9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e7bf33ce4b1bacacc7ef4ed9ec35e1ea
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 3136, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_de611be73a33be835ed38c431366b835(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a093f24259ffd980e52d8d0a456150a8
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 784, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_de611be73a33be835ed38c431366b835(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a093f24259ffd980e52d8d0a456150a8
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 784, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b80ea4bcea35448d432921ede1aab794(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4dbeed217bed2cd40492b87583288c3b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1025, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8a15536672498ad01633711f2c4277f9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e7bf33ce4b1bacacc7ef4ed9ec35e1ea
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 3136, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f5e7b611c0bfcc8c4fa12406c05a56fa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4dbeed217bed2cd40492b87583288c3b
-    def get_inputs(self):
-        return [
-            paddle.uniform([4, 576, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e7dabbcd51d4bcf63cb9184d7a81d7b4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4dbeed217bed2cd40492b87583288c3b
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 196, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_77a8a49d5ed64a64007d41df3ef60421(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1, arg_2):
-        input_0 = arg_0
-        input_1 = arg_1
-        input_2 = arg_2
-        return paddle._C_ops.layer_norm(input_0, input_1, input_2, 1e-05, 2), None, None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 160, 256], dtype='float32'),
-            paddle.static.InputSpec(shape=[256], dtype='float32'),
-            paddle.static.InputSpec(shape=[256], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a65713d2a9553ae83c92b4386018e1dd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_77a8a49d5ed64a64007d41df3ef60421
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 160, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_437bcd510e0b2540b20dac9efc54813d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1, arg_2):
-        input_0 = arg_0
-        input_1 = arg_1
-        input_2 = arg_2
-        return paddle._C_ops.layer_norm(input_0, input_1, input_2, 1e-06, 2), None, None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 2048, 160], dtype='float32'),
-            paddle.static.InputSpec(shape=[160], dtype='float32'),
-            paddle.static.InputSpec(shape=[160], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9427c81f7187fabbf661f0e23228992d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_437bcd510e0b2540b20dac9efc54813d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2048, 160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_b4cc63602ce2559ec19634b5658d27d2(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1, arg_2):
-        input_0 = arg_0
-        input_1 = arg_1
-        input_2 = arg_2
-        return paddle._C_ops.layer_norm(input_0, input_1, input_2, 1e-05, 2), None, None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, None, 160], dtype='float32'),
-            paddle.static.InputSpec(shape=[160], dtype='float32'),
-            paddle.static.InputSpec(shape=[160], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_efdd91ab62913fb9fab9e83eaa1736bd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b4cc63602ce2559ec19634b5658d27d2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2cea8cd0271bfe7c5a2f4b0c38869faf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_562c78b85dd96df6136b5bd23a122060
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_c00fb98d455df56e88cc8dedd4fa30ee(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1, arg_2):
-        input_0 = arg_0
-        input_1 = arg_1
-        input_2 = arg_2
-        return paddle._C_ops.layer_norm(input_0, input_1, input_2, 1e-06, 2), None, None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 32768, 32], dtype='float32'),
-            paddle.static.InputSpec(shape=[32], dtype='float32'),
-            paddle.static.InputSpec(shape=[32], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f80c1c0ea4bf50ae3563361dfb390084(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c00fb98d455df56e88cc8dedd4fa30ee
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 32768, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_817fbe4d244fb9c5a3c8e024dd0a569c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f734db51114b22db226ab1c960db7e2b
-    def get_inputs(self):
-        return [
-            paddle.uniform([16, 512, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_a992f3a7ccc4f434cf87b9778f7431c1(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1, arg_2):
-        input_0 = arg_0
-        input_1 = arg_1
-        input_2 = arg_2
-        return paddle._C_ops.layer_norm(input_0, input_1, input_2, 1e-05, 2), None, None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 100, 128], dtype='float32'),
-            paddle.static.InputSpec(shape=[128], dtype='float32'),
-            paddle.static.InputSpec(shape=[128], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1d4af0d98d0d734f84dc99835b97d4a0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a992f3a7ccc4f434cf87b9778f7431c1
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 100, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8e90941deb5b00625db588601522a863(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f4e425c1ae9121967a682ca8bcf61772
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 49, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_33604ba66e0d9a5afb7655a0f46c4b97(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_35a038a57e84c892cd775892014bd4a6
-    def get_inputs(self):
-        return [
-            paddle.uniform([54, 197, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0599fe3c91c0c6e9ea068c00edf19e60(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ba0caf4b2aed82861ed3b951495b1e36
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 32768, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b284d1f6f108939f07178a5e6e100a57(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_66fbb5b0e7b339371303d2c662c317af
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 65536, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_57d31e82bd242be6bceb0ef1fc87b5ee(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1, arg_2):
-        input_0 = arg_0
-        input_1 = arg_1
-        input_2 = arg_2
-        return paddle._C_ops.layer_norm(input_0, input_1, input_2, 1e-05, 2), None, None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, None, 32], dtype='float32'),
-            paddle.static.InputSpec(shape=[32], dtype='float32'),
-            paddle.static.InputSpec(shape=[32], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_994345e85271a375ed78e2323cc12c67(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_57d31e82bd242be6bceb0ef1fc87b5ee
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_e68abd971099a2c7ae9c2d665cda5f64(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1, arg_2):
-        input_0 = arg_0
-        input_1 = arg_1
-        input_2 = arg_2
-        return paddle._C_ops.layer_norm(input_0, input_1, input_2, 1e-05, 2), None, None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 320, 128], dtype='float32'),
-            paddle.static.InputSpec(shape=[128], dtype='float32'),
-            paddle.static.InputSpec(shape=[128], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c7e44418ea826dfcaadf2adb79f0042a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e68abd971099a2c7ae9c2d665cda5f64
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 320, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e802e190a1ae5ccb99b368348ca5931e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a093f24259ffd980e52d8d0a456150a8
-    def get_inputs(self):
-        return [
-            paddle.uniform([4, 2304, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_acd63c0cd09e446cb813a61e905feb3e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8dbc45d1145bb49ceb04b0e72c3cc639
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 49, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_55a28c65daac075019c5c689e4001f55(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1, arg_2):
-        input_0 = arg_0
-        input_1 = arg_1
-        input_2 = arg_2
-        return paddle._C_ops.layer_norm(input_0, input_1, input_2, 1e-06, 2), None, None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 4096, 160], dtype='float32'),
-            paddle.static.InputSpec(shape=[160], dtype='float32'),
-            paddle.static.InputSpec(shape=[160], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_931be5aaadb65ed3d1bbb9b392a2f8fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_55a28c65daac075019c5c689e4001f55
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4096, 160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_608f07a38611913eab4c8d885582192f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1, arg_2):
-        input_0 = arg_0
-        input_1 = arg_1
-        input_2 = arg_2
-        return paddle._C_ops.layer_norm(input_0, input_1, input_2, 1e-05, 2), None, None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 256], dtype='float32'),
-            paddle.static.InputSpec(shape=[256], dtype='float32'),
-            paddle.static.InputSpec(shape=[256], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2330dcfc2e114e6816d22e543ba5d33c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_608f07a38611913eab4c8d885582192f
-    def get_inputs(self):
-        return [
-            paddle.uniform([8, 128, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1d7f6e7bc6b6af09939b1fb783cd0f1b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4dbeed217bed2cd40492b87583288c3b
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 196, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_57e23a12195cb667bfc4df0dd13a8fc4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_12ea376184e2ce823feefd9b69c7e809
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 49, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_df6a3fe179f380b2a9455372482dfbd3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e7bf33ce4b1bacacc7ef4ed9ec35e1ea
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 3136, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9e25743cb2ac3b1f2ce950d98e342f9a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_29d0166949e84e6c168894146d2b8c27
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 320, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_811c217d3a2b895dad7aeb0e14778f54(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_57afc9ae8956abcd66ea2d7f7661ef10
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 32768, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_d337b1ca103ef28507354725c495ac4c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1, arg_2):
-        input_0 = arg_0
-        input_1 = arg_1
-        input_2 = arg_2
-        return paddle._C_ops.layer_norm(input_0, input_1, input_2, 1e-05, 2), None, None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, None, 64], dtype='float32'),
-            paddle.static.InputSpec(shape=[64], dtype='float32'),
-            paddle.static.InputSpec(shape=[64], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_682ebd30bf56edc992910e2e98d85db8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d337b1ca103ef28507354725c495ac4c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bdc10374db527515c82b152c2d935ee2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_66e579651d4a001798f561e07a732645
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 200, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_916e7b12f6b2b20541ed6561deba4da4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8dbc45d1145bb49ceb04b0e72c3cc639
-    def get_inputs(self):
-        return [
-            paddle.uniform([6, 144, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_acd63c0cd09e446cb813a61e905feb3e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8dbc45d1145bb49ceb04b0e72c3cc639
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 49, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_df3bb63966c2abedb31ddf46b3508144(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1, arg_2):
-        input_0 = arg_0
-        input_1 = arg_1
-        input_2 = arg_2
-        return paddle._C_ops.layer_norm(input_0, input_1, input_2, 1e-05, 2), None, None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 50, 256], dtype='float32'),
-            paddle.static.InputSpec(shape=[256], dtype='float32'),
-            paddle.static.InputSpec(shape=[256], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d2fd177856706d93cce53a6ae5e501e4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_df3bb63966c2abedb31ddf46b3508144
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 50, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e1ea317e9ac772ec71a28c37ee012e17(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e7bf33ce4b1bacacc7ef4ed9ec35e1ea
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 21760, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_de611be73a33be835ed38c431366b835(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a093f24259ffd980e52d8d0a456150a8
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 784, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4160daeb0dba47b21dc915304026af73(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_686e2c1532955643c645fb5b17ce02c7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8192, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c3a38d9fbd7b17fb0d2630729b67c4ef(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3d915c33376c91d2cda0ed57d0ae2e85
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_9c1e79416272a05dc1d9b38258ada20e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1, arg_2):
-        input_0 = arg_0
-        input_1 = arg_1
-        input_2 = arg_2
-        return paddle._C_ops.layer_norm(input_0, input_1, input_2, 1e-06, 2), None, None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 2048, 320], dtype='float32'),
-            paddle.static.InputSpec(shape=[320], dtype='float32'),
-            paddle.static.InputSpec(shape=[320], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_46a151f93f751e1cfb5bd7fb4301c992(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9c1e79416272a05dc1d9b38258ada20e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2048, 320], dtype='float32', min=0, max=0.5),
-            paddle.uniform([320], dtype='float32', min=0, max=0.5),
-            paddle.uniform([320], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_f7c27b56df47fc1d2052beba616d1a3b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1, arg_2):
-        input_0 = arg_0
-        input_1 = arg_1
-        input_2 = arg_2
-        return paddle._C_ops.layer_norm(input_0, input_1, input_2, 1e-05, 2), None, None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, None, 320], dtype='float32'),
-            paddle.static.InputSpec(shape=[320], dtype='float32'),
-            paddle.static.InputSpec(shape=[320], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3dcb5de0313c2fe8479c26cea2b43a53(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f7c27b56df47fc1d2052beba616d1a3b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 320], dtype='float32', min=0, max=0.5),
-            paddle.uniform([320], dtype='float32', min=0, max=0.5),
-            paddle.uniform([320], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0d0685d4279386b6c760eaffa39e0f53(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e7bf33ce4b1bacacc7ef4ed9ec35e1ea
-    def get_inputs(self):
-        return [
-            paddle.uniform([4, 9216, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1d7f6e7bc6b6af09939b1fb783cd0f1b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4dbeed217bed2cd40492b87583288c3b
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 196, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e7dabbcd51d4bcf63cb9184d7a81d7b4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4dbeed217bed2cd40492b87583288c3b
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 196, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0d0685d4279386b6c760eaffa39e0f53(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e7bf33ce4b1bacacc7ef4ed9ec35e1ea
-    def get_inputs(self):
-        return [
-            paddle.uniform([4, 9216, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ec1fe6b467085c93d15ed8384d7818bc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8dbc45d1145bb49ceb04b0e72c3cc639
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1025, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_843b000826ba5c4e02930bb0394ca38d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8dbc45d1145bb49ceb04b0e72c3cc639
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 49, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_df6a3fe179f380b2a9455372482dfbd3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e7bf33ce4b1bacacc7ef4ed9ec35e1ea
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 3136, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e7dabbcd51d4bcf63cb9184d7a81d7b4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4dbeed217bed2cd40492b87583288c3b
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 196, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_c266048718f28411645f011a4b821ba1(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1, arg_2):
-        input_0 = arg_0
-        input_1 = arg_1
-        input_2 = arg_2
-        return paddle._C_ops.layer_norm(input_0, input_1, input_2, 1e-06, 2), None, None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 512], dtype='float32'),
-            paddle.static.InputSpec(shape=[512], dtype='float32'),
-            paddle.static.InputSpec(shape=[512], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7ef91b1b1c237e00f2f4d775a684c1e9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c266048718f28411645f011a4b821ba1
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 512], dtype='float32', min=0, max=0.5),
-            paddle.uniform([512], dtype='float32', min=0, max=0.5),
-            paddle.uniform([512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_843b000826ba5c4e02930bb0394ca38d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8dbc45d1145bb49ceb04b0e72c3cc639
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 49, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_dabcafeef984bba1406c509ca0da5649(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e7bf33ce4b1bacacc7ef4ed9ec35e1ea
-    def get_inputs(self):
-        return [
-            paddle.uniform([6, 9216, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_acd63c0cd09e446cb813a61e905feb3e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8dbc45d1145bb49ceb04b0e72c3cc639
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 49, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_f425230e956ffd130e4140622d073716(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1, arg_2):
-        input_0 = arg_0
-        input_1 = arg_1
-        input_2 = arg_2
-        return paddle._C_ops.layer_norm(input_0, input_1, input_2, 1e-06, 2), None, None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 4096, 320], dtype='float32'),
-            paddle.static.InputSpec(shape=[320], dtype='float32'),
-            paddle.static.InputSpec(shape=[320], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0fbb22e6532eb13c1aac97c8c56eb9a4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f425230e956ffd130e4140622d073716
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4096, 320], dtype='float32', min=0, max=0.5),
-            paddle.uniform([320], dtype='float32', min=0, max=0.5),
-            paddle.uniform([320], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c3ce854515c39f849558b8cb39c862b0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f7c27b56df47fc1d2052beba616d1a3b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 320], dtype='float32', min=0, max=0.5),
-            paddle.uniform([320], dtype='float32', min=0, max=0.5),
-            paddle.uniform([320], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_931be5aaadb65ed3d1bbb9b392a2f8fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_55a28c65daac075019c5c689e4001f55
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4096, 160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3ea7fed2432e27904ae98e588bc45431(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b4cc63602ce2559ec19634b5658d27d2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a7c7c57a290c27f5c016a7be54cb9137(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7955038eeaf69218077c04eac7f810d8
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 49, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_49e4a988c97248caf3488bc3e882f66e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c266048718f28411645f011a4b821ba1
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 512], dtype='float32', min=0, max=0.5),
-            paddle.uniform([512], dtype='float32', min=0, max=0.5),
-            paddle.uniform([512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f93d7fcd6bdf6a13b8e0aadfbca66ab3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a093f24259ffd980e52d8d0a456150a8
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 784, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c5cebaf9359dfb520a6df6d213e238e2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a093f24259ffd980e52d8d0a456150a8
-    def get_inputs(self):
-        return [
-            paddle.uniform([6, 2304, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_85c88febc6f269e0c492e754e0bf4378(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c361add8437a0302699481aa0050ced8
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 49, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1d7f6e7bc6b6af09939b1fb783cd0f1b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4dbeed217bed2cd40492b87583288c3b
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 196, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_43d4e5aa38298f126bf03f46c0b146b4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5810f89c7a68afa1a1956aa60e5fffcb
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 49, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f93d7fcd6bdf6a13b8e0aadfbca66ab3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a093f24259ffd980e52d8d0a456150a8
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 784, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8a15536672498ad01633711f2c4277f9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e7bf33ce4b1bacacc7ef4ed9ec35e1ea
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 3136, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5e95ef85fe145179d9ba70a5ebc78270(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4dbeed217bed2cd40492b87583288c3b
-    def get_inputs(self):
-        return [
-            paddle.uniform([6, 576, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0e9e1ac7f6b08ca93adec10a06c0831b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_dd3e5bb0221c526af5f7c332830acaa8
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 16384, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4f2f493acffb5c91b7a63b0bf25b140a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d337b1ca103ef28507354725c495ac4c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_de5c014d5358f77e7a58bbc40e9d7ec1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62929276a3624a666184cb9ee9ff6d80
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8192, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_682ebd30bf56edc992910e2e98d85db8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d337b1ca103ef28507354725c495ac4c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0fbb22e6532eb13c1aac97c8c56eb9a4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f425230e956ffd130e4140622d073716
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4096, 320], dtype='float32', min=0, max=0.5),
-            paddle.uniform([320], dtype='float32', min=0, max=0.5),
-            paddle.uniform([320], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_1eafe7ef1e2b4989f616ff21c08ae535(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1, arg_2):
-        input_0 = arg_0
-        input_1 = arg_1
-        input_2 = arg_2
-        return paddle._C_ops.layer_norm(input_0, input_1, input_2, 1e-05, 2), None, None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 512], dtype='float32'),
-            paddle.static.InputSpec(shape=[512], dtype='float32'),
-            paddle.static.InputSpec(shape=[512], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f4557766e89f93e5f70ac020b400b5e0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1eafe7ef1e2b4989f616ff21c08ae535
-    def get_inputs(self):
-        return [
-            paddle.uniform([4, 256, 512], dtype='float32', min=0, max=0.5),
-            paddle.uniform([512], dtype='float32', min=0, max=0.5),
-            paddle.uniform([512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1bf9bc1ed26c882206f2c5450e254bd1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_35a038a57e84c892cd775892014bd4a6
-    def get_inputs(self):
-        return [
-            paddle.uniform([86, 197, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f80c1c0ea4bf50ae3563361dfb390084(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c00fb98d455df56e88cc8dedd4fa30ee
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 32768, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_129bf7fecad2145f059f995a200be3a5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_57d31e82bd242be6bceb0ef1fc87b5ee
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_46a151f93f751e1cfb5bd7fb4301c992(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9c1e79416272a05dc1d9b38258ada20e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2048, 320], dtype='float32', min=0, max=0.5),
-            paddle.uniform([320], dtype='float32', min=0, max=0.5),
-            paddle.uniform([320], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ec100895afe40346f3698adc7d2a670d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1eafe7ef1e2b4989f616ff21c08ae535
-    def get_inputs(self):
-        return [
-            paddle.uniform([4, 128, 512], dtype='float32', min=0, max=0.5),
-            paddle.uniform([512], dtype='float32', min=0, max=0.5),
-            paddle.uniform([512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1d7f6e7bc6b6af09939b1fb783cd0f1b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4dbeed217bed2cd40492b87583288c3b
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 196, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_04cf7aba569a4a17dc8e7cd6c749c1b0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_562c78b85dd96df6136b5bd23a122060
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 160, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_803294393fae77f6bf7f3ee429018b57(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4dbeed217bed2cd40492b87583288c3b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1174, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9427c81f7187fabbf661f0e23228992d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_437bcd510e0b2540b20dac9efc54813d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2048, 160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0b56430dc19715f053ff1c25568f2b93(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_608f07a38611913eab4c8d885582192f
-    def get_inputs(self):
-        return [
-            paddle.uniform([4, 128, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_123da2d81c62d869eba5be8cebec47bb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8dbc45d1145bb49ceb04b0e72c3cc639
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1174, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9ec8aca07136c4458ef8f6cc33ca4827(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_74571f72c1a52fe6276884fafdbeda11
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 65536, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4f2f493acffb5c91b7a63b0bf25b140a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d337b1ca103ef28507354725c495ac4c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_df6a3fe179f380b2a9455372482dfbd3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e7bf33ce4b1bacacc7ef4ed9ec35e1ea
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 3136, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_df6a3fe179f380b2a9455372482dfbd3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e7bf33ce4b1bacacc7ef4ed9ec35e1ea
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 3136, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fb2910e4d7fe4f58427d67e5531154f0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_562c78b85dd96df6136b5bd23a122060
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 50, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1, arg_2):
-        input_0 = arg_0
-        input_1 = arg_1
-        input_2 = arg_2
-        return paddle._C_ops.layer_norm(input_0, input_1, input_2, 1e-05, 2), None, None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4db7d7ab7526a797680faa935715c516(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 49, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_71f4110dc23195c89dba89da6cac7bd9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1, arg_2):
-        input_0 = arg_0
-        input_1 = arg_1
-        input_2 = arg_2
-        return paddle._C_ops.layer_norm(input_0, input_1, input_2, 1e-06, 2), None, None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_708488c70ad2f47c4bf6d4efa426cc9c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71f4110dc23195c89dba89da6cac7bd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 100, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9da3dd4f99c09f48c45ea2f65313912f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71f4110dc23195c89dba89da6cac7bd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([54, 198, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e7b6f47e79428a68b55759ea1ec05af2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 49, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2b6b5b5b32cd8f0a8090df90789b977f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71f4110dc23195c89dba89da6cac7bd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 65536, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7b25003ac103ae3898d72e079d2e9ddc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([16, 1024, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7090b0a03c08f7d176198f50a14f405f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 49, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_12f91a1f430f5bd597b54abb5091a15a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71f4110dc23195c89dba89da6cac7bd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 16384, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a7276d8595dbd536e7518727d4c5ab57(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([128, 32, 320], dtype='float32', min=0, max=0.5),
-            paddle.uniform([320], dtype='float32', min=0, max=0.5),
-            paddle.uniform([320], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a632c6b91c5aea8f60c714fac07299a5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 49, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b410f0b059c490194df4e1b86d399090(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 49, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b59c54233867de64095e1babcd997ce2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71f4110dc23195c89dba89da6cac7bd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 320, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_81f1ca81556b98b1a5bd013f24864a4c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71f4110dc23195c89dba89da6cac7bd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8192, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3eeaca1f77ca43c5317ff060c55553b4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([8, 256, 320], dtype='float32', min=0, max=0.5),
-            paddle.uniform([320], dtype='float32', min=0, max=0.5),
-            paddle.uniform([320], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_186943db6a6056238d341dc9e133f388(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71f4110dc23195c89dba89da6cac7bd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8192, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c3595168597fce080052842a61b3da92(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([8, 256, 160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f734237a88b49f23864f9e79e4ee1db5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71f4110dc23195c89dba89da6cac7bd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 577, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2448f29a4f08d77dfff2d416edb8b512(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 196, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5166d280e49703a4537c65317073e223(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71f4110dc23195c89dba89da6cac7bd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 65536, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_802ea2c0d36e10eed848b4ad9568aecf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([64, 256, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cc97bdc0eb1fe75d0643d3cb9578fd69(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 784, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_12f91a1f430f5bd597b54abb5091a15a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71f4110dc23195c89dba89da6cac7bd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 16384, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1682393f4cca8fa6bfbc3f5083c77689(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b410f0b059c490194df4e1b86d399090(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 49, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_08cff7dfb4fc9d4a4cc86f202af9f695(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71f4110dc23195c89dba89da6cac7bd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 32768, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6d77b46608f3f315151247748deb18f6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([16, 512, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_479706027b49d724ca0c642814463648(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 3136, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_86c1bfd5ed9cacba37a8cf4e85a942cb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71f4110dc23195c89dba89da6cac7bd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 16384, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c4eb800c58b12ef1328e18d0bf2d7702(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([8, 512, 160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a632c6b91c5aea8f60c714fac07299a5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 49, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_56b289f3adcec6036822385fdbdcd4f9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 60800, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_55a8e2fad953c554cb32f889dd8346f9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71f4110dc23195c89dba89da6cac7bd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 640, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0bef87973b5e56cb6f71eb32ea1f6aa8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71f4110dc23195c89dba89da6cac7bd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([86, 198, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ea606932e5a426871fb1438fa8de8d26(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 49, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fb542a1356199d2e62af66f88201d1db(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 169, 1024], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1024], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fb542a1356199d2e62af66f88201d1db(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 169, 1024], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1024], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_58db9a7014ec3a303dfc10aab8d31e44(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 49, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d555df0aedcae308d310197bc998bbf9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 65536, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c7e12c4cfd048a6f03f7cace4837a005(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([6, 9216, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_64bb2e233c80e714c6ccedfdbc812798(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71f4110dc23195c89dba89da6cac7bd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ef1185a1c9ff0303d03791ebcaf8aff5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 49, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_708488c70ad2f47c4bf6d4efa426cc9c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71f4110dc23195c89dba89da6cac7bd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 100, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d99df353fb1f71e3581b7b6220382eeb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([4, 144, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_479706027b49d724ca0c642814463648(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 3136, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_54ed9a87ced92111d06bab50d65bde0f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 784, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_54ed9a87ced92111d06bab50d65bde0f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 784, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ce2692c30aff8949573e07cd099b997f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1025, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_479706027b49d724ca0c642814463648(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 3136, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8907d6288d85ee1cf71791e03195ae9d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([4, 576, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2448f29a4f08d77dfff2d416edb8b512(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 196, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1e1f35e83ac824dc8f36990b42d8bcca(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 160, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cdca511f01835d08c1e1b326f06cd264(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71f4110dc23195c89dba89da6cac7bd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2048, 160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_10c2c26c1cd75e1c06f0e466be299567(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0502f08c3306204618c474008c07348e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71f4110dc23195c89dba89da6cac7bd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8b3bbd9048c56f59e27dbe216bd48698(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71f4110dc23195c89dba89da6cac7bd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 32768, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c6635a64e0dbd50a02127a6be5e92242(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([16, 512, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3452b9a10e3881f3300a2d07037abb88(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 100, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4db7d7ab7526a797680faa935715c516(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 49, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8803f1837ad5a9c96c386e1c77b3ae58(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71f4110dc23195c89dba89da6cac7bd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([54, 197, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_485f7ea80997e44c0cc5e4791dead474(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 32768, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5166d280e49703a4537c65317073e223(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71f4110dc23195c89dba89da6cac7bd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 65536, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_df33678f464cf04eb5a2a1615c304445(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4dea55e59477e23cd61d67d6de95a27a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 320, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c07c0d68acb08f986a715da139c32f9b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([4, 2304, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_58db9a7014ec3a303dfc10aab8d31e44(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 49, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_19fec0e9f76e53676b2bc00a5f8975a9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71f4110dc23195c89dba89da6cac7bd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4096, 160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4d58e737acf0718a4c1bdb72302617c1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([8, 128, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_129ba3ab9471cb1dda6825b859d6dac2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 196, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ea606932e5a426871fb1438fa8de8d26(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 49, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_36bfb38e8e46e35156cf2a4351009c8c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 3136, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b59c54233867de64095e1babcd997ce2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71f4110dc23195c89dba89da6cac7bd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 320, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_08cff7dfb4fc9d4a4cc86f202af9f695(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71f4110dc23195c89dba89da6cac7bd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 32768, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6b31b5a2df4253f6c4ad797d41b12670(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_87b2b08e86084fd4f14046e4060ea6ca(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71f4110dc23195c89dba89da6cac7bd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 200, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_34df6958ad997c8020b3ef8324f0fefe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([6, 144, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_58db9a7014ec3a303dfc10aab8d31e44(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 49, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3e40b5d07ce3355faa3df539c10d42cd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 50, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_31f86d6772fc6096d02071cdf6e9b1e0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 21760, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_54ed9a87ced92111d06bab50d65bde0f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 784, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_81f1ca81556b98b1a5bd013f24864a4c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71f4110dc23195c89dba89da6cac7bd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8192, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0b83272ebb4cc9b7d42615494eeb9959(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c42baf1002e1faebe90d2e9b042ee0e4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71f4110dc23195c89dba89da6cac7bd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2048, 320], dtype='float32', min=0, max=0.5),
-            paddle.uniform([320], dtype='float32', min=0, max=0.5),
-            paddle.uniform([320], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bed1f63bf67bd99ae5f3ae73e85157b0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 320], dtype='float32', min=0, max=0.5),
-            paddle.uniform([320], dtype='float32', min=0, max=0.5),
-            paddle.uniform([320], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e546ca744af0150b5ed7b45ed35e111a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([4, 9216, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_129ba3ab9471cb1dda6825b859d6dac2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 196, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2448f29a4f08d77dfff2d416edb8b512(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 196, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e546ca744af0150b5ed7b45ed35e111a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([4, 9216, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_21fcb4ebb61d597191a4e16c09c5c669(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1025, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a632c6b91c5aea8f60c714fac07299a5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 49, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_36bfb38e8e46e35156cf2a4351009c8c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 3136, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2448f29a4f08d77dfff2d416edb8b512(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 196, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e1944043bb4926134b5a837c51189f0f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71f4110dc23195c89dba89da6cac7bd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 512], dtype='float32', min=0, max=0.5),
-            paddle.uniform([512], dtype='float32', min=0, max=0.5),
-            paddle.uniform([512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a632c6b91c5aea8f60c714fac07299a5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 49, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c7e12c4cfd048a6f03f7cace4837a005(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([6, 9216, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_58db9a7014ec3a303dfc10aab8d31e44(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 49, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_62eb1279b95d5fa48b62873ca757d671(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71f4110dc23195c89dba89da6cac7bd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4096, 320], dtype='float32', min=0, max=0.5),
-            paddle.uniform([320], dtype='float32', min=0, max=0.5),
-            paddle.uniform([320], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9c9f3556821e8fce1ba758217b305b9b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 320], dtype='float32', min=0, max=0.5),
-            paddle.uniform([320], dtype='float32', min=0, max=0.5),
-            paddle.uniform([320], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_19fec0e9f76e53676b2bc00a5f8975a9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71f4110dc23195c89dba89da6cac7bd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4096, 160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4a090aff86650809e16a256cb03aa0cc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7090b0a03c08f7d176198f50a14f405f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 49, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_660f987c09109e711d1cf1dc91ba9254(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71f4110dc23195c89dba89da6cac7bd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 512], dtype='float32', min=0, max=0.5),
-            paddle.uniform([512], dtype='float32', min=0, max=0.5),
-            paddle.uniform([512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cc97bdc0eb1fe75d0643d3cb9578fd69(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 784, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e8bc42801874dccbb978a603166950ac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([6, 2304, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e7b6f47e79428a68b55759ea1ec05af2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 49, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_129ba3ab9471cb1dda6825b859d6dac2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 196, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ef1185a1c9ff0303d03791ebcaf8aff5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 49, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cc97bdc0eb1fe75d0643d3cb9578fd69(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 784, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_479706027b49d724ca0c642814463648(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 3136, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2c776f5dd1316cdd7a947cfe0ad95e20(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([6, 576, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_86c1bfd5ed9cacba37a8cf4e85a942cb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71f4110dc23195c89dba89da6cac7bd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 16384, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_82378657c428c073c7233717ef9d9b8a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_186943db6a6056238d341dc9e133f388(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71f4110dc23195c89dba89da6cac7bd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8192, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6b31b5a2df4253f6c4ad797d41b12670(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_62eb1279b95d5fa48b62873ca757d671(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71f4110dc23195c89dba89da6cac7bd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4096, 320], dtype='float32', min=0, max=0.5),
-            paddle.uniform([320], dtype='float32', min=0, max=0.5),
-            paddle.uniform([320], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a331bac7782a4d8a1c9566f5ab7bed56(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([4, 256, 512], dtype='float32', min=0, max=0.5),
-            paddle.uniform([512], dtype='float32', min=0, max=0.5),
-            paddle.uniform([512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a7a6087d87f24954a9aa9e599ec994dc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71f4110dc23195c89dba89da6cac7bd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([86, 197, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8b3bbd9048c56f59e27dbe216bd48698(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71f4110dc23195c89dba89da6cac7bd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 32768, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_85e71034b28b6baea951f320deac4e60(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c42baf1002e1faebe90d2e9b042ee0e4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71f4110dc23195c89dba89da6cac7bd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2048, 320], dtype='float32', min=0, max=0.5),
-            paddle.uniform([320], dtype='float32', min=0, max=0.5),
-            paddle.uniform([320], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fedee9151b1ff787476509738eebf352(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([4, 128, 512], dtype='float32', min=0, max=0.5),
-            paddle.uniform([512], dtype='float32', min=0, max=0.5),
-            paddle.uniform([512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_129ba3ab9471cb1dda6825b859d6dac2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 196, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2a3c5c29e313fb0cca3bb11ea9349a2e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71f4110dc23195c89dba89da6cac7bd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 160, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b4d53fc44166f8d5875c3f284e1c10db(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1174, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cdca511f01835d08c1e1b326f06cd264(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71f4110dc23195c89dba89da6cac7bd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2048, 160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_13ddc1f3ba10afa211b255c05505598a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([4, 128, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5955ccc50754b3fde0780810f7f9684a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1174, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2b6b5b5b32cd8f0a8090df90789b977f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71f4110dc23195c89dba89da6cac7bd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 65536, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_82378657c428c073c7233717ef9d9b8a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_36bfb38e8e46e35156cf2a4351009c8c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 3136, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_36bfb38e8e46e35156cf2a4351009c8c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c46db2ace4b8f1e60a963bb825e8f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 3136, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c8618b304f5cf7b6121c5931e1ea41be(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71f4110dc23195c89dba89da6cac7bd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 50, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+if __name__ == "__main__":
+    sys.exit(table.main(__file__))
@@ -1,2103 +1,28 @@
 import os
-os.environ['FLAGS_cinn_new_group_scheduler'] = '1'
-os.environ['FLAGS_group_schedule_tiling_first'] = '1'
-os.environ['FLAGS_enable_pir_api'] = '1'
-os.environ['FLAGS_cinn_bucket_compile'] = '1'
 import sys
-import unittest
-import numpy as np
-from dataclasses import dataclass
-import typing as t
 
-@dataclass
-class Stage:
-    name: str
-    env_vars: t.Dict[str, str]
+import pytest
 
-cinn_stages = [
-    Stage(
-        name="dynamic_to_static",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=False,
-            FLAGS_prim_all=False,
-            FLAGS_prim_enable_dynamic=False,
-        ),
-    ),
-    Stage(
-        name="prim",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=False,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-        ),
-    ),
-    Stage(
-        name="infer_symbolic",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=False,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-            FLAGS_use_cinn=False,
-            FLAGS_check_infer_symbolic=True,
-        ),
-    ),
-	Stage(
-        name="frontend",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=True,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-            FLAGS_use_cinn=True,
-            FLAGS_check_infer_symbolic=False,
-            FLAGS_enable_fusion_fallback=True,
-        ), 
-    ),
-    Stage(
-        name="backend",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=True,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-            FLAGS_use_cinn=True,
-            FLAGS_check_infer_symbolic=False,
-            FLAGS_enable_fusion_fallback=False,
-        ), 
-    ),
-]
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir, os.pardir))
+from tools.e2e_case_stage import CinnStages  # noqa: E402
 
-def GetCinnStageByName(name):
-    for stage in cinn_stages:
-        if stage.name == name:
-            return stage
-    return None
+stages = CinnStages(__file__)
 
-def GetCurrentCinnStage():
-    name = os.getenv('PADDLE_DEBUG_CINN_STAGE_NAME')
-    if name is None:
-        return None
-    stage_names = [stage.name for stage in cinn_stages]
-    assert name in stage_names, (
-        f"PADDLE_DEBUG_CINN_STAGE_NAME should be in {stage_names}"
-    )
-    return GetCinnStageByName(name)
+from tools.e2e_case_table import E2ECaseTable, CinnTestBase  # noqa: E402
 
-def GetPrevCinnStage(stage):
-    for i in range(1, len(cinn_stages)):
-        if stage is cinn_stages[i]:
-            return cinn_stages[i - 1]
-    return None
+stages.apply()
+table = E2ECaseTable(__file__)
+last_stage_failed = stages.last_stage_failed()
 
-def IsCinnStageEnableDiff():
-    value = os.getenv('PADDLE_DEBUG_CINN_STAGE_ENABLE_DIFF')
-    enabled = value in {
-        '1',
-        'true',
-        'True',
-    }
-    if enabled:
-        assert GetCurrentCinnStage() is not None
-    return enabled
 
-last_cinn_stage_exit_code = None
-def LastCINNStageFailed():
-    global last_cinn_stage_exit_code
-    if last_cinn_stage_exit_code is not None:
-        return last_cinn_stage_exit_code != 0
-    last_stage = GetPrevCinnStage(GetCurrentCinnStage())
-    if last_stage is None:
-        return False
-    env_vars = dict(
-        PADDLE_DEBUG_CINN_STAGE_NAME=last_stage.name,
-        PADDLE_DEBUG_CINN_STAGE_ENABLE_DIFF='0',
-    )
-    env_vars_str = " ".join(
-        f"{env_var}={value}"
-        for env_var, value in env_vars.items()
-    )
-    last_cinn_stage_exit_code = os.system(
-        f"{env_vars_str} {sys.executable} {__file__} > /dev/null 2>&1"
-    )
-    return last_cinn_stage_exit_code != 0
+def pytest_generate_tests(metafunc):
+    table.parametrize(metafunc)
 
-def SetDefaultEnv(**env_var2value):
-    for env_var, value in env_var2value.items():
-        if os.getenv(env_var) is None:
-            os.environ[env_var] = str(value)
 
-SetDefaultEnv(
-    PADDLE_DEBUG_CINN_STAGE_NAME="backend",
-    PADDLE_DEBUG_CINN_STAGE_ENABLE_DIFF=False,
-    PADDLE_DEBUG_ENABLE_CINN=True,
-    FLAGS_enable_pir_api=True,
-    FLAGS_prim_all=True,
-    FLAGS_prim_enable_dynamic=True,
-    FLAGS_use_cinn=False,
-    FLAGS_check_infer_symbolic=False,
-    FLAGS_enable_fusion_fallback=False,
-)
+@pytest.mark.skipif(last_stage_failed, reason="last stage failed")
+class TestPrimitiveOp(CinnTestBase):
+    table = table
 
-import paddle
 
-def SetEnvVar(env_var2value):
-    for env_var, value in env_var2value.items():
-        os.environ[env_var] = str(value)
-    paddle.set_flags({
-        env_var:value
-        for env_var, value in env_var2value.items()
-        if env_var.startswith('FLAGS_')
-    })
-
-if GetCurrentCinnStage() is not None:
-    SetEnvVar(GetCurrentCinnStage().env_vars)
-
-def GetEnvVarEnableJit():
-    enable_jit = os.getenv('PADDLE_DEBUG_ENABLE_JIT')
-    return enable_jit not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
-
-def GetEnvVarEnableCinn():
-    enable_cinn = os.getenv('PADDLE_DEBUG_ENABLE_CINN')
-    if enable_cinn is None:
-        return True
-    return enable_cinn not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
-
-
-def GetTolerance(dtype):
-    if dtype == np.float16:
-        return GetFloat16Tolerance()
-    if dtype == np.float32:
-        return GetFloat32Tolerance()
-    return 1e-6
-
-def GetFloat16Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT16_TOL'))
-    except:
-        return 1e-3
-
-def GetFloat32Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT32_TOL'))
-    except:
-        return 1e-6
-
-def IsInteger(dtype):
-    return np.dtype(dtype).char in np.typecodes['AllInteger']
-
-def ApplyToStatic(net, use_cinn):
-    build_strategy = paddle.static.BuildStrategy()
-    build_strategy.build_cinn_pass = use_cinn
-    return paddle.jit.to_static(
-        net,
-        input_spec=net.get_input_spec(),
-        build_strategy=build_strategy,
-        full_graph=True,
-    )
-
-class InstanceTrait:
-
-    @classmethod
-    def instance(cls):
-        if cls.instance_ is None:
-            cls.instance_ = cls()
-        return cls.instance_
-
-    @classmethod
-    def static_instance_with_cinn(cls):
-        if cls.static_instance_with_cinn_ is None:
-            cls.static_instance_with_cinn_ = ApplyToStatic(
-                cls.instance(),
-                use_cinn=True
-            )
-        return cls.static_instance_with_cinn_
-
-    @classmethod
-    def static_instance_without_cinn(cls):
-        if cls.static_instance_without_cinn_ is None:
-            cls.static_instance_without_cinn_ = ApplyToStatic(
-                cls.instance(),
-                use_cinn=False
-            )
-        return cls.static_instance_without_cinn_
-
-
-class CinnTestBase:
-
-    def setUp(self):
-        paddle.seed(2024)
-        self.prepare_data()
-
-    def test_train(self):
-        dy_outs = self.train(use_cinn=False)
-        cinn_outs = self.train(use_cinn=GetEnvVarEnableCinn())
-
-        for cinn_out, dy_out in zip(cinn_outs, dy_outs):
-          if type(cinn_out) is list and type(dy_out) is list:
-            for x, y in zip(cinn_out, dy_out):
-              self.assert_all_close(x, y)
-          else:
-            self.assert_all_close(cinn_out, dy_out)
-
-    def train(self, use_cinn):
-        if GetEnvVarEnableJit():
-            net = self.prepare_static_net(use_cinn)
-        else:
-            net = self.prepare_net()
-        paddle.seed(2024)
-        out = net(*self.inputs)
-        return out
-    
-    def prepare_data(self):
-        self.inputs = self.get_inputs()
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def prepare_net(self):
-        return self.get_test_class().instance()
-
-    def prepare_static_net(self, use_cinn):
-        if use_cinn:
-            return self.get_test_class().static_instance_with_cinn()
-        else:
-            return self.get_test_class().static_instance_without_cinn()
-
-    def assert_all_close(self, x, y):
-        if (hasattr(x, "numpy") and hasattr(y, "numpy")):
-            x_numpy = x.numpy()
-            y_numpy = y.numpy()
-            assert x_numpy.dtype == y_numpy.dtype
-            if IsInteger(x_numpy.dtype):
-                np.testing.assert_equal(x_numpy, y_numpy)
-            else:
-                tol = GetTolerance(x_numpy.dtype)
-                np.testing.assert_allclose(x_numpy, y_numpy, atol=tol, rtol=tol)
-        else:
-            assert x == y
-
-
-
-
-
-last_stage_failed = (IsCinnStageEnableDiff() and LastCINNStageFailed())
-class PrimitiveOp_b98148870472a92e43fffa5abf97f1e7(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.masked_select(input_0, input_1)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 500, 128], dtype='float32'),
-            paddle.static.InputSpec(shape=[1, 500, 128], dtype='bool'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3af23151663ac3a9a25b5619d2ada56e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b98148870472a92e43fffa5abf97f1e7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 500, 128], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 500, 128], dtype='int32'), 'bool'),
-        ]
-
-
-
-class PrimitiveOp_22e62b63110453382da0b612efb1a3b4(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.masked_select(input_0, input_1)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, 1], dtype='bool'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6c2fb25f8221e4e898ce77736520801c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_22e62b63110453382da0b612efb1a3b4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8732, 1], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 8732, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3af23151663ac3a9a25b5619d2ada56e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b98148870472a92e43fffa5abf97f1e7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 500, 128], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 500, 128], dtype='int32'), 'bool'),
-        ]
-
-
-
-class PrimitiveOp_abbc7001e21bdf4de074b7750a121267(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.masked_select(input_0, input_1)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, 4], dtype='bool'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_429caa237260cb506746b92b170f316e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_abbc7001e21bdf4de074b7750a121267
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3549, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 3549, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_429caa237260cb506746b92b170f316e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_abbc7001e21bdf4de074b7750a121267
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3549, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 3549, 4], dtype='int32'), 'bool'),
-        ]
-
-
-
-class PrimitiveOp_4a0becf994a7dcaad868cb4c3488d106(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.masked_select(input_0, input_1)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None], dtype='bool'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e40ed905c80284650bbf3c0cce3e86f8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4a0becf994a7dcaad868cb4c3488d106
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3549], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 3549], dtype='int32'), 'bool'),
-        ]
-
-
-
-class PrimitiveOp_5a04d903be61760b58411cdb4f853916(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.masked_select(input_0, input_1)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, 68], dtype='bool'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a34019304ff6bd9af9acda7d5ec2dfb3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5a04d903be61760b58411cdb4f853916
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3549, 68], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 3549, 68], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_429caa237260cb506746b92b170f316e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_abbc7001e21bdf4de074b7750a121267
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3549, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 3549, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f0828836ad749615bba42aa2d1772fa8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_abbc7001e21bdf4de074b7750a121267
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 11109, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 11109, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f0828836ad749615bba42aa2d1772fa8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_abbc7001e21bdf4de074b7750a121267
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 11109, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 11109, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3201a8bbd56bc2b6f9ac4e5e61135ebb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4a0becf994a7dcaad868cb4c3488d106
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 11109], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 11109], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_82170238948956f578b3662ba4d7332b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5a04d903be61760b58411cdb4f853916
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 11109, 68], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 11109, 68], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f0828836ad749615bba42aa2d1772fa8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_abbc7001e21bdf4de074b7750a121267
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 11109, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 11109, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_429caa237260cb506746b92b170f316e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_abbc7001e21bdf4de074b7750a121267
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3549, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 3549, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_429caa237260cb506746b92b170f316e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_abbc7001e21bdf4de074b7750a121267
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3549, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 3549, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e40ed905c80284650bbf3c0cce3e86f8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4a0becf994a7dcaad868cb4c3488d106
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3549], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 3549], dtype='int32'), 'bool'),
-        ]
-
-
-
-class PrimitiveOp_f98e4157393e3935bb77771b5768fb7b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.masked_select(input_0, input_1)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, 76], dtype='bool'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_550ec537b7fcd173897b34a8db1780f0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f98e4157393e3935bb77771b5768fb7b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3549, 76], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 3549, 76], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_429caa237260cb506746b92b170f316e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_abbc7001e21bdf4de074b7750a121267
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3549, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 3549, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_066f5089669d8e515d026e0421ddb230(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_abbc7001e21bdf4de074b7750a121267
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3024, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 3024, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_066f5089669d8e515d026e0421ddb230(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_abbc7001e21bdf4de074b7750a121267
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3024, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 3024, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_360e1d62ba8870023c6ca0d71369e2c3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4a0becf994a7dcaad868cb4c3488d106
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3024], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 3024], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9db63615ca612c764ffab18f6a02ec90(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5a04d903be61760b58411cdb4f853916
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3024, 68], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 3024, 68], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_066f5089669d8e515d026e0421ddb230(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_abbc7001e21bdf4de074b7750a121267
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3024, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 3024, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4c6b63c0bef28d1ac3c8d48cd43741d2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_abbc7001e21bdf4de074b7750a121267
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4116, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 4116, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4c6b63c0bef28d1ac3c8d48cd43741d2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_abbc7001e21bdf4de074b7750a121267
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4116, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 4116, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_369b1b286c9668d0c5a428f47eef1013(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4a0becf994a7dcaad868cb4c3488d106
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4116], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 4116], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_67d78e4dc4e01312a3ce6167c77380bc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5a04d903be61760b58411cdb4f853916
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4116, 68], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 4116, 68], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4c6b63c0bef28d1ac3c8d48cd43741d2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_abbc7001e21bdf4de074b7750a121267
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4116, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 4116, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_463079792ab4a6976c8699c33c0eb23b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_abbc7001e21bdf4de074b7750a121267
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9261, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 9261, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_463079792ab4a6976c8699c33c0eb23b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_abbc7001e21bdf4de074b7750a121267
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9261, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 9261, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c1da0eb7e1c3c5efb499f09f2480cd6c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4a0becf994a7dcaad868cb4c3488d106
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9261], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 9261], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2eafb5b656c9eb5aef137f75cc7f744a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5a04d903be61760b58411cdb4f853916
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9261, 68], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 9261, 68], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_463079792ab4a6976c8699c33c0eb23b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_abbc7001e21bdf4de074b7750a121267
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9261, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 9261, 4], dtype='int32'), 'bool'),
-        ]
-
-
-
-class PrimitiveOp_604619c596802e350c636c347dd72b52(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle._C_ops.masked_select(input_0, input_1)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None], dtype='bool'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_676e930b95c7f89b022c90f0458ec124(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2434, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 2434, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_676e930b95c7f89b022c90f0458ec124(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2434, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 2434, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_54f30ae13dc0d3dfda3ac898c38c0bcf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_22e62b63110453382da0b612efb1a3b4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2434, 1], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 2434, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9b473b2ca696bbe1fd623f0ac36e224a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_abbc7001e21bdf4de074b7750a121267
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2100, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 2100, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9b473b2ca696bbe1fd623f0ac36e224a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_abbc7001e21bdf4de074b7750a121267
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2100, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 2100, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d6e29032d3407e3fac5c536e2d4e6df3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4a0becf994a7dcaad868cb4c3488d106
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2100], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 2100], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7247502e0ac878e618b69c1d82e5a589(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5a04d903be61760b58411cdb4f853916
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2100, 68], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 2100, 68], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9b473b2ca696bbe1fd623f0ac36e224a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_abbc7001e21bdf4de074b7750a121267
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2100, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 2100, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8a94c9decdf3cf58f8699eafb4e1356f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_abbc7001e21bdf4de074b7750a121267
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4725, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 4725, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8a94c9decdf3cf58f8699eafb4e1356f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_abbc7001e21bdf4de074b7750a121267
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4725, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 4725, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_84e738ea2117a563d021bd2ca50c80f8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4a0becf994a7dcaad868cb4c3488d106
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4725], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 4725], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8772fe78b62b0aa189907c194c9db54e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5a04d903be61760b58411cdb4f853916
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4725, 68], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 4725, 68], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8a94c9decdf3cf58f8699eafb4e1356f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_abbc7001e21bdf4de074b7750a121267
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4725, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 4725, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b3a247750053a667078867385ab76e1f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_abbc7001e21bdf4de074b7750a121267
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 6069, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 6069, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b3a247750053a667078867385ab76e1f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_abbc7001e21bdf4de074b7750a121267
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 6069, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 6069, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ae33dd9d390b1826491f0977de290bd2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4a0becf994a7dcaad868cb4c3488d106
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 6069], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 6069], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_60b1bfdf80294b7932914b6b87f1f046(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5a04d903be61760b58411cdb4f853916
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 6069, 68], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 6069, 68], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b3a247750053a667078867385ab76e1f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_abbc7001e21bdf4de074b7750a121267
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 6069, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 6069, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9a6f2c0c563610db37b3fea38df45759(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_abbc7001e21bdf4de074b7750a121267
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 7581, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 7581, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9a6f2c0c563610db37b3fea38df45759(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_abbc7001e21bdf4de074b7750a121267
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 7581, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 7581, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fc55986a7292d19f6606e87e78163c0b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4a0becf994a7dcaad868cb4c3488d106
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 7581], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 7581], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7d7eab98b24021a3e64f2037a1719cdb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5a04d903be61760b58411cdb4f853916
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 7581, 68], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 7581, 68], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9a6f2c0c563610db37b3fea38df45759(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_abbc7001e21bdf4de074b7750a121267
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 7581, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 7581, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_56cd4a0f28c92132bcc5128eaaa1bdb3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8732, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 8732, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_56cd4a0f28c92132bcc5128eaaa1bdb3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8732, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 8732, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4c6b63c0bef28d1ac3c8d48cd43741d2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_abbc7001e21bdf4de074b7750a121267
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4116, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 4116, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4c6b63c0bef28d1ac3c8d48cd43741d2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_abbc7001e21bdf4de074b7750a121267
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4116, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 4116, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_369b1b286c9668d0c5a428f47eef1013(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4a0becf994a7dcaad868cb4c3488d106
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4116], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 4116], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_67d78e4dc4e01312a3ce6167c77380bc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5a04d903be61760b58411cdb4f853916
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4116, 68], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 4116, 68], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4c6b63c0bef28d1ac3c8d48cd43741d2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_abbc7001e21bdf4de074b7750a121267
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4116, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 4116, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3af23151663ac3a9a25b5619d2ada56e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b98148870472a92e43fffa5abf97f1e7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 500, 128], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 500, 128], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a7bf804e55d6224f9b85e3a188e72d36(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_abbc7001e21bdf4de074b7750a121267
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8400, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 8400, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a7bf804e55d6224f9b85e3a188e72d36(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_abbc7001e21bdf4de074b7750a121267
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8400, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 8400, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_daf155cd4551fe2681a7de31245daa79(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4a0becf994a7dcaad868cb4c3488d106
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8400], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 8400], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d92a214d83595b1b99865e001cd90cdc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5a04d903be61760b58411cdb4f853916
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8400, 68], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 8400, 68], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a7bf804e55d6224f9b85e3a188e72d36(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_abbc7001e21bdf4de074b7750a121267
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8400, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 8400, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ef30e3b71f858626e401b37640bd6768(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 500, 128], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 500, 128], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0e114e7b886b79c3ded28f5b3f36d5fa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8732, 1], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 8732, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ef30e3b71f858626e401b37640bd6768(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 500, 128], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 500, 128], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2f9f7478e6f3cdcefb788406ebacf39f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3549, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 3549, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2f9f7478e6f3cdcefb788406ebacf39f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3549, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 3549, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e40ed905c80284650bbf3c0cce3e86f8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4a0becf994a7dcaad868cb4c3488d106
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3549], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 3549], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fd00f583d2074aa17d0db751639b31fa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3549, 68], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 3549, 68], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2f9f7478e6f3cdcefb788406ebacf39f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3549, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 3549, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_96b748a80fdff4a4534016be408d12d9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 11109, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 11109, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_96b748a80fdff4a4534016be408d12d9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 11109, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 11109, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3201a8bbd56bc2b6f9ac4e5e61135ebb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4a0becf994a7dcaad868cb4c3488d106
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 11109], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 11109], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a2eb9dd61e324551ef4fed62dae07f6b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 11109, 68], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 11109, 68], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_96b748a80fdff4a4534016be408d12d9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 11109, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 11109, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2f9f7478e6f3cdcefb788406ebacf39f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3549, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 3549, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2f9f7478e6f3cdcefb788406ebacf39f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3549, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 3549, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e40ed905c80284650bbf3c0cce3e86f8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4a0becf994a7dcaad868cb4c3488d106
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3549], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 3549], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_812e2a6b96984ebc498e3dd4ca304ed0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3549, 76], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 3549, 76], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2f9f7478e6f3cdcefb788406ebacf39f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3549, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 3549, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_51e9f76a289be3c8b6e78201fbbbbe07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3024, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 3024, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_51e9f76a289be3c8b6e78201fbbbbe07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3024, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 3024, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_360e1d62ba8870023c6ca0d71369e2c3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4a0becf994a7dcaad868cb4c3488d106
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3024], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 3024], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_25caba9a0ebbf8bd904d447607e7579b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3024, 68], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 3024, 68], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_51e9f76a289be3c8b6e78201fbbbbe07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3024, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 3024, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3b37d162d3d5eadf3e5269f0a565762d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4116, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 4116, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3b37d162d3d5eadf3e5269f0a565762d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4116, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 4116, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_369b1b286c9668d0c5a428f47eef1013(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4a0becf994a7dcaad868cb4c3488d106
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4116], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 4116], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_92688325e570e4e9e956593b673bcbb2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4116, 68], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 4116, 68], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3b37d162d3d5eadf3e5269f0a565762d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4116, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 4116, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ab8e802e832a05324ff36d955342fdc7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9261, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 9261, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ab8e802e832a05324ff36d955342fdc7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9261, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 9261, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c1da0eb7e1c3c5efb499f09f2480cd6c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4a0becf994a7dcaad868cb4c3488d106
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9261], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 9261], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d4f6c8c7bd650ed275fa548cbb3a96be(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9261, 68], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 9261, 68], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ab8e802e832a05324ff36d955342fdc7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9261, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 9261, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_676e930b95c7f89b022c90f0458ec124(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2434, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 2434, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_676e930b95c7f89b022c90f0458ec124(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2434, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 2434, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6afa52a661577f938067dbe15746c2b1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2434, 1], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 2434, 1], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8e394d235a03e9057e1e531b95deeabe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2100, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 2100, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8e394d235a03e9057e1e531b95deeabe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2100, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 2100, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d6e29032d3407e3fac5c536e2d4e6df3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4a0becf994a7dcaad868cb4c3488d106
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2100], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 2100], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_20f5cfaa043018983a86369015f26903(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2100, 68], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 2100, 68], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8e394d235a03e9057e1e531b95deeabe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2100, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 2100, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0a82cd565841932e400d901c58c32d07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4725, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 4725, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0a82cd565841932e400d901c58c32d07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4725, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 4725, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_84e738ea2117a563d021bd2ca50c80f8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4a0becf994a7dcaad868cb4c3488d106
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4725], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 4725], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c0600a57344c85efa529387aed3b85d9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4725, 68], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 4725, 68], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0a82cd565841932e400d901c58c32d07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4725, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 4725, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cbbef444ccf864abd6c95b607bed0370(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 6069, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 6069, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cbbef444ccf864abd6c95b607bed0370(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 6069, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 6069, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ae33dd9d390b1826491f0977de290bd2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4a0becf994a7dcaad868cb4c3488d106
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 6069], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 6069], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c8788ddb08913ad652abd1165df149b7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 6069, 68], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 6069, 68], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cbbef444ccf864abd6c95b607bed0370(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 6069, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 6069, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1a20151defa49ac5211d24dd5ffd73c4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 7581, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 7581, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1a20151defa49ac5211d24dd5ffd73c4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 7581, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 7581, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fc55986a7292d19f6606e87e78163c0b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4a0becf994a7dcaad868cb4c3488d106
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 7581], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 7581], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5024ed28ae8c800f3d21acba9bfc9398(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 7581, 68], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 7581, 68], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1a20151defa49ac5211d24dd5ffd73c4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 7581, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 7581, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_56cd4a0f28c92132bcc5128eaaa1bdb3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8732, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 8732, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_56cd4a0f28c92132bcc5128eaaa1bdb3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8732, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 8732, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3b37d162d3d5eadf3e5269f0a565762d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4116, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 4116, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3b37d162d3d5eadf3e5269f0a565762d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4116, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 4116, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_369b1b286c9668d0c5a428f47eef1013(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4a0becf994a7dcaad868cb4c3488d106
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4116], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 4116], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_92688325e570e4e9e956593b673bcbb2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4116, 68], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 4116, 68], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3b37d162d3d5eadf3e5269f0a565762d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4116, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 4116, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ef30e3b71f858626e401b37640bd6768(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 500, 128], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 500, 128], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_18fafd9d67b9229ab4d8394f9f97695c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8400, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 8400, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_18fafd9d67b9229ab4d8394f9f97695c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8400, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 8400, 4], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_daf155cd4551fe2681a7de31245daa79(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4a0becf994a7dcaad868cb4c3488d106
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8400], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 8400], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1af0854a7c108f3d860c0d39c2f8544d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8400, 68], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 8400, 68], dtype='int32'), 'bool'),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_18fafd9d67b9229ab4d8394f9f97695c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_604619c596802e350c636c347dd72b52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8400, 4], dtype='float32', min=0, max=0.5),
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 8400, 4], dtype='int32'), 'bool'),
-        ]
-
-
-
-
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+if __name__ == "__main__":
+    sys.exit(table.main(__file__))
@@ -1,11065 +1,28 @@
 import os
-os.environ['FLAGS_cinn_new_group_scheduler'] = '1'
-os.environ['FLAGS_group_schedule_tiling_first'] = '1'
-os.environ['FLAGS_enable_pir_api'] = '1'
-os.environ['FLAGS_cinn_bucket_compile'] = '1'
 import sys
-import unittest
-import numpy as np
-from dataclasses import dataclass
-import typing as t
 
-@dataclass
-class Stage:
-    name: str
-    env_vars: t.Dict[str, str]
+import pytest
 
-cinn_stages = [
-    Stage(
-        name="dynamic_to_static",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=False,
-            FLAGS_prim_all=False,
-            FLAGS_prim_enable_dynamic=False,
-        ),
-    ),
-    Stage(
-        name="prim",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=False,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-        ),
-    ),
-    Stage(
-        name="infer_symbolic",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=False,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-            FLAGS_use_cinn=False,
-            FLAGS_check_infer_symbolic=True,
-        ),
-    ),
-	Stage(
-        name="frontend",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=True,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-            FLAGS_use_cinn=True,
-            FLAGS_check_infer_symbolic=False,
-            FLAGS_enable_fusion_fallback=True,
-        ), 
-    ),
-    Stage(
-        name="backend",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=True,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-            FLAGS_use_cinn=True,
-            FLAGS_check_infer_symbolic=False,
-            FLAGS_enable_fusion_fallback=False,
-        ), 
-    ),
-]
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir, os.pardir))
+from tools.e2e_case_stage import CinnStages  # noqa: E402
 
-def GetCinnStageByName(name):
-    for stage in cinn_stages:
-        if stage.name == name:
-            return stage
-    return None
+stages = CinnStages(__file__)
 
-def GetCurrentCinnStage():
-    name = os.getenv('PADDLE_DEBUG_CINN_STAGE_NAME')
-    if name is None:
-        return None
-    stage_names = [stage.name for stage in cinn_stages]
-    assert name in stage_names, (
-        f"PADDLE_DEBUG_CINN_STAGE_NAME should be in {stage_names}"
-    )
-    return GetCinnStageByName(name)
+from tools.e2e_case_table import E2ECaseTable, CinnTestBase  # noqa: E402
 
-def GetPrevCinnStage(stage):
-    for i in range(1, len(cinn_stages)):
-        if stage is cinn_stages[i]:
-            return cinn_stages[i - 1]
-    return None
+stages.apply()
+table = E2ECaseTable(__file__)
+last_stage_failed = stages.last_stage_failed()
 
-def IsCinnStageEnableDiff():
-    value = os.getenv('PADDLE_DEBUG_CINN_STAGE_ENABLE_DIFF')
-    enabled = value in {
-        '1',
-        'true',
-        'True',
-    }
-    if enabled:
-        assert GetCurrentCinnStage() is not None
-    return enabled
 
-last_cinn_stage_exit_code = None
-def LastCINNStageFailed():
-    global last_cinn_stage_exit_code
-    if last_cinn_stage_exit_code is not None:
-        return last_cinn_stage_exit_code != 0
-    last_stage = GetPrevCinnStage(GetCurrentCinnStage())
-    if last_stage is None:
-        return False
-    env_vars = dict(
-        PADDLE_DEBUG_CINN_STAGE_NAME=last_stage.name,
-        PADDLE_DEBUG_CINN_STAGE_ENABLE_DIFF='0',
-    )
-    env_vars_str = " ".join(
-        f"{env_var}={value}"
-        for env_var, value in env_vars.items()
-    )
-    last_cinn_stage_exit_code = os.system(
-        f"{env_vars_str} {sys.executable} {__file__} > /dev/null 2>&1"
-    )
-    return last_cinn_stage_exit_code != 0
+def pytest_generate_tests(metafunc):
+    table.parametrize(metafunc)
 
-def SetDefaultEnv(**env_var2value):
-    for env_var, value in env_var2value.items():
-        if os.getenv(env_var) is None:
-            os.environ[env_var] = str(value)
 
-SetDefaultEnv(
-    PADDLE_DEBUG_CINN_STAGE_NAME="backend",
-    PADDLE_DEBUG_CINN_STAGE_ENABLE_DIFF=False,
-    PADDLE_DEBUG_ENABLE_CINN=True,
-    FLAGS_enable_pir_api=True,
-    FLAGS_prim_all=True,
-    FLAGS_prim_enable_dynamic=True,
-    FLAGS_use_cinn=False,
-    FLAGS_check_infer_symbolic=False,
-    FLAGS_enable_fusion_fallback=False,
-)
+@pytest.mark.skipif(last_stage_failed, reason="last stage failed")
+class TestPrimitiveOp(CinnTestBase):
+    table = table
 
-import paddle
 
-def SetEnvVar(env_var2value):
-    for env_var, value in env_var2value.items():
-        os.environ[env_var] = str(value)
-    paddle.set_flags({
-        env_var:value
-        for env_var, value in env_var2value.items()
-        if env_var.startswith('FLAGS_')
-    })
-
-if GetCurrentCinnStage() is not None:
-    SetEnvVar(GetCurrentCinnStage().env_vars)
-
-def GetEnvVarEnableJit():
-    enable_jit = os.getenv('PADDLE_DEBUG_ENABLE_JIT')
-    return enable_jit not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
-
-def GetEnvVarEnableCinn():
-    enable_cinn = os.getenv('PADDLE_DEBUG_ENABLE_CINN')
-    if enable_cinn is None:
-        return True
-    return enable_cinn not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
-
-
-def GetTolerance(dtype):
-    if dtype == np.float16:
-        return GetFloat16Tolerance()
-    if dtype == np.float32:
-        return GetFloat32Tolerance()
-    return 1e-6
-
-def GetFloat16Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT16_TOL'))
-    except:
-        return 1e-3
-
-def GetFloat32Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT32_TOL'))
-    except:
-        return 1e-6
-
-def IsInteger(dtype):
-    return np.dtype(dtype).char in np.typecodes['AllInteger']
-
-def ApplyToStatic(net, use_cinn):
-    build_strategy = paddle.static.BuildStrategy()
-    build_strategy.build_cinn_pass = use_cinn
-    return paddle.jit.to_static(
-        net,
-        input_spec=net.get_input_spec(),
-        build_strategy=build_strategy,
-        full_graph=True,
-    )
-
-class InstanceTrait:
-
-    @classmethod
-    def instance(cls):
-        if cls.instance_ is None:
-            cls.instance_ = cls()
-        return cls.instance_
-
-    @classmethod
-    def static_instance_with_cinn(cls):
-        if cls.static_instance_with_cinn_ is None:
-            cls.static_instance_with_cinn_ = ApplyToStatic(
-                cls.instance(),
-                use_cinn=True
-            )
-        return cls.static_instance_with_cinn_
-
-    @classmethod
-    def static_instance_without_cinn(cls):
-        if cls.static_instance_without_cinn_ is None:
-            cls.static_instance_without_cinn_ = ApplyToStatic(
-                cls.instance(),
-                use_cinn=False
-            )
-        return cls.static_instance_without_cinn_
-
-
-class CinnTestBase:
-
-    def setUp(self):
-        paddle.seed(2024)
-        self.prepare_data()
-
-    def test_train(self):
-        dy_outs = self.train(use_cinn=False)
-        cinn_outs = self.train(use_cinn=GetEnvVarEnableCinn())
-
-        for cinn_out, dy_out in zip(cinn_outs, dy_outs):
-          if type(cinn_out) is list and type(dy_out) is list:
-            for x, y in zip(cinn_out, dy_out):
-              self.assert_all_close(x, y)
-          else:
-            self.assert_all_close(cinn_out, dy_out)
-
-    def train(self, use_cinn):
-        if GetEnvVarEnableJit():
-            net = self.prepare_static_net(use_cinn)
-        else:
-            net = self.prepare_net()
-        paddle.seed(2024)
-        out = net(*self.inputs)
-        return out
-    
-    def prepare_data(self):
-        self.inputs = self.get_inputs()
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def prepare_net(self):
-        return self.get_test_class().instance()
-
-    def prepare_static_net(self, use_cinn):
-        if use_cinn:
-            return self.get_test_class().static_instance_with_cinn()
-        else:
-            return self.get_test_class().static_instance_without_cinn()
-
-    def assert_all_close(self, x, y):
-        if (hasattr(x, "numpy") and hasattr(y, "numpy")):
-            x_numpy = x.numpy()
-            y_numpy = y.numpy()
-            assert x_numpy.dtype == y_numpy.dtype
-            if IsInteger(x_numpy.dtype):
-                np.testing.assert_equal(x_numpy, y_numpy)
-            else:
-                tol = GetTolerance(x_numpy.dtype)
-                np.testing.assert_allclose(x_numpy, y_numpy, atol=tol, rtol=tol)
-        else:
-            assert x == y
-
-
-
-
-
-last_stage_failed = (IsCinnStageEnableDiff() and LastCINNStageFailed())
-class PrimitiveOp_356c42ecd89d294420a645f91fbcccfd(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 21504, 1, 91], dtype='float32'),
-            paddle.static.InputSpec(shape=[None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ec112ad1b4ee1bf15023262b43b91a9d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_356c42ecd89d294420a645f91fbcccfd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 21504, 1, 91], dtype='float32', min=0, max=0.5),
-            paddle.uniform([91], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_10114e4fd61002fc3518fc538212802f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[192, 192], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3da8e11b119b3334f60485b2b2dd71f3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_10114e4fd61002fc3518fc538212802f
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 784, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_ee4a6febca9cbdcd1a2e4d0804ed9a43(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[11, 49, 192], dtype='float32'),
-            paddle.static.InputSpec(shape=[192, 384], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_db97a169f02fb6ab5054bdc0743cbda0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ee4a6febca9cbdcd1a2e4d0804ed9a43
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 49, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_d3e86366d9605663d0f17d07b87feb6f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[11, 8, 8, 7, 7, 96], dtype='float32'),
-            paddle.static.InputSpec(shape=[96, 288], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_26154f5822d0f274f1d3d8314a4ee360(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d3e86366d9605663d0f17d07b87feb6f
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 8, 8, 7, 7, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 288], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_eccd8910b982363d11cff8746098153c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[72, 18], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b88761d83b0d7c0ba4eebf2d924fc619(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_eccd8910b982363d11cff8746098153c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72], dtype='float32', min=0, max=0.5),
-            paddle.uniform([72, 18], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_622c0fc78e49025fb5014efcea417138(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 18], dtype='float32'),
-            paddle.static.InputSpec(shape=[18, 72], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_46dd03e78dc28ac701d0d078f1add53e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_622c0fc78e49025fb5014efcea417138
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[4.7128376960754395, 4.874957084655762, 4.827646255493164, 4.325068473815918, 4.148613929748535, 4.263113975524902, 4.267441749572754, 4.787745475769043, 5.16745138168335, 4.418758392333984, 5.105741500854492, 5.473527431488037, 5.001097202301025, 4.5380330085754395, 5.232659339904785, 5.4267425537109375, 6.2028679847717285, 5.070359230041504]], dtype='float32').reshape([1, 18]),
-            paddle.uniform([18, 72], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_1bfd0502d507e728fe298a626ba2e17e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 128], dtype='float32'),
-            paddle.static.InputSpec(shape=[128, 384], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9dd9ba5afcdfb2211dfb934bc34df8eb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1bfd0502d507e728fe298a626ba2e17e
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 100, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_e1b8aa7315c14955a85b3d095bb44468(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 4, None, 32], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 4, 32, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c4d5c4abc0914188e1375ddfc10668a1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e1b8aa7315c14955a85b3d095bb44468
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 4, 100, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 4, 32, 100], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_543c724fee619d410248d2891ca6febc(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 4, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 4, None, 32], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_aba54342401d5f8e1d6cbe314689a45a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_543c724fee619d410248d2891ca6febc
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 4, 100, 100], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 4, 100, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_03704671d567acf46652e091d72d3b21(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 128], dtype='float32'),
-            paddle.static.InputSpec(shape=[128, 128], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_21ad06e1479a85c791dda815aec62e3e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_03704671d567acf46652e091d72d3b21
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 100, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_0675fea5c5dbf4e66796902c063276b5(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[92, 23], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1d1abafe07679055267aad8cc05552de(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0675fea5c5dbf4e66796902c063276b5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 92], dtype='float32', min=0, max=0.5),
-            paddle.uniform([92, 23], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_c2468e7e9b15d0d00400c1c23561f7a3(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 23], dtype='float32'),
-            paddle.static.InputSpec(shape=[23, 92], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9fa9816684d9ff1b78912060e2b6cb7b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c2468e7e9b15d0d00400c1c23561f7a3
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[7.115499496459961, 6.420863628387451, 6.43386173248291, 6.495194911956787, 6.782318592071533, 6.629547595977783, 6.720054626464844, 6.494166851043701, 7.013171672821045, 6.801267147064209, 6.6948089599609375, 6.927262306213379, 7.087639808654785, 7.325156211853027, 5.409924030303955, 7.67278528213501, 7.237374782562256, 6.851604461669922, 6.978597640991211, 7.248482704162598, 7.14051628112793, 7.549689769744873, 6.527603626251221]], dtype='float32').reshape([1, 23]),
-            paddle.uniform([23, 92], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_a10430264009c428ebf66323e7ce59b0(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 192], dtype='float32'),
-            paddle.static.InputSpec(shape=[192, 576], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8ac4d9fb1dd1bcf150c5b7127441f1be(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a10430264009c428ebf66323e7ce59b0
-    def get_inputs(self):
-        return [
-            paddle.uniform([54, 198, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 576], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_ffeeb9036ff921100391f8b7f0a5d981(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 3, 198, 64], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 3, 64, 198], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e3118b0503eed8ce2572cf38a145c08a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ffeeb9036ff921100391f8b7f0a5d981
-    def get_inputs(self):
-        return [
-            paddle.uniform([54, 3, 198, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([54, 3, 64, 198], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_30eab31644bb57c2137ae4785a8e6a61(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 3, 198, 198], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 3, 198, 64], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b11eb1ab4dfa248fabe34a7080288732(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_30eab31644bb57c2137ae4785a8e6a61
-    def get_inputs(self):
-        return [
-            paddle.uniform([54, 3, 198, 198], dtype='float32', min=0, max=0.5),
-            paddle.uniform([54, 3, 198, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_d95c02b7fdbf157df6552bbb46d067cf(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 198, 192], dtype='float32'),
-            paddle.static.InputSpec(shape=[192, 192], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4dacab7a7118d4ad20e8e031ebd79e36(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d95c02b7fdbf157df6552bbb46d067cf
-    def get_inputs(self):
-        return [
-            paddle.uniform([54, 198, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_f5c840ffa97d19d9adb20b6364b2a295(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[24, 48], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_04be8b091ea28926d9659c1c3fd07359(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f5c840ffa97d19d9adb20b6364b2a295
-    def get_inputs(self):
-        return [
-            paddle.uniform([1960, 16, 24], dtype='float32', min=0, max=0.5),
-            paddle.uniform([24, 48], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_a16e2dbf50a388ea3cd0d0851594bfd0(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[24, 24], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8b39c93436ea52b112d7ddce8b9248fc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a16e2dbf50a388ea3cd0d0851594bfd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1960, 16, 24], dtype='float32', min=0, max=0.5),
-            paddle.uniform([24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_afb7d386ea4623cc904f4d3d177a4def(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2048, 1000], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_40fd9e5e3c3e06d570ddb1503265ea3e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_afb7d386ea4623cc904f4d3d177a4def
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 2048], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2048, 1000], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c9557daa7d73e5c710030d17e1484de1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_10114e4fd61002fc3518fc538212802f
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 784, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_06cc5c7e304deef2be994dc395244e1b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[43, 49, 192], dtype='float32'),
-            paddle.static.InputSpec(shape=[192, 384], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_85cda3d44ae1ab2b4259e8aba1d1aa09(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_06cc5c7e304deef2be994dc395244e1b
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 49, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_dcaadb7d6169b2948bdb0015c843f4ae(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[960, 240], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a654b812317f6f1ce97e8b337ef38bc3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_dcaadb7d6169b2948bdb0015c843f4ae
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 960], dtype='float32', min=0, max=0.5),
-            paddle.uniform([960, 240], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_8bb2604361f5c47fa54e2d3b9c9672a9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 240], dtype='float32'),
-            paddle.static.InputSpec(shape=[240, 960], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_22d0178fc4a3d52aed69dee80b9cd276(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8bb2604361f5c47fa54e2d3b9c9672a9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 240], dtype='float32', min=0, max=0.5),
-            paddle.uniform([240, 960], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_ea41905dbdbe7ca62418e78b95d36dcb(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[480, 120], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a32d7a81453b2950c1cc46d2469d4794(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ea41905dbdbe7ca62418e78b95d36dcb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480], dtype='float32', min=0, max=0.5),
-            paddle.uniform([480, 120], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_f05505e5afc96eee2e38bcbde9866caa(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 120], dtype='float32'),
-            paddle.static.InputSpec(shape=[120, 480], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8455be5775ef9964e20e100384f9372a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f05505e5afc96eee2e38bcbde9866caa
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120], dtype='float32', min=0, max=0.5),
-            paddle.uniform([120, 480], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_b08af7810d4ccbee4f25204334909fc9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[12544, 1024], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ca69279d19d1f9ef8502b0c7a3ccf236(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b08af7810d4ccbee4f25204334909fc9
-    def get_inputs(self):
-        return [
-            paddle.uniform([512, 12544], dtype='float32', min=0, max=0.5),
-            paddle.uniform([12544, 1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_7b653be932e4e8a8c4c1fbe9a1c59d50(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 1024], dtype='float32'),
-            paddle.static.InputSpec(shape=[1024, 1024], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7e162668201b7bf3acc90bbe1878f057(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b653be932e4e8a8c4c1fbe9a1c59d50
-    def get_inputs(self):
-        return [
-            paddle.uniform([512, 1024], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1024, 1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_a0b8e9703b64703db363d9dffb3f05ea(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[336, 84], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_309e0d6700834fb2545f110ceba31aa8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a0b8e9703b64703db363d9dffb3f05ea
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 336], dtype='float32', min=0, max=0.5),
-            paddle.uniform([336, 84], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_126a5f32d71053c58b9882de2b1b5ac8(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 84], dtype='float32'),
-            paddle.static.InputSpec(shape=[84, 336], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9bd39350a9836c8c59af8d61b68be41d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_126a5f32d71053c58b9882de2b1b5ac8
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 84], dtype='float32', min=0, max=0.5),
-            paddle.uniform([84, 336], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_95da8cf37229a36a6dda70d7fe9d4036(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[43, 8, 8, 7, 7, 96], dtype='float32'),
-            paddle.static.InputSpec(shape=[96, 288], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ab931e9ef7a32dcaff23969c283af9fc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_95da8cf37229a36a6dda70d7fe9d4036
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 8, 8, 7, 7, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 288], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_f870cd98cb97e40d286366330b4efe31(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[384, 384], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bed51ca2688a2731ddd7a8ead68ea76a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f870cd98cb97e40d286366330b4efe31
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b039171d23c0254e92c083ff0ecfa8c3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f870cd98cb97e40d286366330b4efe31
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 196, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_e289e20cbaf620d3f3fb0d2c6e84a11e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[43, 49, 384], dtype='float32'),
-            paddle.static.InputSpec(shape=[384, 768], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7c2882f5249ffcbb0f84de112163a131(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e289e20cbaf620d3f3fb0d2c6e84a11e
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 49, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_f217f43605138306671200e4d2fce8c5(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[60, 15], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fd7c909aa037af735c7fe36f40e617dd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f217f43605138306671200e4d2fce8c5
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 60], dtype='float32', min=0, max=0.5),
-            paddle.uniform([60, 15], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_07722365d5eb00133f201db095672412(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 15], dtype='float32'),
-            paddle.static.InputSpec(shape=[15, 60], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a67f9ba7e61ef5439fc51c75a7c5e69d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_07722365d5eb00133f201db095672412
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 15], dtype='float32', min=0, max=0.5),
-            paddle.uniform([15, 60], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_827ff0097bda4a3ff98e6fea1e54a651(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a0b8e9703b64703db363d9dffb3f05ea
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 336], dtype='float32', min=0, max=0.5),
-            paddle.uniform([336, 84], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_757bd4210ac436a67689c9c957987cda(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_126a5f32d71053c58b9882de2b1b5ac8
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 84], dtype='float32', min=0, max=0.5),
-            paddle.uniform([84, 336], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4b9c3501dc2a9efeeaabb552ebc975b4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_afb7d386ea4623cc904f4d3d177a4def
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 2048], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2048, 1000], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_827ff0097bda4a3ff98e6fea1e54a651(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a0b8e9703b64703db363d9dffb3f05ea
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 336], dtype='float32', min=0, max=0.5),
-            paddle.uniform([336, 84], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_757bd4210ac436a67689c9c957987cda(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_126a5f32d71053c58b9882de2b1b5ac8
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 84], dtype='float32', min=0, max=0.5),
-            paddle.uniform([84, 336], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_26106fa830c7189e5ae59d65a47fec06(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[96, 96], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1c2e1d0a0c65495c299fdf35a3791f89(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_26106fa830c7189e5ae59d65a47fec06
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 3136, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_bf157fca301bdb5c9fb1a63815f71734(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[43, 49, 96], dtype='float32'),
-            paddle.static.InputSpec(shape=[96, 192], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ce122a9d638f1015671de614ea529fbd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bf157fca301bdb5c9fb1a63815f71734
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 49, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4424e3bd0b079c920753e04c096d3712(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1bfd0502d507e728fe298a626ba2e17e
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 320, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_25c77035fff87a8918feeb79120695f7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e1b8aa7315c14955a85b3d095bb44468
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 4, 320, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 4, 32, 320], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_46ddb7fb3c12d92c298137b5b70259b4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_543c724fee619d410248d2891ca6febc
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 4, 320, 320], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 4, 320, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5d701bd76d182bb4d8eb74136597d5df(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_03704671d567acf46652e091d72d3b21
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 320, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_85fed3ad23ef8db69637f94247f5e888(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[240, 60], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f4d6dca098a19f7b787740981226cf32(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_85fed3ad23ef8db69637f94247f5e888
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 240], dtype='float32', min=0, max=0.5),
-            paddle.uniform([240, 60], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_abba347796d0c78c993be0ddd4061241(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 60], dtype='float32'),
-            paddle.static.InputSpec(shape=[60, 240], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_615412858142911d32a775c8f26db9ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_abba347796d0c78c993be0ddd4061241
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 60], dtype='float32', min=0, max=0.5),
-            paddle.uniform([60, 240], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_0d4ddeb8b5aa0cbe93c078ae4398c23c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[43, 4, 4, 7, 7, 192], dtype='float32'),
-            paddle.static.InputSpec(shape=[192, 576], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_872d1b4bb13db616f920570d6bbbed23(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0d4ddeb8b5aa0cbe93c078ae4398c23c
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 4, 4, 7, 7, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 576], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_5d998ae73cc35d7b667ab22f3f248259(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 768], dtype='float32'),
-            paddle.static.InputSpec(shape=[768, 2304], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1cdf3016735eb99a1d5945e0cc8d9e9a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5d998ae73cc35d7b667ab22f3f248259
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 577, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768, 2304], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_fb2bfc1571b4936e3bf9bd9051858e91(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 12, None, 64], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 12, 64, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_043485b0f6eb90fe3692121f46e9dca9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fb2bfc1571b4936e3bf9bd9051858e91
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 12, 577, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 12, 64, 577], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_3aa7a0435710d7898437212079477d5a(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 12, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 12, None, 64], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7c91ac48e3e33a8b158c46c871e77dc3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3aa7a0435710d7898437212079477d5a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 12, 577, 577], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 12, 577, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_40a386fb8a7b382850f8fbf56c67a45e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 768], dtype='float32'),
-            paddle.static.InputSpec(shape=[768, 768], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_dd6e814f5e4adfa21b0dc8b16e64dc1d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_40a386fb8a7b382850f8fbf56c67a45e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 577, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4c501ab21a62fcfcb3a68ab66ba327a7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f217f43605138306671200e4d2fce8c5
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 60], dtype='float32', min=0, max=0.5),
-            paddle.uniform([60, 15], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_896d5f4fe4dc49b90d58e1fb60a50b8d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_07722365d5eb00133f201db095672412
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 15], dtype='float32', min=0, max=0.5),
-            paddle.uniform([15, 60], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_bb9080ff135e106665effe03d57927c3(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[384, 768], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_76a170311632614fafbda968883829ad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bb9080ff135e106665effe03d57927c3
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 197, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_26cf28b4c04cde179f532b242d4996fc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f870cd98cb97e40d286366330b4efe31
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 197, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_acb26f87f9c08252206c74fa6975c732(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[872, 218], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_85a37fb4720ad4fddc418b18c430ca0d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_acb26f87f9c08252206c74fa6975c732
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 872], dtype='float32', min=0, max=0.5),
-            paddle.uniform([872, 218], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_899c0197b1a0487e7df2ce2bcfd2313c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 218], dtype='float32'),
-            paddle.static.InputSpec(shape=[218, 872], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ef7f24e84ff97880cd103866d8328fa3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_899c0197b1a0487e7df2ce2bcfd2313c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 218], dtype='float32', min=0, max=0.5),
-            paddle.uniform([218, 872], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_9763fb67b3269d467efa04464dd32776(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[11, 4, 4, 7, 7, 192], dtype='float32'),
-            paddle.static.InputSpec(shape=[192, 576], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b2132d4121ecab4cedbcfeb864cfee1b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9763fb67b3269d467efa04464dd32776
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 4, 4, 7, 7, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 576], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_04af113281bfa74ee326cd64ec21d93f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 16384, 128], dtype='float32'),
-            paddle.static.InputSpec(shape=[128, 128], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_506686479bd3b71710819a877724ba6e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_04af113281bfa74ee326cd64ec21d93f
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 16384, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_23ad79dea18f341eaad51ed61d4ba127(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, None, 128], dtype='float32'),
-            paddle.static.InputSpec(shape=[128, 256], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3cf08f25041701a0df8bfbc1d0ada5a3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_23ad79dea18f341eaad51ed61d4ba127
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_5490e7b7a5250b909ff3fe5e68fe4fa9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 2, 16384, 64], dtype='float32'),
-            paddle.static.InputSpec(shape=[1, 2, 64, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0d27a97b696ac908c7443f3ec61cfe8d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5490e7b7a5250b909ff3fe5e68fe4fa9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 16384, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 2, 64, 1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_812c40cd7837c95a33e2e37129e8edfd(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 2, 16384, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1, 2, None, 64], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7fa78248c6b5c3f55ab33bbebebfead3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_812c40cd7837c95a33e2e37129e8edfd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 16384, 1024], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 2, 1024, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_506686479bd3b71710819a877724ba6e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_04af113281bfa74ee326cd64ec21d93f
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 16384, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1c2e1d0a0c65495c299fdf35a3791f89(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_26106fa830c7189e5ae59d65a47fec06
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 3136, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ce122a9d638f1015671de614ea529fbd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bf157fca301bdb5c9fb1a63815f71734
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 49, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_5278002b4fb3e2c6c77be0dfa2e1ac96(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[768, 768], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9bb8e21535cebc9e75c3cd2d70dd77e1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5278002b4fb3e2c6c77be0dfa2e1ac96
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 49, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_e6ec51715019dd13180d65cde881c77e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[768, 1536], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4e1069ff2dbdef64c0760783c1061808(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6ec51715019dd13180d65cde881c77e
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 49, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768, 1536], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_f5c93f7c50aa6e116a5b85e04e00d715(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[3136, 1024], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_89574e05d84d1b5c208213ad4dbfc654(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f5c93f7c50aa6e116a5b85e04e00d715
-    def get_inputs(self):
-        return [
-            paddle.uniform([390, 3136], dtype='float32', min=0, max=0.5),
-            paddle.uniform([3136, 1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_de55c2b9390e11347c4ff7bf8712503b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b653be932e4e8a8c4c1fbe9a1c59d50
-    def get_inputs(self):
-        return [
-            paddle.uniform([390, 1024], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1024, 1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_72c358ceb597c2ae89221a2cb4e47480(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a0b8e9703b64703db363d9dffb3f05ea
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 336], dtype='float32', min=0, max=0.5),
-            paddle.uniform([336, 84], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_680b2c6b0f3c18c1dd31977296408304(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_126a5f32d71053c58b9882de2b1b5ac8
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 84], dtype='float32', min=0, max=0.5),
-            paddle.uniform([84, 336], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_eabbe4aae2623a7d8895e6ee683f6e66(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 64], dtype='float32'),
-            paddle.static.InputSpec(shape=[64, 192], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e633dab4f705209d5aa50a17e1713c09(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_eabbe4aae2623a7d8895e6ee683f6e66
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 640, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_5212c24328f1da5715f8ad26682610b7(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 2, None, 32], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 2, 32, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7749a176511f5366ad162da55aa10ebb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5212c24328f1da5715f8ad26682610b7
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 2, 640, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 2, 32, 640], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_94e2c97eebbbc082b02e54a1a99dc5d5(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 2, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 2, None, 32], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6e493d525393499e1619b5b3d0ec9828(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_94e2c97eebbbc082b02e54a1a99dc5d5
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 2, 640, 640], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 2, 640, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_b42967c1b55f85d0739847544d4b0d7a(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 64], dtype='float32'),
-            paddle.static.InputSpec(shape=[64, 64], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2213fa08ab3c1c306e7b0bb76c0c8f03(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b42967c1b55f85d0739847544d4b0d7a
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 640, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_225b16d7db5491e4fd84676009269665(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_85fed3ad23ef8db69637f94247f5e888
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 240], dtype='float32', min=0, max=0.5),
-            paddle.uniform([240, 60], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_00d17a29c8b686634f880a7be6fc9c24(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_abba347796d0c78c993be0ddd4061241
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 60], dtype='float32', min=0, max=0.5),
-            paddle.uniform([60, 240], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_aaf2421b8138a56b8965e8ded40dd1b2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a10430264009c428ebf66323e7ce59b0
-    def get_inputs(self):
-        return [
-            paddle.uniform([86, 198, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 576], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8235c07b2ba27d29988d419440a1f990(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ffeeb9036ff921100391f8b7f0a5d981
-    def get_inputs(self):
-        return [
-            paddle.uniform([86, 3, 198, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([86, 3, 64, 198], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6b7251e427273fb00f58f9c51eaad7fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_30eab31644bb57c2137ae4785a8e6a61
-    def get_inputs(self):
-        return [
-            paddle.uniform([86, 3, 198, 198], dtype='float32', min=0, max=0.5),
-            paddle.uniform([86, 3, 198, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4f5620dc190457b26535b2613e61716b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d95c02b7fdbf157df6552bbb46d067cf
-    def get_inputs(self):
-        return [
-            paddle.uniform([86, 198, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bb4631fa7a33d8553c7ae82ad4351d28(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_26106fa830c7189e5ae59d65a47fec06
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 3136, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_f5deddbe6022f2010019ac6658ee4621(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[11, 49, 96], dtype='float32'),
-            paddle.static.InputSpec(shape=[96, 192], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a44c5e49f373b60a604016ed757177b8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f5deddbe6022f2010019ac6658ee4621
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 49, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_a48a7dda0242f18b9a994644ebebf7a1(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[192, 1000], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2d0e493a0fc911472562af2277b9f637(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a48a7dda0242f18b9a994644ebebf7a1
-    def get_inputs(self):
-        return [
-            paddle.uniform([86, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 1000], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2d0e493a0fc911472562af2277b9f637(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a48a7dda0242f18b9a994644ebebf7a1
-    def get_inputs(self):
-        return [
-            paddle.uniform([86, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 1000], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_f773fe68d76354ab19b0acef8f0405ab(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[11, 320], dtype='float32'),
-            paddle.static.InputSpec(shape=[320, 1000], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e56c4cfb4d8b86aaf924a5e01c4fac10(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f773fe68d76354ab19b0acef8f0405ab
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 320], dtype='float32', min=0, max=0.5),
-            paddle.uniform([320, 1000], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0df942c11141a0f032cfcfa4bc256d6d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a48a7dda0242f18b9a994644ebebf7a1
-    def get_inputs(self):
-        return [
-            paddle.uniform([54, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 1000], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0df942c11141a0f032cfcfa4bc256d6d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a48a7dda0242f18b9a994644ebebf7a1
-    def get_inputs(self):
-        return [
-            paddle.uniform([54, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 1000], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_e728f88194c6e7d274bbdc92b5482222(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 1024], dtype='float32'),
-            paddle.static.InputSpec(shape=[1024, 2048], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9139ad96f5148e23e4b8b105b064f4ca(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e728f88194c6e7d274bbdc92b5482222
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 169, 1024], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1024, 2048], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_bf8861c2e8423775479e98b83503b09b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 2048], dtype='float32'),
-            paddle.static.InputSpec(shape=[2048, 1024], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9185fe0f4f3f759d1c489846262478ec(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bf8861c2e8423775479e98b83503b09b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 169, 2048], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2048, 1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_0dbc873dea846dca5cdc3dbe305cdd15(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[43, 1, 1, 7, 7, 768], dtype='float32'),
-            paddle.static.InputSpec(shape=[768, 2304], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_316b7fbf655a2fa50b725ea110c437c4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0dbc873dea846dca5cdc3dbe305cdd15
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 1, 1, 7, 7, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768, 2304], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4af91b4c487e5266516b47871f9c36cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f5c840ffa97d19d9adb20b6364b2a295
-    def get_inputs(self):
-        return [
-            paddle.uniform([4312, 16, 24], dtype='float32', min=0, max=0.5),
-            paddle.uniform([24, 48], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_451dca09664ba50829af5235a3b973c9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a16e2dbf50a388ea3cd0d0851594bfd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([4312, 16, 24], dtype='float32', min=0, max=0.5),
-            paddle.uniform([24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_309e0d6700834fb2545f110ceba31aa8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a0b8e9703b64703db363d9dffb3f05ea
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 336], dtype='float32', min=0, max=0.5),
-            paddle.uniform([336, 84], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9bd39350a9836c8c59af8d61b68be41d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_126a5f32d71053c58b9882de2b1b5ac8
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 84], dtype='float32', min=0, max=0.5),
-            paddle.uniform([84, 336], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ab931e9ef7a32dcaff23969c283af9fc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_95da8cf37229a36a6dda70d7fe9d4036
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 8, 8, 7, 7, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 288], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_89e63b8cee33660f3c9178a873a15fb6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_afb7d386ea4623cc904f4d3d177a4def
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 2048], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2048, 1000], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_25ae82b8b51fb8d24ea1ff6cedc74f08(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[36, 9], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_862d8380b2ea00dca45242bce09076fa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_25ae82b8b51fb8d24ea1ff6cedc74f08
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 36], dtype='float32', min=0, max=0.5),
-            paddle.uniform([36, 9], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_05a67717a631d1c19d15594ef37211e7(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 9], dtype='float32'),
-            paddle.static.InputSpec(shape=[9, 36], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_43014eb9ba74fea87c2e3f756dda2db4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_05a67717a631d1c19d15594ef37211e7
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 9], dtype='float32', min=0, max=0.5),
-            paddle.uniform([9, 36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_4039feee0d78e3e1c185431045ccde05(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 256], dtype='float32'),
-            paddle.static.InputSpec(shape=[256, 256], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_94a552bfbdaec9ba08d6c5926c111d05(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4039feee0d78e3e1c185431045ccde05
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_6e3bc6b08a6bfdf34409b18e52e29106(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 256], dtype='float32'),
-            paddle.static.InputSpec(shape=[256, 512], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_634a508b83b6669aba0bb652c513580f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6e3bc6b08a6bfdf34409b18e52e29106
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_64073a474de14f715b32b3a26188bde5(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 8, None, 32], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 8, 32, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cb9dfe9bbd3e41c3a794fc49dcb10a5b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_64073a474de14f715b32b3a26188bde5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8, 512, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 8, 32, 512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_2212a3aaa9288881cd9255904e785b42(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 8, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 8, None, 32], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6b1f7b3d104c20a913720b0bb8806352(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2212a3aaa9288881cd9255904e785b42
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8, 512, 512], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 8, 512, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_94a552bfbdaec9ba08d6c5926c111d05(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4039feee0d78e3e1c185431045ccde05
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_0124b1ac7490c7b795539404e7e7f9bc(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1280, 1000], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_199d44d7288ba19534b0ce1c2196c107(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0124b1ac7490c7b795539404e7e7f9bc
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 1280], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1280, 1000], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_832cd674a94fadd82540cf91d7175505(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f870cd98cb97e40d286366330b4efe31
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 196, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_09c4f66e05c633721854a94067c2e4ed(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[11, 49, 384], dtype='float32'),
-            paddle.static.InputSpec(shape=[384, 768], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cda76320f938a864be880034002153a1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_09c4f66e05c633721854a94067c2e4ed
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 49, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9dd9ba5afcdfb2211dfb934bc34df8eb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1bfd0502d507e728fe298a626ba2e17e
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 100, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c4d5c4abc0914188e1375ddfc10668a1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e1b8aa7315c14955a85b3d095bb44468
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 4, 100, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 4, 32, 100], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_aba54342401d5f8e1d6cbe314689a45a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_543c724fee619d410248d2891ca6febc
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 4, 100, 100], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 4, 100, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_21ad06e1479a85c791dda815aec62e3e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_03704671d567acf46652e091d72d3b21
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 100, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_565d7306ba98c22128b5bcef16edaca8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ea41905dbdbe7ca62418e78b95d36dcb
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 480], dtype='float32', min=0, max=0.5),
-            paddle.uniform([480, 120], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0489ea5bc58593a59d1ed38bf419b76a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f05505e5afc96eee2e38bcbde9866caa
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 120], dtype='float32', min=0, max=0.5),
-            paddle.uniform([120, 480], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ff3757067a921c10e57cd48ca83f085f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5d998ae73cc35d7b667ab22f3f248259
-    def get_inputs(self):
-        return [
-            paddle.uniform([4, 144, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768, 2304], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_20fe8951b3b8a0d3abbc24ccfc9ece11(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a0b8e9703b64703db363d9dffb3f05ea
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 336], dtype='float32', min=0, max=0.5),
-            paddle.uniform([336, 84], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fc538a48b1f84792b3977fe48395abbc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_126a5f32d71053c58b9882de2b1b5ac8
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 84], dtype='float32', min=0, max=0.5),
-            paddle.uniform([84, 336], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c2288735c481a4a0dd5b41017ef90b28(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_85fed3ad23ef8db69637f94247f5e888
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 240], dtype='float32', min=0, max=0.5),
-            paddle.uniform([240, 60], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6493c95eb8e9f61e4f0c73b7c464fdc6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_abba347796d0c78c993be0ddd4061241
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 60], dtype='float32', min=0, max=0.5),
-            paddle.uniform([60, 240], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_72c358ceb597c2ae89221a2cb4e47480(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a0b8e9703b64703db363d9dffb3f05ea
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 336], dtype='float32', min=0, max=0.5),
-            paddle.uniform([336, 84], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_680b2c6b0f3c18c1dd31977296408304(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_126a5f32d71053c58b9882de2b1b5ac8
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 84], dtype='float32', min=0, max=0.5),
-            paddle.uniform([84, 336], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_045fa51916047b5a098b1c57980f07f6(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1536, 1000], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_df5481214caff189c1f20114c80c777c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_045fa51916047b5a098b1c57980f07f6
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1536], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1536, 1000], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ab3ca64f7273453da4632c21358fff34(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f217f43605138306671200e4d2fce8c5
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 60], dtype='float32', min=0, max=0.5),
-            paddle.uniform([60, 15], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_95776b9297ca870c9a76c77999062d13(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_07722365d5eb00133f201db095672412
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 15], dtype='float32', min=0, max=0.5),
-            paddle.uniform([15, 60], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6c92bccf843fe73a83221d63396f15ba(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_85fed3ad23ef8db69637f94247f5e888
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 240], dtype='float32', min=0, max=0.5),
-            paddle.uniform([240, 60], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_374d6834b81173b9cb3634ca5008ff96(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_abba347796d0c78c993be0ddd4061241
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 60], dtype='float32', min=0, max=0.5),
-            paddle.uniform([60, 240], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_442e5b023dcf767a21feb94be74d500b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_045fa51916047b5a098b1c57980f07f6
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1536], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1536, 1000], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b2132d4121ecab4cedbcfeb864cfee1b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9763fb67b3269d467efa04464dd32776
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 4, 4, 7, 7, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 576], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_40fd9e5e3c3e06d570ddb1503265ea3e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_afb7d386ea4623cc904f4d3d177a4def
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 2048], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2048, 1000], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_d7c8db6ef29a10ccda2cfb93d19940da(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 384], dtype='float32'),
-            paddle.static.InputSpec(shape=[384, 1152], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_daaaea61f822da80ecd19638d711c9c5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d7c8db6ef29a10ccda2cfb93d19940da
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1025, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 1152], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_c79eb7978d367d33b7e4225cf307ef04(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 6, None, 64], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 6, 64, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3dd5096b09023ff9e092168cb6c94c1a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c79eb7978d367d33b7e4225cf307ef04
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 6, 1025, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 6, 64, 1025], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_4fa618435d80f312e87ace0ff3be953e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 6, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 6, None, 64], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4762fbe361aa7ce42849aa41a81479ec(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4fa618435d80f312e87ace0ff3be953e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 6, 1025, 1025], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 6, 1025, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_a829f11d83e897588b9ef8696e97f48e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 384], dtype='float32'),
-            paddle.static.InputSpec(shape=[384, 384], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5b251409f48419a020a42a2f902355ac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a829f11d83e897588b9ef8696e97f48e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1025, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2c583891a2bea84f3f25334637ede366(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_25ae82b8b51fb8d24ea1ff6cedc74f08
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 36], dtype='float32', min=0, max=0.5),
-            paddle.uniform([36, 9], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_87482f25cbef800d4cb7a00172ce2285(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_05a67717a631d1c19d15594ef37211e7
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 9], dtype='float32', min=0, max=0.5),
-            paddle.uniform([9, 36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0fd49be4d31dbfc109e4a7e00c8b73a2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5278002b4fb3e2c6c77be0dfa2e1ac96
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 49, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ebd9d854a2fd47b742400d8b45ec6c03(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6ec51715019dd13180d65cde881c77e
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 49, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768, 1536], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_b37a3c4fa4a6cfc1ede4f1c6ed3fac90(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 1024, 768], dtype='float32'),
-            paddle.static.InputSpec(shape=[768, 150], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a1de930843bbb0b6124fd2c829aa7796(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b37a3c4fa4a6cfc1ede4f1c6ed3fac90
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768, 150], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c41eb622c835e9161e5d063d684a4dab(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d7c8db6ef29a10ccda2cfb93d19940da
-    def get_inputs(self):
-        return [
-            paddle.uniform([4, 576, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 1152], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e36c66d939e5470b84105366b5a9330d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f217f43605138306671200e4d2fce8c5
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 60], dtype='float32', min=0, max=0.5),
-            paddle.uniform([60, 15], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1bd22aaa3308340341a85c76cd33c5d0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_07722365d5eb00133f201db095672412
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 15], dtype='float32', min=0, max=0.5),
-            paddle.uniform([15, 60], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_c4dca6cf4753fae7847b3a2c89de3014(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[672, 168], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_662906364c160844b72374953fb8fb69(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c4dca6cf4753fae7847b3a2c89de3014
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672], dtype='float32', min=0, max=0.5),
-            paddle.uniform([672, 168], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_8c2d7e704666bb529362cabc3f07b009(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 168], dtype='float32'),
-            paddle.static.InputSpec(shape=[168, 672], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5f9fc8c28e2bd06e57c0939165044aaa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8c2d7e704666bb529362cabc3f07b009
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 168], dtype='float32', min=0, max=0.5),
-            paddle.uniform([168, 672], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_20266cd55f117a51d0facffa5c28b892(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 2048, 160], dtype='float32'),
-            paddle.static.InputSpec(shape=[160, 160], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7f9b08e8f65b9b5204d82a58e41d44a9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_20266cd55f117a51d0facffa5c28b892
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2048, 160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160, 160], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_1f892c368543200895c987d630484f06(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, None, 160], dtype='float32'),
-            paddle.static.InputSpec(shape=[160, 320], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b883407953fd9440f404ca6000e78e44(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1f892c368543200895c987d630484f06
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160, 320], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_8a87457ec881dd5803c27fc7b10a39e7(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 5, 2048, 32], dtype='float32'),
-            paddle.static.InputSpec(shape=[1, 5, 32, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7438f2a3cb1d3f457fdf77ace2a71a1c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8a87457ec881dd5803c27fc7b10a39e7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 5, 2048, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 5, 32, 512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_0cfa6e54cf01f2600ea3f7e358f32e9b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 5, 2048, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1, 5, None, 32], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7df4b907ed4678aa07f3b597f242d994(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0cfa6e54cf01f2600ea3f7e358f32e9b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 5, 2048, 512], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 5, 512, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7f9b08e8f65b9b5204d82a58e41d44a9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_20266cd55f117a51d0facffa5c28b892
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2048, 160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160, 160], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29dbc89dd4b9b71bbb1bdde4fb411e9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4039feee0d78e3e1c185431045ccde05
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fe8921a3946e0944d8e196191d555221(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6e3bc6b08a6bfdf34409b18e52e29106
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d3a325e4da69084ae5b0902d148f34d8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_64073a474de14f715b32b3a26188bde5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8, 1024, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 8, 32, 1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f1ce7d9a44f43a5e99ce330d8ef06d2f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2212a3aaa9288881cd9255904e785b42
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8, 1024, 1024], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 8, 1024, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a29dbc89dd4b9b71bbb1bdde4fb411e9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4039feee0d78e3e1c185431045ccde05
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_20fe8951b3b8a0d3abbc24ccfc9ece11(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a0b8e9703b64703db363d9dffb3f05ea
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 336], dtype='float32', min=0, max=0.5),
-            paddle.uniform([336, 84], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fc538a48b1f84792b3977fe48395abbc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_126a5f32d71053c58b9882de2b1b5ac8
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 84], dtype='float32', min=0, max=0.5),
-            paddle.uniform([84, 336], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3da8e11b119b3334f60485b2b2dd71f3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_10114e4fd61002fc3518fc538212802f
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 784, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_db97a169f02fb6ab5054bdc0743cbda0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ee4a6febca9cbdcd1a2e4d0804ed9a43
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 49, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c204b7f71f69c0487c2662aee45a7297(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_afb7d386ea4623cc904f4d3d177a4def
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 2048], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2048, 1000], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_40fd9e5e3c3e06d570ddb1503265ea3e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_afb7d386ea4623cc904f4d3d177a4def
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 2048], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2048, 1000], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_8a50a62ff86f0b01c7342db54757e32a(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[43, 320], dtype='float32'),
-            paddle.static.InputSpec(shape=[320, 1000], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f5ad1a2dff930194366c3ef94967bc65(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8a50a62ff86f0b01c7342db54757e32a
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 320], dtype='float32', min=0, max=0.5),
-            paddle.uniform([320, 1000], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_316b7fbf655a2fa50b725ea110c437c4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0dbc873dea846dca5cdc3dbe305cdd15
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 1, 1, 7, 7, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768, 2304], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ea24e817d5f4dbca7f11ac10a5973058(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a10430264009c428ebf66323e7ce59b0
-    def get_inputs(self):
-        return [
-            paddle.uniform([54, 197, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 576], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_75745f021984eff269b32c40753c875e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 3, 197, 64], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 3, 64, 197], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_929409c729950f5319270b502ae46415(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_75745f021984eff269b32c40753c875e
-    def get_inputs(self):
-        return [
-            paddle.uniform([54, 3, 197, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([54, 3, 64, 197], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_20392341ef9483b613841e93e112f8ba(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 3, 197, 197], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 3, 197, 64], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_48db6e983fd2130bfe02d7b83e36123f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_20392341ef9483b613841e93e112f8ba
-    def get_inputs(self):
-        return [
-            paddle.uniform([54, 3, 197, 197], dtype='float32', min=0, max=0.5),
-            paddle.uniform([54, 3, 197, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_fc65388a86cf194227fbaa125cb96539(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 197, 192], dtype='float32'),
-            paddle.static.InputSpec(shape=[192, 192], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_711992c68fe210a549ac410fe88e31b1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fc65388a86cf194227fbaa125cb96539
-    def get_inputs(self):
-        return [
-            paddle.uniform([54, 197, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_0d10e5434ed2e7220ff1e590f354d487(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 65536, 32], dtype='float32'),
-            paddle.static.InputSpec(shape=[32, 32], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6fbbc22050b919c0c4e1a29a0f00da5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0d10e5434ed2e7220ff1e590f354d487
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 65536, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_b87ffbf230451f34b9dd3adfc542a94d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, None, 32], dtype='float32'),
-            paddle.static.InputSpec(shape=[32, 64], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b2d59e5bc2872d01110362aa8c809c55(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b87ffbf230451f34b9dd3adfc542a94d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_c6d2b0cfcaa876783b71899719e3016d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 1, 65536, 32], dtype='float32'),
-            paddle.static.InputSpec(shape=[1, 1, 32, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ba81f4794d760012262de153a4eb4b17(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6d2b0cfcaa876783b71899719e3016d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 65536, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 32, 1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_920df663cf5848159dee2094c390e66c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 1, 65536, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1, 1, None, 32], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ac77eb783393c77d3d00993294d7c288(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_920df663cf5848159dee2094c390e66c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 65536, 1024], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 1024, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6fbbc22050b919c0c4e1a29a0f00da5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0d10e5434ed2e7220ff1e590f354d487
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 65536, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_dd7c18d47999192a09500527cafdf154(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a10430264009c428ebf66323e7ce59b0
-    def get_inputs(self):
-        return [
-            paddle.uniform([4, 2304, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 576], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_872d1b4bb13db616f920570d6bbbed23(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0d4ddeb8b5aa0cbe93c078ae4398c23c
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 4, 4, 7, 7, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 576], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bb4631fa7a33d8553c7ae82ad4351d28(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_26106fa830c7189e5ae59d65a47fec06
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 3136, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a44c5e49f373b60a604016ed757177b8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f5deddbe6022f2010019ac6658ee4621
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 49, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_0447843d438d35ad850ab9556fd29af0(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[96, 6625], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_becaf32935888ef4c19fe9434ae209f9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0447843d438d35ad850ab9556fd29af0
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 40, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 6625], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4424e3bd0b079c920753e04c096d3712(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1bfd0502d507e728fe298a626ba2e17e
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 320, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_25c77035fff87a8918feeb79120695f7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e1b8aa7315c14955a85b3d095bb44468
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 4, 320, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 4, 32, 320], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_46ddb7fb3c12d92c298137b5b70259b4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_543c724fee619d410248d2891ca6febc
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 4, 320, 320], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 4, 320, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5d701bd76d182bb4d8eb74136597d5df(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_03704671d567acf46652e091d72d3b21
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 320, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_23731edeef7eb81593961efa7cc028c4(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 32768, 64], dtype='float32'),
-            paddle.static.InputSpec(shape=[64, 64], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_41b4e6a32fc423b4c7075e770c7e02e4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_23731edeef7eb81593961efa7cc028c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 32768, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_0398335e23526a536f69baa1150293df(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, None, 64], dtype='float32'),
-            paddle.static.InputSpec(shape=[64, 128], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_32256a9ac716fba8b6707f85a2e0bb55(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0398335e23526a536f69baa1150293df
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_cee2770d7462fa9b3961a25127bd0b07(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 1, 32768, 64], dtype='float32'),
-            paddle.static.InputSpec(shape=[1, 1, 64, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fa1d9a65880f720f164af041232a59cc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cee2770d7462fa9b3961a25127bd0b07
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 32768, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 64, 512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_5d0a6ef8fddacccd9ebc2c866cb5dce7(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 1, 32768, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1, 1, None, 64], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2a04535dd3162ef0396f38f0118d001a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5d0a6ef8fddacccd9ebc2c866cb5dce7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 32768, 512], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 512, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_41b4e6a32fc423b4c7075e770c7e02e4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_23731edeef7eb81593961efa7cc028c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 32768, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0fd49be4d31dbfc109e4a7e00c8b73a2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5278002b4fb3e2c6c77be0dfa2e1ac96
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 49, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ebd9d854a2fd47b742400d8b45ec6c03(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6ec51715019dd13180d65cde881c77e
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 49, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768, 1536], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_15a8a4a89d15674faf686a1dde0207c6(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 1024, 384], dtype='float32'),
-            paddle.static.InputSpec(shape=[384, 150], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9105b664d03a9dd6ffff2b70194c710b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_15a8a4a89d15674faf686a1dde0207c6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 150], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_48bf733aac69614b446016d8446dd04c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_eabbe4aae2623a7d8895e6ee683f6e66
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 200, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e5db14b85305822d4273e0573ea47c80(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5212c24328f1da5715f8ad26682610b7
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 2, 200, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 2, 32, 200], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_afb5b584e27a54455097a8662dfe766d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_94e2c97eebbbc082b02e54a1a99dc5d5
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 2, 200, 200], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 2, 200, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2d7fa61dcd95a060ff1ed79329071e8b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b42967c1b55f85d0739847544d4b0d7a
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 200, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_99d6ef7b2db9bb0f8c4b658c44d35271(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5d998ae73cc35d7b667ab22f3f248259
-    def get_inputs(self):
-        return [
-            paddle.uniform([6, 144, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768, 2304], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_59e6e8ea9866b109d60fad74f04d6571(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bb9080ff135e106665effe03d57927c3
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 197, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_81c87710008370c94e0d05e5aa735e16(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f870cd98cb97e40d286366330b4efe31
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 197, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_a085d46a4dce47859f41032811bd1251(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[43, 2, 2, 7, 7, 384], dtype='float32'),
-            paddle.static.InputSpec(shape=[384, 1152], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f16979eae6a790a7b510f73e8df72292(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a085d46a4dce47859f41032811bd1251
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 2, 2, 7, 7, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 1152], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_f49f0cce706696f3db51e0fe3c79eae4(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 8192, 128], dtype='float32'),
-            paddle.static.InputSpec(shape=[128, 128], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2279ba0db3e55ea6b8add80b01a298d1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f49f0cce706696f3db51e0fe3c79eae4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8192, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_664154b8bdc0b6f147dc3ae6394718a2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_23ad79dea18f341eaad51ed61d4ba127
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_02d401712a1984b9279329003131fc65(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 2, 8192, 64], dtype='float32'),
-            paddle.static.InputSpec(shape=[1, 2, 64, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7bbd6dc83a7f3740b2a6d31aaaff36c2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_02d401712a1984b9279329003131fc65
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 8192, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 2, 64, 512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_2b7db64828e337230139ed58fb397229(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 2, 8192, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1, 2, None, 64], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1ad77bcd67d9912595e278b53fe36881(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2b7db64828e337230139ed58fb397229
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 8192, 512], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 2, 512, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2279ba0db3e55ea6b8add80b01a298d1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f49f0cce706696f3db51e0fe3c79eae4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8192, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_ec99b86ad294572ed0f823bc46058905(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[704, 1000], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1013b34c478b020f76cca1e220650750(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ec99b86ad294572ed0f823bc46058905
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 704], dtype='float32', min=0, max=0.5),
-            paddle.uniform([704, 1000], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_cf89eb0f9f0fe397af78bf136a20fd3b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 2048, 320], dtype='float32'),
-            paddle.static.InputSpec(shape=[320, 320], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_301cf1bed16908480c39b75d87973686(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cf89eb0f9f0fe397af78bf136a20fd3b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2048, 320], dtype='float32', min=0, max=0.5),
-            paddle.uniform([320, 320], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_e0477fc9d0aba573111cdba8ae47dd68(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, None, 320], dtype='float32'),
-            paddle.static.InputSpec(shape=[320, 640], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d1c40a5eda876da6d6e4878521140014(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e0477fc9d0aba573111cdba8ae47dd68
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 320], dtype='float32', min=0, max=0.5),
-            paddle.uniform([320, 640], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_2b3e8432faf4e8d2517fc283da1c4fb6(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 5, 2048, 64], dtype='float32'),
-            paddle.static.InputSpec(shape=[1, 5, 64, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_59f78d070d0a09eccf734837fb32e920(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2b3e8432faf4e8d2517fc283da1c4fb6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 5, 2048, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 5, 64, 512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_0cd93ad859096c0621f50af2b61dd306(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 5, 2048, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1, 5, None, 64], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_176f827d9da33ee8abecf5b4316b5f31(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0cd93ad859096c0621f50af2b61dd306
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 5, 2048, 512], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 5, 512, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_301cf1bed16908480c39b75d87973686(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cf89eb0f9f0fe397af78bf136a20fd3b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2048, 320], dtype='float32', min=0, max=0.5),
-            paddle.uniform([320, 320], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_5b742b7d1b2e6bcfc8d82e4f4bb49450(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1248, 312], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_43ead1f101c5699f3c4992a1ba5d731b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5b742b7d1b2e6bcfc8d82e4f4bb49450
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1248], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1248, 312], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_02eef5df09e902dff812d49158e3c886(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 312], dtype='float32'),
-            paddle.static.InputSpec(shape=[312, 1248], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_70a61816c6f5d7bde1f74a7b588b1ff3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_02eef5df09e902dff812d49158e3c886
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 312], dtype='float32', min=0, max=0.5),
-            paddle.uniform([312, 1248], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_4f4343fa42a53965efbe811ba971fb76(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 96], dtype='float32'),
-            paddle.static.InputSpec(shape=[96, 288], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f0723ba7c2fcfc6bd264b68d8daf6880(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4f4343fa42a53965efbe811ba971fb76
-    def get_inputs(self):
-        return [
-            paddle.uniform([4, 9216, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 288], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_73ddf2ba9fe0816cfbf3b429dde64ffc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ea41905dbdbe7ca62418e78b95d36dcb
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 480], dtype='float32', min=0, max=0.5),
-            paddle.uniform([480, 120], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f33cb6d048ff03ef18e6b0ea573437ef(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f05505e5afc96eee2e38bcbde9866caa
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 120], dtype='float32', min=0, max=0.5),
-            paddle.uniform([120, 480], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_edd48529304deaa62ed9fde9ad616c18(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_25ae82b8b51fb8d24ea1ff6cedc74f08
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 36], dtype='float32', min=0, max=0.5),
-            paddle.uniform([36, 9], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_feb3204a24958ff82d64136020308f03(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_05a67717a631d1c19d15594ef37211e7
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 9], dtype='float32', min=0, max=0.5),
-            paddle.uniform([9, 36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_e31a1a52fa85e33d2e330f720b2e2e98(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[11, 1, 1, 7, 7, 768], dtype='float32'),
-            paddle.static.InputSpec(shape=[768, 2304], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ab3e7b2335635189671f561d88962862(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e31a1a52fa85e33d2e330f720b2e2e98
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 1, 1, 7, 7, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768, 2304], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_fd35b9ebd6d797119bad973a4f138072(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[11, 2, 2, 7, 7, 384], dtype='float32'),
-            paddle.static.InputSpec(shape=[384, 1152], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ea7f231b4195b6fa121bbd86c713ab91(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fd35b9ebd6d797119bad973a4f138072
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 2, 2, 7, 7, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 1152], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ab3e7b2335635189671f561d88962862(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e31a1a52fa85e33d2e330f720b2e2e98
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 1, 1, 7, 7, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768, 2304], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0eba54decb14a58a49a460596d354c6f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5d998ae73cc35d7b667ab22f3f248259
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1025, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768, 2304], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3f53fb01023b033c85a73cdedb5c02f1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fb2bfc1571b4936e3bf9bd9051858e91
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 12, 1025, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 12, 64, 1025], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3b625e5565c0a8340c069d0ae0278902(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3aa7a0435710d7898437212079477d5a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 12, 1025, 1025], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 12, 1025, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0e46871257c544fe14f5ba52ad6a4bd4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_40a386fb8a7b382850f8fbf56c67a45e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1025, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ea7f231b4195b6fa121bbd86c713ab91(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fd35b9ebd6d797119bad973a4f138072
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 2, 2, 7, 7, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 1152], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_5f0bfd0cacc67fbee8d3b56ddb7d44a2(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[156, 39], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1e24ebf41eaa808ef7b5c734d7251387(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5f0bfd0cacc67fbee8d3b56ddb7d44a2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 156], dtype='float32', min=0, max=0.5),
-            paddle.uniform([156, 39], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_0bbb615488fc17dc9e889a84cd347350(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 39], dtype='float32'),
-            paddle.static.InputSpec(shape=[39, 156], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7e95625f6d787fddac1334dffb5ad034(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0bbb615488fc17dc9e889a84cd347350
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 39], dtype='float32', min=0, max=0.5),
-            paddle.uniform([39, 156], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_41e3bf27a7995abef85d4d3622986964(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 512], dtype='float32'),
-            paddle.static.InputSpec(shape=[512, 512], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7628f33ccd6963d8736888d37bfe6021(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_41e3bf27a7995abef85d4d3622986964
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 512], dtype='float32', min=0, max=0.5),
-            paddle.uniform([512, 512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_838a6ec604685adb1e6e9af0e7ec4214(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 512], dtype='float32'),
-            paddle.static.InputSpec(shape=[512, 1024], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2c93b67e4abfb45bffea6e6a155982cb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_838a6ec604685adb1e6e9af0e7ec4214
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 512], dtype='float32', min=0, max=0.5),
-            paddle.uniform([512, 1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_7dec46445e2b92d2d5eeb2268f41215a(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 8, None, 64], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 8, 64, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3ed9c0ef44f7e6856f780b431893f7a2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7dec46445e2b92d2d5eeb2268f41215a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8, 1024, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 8, 64, 1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_fedcc18621b5bd1bfca26160d7b8e360(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 8, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 8, None, 64], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_291eb8ddf7c96b5726fe99ee59d3c12d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fedcc18621b5bd1bfca26160d7b8e360
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8, 1024, 1024], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 8, 1024, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7628f33ccd6963d8736888d37bfe6021(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_41e3bf27a7995abef85d4d3622986964
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 512], dtype='float32', min=0, max=0.5),
-            paddle.uniform([512, 512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_85a37fb4720ad4fddc418b18c430ca0d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_acb26f87f9c08252206c74fa6975c732
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 872], dtype='float32', min=0, max=0.5),
-            paddle.uniform([872, 218], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ef7f24e84ff97880cd103866d8328fa3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_899c0197b1a0487e7df2ce2bcfd2313c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 218], dtype='float32', min=0, max=0.5),
-            paddle.uniform([218, 872], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_26154f5822d0f274f1d3d8314a4ee360(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d3e86366d9605663d0f17d07b87feb6f
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 8, 8, 7, 7, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 288], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f16979eae6a790a7b510f73e8df72292(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a085d46a4dce47859f41032811bd1251
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 2, 2, 7, 7, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 1152], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ef9fc56f124dd54802aaaff5456763f1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4f4343fa42a53965efbe811ba971fb76
-    def get_inputs(self):
-        return [
-            paddle.uniform([6, 9216, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 288], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1769bc2b0e5afdae61b815529c1db1be(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ea41905dbdbe7ca62418e78b95d36dcb
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 480], dtype='float32', min=0, max=0.5),
-            paddle.uniform([480, 120], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f443ffa8e986ec282c16354a2c401c48(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f05505e5afc96eee2e38bcbde9866caa
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 120], dtype='float32', min=0, max=0.5),
-            paddle.uniform([120, 480], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7aca6f9c31c93d8921f240d728184135(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ea41905dbdbe7ca62418e78b95d36dcb
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 480], dtype='float32', min=0, max=0.5),
-            paddle.uniform([480, 120], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1fefb1c72918968015a28f630acb1910(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f05505e5afc96eee2e38bcbde9866caa
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 120], dtype='float32', min=0, max=0.5),
-            paddle.uniform([120, 480], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9bb8e21535cebc9e75c3cd2d70dd77e1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5278002b4fb3e2c6c77be0dfa2e1ac96
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 49, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4e1069ff2dbdef64c0760783c1061808(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6ec51715019dd13180d65cde881c77e
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 49, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768, 1536], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_8a3adfb91d5ee57f3dd275de83e9cea4(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[192, 37], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_826877f8841feacbac9da50faf80a6c9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8a3adfb91d5ee57f3dd275de83e9cea4
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 25, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 37], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d19793b41adda644ad299bf7702ead03(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_25ae82b8b51fb8d24ea1ff6cedc74f08
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 36], dtype='float32', min=0, max=0.5),
-            paddle.uniform([36, 9], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_02b20ac515dd30307d4413450f83f865(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_05a67717a631d1c19d15594ef37211e7
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 9], dtype='float32', min=0, max=0.5),
-            paddle.uniform([9, 36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_c25d1bdb24b4652f2c59c01e0de0f232(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[120, 30], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ea6d5218592495e43eb8669b2224d7c0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c25d1bdb24b4652f2c59c01e0de0f232
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120], dtype='float32', min=0, max=0.5),
-            paddle.uniform([120, 30], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_bdc81baa8a577ad6065a1908e8df3144(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 30], dtype='float32'),
-            paddle.static.InputSpec(shape=[30, 120], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b5725f8948c8ffc505c218835ea6727a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bdc81baa8a577ad6065a1908e8df3144
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[7.328573703765869, 6.247287750244141, 7.139821529388428, 8.04222583770752, 7.969217777252197, 7.186982154846191, 6.653398036956787, 7.3734540939331055, 6.929617881774902, 8.31694221496582, 7.523541450500488, 7.806892395019531, 7.436128616333008, 7.457583904266357, 7.253500461578369, 7.969172477722168, 7.317387104034424, 7.51309871673584, 7.171206474304199, 6.792637825012207, 6.585378646850586, 7.3003926277160645, 7.75144624710083, 7.329493999481201, 7.001270294189453, 7.774947643280029, 6.7110700607299805, 7.38953161239624, 8.684221267700195, 7.437966823577881]], dtype='float32').reshape([1, 30]),
-            paddle.uniform([30, 120], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_1c2fd37d81af0c78954ddf9e8a9480a4(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 4096, 320], dtype='float32'),
-            paddle.static.InputSpec(shape=[320, 320], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_dc52daab4399aa4764d918f19102a124(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1c2fd37d81af0c78954ddf9e8a9480a4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4096, 320], dtype='float32', min=0, max=0.5),
-            paddle.uniform([320, 320], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e426b3c2d6c0ab98516502c5a8084ffd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e0477fc9d0aba573111cdba8ae47dd68
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 320], dtype='float32', min=0, max=0.5),
-            paddle.uniform([320, 640], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_6cbfb1815c5c23a75e642a5c7d1fec2a(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 5, 4096, 64], dtype='float32'),
-            paddle.static.InputSpec(shape=[1, 5, 64, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e8e60dbfd1ed2b489480f0b5514ec42c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6cbfb1815c5c23a75e642a5c7d1fec2a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 5, 4096, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 5, 64, 1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_27e18fa7f8a68a4208f89bfc00205b63(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 5, 4096, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1, 5, None, 64], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_adb658b520c66c09d3d544b9b9811630(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_27e18fa7f8a68a4208f89bfc00205b63
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 5, 4096, 1024], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 5, 1024, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_dc52daab4399aa4764d918f19102a124(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1c2fd37d81af0c78954ddf9e8a9480a4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4096, 320], dtype='float32', min=0, max=0.5),
-            paddle.uniform([320, 320], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_86f6b7a6460b3fad56667d102e33230c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 4096, 160], dtype='float32'),
-            paddle.static.InputSpec(shape=[160, 160], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_46d73bc0871876f92a02fae53bee5e2e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_86f6b7a6460b3fad56667d102e33230c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4096, 160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160, 160], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cb9e75aea9bcec963dc4d18f684cfe72(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1f892c368543200895c987d630484f06
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160, 320], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_2c85b1f8da72080498db5944b70b3a82(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 5, 4096, 32], dtype='float32'),
-            paddle.static.InputSpec(shape=[1, 5, 32, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c553b3c859f3c9291dbc21a90d722830(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2c85b1f8da72080498db5944b70b3a82
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 5, 4096, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 5, 32, 1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_50a1ce3b4526ae7d3c6111517cf717b9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 5, 4096, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1, 5, None, 32], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9bfb0a9c002ef2d26c51e9a9bf8180e7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_50a1ce3b4526ae7d3c6111517cf717b9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 5, 4096, 1024], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 5, 1024, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_46d73bc0871876f92a02fae53bee5e2e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_86f6b7a6460b3fad56667d102e33230c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4096, 160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160, 160], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_662906364c160844b72374953fb8fb69(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c4dca6cf4753fae7847b3a2c89de3014
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672], dtype='float32', min=0, max=0.5),
-            paddle.uniform([672, 168], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5f9fc8c28e2bd06e57c0939165044aaa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8c2d7e704666bb529362cabc3f07b009
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 168], dtype='float32', min=0, max=0.5),
-            paddle.uniform([168, 672], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b039171d23c0254e92c083ff0ecfa8c3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f870cd98cb97e40d286366330b4efe31
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 196, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7c2882f5249ffcbb0f84de112163a131(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e289e20cbaf620d3f3fb0d2c6e84a11e
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 49, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c11e9a268e0657458ef756ca300f18d1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_41e3bf27a7995abef85d4d3622986964
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 512], dtype='float32', min=0, max=0.5),
-            paddle.uniform([512, 512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1453d304195cd9775e6ed80eb4b9f5fa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_838a6ec604685adb1e6e9af0e7ec4214
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 512], dtype='float32', min=0, max=0.5),
-            paddle.uniform([512, 1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7987ad53c33d3844d44062e8885ab043(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7dec46445e2b92d2d5eeb2268f41215a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8, 512, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 8, 64, 512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_725481f788ffd2729db396a87ad39a02(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fedcc18621b5bd1bfca26160d7b8e360
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8, 512, 512], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 8, 512, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c11e9a268e0657458ef756ca300f18d1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_41e3bf27a7995abef85d4d3622986964
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 512], dtype='float32', min=0, max=0.5),
-            paddle.uniform([512, 512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_57ffd631e1da07f7d4c45697cd13092e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a10430264009c428ebf66323e7ce59b0
-    def get_inputs(self):
-        return [
-            paddle.uniform([6, 2304, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 576], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fd3fb307fa66b2a2f74307b392ffbd75(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5278002b4fb3e2c6c77be0dfa2e1ac96
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c9557daa7d73e5c710030d17e1484de1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_10114e4fd61002fc3518fc538212802f
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 784, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_85cda3d44ae1ab2b4259e8aba1d1aa09(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_06cc5c7e304deef2be994dc395244e1b
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 49, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_832cd674a94fadd82540cf91d7175505(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f870cd98cb97e40d286366330b4efe31
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 196, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cda76320f938a864be880034002153a1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_09c4f66e05c633721854a94067c2e4ed
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 49, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_acf2c660566a8a16c414665507e9d46e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d7c8db6ef29a10ccda2cfb93d19940da
-    def get_inputs(self):
-        return [
-            paddle.uniform([6, 576, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 1152], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_83563503a25d039aa0fee51b0f582478(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 16384, 64], dtype='float32'),
-            paddle.static.InputSpec(shape=[64, 64], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ecedeedee1f9647f7635ee763356a578(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_83563503a25d039aa0fee51b0f582478
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 16384, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4ab274b35c2d48d461073e3b6b29735d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0398335e23526a536f69baa1150293df
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_9502fb7dff34bff4549779b2ebeef7e9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 2, 16384, 32], dtype='float32'),
-            paddle.static.InputSpec(shape=[1, 2, 32, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c5b5daca88a5f7ebe4ed7ed5abc1ff1d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9502fb7dff34bff4549779b2ebeef7e9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 16384, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 2, 32, 1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_c6c081446990461a405a5f3ddc2f1b6e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 2, 16384, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1, 2, None, 32], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_78f9f4a0d28678b62474f5dcc4a40b19(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6c081446990461a405a5f3ddc2f1b6e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 16384, 1024], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 2, 1024, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ecedeedee1f9647f7635ee763356a578(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_83563503a25d039aa0fee51b0f582478
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 16384, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_8d011488e48df5b350d72e2331a59e4c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 8192, 64], dtype='float32'),
-            paddle.static.InputSpec(shape=[64, 64], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_63896f8078b100ef5c6b71560da070d2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8d011488e48df5b350d72e2331a59e4c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8192, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_32256a9ac716fba8b6707f85a2e0bb55(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0398335e23526a536f69baa1150293df
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_408c75582b8408805cf2295a7fd988b0(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 2, 8192, 32], dtype='float32'),
-            paddle.static.InputSpec(shape=[1, 2, 32, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2c676ea9038448f1c38648070faea408(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_408c75582b8408805cf2295a7fd988b0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 8192, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 2, 32, 512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_1a777080714dfb73461faee0be728b5c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 2, 8192, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1, 2, None, 32], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4f4df162c322465e61ca5629ad2f752e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1a777080714dfb73461faee0be728b5c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 8192, 512], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 2, 512, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_63896f8078b100ef5c6b71560da070d2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8d011488e48df5b350d72e2331a59e4c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8192, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e5053ded9fcede4a66d220e6e339a280(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a10430264009c428ebf66323e7ce59b0
-    def get_inputs(self):
-        return [
-            paddle.uniform([86, 197, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 576], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_310fe4801eb31153e8e7871fe8bef8b3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_75745f021984eff269b32c40753c875e
-    def get_inputs(self):
-        return [
-            paddle.uniform([86, 3, 197, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([86, 3, 64, 197], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f26de23398b53f36b709065f41c8160b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_20392341ef9483b613841e93e112f8ba
-    def get_inputs(self):
-        return [
-            paddle.uniform([86, 3, 197, 197], dtype='float32', min=0, max=0.5),
-            paddle.uniform([86, 3, 197, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_954606a7a9b20340587d0ec0f8485dd1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fc65388a86cf194227fbaa125cb96539
-    def get_inputs(self):
-        return [
-            paddle.uniform([86, 197, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_6427f6d30be0db17a5be964608bafce0(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 32768, 32], dtype='float32'),
-            paddle.static.InputSpec(shape=[32, 32], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_659cedcec9e3225eff198c6bba1d3d0f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6427f6d30be0db17a5be964608bafce0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 32768, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1feda09c348d805013342636984056dc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b87ffbf230451f34b9dd3adfc542a94d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_54f0ad0cb2e7df94c9397353693324da(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 1, 32768, 32], dtype='float32'),
-            paddle.static.InputSpec(shape=[1, 1, 32, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ec2c695afadf7e99253a761ce1126e4d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_54f0ad0cb2e7df94c9397353693324da
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 32768, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 32, 512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_909e5844e76ad1a80873484b22bdcb62(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 1, 32768, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1, 1, None, 32], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_59e989a76aba3e299031d5a8284c4c4d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_909e5844e76ad1a80873484b22bdcb62
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 32768, 512], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 512, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_659cedcec9e3225eff198c6bba1d3d0f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6427f6d30be0db17a5be964608bafce0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 32768, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_f801f8590ece29039b3bc95edbbceec1(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 256], dtype='float32'),
-            paddle.static.InputSpec(shape=[256, 768], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ffe4e639ea45368beff774b5be5caedd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f801f8590ece29039b3bc95edbbceec1
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 160, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_28d57ae89db1f5ea61a8d61c70e2e9e9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_64073a474de14f715b32b3a26188bde5
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 8, 160, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 8, 32, 160], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c8f33f28bb06d8e0160a9e65202416c4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2212a3aaa9288881cd9255904e785b42
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 8, 160, 160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 8, 160, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ebd3ce5a84a7e1183eb73d9b7a4337f6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4039feee0d78e3e1c185431045ccde05
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 160, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6dbce91ce9cbf6bc9222684f016eb8d1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d7c8db6ef29a10ccda2cfb93d19940da
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1174, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 1152], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f11171d333d2aaead78621dc24b989ee(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c79eb7978d367d33b7e4225cf307ef04
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 6, 1174, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 6, 64, 1174], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1e9d6f38f834487539a33c28d01c4f66(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4fa618435d80f312e87ace0ff3be953e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 6, 1174, 1174], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 6, 1174, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_442bc371760e1822ea0f342d51e8c386(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a829f11d83e897588b9ef8696e97f48e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1174, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8261c039befff6b8f217549d4281f7ce(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0124b1ac7490c7b795539404e7e7f9bc
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 1280], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1280, 1000], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_37bf5e569b4193761c5226c15c316e02(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ec99b86ad294572ed0f823bc46058905
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 704], dtype='float32', min=0, max=0.5),
-            paddle.uniform([704, 1000], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d99ab95ebb6291e74a4587ba04e33378(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5d998ae73cc35d7b667ab22f3f248259
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1174, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768, 2304], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4a85c11103ef79d119197ae9fc17f831(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fb2bfc1571b4936e3bf9bd9051858e91
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 12, 1174, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 12, 64, 1174], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9f433b8d3b6ef01f80bbe53f50f1bb5b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3aa7a0435710d7898437212079477d5a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 12, 1174, 1174], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 12, 1174, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f75b00e8f6e1218775f5a6db5070d425(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_40a386fb8a7b382850f8fbf56c67a45e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1174, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_db52f6d76d8a91b38c9fe548729294ec(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 65536, 64], dtype='float32'),
-            paddle.static.InputSpec(shape=[64, 64], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9769145ed323f4c5b052219fd5999710(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_db52f6d76d8a91b38c9fe548729294ec
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 65536, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4ab274b35c2d48d461073e3b6b29735d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0398335e23526a536f69baa1150293df
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_3b2df4b230bd1d985099703d53a2e473(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 1, 65536, 64], dtype='float32'),
-            paddle.static.InputSpec(shape=[1, 1, 64, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_02b4904afa6d38ea1aca98cbba87193f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3b2df4b230bd1d985099703d53a2e473
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 65536, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 64, 1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_4c534bd0ba066414a13d3cc88bfffc2d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 1, 65536, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1, 1, None, 64], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_72cc1b625dc41ed0239496cf894f0893(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c534bd0ba066414a13d3cc88bfffc2d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 65536, 1024], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 1024, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9769145ed323f4c5b052219fd5999710(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_db52f6d76d8a91b38c9fe548729294ec
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 65536, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_e15f3fc7543c2bf006cb1997db279331(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[624, 156], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_db998982b5e789e82f0cf57826901d39(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e15f3fc7543c2bf006cb1997db279331
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 624], dtype='float32', min=0, max=0.5),
-            paddle.uniform([624, 156], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_f9e2d1456e73fb0293c9a3fc6805d43a(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 156], dtype='float32'),
-            paddle.static.InputSpec(shape=[156, 624], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_feead780cc9e4544bdf884521f58fe27(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f9e2d1456e73fb0293c9a3fc6805d43a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 156], dtype='float32', min=0, max=0.5),
-            paddle.uniform([156, 624], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3d785fba2f2046a8f3a90d49829eebf2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f801f8590ece29039b3bc95edbbceec1
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 50, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5411812d93647db23afcadbe14521895(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_64073a474de14f715b32b3a26188bde5
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 8, 50, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 8, 32, 50], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d5f887b2b4b87b75c2cef1185122c3fc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2212a3aaa9288881cd9255904e785b42
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 8, 50, 50], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 8, 50, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3d116fc3ed3135f6ef29278789e1e78c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4039feee0d78e3e1c185431045ccde05
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 50, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_412ea2d6afcec4cdaa7d13ef1d3bcff2(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_522cf21d99e8cec8d0d444b52e2261d5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_412ea2d6afcec4cdaa7d13ef1d3bcff2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 21504, 1, 91], dtype='float32', min=0, max=0.5),
-            paddle.uniform([91], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_a7d001e31abc69ada151e88f9336db4d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_348aae60ba55a464e47e0959564be32b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 784, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9c48caf1c0f3a579684472bd985eba11(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 49, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_edd26b5ef7c5d26c0c8a8f7d9331e857(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_763d022e123860960b2a8fa12db8a65b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_edd26b5ef7c5d26c0c8a8f7d9331e857
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 8, 8, 7, 7, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 288], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_526dc17a9e193332c7b25368ccbeef10(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72], dtype='float32', min=0, max=0.5),
-            paddle.uniform([72, 18], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2d10e3b1ab0ac9b2364955432849f8b7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[4.7128376960754395, 4.874957084655762, 4.827646255493164, 4.325068473815918, 4.148613929748535, 4.263113975524902, 4.267441749572754, 4.787745475769043, 5.16745138168335, 4.418758392333984, 5.105741500854492, 5.473527431488037, 5.001097202301025, 4.5380330085754395, 5.232659339904785, 5.4267425537109375, 6.2028679847717285, 5.070359230041504]], dtype='float32').reshape([1, 18]),
-            paddle.uniform([18, 72], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_49d675bbf0c5de9e602b1d4f6689af00(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 100, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_392aa81d0b2d558fc44080c4127a81af(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0, arg_1):
-        input_0 = arg_0
-        input_1 = arg_1
-        return paddle.matmul(input_0, input_1, transpose_x=False, transpose_y=False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_115488767a735971a6eae2c4d36f8eb5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 4, 100, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 4, 32, 100], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5b09199d352db893643385a2a8dc9073(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 4, 100, 100], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 4, 100, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7fca38783a2e4998f19baeee8fbc0261(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 100, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3d462ce20ce735ed201b753aa43158f5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 92], dtype='float32', min=0, max=0.5),
-            paddle.uniform([92, 23], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8463551c86ce299c22ec1cb344df3f8c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[7.115499496459961, 6.420863628387451, 6.43386173248291, 6.495194911956787, 6.782318592071533, 6.629547595977783, 6.720054626464844, 6.494166851043701, 7.013171672821045, 6.801267147064209, 6.6948089599609375, 6.927262306213379, 7.087639808654785, 7.325156211853027, 5.409924030303955, 7.67278528213501, 7.237374782562256, 6.851604461669922, 6.978597640991211, 7.248482704162598, 7.14051628112793, 7.549689769744873, 6.527603626251221]], dtype='float32').reshape([1, 23]),
-            paddle.uniform([23, 92], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0e00b81c6cd07a175aa75c4cd8b7d2bd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([54, 198, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 576], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_97800b8fe88b2ddedaf31e868df9191b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([54, 3, 198, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([54, 3, 64, 198], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_60128a7982f78706bc44445d260f9ac6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([54, 3, 198, 198], dtype='float32', min=0, max=0.5),
-            paddle.uniform([54, 3, 198, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4d32c36a9ebf0d4256e24ee1252a1b66(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([54, 198, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4ccf3c137b73967723b0e142661ecf79(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1960, 16, 24], dtype='float32', min=0, max=0.5),
-            paddle.uniform([24, 48], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_be1b03074afd231ae0b0ecf46296c600(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1960, 16, 24], dtype='float32', min=0, max=0.5),
-            paddle.uniform([24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b63e8cb805391ea958f9e75cfd138967(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 2048], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2048, 1000], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_767729ef55718ec4574b67c712d060bc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 784, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_53ba7e6726d6ea7e8a3719714f0b8ebf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 49, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7fe2506f51443f205ea12ea9af3f7aba(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 960], dtype='float32', min=0, max=0.5),
-            paddle.uniform([960, 240], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ec4c8431a48ecbbd8877f6de40472181(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 240], dtype='float32', min=0, max=0.5),
-            paddle.uniform([240, 960], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fbf5741bddb9855733e5f7760c250c55(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480], dtype='float32', min=0, max=0.5),
-            paddle.uniform([480, 120], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bf7198d65eb6632fa06342025e9ef352(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120], dtype='float32', min=0, max=0.5),
-            paddle.uniform([120, 480], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4a5c0d7b9d28cb1bacd3b098cb725766(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([512, 12544], dtype='float32', min=0, max=0.5),
-            paddle.uniform([12544, 1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6c9737cd31ec766b4207dba4e8c79689(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([512, 1024], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1024, 1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1a2efba96fbc7d035533b13dba8d10a6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 336], dtype='float32', min=0, max=0.5),
-            paddle.uniform([336, 84], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b2d8fc25cfcd63157d528ff550d3ae56(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 84], dtype='float32', min=0, max=0.5),
-            paddle.uniform([84, 336], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1404a944b915f810302a9af7cf8ba35d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_edd26b5ef7c5d26c0c8a8f7d9331e857
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 8, 8, 7, 7, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 288], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_49ea8bd5c2e03aefbc5e01559927995b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0b3b4a66e975ca4f41f343fc8dbc44de(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 196, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_39ca296b52a15f1c8960d7d3c845a9d3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 49, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2dd855b8479c8e8565740d1beb0d730d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 60], dtype='float32', min=0, max=0.5),
-            paddle.uniform([60, 15], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bcae56f72780d09a6d2882a56c79790f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 15], dtype='float32', min=0, max=0.5),
-            paddle.uniform([15, 60], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0ed3a03424535ccdd992365f7e69486c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 336], dtype='float32', min=0, max=0.5),
-            paddle.uniform([336, 84], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e57e9b4024a0408a4e6bc91e5e34882f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 84], dtype='float32', min=0, max=0.5),
-            paddle.uniform([84, 336], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_dd54139b3d5dfe75f159cd98d59d87e5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 2048], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2048, 1000], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0ed3a03424535ccdd992365f7e69486c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 336], dtype='float32', min=0, max=0.5),
-            paddle.uniform([336, 84], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e57e9b4024a0408a4e6bc91e5e34882f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 84], dtype='float32', min=0, max=0.5),
-            paddle.uniform([84, 336], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2d3a8104700e294a8a5ee93680fe3050(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 3136, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c22633b0ab39749d4c4af320c5082434(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 49, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_837d09757bf91d2458162aeb418bfef2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 320, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_afc8f9210ccd6bdf5368311e48691ae2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 4, 320, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 4, 32, 320], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_eff7c86f4ad12128ddae6b7bf46714f2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 4, 320, 320], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 4, 320, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0a0d89eff136c7ae0b3760cec5f891b5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 320, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d90fa3fee558b86ef39d9a269b440b5a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 240], dtype='float32', min=0, max=0.5),
-            paddle.uniform([240, 60], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_877eae2b85c506675cc53745dd890afc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 60], dtype='float32', min=0, max=0.5),
-            paddle.uniform([60, 240], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_beb5e55a5babe02a4b933491d0b26b0d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_edd26b5ef7c5d26c0c8a8f7d9331e857
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 4, 4, 7, 7, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 576], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_598d9fd858b6f8068ee6c1ee77d06990(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 577, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768, 2304], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6cf43bc187912fda3c3d0f08a972f597(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 12, 577, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 12, 64, 577], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0232cdcadc8ec245a2b40caf7f33698e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 12, 577, 577], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 12, 577, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_47180cf9daba15ab9da1c7ef967d33df(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 577, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3ab77216c957981ac379e5aec14dbc28(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 60], dtype='float32', min=0, max=0.5),
-            paddle.uniform([60, 15], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5c39476e0a0d2b9824af92e9892a9d52(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 15], dtype='float32', min=0, max=0.5),
-            paddle.uniform([15, 60], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d3edb5c9c912a632077011b70290e3b5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 197, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_479e51fcbe8691125f8aaa512bbc1fc4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 197, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_19a695839ee7cfff835e4a33bfd39c72(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 872], dtype='float32', min=0, max=0.5),
-            paddle.uniform([872, 218], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a1f979438758cf62a7e30d3ee1711be5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 218], dtype='float32', min=0, max=0.5),
-            paddle.uniform([218, 872], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7073d189cf96c000d161d1db6f69a47a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_edd26b5ef7c5d26c0c8a8f7d9331e857
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 4, 4, 7, 7, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 576], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_81b0efff2959a9e431bf0349b73d4c2f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 16384, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c185c8b9a51c0bc64743056f4119d390(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_33e50c81b9dae572f8c74e72392eda84(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 16384, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 2, 64, 1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e55c1f0776b0d46d7568b2304614dd3a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 16384, 1024], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 2, 1024, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_81b0efff2959a9e431bf0349b73d4c2f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 16384, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2d3a8104700e294a8a5ee93680fe3050(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 3136, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c22633b0ab39749d4c4af320c5082434(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 49, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_264974b59b50092231e74216d3367987(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 49, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e7fa58c26e230b108eddba7ef55a9b5c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 49, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768, 1536], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e187145c1c6917f2b760fdd7c3cc4a48(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([390, 3136], dtype='float32', min=0, max=0.5),
-            paddle.uniform([3136, 1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9ed6f0623a949aa189058f8f28b8e848(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([390, 1024], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1024, 1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0280551d30609531dafe95389f23f2fc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 336], dtype='float32', min=0, max=0.5),
-            paddle.uniform([336, 84], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b60c0f5c889900b5708ee99d7c72c55f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 84], dtype='float32', min=0, max=0.5),
-            paddle.uniform([84, 336], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_282a06b6d94f2298a733749d6739f8fd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 640, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7f51ca4b9c029e40956ac5dc6c78c5d0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 2, 640, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 2, 32, 640], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b668517b6e5a63126ebb4fdf7eb8d783(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 2, 640, 640], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 2, 640, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e9f377a4c70e015ae575ef35f5036adb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 640, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2968d61618eccd285bd1d13ed1337425(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 240], dtype='float32', min=0, max=0.5),
-            paddle.uniform([240, 60], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8b7612abc67732d0f0dd68719fec513b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 60], dtype='float32', min=0, max=0.5),
-            paddle.uniform([60, 240], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b79f170afaf165a9dfc539760c8f9557(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([86, 198, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 576], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_09386cb7f657929b3e286f4eed7539a4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([86, 3, 198, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([86, 3, 64, 198], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_eada4bd2fc4387e836951a0aa2b30bdf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([86, 3, 198, 198], dtype='float32', min=0, max=0.5),
-            paddle.uniform([86, 3, 198, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_15a5339ecb94ecc78e87d5cf28bbb1a7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([86, 198, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2a44d2222bc3b60dfb894985ee483d7c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 3136, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d1a5a2a562017b8386bddae81a0056e4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 49, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d128b41c756d95a77e58273a810f6307(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([86, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 1000], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d128b41c756d95a77e58273a810f6307(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([86, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 1000], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a5d9c9bd0d922ca2b5d457718b97ea9e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 320], dtype='float32', min=0, max=0.5),
-            paddle.uniform([320, 1000], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d5be26db4f073cb992e46027d73bf88d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([54, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 1000], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d5be26db4f073cb992e46027d73bf88d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([54, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 1000], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6dd1d71fbbade61af1f860ecc8c59e34(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 169, 1024], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1024, 2048], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9256121c24f8eaf5e25b2f29cfb519db(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 169, 2048], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2048, 1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0a9ef3121c6e86e73856b5fb053c7519(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_edd26b5ef7c5d26c0c8a8f7d9331e857
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 1, 1, 7, 7, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768, 2304], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a9b2e64955716dbca0646cc94978559e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([4312, 16, 24], dtype='float32', min=0, max=0.5),
-            paddle.uniform([24, 48], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3609b39c7a9461e76b690d1c2a9e2bf4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([4312, 16, 24], dtype='float32', min=0, max=0.5),
-            paddle.uniform([24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1a2efba96fbc7d035533b13dba8d10a6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 336], dtype='float32', min=0, max=0.5),
-            paddle.uniform([336, 84], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b2d8fc25cfcd63157d528ff550d3ae56(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 84], dtype='float32', min=0, max=0.5),
-            paddle.uniform([84, 336], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1404a944b915f810302a9af7cf8ba35d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_edd26b5ef7c5d26c0c8a8f7d9331e857
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 8, 8, 7, 7, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 288], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2440f7560fd6fd1009baa3668ac7de39(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 2048], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2048, 1000], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3e5438ebbb59273dac98dc540d108987(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 36], dtype='float32', min=0, max=0.5),
-            paddle.uniform([36, 9], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2fe14a39bcb39e7c3ac307fd1b6f371f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 9], dtype='float32', min=0, max=0.5),
-            paddle.uniform([9, 36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2ae47dcef1c6433b54d0d2c076328782(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_32c6b5489cc1d029d3317d876064a3f6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_246f450797ad42aeabcc3881052f2ced(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8, 512, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 8, 32, 512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_aed79b0fe882cd173080d696b177b0d1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8, 512, 512], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 8, 512, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2ae47dcef1c6433b54d0d2c076328782(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f7f6341446bddaadf45c3bd234d4cc5c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 1280], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1280, 1000], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c37c40342002704c9c8b332ffcfc06b7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 196, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bcd741567e80dca32618135e4fec8938(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 49, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_49d675bbf0c5de9e602b1d4f6689af00(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 100, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_115488767a735971a6eae2c4d36f8eb5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 4, 100, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 4, 32, 100], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5b09199d352db893643385a2a8dc9073(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 4, 100, 100], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 4, 100, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7fca38783a2e4998f19baeee8fbc0261(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 100, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_33398dc8aa84dc44b9180b8ff647f457(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 480], dtype='float32', min=0, max=0.5),
-            paddle.uniform([480, 120], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bf21bc97f384c7e4e5c3b89e8157f9f3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 120], dtype='float32', min=0, max=0.5),
-            paddle.uniform([120, 480], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a03cfcabe06eda5fd92b90760c17b8e6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([4, 144, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768, 2304], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a5a3a770dc9292260363411cca239eba(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 336], dtype='float32', min=0, max=0.5),
-            paddle.uniform([336, 84], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5e49345dd83c3569d9a08f51132464ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 84], dtype='float32', min=0, max=0.5),
-            paddle.uniform([84, 336], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ac3b81291be3d0ee17354968b10dbb39(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 240], dtype='float32', min=0, max=0.5),
-            paddle.uniform([240, 60], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a0f0847f926e99449068311a86318ec2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 60], dtype='float32', min=0, max=0.5),
-            paddle.uniform([60, 240], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0280551d30609531dafe95389f23f2fc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 336], dtype='float32', min=0, max=0.5),
-            paddle.uniform([336, 84], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b60c0f5c889900b5708ee99d7c72c55f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 84], dtype='float32', min=0, max=0.5),
-            paddle.uniform([84, 336], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_040a4bbdb3abd0c3f781b6e7f0c0bbad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1536], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1536, 1000], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_65ec85b5a509e06606553f0f837f7260(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 60], dtype='float32', min=0, max=0.5),
-            paddle.uniform([60, 15], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fc8e5304a5cb76cb0e1d2fc46afb2773(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 15], dtype='float32', min=0, max=0.5),
-            paddle.uniform([15, 60], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e600b40f4ecea6c657e97df6b065a722(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 240], dtype='float32', min=0, max=0.5),
-            paddle.uniform([240, 60], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a0a21bd0e09e3de314d96a08b7160a2c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 60], dtype='float32', min=0, max=0.5),
-            paddle.uniform([60, 240], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2195ed71307b41d93ece75a5b35ab356(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1536], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1536, 1000], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7073d189cf96c000d161d1db6f69a47a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_edd26b5ef7c5d26c0c8a8f7d9331e857
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 4, 4, 7, 7, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 576], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b63e8cb805391ea958f9e75cfd138967(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 2048], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2048, 1000], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6e9dd0f50940f9df1ca2c0bf37173628(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1025, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 1152], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f58848fe58ca665e3dd8f71919941efd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 6, 1025, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 6, 64, 1025], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e9e9a096e1dbb18d688b1b25be76471a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 6, 1025, 1025], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 6, 1025, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e735c2917b8ddf9fab894171221ae448(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1025, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_921593795119e07f5581bede821ce01e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 36], dtype='float32', min=0, max=0.5),
-            paddle.uniform([36, 9], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_eb5932114c65824a40db014097a4bbff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 9], dtype='float32', min=0, max=0.5),
-            paddle.uniform([9, 36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1cfe699ffbc816acacd367a0f298bab6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 49, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4726ef15256dbd8f84281bb2ecdac764(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 49, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768, 1536], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a13118c6d21429cb828406855444aa7a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768, 150], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6a23dc8a3e47105bf4c8442ab2225b9f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([4, 576, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 1152], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fe82fffedf518a071978b43f5f403c0e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 60], dtype='float32', min=0, max=0.5),
-            paddle.uniform([60, 15], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d2d51ba89ed1b6e11159256de711073c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 15], dtype='float32', min=0, max=0.5),
-            paddle.uniform([15, 60], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8f949810b889a32b94005c2c38321731(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672], dtype='float32', min=0, max=0.5),
-            paddle.uniform([672, 168], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1b67c17fd0229efdd5235856a48fbfa3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 168], dtype='float32', min=0, max=0.5),
-            paddle.uniform([168, 672], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fd6b0739cd6d93dd5100a5a57cc37acc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2048, 160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160, 160], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_031fc5c1c7798ee8077bdf8b35290882(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160, 320], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2384d31916f3865b7833b4a7976e0479(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 5, 2048, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 5, 32, 512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b2f3e876d635a75ef0733ddfd677ca14(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 5, 2048, 512], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 5, 512, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fd6b0739cd6d93dd5100a5a57cc37acc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2048, 160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160, 160], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0f2baf3918cbd830c0bd049fa6a5dd77(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b8dbb5a2a85ee3cdf186da4ad8ed75b0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4b8484122e3c1b893fe0bcad95abcb2d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8, 1024, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 8, 32, 1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9a15db8b7beb44b86f020d8be161d5ed(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8, 1024, 1024], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 8, 1024, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0f2baf3918cbd830c0bd049fa6a5dd77(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a5a3a770dc9292260363411cca239eba(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 336], dtype='float32', min=0, max=0.5),
-            paddle.uniform([336, 84], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5e49345dd83c3569d9a08f51132464ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 84], dtype='float32', min=0, max=0.5),
-            paddle.uniform([84, 336], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_348aae60ba55a464e47e0959564be32b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 784, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9c48caf1c0f3a579684472bd985eba11(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 49, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5929b7ea183e07b4116c7d783f917507(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 2048], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2048, 1000], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b63e8cb805391ea958f9e75cfd138967(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 2048], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2048, 1000], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_da6fa360d147f91960564eb6c55e6516(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 320], dtype='float32', min=0, max=0.5),
-            paddle.uniform([320, 1000], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0a9ef3121c6e86e73856b5fb053c7519(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_edd26b5ef7c5d26c0c8a8f7d9331e857
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 1, 1, 7, 7, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768, 2304], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6d7408b2e6694321026331153b625a29(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([54, 197, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 576], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6a8cfdfbcefa4a4c0f94d94146caed59(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([54, 3, 197, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([54, 3, 64, 197], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f2a46c601acb542473aa02ad076bedc9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([54, 3, 197, 197], dtype='float32', min=0, max=0.5),
-            paddle.uniform([54, 3, 197, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bb7de5274ae09b876b0f0015615c4dfc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([54, 197, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_29b42a386ea4e1b2414522d812afa329(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 65536, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_25d1e7044153601d6003afd857e02223(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4e6ffe164a0e39eb61f8d7476fb46711(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 65536, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 32, 1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3c75eb4cd0204dc55faa24512e7c1e73(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 65536, 1024], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 1024, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_29b42a386ea4e1b2414522d812afa329(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 65536, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bd54742930b2e47c8768fa86a082089d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([4, 2304, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 576], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_beb5e55a5babe02a4b933491d0b26b0d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_edd26b5ef7c5d26c0c8a8f7d9331e857
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 4, 4, 7, 7, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 576], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2a44d2222bc3b60dfb894985ee483d7c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 3136, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d1a5a2a562017b8386bddae81a0056e4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 49, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4df6d66f822d624b46f82dce9581445b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 40, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 6625], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_837d09757bf91d2458162aeb418bfef2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 320, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_afc8f9210ccd6bdf5368311e48691ae2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 4, 320, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 4, 32, 320], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_eff7c86f4ad12128ddae6b7bf46714f2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 4, 320, 320], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 4, 320, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0a0d89eff136c7ae0b3760cec5f891b5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 320, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_13ea31eeeb6b41864f13ae12c24f6bf3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 32768, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8b6b69076f40eba6588c61eedbfde784(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0b3621062515f69a81909ec3defbd072(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 32768, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 64, 512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ba99e8330b3054068c51ab33a2a2dc08(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 32768, 512], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 512, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_13ea31eeeb6b41864f13ae12c24f6bf3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 32768, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1cfe699ffbc816acacd367a0f298bab6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 49, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4726ef15256dbd8f84281bb2ecdac764(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 49, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768, 1536], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_42303cc58f1a3ced812bf3be2fb8248f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 150], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ea9c3a9b9dd56f93ce1c251be31c8eb3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 200, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d4e2e7cce939232fdd64d2cda8e91f64(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 2, 200, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 2, 32, 200], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ab92bea66bad10f3c2c49fd7cbbd0e6b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 2, 200, 200], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 2, 200, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ecdd3418957f39537f837e32bea9efb1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 200, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_789012aa5602da828c75959dd5b3c009(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([6, 144, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768, 2304], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2d875fd0b06a06fe1aeb3de98f21e0f9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 197, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_176bcdb70e53b0635d427572b91c9dfe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 197, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e69141e99ca932612178d8d743e7bb9a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_edd26b5ef7c5d26c0c8a8f7d9331e857
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 2, 2, 7, 7, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 1152], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_60da420e61633894d837791c954d243e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8192, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f5e61d09016986a0a457b853844cce16(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ff3a8305b5b0ae6962ab9ccc5757124c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 8192, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 2, 64, 512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_498c13ed684ab36158358169670c7ab9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 8192, 512], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 2, 512, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_60da420e61633894d837791c954d243e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8192, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8bfde8ce9de67b954accc7663f90f7ba(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 704], dtype='float32', min=0, max=0.5),
-            paddle.uniform([704, 1000], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_55fc19d2ca199b20df2d9deb99055d70(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2048, 320], dtype='float32', min=0, max=0.5),
-            paddle.uniform([320, 320], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2678e7a9bc1b1a0477c2f94143866db7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 320], dtype='float32', min=0, max=0.5),
-            paddle.uniform([320, 640], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_02eadaf2b5774b020c567f0e089863ec(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 5, 2048, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 5, 64, 512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6ae7bea515b6a51c0645b0cf076ace83(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 5, 2048, 512], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 5, 512, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_55fc19d2ca199b20df2d9deb99055d70(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2048, 320], dtype='float32', min=0, max=0.5),
-            paddle.uniform([320, 320], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b521dedc830533e48766e26c315a99b7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1248], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1248, 312], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a39003b6159e5fd884c07717c99bb1f6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 312], dtype='float32', min=0, max=0.5),
-            paddle.uniform([312, 1248], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_93bb050ac52d1990b2d5802e2c0aee0c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([4, 9216, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 288], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_31524dbb68169cfebf4decd883912568(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 480], dtype='float32', min=0, max=0.5),
-            paddle.uniform([480, 120], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3c1338d580037dde4bba6c8e494b21cb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 120], dtype='float32', min=0, max=0.5),
-            paddle.uniform([120, 480], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6624e624bbf4e01abb6f548b58a22f6d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 36], dtype='float32', min=0, max=0.5),
-            paddle.uniform([36, 9], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_37ad2468ff003d8b9601b8efaa2794a7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 9], dtype='float32', min=0, max=0.5),
-            paddle.uniform([9, 36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9e49bf1e0d20a00b64a5008ed7e05e12(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_edd26b5ef7c5d26c0c8a8f7d9331e857
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 1, 1, 7, 7, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768, 2304], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6bce34074058e6a5b27b415ff1855818(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_edd26b5ef7c5d26c0c8a8f7d9331e857
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 2, 2, 7, 7, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 1152], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9e49bf1e0d20a00b64a5008ed7e05e12(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_edd26b5ef7c5d26c0c8a8f7d9331e857
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 1, 1, 7, 7, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768, 2304], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7e618b6d03f39dff6b5e917147092ed3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1025, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768, 2304], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a21dd4b57e489a595a4a20ecbd58bad4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 12, 1025, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 12, 64, 1025], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fccdf615838958c90aa1a17906cb30d5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 12, 1025, 1025], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 12, 1025, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9c2c3e59fc869d52049447917af4ed28(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1025, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6bce34074058e6a5b27b415ff1855818(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_edd26b5ef7c5d26c0c8a8f7d9331e857
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 2, 2, 7, 7, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 1152], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7fc9bb3f7ac1a97052bfda88cdfd02d4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 156], dtype='float32', min=0, max=0.5),
-            paddle.uniform([156, 39], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_345044898679dbaff813435f2ecf099d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 39], dtype='float32', min=0, max=0.5),
-            paddle.uniform([39, 156], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_958ceaa1a8204a9a0a705eee9e591a1a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 512], dtype='float32', min=0, max=0.5),
-            paddle.uniform([512, 512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_21097da64370de2d4c1f2446fef13cbb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 512], dtype='float32', min=0, max=0.5),
-            paddle.uniform([512, 1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8a595b5fa05f6ef01ff962c89e250514(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8, 1024, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 8, 64, 1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_38e47f87f245b96b97ca4450af1f432d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8, 1024, 1024], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 8, 1024, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_958ceaa1a8204a9a0a705eee9e591a1a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 512], dtype='float32', min=0, max=0.5),
-            paddle.uniform([512, 512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_19a695839ee7cfff835e4a33bfd39c72(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 872], dtype='float32', min=0, max=0.5),
-            paddle.uniform([872, 218], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a1f979438758cf62a7e30d3ee1711be5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 218], dtype='float32', min=0, max=0.5),
-            paddle.uniform([218, 872], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_763d022e123860960b2a8fa12db8a65b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_edd26b5ef7c5d26c0c8a8f7d9331e857
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 8, 8, 7, 7, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 288], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e69141e99ca932612178d8d743e7bb9a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_edd26b5ef7c5d26c0c8a8f7d9331e857
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 2, 2, 7, 7, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 1152], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_71d909c586b4206008d554e857dc8411(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([6, 9216, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 288], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d6e92c8375a6dd2212ee10df59d8fbc0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 480], dtype='float32', min=0, max=0.5),
-            paddle.uniform([480, 120], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6b3fa04750f6c071c2c8fa3de88f3fbe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 120], dtype='float32', min=0, max=0.5),
-            paddle.uniform([120, 480], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b33a21b48d70293f29a7af442e560d06(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 480], dtype='float32', min=0, max=0.5),
-            paddle.uniform([480, 120], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9d8e99afdb88fcc26c7e494e18f981ad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 120], dtype='float32', min=0, max=0.5),
-            paddle.uniform([120, 480], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_264974b59b50092231e74216d3367987(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 49, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e7fa58c26e230b108eddba7ef55a9b5c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 49, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768, 1536], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a0d15b043b04013e8d9aa5aa80d3e1e6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 25, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 37], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e1d3f1fafc6ae469a1c9673363108f50(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 36], dtype='float32', min=0, max=0.5),
-            paddle.uniform([36, 9], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_43f1fd2876c94987103d7e97627300a3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 9], dtype='float32', min=0, max=0.5),
-            paddle.uniform([9, 36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c4bc1f0c2e6deb457e763c470e304806(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120], dtype='float32', min=0, max=0.5),
-            paddle.uniform([120, 30], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_dbc936e7024d5325264f027d5601a8a8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[7.328573703765869, 6.247287750244141, 7.139821529388428, 8.04222583770752, 7.969217777252197, 7.186982154846191, 6.653398036956787, 7.3734540939331055, 6.929617881774902, 8.31694221496582, 7.523541450500488, 7.806892395019531, 7.436128616333008, 7.457583904266357, 7.253500461578369, 7.969172477722168, 7.317387104034424, 7.51309871673584, 7.171206474304199, 6.792637825012207, 6.585378646850586, 7.3003926277160645, 7.75144624710083, 7.329493999481201, 7.001270294189453, 7.774947643280029, 6.7110700607299805, 7.38953161239624, 8.684221267700195, 7.437966823577881]], dtype='float32').reshape([1, 30]),
-            paddle.uniform([30, 120], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_016f4bdd7e0894b71268835ef142cf66(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4096, 320], dtype='float32', min=0, max=0.5),
-            paddle.uniform([320, 320], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fe0d5e472afe3481e5040fc0fc15fe56(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 320], dtype='float32', min=0, max=0.5),
-            paddle.uniform([320, 640], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d53707cd32daf63c5f8fa2c9b21ea12d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 5, 4096, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 5, 64, 1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_925f7c4c1f5376a088d876ea4e83c577(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 5, 4096, 1024], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 5, 1024, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_016f4bdd7e0894b71268835ef142cf66(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4096, 320], dtype='float32', min=0, max=0.5),
-            paddle.uniform([320, 320], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b653f477587c88f1fe6f39200f597624(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4096, 160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160, 160], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e5d39727dda6d095796cc3fa75173fbd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160, 320], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_edade316fb8ee600e3f54802b617d02f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 5, 4096, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 5, 32, 1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d6e5be4c8add1a80b70bb54404953c9d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 5, 4096, 1024], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 5, 1024, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b653f477587c88f1fe6f39200f597624(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4096, 160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160, 160], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8f949810b889a32b94005c2c38321731(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672], dtype='float32', min=0, max=0.5),
-            paddle.uniform([672, 168], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1b67c17fd0229efdd5235856a48fbfa3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 168], dtype='float32', min=0, max=0.5),
-            paddle.uniform([168, 672], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0b3b4a66e975ca4f41f343fc8dbc44de(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 196, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_39ca296b52a15f1c8960d7d3c845a9d3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 49, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_39d5b624454e267e70ae953763a56828(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 512], dtype='float32', min=0, max=0.5),
-            paddle.uniform([512, 512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d0fc7d81196fd0e6d156459733c2ef3d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 512], dtype='float32', min=0, max=0.5),
-            paddle.uniform([512, 1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e39d91f3807b4fe0681acfbcf790cf27(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8, 512, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 8, 64, 512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_86e1f4fb89cf2ffd95160f3d1d9d1f17(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8, 512, 512], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 8, 512, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_39d5b624454e267e70ae953763a56828(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 512], dtype='float32', min=0, max=0.5),
-            paddle.uniform([512, 512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ba0c7bb38c04ff3f86678ba0ec7770bc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([6, 2304, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 576], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1dd168fb21f0b30363e41699e4be2c5f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_767729ef55718ec4574b67c712d060bc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 784, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_53ba7e6726d6ea7e8a3719714f0b8ebf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 49, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c37c40342002704c9c8b332ffcfc06b7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 196, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bcd741567e80dca32618135e4fec8938(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 49, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c58d809f6c2f2808a2f0d3c2a09704dc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([6, 576, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 1152], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_559c2f77ad3e82a0270e9025138c881f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 16384, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d8e63ee9e854c5af60ff3272f3c28bbe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3f80c50617154299cfcdbabb56bcac68(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 16384, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 2, 32, 1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_30b4932b7c20a64663221b3df8ba4f20(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 16384, 1024], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 2, 1024, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_559c2f77ad3e82a0270e9025138c881f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 16384, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8cf8afb9ce56fe2d8624c437a811ea13(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8192, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8b6b69076f40eba6588c61eedbfde784(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a20eaf31602908546a84de3cc2351a45(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 8192, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 2, 32, 512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ac4674fd894e097df945ba462c401748(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 8192, 512], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 2, 512, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8cf8afb9ce56fe2d8624c437a811ea13(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8192, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_aebaf6ac8cf2b8e62f350f8df801f3d9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([86, 197, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 576], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_27c2320b6b6ebe0318afef98e5c07ba5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([86, 3, 197, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([86, 3, 64, 197], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6b142677c6543e0e417a6c21457c5688(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([86, 3, 197, 197], dtype='float32', min=0, max=0.5),
-            paddle.uniform([86, 3, 197, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2b1da92a46f9a4679ec8cd885db03c5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([86, 197, 192], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_02f89a0720f4d32b328aab5c86207a43(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 32768, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_be206e0d86d08f4a4748d84dd7e40053(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_248108f16459f7a7fb87a2436dc9c03f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 32768, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 32, 512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_192458b14cd8ee7083f0d9bab59e0b27(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 32768, 512], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 512, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_02f89a0720f4d32b328aab5c86207a43(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 32768, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1d25eb1d7d14933c861084943670b276(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 160, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d329c6bb376699577d0390c8fd3e2c88(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 8, 160, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 8, 32, 160], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1bbd39925de38056da38249832c1e15a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 8, 160, 160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 8, 160, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7cd102c277206f572454a0aa1cad5ebb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 160, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_522424763daabf2fc55ab6d39684b011(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1174, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 1152], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_45daad123c7f8c3ffb288f4250411863(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 6, 1174, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 6, 64, 1174], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d4981625bccb34a53b13784b65b084a1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 6, 1174, 1174], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 6, 1174, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7d802521b1970a58669433707a5bb3f4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1174, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3191113c6442a51c8a8f928de7d99fe1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 1280], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1280, 1000], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ff7d64ed82712a3545db577931a82c6c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 704], dtype='float32', min=0, max=0.5),
-            paddle.uniform([704, 1000], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5d12d89b181b91e954dd7fc15c1f98ca(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1174, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768, 2304], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1e10b3b826cf2b36fbbafdc230e01375(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 12, 1174, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 12, 64, 1174], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_728ceea4d9d8ee55178978930871d3d0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 12, 1174, 1174], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 12, 1174, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_23b9baef7f2c15bad9db23bfaffdb4b9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1174, 768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e57ca0fa9beec20507ce2c8487e75497(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 65536, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d8e63ee9e854c5af60ff3272f3c28bbe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c0e3060d662e36bef93c0aa672c34f40(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 65536, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 64, 1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_19d48f15944222bc47d1201316cd096a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 65536, 1024], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 1024, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e57ca0fa9beec20507ce2c8487e75497(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 65536, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a4008080d95ee30da0edd08f1e6e44e8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 624], dtype='float32', min=0, max=0.5),
-            paddle.uniform([624, 156], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_071267efc06697ad64b8e1eb8f091ccd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82dc7180d781fd0d6f380c7e912d902a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 156], dtype='float32', min=0, max=0.5),
-            paddle.uniform([156, 624], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_afd81831fb6ecbf2ee245139e55b897a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 50, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2c66244c34130a3f2ef55db00f8fd396(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 8, 50, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 8, 32, 50], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f39cc462a0c5117d2e327c4374cf0a8a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392aa81d0b2d558fc44080c4127a81af
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 8, 50, 50], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 8, 50, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a9bb255a323cdc607769f7541cf51660(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d001e31abc69ada151e88f9336db4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 50, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+if __name__ == "__main__":
+    sys.exit(table.main(__file__))
@@ -1,3281 +1,28 @@
 import os
-os.environ['FLAGS_cinn_new_group_scheduler'] = '1'
-os.environ['FLAGS_group_schedule_tiling_first'] = '1'
-os.environ['FLAGS_enable_pir_api'] = '1'
-os.environ['FLAGS_cinn_bucket_compile'] = '1'
 import sys
-import unittest
-import numpy as np
-from dataclasses import dataclass
-import typing as t
 
-@dataclass
-class Stage:
-    name: str
-    env_vars: t.Dict[str, str]
+import pytest
 
-cinn_stages = [
-    Stage(
-        name="dynamic_to_static",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=False,
-            FLAGS_prim_all=False,
-            FLAGS_prim_enable_dynamic=False,
-        ),
-    ),
-    Stage(
-        name="prim",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=False,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-        ),
-    ),
-    Stage(
-        name="infer_symbolic",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=False,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-            FLAGS_use_cinn=False,
-            FLAGS_check_infer_symbolic=True,
-        ),
-    ),
-	Stage(
-        name="frontend",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=True,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-            FLAGS_use_cinn=True,
-            FLAGS_check_infer_symbolic=False,
-            FLAGS_enable_fusion_fallback=True,
-        ), 
-    ),
-    Stage(
-        name="backend",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=True,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-            FLAGS_use_cinn=True,
-            FLAGS_check_infer_symbolic=False,
-            FLAGS_enable_fusion_fallback=False,
-        ), 
-    ),
-]
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir, os.pardir))
+from tools.e2e_case_stage import CinnStages  # noqa: E402
 
-def GetCinnStageByName(name):
-    for stage in cinn_stages:
-        if stage.name == name:
-            return stage
-    return None
+stages = CinnStages(__file__)
 
-def GetCurrentCinnStage():
-    name = os.getenv('PADDLE_DEBUG_CINN_STAGE_NAME')
-    if name is None:
-        return None
-    stage_names = [stage.name for stage in cinn_stages]
-    assert name in stage_names, (
-        f"PADDLE_DEBUG_CINN_STAGE_NAME should be in {stage_names}"
-    )
-    return GetCinnStageByName(name)
+from tools.e2e_case_table import E2ECaseTable, CinnTestBase  # noqa: E402
 
-def GetPrevCinnStage(stage):
-    for i in range(1, len(cinn_stages)):
-        if stage is cinn_stages[i]:
-            return cinn_stages[i - 1]
-    return None
+stages.apply()
+table = E2ECaseTable(__file__)
+last_stage_failed = stages.last_stage_failed()
 
-def IsCinnStageEnableDiff():
-    value = os.getenv('PADDLE_DEBUG_CINN_STAGE_ENABLE_DIFF')
-    enabled = value in {
-        '1',
-        'true',
-        'True',
-    }
-    if enabled:
-        assert GetCurrentCinnStage() is not None
-    return enabled
 
-last_cinn_stage_exit_code = None
-def LastCINNStageFailed():
-    global last_cinn_stage_exit_code
-    if last_cinn_stage_exit_code is not None:
-        return last_cinn_stage_exit_code != 0
-    last_stage = GetPrevCinnStage(GetCurrentCinnStage())
-    if last_stage is None:
-        return False
-    env_vars = dict(
-        PADDLE_DEBUG_CINN_STAGE_NAME=last_stage.name,
-        PADDLE_DEBUG_CINN_STAGE_ENABLE_DIFF='0',
-    )
-    env_vars_str = " ".join(
-        f"{env_var}={value}"
-        for env_var, value in env_vars.items()
-    )
-    last_cinn_stage_exit_code = os.system(
-        f"{env_vars_str} {sys.executable} {__file__} > /dev/null 2>&1"
-    )
-    return last_cinn_stage_exit_code != 0
+def pytest_generate_tests(metafunc):
+    table.parametrize(metafunc)
 
-def SetDefaultEnv(**env_var2value):
-    for env_var, value in env_var2value.items():
-        if os.getenv(env_var) is None:
-            os.environ[env_var] = str(value)
 
-SetDefaultEnv(
-    PADDLE_DEBUG_CINN_STAGE_NAME="backend",
-    PADDLE_DEBUG_CINN_STAGE_ENABLE_DIFF=False,
-    PADDLE_DEBUG_ENABLE_CINN=True,
-    FLAGS_enable_pir_api=True,
-    FLAGS_prim_all=True,
-    FLAGS_prim_enable_dynamic=True,
-    FLAGS_use_cinn=False,
-    FLAGS_check_infer_symbolic=False,
-    FLAGS_enable_fusion_fallback=False,
-)
+@pytest.mark.skipif(last_stage_failed, reason="last stage failed")
+class TestPrimitiveOp(CinnTestBase):
+    table = table
 
-import paddle
 
-def SetEnvVar(env_var2value):
-    for env_var, value in env_var2value.items():
-        os.environ[env_var] = str(value)
-    paddle.set_flags({
-        env_var:value
-        for env_var, value in env_var2value.items()
-        if env_var.startswith('FLAGS_')
-    })
-
-if GetCurrentCinnStage() is not None:
-    SetEnvVar(GetCurrentCinnStage().env_vars)
-
-def GetEnvVarEnableJit():
-    enable_jit = os.getenv('PADDLE_DEBUG_ENABLE_JIT')
-    return enable_jit not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
-
-def GetEnvVarEnableCinn():
-    enable_cinn = os.getenv('PADDLE_DEBUG_ENABLE_CINN')
-    if enable_cinn is None:
-        return True
-    return enable_cinn not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
-
-
-def GetTolerance(dtype):
-    if dtype == np.float16:
-        return GetFloat16Tolerance()
-    if dtype == np.float32:
-        return GetFloat32Tolerance()
-    return 1e-6
-
-def GetFloat16Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT16_TOL'))
-    except:
-        return 1e-3
-
-def GetFloat32Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT32_TOL'))
-    except:
-        return 1e-6
-
-def IsInteger(dtype):
-    return np.dtype(dtype).char in np.typecodes['AllInteger']
-
-def ApplyToStatic(net, use_cinn):
-    build_strategy = paddle.static.BuildStrategy()
-    build_strategy.build_cinn_pass = use_cinn
-    return paddle.jit.to_static(
-        net,
-        input_spec=net.get_input_spec(),
-        build_strategy=build_strategy,
-        full_graph=True,
-    )
-
-class InstanceTrait:
-
-    @classmethod
-    def instance(cls):
-        if cls.instance_ is None:
-            cls.instance_ = cls()
-        return cls.instance_
-
-    @classmethod
-    def static_instance_with_cinn(cls):
-        if cls.static_instance_with_cinn_ is None:
-            cls.static_instance_with_cinn_ = ApplyToStatic(
-                cls.instance(),
-                use_cinn=True
-            )
-        return cls.static_instance_with_cinn_
-
-    @classmethod
-    def static_instance_without_cinn(cls):
-        if cls.static_instance_without_cinn_ is None:
-            cls.static_instance_without_cinn_ = ApplyToStatic(
-                cls.instance(),
-                use_cinn=False
-            )
-        return cls.static_instance_without_cinn_
-
-
-class CinnTestBase:
-
-    def setUp(self):
-        paddle.seed(2024)
-        self.prepare_data()
-
-    def test_train(self):
-        dy_outs = self.train(use_cinn=False)
-        cinn_outs = self.train(use_cinn=GetEnvVarEnableCinn())
-
-        for cinn_out, dy_out in zip(cinn_outs, dy_outs):
-          if type(cinn_out) is list and type(dy_out) is list:
-            for x, y in zip(cinn_out, dy_out):
-              self.assert_all_close(x, y)
-          else:
-            self.assert_all_close(cinn_out, dy_out)
-
-    def train(self, use_cinn):
-        if GetEnvVarEnableJit():
-            net = self.prepare_static_net(use_cinn)
-        else:
-            net = self.prepare_net()
-        paddle.seed(2024)
-        out = net(*self.inputs)
-        return out
-    
-    def prepare_data(self):
-        self.inputs = self.get_inputs()
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def prepare_net(self):
-        return self.get_test_class().instance()
-
-    def prepare_static_net(self, use_cinn):
-        if use_cinn:
-            return self.get_test_class().static_instance_with_cinn()
-        else:
-            return self.get_test_class().static_instance_without_cinn()
-
-    def assert_all_close(self, x, y):
-        if (hasattr(x, "numpy") and hasattr(y, "numpy")):
-            x_numpy = x.numpy()
-            y_numpy = y.numpy()
-            assert x_numpy.dtype == y_numpy.dtype
-            if IsInteger(x_numpy.dtype):
-                np.testing.assert_equal(x_numpy, y_numpy)
-            else:
-                tol = GetTolerance(x_numpy.dtype)
-                np.testing.assert_allclose(x_numpy, y_numpy, atol=tol, rtol=tol)
-        else:
-            assert x == y
-
-
-
-
-
-last_stage_failed = (IsCinnStageEnableDiff() and LastCINNStageFailed())
-class PrimitiveOp_b895015f3bc49e5b3fdaaacec6de48ab(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.mean(input_0, [2, 3], True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 480, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9a0bd1d3aa83819e6f6860d4f7f31980(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b895015f3bc49e5b3fdaaacec6de48ab
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_22c10ae0d2cbdf80a54d6af85da91f63(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.mean(input_0, [2, 3], True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 48, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b5c743e552c607fe884f4255b3241902(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_22c10ae0d2cbdf80a54d6af85da91f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 48, 152, 152], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_5284d1ca8ee7ea7251ef7a2c2cfd6413(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.mean(input_0, [2, 3], True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 768, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_730f6a2280e7dc7f83acb1b0207d3df9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5284d1ca8ee7ea7251ef7a2c2cfd6413
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 768, 13, 13], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_f9496b95c93adff190e0035479404eaf(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.mean(input_0, [2, 3], True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 72, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c23c56f29017682a50600dd9176bbf9d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f9496b95c93adff190e0035479404eaf
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 104, 104], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_c670ff1d7853282dd064b4e3c9a4ab41(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.mean(input_0, [2, 3], True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 384, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e78c23938edffbcd84462860a676b1c2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c670ff1d7853282dd064b4e3c9a4ab41
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 17, 17], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_85939de92026ef4f30d8be7244b626ca(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.mean(input_0, [2, 3], True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 192, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5aa2a90288c342d3e97fc3404a01b218(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_85939de92026ef4f30d8be7244b626ca
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 48, 48], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cd2b8cb997401d32a0c01c2df16d570e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c670ff1d7853282dd064b4e3c9a4ab41
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_f60745817a9aebafcc7e256136d30db0(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.mean(input_0, [2, 3], True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 96, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d247185ce7f4e5759fa7516ef5edeed3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f60745817a9aebafcc7e256136d30db0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 112, 112], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d508b40dafd1c0e1df0b80be122ec537(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_85939de92026ef4f30d8be7244b626ca
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b0e728b42b731274d3b30638cbeb3cb5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_85939de92026ef4f30d8be7244b626ca
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 34, 34], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_695554785e8401cb01b9f96e67599fa8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_85939de92026ef4f30d8be7244b626ca
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_f54201b28a7103dd9a281f6bcc52d084(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.mean(input_0, [-1], True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 4], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9e253a81484bbf1e764a4b80b1179cda(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f54201b28a7103dd9a281f6bcc52d084
-    def get_inputs(self):
-        return [
-            paddle.uniform([1777, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fc839e311eacdcbd4bee910f1db7b711(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c670ff1d7853282dd064b4e3c9a4ab41
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 13, 13], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_51ec95172a86e367e6c4800a6a383db1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f60745817a9aebafcc7e256136d30db0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 96, 96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_e6e31a5932bbe7daae7ba65d5734409d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.mean(input_0, [2, 3], True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 576, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_947c198722bf578100021729e59e59a8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6e31a5932bbe7daae7ba65d5734409d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 576, 13, 13], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_213e03041862821795bdb71256ef1ffe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5284d1ca8ee7ea7251ef7a2c2cfd6413
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 768, 12, 12], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4f449364c2ee9552f221975d6e4e62de(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f54201b28a7103dd9a281f6bcc52d084
-    def get_inputs(self):
-        return [
-            paddle.uniform([5480, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_55b331a544944a5014a82d12c8d201ee(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6e31a5932bbe7daae7ba65d5734409d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 576, 15, 15], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_00593279e1d53a3dfc799172cabf9bfe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c670ff1d7853282dd064b4e3c9a4ab41
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 10, 10], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2068ef69a74fcb7e5c3471851ddd7ddf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_22c10ae0d2cbdf80a54d6af85da91f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 48, 160, 160], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1d30951be5dad403fb3ea5f0043f8895(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f60745817a9aebafcc7e256136d30db0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_754937148288a459be6475db605fea5c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.mean(input_0, [2, 3], True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 120, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_441142a1b003919c43d8eb6d7ce9aee5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_754937148288a459be6475db605fea5c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 168, 168], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f0a7467be99b5e61f3b3b24fe91c9818(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_85939de92026ef4f30d8be7244b626ca
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.mean(input_0, [1], True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cc4490a1ef3bca5c39de29b3a7f7cb20(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 64, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cc4490a1ef3bca5c39de29b3a7f7cb20(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 64, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9922d1c12f0745c95fb8c7e270fd6000(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 128, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9922d1c12f0745c95fb8c7e270fd6000(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 128, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_39dc5b78a2013602ac4ba1f0b8d03bbd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 256, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_39dc5b78a2013602ac4ba1f0b8d03bbd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 256, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b2ed95e2638cee8ffa8280ba1731c526(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 512, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b2ed95e2638cee8ffa8280ba1731c526(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 512, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_956092f0b95b4feb7346ae3453ac655f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.mean(input_0, [], False)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_780da87d35bbed6f899bca3017ce15b7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_956092f0b95b4feb7346ae3453ac655f
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([1.163149118423462, 3.2520620822906494, 2.711258888244629, 1.3589682579040527, 2.232752561569214, 2.4957945346832275], dtype='float32').reshape([6]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c4ab8fde38eff72daa65a0a78be7b3c2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 64, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c4ab8fde38eff72daa65a0a78be7b3c2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 64, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5e547ea600cf80bad84842f4fdd907fd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 128, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5e547ea600cf80bad84842f4fdd907fd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 128, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c7586c8aba577fabc731666f4711c7d5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 256, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c7586c8aba577fabc731666f4711c7d5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 256, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3af93eb459d6bb2090eb07cb35dd4457(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 512, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3af93eb459d6bb2090eb07cb35dd4457(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 512, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_dcc26205787f634d6d451b57ad2e6ed3(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.mean(input_0, [2, 3], True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 144, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6729858b19a878b80de94c2c1974acec(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_dcc26205787f634d6d451b57ad2e6ed3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 144, 52, 52], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f9933007d20fec7a1a12ba6c8a8e3980(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f54201b28a7103dd9a281f6bcc52d084
-    def get_inputs(self):
-        return [
-            paddle.uniform([1742, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8d16241b55d765c962d6c94d2a094303(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f60745817a9aebafcc7e256136d30db0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 76, 76], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9ffcefa0af23cb805c0e535036598ece(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c670ff1d7853282dd064b4e3c9a4ab41
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 20, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_86b78c79f2ae0ee4d2bb8601ad3b1cf0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5284d1ca8ee7ea7251ef7a2c2cfd6413
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 768, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c4ab8fde38eff72daa65a0a78be7b3c2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 64, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c4ab8fde38eff72daa65a0a78be7b3c2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 64, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5e547ea600cf80bad84842f4fdd907fd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 128, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5e547ea600cf80bad84842f4fdd907fd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 128, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c7586c8aba577fabc731666f4711c7d5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 256, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c7586c8aba577fabc731666f4711c7d5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 256, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3af93eb459d6bb2090eb07cb35dd4457(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 512, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3af93eb459d6bb2090eb07cb35dd4457(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 512, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0a588deb3e4ca0b852e738e50510ed3a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f54201b28a7103dd9a281f6bcc52d084
-    def get_inputs(self):
-        return [
-            paddle.uniform([1527, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_f25725034a3ce529674294a0a49e4fe5(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.mean(input_0, [2, 3], True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 288, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ae587cfb04eef2f7feaf101cf73ed36c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f25725034a3ce529674294a0a49e4fe5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 288, 26, 26], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4c74f27e4511de4a0accfe7988d0f6a5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_22c10ae0d2cbdf80a54d6af85da91f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 48, 136, 136], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fe8df3927bda92ad86042c2a06bd5c9b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c670ff1d7853282dd064b4e3c9a4ab41
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_067f1c55beb32279acbaa7b04cac213b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.mean(input_0, [2], True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 4, 4, 13, 19], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3f36cef7b8773f901b00011081f71d81(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_067f1c55beb32279acbaa7b04cac213b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 4, 13, 19], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5cd2fe30430d3ff8e157085607daf9e9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f60745817a9aebafcc7e256136d30db0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 80, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d071edb55b145b76ce83431b57608807(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_22c10ae0d2cbdf80a54d6af85da91f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 48, 104, 104], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_29766b30b9d0be4a641017a10c6a9ebd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f60745817a9aebafcc7e256136d30db0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 184, 184], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c98e60348bd8f6c62fec66d4490886b0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_85939de92026ef4f30d8be7244b626ca
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 52, 52], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_6451447aaebd844cd82c0849c5d86daa(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.mean(input_0, [2, 3], True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 960, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9b6f6a28efeb5a56235607f295288076(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6451447aaebd844cd82c0849c5d86daa
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 960, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_114e97c2cfaa3d65d1e886d7c52afca9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f60745817a9aebafcc7e256136d30db0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 104, 104], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a9b972ee3f1c4cd4f0a3af23ed4f6b06(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f54201b28a7103dd9a281f6bcc52d084
-    def get_inputs(self):
-        return [
-            paddle.uniform([2066, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d035918511365f0ce04553e903792826(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b895015f3bc49e5b3fdaaacec6de48ab
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 42, 42], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fb5762a3392e78ecdf8e6a7f5d2def2e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_dcc26205787f634d6d451b57ad2e6ed3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 144, 60, 60], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_386bdc765a26d3c866abdcfd270d0e0f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f54201b28a7103dd9a281f6bcc52d084
-    def get_inputs(self):
-        return [
-            paddle.uniform([4586, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6c93d40449d82b9eb28a2fc7b9c716ab(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c670ff1d7853282dd064b4e3c9a4ab41
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 19, 19], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8cfcb1faf93d1763b4d2179f84f8f3fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f54201b28a7103dd9a281f6bcc52d084
-    def get_inputs(self):
-        return [
-            paddle.uniform([1073, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fdd43f07225edb0c06a2a29a7dabfd54(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c670ff1d7853282dd064b4e3c9a4ab41
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_ca837081f2751c8a8992eb87a534e382(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.mean(input_0, [2, 3], True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 240, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7b196410f8fb9bb80aa24790dd895c1f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca837081f2751c8a8992eb87a534e382
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 240, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f8cc4af670e1832e8673e234412ea839(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c670ff1d7853282dd064b4e3c9a4ab41
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 26, 26], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_705b44b49446ad08c9f5170b27fd69eb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5284d1ca8ee7ea7251ef7a2c2cfd6413
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 768, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_80354b1a59c5a1455e2de40040b5accd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f25725034a3ce529674294a0a49e4fe5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 288, 30, 30], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6aa6b8bc9598a9b101d347c7df1b5411(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_22c10ae0d2cbdf80a54d6af85da91f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 48, 256, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cc4490a1ef3bca5c39de29b3a7f7cb20(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 64, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cc4490a1ef3bca5c39de29b3a7f7cb20(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 64, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9922d1c12f0745c95fb8c7e270fd6000(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 128, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9922d1c12f0745c95fb8c7e270fd6000(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 128, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_39dc5b78a2013602ac4ba1f0b8d03bbd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 256, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_39dc5b78a2013602ac4ba1f0b8d03bbd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 256, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b2ed95e2638cee8ffa8280ba1731c526(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 512, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b2ed95e2638cee8ffa8280ba1731c526(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 512, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7c616725033c48ec2c4625687db463a4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5284d1ca8ee7ea7251ef7a2c2cfd6413
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 768, 23, 23], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e161c7a42ecc6bbae6c22fbfb1460dcf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f54201b28a7103dd9a281f6bcc52d084
-    def get_inputs(self):
-        return [
-            paddle.uniform([2383, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c1455c7e08663bde4d80ab4843d14657(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_85939de92026ef4f30d8be7244b626ca
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 40, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bce3ca538ff14b8778ee2c218b750c81(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f54201b28a7103dd9a281f6bcc52d084
-    def get_inputs(self):
-        return [
-            paddle.uniform([3030, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d4e4298b4cd383284b08b64ae2fae8e5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f54201b28a7103dd9a281f6bcc52d084
-    def get_inputs(self):
-        return [
-            paddle.uniform([3787, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7022152dbc0669a8ef24737b90b14782(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_85939de92026ef4f30d8be7244b626ca
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 92, 92], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_13ae5cd323f591b1ac24690306947fb4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_85939de92026ef4f30d8be7244b626ca
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 20, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_02b4f183a131fa76e68c0ed82147878c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f60745817a9aebafcc7e256136d30db0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 52, 52], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f163235653c4d05b335f2486fd034ecb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f60745817a9aebafcc7e256136d30db0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 40, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e5de3f4283f184c6600a1da227a31291(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c670ff1d7853282dd064b4e3c9a4ab41
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_dd209a4d2357f87cc3b3326724ac2ab9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.mean(input_0, [2], True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 4, 4, 50, 76], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_97f1769dcd60c61d747322663593dd54(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_dd209a4d2357f87cc3b3326724ac2ab9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 4, 50, 76], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8c3eaab887d40a932d3db0dbfc2dc867(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c670ff1d7853282dd064b4e3c9a4ab41
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 46, 46], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b0aa72e188893e8f196ebd5cc28075a6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f25725034a3ce529674294a0a49e4fe5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 288, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_43d792dbeb1862a3d0da0f6da165dfa7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca837081f2751c8a8992eb87a534e382
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 240, 84, 84], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f4e7619e5ce845b4196de1397610b9f2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_22c10ae0d2cbdf80a54d6af85da91f63
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 48, 80, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1f0908644b793bf6e822e255bf838601(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_dcc26205787f634d6d451b57ad2e6ed3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 144, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5defc06caa9c20e879c1ce346487bd40(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6e31a5932bbe7daae7ba65d5734409d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 576, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1a5650870d0da4af9c40d53cd67e45fc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_85939de92026ef4f30d8be7244b626ca
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 26, 26], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6108e0feada1304c5fa0fc7db66a630e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f54201b28a7103dd9a281f6bcc52d084
-    def get_inputs(self):
-        return [
-            paddle.uniform([2084, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1df91fb9af84e31717789465faac9895(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f9496b95c93adff190e0035479404eaf
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 120, 120], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ffc841449f78959bc503f3fd96e25afd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6451447aaebd844cd82c0849c5d86daa
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 960, 21, 21], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a3408f2a5640ec5270acbbf190801dfc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_85939de92026ef4f30d8be7244b626ca
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 38, 38], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9f4800c645951dc60f0aec1547ea9989(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_754937148288a459be6475db605fea5c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 256, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_81fec1c7f040aaae72f1a827a05170c0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f60745817a9aebafcc7e256136d30db0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 68, 68], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_7db2654ce79a5ec428f768d825336be8(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.mean(input_0, [2], True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 4, 4, 25, 38], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_eb1c7a5eacc9a38c554d3302178e3a4e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7db2654ce79a5ec428f768d825336be8
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 4, 25, 38], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1d34fa1b59c6c9da0a336e3c115128f3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f60745817a9aebafcc7e256136d30db0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 256, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_3566055df83b355d9f6d21b2438f3b77(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.mean(input_0, [2], True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 4, 4, 7, 10], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_664fe7f6189009973b91f45fd0617aa1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3566055df83b355d9f6d21b2438f3b77
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 4, 7, 10], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e33a1b40011984d8f38a9a67b21953f7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f54201b28a7103dd9a281f6bcc52d084
-    def get_inputs(self):
-        return [
-            paddle.uniform([4260, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_4d2d8668419d6cd55fe3b69be31c84a6(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.mean(input_0, [2], True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 4, 4, 100, 152], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_590cd2740fa7f269e54d6a6c22a3ac34(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4d2d8668419d6cd55fe3b69be31c84a6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 4, 100, 152], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7f8536bbcc372d99cf4998062e7d17a2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f9496b95c93adff190e0035479404eaf
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 256, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_21f1549520222ea0b66e720efcbe75de(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.mean(input_0, [2, 3], True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_00909e3845c88e2cd33531b19319169b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b8090d9bea26f3ff1f97118a17b0b3b1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 48, 152, 152], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2acbe4c0789d4eaca1cf8110bda53771(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 768, 13, 13], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_472922b07b2ceb261ab163fa3ff581a3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 104, 104], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0038d71d7405ff465514e597f16ea0fb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 17, 17], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_300e128b9ad5828cc5f3bf6eb60e8d6e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 48, 48], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_430b3db961b1591740ee2095a6889123(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5c304d9bbff9d7d65a90136f901f860c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 112, 112], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cea4faa2cf994edf1a8f407b4f0cc533(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a0909b40511e06907ee8e701dfaa95dd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 34, 34], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ffe69dec31e5110ff4ea28134b491c54(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_4ed0253bd03a774a04009f99bf2d8369(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.mean(input_0, [-1], True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f1d4d3e02cd4dbca550db94a0c77214d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ed0253bd03a774a04009f99bf2d8369
-    def get_inputs(self):
-        return [
-            paddle.uniform([1777, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ff46344e263749f4192f06e9bc164576(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 13, 13], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ca4555d83d7888112400ae66dbfb5bdd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 96, 96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c5e7ee8323eb02eb81ea0d993e42a62f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 576, 13, 13], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c82997a4c5cd825015c77e34a69f51d6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 768, 12, 12], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_26b35c5553335b9506b30ff0929ca268(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ed0253bd03a774a04009f99bf2d8369
-    def get_inputs(self):
-        return [
-            paddle.uniform([5480, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_677d7d411a49c1614de596b94944ff8a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 576, 15, 15], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e5a70e83685ec3abb21e8a89c0eca854(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 10, 10], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_291c9faab359ef2bbff4c80033ae0a5c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 48, 160, 160], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_989d4d519396663e1dd7f9838efae2b5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_036855e500c044f3d9f0d005ffd7fe27(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 168, 168], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fd208aad32cf115ec230e13f8881de31(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cc4490a1ef3bca5c39de29b3a7f7cb20(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 64, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cc4490a1ef3bca5c39de29b3a7f7cb20(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 64, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9922d1c12f0745c95fb8c7e270fd6000(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 128, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9922d1c12f0745c95fb8c7e270fd6000(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 128, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_39dc5b78a2013602ac4ba1f0b8d03bbd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 256, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_39dc5b78a2013602ac4ba1f0b8d03bbd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 256, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b2ed95e2638cee8ffa8280ba1731c526(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 512, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b2ed95e2638cee8ffa8280ba1731c526(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 512, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_780da87d35bbed6f899bca3017ce15b7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_956092f0b95b4feb7346ae3453ac655f
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([1.163149118423462, 3.2520620822906494, 2.711258888244629, 1.3589682579040527, 2.232752561569214, 2.4957945346832275], dtype='float32').reshape([6]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c4ab8fde38eff72daa65a0a78be7b3c2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 64, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c4ab8fde38eff72daa65a0a78be7b3c2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 64, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5e547ea600cf80bad84842f4fdd907fd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 128, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5e547ea600cf80bad84842f4fdd907fd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 128, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c7586c8aba577fabc731666f4711c7d5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 256, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c7586c8aba577fabc731666f4711c7d5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 256, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3af93eb459d6bb2090eb07cb35dd4457(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 512, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3af93eb459d6bb2090eb07cb35dd4457(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 512, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ef1ca560d57e5d7e8e4aa86f43685e82(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 144, 52, 52], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3c35d71f56c6e236840210c97adfee90(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ed0253bd03a774a04009f99bf2d8369
-    def get_inputs(self):
-        return [
-            paddle.uniform([1742, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3658c02dd772efa2d55efa0419fa96b5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 76, 76], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_093cdc8908a2b50cab56c92d4444083f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 20, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8114258f4823c84440ebb1dda1c907f8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 768, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c4ab8fde38eff72daa65a0a78be7b3c2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 64, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c4ab8fde38eff72daa65a0a78be7b3c2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 64, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5e547ea600cf80bad84842f4fdd907fd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 128, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5e547ea600cf80bad84842f4fdd907fd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 128, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c7586c8aba577fabc731666f4711c7d5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 256, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c7586c8aba577fabc731666f4711c7d5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 256, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3af93eb459d6bb2090eb07cb35dd4457(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 512, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3af93eb459d6bb2090eb07cb35dd4457(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 512, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_21c4c46c8fca2867ca5df05c52751fca(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ed0253bd03a774a04009f99bf2d8369
-    def get_inputs(self):
-        return [
-            paddle.uniform([1527, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_345832d0bef73e595934e084a63b091d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 288, 26, 26], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_29134090c238375c8b6ed74d311d47bd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 48, 136, 136], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_de226cac7c6e193fc419846e69a0b684(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_fb2bb91d575a611ba7b222cdf84ec8af(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.mean(input_0, [2], True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f7528b91701f68747bf05a7adedae540(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fb2bb91d575a611ba7b222cdf84ec8af
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 4, 13, 19], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c8416338f5cbad059aa691273ce40443(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 80, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ced2fdbe677c34a59699aed47a5bf5fa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 48, 104, 104], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3e7163f01ba3649eb0ed0510f285a195(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 184, 184], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_097a0044c42608efa9141733564ab8a7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 52, 52], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4b52c460709938367ffad0b1e1963001(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 960, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7736b10662582086b38fcd92880b8008(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 104, 104], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_96b9baafe592bec6d046ca3312ec3f08(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ed0253bd03a774a04009f99bf2d8369
-    def get_inputs(self):
-        return [
-            paddle.uniform([2066, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_01cbde6ae7009f1d6c51696de90b03ef(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 42, 42], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1b1d81bf5ecc026b2e9ae28a7ea3105d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 144, 60, 60], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5a8ff9fb80103c4303a92c3569275470(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ed0253bd03a774a04009f99bf2d8369
-    def get_inputs(self):
-        return [
-            paddle.uniform([4586, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_56eb9a1b43fa32f07ef3802d1b09c067(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 19, 19], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b618d43459e168bd8beb55de1e11becb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ed0253bd03a774a04009f99bf2d8369
-    def get_inputs(self):
-        return [
-            paddle.uniform([1073, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_632359f3ac777648b95072943ed87f6f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_069974224a851e105291336ef81bd5d2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 240, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_048a9d7aa9de466a3eab7142d3a0ffda(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 26, 26], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_04c4c71341e221156ac47fd2a24a60d0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 768, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_836f1587d99f87fa0f9f35d6a3aa630e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 288, 30, 30], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1fb14ae2bcb43da9adee50695718275a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 48, 256, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cc4490a1ef3bca5c39de29b3a7f7cb20(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 64, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cc4490a1ef3bca5c39de29b3a7f7cb20(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 64, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9922d1c12f0745c95fb8c7e270fd6000(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 128, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9922d1c12f0745c95fb8c7e270fd6000(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 128, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_39dc5b78a2013602ac4ba1f0b8d03bbd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 256, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_39dc5b78a2013602ac4ba1f0b8d03bbd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 256, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b2ed95e2638cee8ffa8280ba1731c526(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 512, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b2ed95e2638cee8ffa8280ba1731c526(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c238ba6013e368d40e3a905da5cd2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 512, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ab8a30545d836eee51cc8f36e1b4d30e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 768, 23, 23], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f706f259dc804220df76199df9469579(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ed0253bd03a774a04009f99bf2d8369
-    def get_inputs(self):
-        return [
-            paddle.uniform([2383, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2c474bfc57f6f69f0fbe803232dc6fda(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 40, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_119e6e7fe137bf598a8a9d82612f1ac7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ed0253bd03a774a04009f99bf2d8369
-    def get_inputs(self):
-        return [
-            paddle.uniform([3030, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f7353ec265a746faed62858773952bc4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ed0253bd03a774a04009f99bf2d8369
-    def get_inputs(self):
-        return [
-            paddle.uniform([3787, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_96e37de26e2fc0efeebb6b0d19151abc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 92, 92], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1c68566ce7f741c5090969d5661ea5d4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 20, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_86d6d190176e5446fc14a73c3af1cf8a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 52, 52], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c50f753d105ccad07d4b47a8fb5228e7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 40, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_07e6ba09f3b06404a6f1a1603efcfd70(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_43cebb2e6ee44ca5ecb4d28200a11c98(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fb2bb91d575a611ba7b222cdf84ec8af
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 4, 50, 76], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cd148c58f5346695f783c5261ec2921a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 46, 46], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2a12c04c1f045e31ce2fd9ca29b560ca(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 288, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_68141cf5ff6c60b5c2a827884350e60d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 240, 84, 84], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3799c9432ba9245fa44dd4f2ea21ae20(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 48, 80, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3ddc0a327167abb9b6537cc33a042ea7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 144, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0274cd91d37a662c2c657ba24f519c7e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 576, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e3b872b7c0eb7bf32f5ede67eaabdf22(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 26, 26], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_438aa9559a42e897e5c37ce4f9f39034(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ed0253bd03a774a04009f99bf2d8369
-    def get_inputs(self):
-        return [
-            paddle.uniform([2084, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_dfca9a33234f2839ae9bf4c1de9d9991(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 120, 120], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_84fd2b21ae04a0b852b720bd29db30c5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 960, 21, 21], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_39236ba711f0b7e4e5a6558ecde70e82(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 38, 38], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_87fc83af247375d61632fa564e35b503(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 256, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cdb92e7a1dcbff4a1a82eccd7cf28332(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 68, 68], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_812661d63e12f562dd10d93a40a4d715(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fb2bb91d575a611ba7b222cdf84ec8af
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 4, 25, 38], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e508b499064d218a2c7bc3d2377d18e5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 256, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3730d0ecd5d9c622b7aa5d49850467d0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fb2bb91d575a611ba7b222cdf84ec8af
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 4, 7, 10], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bdc018073255932a7e17c08895d233bd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ed0253bd03a774a04009f99bf2d8369
-    def get_inputs(self):
-        return [
-            paddle.uniform([4260, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d2314008b9dbcb8c91ea1c1f44cf834c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fb2bb91d575a611ba7b222cdf84ec8af
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 4, 100, 152], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_37b5a0ed7b633d88a72a7e5c39ff7b41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21f1549520222ea0b66e720efcbe75de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 256, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+if __name__ == "__main__":
+    sys.exit(table.main(__file__))
@@ -1,2551 +1,28 @@
 import os
-os.environ['FLAGS_cinn_new_group_scheduler'] = '1'
-os.environ['FLAGS_group_schedule_tiling_first'] = '1'
-os.environ['FLAGS_enable_pir_api'] = '1'
-os.environ['FLAGS_cinn_bucket_compile'] = '1'
 import sys
-import unittest
-import numpy as np
-from dataclasses import dataclass
-import typing as t
 
-@dataclass
-class Stage:
-    name: str
-    env_vars: t.Dict[str, str]
+import pytest
 
-cinn_stages = [
-    Stage(
-        name="dynamic_to_static",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=False,
-            FLAGS_prim_all=False,
-            FLAGS_prim_enable_dynamic=False,
-        ),
-    ),
-    Stage(
-        name="prim",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=False,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-        ),
-    ),
-    Stage(
-        name="infer_symbolic",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=False,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-            FLAGS_use_cinn=False,
-            FLAGS_check_infer_symbolic=True,
-        ),
-    ),
-	Stage(
-        name="frontend",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=True,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-            FLAGS_use_cinn=True,
-            FLAGS_check_infer_symbolic=False,
-            FLAGS_enable_fusion_fallback=True,
-        ), 
-    ),
-    Stage(
-        name="backend",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=True,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-            FLAGS_use_cinn=True,
-            FLAGS_check_infer_symbolic=False,
-            FLAGS_enable_fusion_fallback=False,
-        ), 
-    ),
-]
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir, os.pardir))
+from tools.e2e_case_stage import CinnStages  # noqa: E402
 
-def GetCinnStageByName(name):
-    for stage in cinn_stages:
-        if stage.name == name:
-            return stage
-    return None
+stages = CinnStages(__file__)
 
-def GetCurrentCinnStage():
-    name = os.getenv('PADDLE_DEBUG_CINN_STAGE_NAME')
-    if name is None:
-        return None
-    stage_names = [stage.name for stage in cinn_stages]
-    assert name in stage_names, (
-        f"PADDLE_DEBUG_CINN_STAGE_NAME should be in {stage_names}"
-    )
-    return GetCinnStageByName(name)
+from tools.e2e_case_table import E2ECaseTable, CinnTestBase  # noqa: E402
 
-def GetPrevCinnStage(stage):
-    for i in range(1, len(cinn_stages)):
-        if stage is cinn_stages[i]:
-            return cinn_stages[i - 1]
-    return None
+stages.apply()
+table = E2ECaseTable(__file__)
+last_stage_failed = stages.last_stage_failed()
 
-def IsCinnStageEnableDiff():
-    value = os.getenv('PADDLE_DEBUG_CINN_STAGE_ENABLE_DIFF')
-    enabled = value in {
-        '1',
-        'true',
-        'True',
-    }
-    if enabled:
-        assert GetCurrentCinnStage() is not None
-    return enabled
 
-last_cinn_stage_exit_code = None
-def LastCINNStageFailed():
-    global last_cinn_stage_exit_code
-    if last_cinn_stage_exit_code is not None:
-        return last_cinn_stage_exit_code != 0
-    last_stage = GetPrevCinnStage(GetCurrentCinnStage())
-    if last_stage is None:
-        return False
-    env_vars = dict(
-        PADDLE_DEBUG_CINN_STAGE_NAME=last_stage.name,
-        PADDLE_DEBUG_CINN_STAGE_ENABLE_DIFF='0',
-    )
-    env_vars_str = " ".join(
-        f"{env_var}={value}"
-        for env_var, value in env_vars.items()
-    )
-    last_cinn_stage_exit_code = os.system(
-        f"{env_vars_str} {sys.executable} {__file__} > /dev/null 2>&1"
-    )
-    return last_cinn_stage_exit_code != 0
+def pytest_generate_tests(metafunc):
+    table.parametrize(metafunc)
 
-def SetDefaultEnv(**env_var2value):
-    for env_var, value in env_var2value.items():
-        if os.getenv(env_var) is None:
-            os.environ[env_var] = str(value)
 
-SetDefaultEnv(
-    PADDLE_DEBUG_CINN_STAGE_NAME="backend",
-    PADDLE_DEBUG_CINN_STAGE_ENABLE_DIFF=False,
-    PADDLE_DEBUG_ENABLE_CINN=True,
-    FLAGS_enable_pir_api=True,
-    FLAGS_prim_all=True,
-    FLAGS_prim_enable_dynamic=True,
-    FLAGS_use_cinn=False,
-    FLAGS_check_infer_symbolic=False,
-    FLAGS_enable_fusion_fallback=False,
-)
+@pytest.mark.skipif(last_stage_failed, reason="last stage failed")
+class TestPrimitiveOp(CinnTestBase):
+    table = table
 
-import paddle
 
-def SetEnvVar(env_var2value):
-    for env_var, value in env_var2value.items():
-        os.environ[env_var] = str(value)
-    paddle.set_flags({
-        env_var:value
-        for env_var, value in env_var2value.items()
-        if env_var.startswith('FLAGS_')
-    })
-
-if GetCurrentCinnStage() is not None:
-    SetEnvVar(GetCurrentCinnStage().env_vars)
-
-def GetEnvVarEnableJit():
-    enable_jit = os.getenv('PADDLE_DEBUG_ENABLE_JIT')
-    return enable_jit not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
-
-def GetEnvVarEnableCinn():
-    enable_cinn = os.getenv('PADDLE_DEBUG_ENABLE_CINN')
-    if enable_cinn is None:
-        return True
-    return enable_cinn not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
-
-
-def GetTolerance(dtype):
-    if dtype == np.float16:
-        return GetFloat16Tolerance()
-    if dtype == np.float32:
-        return GetFloat32Tolerance()
-    return 1e-6
-
-def GetFloat16Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT16_TOL'))
-    except:
-        return 1e-3
-
-def GetFloat32Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT32_TOL'))
-    except:
-        return 1e-6
-
-def IsInteger(dtype):
-    return np.dtype(dtype).char in np.typecodes['AllInteger']
-
-def ApplyToStatic(net, use_cinn):
-    build_strategy = paddle.static.BuildStrategy()
-    build_strategy.build_cinn_pass = use_cinn
-    return paddle.jit.to_static(
-        net,
-        input_spec=net.get_input_spec(),
-        build_strategy=build_strategy,
-        full_graph=True,
-    )
-
-class InstanceTrait:
-
-    @classmethod
-    def instance(cls):
-        if cls.instance_ is None:
-            cls.instance_ = cls()
-        return cls.instance_
-
-    @classmethod
-    def static_instance_with_cinn(cls):
-        if cls.static_instance_with_cinn_ is None:
-            cls.static_instance_with_cinn_ = ApplyToStatic(
-                cls.instance(),
-                use_cinn=True
-            )
-        return cls.static_instance_with_cinn_
-
-    @classmethod
-    def static_instance_without_cinn(cls):
-        if cls.static_instance_without_cinn_ is None:
-            cls.static_instance_without_cinn_ = ApplyToStatic(
-                cls.instance(),
-                use_cinn=False
-            )
-        return cls.static_instance_without_cinn_
-
-
-class CinnTestBase:
-
-    def setUp(self):
-        paddle.seed(2024)
-        self.prepare_data()
-
-    def test_train(self):
-        dy_outs = self.train(use_cinn=False)
-        cinn_outs = self.train(use_cinn=GetEnvVarEnableCinn())
-
-        for cinn_out, dy_out in zip(cinn_outs, dy_outs):
-          if type(cinn_out) is list and type(dy_out) is list:
-            for x, y in zip(cinn_out, dy_out):
-              self.assert_all_close(x, y)
-          else:
-            self.assert_all_close(cinn_out, dy_out)
-
-    def train(self, use_cinn):
-        if GetEnvVarEnableJit():
-            net = self.prepare_static_net(use_cinn)
-        else:
-            net = self.prepare_net()
-        paddle.seed(2024)
-        out = net(*self.inputs)
-        return out
-    
-    def prepare_data(self):
-        self.inputs = self.get_inputs()
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def prepare_net(self):
-        return self.get_test_class().instance()
-
-    def prepare_static_net(self, use_cinn):
-        if use_cinn:
-            return self.get_test_class().static_instance_with_cinn()
-        else:
-            return self.get_test_class().static_instance_without_cinn()
-
-    def assert_all_close(self, x, y):
-        if (hasattr(x, "numpy") and hasattr(y, "numpy")):
-            x_numpy = x.numpy()
-            y_numpy = y.numpy()
-            assert x_numpy.dtype == y_numpy.dtype
-            if IsInteger(x_numpy.dtype):
-                np.testing.assert_equal(x_numpy, y_numpy)
-            else:
-                tol = GetTolerance(x_numpy.dtype)
-                np.testing.assert_allclose(x_numpy, y_numpy, atol=tol, rtol=tol)
-        else:
-            assert x == y
-
-
-
-
-
-last_stage_failed = (IsCinnStageEnableDiff() and LastCINNStageFailed())
-class PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = None
-        input_2 = None
-        input_3 = None
-        return paddle._C_ops.nearest_interp(input_0, None, None, None, 'NCHW', -1, -1, -1, [2, 2], 'nearest', False, 0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 256, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6e95dada56ed567db688bacb2f16b6a9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 25, 38], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_daac625863c7b3d7dea6a4d1475c923e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 50, 76], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6c25661fc53d3f24ed1caa5ab08f1f5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 23, 35], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5a58e648e6dc066b910616d076fe9d54(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 46, 70], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e6b1a9e70d487bf72ebc8098c087cb0b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 92, 140], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_a24047558309951a20d22af5427cd898(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = None
-        input_2 = None
-        input_3 = None
-        return paddle._C_ops.nearest_interp(input_0, None, None, None, 'NCHW', -1, -1, -1, [2, 2], 'nearest', False, 1)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 256, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7304ac80e9e939b87d14bd7552b52817(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a24047558309951a20d22af5427cd898
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 256, 30, 30], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6a6dc3f38b12abef34d7bf331c67a4bf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a24047558309951a20d22af5427cd898
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 256, 60, 60], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ee249bc0bedd5009b5479d816c61a940(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a24047558309951a20d22af5427cd898
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 256, 120, 120], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_b42e51183af76fc9430075506b85df10(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = None
-        input_2 = None
-        input_3 = None
-        return paddle._C_ops.nearest_interp(input_0, None, None, None, 'NCHW', -1, -1, -1, [8, 8], 'nearest', False, 1)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 64, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_de03339995d03781ab630b693a735cdb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b42e51183af76fc9430075506b85df10
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 64, 30, 30], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_5e9fdd0ab2adc2c27d460159f8d5caf5(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = None
-        input_2 = None
-        input_3 = None
-        return paddle._C_ops.nearest_interp(input_0, None, None, None, 'NCHW', -1, -1, -1, [4, 4], 'nearest', False, 1)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 64, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5b2ae079daf02906b40cdbaa83cd91ba(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5e9fdd0ab2adc2c27d460159f8d5caf5
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 64, 60, 60], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_e115bef4be3b68fd3f068282e415fb54(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = None
-        input_2 = None
-        input_3 = None
-        return paddle._C_ops.nearest_interp(input_0, None, None, None, 'NCHW', -1, -1, -1, [2, 2], 'nearest', False, 1)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 64, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_079dd4f5bacd0f7a6108223cfb8d012d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e115bef4be3b68fd3f068282e415fb54
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 64, 120, 120], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9b0ca6078f08fe4a315621d359697a84(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 22, 22], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_576ce14fea429aa42aea3410a6703211(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 44, 44], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_01869452fedcdfbcc16f63af298bbefa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 88, 88], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_baa145ed4a8e293bbbf7400623c00b0c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 22, 33], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f56ab6a9d462e1fb11a51739f2bb772f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 44, 66], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e32ce95a65a3e1d92982d9a053a93c05(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 24, 36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_912995108dfb1a9556740120b6c2d094(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 48, 72], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b31e2b11e4b49f8c159c7bf255f9c61b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a24047558309951a20d22af5427cd898
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 23, 41], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c7eda97d08b28da75350e0b77edc8804(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a24047558309951a20d22af5427cd898
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 46, 82], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5a401e0cd0616e52ac8a011700278438(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a24047558309951a20d22af5427cd898
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 92, 164], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_87a7cc3cdb5598a7931649a965da0537(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b42e51183af76fc9430075506b85df10
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 23, 41], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d5077f0abcf4632a4e7af179bfb3c822(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5e9fdd0ab2adc2c27d460159f8d5caf5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 46, 82], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b2696dc2b7fb5c2b0671df6d4bba584c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e115bef4be3b68fd3f068282e415fb54
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 92, 164], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_00c78314531bb5b39187f4d4ff15d1c0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 20, 30], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_210db8c5149ae8f4f9335441afbf839c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 40, 60], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_23057543ad331ff3a7964edcfd87c294(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 80, 120], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c79635e44f43ef6d715cac82e9a4e583(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0a16274efc0228b8b0de893bd74014ea(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7fe27703d1a29aa5782b3f236da22ab6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 15, 25], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a53789eb22266c54f7532508aa518e33(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 30, 50], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_13df6db60f13464252c6fbad38dbd32d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 60, 100], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6e95dada56ed567db688bacb2f16b6a9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 25, 38], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_daac625863c7b3d7dea6a4d1475c923e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 50, 76], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_70988c70c35826aa371f76d743d205cb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 100, 152], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_9934fdcfc129d5b69f9f5ba239660f46(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = None
-        input_2 = None
-        input_3 = None
-        return paddle._C_ops.nearest_interp(input_0, None, None, None, 'NCHW', -1, -1, -1, [2, 2], 'nearest', False, 0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 64, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bce50bc294d6462d1c36ed63ac72112d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9934fdcfc129d5b69f9f5ba239660f46
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 17, 26], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_57117f5563ec11ab4e09fc4b5687407f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9934fdcfc129d5b69f9f5ba239660f46
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 34, 52], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_70dd2eabc898494553c3c43d07e4d931(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9934fdcfc129d5b69f9f5ba239660f46
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 68, 104], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6c25661fc53d3f24ed1caa5ab08f1f5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 23, 35], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5a58e648e6dc066b910616d076fe9d54(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 46, 70], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6e95dada56ed567db688bacb2f16b6a9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 25, 38], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_daac625863c7b3d7dea6a4d1475c923e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 50, 76], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_70988c70c35826aa371f76d743d205cb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 100, 152], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6e95dada56ed567db688bacb2f16b6a9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 25, 38], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_daac625863c7b3d7dea6a4d1475c923e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 50, 76], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_121e84aac0bc265c3267c11ec6221f28(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = None
-        input_2 = None
-        input_3 = None
-        return paddle._C_ops.nearest_interp(input_0, None, None, None, 'NCHW', -1, -1, -1, [2, 2], 'nearest', False, 1)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 96, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_89103bc7702a95c40f3f7b6b3f32b649(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_121e84aac0bc265c3267c11ec6221f28
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 96, 30, 30], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4e1449e592981efec7c49a6ab044f92f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_121e84aac0bc265c3267c11ec6221f28
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 96, 60, 60], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0fc2eb96bb5456081e3693382b10a2a2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_121e84aac0bc265c3267c11ec6221f28
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 96, 120, 120], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_dbf74ee223857b2dc137ccb472e57204(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = None
-        input_2 = None
-        input_3 = None
-        return paddle._C_ops.nearest_interp(input_0, None, None, None, 'NCHW', -1, -1, -1, [8, 8], 'nearest', False, 1)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 24, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2ffd7daed91a60bde3df0ece5054e21e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_dbf74ee223857b2dc137ccb472e57204
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 24, 30, 30], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_c879e8e3fcc4c75cd2726e36c60ab463(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = None
-        input_2 = None
-        input_3 = None
-        return paddle._C_ops.nearest_interp(input_0, None, None, None, 'NCHW', -1, -1, -1, [4, 4], 'nearest', False, 1)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 24, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b40770e3f122d684b37fab18dd49e3b1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c879e8e3fcc4c75cd2726e36c60ab463
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 24, 60, 60], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_64041a00e2f1254b07209d88b05ded71(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = None
-        input_2 = None
-        input_3 = None
-        return paddle._C_ops.nearest_interp(input_0, None, None, None, 'NCHW', -1, -1, -1, [2, 2], 'nearest', False, 1)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 24, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e007423177696466a259ddf87d3b74d3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_64041a00e2f1254b07209d88b05ded71
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 24, 120, 120], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cf52ee88dbd4acfa0bfc3ab01854aecb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 17, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ff7acfd5929e785847f00906f5314761(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 34, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_367ddad5d31a35ad80b6b7f3041bf357(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 68, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c79635e44f43ef6d715cac82e9a4e583(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0a16274efc0228b8b0de893bd74014ea(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_00c78314531bb5b39187f4d4ff15d1c0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 20, 30], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_210db8c5149ae8f4f9335441afbf839c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 40, 60], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6e95dada56ed567db688bacb2f16b6a9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 25, 38], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_daac625863c7b3d7dea6a4d1475c923e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 50, 76], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_70988c70c35826aa371f76d743d205cb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 100, 152], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e32ce95a65a3e1d92982d9a053a93c05(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 24, 36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_912995108dfb1a9556740120b6c2d094(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 48, 72], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3305b45327ec31d9d5abad0bbe6c0aea(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 96, 144], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5bbc154bb31d06d011110caf9aa457ad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 18, 27], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6111568d11d5f8412b8c1ecb6fd0bf46(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 36, 54], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2bfc8a721a960ecc6832e5a8b52416fb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 72, 108], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_baa145ed4a8e293bbbf7400623c00b0c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 22, 33], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f56ab6a9d462e1fb11a51739f2bb772f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 44, 66], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_29cdf61be00e8f6d066ec783c0845cef(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 88, 132], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e51ac5656f008ebc23afbe31c391d639(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 21, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_941602f03de367ef8d02f0f3b6a24f73(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 42, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1346f724e1f19da4f5cb5ffde0f27ad9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 84, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_deea318b8565c9e6d39132bb2cb0624b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 25, 34], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f57428c9e819d6c548856bb510a6680d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 50, 68], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1db07b46592cb74af521ca217ced4a54(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 100, 136], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d768645c5544dbe85babc18b210b509c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 28, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3a3c37e16492f5e1f9a80773a63fef1a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 56, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3c8c103e71d1adc9859acb5f49705cae(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 20, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_feb4a65e9e1b8d4b3336f485da2da0f4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 40, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_86b058cf692b02b13c3c52231bef6639(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 19, 29], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e4534ab3735fa737e035c41eccfd3df1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d25ab13669ed2c4d6555680fc20c6881
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 38, 58], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ab7b62228d9fa192b357258a969e24d0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_121e84aac0bc265c3267c11ec6221f28
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 23, 41], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f3178c47058241ddb27cdffe267d98bd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_121e84aac0bc265c3267c11ec6221f28
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 46, 82], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4f252bc833d39564e5b7a3789bde7a12(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_121e84aac0bc265c3267c11ec6221f28
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 92, 164], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1a39204b0cf6c59313ae8c6217bf219d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_dbf74ee223857b2dc137ccb472e57204
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 24, 23, 41], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5e2ed2217a0d3c856980301ef3a205e6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c879e8e3fcc4c75cd2726e36c60ab463
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 24, 46, 82], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fedcbe7d2f2e9763e582e2a610760972(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_64041a00e2f1254b07209d88b05ded71
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 24, 92, 164], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_6069f27cb211b3aea820d7df50e28489(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = None
-        input_2 = None
-        input_3 = None
-        return paddle._C_ops.nearest_interp(input_0, None, None, None, 'NCHW', -1, -1, -1, [2, 2], 'nearest', False, 0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b8a48ec076aadbefe8edec63eed4d08c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 25, 38], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e3db1729e6bb1d92cbb22d262028c343(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 50, 76], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_36bb50323b471f41d3e9185747cdfcbd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 23, 35], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b846d924eee1c1525767c9842743003c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 46, 70], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_33858eae5b56e96447dc5075ed778d32(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 92, 140], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_67ee3a4d450c1d869582598e8c497a38(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = None
-        input_2 = None
-        input_3 = None
-        return paddle._C_ops.nearest_interp(input_0, None, None, None, 'NCHW', -1, -1, -1, [2, 2], 'nearest', False, 1)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_266c0dbcb83d0648a47158cbd677c931(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_67ee3a4d450c1d869582598e8c497a38
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 256, 30, 30], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_887eb1720f8f44a73807f1195f5430e6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_67ee3a4d450c1d869582598e8c497a38
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 256, 60, 60], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c0f75bf71facd09ee66f268bad9085da(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_67ee3a4d450c1d869582598e8c497a38
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 256, 120, 120], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_99f41c6a2c32a0f05ae6481760e7ef16(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = None
-        input_2 = None
-        input_3 = None
-        return paddle._C_ops.nearest_interp(input_0, None, None, None, 'NCHW', -1, -1, -1, [8, 8], 'nearest', False, 1)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8c134b109bbbc18b0d06d8d8c5cf63e3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_99f41c6a2c32a0f05ae6481760e7ef16
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 64, 30, 30], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_06c79c1090a432fe426aee7c26c97a17(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = None
-        input_2 = None
-        input_3 = None
-        return paddle._C_ops.nearest_interp(input_0, None, None, None, 'NCHW', -1, -1, -1, [4, 4], 'nearest', False, 1)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ac76476e50a9bfc6d7eb66b2f53852f9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_06c79c1090a432fe426aee7c26c97a17
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 64, 60, 60], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e9660db6596d277b3414e4669809454c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_67ee3a4d450c1d869582598e8c497a38
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 64, 120, 120], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8c888c9ff2ead598ac2789cbe53afb04(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 22, 22], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1a65cecc86f8e2022f82e1c48d488ece(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 44, 44], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c335a6ccf6bc3d9c7e800919569f9c26(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 88, 88], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f641470e5c5eac3975ceb42e1d501fbc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 22, 33], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2baa44c0d6143e6658fcbb1fbd807854(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 44, 66], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_71e1677e6df232588ade8e958fbb44b1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 24, 36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_95b09f0ef7b0bbc2c121d1986e372b12(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 48, 72], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3d12e08191461a96ea7fc27e8c75faf3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_67ee3a4d450c1d869582598e8c497a38
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 23, 41], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b993c6e56cdf06e341fd80f16180810e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_67ee3a4d450c1d869582598e8c497a38
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 46, 82], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_737f7707b650481b8b03383a677b2d79(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_67ee3a4d450c1d869582598e8c497a38
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 92, 164], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8d216609e2c495cbc1cda35439b4d27d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_99f41c6a2c32a0f05ae6481760e7ef16
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 23, 41], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_13663329295e9894b86dda016700cb6f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_06c79c1090a432fe426aee7c26c97a17
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 46, 82], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fb7424c394395e93eb75427c9e75cdc6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_67ee3a4d450c1d869582598e8c497a38
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 92, 164], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_48e6c77bc62ad2f291ca3597874c1763(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 20, 30], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_724be353b0a01079ac592957da6e2767(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 40, 60], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ce440c6aec15bf22eac0e218eff5b0ac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 80, 120], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_71deeb8ec488384b92a157110f576035(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5a917a10f4a12ba5cb27447f0843093d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_38e2d1c60d0fe33cc0cbc0cd45609c3b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 15, 25], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5c00d34252c26f10dd03a2fbd5bec0d3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 30, 50], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a1af7b638965fb4d8aba7b7919cef605(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 60, 100], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b8a48ec076aadbefe8edec63eed4d08c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 25, 38], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e3db1729e6bb1d92cbb22d262028c343(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 50, 76], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_16c153cf69107e898db07870e648df24(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 100, 152], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bed0594707ee2bc77c9d8a28886c3346(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 17, 26], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0b7946bafe8c4c64ce30ade4243c54e2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 34, 52], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9830a26dda6bc20ea94955f8f6ebb210(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 68, 104], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_36bb50323b471f41d3e9185747cdfcbd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 23, 35], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b846d924eee1c1525767c9842743003c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 46, 70], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b8a48ec076aadbefe8edec63eed4d08c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 25, 38], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e3db1729e6bb1d92cbb22d262028c343(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 50, 76], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_16c153cf69107e898db07870e648df24(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 100, 152], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b8a48ec076aadbefe8edec63eed4d08c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 25, 38], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e3db1729e6bb1d92cbb22d262028c343(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 50, 76], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_496ab7b164696ddd5afe7c1ad7571446(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_67ee3a4d450c1d869582598e8c497a38
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 96, 30, 30], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9f3db810b5eec803f8a5c4846f70a719(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_67ee3a4d450c1d869582598e8c497a38
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 96, 60, 60], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_394c06e392bea32ee19175f1df0cce05(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_67ee3a4d450c1d869582598e8c497a38
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 96, 120, 120], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_412ee3cf1794686871eecd1160b28deb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_99f41c6a2c32a0f05ae6481760e7ef16
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 24, 30, 30], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_537bc2c25f9c1236253477ea0afe9f7f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_06c79c1090a432fe426aee7c26c97a17
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 24, 60, 60], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cc8848ee141f375ff458c5bbbda2e401(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_67ee3a4d450c1d869582598e8c497a38
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 24, 120, 120], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_08b06657cd29d6e5f249f210bf4e51a0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 17, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_80a02528650cffc3b7be70fe0314138b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 34, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a38207725ec4291cb2ca23170c7c2141(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 68, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_71deeb8ec488384b92a157110f576035(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5a917a10f4a12ba5cb27447f0843093d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_48e6c77bc62ad2f291ca3597874c1763(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 20, 30], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_724be353b0a01079ac592957da6e2767(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 40, 60], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b8a48ec076aadbefe8edec63eed4d08c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 25, 38], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e3db1729e6bb1d92cbb22d262028c343(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 50, 76], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_16c153cf69107e898db07870e648df24(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 100, 152], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_71e1677e6df232588ade8e958fbb44b1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 24, 36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_95b09f0ef7b0bbc2c121d1986e372b12(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 48, 72], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4d41f408a30742b41a476449c8f23446(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 96, 144], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bc7ba71b220afc0fa293e24ce8c5cf7c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 18, 27], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a5bff999ac5ccc881fe236c8b539b1a8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 36, 54], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f419583102b70ac98935700ef32be53a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 72, 108], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f641470e5c5eac3975ceb42e1d501fbc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 22, 33], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2baa44c0d6143e6658fcbb1fbd807854(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 44, 66], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8c6bddd7080e84b0a5945a7a6de3b879(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 88, 132], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d89dc484259918a9b033c6da60678f41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 21, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ef16c0d9701917a9a1a92ce057509097(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 42, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c25bcb77807c6d10b94e166c4684ec82(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 84, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3a651fff84d1e35104ec83f38fbacfa5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 25, 34], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_334df697654f57568b0923806d65d1c2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 50, 68], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_748dcea040f8cad8b3c23608ed7f96bd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 100, 136], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4d532058bdd0a83a9bd112ad3fa623b1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 28, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f32094844dfaa840b3b82ee3209b7e31(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 56, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8740b97a3fc971bac20188fb4706a097(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 20, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0c3066091a7b2cbaf46e05eeb9faaf30(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 40, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bf6acdc4645d5fd1067d146285109ae1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 19, 29], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_422e51601a9f02651dc0db9e845a89bd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6069f27cb211b3aea820d7df50e28489
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 38, 58], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8af0b4c94d46260d7945d2b3e3d6fd0b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_67ee3a4d450c1d869582598e8c497a38
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 23, 41], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bce05ebfb3d8dd951165ab9cc88ce15e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_67ee3a4d450c1d869582598e8c497a38
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 46, 82], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c0f06f6293a89840853ad649d0c36f74(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_67ee3a4d450c1d869582598e8c497a38
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 92, 164], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_447958ee0346257e2493c1e37f989a90(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_99f41c6a2c32a0f05ae6481760e7ef16
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 24, 23, 41], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4f285e2f3efa5d89383e774cf96d8855(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_06c79c1090a432fe426aee7c26c97a17
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 24, 46, 82], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6eaa261ff8005e65f330a8308413548a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_67ee3a4d450c1d869582598e8c497a38
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 24, 92, 164], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+if __name__ == "__main__":
+    sys.exit(table.main(__file__))
@@ -1,10340 +1,28 @@
 import os
-os.environ['FLAGS_cinn_new_group_scheduler'] = '1'
-os.environ['FLAGS_group_schedule_tiling_first'] = '1'
-os.environ['FLAGS_enable_pir_api'] = '1'
-os.environ['FLAGS_cinn_bucket_compile'] = '1'
 import sys
-import unittest
-import numpy as np
-from dataclasses import dataclass
-import typing as t
 
-@dataclass
-class Stage:
-    name: str
-    env_vars: t.Dict[str, str]
+import pytest
 
-cinn_stages = [
-    Stage(
-        name="dynamic_to_static",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=False,
-            FLAGS_prim_all=False,
-            FLAGS_prim_enable_dynamic=False,
-        ),
-    ),
-    Stage(
-        name="prim",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=False,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-        ),
-    ),
-    Stage(
-        name="infer_symbolic",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=False,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-            FLAGS_use_cinn=False,
-            FLAGS_check_infer_symbolic=True,
-        ),
-    ),
-	Stage(
-        name="frontend",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=True,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-            FLAGS_use_cinn=True,
-            FLAGS_check_infer_symbolic=False,
-            FLAGS_enable_fusion_fallback=True,
-        ), 
-    ),
-    Stage(
-        name="backend",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=True,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-            FLAGS_use_cinn=True,
-            FLAGS_check_infer_symbolic=False,
-            FLAGS_enable_fusion_fallback=False,
-        ), 
-    ),
-]
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir, os.pardir))
+from tools.e2e_case_stage import CinnStages  # noqa: E402
 
-def GetCinnStageByName(name):
-    for stage in cinn_stages:
-        if stage.name == name:
-            return stage
-    return None
+stages = CinnStages(__file__)
 
-def GetCurrentCinnStage():
-    name = os.getenv('PADDLE_DEBUG_CINN_STAGE_NAME')
-    if name is None:
-        return None
-    stage_names = [stage.name for stage in cinn_stages]
-    assert name in stage_names, (
-        f"PADDLE_DEBUG_CINN_STAGE_NAME should be in {stage_names}"
-    )
-    return GetCinnStageByName(name)
+from tools.e2e_case_table import E2ECaseTable, CinnTestBase  # noqa: E402
 
-def GetPrevCinnStage(stage):
-    for i in range(1, len(cinn_stages)):
-        if stage is cinn_stages[i]:
-            return cinn_stages[i - 1]
-    return None
+stages.apply()
+table = E2ECaseTable(__file__)
+last_stage_failed = stages.last_stage_failed()
 
-def IsCinnStageEnableDiff():
-    value = os.getenv('PADDLE_DEBUG_CINN_STAGE_ENABLE_DIFF')
-    enabled = value in {
-        '1',
-        'true',
-        'True',
-    }
-    if enabled:
-        assert GetCurrentCinnStage() is not None
-    return enabled
 
-last_cinn_stage_exit_code = None
-def LastCINNStageFailed():
-    global last_cinn_stage_exit_code
-    if last_cinn_stage_exit_code is not None:
-        return last_cinn_stage_exit_code != 0
-    last_stage = GetPrevCinnStage(GetCurrentCinnStage())
-    if last_stage is None:
-        return False
-    env_vars = dict(
-        PADDLE_DEBUG_CINN_STAGE_NAME=last_stage.name,
-        PADDLE_DEBUG_CINN_STAGE_ENABLE_DIFF='0',
-    )
-    env_vars_str = " ".join(
-        f"{env_var}={value}"
-        for env_var, value in env_vars.items()
-    )
-    last_cinn_stage_exit_code = os.system(
-        f"{env_vars_str} {sys.executable} {__file__} > /dev/null 2>&1"
-    )
-    return last_cinn_stage_exit_code != 0
+def pytest_generate_tests(metafunc):
+    table.parametrize(metafunc)
 
-def SetDefaultEnv(**env_var2value):
-    for env_var, value in env_var2value.items():
-        if os.getenv(env_var) is None:
-            os.environ[env_var] = str(value)
 
-SetDefaultEnv(
-    PADDLE_DEBUG_CINN_STAGE_NAME="backend",
-    PADDLE_DEBUG_CINN_STAGE_ENABLE_DIFF=False,
-    PADDLE_DEBUG_ENABLE_CINN=True,
-    FLAGS_enable_pir_api=True,
-    FLAGS_prim_all=True,
-    FLAGS_prim_enable_dynamic=True,
-    FLAGS_use_cinn=False,
-    FLAGS_check_infer_symbolic=False,
-    FLAGS_enable_fusion_fallback=False,
-)
+@pytest.mark.skipif(last_stage_failed, reason="last stage failed")
+class TestPrimitiveOp(CinnTestBase):
+    table = table
 
-import paddle
 
-def SetEnvVar(env_var2value):
-    for env_var, value in env_var2value.items():
-        os.environ[env_var] = str(value)
-    paddle.set_flags({
-        env_var:value
-        for env_var, value in env_var2value.items()
-        if env_var.startswith('FLAGS_')
-    })
-
-if GetCurrentCinnStage() is not None:
-    SetEnvVar(GetCurrentCinnStage().env_vars)
-
-def GetEnvVarEnableJit():
-    enable_jit = os.getenv('PADDLE_DEBUG_ENABLE_JIT')
-    return enable_jit not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
-
-def GetEnvVarEnableCinn():
-    enable_cinn = os.getenv('PADDLE_DEBUG_ENABLE_CINN')
-    if enable_cinn is None:
-        return True
-    return enable_cinn not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
-
-
-def GetTolerance(dtype):
-    if dtype == np.float16:
-        return GetFloat16Tolerance()
-    if dtype == np.float32:
-        return GetFloat32Tolerance()
-    return 1e-6
-
-def GetFloat16Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT16_TOL'))
-    except:
-        return 1e-3
-
-def GetFloat32Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT32_TOL'))
-    except:
-        return 1e-6
-
-def IsInteger(dtype):
-    return np.dtype(dtype).char in np.typecodes['AllInteger']
-
-def ApplyToStatic(net, use_cinn):
-    build_strategy = paddle.static.BuildStrategy()
-    build_strategy.build_cinn_pass = use_cinn
-    return paddle.jit.to_static(
-        net,
-        input_spec=net.get_input_spec(),
-        build_strategy=build_strategy,
-        full_graph=True,
-    )
-
-class InstanceTrait:
-
-    @classmethod
-    def instance(cls):
-        if cls.instance_ is None:
-            cls.instance_ = cls()
-        return cls.instance_
-
-    @classmethod
-    def static_instance_with_cinn(cls):
-        if cls.static_instance_with_cinn_ is None:
-            cls.static_instance_with_cinn_ = ApplyToStatic(
-                cls.instance(),
-                use_cinn=True
-            )
-        return cls.static_instance_with_cinn_
-
-    @classmethod
-    def static_instance_without_cinn(cls):
-        if cls.static_instance_without_cinn_ is None:
-            cls.static_instance_without_cinn_ = ApplyToStatic(
-                cls.instance(),
-                use_cinn=False
-            )
-        return cls.static_instance_without_cinn_
-
-
-class CinnTestBase:
-
-    def setUp(self):
-        paddle.seed(2024)
-        self.prepare_data()
-
-    def test_train(self):
-        dy_outs = self.train(use_cinn=False)
-        cinn_outs = self.train(use_cinn=GetEnvVarEnableCinn())
-
-        for cinn_out, dy_out in zip(cinn_outs, dy_outs):
-          if type(cinn_out) is list and type(dy_out) is list:
-            for x, y in zip(cinn_out, dy_out):
-              self.assert_all_close(x, y)
-          else:
-            self.assert_all_close(cinn_out, dy_out)
-
-    def train(self, use_cinn):
-        if GetEnvVarEnableJit():
-            net = self.prepare_static_net(use_cinn)
-        else:
-            net = self.prepare_net()
-        paddle.seed(2024)
-        out = net(*self.inputs)
-        return out
-    
-    def prepare_data(self):
-        self.inputs = self.get_inputs()
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def prepare_net(self):
-        return self.get_test_class().instance()
-
-    def prepare_static_net(self, use_cinn):
-        if use_cinn:
-            return self.get_test_class().static_instance_with_cinn()
-        else:
-            return self.get_test_class().static_instance_without_cinn()
-
-    def assert_all_close(self, x, y):
-        if (hasattr(x, "numpy") and hasattr(y, "numpy")):
-            x_numpy = x.numpy()
-            y_numpy = y.numpy()
-            assert x_numpy.dtype == y_numpy.dtype
-            if IsInteger(x_numpy.dtype):
-                np.testing.assert_equal(x_numpy, y_numpy)
-            else:
-                tol = GetTolerance(x_numpy.dtype)
-                np.testing.assert_allclose(x_numpy, y_numpy, atol=tol, rtol=tol)
-        else:
-            assert x == y
-
-
-
-
-
-last_stage_failed = (IsCinnStageEnableDiff() and LastCINNStageFailed())
-class PrimitiveOp_bb9b30cbeef8a04c0c506568cfae0ca1(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 576, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8a4c35cdc92dd4ca2f47202b5879760f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bb9b30cbeef8a04c0c506568cfae0ca1
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 576, 10, 10], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_f640d9c72133910427f43a744e878ec2(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a7bf5e544bb02c2c74818aa4a27024c6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5393070d60a8526fc52ce646c6d08bb2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 92, 40, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_0cbbd9c86270a237992ba7e113cf1ae7(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 160, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_501663bce1bea76cfd48eeb5bdbc034c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0cbbd9c86270a237992ba7e113cf1ae7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 30, 30], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0cd2632f20c2c6645cb22a720e9a9583(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 2048, 10, 10], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4cc5abd07f298e6c1eb668f5d63e5250(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 960, 16, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_042692eeb63875641f63a4001f7d3370(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 672, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cfd1df740872c46369b5f051b5af2abc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_042692eeb63875641f63a4001f7d3370
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 672, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_573a290de18412d87ffbe68e47a333a7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 32, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_971e59afcf3d5e2d82c692075c0ade8e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_042692eeb63875641f63a4001f7d3370
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_5add60d34c9c830cb035c879b396c7c8(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 120, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_88c491c5868e18b5a48cec9c64d23050(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5add60d34c9c830cb035c879b396c7c8
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 44, 44], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_de8342c485a8d34ab047c8a918a25fad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 336, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_837f427b6e1d5666fb1bf2029838024c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [5, 5]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [2, 2], False, True, 'NCHW', 'max', False, False, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9319f8ee6a4471c98408029847be750d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_837f427b6e1d5666fb1bf2029838024c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 12, 12], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_0f0195ecf97c5f2a1f388163641bafa7(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [9, 9]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [4, 4], False, True, 'NCHW', 'max', False, False, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6dd1b39459bcc692e4d31cad1d6d3284(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0f0195ecf97c5f2a1f388163641bafa7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 12, 12], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_6a1b72f1f7523732b2b45b68b80352f2(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [13, 13]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [6, 6], False, True, 'NCHW', 'max', False, False, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5574d284afae5b65e82966c8d17aeb55(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a1b72f1f7523732b2b45b68b80352f2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 12, 12], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a9929b2dd0c2c66cb21d32eda3000a2b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5add60d34c9c830cb035c879b396c7c8
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_3d4d1bac99e9475366b72a8e2368ea46(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 20, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5ba302ae6b086cf1fbc6e3bfa1b049c8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3d4d1bac99e9475366b72a8e2368ea46
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 20, 128, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_eaeb5c6f4c345fa8eb372989ac93098e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 40, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_591419abdf9a01dbb33ed1590b496a86(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_eaeb5c6f4c345fa8eb372989ac93098e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 40, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_7ea7caa670d8e0133fe0af28d0b952b9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 960, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_60e59a55c976c2c20cb6b52203cf66c9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7ea7caa670d8e0133fe0af28d0b952b9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 960, 10, 10], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_bb9027a84c932890db2e76b95d257461(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 96, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_62c81bb55ccc72187f7558d7ea808f19(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bb9027a84c932890db2e76b95d257461
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_573a758f81ef2dd51845bd3df99390df(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 240, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_759ba775adc5407c24c49778e340b7a9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_573a758f81ef2dd51845bd3df99390df
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 240, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c26c33f65b9f245a0e245e57f69ee7b7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 60, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_43b3c19e087b1f1c2088c25d4d1b7ffe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_042692eeb63875641f63a4001f7d3370
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 672, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_b74c932e0f0ed323cbcab12d8400ddde(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 72, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_42828d3d6a615475e3b43ea0991db573(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b74c932e0f0ed323cbcab12d8400ddde
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 44, 44], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_dfdf08c7395a65bc320bdce80cf69c4f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7ea7caa670d8e0133fe0af28d0b952b9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 960, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_925eba7e9c3233733732f7b129360944(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_573a758f81ef2dd51845bd3df99390df
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 240, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_c6b3661db2a9451fecf3732bd930b899(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 1152, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cd13977a29317052c9f172430a31a270(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b3661db2a9451fecf3732bd930b899
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 1152, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_26f390c56d13176376f11c1f3deb7a7b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_837f427b6e1d5666fb1bf2029838024c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 23, 23], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1b3c9edbbfba6777a1d2f91804f87551(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0f0195ecf97c5f2a1f388163641bafa7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 23, 23], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3fc42d7fb85ce04f50e24f135316b90c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a1b72f1f7523732b2b45b68b80352f2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 23, 23], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_399c362aed59674c76adcf8d97566ebb(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [2, 2], [0, 0], False, True, 'NCHW', 'max', False, False, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 256, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cc92526e3da82ce2ebbb7bf3423e517b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_399c362aed59674c76adcf8d97566ebb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 23, 35], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_168b238f17bac977b0c9dbbe0a5cc995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bb9027a84c932890db2e76b95d257461
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b00405c1f6a03e0fe934d29d835ce0b1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 336, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_12a2d541ea7f436ffa6915ff8606e647(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 2048, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_7bdee029e56e53ec96cea5cc448fd5dc(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 16, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_50d4b3486e745503c061f3c0c53c6de7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7bdee029e56e53ec96cea5cc448fd5dc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 16, 80, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7e30f5b28beb07d7bb7cc2d3914f3abc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 336, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_01049751ed48049a0488ad1b70ff9ea2(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 44, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4eebbc76a92720c1657d7efcc2529ce0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_01049751ed48049a0488ad1b70ff9ea2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 44, 48, 48], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8ced7150540f0cadc9f221636fc8ace8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0cbbd9c86270a237992ba7e113cf1ae7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7e62c8863c7bab49313b240599126ddb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7ea7caa670d8e0133fe0af28d0b952b9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 960, 11, 11], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_b188cd53c668949013d3284dd87c86ad(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 1024, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_238115752dd036425e9ad14b771555df(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b188cd53c668949013d3284dd87c86ad
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1024, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b941ad7a5aef9c4973fd84ef3b70dcd4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_837f427b6e1d5666fb1bf2029838024c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 10, 10], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8adef344a6effab79801a9808549dc80(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0f0195ecf97c5f2a1f388163641bafa7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 10, 10], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_902e662b5876317e8b21de1ef0ed9eac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a1b72f1f7523732b2b45b68b80352f2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 10, 10], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_d8cdb3f50656936ccf07c09a2ab90949(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 480, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_34b8c85644be94a472e92dc06deac6ae(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d8cdb3f50656936ccf07c09a2ab90949
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 13, 13], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_285d9c5bfa708c55b00ef85ee8f4c41d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5add60d34c9c830cb035c879b396c7c8
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c59bea13fc5e8d6695219055b9e0e6a9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_042692eeb63875641f63a4001f7d3370
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_8744b9c027aafa775494a6650e4e066d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [2, 2]
-        return paddle._C_ops.pool2d(input_0, input_1, [2, 2], [0, 0], False, True, 'NCHW', 'avg', False, False, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 256, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2bb609eac3b269babdd47d7b3121012e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8744b9c027aafa775494a6650e4e066d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 160, 240], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_4421552144871a7fa1cffd174886febe(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [4, 4]
-        return paddle._C_ops.pool2d(input_0, input_1, [4, 4], [0, 0], False, True, 'NCHW', 'avg', False, False, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 256, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ad297fd4a985622b725b2539af2f561d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4421552144871a7fa1cffd174886febe
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 160, 240], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_dc425afba7814bff8da43fb53d4f897d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [8, 8]
-        return paddle._C_ops.pool2d(input_0, input_1, [8, 8], [0, 0], False, True, 'NCHW', 'avg', False, False, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 256, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_54f2f679d7d7699cb6851984bf5c9d78(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_dc425afba7814bff8da43fb53d4f897d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 160, 240], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_96123dd2d0684a6a5e74fcfb6aca191e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [16, 16]
-        return paddle._C_ops.pool2d(input_0, input_1, [16, 16], [0, 0], False, True, 'NCHW', 'avg', False, False, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 256, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bbd5baa595256452ee3b5e8ef2e25401(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_96123dd2d0684a6a5e74fcfb6aca191e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 160, 240], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1f611e18c31794255accad70ab194b15(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 240, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_74d19b8476c0428dfec414fef0c6dcb0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_837f427b6e1d5666fb1bf2029838024c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1789ef6fe24201129d5b39fbae825fad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0f0195ecf97c5f2a1f388163641bafa7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_99c0fd455c1be764d1f55eb7cd30655b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a1b72f1f7523732b2b45b68b80352f2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_1348c0d30f8c69d74bae800ce6f783d5(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 64, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bc79f50eb82181ca39e4eeedc3e8493b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1348c0d30f8c69d74bae800ce6f783d5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 60, 60], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_df4c88953f6c412d419d04a1cf0b2b73(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [16, 16]
-        return paddle._C_ops.pool2d(input_0, input_1, [16, 16], [0, 0], False, True, 'NCHW', 'avg', False, False, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_653a7d8026110a308f8e0954129a99a0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_df4c88953f6c412d419d04a1cf0b2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 32, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_b33f66f705adbad9e0913839dfbcb5aa(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [8, 8]
-        return paddle._C_ops.pool2d(input_0, input_1, [8, 8], [0, 0], False, True, 'NCHW', 'avg', False, False, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_dd1fb69f23042d61f3c12dbbbe4af1cb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b33f66f705adbad9e0913839dfbcb5aa
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_15a91387b4bc87a4e70749322c891584(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [4, 4]
-        return paddle._C_ops.pool2d(input_0, input_1, [4, 4], [0, 0], False, True, 'NCHW', 'avg', False, False, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7bd265de8a312668abe9c241796c460b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_15a91387b4bc87a4e70749322c891584
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_3be4a0bf23ecbcd0ff1d20bd7eace03b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [2, 2]
-        return paddle._C_ops.pool2d(input_0, input_1, [2, 2], [0, 0], False, True, 'NCHW', 'avg', False, False, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e3d01f865bd26e46bc7a8076541b581c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3be4a0bf23ecbcd0ff1d20bd7eace03b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d374fcff1e9d6885c74a588ebd482936(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_df4c88953f6c412d419d04a1cf0b2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 16, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4266db2fe8d5287761ef81c176adcb98(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b33f66f705adbad9e0913839dfbcb5aa
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 32, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_434023b43da8da69d412a2ba80fbcda9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_15a91387b4bc87a4e70749322c891584
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_50087cc069bc8faf4f06f1c661cb1d68(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3be4a0bf23ecbcd0ff1d20bd7eace03b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_28e9419cf347efd07f354a2b0b32eb1b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_042692eeb63875641f63a4001f7d3370
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 34, 34], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_013d44e337d2346850c0b05e288f5af2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 60, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cfd1df740872c46369b5f051b5af2abc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_042692eeb63875641f63a4001f7d3370
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 672, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_0c46fe3be0652a9e78261970f0727158(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 128, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f2aed0c39ccb31c74fda9a242fea3140(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0c46fe3be0652a9e78261970f0727158
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 30, 30], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_181e59967aae66c6799cc61dc68f0fdd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d8cdb3f50656936ccf07c09a2ab90949
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 22, 22], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5706d6cd4a27561f0b67940ff5834a60(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5add60d34c9c830cb035c879b396c7c8
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_902da57739cd120333304c6ee9826809(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 320, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7a0d22782da3423fd9e5b0b6b8fa1ac8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_902da57739cd120333304c6ee9826809
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 320, 22, 22], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7f16a00b89752141544687c88cb94c35(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 872, 20, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_66bc168ee4db2323a9c2324f652587c2(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 100, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1f01e24a5c76d3ee391db845953eadf4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_66bc168ee4db2323a9c2324f652587c2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 100, 18, 18], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2ba7170f50e96aed0d880ff39de05599(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7ea7caa670d8e0133fe0af28d0b952b9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 960, 16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_39bfa38a9847214b47a1c27227902502(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_042692eeb63875641f63a4001f7d3370
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 22, 22], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f41e742d93150613f7dc63c0616bb064(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_837f427b6e1d5666fb1bf2029838024c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 10, 10], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_231a66922fc3cfd249a9e7fd190c36d2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0f0195ecf97c5f2a1f388163641bafa7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 10, 10], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1ae847a1e557bb063cde709342803796(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a1b72f1f7523732b2b45b68b80352f2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 10, 10], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_6a4d101c98cea0c1a3a04e3638d56980(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 256, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e2ca669ad70c93fb2aedbd98d594dbd4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a4d101c98cea0c1a3a04e3638d56980
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 12, 12], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_82034db03c56fe7ade1bc47f4d08f614(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 336, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ef34248ed1ed1edc074089c769de40bc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_573a758f81ef2dd51845bd3df99390df
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 240, 44, 44], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_3b41be388b02778cc6fc092e431c76cd(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 80, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_365efcb728ebd33c94aa76f5135e5daa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3b41be388b02778cc6fc092e431c76cd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6e5c2595f752c4ef01fcb0025503b812(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_042692eeb63875641f63a4001f7d3370
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 11, 11], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_2e0c1cb518e321b172522013d363812b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 768, 1, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_31756a305e30ffc8301808f70093a575(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2e0c1cb518e321b172522013d363812b
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 768, 1, 49], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9e3202e39a2b966744adde639ac66ed6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_902da57739cd120333304c6ee9826809
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 320, 12, 12], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0d52b9e46ba3bde57394e5197e223de7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d8cdb3f50656936ccf07c09a2ab90949
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 38, 38], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_535c8fc6544707744ddbc07559f72a05(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_042692eeb63875641f63a4001f7d3370
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 19, 19], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1dc50c53e2bd2c6929ca03d3d1177af2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b74c932e0f0ed323cbcab12d8400ddde
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 36, 36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_05bbe189b38acbecf6ee5d200c23293d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_399c362aed59674c76adcf8d97566ebb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 22, 22], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_139304a9ad82e043b3e58bb0222b235f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 240, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f17c36eed905cf19fe28308287c1d2aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bb9027a84c932890db2e76b95d257461
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 96, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ab033a20302e3b866ddf2a089664f3a9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bb9b30cbeef8a04c0c506568cfae0ca1
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 576, 16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d782473a1c790393e2cf0a664cdc6837(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d8cdb3f50656936ccf07c09a2ab90949
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 480, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1b30e3ed0386b3e8dd822143421bbec7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_837f427b6e1d5666fb1bf2029838024c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 288, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_272ff445277b3df3a363b53b7dd512d0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0f0195ecf97c5f2a1f388163641bafa7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 288, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_598d4fb808d2a07af8f835705d06a7fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a1b72f1f7523732b2b45b68b80352f2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 288, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_813eb68e8d122ae554563eb3d93fcd7c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 320, 8, 8], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b0f722825a7d3e8d126fe9dc51f63178(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_042692eeb63875641f63a4001f7d3370
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 17, 17], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_bd618ea692130335110ae7249b074b15(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [3, 3]
-        return paddle._C_ops.pool2d(input_0, input_1, [2, 2], [0, 0], False, True, 'NCHW', 'max', False, False, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 96, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e4109d8fc949ca11e05bcb89b92e6acc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bd618ea692130335110ae7249b074b15
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 96, 109, 109], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_f4d1e1cfe616a12626dd2053a039a2ed(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [3, 3]
-        return paddle._C_ops.pool2d(input_0, input_1, [2, 2], [0, 0], False, True, 'NCHW', 'max', False, False, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 256, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_831e089a7790d2fb03c2149e1f353617(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f4d1e1cfe616a12626dd2053a039a2ed
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 256, 54, 54], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_b31c231c56d94809371bc2d84ec86c0c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [3, 3]
-        return paddle._C_ops.pool2d(input_0, input_1, [2, 2], [0, 0], False, True, 'NCHW', 'max', False, False, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 512, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ca6dbeba66613de399cc399217081946(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b31c231c56d94809371bc2d84ec86c0c
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 512, 26, 26], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_13cddfcba6f939582f57902b38c71d4e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 1000, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_09c90cf06a799678b1fd8b48ebe50ba4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_13cddfcba6f939582f57902b38c71d4e
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 1000, 12, 12], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7d46fd6089a2afe996c7a726aeff09b4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_573a758f81ef2dd51845bd3df99390df
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 240, 26, 26], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c99a81baecd0e855f96659060b1bbff7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b74c932e0f0ed323cbcab12d8400ddde
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_29e991286ba06113f6a85e94c3d546ac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 336, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_02c3ae9ce5654fd05f636b05c3a98e56(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bb9027a84c932890db2e76b95d257461
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 8, 8], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b072114565f64226e529a454ed500931(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b74c932e0f0ed323cbcab12d8400ddde
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 88, 88], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_b5789826b4964c12ec23763a4c1d3341(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 192, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5b6adbb5bfbdc131a4060f9ab9a43b61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b5789826b4964c12ec23763a4c1d3341
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 30, 30], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_e862f37f8e4cc1d8a8dd3489ad68c0c7(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 144, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2aac9d180d965ef934b8c1fb798639ca(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e862f37f8e4cc1d8a8dd3489ad68c0c7
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 144, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d36ff0fccb7b10239016410732f4bf53(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 2048, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4f047ece796264921918531950b2b75c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b74c932e0f0ed323cbcab12d8400ddde
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 40, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0ff917e5af014f5571a9b088b0b567d8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b5789826b4964c12ec23763a4c1d3341
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f3de6b2e811599fca3a5a1c162b437ea(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 36, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_925eba7e9c3233733732f7b129360944(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_573a758f81ef2dd51845bd3df99390df
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 240, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_675309f2d572634c3f427db5505f8eec(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 1280, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_737a192010e6938c14e3aa61f42b9864(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bd618ea692130335110ae7249b074b15
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 96, 109, 109], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cd4aa2c4869a01d831faab10ab1a998e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f4d1e1cfe616a12626dd2053a039a2ed
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 256, 54, 54], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d9d9186d8bea8d4798a20d8f26173718(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b31c231c56d94809371bc2d84ec86c0c
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 512, 26, 26], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bb764648363f2cfd4f6b9e36a2e11ea1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_13cddfcba6f939582f57902b38c71d4e
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1000, 12, 12], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_65a2ce85c32fc882c2c1c7ecaaee035c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_837f427b6e1d5666fb1bf2029838024c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 13, 13], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3768489e40246f836b8df544b0318124(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0f0195ecf97c5f2a1f388163641bafa7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 13, 13], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3582a3dab36af53a72df0be036bafcf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a1b72f1f7523732b2b45b68b80352f2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 13, 13], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8bd7108d09494fcef153ce2c9f185bd4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e862f37f8e4cc1d8a8dd3489ad68c0c7
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 144, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_8e05b1fed152333f4021d657cef90a9b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [7, 7]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 1, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_96032d312f86a7686a779e34de4b3fc7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8e05b1fed152333f4021d657cef90a9b
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_96032d312f86a7686a779e34de4b3fc7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8e05b1fed152333f4021d657cef90a9b
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_577c207508f896233fbbda38c729432f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8e05b1fed152333f4021d657cef90a9b
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_577c207508f896233fbbda38c729432f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8e05b1fed152333f4021d657cef90a9b
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_10a57930303d47fa657db85a27aaa81e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8e05b1fed152333f4021d657cef90a9b
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_10a57930303d47fa657db85a27aaa81e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8e05b1fed152333f4021d657cef90a9b
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d16e36d048caf7b1f5a3f695009179c5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8e05b1fed152333f4021d657cef90a9b
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d16e36d048caf7b1f5a3f695009179c5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8e05b1fed152333f4021d657cef90a9b
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b8620547702155472c65a3bb57aab063(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_042692eeb63875641f63a4001f7d3370
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 672, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_f3ccf76cfd73f9a34431e5d34e36bbb9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [28, 28]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 1, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_26e276b727395083aa1d595a9b038d11(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f3ccf76cfd73f9a34431e5d34e36bbb9
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_26e276b727395083aa1d595a9b038d11(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f3ccf76cfd73f9a34431e5d34e36bbb9
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_847f486fddd15b8b8267cf81857c77ad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f3ccf76cfd73f9a34431e5d34e36bbb9
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_847f486fddd15b8b8267cf81857c77ad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f3ccf76cfd73f9a34431e5d34e36bbb9
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5d939768c7183be22287ccda41fbc708(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f3ccf76cfd73f9a34431e5d34e36bbb9
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5d939768c7183be22287ccda41fbc708(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f3ccf76cfd73f9a34431e5d34e36bbb9
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_88c5ab7253f487ee5f123f1bab3edb63(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f3ccf76cfd73f9a34431e5d34e36bbb9
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_88c5ab7253f487ee5f123f1bab3edb63(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f3ccf76cfd73f9a34431e5d34e36bbb9
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6ec2ebb1eb882e11f6423662762180f9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 480, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cdb06962b7746ccb5491e182358869ac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0c46fe3be0652a9e78261970f0727158
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 60, 60], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d782473a1c790393e2cf0a664cdc6837(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d8cdb3f50656936ccf07c09a2ab90949
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 480, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e19be0b23ee416870f68930eb2fb0995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 336, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_01f09c03eac8440fa9e3988cfe50ae1c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b3661db2a9451fecf3732bd930b899
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 1152, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_5b5fa6b2386a437dd63ec8f0943351eb(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 32, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_47354c7ea45089de8d5cb150dd07abca(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5b5fa6b2386a437dd63ec8f0943351eb
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 32, 112, 112], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_93776aacc468cb218f38e7bdebef77a4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 240, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4f426260296f54ae6843f129cec7be7c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 336, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b8d8576ca5c383a170a1859c265ce07d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d8cdb3f50656936ccf07c09a2ab90949
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 480, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_fbe1573a5c3833039ea6d048f535a5d8(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [14, 14]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 1, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ba86b3d9935dc62d41064c6a31b999b5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fbe1573a5c3833039ea6d048f535a5d8
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ba86b3d9935dc62d41064c6a31b999b5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fbe1573a5c3833039ea6d048f535a5d8
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d58a076bc2fa4048a55560d11d675a4e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fbe1573a5c3833039ea6d048f535a5d8
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d58a076bc2fa4048a55560d11d675a4e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fbe1573a5c3833039ea6d048f535a5d8
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_13c0d03802ddb45ef04aa740aea649eb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fbe1573a5c3833039ea6d048f535a5d8
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_13c0d03802ddb45ef04aa740aea649eb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fbe1573a5c3833039ea6d048f535a5d8
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_91071a7bf38837826171857b2813b764(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fbe1573a5c3833039ea6d048f535a5d8
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_91071a7bf38837826171857b2813b764(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fbe1573a5c3833039ea6d048f535a5d8
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_a0f6a0272da0fbe4ad07ddcf61ea7983(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [2, 2]
-        return paddle._C_ops.pool2d(input_0, input_1, [2, 2], [0, 0], True, True, 'NCHW', 'max', False, False, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 64, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_95aea788b168b86985c89a37929d38d8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a0f6a0272da0fbe4ad07ddcf61ea7983
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 300, 300], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_7e72b7e75e76b9c844a7a051c33e202c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [2, 2]
-        return paddle._C_ops.pool2d(input_0, input_1, [2, 2], [0, 0], True, True, 'NCHW', 'max', False, False, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 128, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_958893f1b81163080194798db727cdfa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7e72b7e75e76b9c844a7a051c33e202c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 150, 150], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_7073e969366547ee3dc2f1ea3ab1301a(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [2, 2]
-        return paddle._C_ops.pool2d(input_0, input_1, [2, 2], [0, 0], True, True, 'NCHW', 'max', False, False, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 256, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0f0975d92c754fdd1f31d67a04c1f6c9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7073e969366547ee3dc2f1ea3ab1301a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 75, 75], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_a2e502d264d2fe420e295c0bb10108eb(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [2, 2]
-        return paddle._C_ops.pool2d(input_0, input_1, [2, 2], [0, 0], True, True, 'NCHW', 'max', False, False, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 512, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9050898ce9ec3618ed138346c42572fc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a2e502d264d2fe420e295c0bb10108eb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 38, 38], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_0a86c8cf3d26d11a9ad25b00e9447915(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [3, 3]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [1, 1], True, True, 'NCHW', 'max', False, False, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 512, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_36c1b99f41a5899c409a53ca9fb29f46(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0a86c8cf3d26d11a9ad25b00e9447915
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 19, 19], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5516ef4b78062059e0e34e94977b00d6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1536, 8, 8], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_47d0d954ddf36f0f8300a219537d565f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_042692eeb63875641f63a4001f7d3370
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_aacd617d5ee9a0aa0e82876691405d88(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 60, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_aa629808ddca0e266c58498294be2d0f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8744b9c027aafa775494a6650e4e066d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 176, 264], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ae67a854190645271165c2d280732661(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4421552144871a7fa1cffd174886febe
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 176, 264], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3cf24f527148d0ababf68ecdd6893103(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_dc425afba7814bff8da43fb53d4f897d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 176, 264], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1b2d247ef532c4f87fee4c8c7059f6fb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_96123dd2d0684a6a5e74fcfb6aca191e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 176, 264], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_61d49c6e0faabdcbfff3b451ce8858b7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 240, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6b30ec95788d1e461f8097d31b2846e4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1536, 8, 8], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a3ddda67a5f361f59d4ff925bcfafe00(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b74c932e0f0ed323cbcab12d8400ddde
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 76, 76], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_74fca391f3dacbe52a5ac98f861e7780(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_573a758f81ef2dd51845bd3df99390df
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 240, 20, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b5678ac76500ce5c6c2b6d95a33986a9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_399c362aed59674c76adcf8d97566ebb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 20, 30], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_bf6cf60e54fed01c6416fa73bcc15760(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NHWC', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_43f59b8f98bdfa1724d7e8543ad9eb20(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bf6cf60e54fed01c6416fa73bcc15760
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 7, 7, 2048], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_70371ffa921a7fc5657b321f2b2501f2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_837f427b6e1d5666fb1bf2029838024c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 20, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1ba9f309fb617c8e0694a28dc782465e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0f0195ecf97c5f2a1f388163641bafa7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 20, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1cd0068603feac94ec39062cf5197799(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a1b72f1f7523732b2b45b68b80352f2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 20, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d62cf7f81e4b9dafc91bbc2e5de71cc5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0cbbd9c86270a237992ba7e113cf1ae7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 44, 44], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c7f4a76d3830063e8ec6784a3b2f7a6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1348c0d30f8c69d74bae800ce6f783d5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_dd4c939a254e92abe0e605318e42b38d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_837f427b6e1d5666fb1bf2029838024c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2f2cb7d9026d6e6c4c30dbdccefa9fbc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0f0195ecf97c5f2a1f388163641bafa7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e6fade13ecb2cce91b3bb0ead316d407(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a1b72f1f7523732b2b45b68b80352f2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b8620547702155472c65a3bb57aab063(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_042692eeb63875641f63a4001f7d3370
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 672, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1a869bef2425391d1475f22d743852e5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 36, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e41148710869abe3e0e5316daace6366(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d8cdb3f50656936ccf07c09a2ab90949
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b197b0625e367e79f344e08739a7091d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b74c932e0f0ed323cbcab12d8400ddde
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c3d83dc858139b3f1f6e7094a5ab56d8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e862f37f8e4cc1d8a8dd3489ad68c0c7
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 144, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_50c1a758ac4c2bc968151a95699501e4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7bdee029e56e53ec96cea5cc448fd5dc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 16, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fa84dcfe3c4ae5d1816080b973a3715f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_837f427b6e1d5666fb1bf2029838024c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 21, 21], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9a5fd884da2ecad8159d9b110ec8bede(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0f0195ecf97c5f2a1f388163641bafa7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 21, 21], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_07ecd3061510bd88fbf9ada62e9b8508(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a1b72f1f7523732b2b45b68b80352f2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 21, 21], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f658bcb99d2cb487d390b397a052501c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bd618ea692130335110ae7249b074b15
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 96, 109, 109], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_054f0302b0a160203eea3cfe58341127(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f4d1e1cfe616a12626dd2053a039a2ed
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 256, 54, 54], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_245c221218c81b3657fc7192eaaae533(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b31c231c56d94809371bc2d84ec86c0c
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 512, 26, 26], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4861866e02f66817a925d26d70134eb3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_13cddfcba6f939582f57902b38c71d4e
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 1000, 12, 12], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5ada3e547419ca42c98292fad50c96bd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_573a758f81ef2dd51845bd3df99390df
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 240, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_15c69db3d248a532ef7a3ab2042e362d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a4d101c98cea0c1a3a04e3638d56980
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 15, 15], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_eae294dca8109735d6803cdfbacab6eb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 60, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_05f66d8eab9cebbab6c4157a52148d1a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_399c362aed59674c76adcf8d97566ebb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 15, 25], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f44b4f295d36b0303ac2592001ba5528(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 32, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_a65f4df3c48d83787c3e7fe3e6b08c23(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 400, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ded667f605f1c31348eb7386f95899c2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a65f4df3c48d83787c3e7fe3e6b08c23
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 400, 22, 22], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1fb9e91b8ca3b6a82103b15f793ea89f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_399c362aed59674c76adcf8d97566ebb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 25, 38], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_fd5a26d0dca78fd460031949f90d463e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [2, 2], [0, 0], False, True, 'NCHW', 'max', False, False, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 64, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_01d2a565e7a74a71270cc34eb74de6a3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fd5a26d0dca78fd460031949f90d463e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 17, 26], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_950fbe1bf95a24664758ff24f1efd02c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 336, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c5b8295d34b7c22de9e2fa3caca5c569(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_573a758f81ef2dd51845bd3df99390df
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 240, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_dda6055352f94f758d0b9299dd21e89e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_837f427b6e1d5666fb1bf2029838024c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b638caee3d82297e6a35417d1c4ac514(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0f0195ecf97c5f2a1f388163641bafa7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_15d51c46590eeeb85ca2de05753497ed(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a1b72f1f7523732b2b45b68b80352f2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fa52c9f612e61cdb84e605c2c9906224(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_573a758f81ef2dd51845bd3df99390df
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 240, 18, 18], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4e72117406ff6b4f4b826ca8fbc3a90f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3be4a0bf23ecbcd0ff1d20bd7eace03b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 38, 68], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_523d174284e5387954986e5eae6e3155(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [9, 9]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [4, 4], False, True, 'NCHW', 'avg', False, False, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_057189ea07fdce5e0a5f98321ad4828a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_523d174284e5387954986e5eae6e3155
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 19, 34], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e4610b71f21b5c1665d9c2693ba276c8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d8cdb3f50656936ccf07c09a2ab90949
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 9, 9], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cb027178c09148ebac4e8dbff4e72f4d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b5789826b4964c12ec23763a4c1d3341
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 12, 12], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_39119fa53f9c0b99e8a148d26149cac9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_042692eeb63875641f63a4001f7d3370
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 20, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6ba1202d38b558924189d6dc7adddd58(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3b41be388b02778cc6fc092e431c76cd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 88, 88], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a5953e954821de8935daad1fd4ddf9e3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 2048, 10, 10], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d2ce6f5088292abd55b75ef6c60f8382(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 2048, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e32b91f365dd66633da6c357e7561dc9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 320, 8, 8], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_6e1d4c42d68ed09391153b5d9256186d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 336, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_17eb9eacd548be75c6800bb457ec45ea(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6e1d4c42d68ed09391153b5d9256186d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 336, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3ed9f3c3e6d65271ecfbd3440071ba84(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5b5fa6b2386a437dd63ec8f0943351eb
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 32, 112, 112], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3ff3b33699094e776d89f181722eb049(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e862f37f8e4cc1d8a8dd3489ad68c0c7
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 144, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_699e501c67e0de4f5b94f68a92c957d9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 48, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_45e5082a5917834f9f259a5c652e7091(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_699e501c67e0de4f5b94f68a92c957d9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 48, 24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_11748bcd06aa916a890233ae2a7fab31(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3b41be388b02778cc6fc092e431c76cd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 52, 52], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_40cf79441525724912ffcc22f5a7f425(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_01049751ed48049a0488ad1b70ff9ea2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 44, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bb00e46e37c4dd5c0fe89be281c462d4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d8cdb3f50656936ccf07c09a2ab90949
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_41544e5ce8f8240d7e0b10063fe7817d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b188cd53c668949013d3284dd87c86ad
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1024, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_04f04cbb04f46646264d22c3e5c9d22e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a65f4df3c48d83787c3e7fe3e6b08c23
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 400, 13, 13], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_e31ede7383a64fb26d23d6a6aca336d4(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 56, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d4e17113ad90ddd6dba4c45e0b91baf8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e31ede7383a64fb26d23d6a6aca336d4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 56, 60, 60], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1fb9e91b8ca3b6a82103b15f793ea89f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_399c362aed59674c76adcf8d97566ebb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 25, 38], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a286cc5cc2af6613e9cef5c972935ff9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_523d174284e5387954986e5eae6e3155
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 152, 272], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_a5841185a2129141e047b2868d23eda9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 384, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2fe000e4dea32e9f2d490744523fbc2b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a5841185a2129141e047b2868d23eda9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 15, 15], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8cf1d4dc3ebefc7c0a12a943c30adf3f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0cbbd9c86270a237992ba7e113cf1ae7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 26, 26], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_668608b2d6863a4e84cc477d8cf9c5cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3b41be388b02778cc6fc092e431c76cd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 30, 30], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2aac9d180d965ef934b8c1fb798639ca(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e862f37f8e4cc1d8a8dd3489ad68c0c7
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 144, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_521a1bb2d7eac9e79c1eb1fb185bcc90(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bb9027a84c932890db2e76b95d257461
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 96, 30, 30], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_516b70e5d01368e113466ec3a0e9f9cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bb9027a84c932890db2e76b95d257461
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 96, 60, 60], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a42cbe3ce5e0cd0208c01be0e3abb6bb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bb9027a84c932890db2e76b95d257461
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 96, 120, 120], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2fdf4b4dd8c507e83ae559c3cae850ce(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bb9027a84c932890db2e76b95d257461
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 96, 240, 240], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_0d6e8f7470a1657134be04f6628a3c6c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 24, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d53c0cb6f4866bada33cf199dcaa24e0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0d6e8f7470a1657134be04f6628a3c6c
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 24, 30, 30], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b018ff648ecf0bf8b7916c9ca469a9e4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0d6e8f7470a1657134be04f6628a3c6c
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 24, 60, 60], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_48311ff49b5805e8c90952ccd612f11a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0d6e8f7470a1657134be04f6628a3c6c
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 24, 120, 120], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b79a1b03c5cb4410c5b3c19e994966bd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0d6e8f7470a1657134be04f6628a3c6c
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 24, 240, 240], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_01f09c03eac8440fa9e3988cfe50ae1c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b3661db2a9451fecf3732bd930b899
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 1152, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4ecec0a86168fa5cbc223c272966bef3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d8cdb3f50656936ccf07c09a2ab90949
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 20, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c3d83dc858139b3f1f6e7094a5ab56d8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e862f37f8e4cc1d8a8dd3489ad68c0c7
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 144, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4bd826adc1e3f7a956a02a50d8a00371(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b5789826b4964c12ec23763a4c1d3341
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 8, 8], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_83a8cee3834e797c255ccc8a6fd7c2d5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5add60d34c9c830cb035c879b396c7c8
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3b6599437914f31e759ac2684fba16a7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5add60d34c9c830cb035c879b396c7c8
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 40, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5f3f09dd64ffdbb5f914974875c8b57c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5add60d34c9c830cb035c879b396c7c8
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 20, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c533555003cec5f11b2a6b87c75cf78c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2e0c1cb518e321b172522013d363812b
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 768, 1, 49], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_e74f4da00f35d4f083a19df09cc1d60c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 200, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_271e51aff906d3b091136939370bcd18(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e74f4da00f35d4f083a19df09cc1d60c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 200, 26, 26], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0d968f724c8d79661c51c71a7d6730db(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_399c362aed59674c76adcf8d97566ebb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 17, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_32f7482807011369f3e0d0f13f518862(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_573a758f81ef2dd51845bd3df99390df
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 240, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_353c01046ab23b0dfc5a5fbe42cd6750(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5add60d34c9c830cb035c879b396c7c8
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 68, 68], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_03555a55f3204fc2bb56f6e94657aa49(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_699e501c67e0de4f5b94f68a92c957d9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 48, 16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_39fd069a783bdd3279c4c7d622d8e25f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_699e501c67e0de4f5b94f68a92c957d9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 48, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_43b3c19e087b1f1c2088c25d4d1b7ffe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_042692eeb63875641f63a4001f7d3370
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 672, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_caabfcec414c63f0818feb446239ff1f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [7, 7]
-        return paddle._C_ops.pool2d(input_0, input_1, [7, 7], [0, 0], False, True, 'NCHW', 'avg', False, False, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5f55309bdaf5e56ee077a253a9303989(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_caabfcec414c63f0818feb446239ff1f
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 704, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_759ba775adc5407c24c49778e340b7a9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_573a758f81ef2dd51845bd3df99390df
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 240, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_85e44124d458483ba0cf2a61fece946d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_66bc168ee4db2323a9c2324f652587c2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 100, 44, 44], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_c6599667280c8bbc4d3379a936d91df9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 288, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d3b3b87633d78a91529572656a92cc17(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6599667280c8bbc4d3379a936d91df9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 288, 10, 10], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_532733861688423a098ac0469ca87e3e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1248, 10, 10], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8467878b83b3db59dc64e36397eb42fb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 480, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0a3411aef70ade9c17b937a23719a4c9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 36, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b73c5ecc82797f68c256713d438c6bf0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f3ccf76cfd73f9a34431e5d34e36bbb9
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b73c5ecc82797f68c256713d438c6bf0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f3ccf76cfd73f9a34431e5d34e36bbb9
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e59e253595b1ef4caa678217b748769e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f3ccf76cfd73f9a34431e5d34e36bbb9
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e59e253595b1ef4caa678217b748769e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f3ccf76cfd73f9a34431e5d34e36bbb9
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9006b1050d93045958026884886fb766(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f3ccf76cfd73f9a34431e5d34e36bbb9
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9006b1050d93045958026884886fb766(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f3ccf76cfd73f9a34431e5d34e36bbb9
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_aafbc7dba6dffce89f3951eb5c4e127e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f3ccf76cfd73f9a34431e5d34e36bbb9
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_aafbc7dba6dffce89f3951eb5c4e127e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f3ccf76cfd73f9a34431e5d34e36bbb9
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4d91ab6a092d150df38e3157eef8c77b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b74c932e0f0ed323cbcab12d8400ddde
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 52, 52], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_198a655687d34fe4e1a6d3cb635c95cb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_573a758f81ef2dd51845bd3df99390df
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 240, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_243eb8b489009c1756645b71b0b2c6c6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_837f427b6e1d5666fb1bf2029838024c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_adb96cec0e5da49c4be666bf1c27cb4b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0f0195ecf97c5f2a1f388163641bafa7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0ae405b93adaec5fd008145b045466c4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a1b72f1f7523732b2b45b68b80352f2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_24e23b9ab6d48c7de7d5ef3304bb28a8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_837f427b6e1d5666fb1bf2029838024c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_473972347a7b4fd58589e364f60e8f72(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0f0195ecf97c5f2a1f388163641bafa7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_23acbce839184c79069a7117fe93281b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a1b72f1f7523732b2b45b68b80352f2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5e6b5668efac331c8d9e180ed2e4505c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 156, 40, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b7de561a79315cdd14cd08b228bad5dd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_df4c88953f6c412d419d04a1cf0b2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 24, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b96cd1268bd9c9b15fa206da4da0d689(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b33f66f705adbad9e0913839dfbcb5aa
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 48, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8a70c8496799bd197bb633924451fd8c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_15a91387b4bc87a4e70749322c891584
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3f9c666961fbc8ea5e943d5c24142f2a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3be4a0bf23ecbcd0ff1d20bd7eace03b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_28b7086233377f99127384e4b22d69e9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 20, 128, 256], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_90b50e283a17d07a7da91ef52c17ae54(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_28b7086233377f99127384e4b22d69e9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 20, 128, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_c45f896c2146c0f843f57e0f1c98ae48(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 40, 64, 128], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2b4acdb10ca7a092bd71f1f965326126(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c45f896c2146c0f843f57e0f1c98ae48
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 40, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_6a17f558591437191430bdf8122488c0(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 80, 32, 64], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b3a3e0dc0802a165626beb1547cf197d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a17f558591437191430bdf8122488c0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 32, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_abe3b02663db8a1b10a95f9f77f3a298(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 160, 16, 32], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_dcc789f29148f9d5f85ee2e364901dcf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_abe3b02663db8a1b10a95f9f77f3a298
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 16, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b60863e0fbcb9a5509f3488e490a38e4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e74f4da00f35d4f083a19df09cc1d60c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 200, 44, 44], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fcb399cda537408ec1732c02ea8981f4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_902da57739cd120333304c6ee9826809
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 320, 9, 9], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_59a3d33981d05e2d02d58e492fc99904(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bb9027a84c932890db2e76b95d257461
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 96, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_47b757df41592cef16bc9c600dfda152(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d8cdb3f50656936ccf07c09a2ab90949
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 34, 34], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e5606d0fd4005625267a1c0188e48a70(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_042692eeb63875641f63a4001f7d3370
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 672, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_046e4bea1ae7df1f96fdcf8b7c5a23f4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 872, 10, 10], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5721303bd5cf56ccf175b39b1eb8f7bb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bb9027a84c932890db2e76b95d257461
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 12, 12], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_79e97ed797cdecf60a1f4fe0f6125063(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 480, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c8efe99adfa4f594b169daff207ac22f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_eaeb5c6f4c345fa8eb372989ac93098e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 40, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1fb9e91b8ca3b6a82103b15f793ea89f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_399c362aed59674c76adcf8d97566ebb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 25, 38], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cbdfc8a11ac9b77b1b1aa449d8d490e7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 480, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_acf7b22a246318b10484ef90fab2f8ab(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 36, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e10431457653715b212550d883ddc0c6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d8cdb3f50656936ccf07c09a2ab90949
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 10, 10], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_08b238cf959a5d7506a096f1b6f29d7d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_837f427b6e1d5666fb1bf2029838024c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 288, 15, 15], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f3675ccc4a8c27176a692c47b518e3d8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0f0195ecf97c5f2a1f388163641bafa7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 288, 15, 15], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9eea81c23ca5f622a2b9d0bd2ef182b9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a1b72f1f7523732b2b45b68b80352f2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 288, 15, 15], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_911478924f7ef9c46fc78a0592f95642(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b74c932e0f0ed323cbcab12d8400ddde
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 68, 68], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_46ad86d56ae63057342e60a46fb51f9a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_65782b20e4839af8675d30e201a948c8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_042692eeb63875641f63a4001f7d3370
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 10, 10], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_988220451d366f4456a5a3b6fbe080fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_399c362aed59674c76adcf8d97566ebb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 24, 36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d689c01001edbdf63f6ff16ca33a024f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_042692eeb63875641f63a4001f7d3370
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 38, 38], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a27f20e0f580943b4eb4ad46bd736418(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 16, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_485f328fefd4c1800ec43250c98e6901(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5add60d34c9c830cb035c879b396c7c8
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5ba302ae6b086cf1fbc6e3bfa1b049c8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3d4d1bac99e9475366b72a8e2368ea46
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 20, 128, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_591419abdf9a01dbb33ed1590b496a86(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_eaeb5c6f4c345fa8eb372989ac93098e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 40, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_aa800c1a159cfec8e80c90b0e6a3a54d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3b41be388b02778cc6fc092e431c76cd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 32, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_59a3d33981d05e2d02d58e492fc99904(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bb9027a84c932890db2e76b95d257461
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 96, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_06349604a60042e2f27dffb026a2dbe1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0cbbd9c86270a237992ba7e113cf1ae7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 36, 36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e5606d0fd4005625267a1c0188e48a70(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_042692eeb63875641f63a4001f7d3370
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 672, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3ff3b33699094e776d89f181722eb049(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e862f37f8e4cc1d8a8dd3489ad68c0c7
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 144, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a06aecfa28995905c4a4fc8e1ef4213f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1348c0d30f8c69d74bae800ce6f783d5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 48, 48], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ed08ec0b58d05ce6d33aff0cbd9e6d40(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0c46fe3be0652a9e78261970f0727158
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_38985af9bbeb2478fec4d20e5f10774e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e862f37f8e4cc1d8a8dd3489ad68c0c7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 144, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6de8980a2d233723e4254648c68e2d5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6e1d4c42d68ed09391153b5d9256186d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 336, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ccf5a69b2b78182bd33eca56af587524(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a5841185a2129141e047b2868d23eda9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 12, 12], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6a33a8d503020e6f57ea92c295179c20(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e31ede7383a64fb26d23d6a6aca336d4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 56, 48, 48], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a0c70c4a5ab3cd77b976ca99d506470a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_399c362aed59674c76adcf8d97566ebb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 18, 27], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_dd7508b4abac99402f6156bb4ac60afe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_399c362aed59674c76adcf8d97566ebb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 22, 33], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c9f25af78360e0eff11d4ff46312f06c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_399c362aed59674c76adcf8d97566ebb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 21, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a7299b050b657747cd4eb18f47b29ed8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3b41be388b02778cc6fc092e431c76cd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 36, 36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4a503f727925d367a7c9a7a83a5c2e45(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_399c362aed59674c76adcf8d97566ebb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 25, 34], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_626b95ae3ac4d469f864e1a95b432ebc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_837f427b6e1d5666fb1bf2029838024c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 10, 10], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_12b8ee503acef6bc5532c387896d7d39(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0f0195ecf97c5f2a1f388163641bafa7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 10, 10], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e951259c690a0df71bb080f88e9ddcfa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a1b72f1f7523732b2b45b68b80352f2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 10, 10], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_415637fe3f5cd1283d01a085b0ebf019(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_837f427b6e1d5666fb1bf2029838024c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 17, 17], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_17e7f88a4d67cf6679a3584f8c944692(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0f0195ecf97c5f2a1f388163641bafa7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 17, 17], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_57c18ce9d758d16fb433e52db6f0422e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a1b72f1f7523732b2b45b68b80352f2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 17, 17], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b8d8576ca5c383a170a1859c265ce07d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d8cdb3f50656936ccf07c09a2ab90949
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 480, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_563739686e198cee9df957b4ba10262b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_902da57739cd120333304c6ee9826809
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 320, 15, 15], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0b32caa3a6e3305a49a90fdd6be4622e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5add60d34c9c830cb035c879b396c7c8
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 76, 76], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7601d5d98ddd4e471267a289dcca45b1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7ea7caa670d8e0133fe0af28d0b952b9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 960, 19, 19], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ec007102996f754e7cb89a00d492d8a6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0cbbd9c86270a237992ba7e113cf1ae7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 18, 18], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f7278cbefcb5b36775c054834a6d9b3c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e862f37f8e4cc1d8a8dd3489ad68c0c7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 144, 20, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9481fa22aad160b6ccb0bc24360f9f9d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bd618ea692130335110ae7249b074b15
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 96, 109, 109], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_24e22e4ac78e7255f7648a11d3faa1f8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f4d1e1cfe616a12626dd2053a039a2ed
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 256, 54, 54], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ce45ae475c53c6e73ef8cde5e81843ba(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b31c231c56d94809371bc2d84ec86c0c
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 512, 26, 26], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7d34f2759ec5109479fe9064910f874a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_13cddfcba6f939582f57902b38c71d4e
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1000, 12, 12], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3ce9041a4938573be66c93a8220ba066(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_837f427b6e1d5666fb1bf2029838024c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 19, 19], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2f3158139fbdb608550373219eef9824(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0f0195ecf97c5f2a1f388163641bafa7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 19, 19], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_55828add4806e5fdd854c33f2dca682a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a1b72f1f7523732b2b45b68b80352f2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 19, 19], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bd7775a2f109d6fba0c372fc91a413c6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e74f4da00f35d4f083a19df09cc1d60c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 200, 18, 18], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_20bdfe77a9c8ade71f142ff9094d3145(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a65f4df3c48d83787c3e7fe3e6b08c23
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 400, 9, 9], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3ed9f3c3e6d65271ecfbd3440071ba84(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5b5fa6b2386a437dd63ec8f0943351eb
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 32, 112, 112], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_10e642ebb8b458db3301218ba6de56f3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bb9027a84c932890db2e76b95d257461
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_07b87a1448d067d9b25cbb628edb496a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_66bc168ee4db2323a9c2324f652587c2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 100, 26, 26], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f17c36eed905cf19fe28308287c1d2aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bb9027a84c932890db2e76b95d257461
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 96, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_797a34fa0eb2969ecfdb4825820a354c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_699e501c67e0de4f5b94f68a92c957d9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 48, 48, 48], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_47354c7ea45089de8d5cb150dd07abca(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5b5fa6b2386a437dd63ec8f0943351eb
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 32, 112, 112], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_181e59967aae66c6799cc61dc68f0fdd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d8cdb3f50656936ccf07c09a2ab90949
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 22, 22], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6ceaa86cf96e88a3a5d484d6af630df6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0cbbd9c86270a237992ba7e113cf1ae7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 88, 88], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2c39d0a7e6fde95c92b1c5433aa10c9e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_902da57739cd120333304c6ee9826809
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 320, 13, 13], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fd98c28b1b0a32dcdb5323aa0ef8c093(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0c46fe3be0652a9e78261970f0727158
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 48, 48], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c5b8295d34b7c22de9e2fa3caca5c569(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_573a758f81ef2dd51845bd3df99390df
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 240, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_40da98d32f16c17416e4af3c0fcd8c7c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0cbbd9c86270a237992ba7e113cf1ae7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 52, 52], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3135f139a94c302e46e7886e1d8acede(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d8cdb3f50656936ccf07c09a2ab90949
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_198a655687d34fe4e1a6d3cb635c95cb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_573a758f81ef2dd51845bd3df99390df
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 240, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_67699a7a563d2c827feeb05bcffd4381(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 1280, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9e259c9fdf8c0bd7ed0863d472b97b4b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bb9027a84c932890db2e76b95d257461
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 23, 41], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1ee05ecd989a1ab1658f3eef84586389(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bb9027a84c932890db2e76b95d257461
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 46, 82], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c8115c29ee63eedb432e57b45a900073(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bb9027a84c932890db2e76b95d257461
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 92, 164], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f7cecd608739cbe6aab50d3bae16e197(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bb9027a84c932890db2e76b95d257461
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 184, 328], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7628dd23741f5e639b8b334aa95a98dc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0d6e8f7470a1657134be04f6628a3c6c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 24, 23, 41], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c66dbfcf46aa8b9dea159442f5cb00b9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0d6e8f7470a1657134be04f6628a3c6c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 24, 46, 82], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_97122b468e087e3baeb4ea423c26e1e6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0d6e8f7470a1657134be04f6628a3c6c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 24, 92, 164], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9e9dcd55de463d299daebd7d9aa722e8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0d6e8f7470a1657134be04f6628a3c6c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 24, 184, 328], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7516013aab08b9b808c605154e2244aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7ea7caa670d8e0133fe0af28d0b952b9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 960, 17, 17], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4ed8b7e8fde23efcd8b6b99537bce826(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6599667280c8bbc4d3379a936d91df9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 288, 16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8bd7108d09494fcef153ce2c9f185bd4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e862f37f8e4cc1d8a8dd3489ad68c0c7
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 144, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_109d3c3bb6363a90868fc55a93b262c8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bb9027a84c932890db2e76b95d257461
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 20, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_60dbaa22c83ac80ad8e9347acb10a1a1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_caabfcec414c63f0818feb446239ff1f
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 704, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_451208e687871dc4916b532320a11439(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_837f427b6e1d5666fb1bf2029838024c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 288, 13, 13], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e3301dead38ba684ad01a2c01d42a47d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0f0195ecf97c5f2a1f388163641bafa7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 288, 13, 13], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2d6e3a8723dd9c1d26296394d87b6984(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a1b72f1f7523732b2b45b68b80352f2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 288, 13, 13], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_82614441ffeeac6e5f6596515ec9772e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_837f427b6e1d5666fb1bf2029838024c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 13, 13], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a9adbbe02c8b183a478c8b5a88215d74(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0f0195ecf97c5f2a1f388163641bafa7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 13, 13], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2d36ed31e61be23f01079a9d26a81f73(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a1b72f1f7523732b2b45b68b80352f2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 13, 13], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_52bfc22547af10ceb2ee954c39197c99(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 624, 20, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cd13977a29317052c9f172430a31a270(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b3661db2a9451fecf3732bd930b899
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 1152, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_92433077f008c9a397dec71f206fbfae(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_042692eeb63875641f63a4001f7d3370
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bcdcd2beb58fbd78e7929fbd97cec0cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 576, 10, 10], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a7bf5e544bb02c2c74818aa4a27024c6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5393070d60a8526fc52ce646c6d08bb2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 92, 40, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d3d6145e3bfa50991fdfdb1b5d0839d8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 30, 30], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0cd2632f20c2c6645cb22a720e9a9583(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 2048, 10, 10], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4cc5abd07f298e6c1eb668f5d63e5250(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 960, 16, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2107d5e6f51726339a3c05bfe1b398d9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 672, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_573a290de18412d87ffbe68e47a333a7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 32, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e90258f17b4ea6d3fbf79b0b482bcc77(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1d439f30fd8e3553c965426446a0768b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 44, 44], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_de8342c485a8d34ab047c8a918a25fad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 336, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9319f8ee6a4471c98408029847be750d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_837f427b6e1d5666fb1bf2029838024c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 12, 12], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6dd1b39459bcc692e4d31cad1d6d3284(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0f0195ecf97c5f2a1f388163641bafa7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 12, 12], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5574d284afae5b65e82966c8d17aeb55(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a1b72f1f7523732b2b45b68b80352f2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 12, 12], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_662d1a6cc48aaf17e639f715822440df(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6347ce594b5572f75a8a8121fe5170b4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 20, 128, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_43a105203ec5e0c36ca55f027c0595ce(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 40, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a03c3110f285e5b96255f15c79cec3cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 960, 10, 10], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_52a7d2bcfb3f0a16fa89a76339a3a26f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3d355585e0151b1c84e47e945483cee0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 240, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c26c33f65b9f245a0e245e57f69ee7b7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 60, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3524481ee7bcd15b1674cd0b49771200(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 672, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6dffc6c9e3bca2f7deabd2284e7a95a7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 44, 44], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ff2f548d8265297e4b611420d26e7e15(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 960, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9bc5bd1027051f1df5d2dd4355525c7b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 240, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5f6a73c059311d629cb7dad19eddb25b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 1152, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_26f390c56d13176376f11c1f3deb7a7b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_837f427b6e1d5666fb1bf2029838024c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 23, 23], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1b3c9edbbfba6777a1d2f91804f87551(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0f0195ecf97c5f2a1f388163641bafa7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 23, 23], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3fc42d7fb85ce04f50e24f135316b90c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a1b72f1f7523732b2b45b68b80352f2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 23, 23], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_3cf0a47f33f62e93a7bedbcc787fc23a(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [2, 2], [0, 0], False, True, 'NCHW', 'max', False, False, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d5df865b12195d14ca878cb8746e1a79(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3cf0a47f33f62e93a7bedbcc787fc23a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 23, 35], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7208b78a95b820f3ddab18c7c6c7c20e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b00405c1f6a03e0fe934d29d835ce0b1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 336, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_12a2d541ea7f436ffa6915ff8606e647(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 2048, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d70854901c84a8ef12c6abdf136d19da(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 16, 80, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7e30f5b28beb07d7bb7cc2d3914f3abc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 336, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8df3ab1e65c1f4eeafe2dba27c7ed77e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 44, 48, 48], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9aa18e4282b21c6a1d074ddcc6e220db(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_be61e86978dfcbe7a57eb1fbb0d4c2f6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 960, 11, 11], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5283b98f7a274fa458456b3fe801cab1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1024, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b941ad7a5aef9c4973fd84ef3b70dcd4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_837f427b6e1d5666fb1bf2029838024c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 10, 10], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8adef344a6effab79801a9808549dc80(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0f0195ecf97c5f2a1f388163641bafa7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 10, 10], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_902e662b5876317e8b21de1ef0ed9eac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a1b72f1f7523732b2b45b68b80352f2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 10, 10], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b8efa0329fea8be3cd4ea5b47be10b16(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 13, 13], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d705975d2ae3cc001c936181e6090a7f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0db2bd273595cb1dc3f16e04e4469369(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cbf618f4e7c3969a717a70a1ff1e3fb0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3be4a0bf23ecbcd0ff1d20bd7eace03b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 160, 240], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_00e90d09dbffbc7308e73c9eb3d7ed81(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_15a91387b4bc87a4e70749322c891584
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 160, 240], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ad0fed210b76fbc766936512f2877992(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b33f66f705adbad9e0913839dfbcb5aa
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 160, 240], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4b735bdc9d5ad9bb962998ebcfd38a91(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_df4c88953f6c412d419d04a1cf0b2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 160, 240], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1f611e18c31794255accad70ab194b15(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 240, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_74d19b8476c0428dfec414fef0c6dcb0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_837f427b6e1d5666fb1bf2029838024c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1789ef6fe24201129d5b39fbae825fad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0f0195ecf97c5f2a1f388163641bafa7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_99c0fd455c1be764d1f55eb7cd30655b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a1b72f1f7523732b2b45b68b80352f2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_404de20ace43522e139a054f68286703(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 60, 60], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_653a7d8026110a308f8e0954129a99a0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_df4c88953f6c412d419d04a1cf0b2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 32, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_dd1fb69f23042d61f3c12dbbbe4af1cb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b33f66f705adbad9e0913839dfbcb5aa
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7bd265de8a312668abe9c241796c460b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_15a91387b4bc87a4e70749322c891584
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e3d01f865bd26e46bc7a8076541b581c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3be4a0bf23ecbcd0ff1d20bd7eace03b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d374fcff1e9d6885c74a588ebd482936(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_df4c88953f6c412d419d04a1cf0b2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 16, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4266db2fe8d5287761ef81c176adcb98(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b33f66f705adbad9e0913839dfbcb5aa
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 32, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_434023b43da8da69d412a2ba80fbcda9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_15a91387b4bc87a4e70749322c891584
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_50087cc069bc8faf4f06f1c661cb1d68(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3be4a0bf23ecbcd0ff1d20bd7eace03b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b8898e2c71b3de7996fcb6c7030a769c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 34, 34], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_013d44e337d2346850c0b05e288f5af2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 60, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2107d5e6f51726339a3c05bfe1b398d9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 672, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_25ac5cc4bcb0fe2b8f36a20729597255(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 30, 30], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bcbe3d6e56fd83d8d61eea5d9a852204(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 22, 22], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3ab941c265f4e5f7f65753bea4184c4f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f68d1e7a7510fd4ebad4474878767ce0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 320, 22, 22], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7f16a00b89752141544687c88cb94c35(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 872, 20, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_749b07cb04c36180c2818b9c073cb5c7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 100, 18, 18], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3d8d2797aec926716134dca112db35c0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 960, 16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d25b18c0c75450c5a871ad66d8096717(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 22, 22], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f41e742d93150613f7dc63c0616bb064(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_837f427b6e1d5666fb1bf2029838024c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 10, 10], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_231a66922fc3cfd249a9e7fd190c36d2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0f0195ecf97c5f2a1f388163641bafa7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 10, 10], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1ae847a1e557bb063cde709342803796(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a1b72f1f7523732b2b45b68b80352f2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 10, 10], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_42d66fd3f0f4bb39e0952f9ca55ecf81(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 12, 12], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_82034db03c56fe7ade1bc47f4d08f614(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 336, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2a090d3a0415957ca881f96f9722fbb7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 240, 44, 44], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4517d835539691ae773999bdc1f2b3e9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ad0aebb491ed4d1e31bf2f5dc2669b76(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 11, 11], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8aa72ab620a9437eac52e3e8529167a1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 768, 1, 49], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_920568a12472e931c4802a725842521e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 320, 12, 12], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_052533f4bb10029ae309ab1f7531ab2b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 38, 38], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_13b4de2410c0d1983ad5f461461dc341(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 19, 19], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e2c218f2eea20202037c8542ea9ceb4a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 36, 36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d07cee441b3a66118c65430aed7356f4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3cf0a47f33f62e93a7bedbcc787fc23a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 22, 22], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_139304a9ad82e043b3e58bb0222b235f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 240, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7eb90d7113b8df61ded934ace4a8d187(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 96, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_00753bebd320766564e7c6a1f3fbbb4a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 576, 16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e52addedd7189e40a88fc2c22a903717(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 480, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1b30e3ed0386b3e8dd822143421bbec7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_837f427b6e1d5666fb1bf2029838024c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 288, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_272ff445277b3df3a363b53b7dd512d0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0f0195ecf97c5f2a1f388163641bafa7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 288, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_598d4fb808d2a07af8f835705d06a7fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a1b72f1f7523732b2b45b68b80352f2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 288, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_813eb68e8d122ae554563eb3d93fcd7c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 320, 8, 8], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b8c6de424b2060d3fa37665073c87fe8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 17, 17], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_3b8bf64f2890cb022c8b0c9c017af544(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [3, 3]
-        return paddle._C_ops.pool2d(input_0, input_1, [2, 2], [0, 0], False, True, 'NCHW', 'max', False, False, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c27449e86a6d35384936db3d8b6762bd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3b8bf64f2890cb022c8b0c9c017af544
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 96, 109, 109], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b968067e8ab9bb32a6dee7db055de82a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3b8bf64f2890cb022c8b0c9c017af544
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 256, 54, 54], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2cf2802c6dfb0d41d8d475021fedf8a7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3b8bf64f2890cb022c8b0c9c017af544
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 512, 26, 26], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ff69e5199bf72126ebe5828dedcaff8f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 1000, 12, 12], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e4de1db043749f099d621eab9c26d880(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 240, 26, 26], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_39a9d4ff021ad1867b4caeaa47d22aec(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_29e991286ba06113f6a85e94c3d546ac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 336, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_16d87e433536c4dc012eadf2ab4fa44e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 8, 8], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e0e04b77cc5776bd20fd51c406e49b6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 88, 88], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c4cefc44f18521310e9fe707011c4868(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 30, 30], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8bc06a502d0df18cdb7e43ca1bd708d1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 144, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d36ff0fccb7b10239016410732f4bf53(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 2048, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_580c05872a31695a6cd8680e4615029d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 40, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_072f3a3b3d9569dd8062ccee85d88a4c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f3de6b2e811599fca3a5a1c162b437ea(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 36, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9bc5bd1027051f1df5d2dd4355525c7b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 240, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_675309f2d572634c3f427db5505f8eec(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 1280, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_794f8b621ebb31c6a7a6fe403dc6ecb1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3b8bf64f2890cb022c8b0c9c017af544
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 96, 109, 109], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6c3fd875aa4ff7eb06673a17a746bb2c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3b8bf64f2890cb022c8b0c9c017af544
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 256, 54, 54], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7b053e5ac18ee26a890b5a19033aa579(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3b8bf64f2890cb022c8b0c9c017af544
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 512, 26, 26], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_061e4d84d8bc26b68e0f1dbcb9680578(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1000, 12, 12], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_65a2ce85c32fc882c2c1c7ecaaee035c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_837f427b6e1d5666fb1bf2029838024c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 13, 13], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3768489e40246f836b8df544b0318124(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0f0195ecf97c5f2a1f388163641bafa7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 13, 13], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3582a3dab36af53a72df0be036bafcf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a1b72f1f7523732b2b45b68b80352f2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 13, 13], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c89c1ad6f098fc92718cfcb687beac4f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 144, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_fa20ffab383d44f77a4a9f901d20624a(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [7, 7]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8767060758ca86d7566cca9709b3d44e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fa20ffab383d44f77a4a9f901d20624a
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8767060758ca86d7566cca9709b3d44e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fa20ffab383d44f77a4a9f901d20624a
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6a7b8819cdd2159528aa358f993c3953(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fa20ffab383d44f77a4a9f901d20624a
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6a7b8819cdd2159528aa358f993c3953(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fa20ffab383d44f77a4a9f901d20624a
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b74ce07fd1d90f4c7d3cd8aeb86e10e2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fa20ffab383d44f77a4a9f901d20624a
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b74ce07fd1d90f4c7d3cd8aeb86e10e2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fa20ffab383d44f77a4a9f901d20624a
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_99ceb5b7f31636f739a8577a873e87d1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fa20ffab383d44f77a4a9f901d20624a
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_99ceb5b7f31636f739a8577a873e87d1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fa20ffab383d44f77a4a9f901d20624a
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d977e4407dba576d86fc85ce8d70c67e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 672, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_d9d7b5c4b5df084bda0c95eb09b8f8bd(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [28, 28]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_95d0741f6be457dbdb221daad98af6cc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d9d7b5c4b5df084bda0c95eb09b8f8bd
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_95d0741f6be457dbdb221daad98af6cc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d9d7b5c4b5df084bda0c95eb09b8f8bd
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_dad2024a2e0fcf0d800cb03f96998981(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d9d7b5c4b5df084bda0c95eb09b8f8bd
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_dad2024a2e0fcf0d800cb03f96998981(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d9d7b5c4b5df084bda0c95eb09b8f8bd
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_df13ca5601d7c12f149e8ffec747dfed(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d9d7b5c4b5df084bda0c95eb09b8f8bd
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_df13ca5601d7c12f149e8ffec747dfed(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d9d7b5c4b5df084bda0c95eb09b8f8bd
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2d1fa6b4529ab91887c30932b17390a5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d9d7b5c4b5df084bda0c95eb09b8f8bd
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2d1fa6b4529ab91887c30932b17390a5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d9d7b5c4b5df084bda0c95eb09b8f8bd
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6ec2ebb1eb882e11f6423662762180f9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 480, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_24d5837556391a272b1495de8b3e6378(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 60, 60], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e52addedd7189e40a88fc2c22a903717(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 480, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e19be0b23ee416870f68930eb2fb0995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 336, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_463f985c242b5e9c3d7f568a4db10f86(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 1152, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9a20b4ec6ac89640772b893cf756d0bc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 32, 112, 112], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_93776aacc468cb218f38e7bdebef77a4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 240, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4f426260296f54ae6843f129cec7be7c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 336, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cf87dd9fd2127f8196687a967ebaeb59(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 480, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_3d061bc692900fa451d1b8aa79508af0(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [14, 14]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2af6bab8d89496d278d1511ce2ac62c6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3d061bc692900fa451d1b8aa79508af0
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2af6bab8d89496d278d1511ce2ac62c6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3d061bc692900fa451d1b8aa79508af0
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fda41f7b8016920239f207cbd0ec8bed(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3d061bc692900fa451d1b8aa79508af0
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fda41f7b8016920239f207cbd0ec8bed(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3d061bc692900fa451d1b8aa79508af0
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a3605efdf3181da2925e9ad990243ba1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3d061bc692900fa451d1b8aa79508af0
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a3605efdf3181da2925e9ad990243ba1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3d061bc692900fa451d1b8aa79508af0
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9c65728c5e1a13cc2987c3f351cc97d0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3d061bc692900fa451d1b8aa79508af0
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9c65728c5e1a13cc2987c3f351cc97d0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3d061bc692900fa451d1b8aa79508af0
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_c0db235748b98c10d5090fde873bdb63(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [2, 2]
-        return paddle._C_ops.pool2d(input_0, input_1, [2, 2], [0, 0], True, True, 'NCHW', 'max', False, False, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_63078921c5711634434a45f554b488a6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c0db235748b98c10d5090fde873bdb63
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 300, 300], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3dff36fa6df8209687d1e364b9d6c3ad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c0db235748b98c10d5090fde873bdb63
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 150, 150], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b6e525819afa854fed85532818643c59(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c0db235748b98c10d5090fde873bdb63
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 75, 75], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9df9af4e98c4711657e53939be5ddc76(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c0db235748b98c10d5090fde873bdb63
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 38, 38], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_7fbf50fde68ae2221662e1d5ec5ae675(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        input_1 = [3, 3]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [1, 1], True, True, 'NCHW', 'max', False, False, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ac4f6512dd6cbb6fe0b68c0d54eeca06(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7fbf50fde68ae2221662e1d5ec5ae675
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 19, 19], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5516ef4b78062059e0e34e94977b00d6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1536, 8, 8], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6a658b49b076d6023c2498a33f408121(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_aacd617d5ee9a0aa0e82876691405d88(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 60, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a708ea20723f541e39301935155fa3f4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3be4a0bf23ecbcd0ff1d20bd7eace03b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 176, 264], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bec0a3ba38feb3116ceeb58cd4511c5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_15a91387b4bc87a4e70749322c891584
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 176, 264], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d966fd52e82fa28494722e014038e33e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b33f66f705adbad9e0913839dfbcb5aa
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 176, 264], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7d094457225710f1e00722c56aeaa7fa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_df4c88953f6c412d419d04a1cf0b2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 176, 264], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_61d49c6e0faabdcbfff3b451ce8858b7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 240, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6b30ec95788d1e461f8097d31b2846e4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1536, 8, 8], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a9a816d856de681f21e09ba48007fc5e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 76, 76], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4dae2a612309c60d9601535c5494654f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 240, 20, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c630a02a5043de7bdb6ad8f40f0ab40a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3cf0a47f33f62e93a7bedbcc787fc23a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 20, 30], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_43f59b8f98bdfa1724d7e8543ad9eb20(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bf6cf60e54fed01c6416fa73bcc15760
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 7, 7, 2048], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_70371ffa921a7fc5657b321f2b2501f2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_837f427b6e1d5666fb1bf2029838024c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 20, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1ba9f309fb617c8e0694a28dc782465e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0f0195ecf97c5f2a1f388163641bafa7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 20, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1cd0068603feac94ec39062cf5197799(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a1b72f1f7523732b2b45b68b80352f2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 20, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_885046cae5e928530fe6e198b6e6b1cc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 44, 44], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f6c670c58d0f6f439c1f4cd33116919a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_dd4c939a254e92abe0e605318e42b38d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_837f427b6e1d5666fb1bf2029838024c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2f2cb7d9026d6e6c4c30dbdccefa9fbc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0f0195ecf97c5f2a1f388163641bafa7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e6fade13ecb2cce91b3bb0ead316d407(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a1b72f1f7523732b2b45b68b80352f2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d977e4407dba576d86fc85ce8d70c67e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 672, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1a869bef2425391d1475f22d743852e5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 36, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_17d6cacc60250114b7b4ec48309bdb81(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8e291b8eda51d1d86313f1f1e6bac3ae(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bc2e61a9b7f0486bf55f48bd025b516a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 144, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_90674ee353acb676a2866d1ae061cb4f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 16, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fa84dcfe3c4ae5d1816080b973a3715f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_837f427b6e1d5666fb1bf2029838024c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 21, 21], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9a5fd884da2ecad8159d9b110ec8bede(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0f0195ecf97c5f2a1f388163641bafa7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 21, 21], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_07ecd3061510bd88fbf9ada62e9b8508(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a1b72f1f7523732b2b45b68b80352f2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 21, 21], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_29eeca32ad222f646133c2237e701dc6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3b8bf64f2890cb022c8b0c9c017af544
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 96, 109, 109], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_141d769be0a48299dee6d9875e0e2500(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3b8bf64f2890cb022c8b0c9c017af544
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 256, 54, 54], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9f6ede9b41f6e33afef731455480b834(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3b8bf64f2890cb022c8b0c9c017af544
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 512, 26, 26], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_10a7c8226877d9332211b25b3d2954db(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 1000, 12, 12], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_003c5783a48dfd4b4bbbe4416bbc5cfa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 240, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a576d42b0a8d869056e482842a7cc577(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 15, 15], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_eae294dca8109735d6803cdfbacab6eb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 60, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6154f10f35bf484841b7d5a3ca943f67(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3cf0a47f33f62e93a7bedbcc787fc23a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 15, 25], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f44b4f295d36b0303ac2592001ba5528(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 32, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3934c42296c01cba08a5ae5e06ad15d8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 400, 22, 22], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1f7746a5bafc62ae740bb981b084e127(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3cf0a47f33f62e93a7bedbcc787fc23a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 25, 38], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4a951416d97502c661d4893aa6a59430(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3cf0a47f33f62e93a7bedbcc787fc23a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 17, 26], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_950fbe1bf95a24664758ff24f1efd02c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 336, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_677a61337287444f83859a491df94451(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 240, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_dda6055352f94f758d0b9299dd21e89e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_837f427b6e1d5666fb1bf2029838024c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b638caee3d82297e6a35417d1c4ac514(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0f0195ecf97c5f2a1f388163641bafa7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_15d51c46590eeeb85ca2de05753497ed(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a1b72f1f7523732b2b45b68b80352f2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_080b813ba19d0b64354ec9156fb9d064(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 240, 18, 18], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4e72117406ff6b4f4b826ca8fbc3a90f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3be4a0bf23ecbcd0ff1d20bd7eace03b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 38, 68], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_057189ea07fdce5e0a5f98321ad4828a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_523d174284e5387954986e5eae6e3155
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 19, 34], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1c684de06c16c69e702ffeb728e5be05(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 9, 9], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ecb7209675062d5163567e8edf7621d9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 12, 12], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ee1e0812028d90fd0710e1d2e797cf67(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 20, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_475a8d334ab5fbce2e0904193acfe6d1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 88, 88], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a5953e954821de8935daad1fd4ddf9e3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 2048, 10, 10], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d2ce6f5088292abd55b75ef6c60f8382(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 2048, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e32b91f365dd66633da6c357e7561dc9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 320, 8, 8], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bffe5f859f8dea78c6a3cc7314f0b1e4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 336, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4df3735ac2732ab669f2fc00ac201909(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 32, 112, 112], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3251b9a737f141e4ed2cf8ec11cbf557(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 144, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_377fd7e96a04d07e7fb11486f63005f6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 48, 24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_615de841c7c767149846b0f038365b58(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 52, 52], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ffe2cfb1213dd405154b43a269f617e7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 44, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_dec7a171954b6e3a30f3ed16b0939844(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f3fb00fdceb744f11fb2f2c0e2b1b4ec(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1024, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e6abfb6efdebe0c67c5aca39b1131246(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 400, 13, 13], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3b4cde03ff6c9562f5bd2a618feb610f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 56, 60, 60], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1f7746a5bafc62ae740bb981b084e127(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3cf0a47f33f62e93a7bedbcc787fc23a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 25, 38], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a286cc5cc2af6613e9cef5c972935ff9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_523d174284e5387954986e5eae6e3155
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 152, 272], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e70e679165209c61417135dfe9cd392c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 15, 15], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f862e74474e41716cffbd9d1f1598a13(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 26, 26], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f2b448e3539900e477a720733bc50b81(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 30, 30], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8bc06a502d0df18cdb7e43ca1bd708d1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 144, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_66d805029ba7387b973168db83ed1fdc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 96, 30, 30], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_867d4cc598f8402ea4bda2f0aee21e9b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 96, 60, 60], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_52a18fb0649dab01e166a1adeb1b88b6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 96, 120, 120], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_051f52506242c90b2d44bc4a34320b1b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 96, 240, 240], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6a89c445cf12df4bc97d77005047737e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 24, 30, 30], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6ee9a9c9719a04a26fb922fc4004e5f1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 24, 60, 60], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9886832244ee46e510997e1f226137b3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 24, 120, 120], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0a24e92427a7ce9e55ff7eceb7a15ef3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 24, 240, 240], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_463f985c242b5e9c3d7f568a4db10f86(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 1152, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0bfd2bfb3cd60612e11fefcc57caeaeb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 20, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bc2e61a9b7f0486bf55f48bd025b516a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 144, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_218cbe31d3cfe30c83621427aba290b4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 8, 8], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bfd37b1e5ec6d1bd089b19c1a7d0d0cb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f7ea4125f7f44c9ce5ac61f08f4979c3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 40, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_42c897e7389355d705e807fc18347319(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 20, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5153031295ba7bf0ac49bc4950627ed4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 768, 1, 49], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e7789bd18bf812083edc5a6bafc59eb2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 200, 26, 26], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6346647ddbf08e63cbcf38a9c0425d60(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3cf0a47f33f62e93a7bedbcc787fc23a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 17, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_27606e2b77e171917246f707b334041f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 240, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7003ec0f1280307c21945fc846874acf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 68, 68], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_513afa4e025bd790141c14e64cfdb85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 48, 16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7fce45d7226506703fda7df1f9006ddf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 48, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3524481ee7bcd15b1674cd0b49771200(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 672, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5f55309bdaf5e56ee077a253a9303989(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_caabfcec414c63f0818feb446239ff1f
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 704, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3d355585e0151b1c84e47e945483cee0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 240, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f64d1e4741c7b70478a18e8349de6f82(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 100, 44, 44], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ed04160768689101d4dc3c7be63e4ad9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 288, 10, 10], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_532733861688423a098ac0469ca87e3e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1248, 10, 10], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8467878b83b3db59dc64e36397eb42fb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 480, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0a3411aef70ade9c17b937a23719a4c9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 36, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ee52c520078623751dc048b47d108223(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d9d7b5c4b5df084bda0c95eb09b8f8bd
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ee52c520078623751dc048b47d108223(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d9d7b5c4b5df084bda0c95eb09b8f8bd
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6faa78735f3426320a93b05024b24c1e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d9d7b5c4b5df084bda0c95eb09b8f8bd
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6faa78735f3426320a93b05024b24c1e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d9d7b5c4b5df084bda0c95eb09b8f8bd
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1465344943da137057327131fe9b8705(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d9d7b5c4b5df084bda0c95eb09b8f8bd
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1465344943da137057327131fe9b8705(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d9d7b5c4b5df084bda0c95eb09b8f8bd
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2473029fb04a4ab9c18647ef8f2c4237(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d9d7b5c4b5df084bda0c95eb09b8f8bd
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2473029fb04a4ab9c18647ef8f2c4237(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d9d7b5c4b5df084bda0c95eb09b8f8bd
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cdb7beca40436d598446b449f7b1d5fa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 52, 52], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1e56bd02c1e120c76300e31df9ece7bb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 240, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_243eb8b489009c1756645b71b0b2c6c6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_837f427b6e1d5666fb1bf2029838024c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_adb96cec0e5da49c4be666bf1c27cb4b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0f0195ecf97c5f2a1f388163641bafa7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0ae405b93adaec5fd008145b045466c4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a1b72f1f7523732b2b45b68b80352f2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_24e23b9ab6d48c7de7d5ef3304bb28a8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_837f427b6e1d5666fb1bf2029838024c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_473972347a7b4fd58589e364f60e8f72(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0f0195ecf97c5f2a1f388163641bafa7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_23acbce839184c79069a7117fe93281b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a1b72f1f7523732b2b45b68b80352f2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5e6b5668efac331c8d9e180ed2e4505c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 156, 40, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b7de561a79315cdd14cd08b228bad5dd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_df4c88953f6c412d419d04a1cf0b2b73
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 24, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b96cd1268bd9c9b15fa206da4da0d689(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b33f66f705adbad9e0913839dfbcb5aa
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 48, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8a70c8496799bd197bb633924451fd8c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_15a91387b4bc87a4e70749322c891584
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3f9c666961fbc8ea5e943d5c24142f2a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3be4a0bf23ecbcd0ff1d20bd7eace03b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6347ce594b5572f75a8a8121fe5170b4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 20, 128, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_43a105203ec5e0c36ca55f027c0595ce(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 40, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2e3c99b39eec800f4447b0705aa8f6d3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 32, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_247a9a75e931eef01c94e3701366c316(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 16, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b67e0433d5e26a5d42bd1267f8069c71(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 200, 44, 44], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e8b4bba8a2081a940e9a75d65296e8e0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 320, 9, 9], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7dcdf8af616d0b7899412eff59d51190(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 96, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_02ec88083559ae85d483f1e876b16134(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 34, 34], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_da825b404c32173836205be7d1abe03d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 672, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_046e4bea1ae7df1f96fdcf8b7c5a23f4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 872, 10, 10], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7e06c2129d6403db96cf99ca0c571cbc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 12, 12], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_79e97ed797cdecf60a1f4fe0f6125063(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 480, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fd34cc2fd09befea6d8b51d6a34b034d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 40, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1f7746a5bafc62ae740bb981b084e127(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3cf0a47f33f62e93a7bedbcc787fc23a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 25, 38], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cbdfc8a11ac9b77b1b1aa449d8d490e7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 480, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_acf7b22a246318b10484ef90fab2f8ab(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 36, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a62a8e53a33253047adced55f3b46eb2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 10, 10], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_08b238cf959a5d7506a096f1b6f29d7d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_837f427b6e1d5666fb1bf2029838024c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 288, 15, 15], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f3675ccc4a8c27176a692c47b518e3d8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0f0195ecf97c5f2a1f388163641bafa7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 288, 15, 15], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9eea81c23ca5f622a2b9d0bd2ef182b9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a1b72f1f7523732b2b45b68b80352f2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 288, 15, 15], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0b9eb4ce7f3fd6e0278ca3c6b56cde73(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 68, 68], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_46ad86d56ae63057342e60a46fb51f9a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_07353fa5dd86743cfa166cee1cba52f9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 10, 10], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8215b257eb4d8ef9de248c57bb94af02(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3cf0a47f33f62e93a7bedbcc787fc23a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 24, 36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_17aad9d006b3149f3351f213160081ea(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 38, 38], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a27f20e0f580943b4eb4ad46bd736418(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 16, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4bad0e4b1cb233d896ed089d4e1b2abd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6347ce594b5572f75a8a8121fe5170b4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 20, 128, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_43a105203ec5e0c36ca55f027c0595ce(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 40, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2e3c99b39eec800f4447b0705aa8f6d3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 32, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7dcdf8af616d0b7899412eff59d51190(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 96, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e60e135012e84c8a71f0fb4ee60ec395(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 36, 36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_da825b404c32173836205be7d1abe03d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 672, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3251b9a737f141e4ed2cf8ec11cbf557(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 144, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5cf55025de9b2a1edbab34223f98508e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 48, 48], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9ceea6d841f2d04ab7db4687aacad3c6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_adf34f2ed98aa6c67d7447af4aa13280(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 144, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0b11c45c3a0ae8179c69402e7c26807b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 336, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2e1628f6d362f6eedee6fb2faf18db73(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 12, 12], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_02d72e4304e1ba0745618831bbb13634(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 56, 48, 48], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6794578a0a3d4f0cbf9d2765aa78809e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3cf0a47f33f62e93a7bedbcc787fc23a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 18, 27], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fb0d90410a63576eb4c893ea0f496a78(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3cf0a47f33f62e93a7bedbcc787fc23a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 22, 33], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c1f1c633b3d1b83f31cafba7efb675b5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3cf0a47f33f62e93a7bedbcc787fc23a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 21, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_da14fa443a76569f0b228dfa395253d0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 36, 36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8fe29d1aaf5ea98edee730429f08aa21(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3cf0a47f33f62e93a7bedbcc787fc23a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 25, 34], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_626b95ae3ac4d469f864e1a95b432ebc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_837f427b6e1d5666fb1bf2029838024c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 10, 10], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_12b8ee503acef6bc5532c387896d7d39(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0f0195ecf97c5f2a1f388163641bafa7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 10, 10], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e951259c690a0df71bb080f88e9ddcfa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a1b72f1f7523732b2b45b68b80352f2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 10, 10], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_415637fe3f5cd1283d01a085b0ebf019(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_837f427b6e1d5666fb1bf2029838024c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 17, 17], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_17e7f88a4d67cf6679a3584f8c944692(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0f0195ecf97c5f2a1f388163641bafa7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 17, 17], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_57c18ce9d758d16fb433e52db6f0422e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a1b72f1f7523732b2b45b68b80352f2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 17, 17], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cf87dd9fd2127f8196687a967ebaeb59(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 480, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_50de308560c98feb02cee95e5a0ed941(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 320, 15, 15], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0eceb5861df3b2e6ece970c98ffacccd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 76, 76], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_97fe6c03a12eadc30df3d299f1dfaad3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 960, 19, 19], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5e09340cb70251a25986c7c0bc2aade1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 18, 18], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_58d2732650a578f6081b6572dfe200b4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 144, 20, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f1fc9404ced98b02eefcce301d26a6cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3b8bf64f2890cb022c8b0c9c017af544
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 96, 109, 109], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_37410797693a8be55e662881ae551f63(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3b8bf64f2890cb022c8b0c9c017af544
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 256, 54, 54], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c24996f752db991a6c87c38d8b13d1b6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3b8bf64f2890cb022c8b0c9c017af544
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 512, 26, 26], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6af19594af8de9ebb7bb051cedc1d408(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1000, 12, 12], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3ce9041a4938573be66c93a8220ba066(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_837f427b6e1d5666fb1bf2029838024c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 19, 19], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2f3158139fbdb608550373219eef9824(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0f0195ecf97c5f2a1f388163641bafa7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 19, 19], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_55828add4806e5fdd854c33f2dca682a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a1b72f1f7523732b2b45b68b80352f2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 19, 19], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_da5ed695f3dff17b1a7e3f89e6f6a0f0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 200, 18, 18], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9e765285abb32569aef438577006c968(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 400, 9, 9], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4df3735ac2732ab669f2fc00ac201909(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 32, 112, 112], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_78ff0d4b26c04c737f1c7b3ade49f64f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8b7cc34229a9da967aae0774c02f3382(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 100, 26, 26], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7eb90d7113b8df61ded934ace4a8d187(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 96, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_85fcc30a92ccb184003fe3b7e840fe5b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 48, 48, 48], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9a20b4ec6ac89640772b893cf756d0bc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 32, 112, 112], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bcbe3d6e56fd83d8d61eea5d9a852204(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 22, 22], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d51891ea48d2b03bee932a083d2d209b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 88, 88], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1281569617f8e8f92c106374331c3224(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 320, 13, 13], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_db9869226268c029478c0a1a786b431a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 48, 48], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_677a61337287444f83859a491df94451(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 240, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c59dee56818c000c8a2181bb8c59daca(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 52, 52], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_96393c9cdb0bcd19eabcdd92cd40e789(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1e56bd02c1e120c76300e31df9ece7bb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 240, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_67699a7a563d2c827feeb05bcffd4381(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 1280, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b855ea91acf8873e13df22ab07ce4847(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 23, 41], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_51223ebc3eb7b5a73763acbc38f09f85(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 46, 82], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5496ba91743307c98b3a85e174930951(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 92, 164], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_982a5034dac620b61ae799008c76feb7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 184, 328], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_71b78543bd86bdbc1937c22883e5413f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 24, 23, 41], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_530901db447b2c6281f9686ff975d281(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 24, 46, 82], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3ee49614b48fff2949a1ed343229594b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 24, 92, 164], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_455f54d654bf5a6fef63a8879276fdef(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 24, 184, 328], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f487193a7a99d957640697904238cac2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 960, 17, 17], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_364c36aedd589eb5cbd3f2fa515d9343(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 288, 16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c89c1ad6f098fc92718cfcb687beac4f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 144, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7212d956036d9c8e11b54ae5c67b9ea7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 20, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_60dbaa22c83ac80ad8e9347acb10a1a1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_caabfcec414c63f0818feb446239ff1f
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 704, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_451208e687871dc4916b532320a11439(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_837f427b6e1d5666fb1bf2029838024c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 288, 13, 13], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e3301dead38ba684ad01a2c01d42a47d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0f0195ecf97c5f2a1f388163641bafa7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 288, 13, 13], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2d6e3a8723dd9c1d26296394d87b6984(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a1b72f1f7523732b2b45b68b80352f2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 288, 13, 13], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_82614441ffeeac6e5f6596515ec9772e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_837f427b6e1d5666fb1bf2029838024c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 13, 13], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a9adbbe02c8b183a478c8b5a88215d74(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0f0195ecf97c5f2a1f388163641bafa7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 13, 13], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2d36ed31e61be23f01079a9d26a81f73(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a1b72f1f7523732b2b45b68b80352f2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 13, 13], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_52bfc22547af10ceb2ee954c39197c99(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 624, 20, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5f6a73c059311d629cb7dad19eddb25b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 1152, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_75b402c4f745dec6bb98fc14061cda3d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f640d9c72133910427f43a744e878ec2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+if __name__ == "__main__":
+    sys.exit(table.main(__file__))
@@ -1,4529 +1,28 @@
 import os
-os.environ['FLAGS_cinn_new_group_scheduler'] = '1'
-os.environ['FLAGS_group_schedule_tiling_first'] = '1'
-os.environ['FLAGS_enable_pir_api'] = '1'
-os.environ['FLAGS_cinn_bucket_compile'] = '1'
 import sys
-import unittest
-import numpy as np
-from dataclasses import dataclass
-import typing as t
 
-@dataclass
-class Stage:
-    name: str
-    env_vars: t.Dict[str, str]
+import pytest
 
-cinn_stages = [
-    Stage(
-        name="dynamic_to_static",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=False,
-            FLAGS_prim_all=False,
-            FLAGS_prim_enable_dynamic=False,
-        ),
-    ),
-    Stage(
-        name="prim",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=False,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-        ),
-    ),
-    Stage(
-        name="infer_symbolic",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=False,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-            FLAGS_use_cinn=False,
-            FLAGS_check_infer_symbolic=True,
-        ),
-    ),
-	Stage(
-        name="frontend",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=True,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-            FLAGS_use_cinn=True,
-            FLAGS_check_infer_symbolic=False,
-            FLAGS_enable_fusion_fallback=True,
-        ), 
-    ),
-    Stage(
-        name="backend",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=True,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-            FLAGS_use_cinn=True,
-            FLAGS_check_infer_symbolic=False,
-            FLAGS_enable_fusion_fallback=False,
-        ), 
-    ),
-]
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir, os.pardir))
+from tools.e2e_case_stage import CinnStages  # noqa: E402
 
-def GetCinnStageByName(name):
-    for stage in cinn_stages:
-        if stage.name == name:
-            return stage
-    return None
+stages = CinnStages(__file__)
 
-def GetCurrentCinnStage():
-    name = os.getenv('PADDLE_DEBUG_CINN_STAGE_NAME')
-    if name is None:
-        return None
-    stage_names = [stage.name for stage in cinn_stages]
-    assert name in stage_names, (
-        f"PADDLE_DEBUG_CINN_STAGE_NAME should be in {stage_names}"
-    )
-    return GetCinnStageByName(name)
+from tools.e2e_case_table import E2ECaseTable, CinnTestBase  # noqa: E402
 
-def GetPrevCinnStage(stage):
-    for i in range(1, len(cinn_stages)):
-        if stage is cinn_stages[i]:
-            return cinn_stages[i - 1]
-    return None
+stages.apply()
+table = E2ECaseTable(__file__)
+last_stage_failed = stages.last_stage_failed()
 
-def IsCinnStageEnableDiff():
-    value = os.getenv('PADDLE_DEBUG_CINN_STAGE_ENABLE_DIFF')
-    enabled = value in {
-        '1',
-        'true',
-        'True',
-    }
-    if enabled:
-        assert GetCurrentCinnStage() is not None
-    return enabled
 
-last_cinn_stage_exit_code = None
-def LastCINNStageFailed():
-    global last_cinn_stage_exit_code
-    if last_cinn_stage_exit_code is not None:
-        return last_cinn_stage_exit_code != 0
-    last_stage = GetPrevCinnStage(GetCurrentCinnStage())
-    if last_stage is None:
-        return False
-    env_vars = dict(
-        PADDLE_DEBUG_CINN_STAGE_NAME=last_stage.name,
-        PADDLE_DEBUG_CINN_STAGE_ENABLE_DIFF='0',
-    )
-    env_vars_str = " ".join(
-        f"{env_var}={value}"
-        for env_var, value in env_vars.items()
-    )
-    last_cinn_stage_exit_code = os.system(
-        f"{env_vars_str} {sys.executable} {__file__} > /dev/null 2>&1"
-    )
-    return last_cinn_stage_exit_code != 0
+def pytest_generate_tests(metafunc):
+    table.parametrize(metafunc)
 
-def SetDefaultEnv(**env_var2value):
-    for env_var, value in env_var2value.items():
-        if os.getenv(env_var) is None:
-            os.environ[env_var] = str(value)
 
-SetDefaultEnv(
-    PADDLE_DEBUG_CINN_STAGE_NAME="backend",
-    PADDLE_DEBUG_CINN_STAGE_ENABLE_DIFF=False,
-    PADDLE_DEBUG_ENABLE_CINN=True,
-    FLAGS_enable_pir_api=True,
-    FLAGS_prim_all=True,
-    FLAGS_prim_enable_dynamic=True,
-    FLAGS_use_cinn=False,
-    FLAGS_check_infer_symbolic=False,
-    FLAGS_enable_fusion_fallback=False,
-)
+@pytest.mark.skipif(last_stage_failed, reason="last stage failed")
+class TestPrimitiveOp(CinnTestBase):
+    table = table
 
-import paddle
 
-def SetEnvVar(env_var2value):
-    for env_var, value in env_var2value.items():
-        os.environ[env_var] = str(value)
-    paddle.set_flags({
-        env_var:value
-        for env_var, value in env_var2value.items()
-        if env_var.startswith('FLAGS_')
-    })
-
-if GetCurrentCinnStage() is not None:
-    SetEnvVar(GetCurrentCinnStage().env_vars)
-
-def GetEnvVarEnableJit():
-    enable_jit = os.getenv('PADDLE_DEBUG_ENABLE_JIT')
-    return enable_jit not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
-
-def GetEnvVarEnableCinn():
-    enable_cinn = os.getenv('PADDLE_DEBUG_ENABLE_CINN')
-    if enable_cinn is None:
-        return True
-    return enable_cinn not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
-
-
-def GetTolerance(dtype):
-    if dtype == np.float16:
-        return GetFloat16Tolerance()
-    if dtype == np.float32:
-        return GetFloat32Tolerance()
-    return 1e-6
-
-def GetFloat16Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT16_TOL'))
-    except:
-        return 1e-3
-
-def GetFloat32Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT32_TOL'))
-    except:
-        return 1e-6
-
-def IsInteger(dtype):
-    return np.dtype(dtype).char in np.typecodes['AllInteger']
-
-def ApplyToStatic(net, use_cinn):
-    build_strategy = paddle.static.BuildStrategy()
-    build_strategy.build_cinn_pass = use_cinn
-    return paddle.jit.to_static(
-        net,
-        input_spec=net.get_input_spec(),
-        build_strategy=build_strategy,
-        full_graph=True,
-    )
-
-class InstanceTrait:
-
-    @classmethod
-    def instance(cls):
-        if cls.instance_ is None:
-            cls.instance_ = cls()
-        return cls.instance_
-
-    @classmethod
-    def static_instance_with_cinn(cls):
-        if cls.static_instance_with_cinn_ is None:
-            cls.static_instance_with_cinn_ = ApplyToStatic(
-                cls.instance(),
-                use_cinn=True
-            )
-        return cls.static_instance_with_cinn_
-
-    @classmethod
-    def static_instance_without_cinn(cls):
-        if cls.static_instance_without_cinn_ is None:
-            cls.static_instance_without_cinn_ = ApplyToStatic(
-                cls.instance(),
-                use_cinn=False
-            )
-        return cls.static_instance_without_cinn_
-
-
-class CinnTestBase:
-
-    def setUp(self):
-        paddle.seed(2024)
-        self.prepare_data()
-
-    def test_train(self):
-        dy_outs = self.train(use_cinn=False)
-        cinn_outs = self.train(use_cinn=GetEnvVarEnableCinn())
-
-        for cinn_out, dy_out in zip(cinn_outs, dy_outs):
-          if type(cinn_out) is list and type(dy_out) is list:
-            for x, y in zip(cinn_out, dy_out):
-              self.assert_all_close(x, y)
-          else:
-            self.assert_all_close(cinn_out, dy_out)
-
-    def train(self, use_cinn):
-        if GetEnvVarEnableJit():
-            net = self.prepare_static_net(use_cinn)
-        else:
-            net = self.prepare_net()
-        paddle.seed(2024)
-        out = net(*self.inputs)
-        return out
-    
-    def prepare_data(self):
-        self.inputs = self.get_inputs()
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def prepare_net(self):
-        return self.get_test_class().instance()
-
-    def prepare_static_net(self, use_cinn):
-        if use_cinn:
-            return self.get_test_class().static_instance_with_cinn()
-        else:
-            return self.get_test_class().static_instance_without_cinn()
-
-    def assert_all_close(self, x, y):
-        if (hasattr(x, "numpy") and hasattr(y, "numpy")):
-            x_numpy = x.numpy()
-            y_numpy = y.numpy()
-            assert x_numpy.dtype == y_numpy.dtype
-            if IsInteger(x_numpy.dtype):
-                np.testing.assert_equal(x_numpy, y_numpy)
-            else:
-                tol = GetTolerance(x_numpy.dtype)
-                np.testing.assert_allclose(x_numpy, y_numpy, atol=tol, rtol=tol)
-        else:
-            assert x == y
-
-
-
-
-
-last_stage_failed = (IsCinnStageEnableDiff() and LastCINNStageFailed())
-class PrimitiveOp_344dfe784facfefd8bab61485836297c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.shape(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 24, 36], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7045bef12d9e64c6849083677448bc0f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_344dfe784facfefd8bab61485836297c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 24, 36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_275b79f7d46792bd32855f80988e7bd0(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.shape(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d96b534d1eeeae7b1e44643cf33fb46c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 192, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8532b63151583f08282e1b2cf7d1dd15(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 112, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_e925132faea11cd57fd6a4daf3276729(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.shape(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 128, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c5ef8f607da9fb3c535f8a2e2ab78c03(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e925132faea11cd57fd6a4daf3276729
-    def get_inputs(self):
-        return [
-            paddle.uniform([16, 128, 16, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_f14f80001825490a9f6877f85f4acd2c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.shape(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f444c5f14649d7773a9caf220ce0f4f0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14f80001825490a9f6877f85f4acd2c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3549, 76], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b08138a7ffbc236c8fa562c08aa08ca8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 576, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_66907461135236c733a416528543d0b8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 288, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5df469967de3c36d24b776ec11e70e78(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 144, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0977b548480b53c6319d10c8448dd8ea(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 40, 128, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ebfad196585dfaa53c89528cedc3dc15(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_bae73b21de2ba6ddf9df5b9429bdb666(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.shape(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 384], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b6f6e0be2555d4c9aa6d2a3cd46c1c7f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bae73b21de2ba6ddf9df5b9429bdb666
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_c3357f75045645daa24df23888be9d95(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.shape(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 320, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_dfc2cd1aa37ee415ece0a6c576cf99bb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3357f75045645daa24df23888be9d95
-    def get_inputs(self):
-        return [
-            paddle.uniform([128, 320, 8, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_cb1dbc2e4020b981b28136110f45abf0(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.shape(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 768], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f2ab190e2520a2b83cf84ed7a0ac8ab7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cb1dbc2e4020b981b28136110f45abf0
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 49, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_40740a558c51ae250ebd086d110ba331(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.shape(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 7, 7, 768], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_93f8471799ee927c63bf25ff18c8c470(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_40740a558c51ae250ebd086d110ba331
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 7, 7, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_572f83f14ce7b96d4a8275fdcb544023(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 32, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_204756436c36ec24e1f96f5def497e8c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 512, 1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_92ceadb96409aef03668c8c9a12ed4a8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 80, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f304c2fd14cbbdec380e52d62ef3fad2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14f80001825490a9f6877f85f4acd2c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 7581, 68], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d5227777ee88f6641e062483397f8ae0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([528, 4, 96, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_21aacbda2d7d95312668502cbe768d97(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.shape(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 25, 38], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2434534548e2485ec447ab0604a2a614(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21aacbda2d7d95312668502cbe768d97
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 25, 38], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e8b84af5b24597b4555f061a5455f2e8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14f80001825490a9f6877f85f4acd2c
-    def get_inputs(self):
-        return [
-            paddle.uniform([12, 288, 192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8eafb1f3889731350e267a762d6f8c46(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3357f75045645daa24df23888be9d95
-    def get_inputs(self):
-        return [
-            paddle.uniform([8, 320, 8, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9af3eff8ff9d60c875de77471421111a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14f80001825490a9f6877f85f4acd2c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4725, 68], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_ad950060aa50b54d678099416abba372(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.shape(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 160, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ea045cdd598f717ea951d6c2f42ecf55(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ad950060aa50b54d678099416abba372
-    def get_inputs(self):
-        return [
-            paddle.uniform([8, 160, 8, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_715341df772d6cb74e90824b47ea36e8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cb1dbc2e4020b981b28136110f45abf0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 577, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7b77f66376b5ef54323d741e7640791d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bae73b21de2ba6ddf9df5b9429bdb666
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 196, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_040319a75e8322c3a81cd9a61fb93281(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.shape(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 14, 14, 384], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_613b523fa35fad65fafdfe002a33b5ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_040319a75e8322c3a81cd9a61fb93281
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 14, 14, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_8c0f97976295d5c891b5701bdbb11fc3(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.shape(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 64, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_966fa1ebc4613cbc29d72c1f01d6ea28(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8c0f97976295d5c891b5701bdbb11fc3
-    def get_inputs(self):
-        return [
-            paddle.uniform([64, 64, 32, 8], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fc4e45b6ced629d29e08eaa3ad2312bd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([384, 2, 96, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_0703174892ecfafcbb6aa232a979bcb0(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.shape(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 192], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e9e30c1fb0435fb76a00ea65187fd970(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0703174892ecfafcbb6aa232a979bcb0
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 784, 192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_31494cd4feda2f7bc5edb423d50c6a40(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.shape(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 28, 28, 192], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f970e1b413abace93f9cc21b0b00a51c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_31494cd4feda2f7bc5edb423d50c6a40
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 28, 28, 192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_427f4f00702dc77d37dd346a50c3b4f8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e925132faea11cd57fd6a4daf3276729
-    def get_inputs(self):
-        return [
-            paddle.uniform([16, 128, 16, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b08e628d3d6da8e2b31b1c0ff51bfa88(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14f80001825490a9f6877f85f4acd2c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8400, 68], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_267671b8aca99e019874667bad021ede(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 112, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_5433542565817efeb453604ad48be97e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.shape(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 20, 30], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_610848f297eda3caa2c855b6209e9965(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5433542565817efeb453604ad48be97e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 20, 30], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6ac6c27f9ae48ecabe095742fc638723(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 40, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_d4309df202d55374feda6165c792d440(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.shape(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 96], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_45b3d83c3da5da36aaed23776a2266bb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d4309df202d55374feda6165c792d440
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 3136, 96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_a0057a9354a95afd3b68ee5c6a53792b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.shape(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 56, 56, 96], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_612611ce634930afe24bb1187d6921f6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a0057a9354a95afd3b68ee5c6a53792b
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 56, 56, 96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2af3a0a22578b1f58717cf9e6b8f4916(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 24, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2be7bb79126319c575fb9447f17d3d87(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ad950060aa50b54d678099416abba372
-    def get_inputs(self):
-        return [
-            paddle.uniform([8, 160, 16, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f4f903aa815d98c22a764ffa1de416ae(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 32, 128, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_204756436c36ec24e1f96f5def497e8c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 512, 1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8e120d6ac4fee11cdb205d684a81510a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14f80001825490a9f6877f85f4acd2c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3549, 68], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_6a5c098eab01c8aeedd419309cf559ac(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.shape(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 768, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_65b76260f4b051a74bc2312bb189a447(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a5c098eab01c8aeedd419309cf559ac
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 768, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_55cea875373ffa6ad7cb37cd7df7256c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cb1dbc2e4020b981b28136110f45abf0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1025, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_29f773b2175aebf0f7591f4cb773041d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 128, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_b2fc09458a3c14f5b463ef62698beb95(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.shape(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 512, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a7f18585e2f0c5721a199c0435a62967(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b2fc09458a3c14f5b463ef62698beb95
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_dc429d04d225fad4f1ea7382016fe27d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 192, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6ca347dc32f7e1e767278f4df7d4036(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([20, 8, 288, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_63586c6981f486dacef145be91608a94(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.shape(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 192, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0586e8f67f47c7d26011b2e0f2c3a645(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_63586c6981f486dacef145be91608a94
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f42149fa93e3be2a6343193a49b7e016(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cb1dbc2e4020b981b28136110f45abf0
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 49, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f04b5d9533968ca1cfe558bb1f52145a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_40740a558c51ae250ebd086d110ba331
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 7, 7, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_31a8fa31bac01dcb5f9c818322be1269(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.shape(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 3, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cf0de81c02ecd8a5cbee134a40df5ee5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_31a8fa31bac01dcb5f9c818322be1269
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 1024, 1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_011aa477e7fed06c7db012c23bb493b9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.shape(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 32, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_02fe9e6b53c64aa961e9531bb4c48959(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_011aa477e7fed06c7db012c23bb493b9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 32, 256, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2ae8d65165ff0308fc6637b6bbc02c0f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([576, 2, 96, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d6eaf509f017664edc821c18d90828ed(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 32, 144, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f9cb1b8f975933b2e62c0adb20365947(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([96, 4, 96, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c0f54c0b14b31d1fe67dcd19eeeeb22e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([12, 8, 288, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_09507a95215f35decec00a796a79fc78(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.shape(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 256], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a8cb5556363a57fd5879b8b9d8ec992a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_09507a95215f35decec00a796a79fc78
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_29f773b2175aebf0f7591f4cb773041d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 128, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0e70af4eaefe4f3eb61a73b221facac7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([6, 32, 144, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8bf6cfa257bff067c1f033d0c9d43770(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([960, 2, 96, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_9ad979178b71207233a3600e92b7f890(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.shape(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 256, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_94bda87df90296175bd2e8755646847b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9ad979178b71207233a3600e92b7f890
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e45d6f76b377456ee12e8286fe3e0052(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9ad979178b71207233a3600e92b7f890
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 256, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_be5cee4f999825e4139b061eebd06e33(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([2112, 2, 96, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_830576b0eda5c4011a477793041487db(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 28, 50], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_226934c6603052f8f7022ccb07bcaa9a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14f80001825490a9f6877f85f4acd2c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4116, 68], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b5d0be78a38c1625e37fef5ab05e5a92(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b5d0be78a38c1625e37fef5ab05e5a92(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_204756436c36ec24e1f96f5def497e8c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 512, 1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_45b3d83c3da5da36aaed23776a2266bb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d4309df202d55374feda6165c792d440
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 3136, 96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_612611ce634930afe24bb1187d6921f6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a0057a9354a95afd3b68ee5c6a53792b
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 56, 56, 96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_832f873839c836653c3a0c1731abb625(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 960, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3023420e64e34af5fdd5dc1df2c67253(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3d195433c07d779687a06c274c66efde(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 240, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1f6adb1167a8d3024fa46e625591985b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14f80001825490a9f6877f85f4acd2c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 6069, 68], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_31372cd01675274c30db82230f97b75e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0703174892ecfafcbb6aa232a979bcb0
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 784, 192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8c299c03d36df83d8ae7eaa70cf0e7e5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_31494cd4feda2f7bc5edb423d50c6a40
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 28, 28, 192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_21a539e2f5342de661d5de3bc8d71b7c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bae73b21de2ba6ddf9df5b9429bdb666
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1025, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0fc5151425022be242df0114aa93324d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b2fc09458a3c14f5b463ef62698beb95
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b9cb7876b38031ee724f6e6a9d6157f8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 24, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7b77f66376b5ef54323d741e7640791d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bae73b21de2ba6ddf9df5b9429bdb666
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 196, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_613b523fa35fad65fafdfe002a33b5ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_040319a75e8322c3a81cd9a61fb93281
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 14, 14, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d78e0e6303c8c94acf9a4f3b79ca9bb4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_09507a95215f35decec00a796a79fc78
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e21d69db800ad68163e3c94e82f49c04(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8c0f97976295d5c891b5701bdbb11fc3
-    def get_inputs(self):
-        return [
-            paddle.uniform([16, 64, 16, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3db5c230ed1bf403943a979c91e16b87(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 464, 16, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f4f903aa815d98c22a764ffa1de416ae(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 32, 128, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0a9f2468c8ef504e35cad94c45eee6cc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_31a8fa31bac01dcb5f9c818322be1269
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 512, 1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8cfcc9bdcab49cba2a2e1dfe09333ce5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_011aa477e7fed06c7db012c23bb493b9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 32, 128, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9cc8decaf4dbf9256e8bdaea492089bc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9ad979178b71207233a3600e92b7f890
-    def get_inputs(self):
-        return [
-            paddle.uniform([8, 256, 8, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_099847a3c53b68f6744cab5f1926a0ed(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bae73b21de2ba6ddf9df5b9429bdb666
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 196, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_72bd57b3b6506bd68b8bd88765c3625b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_040319a75e8322c3a81cd9a61fb93281
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 14, 14, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0281a1d4988664f25e1e508a7fbc347b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([8, 8, 288, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fe4fdc26df16fbf25990073401a9292b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 144, 14, 25], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_848a1bab68adffdb9f9445697f49dd02(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d4309df202d55374feda6165c792d440
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 3136, 96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d8125ac4f06a8b071bc91f2c47c247af(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a0057a9354a95afd3b68ee5c6a53792b
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 56, 56, 96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_87c0370b804cc6839e12e23e934dc1fd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14f80001825490a9f6877f85f4acd2c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9261, 68], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b80230b989b5937674202f7271eb256a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([240, 4, 96, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_236e7972eb76cf318c8db29613e8336a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([4, 32, 144, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a7f18585e2f0c5721a199c0435a62967(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b2fc09458a3c14f5b463ef62698beb95
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a7f18585e2f0c5721a199c0435a62967(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b2fc09458a3c14f5b463ef62698beb95
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a7f18585e2f0c5721a199c0435a62967(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b2fc09458a3c14f5b463ef62698beb95
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_4331bfa8a18618b8fbfe73e1449d231a(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.shape(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 2048, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_46620ce7864b358aa47437e366c7d01d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4331bfa8a18618b8fbfe73e1449d231a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2048, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_31372cd01675274c30db82230f97b75e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0703174892ecfafcbb6aa232a979bcb0
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 784, 192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8c299c03d36df83d8ae7eaa70cf0e7e5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_31494cd4feda2f7bc5edb423d50c6a40
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 28, 28, 192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_503a3643381ffb2046d33b19a4a582ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bfb52e5bff64747d100a7587005c97c6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_943d6a80add1d3237e76d11f070127b3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_763d510513d5e4fa07d5c993018c8c63(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6b5aa0c5963d7c3907314fdc3a5720ad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 8, 8], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0cb0d8f3bfcedf908e665eb9b0350f1e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14f80001825490a9f6877f85f4acd2c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2100, 68], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a7f18585e2f0c5721a199c0435a62967(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b2fc09458a3c14f5b463ef62698beb95
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0fc5151425022be242df0114aa93324d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b2fc09458a3c14f5b463ef62698beb95
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0fc5151425022be242df0114aa93324d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b2fc09458a3c14f5b463ef62698beb95
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0fc5151425022be242df0114aa93324d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b2fc09458a3c14f5b463ef62698beb95
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ae92b7d43d35675164bd5d9e35fa030f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4331bfa8a18618b8fbfe73e1449d231a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2048, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_099847a3c53b68f6744cab5f1926a0ed(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bae73b21de2ba6ddf9df5b9429bdb666
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 196, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_72bd57b3b6506bd68b8bd88765c3625b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_040319a75e8322c3a81cd9a61fb93281
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 14, 14, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_fe0294ecb3c5cfa8f86bc4f7ca2a59fb(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.shape(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 15, 25], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7ece9a7c57a640fe783d35e5002b316c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fe0294ecb3c5cfa8f86bc4f7ca2a59fb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 15, 25], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7b77f66376b5ef54323d741e7640791d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bae73b21de2ba6ddf9df5b9429bdb666
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 196, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_613b523fa35fad65fafdfe002a33b5ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_040319a75e8322c3a81cd9a61fb93281
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 14, 14, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_55cea875373ffa6ad7cb37cd7df7256c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cb1dbc2e4020b981b28136110f45abf0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1025, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9e7c1c8799bd33747f148a602137a363(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([44, 8, 288, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d5ed7e2d6e9cb572a0d358cfc05097e0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 80, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_848a1bab68adffdb9f9445697f49dd02(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d4309df202d55374feda6165c792d440
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 3136, 96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d8125ac4f06a8b071bc91f2c47c247af(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a0057a9354a95afd3b68ee5c6a53792b
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 56, 56, 96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_350970d07e59fa9ff96fa9c61a1b3584(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_6d33896ce0bbf6c32bfe3a1329ac6739(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.shape(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 512], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fcde855a2a11fba921ccf514949b7da0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6d33896ce0bbf6c32bfe3a1329ac6739
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3819a7561482b93341184ee52ef56d80(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14f80001825490a9f6877f85f4acd2c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 11109, 68], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f2ab190e2520a2b83cf84ed7a0ac8ab7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cb1dbc2e4020b981b28136110f45abf0
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 49, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_93f8471799ee927c63bf25ff18c8c470(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_40740a558c51ae250ebd086d110ba331
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 7, 7, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f42149fa93e3be2a6343193a49b7e016(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cb1dbc2e4020b981b28136110f45abf0
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 49, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f04b5d9533968ca1cfe558bb1f52145a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_40740a558c51ae250ebd086d110ba331
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 7, 7, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cf1654e0326c25ed1a88a827618946e5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e925132faea11cd57fd6a4daf3276729
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b75869160bf53269e0d8889c5eaadecd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9ad979178b71207233a3600e92b7f890
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_dc7fa09edae8a8505afa5e2c0839c2af(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([144, 4, 96, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0977b548480b53c6319d10c8448dd8ea(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 40, 128, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ebfad196585dfaa53c89528cedc3dc15(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_691babea125bda903e4a5140dfd8a3d1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 32, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9c14150ea418d0c2a078319392def6da(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_675f542c83e6cabf84205acade8569a8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3b3f339eceb04e34556fc5665b431fde(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5732e8c86b28628b2bbb1f4500081bc1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6d33896ce0bbf6c32bfe3a1329ac6739
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e9e30c1fb0435fb76a00ea65187fd970(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0703174892ecfafcbb6aa232a979bcb0
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 784, 192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f970e1b413abace93f9cc21b0b00a51c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_31494cd4feda2f7bc5edb423d50c6a40
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 28, 28, 192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f833e25f92862fc996373e60044ada26(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cb1dbc2e4020b981b28136110f45abf0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_687a8f2c56fa10331bc083ef4cdabf2d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 232, 32, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_45b3d83c3da5da36aaed23776a2266bb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d4309df202d55374feda6165c792d440
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 3136, 96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_612611ce634930afe24bb1187d6921f6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a0057a9354a95afd3b68ee5c6a53792b
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 56, 56, 96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ea205e5b83fc17afd3f18ce796b15f7e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 40, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b218773dd3a31a8723a7b79e097e7d73(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b2fc09458a3c14f5b463ef62698beb95
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 97, 97], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_71ce8694da626478bb9d6d3b2e6d987e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b2fc09458a3c14f5b463ef62698beb95
-    def get_inputs(self):
-        return [
-            paddle.uniform([4, 512, 8, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d298d5badd9d4ae8be2b0810e408e6bf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d3eba3ce4f70f7cf9ef3ecc2ba633c91(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b2fc09458a3c14f5b463ef62698beb95
-    def get_inputs(self):
-        return [
-            paddle.uniform([4, 512, 4, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_099847a3c53b68f6744cab5f1926a0ed(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bae73b21de2ba6ddf9df5b9429bdb666
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 196, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_72bd57b3b6506bd68b8bd88765c3625b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_040319a75e8322c3a81cd9a61fb93281
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 14, 14, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c7a7210970ee3ff169ecb2798812f89b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14f80001825490a9f6877f85f4acd2c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3024, 68], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_409b1937926576564dce16d7fd3bfdd4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bae73b21de2ba6ddf9df5b9429bdb666
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1174, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0fc5151425022be242df0114aa93324d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b2fc09458a3c14f5b463ef62698beb95
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_39b7105eb53ada3327fab7fdc9870386(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9ad979178b71207233a3600e92b7f890
-    def get_inputs(self):
-        return [
-            paddle.uniform([4, 256, 8, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b5d0be78a38c1625e37fef5ab05e5a92(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e83b4159c649f1d4e30b6a5f36d9e66b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 116, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_758f49daab82cbe3c91c5dcb53972ca8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cb1dbc2e4020b981b28136110f45abf0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1174, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d20940a20204bf5fa36fb38451939b97(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 768, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_71fb80e2485e5c7518503f43d01575f1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ec83965cea96128b1f379430a99c6b42(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_848a1bab68adffdb9f9445697f49dd02(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d4309df202d55374feda6165c792d440
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 3136, 96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d8125ac4f06a8b071bc91f2c47c247af(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a0057a9354a95afd3b68ee5c6a53792b
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 56, 56, 96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e956c5db57682e5782a65baa3067d5f3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 24, 36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d96b534d1eeeae7b1e44643cf33fb46c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 192, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8532b63151583f08282e1b2cf7d1dd15(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 112, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_53ddd5135a284547941791b62acd2b53(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([16, 128, 16, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f444c5f14649d7773a9caf220ce0f4f0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14f80001825490a9f6877f85f4acd2c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3549, 76], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b08138a7ffbc236c8fa562c08aa08ca8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 576, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_66907461135236c733a416528543d0b8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 288, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5df469967de3c36d24b776ec11e70e78(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 144, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0977b548480b53c6319d10c8448dd8ea(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 40, 128, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ebfad196585dfaa53c89528cedc3dc15(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b299cab1d9d6b76a7d6ab8a5a7d07000(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14f80001825490a9f6877f85f4acd2c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8f78bb6ee7994bb1d9d7828ede5a2372(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([128, 320, 8, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_51847d78df9da7197651c04d839c650d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14f80001825490a9f6877f85f4acd2c
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 49, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3041b291249ba8f34f0d4d9f076bb1b3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 7, 7, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_572f83f14ce7b96d4a8275fdcb544023(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 32, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_204756436c36ec24e1f96f5def497e8c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 512, 1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_92ceadb96409aef03668c8c9a12ed4a8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 80, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f304c2fd14cbbdec380e52d62ef3fad2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14f80001825490a9f6877f85f4acd2c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 7581, 68], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d5227777ee88f6641e062483397f8ae0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([528, 4, 96, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_11583fbdc914f281d0a40272b7c99076(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 25, 38], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e8b84af5b24597b4555f061a5455f2e8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14f80001825490a9f6877f85f4acd2c
-    def get_inputs(self):
-        return [
-            paddle.uniform([12, 288, 192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fc488db83ab77a7d581b40cf2be86a68(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([8, 320, 8, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9af3eff8ff9d60c875de77471421111a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14f80001825490a9f6877f85f4acd2c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4725, 68], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_22805cfc16e3c811d8094f3ab423783c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([8, 160, 8, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a173233c5ecf7f5c48ce9630c1cc4ee0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14f80001825490a9f6877f85f4acd2c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 577, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_aa1d37d21f41aadfb44d801b94eb82f1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14f80001825490a9f6877f85f4acd2c
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 196, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_aa3c8b53105d1bfe2a878b88d8cd080b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 14, 14, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c45cdd180cc959d132ad26daed10ec90(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([64, 64, 32, 8], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fc4e45b6ced629d29e08eaa3ad2312bd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([384, 2, 96, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3aaad181fdb8870dc4b8ee2b547cf604(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14f80001825490a9f6877f85f4acd2c
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 784, 192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1b531fbf5525b068882d9f386047b0da(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 28, 28, 192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e5a8343b9d17b2f73106d76eccddc6a6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([16, 128, 16, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b08e628d3d6da8e2b31b1c0ff51bfa88(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14f80001825490a9f6877f85f4acd2c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8400, 68], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_267671b8aca99e019874667bad021ede(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 112, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cefad9d7b0783c417f6021afaf555670(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 20, 30], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6ac6c27f9ae48ecabe095742fc638723(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 40, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6f7c8436f1d48e400f1b7691c2b1e537(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14f80001825490a9f6877f85f4acd2c
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 3136, 96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2cf516c73dc634ae94a316fc11609d81(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 56, 56, 96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2af3a0a22578b1f58717cf9e6b8f4916(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 24, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ad76aac67fd8fb2d8c9c69a850574c55(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([8, 160, 16, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f4f903aa815d98c22a764ffa1de416ae(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 32, 128, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_204756436c36ec24e1f96f5def497e8c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 512, 1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8e120d6ac4fee11cdb205d684a81510a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14f80001825490a9f6877f85f4acd2c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3549, 68], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d20940a20204bf5fa36fb38451939b97(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 768, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c16130afce87fecfb85783e9f566ba52(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14f80001825490a9f6877f85f4acd2c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1025, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_29f773b2175aebf0f7591f4cb773041d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 128, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_350970d07e59fa9ff96fa9c61a1b3584(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_dc429d04d225fad4f1ea7382016fe27d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 192, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6ca347dc32f7e1e767278f4df7d4036(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([20, 8, 288, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_675f542c83e6cabf84205acade8569a8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7cd174456538265bcc7bbac31b5d66b5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14f80001825490a9f6877f85f4acd2c
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 49, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7249e8e9673477f0b582b3fbefefaa9f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 7, 7, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_59205781ed85d3bf0605507bf5b15322(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 1024, 1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_98f074d60c717372cb1d9627618df9b1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 32, 256, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2ae8d65165ff0308fc6637b6bbc02c0f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([576, 2, 96, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d6eaf509f017664edc821c18d90828ed(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 32, 144, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f9cb1b8f975933b2e62c0adb20365947(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([96, 4, 96, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c0f54c0b14b31d1fe67dcd19eeeeb22e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([12, 8, 288, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_08969f1dcccd6f1a94e0323fea1a60e5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14f80001825490a9f6877f85f4acd2c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_29f773b2175aebf0f7591f4cb773041d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 128, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0e70af4eaefe4f3eb61a73b221facac7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([6, 32, 144, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8bf6cfa257bff067c1f033d0c9d43770(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([960, 2, 96, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c2a27586cab425ce2ee00a36800b5bc1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9d1e3b2f42b96e692b9aa258a5682414(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 256, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_be5cee4f999825e4139b061eebd06e33(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([2112, 2, 96, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_830576b0eda5c4011a477793041487db(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 28, 50], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_226934c6603052f8f7022ccb07bcaa9a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14f80001825490a9f6877f85f4acd2c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4116, 68], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b5d0be78a38c1625e37fef5ab05e5a92(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b5d0be78a38c1625e37fef5ab05e5a92(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_204756436c36ec24e1f96f5def497e8c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 512, 1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6f7c8436f1d48e400f1b7691c2b1e537(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14f80001825490a9f6877f85f4acd2c
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 3136, 96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2cf516c73dc634ae94a316fc11609d81(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 56, 56, 96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_832f873839c836653c3a0c1731abb625(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 960, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3023420e64e34af5fdd5dc1df2c67253(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3d195433c07d779687a06c274c66efde(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 240, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1f6adb1167a8d3024fa46e625591985b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14f80001825490a9f6877f85f4acd2c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 6069, 68], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6937cc6a50a0bd9511be8d796f281ef(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14f80001825490a9f6877f85f4acd2c
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 784, 192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c3b633e60a634e50c5eed8bdd05d349f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 28, 28, 192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_aee1868358d21dbcb072b4d92550a40b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14f80001825490a9f6877f85f4acd2c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1025, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d298d5badd9d4ae8be2b0810e408e6bf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b9cb7876b38031ee724f6e6a9d6157f8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 24, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_aa1d37d21f41aadfb44d801b94eb82f1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14f80001825490a9f6877f85f4acd2c
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 196, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_aa3c8b53105d1bfe2a878b88d8cd080b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 14, 14, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_84d548cac9e1dea591a30a73041a546e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14f80001825490a9f6877f85f4acd2c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7c826177657b823d4e6111e9bbb60be3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([16, 64, 16, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3db5c230ed1bf403943a979c91e16b87(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 464, 16, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f4f903aa815d98c22a764ffa1de416ae(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 32, 128, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_204756436c36ec24e1f96f5def497e8c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 512, 1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f4f903aa815d98c22a764ffa1de416ae(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 32, 128, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ec18c1fb648a5cdcb590dd9086b365f9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([8, 256, 8, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7db9b86bb3a4d66e156e9afe9b65c493(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14f80001825490a9f6877f85f4acd2c
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 196, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6f323357d4fe9d03860da85d7baa3c2b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 14, 14, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0281a1d4988664f25e1e508a7fbc347b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([8, 8, 288, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fe4fdc26df16fbf25990073401a9292b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 144, 14, 25], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ec825509b0504d4c4e7277edca0e33c5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14f80001825490a9f6877f85f4acd2c
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 3136, 96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_31d873ad533d28a50af6df5174d3cda9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 56, 56, 96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_87c0370b804cc6839e12e23e934dc1fd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14f80001825490a9f6877f85f4acd2c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9261, 68], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b80230b989b5937674202f7271eb256a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([240, 4, 96, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_236e7972eb76cf318c8db29613e8336a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([4, 32, 144, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_350970d07e59fa9ff96fa9c61a1b3584(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_350970d07e59fa9ff96fa9c61a1b3584(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_350970d07e59fa9ff96fa9c61a1b3584(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9154675c5cdabd792b3b2485f16a63de(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2048, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a6937cc6a50a0bd9511be8d796f281ef(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14f80001825490a9f6877f85f4acd2c
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 784, 192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c3b633e60a634e50c5eed8bdd05d349f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 28, 28, 192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_503a3643381ffb2046d33b19a4a582ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bfb52e5bff64747d100a7587005c97c6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_943d6a80add1d3237e76d11f070127b3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_763d510513d5e4fa07d5c993018c8c63(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6b5aa0c5963d7c3907314fdc3a5720ad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 8, 8], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0cb0d8f3bfcedf908e665eb9b0350f1e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14f80001825490a9f6877f85f4acd2c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2100, 68], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_350970d07e59fa9ff96fa9c61a1b3584(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d298d5badd9d4ae8be2b0810e408e6bf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d298d5badd9d4ae8be2b0810e408e6bf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d298d5badd9d4ae8be2b0810e408e6bf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b11aaa1cf04861a4bd3fd8002113a11f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2048, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7db9b86bb3a4d66e156e9afe9b65c493(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14f80001825490a9f6877f85f4acd2c
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 196, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6f323357d4fe9d03860da85d7baa3c2b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 14, 14, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_103219cae2ca0d865dfbd3f3c05679eb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 15, 25], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_aa1d37d21f41aadfb44d801b94eb82f1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14f80001825490a9f6877f85f4acd2c
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 196, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_aa3c8b53105d1bfe2a878b88d8cd080b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 14, 14, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c16130afce87fecfb85783e9f566ba52(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14f80001825490a9f6877f85f4acd2c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1025, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9e7c1c8799bd33747f148a602137a363(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([44, 8, 288, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d5ed7e2d6e9cb572a0d358cfc05097e0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 80, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ec825509b0504d4c4e7277edca0e33c5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14f80001825490a9f6877f85f4acd2c
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 3136, 96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_31d873ad533d28a50af6df5174d3cda9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 56, 56, 96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_350970d07e59fa9ff96fa9c61a1b3584(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_466e9b369b736748b46315a0a2517f98(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14f80001825490a9f6877f85f4acd2c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3819a7561482b93341184ee52ef56d80(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14f80001825490a9f6877f85f4acd2c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 11109, 68], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_51847d78df9da7197651c04d839c650d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14f80001825490a9f6877f85f4acd2c
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 49, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3041b291249ba8f34f0d4d9f076bb1b3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 7, 7, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7cd174456538265bcc7bbac31b5d66b5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14f80001825490a9f6877f85f4acd2c
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 49, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7249e8e9673477f0b582b3fbefefaa9f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 7, 7, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ab6797e31661aa205c6523d77cc8e948(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bfb52e5bff64747d100a7587005c97c6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_dc7fa09edae8a8505afa5e2c0839c2af(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([144, 4, 96, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0977b548480b53c6319d10c8448dd8ea(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 40, 128, 256], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ebfad196585dfaa53c89528cedc3dc15(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_691babea125bda903e4a5140dfd8a3d1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 32, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9c14150ea418d0c2a078319392def6da(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_675f542c83e6cabf84205acade8569a8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3b3f339eceb04e34556fc5665b431fde(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0104d84b744480c5415a1ecb6da682cd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14f80001825490a9f6877f85f4acd2c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3aaad181fdb8870dc4b8ee2b547cf604(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14f80001825490a9f6877f85f4acd2c
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 784, 192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1b531fbf5525b068882d9f386047b0da(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 28, 28, 192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_14e7cf0a472fba3c7a057867ab90957c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14f80001825490a9f6877f85f4acd2c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_687a8f2c56fa10331bc083ef4cdabf2d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 232, 32, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6f7c8436f1d48e400f1b7691c2b1e537(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14f80001825490a9f6877f85f4acd2c
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 3136, 96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2cf516c73dc634ae94a316fc11609d81(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 56, 56, 96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ea205e5b83fc17afd3f18ce796b15f7e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 40, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1985d7e9acc03ca42e89698caddd58a9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 97, 97], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fed03dec2fb3cf77c058142750d6eae0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([4, 512, 8, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d298d5badd9d4ae8be2b0810e408e6bf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_84b5ed9901cb0b2bbed1fa27c00936f2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([4, 512, 4, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7db9b86bb3a4d66e156e9afe9b65c493(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14f80001825490a9f6877f85f4acd2c
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 196, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6f323357d4fe9d03860da85d7baa3c2b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 14, 14, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c7a7210970ee3ff169ecb2798812f89b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14f80001825490a9f6877f85f4acd2c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3024, 68], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3d3b2370748b62f872f09ea84f3491a3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14f80001825490a9f6877f85f4acd2c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1174, 384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d298d5badd9d4ae8be2b0810e408e6bf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_750bb9c2232de90321599077e541be25(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([4, 256, 8, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b5d0be78a38c1625e37fef5ab05e5a92(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e83b4159c649f1d4e30b6a5f36d9e66b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 116, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8e13109f6a2cd6ee6aaccbf6c396d68f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14f80001825490a9f6877f85f4acd2c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1174, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d20940a20204bf5fa36fb38451939b97(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 768, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_71fb80e2485e5c7518503f43d01575f1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ec83965cea96128b1f379430a99c6b42(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ec825509b0504d4c4e7277edca0e33c5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14f80001825490a9f6877f85f4acd2c
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 3136, 96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_31d873ad533d28a50af6df5174d3cda9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_275b79f7d46792bd32855f80988e7bd0
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 56, 56, 96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+if __name__ == "__main__":
+    sys.exit(table.main(__file__))
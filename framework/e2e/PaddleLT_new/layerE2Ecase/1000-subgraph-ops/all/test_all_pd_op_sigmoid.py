@@ -1,5415 +1,28 @@
 import os
-os.environ['FLAGS_cinn_new_group_scheduler'] = '1'
-os.environ['FLAGS_group_schedule_tiling_first'] = '1'
-os.environ['FLAGS_enable_pir_api'] = '1'
-os.environ['FLAGS_cinn_bucket_compile'] = '1'
 import sys
-import unittest
-import numpy as np
-from dataclasses import dataclass
-import typing as t
 
-@dataclass
-class Stage:
-    name: str
-    env_vars: t.Dict[str, str]
+import pytest
 
-cinn_stages = [
-    Stage(
-        name="dynamic_to_static",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=False,
-            FLAGS_prim_all=False,
-            FLAGS_prim_enable_dynamic=False,
-        ),
-    ),
-    Stage(
-        name="prim",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=False,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-        ),
-    ),
-    Stage(
-        name="infer_symbolic",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=False,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-            FLAGS_use_cinn=False,
-            FLAGS_check_infer_symbolic=True,
-        ),
-    ),
-	Stage(
-        name="frontend",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=True,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-            FLAGS_use_cinn=True,
-            FLAGS_check_infer_symbolic=False,
-            FLAGS_enable_fusion_fallback=True,
-        ), 
-    ),
-    Stage(
-        name="backend",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=True,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-            FLAGS_use_cinn=True,
-            FLAGS_check_infer_symbolic=False,
-            FLAGS_enable_fusion_fallback=False,
-        ), 
-    ),
-]
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir, os.pardir))
+from tools.e2e_case_stage import CinnStages  # noqa: E402
 
-def GetCinnStageByName(name):
-    for stage in cinn_stages:
-        if stage.name == name:
-            return stage
-    return None
+stages = CinnStages(__file__)
 
-def GetCurrentCinnStage():
-    name = os.getenv('PADDLE_DEBUG_CINN_STAGE_NAME')
-    if name is None:
-        return None
-    stage_names = [stage.name for stage in cinn_stages]
-    assert name in stage_names, (
-        f"PADDLE_DEBUG_CINN_STAGE_NAME should be in {stage_names}"
-    )
-    return GetCinnStageByName(name)
+from tools.e2e_case_table import E2ECaseTable, CinnTestBase  # noqa: E402
 
-def GetPrevCinnStage(stage):
-    for i in range(1, len(cinn_stages)):
-        if stage is cinn_stages[i]:
-            return cinn_stages[i - 1]
-    return None
+stages.apply()
+table = E2ECaseTable(__file__)
+last_stage_failed = stages.last_stage_failed()
 
-def IsCinnStageEnableDiff():
-    value = os.getenv('PADDLE_DEBUG_CINN_STAGE_ENABLE_DIFF')
-    enabled = value in {
-        '1',
-        'true',
-        'True',
-    }
-    if enabled:
-        assert GetCurrentCinnStage() is not None
-    return enabled
 
-last_cinn_stage_exit_code = None
-def LastCINNStageFailed():
-    global last_cinn_stage_exit_code
-    if last_cinn_stage_exit_code is not None:
-        return last_cinn_stage_exit_code != 0
-    last_stage = GetPrevCinnStage(GetCurrentCinnStage())
-    if last_stage is None:
-        return False
-    env_vars = dict(
-        PADDLE_DEBUG_CINN_STAGE_NAME=last_stage.name,
-        PADDLE_DEBUG_CINN_STAGE_ENABLE_DIFF='0',
-    )
-    env_vars_str = " ".join(
-        f"{env_var}={value}"
-        for env_var, value in env_vars.items()
-    )
-    last_cinn_stage_exit_code = os.system(
-        f"{env_vars_str} {sys.executable} {__file__} > /dev/null 2>&1"
-    )
-    return last_cinn_stage_exit_code != 0
+def pytest_generate_tests(metafunc):
+    table.parametrize(metafunc)
 
-def SetDefaultEnv(**env_var2value):
-    for env_var, value in env_var2value.items():
-        if os.getenv(env_var) is None:
-            os.environ[env_var] = str(value)
 
-SetDefaultEnv(
-    PADDLE_DEBUG_CINN_STAGE_NAME="backend",
-    PADDLE_DEBUG_CINN_STAGE_ENABLE_DIFF=False,
-    PADDLE_DEBUG_ENABLE_CINN=True,
-    FLAGS_enable_pir_api=True,
-    FLAGS_prim_all=True,
-    FLAGS_prim_enable_dynamic=True,
-    FLAGS_use_cinn=False,
-    FLAGS_check_infer_symbolic=False,
-    FLAGS_enable_fusion_fallback=False,
-)
+@pytest.mark.skipif(last_stage_failed, reason="last stage failed")
+class TestPrimitiveOp(CinnTestBase):
+    table = table
 
-import paddle
 
-def SetEnvVar(env_var2value):
-    for env_var, value in env_var2value.items():
-        os.environ[env_var] = str(value)
-    paddle.set_flags({
-        env_var:value
-        for env_var, value in env_var2value.items()
-        if env_var.startswith('FLAGS_')
-    })
-
-if GetCurrentCinnStage() is not None:
-    SetEnvVar(GetCurrentCinnStage().env_vars)
-
-def GetEnvVarEnableJit():
-    enable_jit = os.getenv('PADDLE_DEBUG_ENABLE_JIT')
-    return enable_jit not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
-
-def GetEnvVarEnableCinn():
-    enable_cinn = os.getenv('PADDLE_DEBUG_ENABLE_CINN')
-    if enable_cinn is None:
-        return True
-    return enable_cinn not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
-
-
-def GetTolerance(dtype):
-    if dtype == np.float16:
-        return GetFloat16Tolerance()
-    if dtype == np.float32:
-        return GetFloat32Tolerance()
-    return 1e-6
-
-def GetFloat16Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT16_TOL'))
-    except:
-        return 1e-3
-
-def GetFloat32Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT32_TOL'))
-    except:
-        return 1e-6
-
-def IsInteger(dtype):
-    return np.dtype(dtype).char in np.typecodes['AllInteger']
-
-def ApplyToStatic(net, use_cinn):
-    build_strategy = paddle.static.BuildStrategy()
-    build_strategy.build_cinn_pass = use_cinn
-    return paddle.jit.to_static(
-        net,
-        input_spec=net.get_input_spec(),
-        build_strategy=build_strategy,
-        full_graph=True,
-    )
-
-class InstanceTrait:
-
-    @classmethod
-    def instance(cls):
-        if cls.instance_ is None:
-            cls.instance_ = cls()
-        return cls.instance_
-
-    @classmethod
-    def static_instance_with_cinn(cls):
-        if cls.static_instance_with_cinn_ is None:
-            cls.static_instance_with_cinn_ = ApplyToStatic(
-                cls.instance(),
-                use_cinn=True
-            )
-        return cls.static_instance_with_cinn_
-
-    @classmethod
-    def static_instance_without_cinn(cls):
-        if cls.static_instance_without_cinn_ is None:
-            cls.static_instance_without_cinn_ = ApplyToStatic(
-                cls.instance(),
-                use_cinn=False
-            )
-        return cls.static_instance_without_cinn_
-
-
-class CinnTestBase:
-
-    def setUp(self):
-        paddle.seed(2024)
-        self.prepare_data()
-
-    def test_train(self):
-        dy_outs = self.train(use_cinn=False)
-        cinn_outs = self.train(use_cinn=GetEnvVarEnableCinn())
-
-        for cinn_out, dy_out in zip(cinn_outs, dy_outs):
-          if type(cinn_out) is list and type(dy_out) is list:
-            for x, y in zip(cinn_out, dy_out):
-              self.assert_all_close(x, y)
-          else:
-            self.assert_all_close(cinn_out, dy_out)
-
-    def train(self, use_cinn):
-        if GetEnvVarEnableJit():
-            net = self.prepare_static_net(use_cinn)
-        else:
-            net = self.prepare_net()
-        paddle.seed(2024)
-        out = net(*self.inputs)
-        return out
-    
-    def prepare_data(self):
-        self.inputs = self.get_inputs()
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def prepare_net(self):
-        return self.get_test_class().instance()
-
-    def prepare_static_net(self, use_cinn):
-        if use_cinn:
-            return self.get_test_class().static_instance_with_cinn()
-        else:
-            return self.get_test_class().static_instance_without_cinn()
-
-    def assert_all_close(self, x, y):
-        if (hasattr(x, "numpy") and hasattr(y, "numpy")):
-            x_numpy = x.numpy()
-            y_numpy = y.numpy()
-            assert x_numpy.dtype == y_numpy.dtype
-            if IsInteger(x_numpy.dtype):
-                np.testing.assert_equal(x_numpy, y_numpy)
-            else:
-                tol = GetTolerance(x_numpy.dtype)
-                np.testing.assert_allclose(x_numpy, y_numpy, atol=tol, rtol=tol)
-        else:
-            assert x == y
-
-
-
-
-
-last_stage_failed = (IsCinnStageEnableDiff() and LastCINNStageFailed())
-class PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle.nn.functional.sigmoid(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7560c490887dccae4cdb22c48d2f760b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_4ebad12140579d4eb2addcdd35942a7e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle.nn.functional.sigmoid(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 9, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6788f21196a8290c126a598a9355e2ba(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ebad12140579d4eb2addcdd35942a7e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 24, 36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_d51279e62562b41bdce5c99e5f4b89f5(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle.nn.functional.sigmoid(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 672, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b47f9758efbba6585f7603c3ddfff3fd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d51279e62562b41bdce5c99e5f4b89f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 672, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3ac6ce6438d4b1003ce9c80ab4c1f020(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 84, 84], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a13c4f714e837a2b644da06542633c34(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a13ead3571c7fc7713a2ee263a0a46fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ff01f2b8815a2a57f5aa43bd3c02e6b1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d2587207642d79b72dd8544b0f7eb812(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 48, 48], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_185694a2aa9257706a93f308f945549c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle.nn.functional.sigmoid(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 960, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_91ef2c9c8b7a99f522061ab481c126d1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_185694a2aa9257706a93f308f945549c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 960, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_afd808a5a52d3a026138d7aa4f6f7b01(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 15, 15], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c783341371b88bc2ff9efba0195d1b31(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ebad12140579d4eb2addcdd35942a7e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 112, 160], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_ca75f555dfbcd08e5338b161a92cc8e6(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle.nn.functional.sigmoid(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 20, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_85dd26c9bb0a4a2bc195d5316e38747d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca75f555dfbcd08e5338b161a92cc8e6
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[2.582711935043335]], [[1.9970217943191528]], [[2.201580762863159]], [[2.418344020843506]], [[3.0107743740081787]], [[2.3138210773468018]], [[2.3002073764801025]], [[2.722538709640503]], [[3.4076428413391113]], [[2.523327112197876]], [[2.532785415649414]], [[2.456149101257324]], [[3.439574718475342]], [[1.9469984769821167]], [[2.3776469230651855]], [[2.0379297733306885]], [[2.2267868518829346]], [[2.77728533744812]], [[1.6455498933792114]], [[3.459139347076416]]]], dtype='float32').reshape([1, 20, 1, 1]),
-        ]
-
-
-
-class PrimitiveOp_11b5a9e161c32fe94093c9d270699fa1(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle.nn.functional.sigmoid(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 40, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d9dec1e4b8efc904356939794303df6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_11b5a9e161c32fe94093c9d270699fa1
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 40, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_211da3deb4b5483a505983e21d41b989(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_782223c185c496f94c5124f02d659470(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_1e69ac5b423bad98c8f5551e78174677(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle.nn.functional.sigmoid(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 240, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e203ab7085ac2abbf7148fcbaf8d4688(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1e69ac5b423bad98c8f5551e78174677
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_7355857b79e968e11e2217b633efaf8f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle.nn.functional.sigmoid(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 80], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c6cfbffd3e96e5ac436711e5ad93af67(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7355857b79e968e11e2217b633efaf8f
-    def get_inputs(self):
-        return [
-            paddle.uniform([3800, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5bfb03a3e3f7ed43cd4b2b44d08cc322(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b47f9758efbba6585f7603c3ddfff3fd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d51279e62562b41bdce5c99e5f4b89f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 672, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_afe9927e1a102b9f1a4c38c23a715670(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ebad12140579d4eb2addcdd35942a7e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e203ab7085ac2abbf7148fcbaf8d4688(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1e69ac5b423bad98c8f5551e78174677
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_087c4082ec6ea3f76075bb912addcd47(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle.nn.functional.sigmoid(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 1152, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d68ddd3e032c42f8066dd46339cdb885(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_087c4082ec6ea3f76075bb912addcd47
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 1152, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8c61bae2f2ece1638ce91b4baaceccd1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7355857b79e968e11e2217b633efaf8f
-    def get_inputs(self):
-        return [
-            paddle.uniform([150, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c6744d490ead94cec8553ead40cb2538(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 26, 26], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_11927d9e993c38808be68f24f74ac648(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ebad12140579d4eb2addcdd35942a7e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 30, 50], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_fbfeb934d18cde3504d92660dbe55d7c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle.nn.functional.sigmoid(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 384, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e98f3b959c7b4edbe34959fb50b11ea2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fbfeb934d18cde3504d92660dbe55d7c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5e4aa8cc71c59c34b0e09d285d7b6965(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7355857b79e968e11e2217b633efaf8f
-    def get_inputs(self):
-        return [
-            paddle.uniform([40, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_83ebd18e8f798922a4a4dd640413d304(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 30, 30], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8fbc5d7fc2e44f92a2d8201d82fef378(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 52, 52], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_c3dbf8e15caa79edd45a0d0f7791d453(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle.nn.functional.sigmoid(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 15, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_539123dbfbf0b058df5f81f03c52c017(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3dbf8e15caa79edd45a0d0f7791d453
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 8, 8], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_94d930df9da146a07e6e5a4a8c097cc9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ebad12140579d4eb2addcdd35942a7e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b507cc017235570250dbd04317b3c524(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 13, 13], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c4b6376ea914d291cea2802023fdce0c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4dfe723c79854e9957642dc71fb4fc33(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 34, 34], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_8be7398bbce3dedd631cb0be73704218(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle.nn.functional.sigmoid(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 768, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_78ce83cb015d1e7c8568dc2e3ca90cfe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8be7398bbce3dedd631cb0be73704218
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 768, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8665492b5289f90d2a3d074c23f24afa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 76, 76], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ff01f2b8815a2a57f5aa43bd3c02e6b1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_97baf7eb0e6204b7082275d044794c32(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b47f9758efbba6585f7603c3ddfff3fd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d51279e62562b41bdce5c99e5f4b89f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 672, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b048df7ce8ea7698d67d54e34620c857(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 36, 36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6d5fda8113782e42c8ffcb85e07a8e8b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 36, 36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f0220f756e067d9c8e5f49d3d8fb3e4e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3dbf8e15caa79edd45a0d0f7791d453
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_afe9927e1a102b9f1a4c38c23a715670(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ebad12140579d4eb2addcdd35942a7e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5c55961c4a1b0dae88a24f0defbe6889(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3dbf8e15caa79edd45a0d0f7791d453
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b507cc017235570250dbd04317b3c524(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 13, 13], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5b1a13dbae341df39cdba60e9cdf159a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 20, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d1f59ed82879131f2e3ea04524e8ec5e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ebad12140579d4eb2addcdd35942a7e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 48, 72], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_d7c750b069ea3b720a7a63ed9cb0196b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle.nn.functional.sigmoid(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 96, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_905d75898048ea5efd1c662a7115ac3b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d7c750b069ea3b720a7a63ed9cb0196b
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_023e7e6ca153baf8df6aeaa4132e6866(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ebad12140579d4eb2addcdd35942a7e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 60, 100], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_38ac05635ef2a8634d408f07263d2787(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle.nn.functional.sigmoid(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 480, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_653536c6a13d7ae9da0a47dd5ac889aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_38ac05635ef2a8634d408f07263d2787
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 480, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1ca05585da0f5ee0848facef38756175(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ebad12140579d4eb2addcdd35942a7e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 36, 36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_dd8ebf0624b27c04ecc64bcbaf509527(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 40, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_023e7e6ca153baf8df6aeaa4132e6866(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ebad12140579d4eb2addcdd35942a7e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 60, 100], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ceb3295c3c9ad86af62923c4630adab4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d2587207642d79b72dd8544b0f7eb812(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 48, 48], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7a777e4b0760dd643ba6dfbd43bf8e55(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 21, 21], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4dfe723c79854e9957642dc71fb4fc33(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 34, 34], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4d1a2906b98a4217602228e875d7e5e5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 34, 34], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c98ef72664919800de014c852d0d315c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ebad12140579d4eb2addcdd35942a7e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 7, 10], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8758cda94c7cf2a35b17d5e9110c174b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7355857b79e968e11e2217b633efaf8f
-    def get_inputs(self):
-        return [
-            paddle.uniform([15200, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d65d4280bbe1d26f5dd6ae9c00343c70(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 18, 18], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8714ce105eae4dbcef75d9e557922a3a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 18, 18], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_472ab611b57f70ac76c6ca167f8e4685(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle.nn.functional.sigmoid(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 144, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8b37d9ec9ccbf45d1a54b0ddc961e2eb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_472ab611b57f70ac76c6ca167f8e4685
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 144, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f7b35c6a6ba11e7d079610d0e0638801(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 17, 17], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a603c06c1cb7db38cbbd98c46eb9c47b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 17, 17], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_3bd6e2eee3bf5a1f64549b9ad83de2fe(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle.nn.functional.sigmoid(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3411022ae08d046ad316cf7347d7e6cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3bd6e2eee3bf5a1f64549b9ad83de2fe
-    def get_inputs(self):
-        return [
-            paddle.uniform([100, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e203ab7085ac2abbf7148fcbaf8d4688(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1e69ac5b423bad98c8f5551e78174677
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e6d9e662a34df6852a44445f1b0c8d94(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5bfb03a3e3f7ed43cd4b2b44d08cc322(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ac2f27401f53685786fdc8bb72b0dcf3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 20, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_18a51c6da308318710de691fed24acb4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_472ab611b57f70ac76c6ca167f8e4685
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 144, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b232d8c78af10394974a346c8d2d0501(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d51279e62562b41bdce5c99e5f4b89f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 672, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_653536c6a13d7ae9da0a47dd5ac889aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_38ac05635ef2a8634d408f07263d2787
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 480, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_afe9927e1a102b9f1a4c38c23a715670(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ebad12140579d4eb2addcdd35942a7e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_94d930df9da146a07e6e5a4a8c097cc9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ebad12140579d4eb2addcdd35942a7e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_866582cd09c7885fc43586de2045f53e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_087c4082ec6ea3f76075bb912addcd47
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 1152, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_85f38383e3f19821d8f1572f28a943b4(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle.nn.functional.sigmoid(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 32, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_089c048a0b60168d7b22cc35c6e7adc3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_85f38383e3f19821d8f1572f28a943b4
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 32, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_33b35d486c830e15977f68e980ded23e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3bd6e2eee3bf5a1f64549b9ad83de2fe
-    def get_inputs(self):
-        return [
-            paddle.uniform([300, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f7b35c6a6ba11e7d079610d0e0638801(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 17, 17], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a3b023d976308ab08beabc5351409601(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_38ac05635ef2a8634d408f07263d2787
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 480, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b3b3c1c4f0452707375e7e1c00e950a8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ebad12140579d4eb2addcdd35942a7e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 12, 12], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6f7be3a098941ef0b756300de0ff8986(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ebad12140579d4eb2addcdd35942a7e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 40, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_b0b2838202dedcd77f7e8affd4ca647b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle.nn.functional.sigmoid(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 1, 13, 19], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6e8e9c5647d214ae08f09ec2c632b7c2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b0b2838202dedcd77f7e8affd4ca647b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 13, 19], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_98645057c5efaa7947a8146c99092ff9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 46, 46], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1bcb11bfd8522f4dd8bb7c30fd88a6c1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7355857b79e968e11e2217b633efaf8f
-    def get_inputs(self):
-        return [
-            paddle.uniform([2204, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7560c490887dccae4cdb22c48d2f760b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b232d8c78af10394974a346c8d2d0501(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d51279e62562b41bdce5c99e5f4b89f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 672, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6f7be3a098941ef0b756300de0ff8986(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ebad12140579d4eb2addcdd35942a7e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 40, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_18a51c6da308318710de691fed24acb4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_472ab611b57f70ac76c6ca167f8e4685
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 144, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7560c490887dccae4cdb22c48d2f760b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6541c2f7e500d6f5106089984abae053(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7355857b79e968e11e2217b633efaf8f
-    def get_inputs(self):
-        return [
-            paddle.uniform([551, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c90885abe5cb638b9687c742f230556d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 80, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c5d2858a40c609374c03c6eac1dc2ce1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1e69ac5b423bad98c8f5551e78174677
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6f7be3a098941ef0b756300de0ff8986(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ebad12140579d4eb2addcdd35942a7e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 40, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_739f9fd47b1d08bf724d282f5de4f079(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 60, 60], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_64febd953cedc0fca09deb49a8f45004(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 20, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_21ea0cbbdd33027eae80511832c1eaf0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7355857b79e968e11e2217b633efaf8f
-    def get_inputs(self):
-        return [
-            paddle.uniform([247, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d3ca35642a301a0cc56c696a4e46d830(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7355857b79e968e11e2217b633efaf8f
-    def get_inputs(self):
-        return [
-            paddle.uniform([950, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_63f506ad66d5f6d8bf26e235e7bbacd2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 96, 96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_95efe275f09a1a8bc6b8c2a7c1b981dc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 96, 96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8fbc5d7fc2e44f92a2d8201d82fef378(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 52, 52], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_01885d33e3c497635a44c49a27eb0d3d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_85f38383e3f19821d8f1572f28a943b4
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 32, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8b37d9ec9ccbf45d1a54b0ddc961e2eb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_472ab611b57f70ac76c6ca167f8e4685
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 144, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_a51f464625b625b8b75a381fe80bc627(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle.nn.functional.sigmoid(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 240, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_66de304815f2348f215cd4d5d1804a5f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a51f464625b625b8b75a381fe80bc627
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_040dd6db4b7d755719a7be5417352f73(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3dbf8e15caa79edd45a0d0f7791d453
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c90885abe5cb638b9687c742f230556d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 80, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8c38ffb0662cc9b73f431b91d957263f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 80, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b507cc017235570250dbd04317b3c524(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 13, 13], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c6744d490ead94cec8553ead40cb2538(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 26, 26], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1347e605ccd5257a1399c8e7919669b4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 23, 23], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5bfb03a3e3f7ed43cd4b2b44d08cc322(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c4b6376ea914d291cea2802023fdce0c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c4b6376ea914d291cea2802023fdce0c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_288b0a24b7fe9cf551086881d0507e71(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7355857b79e968e11e2217b633efaf8f
-    def get_inputs(self):
-        return [
-            paddle.uniform([8816, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_dd8ebf0624b27c04ecc64bcbaf509527(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 40, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3f138dc2a7adc71e2d7ab88f400e3781(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 40, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8a64e86eda8c0c4d212e12cbd3e42bf8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 19, 19], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7560c490887dccae4cdb22c48d2f760b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8b37d9ec9ccbf45d1a54b0ddc961e2eb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_472ab611b57f70ac76c6ca167f8e4685
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 144, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d1f59ed82879131f2e3ea04524e8ec5e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ebad12140579d4eb2addcdd35942a7e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 48, 72], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e98f3b959c7b4edbe34959fb50b11ea2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fbfeb934d18cde3504d92660dbe55d7c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_866582cd09c7885fc43586de2045f53e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_087c4082ec6ea3f76075bb912addcd47
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 1152, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_94d930df9da146a07e6e5a4a8c097cc9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ebad12140579d4eb2addcdd35942a7e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_18a51c6da308318710de691fed24acb4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_472ab611b57f70ac76c6ca167f8e4685
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 144, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e22b1966a0a395b7aaa3b80e1b157dbf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_604e43e2916e69975ea0460096433404(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_50fbdb16d3514da9ecea7aa7ba8f319c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ebad12140579d4eb2addcdd35942a7e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 15, 25], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_681ae03d7ca9ff50105cd5ec7ee03850(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ebad12140579d4eb2addcdd35942a7e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 96, 144], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e41d83278961ac449fdc8760f957bed9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ebad12140579d4eb2addcdd35942a7e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 192, 288], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c6744d490ead94cec8553ead40cb2538(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 26, 26], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_44f9d213532edff72838fa9845be18a6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 68, 68], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b575227afa98211abb45e81367e7dfc5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 68, 68], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_681ae03d7ca9ff50105cd5ec7ee03850(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ebad12140579d4eb2addcdd35942a7e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 96, 144], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b47f9758efbba6585f7603c3ddfff3fd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d51279e62562b41bdce5c99e5f4b89f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 672, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e203ab7085ac2abbf7148fcbaf8d4688(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1e69ac5b423bad98c8f5551e78174677
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_ac7f4e0cab9274fb2d54b2d52488a250(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle.nn.functional.sigmoid(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 192, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b90517c2f37fd34b8cef511a0ec1f228(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ac7f4e0cab9274fb2d54b2d52488a250
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f57b88117c85cf6b3d5f2557033d0927(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 20, 40, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f59f54b6c857952e4ac699e01d8210f9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 72, 72], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cdfbfae3fb0d373fc8742b1fd59dd7f9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 72, 72], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d6881249df897155f766a1e18d217391(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 20, 10, 10], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b90517c2f37fd34b8cef511a0ec1f228(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ac7f4e0cab9274fb2d54b2d52488a250
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2b7b1bc08e299c3ab3e8a8abd806571b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 20, 20, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b3b3c1c4f0452707375e7e1c00e950a8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ebad12140579d4eb2addcdd35942a7e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 12, 12], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c5d2858a40c609374c03c6eac1dc2ce1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1e69ac5b423bad98c8f5551e78174677
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ff01f2b8815a2a57f5aa43bd3c02e6b1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_1dd2d01c68701703b676a5b712faaf51(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle.nn.functional.sigmoid(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 20, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4211d4678bdacd461a371b83e04add7d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1dd2d01c68701703b676a5b712faaf51
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[1.0196971893310547]], [[2.2704689502716064]], [[1.851608157157898]], [[1.4770941734313965]], [[2.4766030311584473]], [[2.1102824211120605]], [[2.3709990978240967]], [[2.121116876602173]], [[0.9733872413635254]], [[1.8852782249450684]], [[1.6255929470062256]], [[1.9822272062301636]], [[1.823581337928772]], [[1.6723984479904175]], [[2.0752878189086914]], [[1.9260599613189697]], [[1.8854875564575195]], [[1.738224744796753]], [[1.8721301555633545]], [[0.8589106798171997]]]], dtype='float32').reshape([1, 20, 1, 1]),
-        ]
-
-
-
-class PrimitiveOp_d63fcbafda62a7f7fe3a8ecf5e1f56bf(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle.nn.functional.sigmoid(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 40, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ade28c8e9988ade5963c8aa9e9f7d285(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d63fcbafda62a7f7fe3a8ecf5e1f56bf
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 40, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_0eee07dbc6184bafd0ccbb51cbbed24f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle.nn.functional.sigmoid(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 80, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2710db5e82b15ed56fe0e50d5c9d7cfb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0eee07dbc6184bafd0ccbb51cbbed24f
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_cf2810be31f3f1549e66e4274e0a2a0d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle.nn.functional.sigmoid(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 160, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1c11528b270f4f7fe96be1e0baa43601(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cf2810be31f3f1549e66e4274e0a2a0d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_47111a19c0a07fd0f49b94f76f8b98f3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ebad12140579d4eb2addcdd35942a7e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 28, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f08a9c5a595b2eae27fdc133fd5f562a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d7c750b069ea3b720a7a63ed9cb0196b
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b48a620fca4a21c91496bfb5668ff708(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ebad12140579d4eb2addcdd35942a7e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 120, 200], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b232d8c78af10394974a346c8d2d0501(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d51279e62562b41bdce5c99e5f4b89f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 672, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8fbc5d7fc2e44f92a2d8201d82fef378(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 52, 52], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2509c38aa3201bc73f2e7d3da58f5983(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3dbf8e15caa79edd45a0d0f7791d453
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_ee7ae298ff3668068baeb6ef8d1f53f0(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle.nn.functional.sigmoid(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 1, 50, 76], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_299e9fd6af235c1fe7f2a70200718dcd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ee7ae298ff3668068baeb6ef8d1f53f0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 50, 76], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_7722c00b08aab996c9a71334a70ba894(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle.nn.functional.sigmoid(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 1, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c73bf4614506fd087bcdce5a55498646(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7722c00b08aab996c9a71334a70ba894
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 120, 200], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5b1a13dbae341df39cdba60e9cdf159a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 20, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a2bb8161b98aeafe42c932ad79ae171d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 20, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0fdc43795cd2489e1b5812b1c745d50c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 92, 92], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_13f182d175353bfa03aa7eddffa75be0(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle.nn.functional.sigmoid(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 96, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_11a21ec7c4895bcfa2d1c15713b78bd5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_13f182d175353bfa03aa7eddffa75be0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1ca05585da0f5ee0848facef38756175(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ebad12140579d4eb2addcdd35942a7e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 36, 36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c4b6376ea914d291cea2802023fdce0c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_beb1b88a93c3aec9aa43721ee74a2345(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca75f555dfbcd08e5338b161a92cc8e6
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[2.102309226989746]], [[2.0835232734680176]], [[2.6745057106018066]], [[1.634010672569275]], [[1.626343846321106]], [[1.898132562637329]], [[2.039623737335205]], [[1.934592366218567]], [[2.5141489505767822]], [[1.8221969604492188]], [[1.8926172256469727]], [[1.987426519393921]], [[2.1937639713287354]], [[1.5194551944732666]], [[2.159522294998169]], [[1.3361855745315552]], [[1.6347235441207886]], [[2.5471084117889404]], [[2.088796615600586]], [[2.858461380004883]]]], dtype='float32').reshape([1, 20, 1, 1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d9dec1e4b8efc904356939794303df6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_11b5a9e161c32fe94093c9d270699fa1
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 40, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_33cfbb711af99f616a30861013b4fa12(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle.nn.functional.sigmoid(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 80, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1794526ca0b0c386f071dfb1a3dbad72(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_33cfbb711af99f616a30861013b4fa12
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f08a9c5a595b2eae27fdc133fd5f562a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d7c750b069ea3b720a7a63ed9cb0196b
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c6cfbffd3e96e5ac436711e5ad93af67(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7355857b79e968e11e2217b633efaf8f
-    def get_inputs(self):
-        return [
-            paddle.uniform([3800, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b232d8c78af10394974a346c8d2d0501(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d51279e62562b41bdce5c99e5f4b89f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 672, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8b37d9ec9ccbf45d1a54b0ddc961e2eb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_472ab611b57f70ac76c6ca167f8e4685
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 144, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b3b3c1c4f0452707375e7e1c00e950a8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ebad12140579d4eb2addcdd35942a7e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 12, 12], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5bfb03a3e3f7ed43cd4b2b44d08cc322(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_66738093df3ef8cacf742ea97772b6dd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 20, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8439038ec4f6be499a59b33e7536f87b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_515a9eaade68c86cbabe69c25dad9195(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 38, 38], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a3b023d976308ab08beabc5351409601(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_38ac05635ef2a8634d408f07263d2787
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 480, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f4108771b515a115ac298ea7779e1138(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ebad12140579d4eb2addcdd35942a7e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 56, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_856a84e856cd61e13bc311d67915f2bf(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle.nn.functional.sigmoid(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 576, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9c060f4283fc330e9668d656b31a24f0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_856a84e856cd61e13bc311d67915f2bf
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 576, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5c6efef09c5483bad57dece435ef07a8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 42, 42], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1ca05585da0f5ee0848facef38756175(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ebad12140579d4eb2addcdd35942a7e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 36, 36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_beed642845808d818f148ee53d200ac1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 12, 12], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bd68d67a856c2e9bd1c71be088496d16(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7355857b79e968e11e2217b633efaf8f
-    def get_inputs(self):
-        return [
-            paddle.uniform([70, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_763d6fee205834b5ac87ff565f562e91(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle.nn.functional.sigmoid(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 480, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_af7081e98ca8af00dea925bcbf394109(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_763d6fee205834b5ac87ff565f562e91
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_11927d9e993c38808be68f24f74ac648(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ebad12140579d4eb2addcdd35942a7e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 30, 50], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_01885d33e3c497635a44c49a27eb0d3d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_85f38383e3f19821d8f1572f28a943b4
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 32, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_905d75898048ea5efd1c662a7115ac3b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d7c750b069ea3b720a7a63ed9cb0196b
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_3add2fa278160f0f00b15ee03e2fcd74(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle.nn.functional.sigmoid(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 288, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e456e329ad55967e24acb8da841efbdc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3add2fa278160f0f00b15ee03e2fcd74
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 288, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_089c048a0b60168d7b22cc35c6e7adc3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_85f38383e3f19821d8f1572f28a943b4
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 32, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_e3879dcd9124d090f62fe2fb1367d22d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle.nn.functional.sigmoid(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 1, 25, 38], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4a1e2d6054d65a514fa8e110c0e886be(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e3879dcd9124d090f62fe2fb1367d22d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 25, 38], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c5d2858a40c609374c03c6eac1dc2ce1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1e69ac5b423bad98c8f5551e78174677
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c5d2858a40c609374c03c6eac1dc2ce1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1e69ac5b423bad98c8f5551e78174677
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_717d3235c04477cb8138800e36b48ffd(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle.nn.functional.sigmoid(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 1, 7, 10], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2b7ff12a808430137dc20200a59a4ac5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_717d3235c04477cb8138800e36b48ffd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 7, 10], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_e82b4060a757498a03524a8daf1bb393(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle.nn.functional.sigmoid(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 144, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5908c895608f3ecbfe87bc6d2bf58bd3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e82b4060a757498a03524a8daf1bb393
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 144, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_70398939775f2cadaae14e3202c8264a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ebad12140579d4eb2addcdd35942a7e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 14, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_44f9d213532edff72838fa9845be18a6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 68, 68], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_18a51c6da308318710de691fed24acb4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_472ab611b57f70ac76c6ca167f8e4685
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 144, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d2587207642d79b72dd8544b0f7eb812(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 48, 48], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_646883311c8aee13507f06fb7c599924(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 48, 48], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_504cc18d8d9542eed1f97f997464f348(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle.nn.functional.sigmoid(input_0)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 1, 100, 152], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_90fccb246b2fe369cc64bb2c4a0355ac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_504cc18d8d9542eed1f97f997464f348
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 100, 152], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d68ddd3e032c42f8066dd46339cdb885(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_087c4082ec6ea3f76075bb912addcd47
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 1152, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3d167e8f909ea6c07b6759cebc34deba(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7722c00b08aab996c9a71334a70ba894
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 192, 288], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7560c490887dccae4cdb22c48d2f760b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_73ca668630a62151ce23386c6783f938(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 24, 36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1fe2f6ade191eb59c97974be5baaa2cb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 672, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3ac6ce6438d4b1003ce9c80ab4c1f020(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 84, 84], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a13c4f714e837a2b644da06542633c34(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a13ead3571c7fc7713a2ee263a0a46fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ff01f2b8815a2a57f5aa43bd3c02e6b1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d2587207642d79b72dd8544b0f7eb812(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 48, 48], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_77a235a11e5096a27077cae7de21acb9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 960, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_afd808a5a52d3a026138d7aa4f6f7b01(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 15, 15], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b87ee00c1f60d7ab28541439af05bd89(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 112, 160], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_515a9db146bd08f8dd12f39f53481c45(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[2.582711935043335]], [[1.9970217943191528]], [[2.201580762863159]], [[2.418344020843506]], [[3.0107743740081787]], [[2.3138210773468018]], [[2.3002073764801025]], [[2.722538709640503]], [[3.4076428413391113]], [[2.523327112197876]], [[2.532785415649414]], [[2.456149101257324]], [[3.439574718475342]], [[1.9469984769821167]], [[2.3776469230651855]], [[2.0379297733306885]], [[2.2267868518829346]], [[2.77728533744812]], [[1.6455498933792114]], [[3.459139347076416]]]], dtype='float32').reshape([1, 20, 1, 1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6913f4e8833f5830f8c2c38d619c2ab3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 40, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_211da3deb4b5483a505983e21d41b989(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_782223c185c496f94c5124f02d659470(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bd972d34b75b37c4697b09b8e5871de5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2738f0f2347de606653135c20ce6942e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3bd6e2eee3bf5a1f64549b9ad83de2fe
-    def get_inputs(self):
-        return [
-            paddle.uniform([3800, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5bfb03a3e3f7ed43cd4b2b44d08cc322(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1fe2f6ade191eb59c97974be5baaa2cb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 672, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8049a8684efcfb6bcf55efba20badec2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bd972d34b75b37c4697b09b8e5871de5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b240c6519c8ff3d275b701b7466de8a7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 1152, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fb66af7a80113ecc2c3cfa80b2a5c343(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3bd6e2eee3bf5a1f64549b9ad83de2fe
-    def get_inputs(self):
-        return [
-            paddle.uniform([150, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c6744d490ead94cec8553ead40cb2538(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 26, 26], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1042570547208b02ae9333d636f3916c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 30, 50], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d422ae930f664d27fabbabaf70585cb0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5dbe3ec1459edad56368358a2d435485(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3bd6e2eee3bf5a1f64549b9ad83de2fe
-    def get_inputs(self):
-        return [
-            paddle.uniform([40, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_83ebd18e8f798922a4a4dd640413d304(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 30, 30], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8fbc5d7fc2e44f92a2d8201d82fef378(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 52, 52], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a7dc58bf75b9d0515a620c30468e3a1c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 8, 8], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_29a08503a1a03cf923a325ac3af1deed(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b507cc017235570250dbd04317b3c524(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 13, 13], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c4b6376ea914d291cea2802023fdce0c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4dfe723c79854e9957642dc71fb4fc33(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 34, 34], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e6ec1861e0b2423497ee1bc64a4177bf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 768, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8665492b5289f90d2a3d074c23f24afa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 76, 76], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ff01f2b8815a2a57f5aa43bd3c02e6b1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_97baf7eb0e6204b7082275d044794c32(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1fe2f6ade191eb59c97974be5baaa2cb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 672, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b048df7ce8ea7698d67d54e34620c857(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 36, 36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6d5fda8113782e42c8ffcb85e07a8e8b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 36, 36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_103e68ad24e651a556baa4718d5db7d0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8049a8684efcfb6bcf55efba20badec2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5bfb03a3e3f7ed43cd4b2b44d08cc322(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b507cc017235570250dbd04317b3c524(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 13, 13], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5b1a13dbae341df39cdba60e9cdf159a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 20, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_51b87bdf57cbf57c376167bb36ab60cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 48, 72], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e5a17b509c1cc48a104dd6d0d09dd660(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cba70f779e6e986b9bc336a32819931d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 60, 100], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9708da9da982453e3a3544266cb458cc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 480, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_380d05d3077c6643d9aded95b94efd9b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 36, 36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_dd8ebf0624b27c04ecc64bcbaf509527(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 40, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cba70f779e6e986b9bc336a32819931d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 60, 100], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ceb3295c3c9ad86af62923c4630adab4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d2587207642d79b72dd8544b0f7eb812(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 48, 48], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7a777e4b0760dd643ba6dfbd43bf8e55(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 21, 21], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4dfe723c79854e9957642dc71fb4fc33(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 34, 34], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4d1a2906b98a4217602228e875d7e5e5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 34, 34], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_432042a851677d3464ea5affc769a02e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 7, 10], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1ab9a3d8871d4d57679d923bf1447dd5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3bd6e2eee3bf5a1f64549b9ad83de2fe
-    def get_inputs(self):
-        return [
-            paddle.uniform([15200, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d65d4280bbe1d26f5dd6ae9c00343c70(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 18, 18], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8714ce105eae4dbcef75d9e557922a3a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 18, 18], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2430f31ebe1ac84d0b5b7e3c6f17ee18(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 144, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f7b35c6a6ba11e7d079610d0e0638801(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 17, 17], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a603c06c1cb7db38cbbd98c46eb9c47b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 17, 17], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3411022ae08d046ad316cf7347d7e6cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3bd6e2eee3bf5a1f64549b9ad83de2fe
-    def get_inputs(self):
-        return [
-            paddle.uniform([100, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bd972d34b75b37c4697b09b8e5871de5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e6d9e662a34df6852a44445f1b0c8d94(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5bfb03a3e3f7ed43cd4b2b44d08cc322(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ac2f27401f53685786fdc8bb72b0dcf3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 20, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9e68b6b2cd7ca5680546cf7a8277b11d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 144, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_df23049d04e3d9069f7905f262ab8dfd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 672, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9708da9da982453e3a3544266cb458cc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 480, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8049a8684efcfb6bcf55efba20badec2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_29a08503a1a03cf923a325ac3af1deed(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c6de41cbacee40924196d7c3e2e0d3f7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 1152, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_75d2b793b91ab12ec062eab8933ab257(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 32, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_33b35d486c830e15977f68e980ded23e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3bd6e2eee3bf5a1f64549b9ad83de2fe
-    def get_inputs(self):
-        return [
-            paddle.uniform([300, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f7b35c6a6ba11e7d079610d0e0638801(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 17, 17], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bd9a1b87c68e4162f79a27b9dd8ef385(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 480, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_919bec34a30675edc5c86a46448f61c6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 12, 12], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7d6a0aabb8e4b9318c027b29c713da5e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 40, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7b8767efda2dc1186e7a3edd4faf2883(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 13, 19], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_98645057c5efaa7947a8146c99092ff9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 46, 46], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2f009d6e0433ffefd4e0d742212490c9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3bd6e2eee3bf5a1f64549b9ad83de2fe
-    def get_inputs(self):
-        return [
-            paddle.uniform([2204, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7560c490887dccae4cdb22c48d2f760b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_df23049d04e3d9069f7905f262ab8dfd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 672, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7d6a0aabb8e4b9318c027b29c713da5e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 40, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9e68b6b2cd7ca5680546cf7a8277b11d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 144, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7560c490887dccae4cdb22c48d2f760b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_33ad8aa4461f1354eb17bff97aae7a9e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3bd6e2eee3bf5a1f64549b9ad83de2fe
-    def get_inputs(self):
-        return [
-            paddle.uniform([551, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c90885abe5cb638b9687c742f230556d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 80, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_512d0cc8d4a48960a331f3320f582c90(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7d6a0aabb8e4b9318c027b29c713da5e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 40, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_739f9fd47b1d08bf724d282f5de4f079(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 60, 60], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_64febd953cedc0fca09deb49a8f45004(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 20, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_56bf77ae71fa471ffdc025cbec91bbb8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3bd6e2eee3bf5a1f64549b9ad83de2fe
-    def get_inputs(self):
-        return [
-            paddle.uniform([247, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c7f18cc0cba30f7f65709711ce184bcd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3bd6e2eee3bf5a1f64549b9ad83de2fe
-    def get_inputs(self):
-        return [
-            paddle.uniform([950, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_63f506ad66d5f6d8bf26e235e7bbacd2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 96, 96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_95efe275f09a1a8bc6b8c2a7c1b981dc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 96, 96], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8fbc5d7fc2e44f92a2d8201d82fef378(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 52, 52], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_44a6eeb0342898b6d5be12b14a4d108b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 32, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2430f31ebe1ac84d0b5b7e3c6f17ee18(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 144, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_eddfe634986f42189d74722df8b5dc10(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7560c490887dccae4cdb22c48d2f760b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c90885abe5cb638b9687c742f230556d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 80, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8c38ffb0662cc9b73f431b91d957263f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 80, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b507cc017235570250dbd04317b3c524(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 13, 13], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c6744d490ead94cec8553ead40cb2538(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 26, 26], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1347e605ccd5257a1399c8e7919669b4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 23, 23], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5bfb03a3e3f7ed43cd4b2b44d08cc322(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c4b6376ea914d291cea2802023fdce0c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c4b6376ea914d291cea2802023fdce0c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e3b48ed51defec1a30697b8bddfd402e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3bd6e2eee3bf5a1f64549b9ad83de2fe
-    def get_inputs(self):
-        return [
-            paddle.uniform([8816, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_dd8ebf0624b27c04ecc64bcbaf509527(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 40, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3f138dc2a7adc71e2d7ab88f400e3781(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 40, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8a64e86eda8c0c4d212e12cbd3e42bf8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 19, 19], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7560c490887dccae4cdb22c48d2f760b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2430f31ebe1ac84d0b5b7e3c6f17ee18(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 144, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_51b87bdf57cbf57c376167bb36ab60cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 48, 72], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d422ae930f664d27fabbabaf70585cb0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c6de41cbacee40924196d7c3e2e0d3f7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 1152, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_29a08503a1a03cf923a325ac3af1deed(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9e68b6b2cd7ca5680546cf7a8277b11d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 144, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e22b1966a0a395b7aaa3b80e1b157dbf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_604e43e2916e69975ea0460096433404(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_485b6112532439ab55fdfc4040a3a985(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 15, 25], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3b373b6fce9e9d368c11ea4d6e6ce3d8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 96, 144], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3c7c8b2584adb1834e09e012e0467b31(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 192, 288], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c6744d490ead94cec8553ead40cb2538(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 26, 26], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_44f9d213532edff72838fa9845be18a6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 68, 68], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b575227afa98211abb45e81367e7dfc5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 68, 68], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3b373b6fce9e9d368c11ea4d6e6ce3d8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 96, 144], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1fe2f6ade191eb59c97974be5baaa2cb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 672, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bd972d34b75b37c4697b09b8e5871de5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e50806ac7e547d749c325749b6c92c18(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f57b88117c85cf6b3d5f2557033d0927(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 20, 40, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f59f54b6c857952e4ac699e01d8210f9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 72, 72], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_cdfbfae3fb0d373fc8742b1fd59dd7f9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 72, 72], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d6881249df897155f766a1e18d217391(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 20, 10, 10], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e50806ac7e547d749c325749b6c92c18(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2b7b1bc08e299c3ab3e8a8abd806571b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 20, 20, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_919bec34a30675edc5c86a46448f61c6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 12, 12], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_512d0cc8d4a48960a331f3320f582c90(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ff01f2b8815a2a57f5aa43bd3c02e6b1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 24, 24], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_24c871627501d169308fdd7522379faa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[1.0196971893310547]], [[2.2704689502716064]], [[1.851608157157898]], [[1.4770941734313965]], [[2.4766030311584473]], [[2.1102824211120605]], [[2.3709990978240967]], [[2.121116876602173]], [[0.9733872413635254]], [[1.8852782249450684]], [[1.6255929470062256]], [[1.9822272062301636]], [[1.823581337928772]], [[1.6723984479904175]], [[2.0752878189086914]], [[1.9260599613189697]], [[1.8854875564575195]], [[1.738224744796753]], [[1.8721301555633545]], [[0.8589106798171997]]]], dtype='float32').reshape([1, 20, 1, 1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6913f4e8833f5830f8c2c38d619c2ab3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 40, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e4425876e80ee64a0bb4c238e6b64a7a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d7deec180067307cff84d39c23d83486(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2308a401729adbab5033905bc864e83f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 28, 40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c8ca75a681b0b56d9b5a39c88dcf1fd4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_80932766314346608a0ca2d02a13b15c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 120, 200], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_df23049d04e3d9069f7905f262ab8dfd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 672, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8fbc5d7fc2e44f92a2d8201d82fef378(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 52, 52], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c4b6376ea914d291cea2802023fdce0c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7f0c3733f71c37f79ddcc069d4b6bed4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 50, 76], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f691faefd8b7749f6d4d1ac662971c59(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 120, 200], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5b1a13dbae341df39cdba60e9cdf159a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 20, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a2bb8161b98aeafe42c932ad79ae171d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 20, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0fdc43795cd2489e1b5812b1c745d50c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 92, 92], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0c5f66d12b43cb853eb3a79441ca2a3b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_380d05d3077c6643d9aded95b94efd9b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 36, 36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c4b6376ea914d291cea2802023fdce0c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1f63089c655b9f9ef71187f1bc76700e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[2.102309226989746]], [[2.0835232734680176]], [[2.6745057106018066]], [[1.634010672569275]], [[1.626343846321106]], [[1.898132562637329]], [[2.039623737335205]], [[1.934592366218567]], [[2.5141489505767822]], [[1.8221969604492188]], [[1.8926172256469727]], [[1.987426519393921]], [[2.1937639713287354]], [[1.5194551944732666]], [[2.159522294998169]], [[1.3361855745315552]], [[1.6347235441207886]], [[2.5471084117889404]], [[2.088796615600586]], [[2.858461380004883]]]], dtype='float32').reshape([1, 20, 1, 1]),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6913f4e8833f5830f8c2c38d619c2ab3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 40, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e4425876e80ee64a0bb4c238e6b64a7a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c8ca75a681b0b56d9b5a39c88dcf1fd4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2738f0f2347de606653135c20ce6942e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3bd6e2eee3bf5a1f64549b9ad83de2fe
-    def get_inputs(self):
-        return [
-            paddle.uniform([3800, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_df23049d04e3d9069f7905f262ab8dfd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 672, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2430f31ebe1ac84d0b5b7e3c6f17ee18(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 144, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_919bec34a30675edc5c86a46448f61c6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 12, 12], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5bfb03a3e3f7ed43cd4b2b44d08cc322(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 15, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_66738093df3ef8cacf742ea97772b6dd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 20, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8439038ec4f6be499a59b33e7536f87b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_515a9eaade68c86cbabe69c25dad9195(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 38, 38], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bd9a1b87c68e4162f79a27b9dd8ef385(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 480, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d07d56d0f287f4e1a46f76e0940ea19b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 56, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c6232c7fb70674bc558ef04ce29ac74a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 576, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5c6efef09c5483bad57dece435ef07a8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 42, 42], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_380d05d3077c6643d9aded95b94efd9b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 36, 36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_beed642845808d818f148ee53d200ac1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 12, 12], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d1d222ae02e291c9d66ef8cca3e723d2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3bd6e2eee3bf5a1f64549b9ad83de2fe
-    def get_inputs(self):
-        return [
-            paddle.uniform([70, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6928a65954dc33d991fe5a2b57e65259(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1042570547208b02ae9333d636f3916c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 30, 50], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_44a6eeb0342898b6d5be12b14a4d108b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 32, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e5a17b509c1cc48a104dd6d0d09dd660(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1d9e81655342124501eb962876f51a95(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 288, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_75d2b793b91ab12ec062eab8933ab257(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 32, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1f5b2748aaea9351777f20ba22439310(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 25, 38], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_512d0cc8d4a48960a331f3320f582c90(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_512d0cc8d4a48960a331f3320f582c90(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8c6c71c314d4b016859b16f625bb8c1f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 7, 10], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bb9158fdf18fd4c1c1a0ec3b65956cec(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 144, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b1067073c90f77a8d5fbe6f37eb64a59(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9, 14, 20], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_44f9d213532edff72838fa9845be18a6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 68, 68], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9e68b6b2cd7ca5680546cf7a8277b11d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 144, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d2587207642d79b72dd8544b0f7eb812(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 48, 48], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_646883311c8aee13507f06fb7c599924(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 48, 48], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_632396a5882fe2b7812053b874492b43(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 100, 152], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b240c6519c8ff3d275b701b7466de8a7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 1152, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8a900d2888f706e671962fcfbfd1a072(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_829eb3f3b4fa1a384a8e93768bb07cbc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 192, 288], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+if __name__ == "__main__":
+    sys.exit(table.main(__file__))
@@ -1,2085 +1,28 @@
 import os
-os.environ['FLAGS_cinn_new_group_scheduler'] = '1'
-os.environ['FLAGS_group_schedule_tiling_first'] = '1'
-os.environ['FLAGS_enable_pir_api'] = '1'
-os.environ['FLAGS_cinn_bucket_compile'] = '1'
 import sys
-import unittest
-import numpy as np
-from dataclasses import dataclass
-import typing as t
 
-@dataclass
-class Stage:
-    name: str
-    env_vars: t.Dict[str, str]
+import pytest
 
-cinn_stages = [
-    Stage(
-        name="dynamic_to_static",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=False,
-            FLAGS_prim_all=False,
-            FLAGS_prim_enable_dynamic=False,
-        ),
-    ),
-    Stage(
-        name="prim",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=False,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-        ),
-    ),
-    Stage(
-        name="infer_symbolic",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=False,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-            FLAGS_use_cinn=False,
-            FLAGS_check_infer_symbolic=True,
-        ),
-    ),
-	Stage(
-        name="frontend",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=True,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-            FLAGS_use_cinn=True,
-            FLAGS_check_infer_symbolic=False,
-            FLAGS_enable_fusion_fallback=True,
-        ), 
-    ),
-    Stage(
-        name="backend",
-        env_vars=dict(
-            PADDLE_DEBUG_ENABLE_CINN=True,
-            FLAGS_prim_all=True,
-            FLAGS_prim_enable_dynamic=True,
-            FLAGS_use_cinn=True,
-            FLAGS_check_infer_symbolic=False,
-            FLAGS_enable_fusion_fallback=False,
-        ), 
-    ),
-]
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir, os.pardir))
+from tools.e2e_case_stage import CinnStages  # noqa: E402
 
-def GetCinnStageByName(name):
-    for stage in cinn_stages:
-        if stage.name == name:
-            return stage
-    return None
+stages = CinnStages(__file__)
 
-def GetCurrentCinnStage():
-    name = os.getenv('PADDLE_DEBUG_CINN_STAGE_NAME')
-    if name is None:
-        return None
-    stage_names = [stage.name for stage in cinn_stages]
-    assert name in stage_names, (
-        f"PADDLE_DEBUG_CINN_STAGE_NAME should be in {stage_names}"
-    )
-    return GetCinnStageByName(name)
+from tools.e2e_case_table import E2ECaseTable, CinnTestBase  # noqa: E402
 
-def GetPrevCinnStage(stage):
-    for i in range(1, len(cinn_stages)):
-        if stage is cinn_stages[i]:
-            return cinn_stages[i - 1]
-    return None
+stages.apply()
+table = E2ECaseTable(__file__)
+last_stage_failed = stages.last_stage_failed()
 
-def IsCinnStageEnableDiff():
-    value = os.getenv('PADDLE_DEBUG_CINN_STAGE_ENABLE_DIFF')
-    enabled = value in {
-        '1',
-        'true',
-        'True',
-    }
-    if enabled:
-        assert GetCurrentCinnStage() is not None
-    return enabled
 
-last_cinn_stage_exit_code = None
-def LastCINNStageFailed():
-    global last_cinn_stage_exit_code
-    if last_cinn_stage_exit_code is not None:
-        return last_cinn_stage_exit_code != 0
-    last_stage = GetPrevCinnStage(GetCurrentCinnStage())
-    if last_stage is None:
-        return False
-    env_vars = dict(
-        PADDLE_DEBUG_CINN_STAGE_NAME=last_stage.name,
-        PADDLE_DEBUG_CINN_STAGE_ENABLE_DIFF='0',
-    )
-    env_vars_str = " ".join(
-        f"{env_var}={value}"
-        for env_var, value in env_vars.items()
-    )
-    last_cinn_stage_exit_code = os.system(
-        f"{env_vars_str} {sys.executable} {__file__} > /dev/null 2>&1"
-    )
-    return last_cinn_stage_exit_code != 0
+def pytest_generate_tests(metafunc):
+    table.parametrize(metafunc)
 
-def SetDefaultEnv(**env_var2value):
-    for env_var, value in env_var2value.items():
-        if os.getenv(env_var) is None:
-            os.environ[env_var] = str(value)
 
-SetDefaultEnv(
-    PADDLE_DEBUG_CINN_STAGE_NAME="backend",
-    PADDLE_DEBUG_CINN_STAGE_ENABLE_DIFF=False,
-    PADDLE_DEBUG_ENABLE_CINN=True,
-    FLAGS_enable_pir_api=True,
-    FLAGS_prim_all=True,
-    FLAGS_prim_enable_dynamic=True,
-    FLAGS_use_cinn=False,
-    FLAGS_check_infer_symbolic=False,
-    FLAGS_enable_fusion_fallback=False,
-)
+@pytest.mark.skipif(last_stage_failed, reason="last stage failed")
+class TestPrimitiveOp(CinnTestBase):
+    table = table
 
-import paddle
 
-def SetEnvVar(env_var2value):
-    for env_var, value in env_var2value.items():
-        os.environ[env_var] = str(value)
-    paddle.set_flags({
-        env_var:value
-        for env_var, value in env_var2value.items()
-        if env_var.startswith('FLAGS_')
-    })
-
-if GetCurrentCinnStage() is not None:
-    SetEnvVar(GetCurrentCinnStage().env_vars)
-
-def GetEnvVarEnableJit():
-    enable_jit = os.getenv('PADDLE_DEBUG_ENABLE_JIT')
-    return enable_jit not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
-
-def GetEnvVarEnableCinn():
-    enable_cinn = os.getenv('PADDLE_DEBUG_ENABLE_CINN')
-    if enable_cinn is None:
-        return True
-    return enable_cinn not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
-
-
-def GetTolerance(dtype):
-    if dtype == np.float16:
-        return GetFloat16Tolerance()
-    if dtype == np.float32:
-        return GetFloat32Tolerance()
-    return 1e-6
-
-def GetFloat16Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT16_TOL'))
-    except:
-        return 1e-3
-
-def GetFloat32Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT32_TOL'))
-    except:
-        return 1e-6
-
-def IsInteger(dtype):
-    return np.dtype(dtype).char in np.typecodes['AllInteger']
-
-def ApplyToStatic(net, use_cinn):
-    build_strategy = paddle.static.BuildStrategy()
-    build_strategy.build_cinn_pass = use_cinn
-    return paddle.jit.to_static(
-        net,
-        input_spec=net.get_input_spec(),
-        build_strategy=build_strategy,
-        full_graph=True,
-    )
-
-class InstanceTrait:
-
-    @classmethod
-    def instance(cls):
-        if cls.instance_ is None:
-            cls.instance_ = cls()
-        return cls.instance_
-
-    @classmethod
-    def static_instance_with_cinn(cls):
-        if cls.static_instance_with_cinn_ is None:
-            cls.static_instance_with_cinn_ = ApplyToStatic(
-                cls.instance(),
-                use_cinn=True
-            )
-        return cls.static_instance_with_cinn_
-
-    @classmethod
-    def static_instance_without_cinn(cls):
-        if cls.static_instance_without_cinn_ is None:
-            cls.static_instance_without_cinn_ = ApplyToStatic(
-                cls.instance(),
-                use_cinn=False
-            )
-        return cls.static_instance_without_cinn_
-
-
-class CinnTestBase:
-
-    def setUp(self):
-        paddle.seed(2024)
-        self.prepare_data()
-
-    def test_train(self):
-        dy_outs = self.train(use_cinn=False)
-        cinn_outs = self.train(use_cinn=GetEnvVarEnableCinn())
-
-        for cinn_out, dy_out in zip(cinn_outs, dy_outs):
-          if type(cinn_out) is list and type(dy_out) is list:
-            for x, y in zip(cinn_out, dy_out):
-              self.assert_all_close(x, y)
-          else:
-            self.assert_all_close(cinn_out, dy_out)
-
-    def train(self, use_cinn):
-        if GetEnvVarEnableJit():
-            net = self.prepare_static_net(use_cinn)
-        else:
-            net = self.prepare_net()
-        paddle.seed(2024)
-        out = net(*self.inputs)
-        return out
-    
-    def prepare_data(self):
-        self.inputs = self.get_inputs()
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def prepare_net(self):
-        return self.get_test_class().instance()
-
-    def prepare_static_net(self, use_cinn):
-        if use_cinn:
-            return self.get_test_class().static_instance_with_cinn()
-        else:
-            return self.get_test_class().static_instance_without_cinn()
-
-    def assert_all_close(self, x, y):
-        if (hasattr(x, "numpy") and hasattr(y, "numpy")):
-            x_numpy = x.numpy()
-            y_numpy = y.numpy()
-            assert x_numpy.dtype == y_numpy.dtype
-            if IsInteger(x_numpy.dtype):
-                np.testing.assert_equal(x_numpy, y_numpy)
-            else:
-                tol = GetTolerance(x_numpy.dtype)
-                np.testing.assert_allclose(x_numpy, y_numpy, atol=tol, rtol=tol)
-        else:
-            assert x == y
-
-
-
-
-
-last_stage_failed = (IsCinnStageEnableDiff() and LastCINNStageFailed())
-class PrimitiveOp_5405230c684bce5bb62f2a8509f6b1a9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.softmax(input_0, -1)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 21504, 1, 91], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d1c55c4f5f74c658ffc79a9bea8d5cce(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5405230c684bce5bb62f2a8509f6b1a9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 21504, 1, 91], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_aa0302b80b29182cc53b9c323ff96a2f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.softmax(input_0, -1)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 4, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6b9747c685ca12f0aeab98b88c0928ee(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_aa0302b80b29182cc53b9c323ff96a2f
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 4, 100, 100], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_f5b6851fedd1ccfd5893a25a148c15da(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.softmax(input_0, -1)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 3, 198, 198], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6dfa4634fef16a71c9642518e0349423(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f5b6851fedd1ccfd5893a25a148c15da
-    def get_inputs(self):
-        return [
-            paddle.uniform([54, 3, 198, 198], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_d62c81312814cc7e898201cd153a53b8(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.softmax(input_0, -1)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 4, 19], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_592834e449dbe8c112502427a8835865(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d62c81312814cc7e898201cd153a53b8
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3549, 4, 19], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e4d779f137eb56636948c532a1ab0b7e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_aa0302b80b29182cc53b9c323ff96a2f
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 4, 320, 320], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_29f858c96375633d77103aadd868cb6c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.softmax(input_0, 2)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 19, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_58b8be7216b5006789ca4031e627b254(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_29f858c96375633d77103aadd868cb6c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 19, 32768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_fd8bfc6913ff3e9a13af22806f288ce4(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.softmax(input_0, -1)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 4, 17], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bb3aa14ed25f8b0e0c6ec6f1ccc4e07c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fd8bfc6913ff3e9a13af22806f288ce4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 7581, 4, 17], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_898528d92e1048822165849538586bba(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.softmax(input_0, 2)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 21, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_500ca157f16bdea9bf333bcf78980355(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_898528d92e1048822165849538586bba
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 21, 16384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_476752f11064770061c7b83c425af722(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fd8bfc6913ff3e9a13af22806f288ce4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4725, 4, 17], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_1d852abd7e5a5fcfbd2b150923031ebc(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.softmax(input_0, -1)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 12, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f630a10c5ce22219c7d2524592a8773d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1d852abd7e5a5fcfbd2b150923031ebc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 12, 577, 577], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_6bc615f73fff674f4d0b441ba365eb00(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.softmax(input_0, -1)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 2, 16384, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3a56d5029dc441c635f8e997f829912d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6bc615f73fff674f4d0b441ba365eb00
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 16384, 1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fe37ac1837d2afa8248f97f85d0a4d5f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fd8bfc6913ff3e9a13af22806f288ce4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8400, 4, 17], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1c149e650a87cf97dd9768aa1720b52d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fd8bfc6913ff3e9a13af22806f288ce4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3549, 4, 17], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_ecb671380a1691809656050c6ada6619(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.softmax(input_0, -1)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 2, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_87c30755f50e15737193337664d789be(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ecb671380a1691809656050c6ada6619
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 2, 640, 640], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0a49a3c06a9edf0f7492848830c81f32(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f5b6851fedd1ccfd5893a25a148c15da
-    def get_inputs(self):
-        return [
-            paddle.uniform([86, 3, 198, 198], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_1a8c185809c6fb1ad3a9f5d40475bbc5(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.softmax(input_0, -1)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 8, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_98c4007e380d6c59d317aa7e0c4e674a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1a8c185809c6fb1ad3a9f5d40475bbc5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8, 512, 512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6b9747c685ca12f0aeab98b88c0928ee(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_aa0302b80b29182cc53b9c323ff96a2f
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 4, 100, 100], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_376c22a15ca3486966ff78be53b40d4f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fd8bfc6913ff3e9a13af22806f288ce4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4116, 4, 17], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0ffa69dc7750da3a33fe3f0bc58c2690(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fd8bfc6913ff3e9a13af22806f288ce4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 6069, 4, 17], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_19450f68eed62b7f83de483ce1f8d166(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.softmax(input_0, 2)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 4, None, 13, 19], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_04c7102f4011e9e2898163191d8d7e1b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_19450f68eed62b7f83de483ce1f8d166
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 17, 13, 19], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_d95370fcc6f7f0768a236aa19e53eaa6(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.softmax(input_0, -1)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 6, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a2323c8927d5a0b88b2cce84f2a4db7a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d95370fcc6f7f0768a236aa19e53eaa6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 6, 1025, 1025], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_bc3ce10c92dfeb516d11651d37229013(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.softmax(input_0, -1)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_de09407970db844c2b2b9b14715885fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc3ce10c92dfeb516d11651d37229013
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4096, 4096], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_93841af3525ce389a188f30432a33018(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.softmax(input_0, -1)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 5, 2048, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bc0da74477ff8173007aa3a0d8ef8cb8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_93841af3525ce389a188f30432a33018
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 5, 2048, 512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c49f5c4c508d1793383b697305e3cc75(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1a8c185809c6fb1ad3a9f5d40475bbc5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8, 1024, 1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_6595943037539b86389343ede10d8ee7(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.softmax(input_0, -1)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 3, 197, 197], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_883883be2c7e4abaa156f2b67b0d920f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6595943037539b86389343ede10d8ee7
-    def get_inputs(self):
-        return [
-            paddle.uniform([54, 3, 197, 197], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_cc152534cb774bf56bd0dc3ce4b18bdf(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.softmax(input_0, -1)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 1, 65536, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0aa683d3aa5fa680ef173cf101688437(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cc152534cb774bf56bd0dc3ce4b18bdf
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 65536, 1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e4d779f137eb56636948c532a1ab0b7e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_aa0302b80b29182cc53b9c323ff96a2f
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 4, 320, 320], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_077e1aedbe2702d7e862a7af8663077f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.softmax(input_0, -1)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 1, 32768, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5a309406d485022c3e0ad4b51c9eaa34(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_077e1aedbe2702d7e862a7af8663077f
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 32768, 512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8b75e73d4c0147b2b48a766a3af5059f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ecb671380a1691809656050c6ada6619
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 2, 200, 200], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_dfa2cf5e0d85571417c1b94160845ff8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fd8bfc6913ff3e9a13af22806f288ce4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9261, 4, 17], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_8b45e047486285ee22613eefb9a58f0c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.softmax(input_0, -1)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 2, 8192, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7d17d9d8d1cfd9e15f56732150c9f164(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8b45e047486285ee22613eefb9a58f0c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 8192, 512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bc0da74477ff8173007aa3a0d8ef8cb8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_93841af3525ce389a188f30432a33018
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 5, 2048, 512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9e434ab1bb9e41f5a1b235d2d9883bd0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fd8bfc6913ff3e9a13af22806f288ce4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2100, 4, 17], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_92508bf78afc2a166c942ebb4ab00916(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc3ce10c92dfeb516d11651d37229013
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8192, 8192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2a45a5eb8bcfd94010fda67fec9b7c7c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1d852abd7e5a5fcfbd2b150923031ebc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 12, 1025, 1025], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_bd0bd8a703ddd6181c5c8421d52a5534(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.softmax(input_0, -1)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 512, 512], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_08a3a8343a93fdde0ad6c51f7e9942a0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bd0bd8a703ddd6181c5c8421d52a5534
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c49f5c4c508d1793383b697305e3cc75(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1a8c185809c6fb1ad3a9f5d40475bbc5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8, 1024, 1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_2e64c5bfff19739eca208af7371242de(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fd8bfc6913ff3e9a13af22806f288ce4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 11109, 4, 17], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_7ccdbb8f4859b9a4cde400390474c6c0(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.softmax(input_0, 2)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 4, None, 50, 76], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5f9263cc95df3c1a35ecbe86ef07b443(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7ccdbb8f4859b9a4cde400390474c6c0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 17, 50, 76], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_e05b4c177f53d326acf8a307fb11e0ef(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.softmax(input_0, -1)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 5, 4096, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_920defd529d24406fe4a9de08ed7a4b7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e05b4c177f53d326acf8a307fb11e0ef
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 5, 4096, 1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_920defd529d24406fe4a9de08ed7a4b7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e05b4c177f53d326acf8a307fb11e0ef
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 5, 4096, 1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_98c4007e380d6c59d317aa7e0c4e674a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1a8c185809c6fb1ad3a9f5d40475bbc5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8, 512, 512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3a56d5029dc441c635f8e997f829912d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6bc615f73fff674f4d0b441ba365eb00
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 16384, 1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7d17d9d8d1cfd9e15f56732150c9f164(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8b45e047486285ee22613eefb9a58f0c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 8192, 512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e4bd55f44dc4f81478060f8a0f61239c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6595943037539b86389343ede10d8ee7
-    def get_inputs(self):
-        return [
-            paddle.uniform([86, 3, 197, 197], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5a309406d485022c3e0ad4b51c9eaa34(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_077e1aedbe2702d7e862a7af8663077f
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 32768, 512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_08a3a8343a93fdde0ad6c51f7e9942a0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bd0bd8a703ddd6181c5c8421d52a5534
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0e6ac09606fcc932df52677fc41a32a7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fd8bfc6913ff3e9a13af22806f288ce4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3024, 4, 17], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_65e0b54a5e3b3a9ba1af1092ffa8d819(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1a8c185809c6fb1ad3a9f5d40475bbc5
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 8, 160, 160], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_5ef98623820c17326fa6af30060182af(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d95370fcc6f7f0768a236aa19e53eaa6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 6, 1174, 1174], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_3912cac523fdd90b7e52ba83a9b092ad(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.softmax(input_0, 2)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 4, None, 25, 38], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_594a9a28d3b978bd43dec86a74d7e286(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3912cac523fdd90b7e52ba83a9b092ad
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 17, 25, 38], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_462b0262db4a6a19152bdea8c519e189(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.softmax(input_0, 2)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 4, None, 7, 10], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_760589b53faff8b0cb96eec9078b96d9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_462b0262db4a6a19152bdea8c519e189
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 17, 7, 10], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bd88c08f98cbcb82a9a778448d8df1fa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1d852abd7e5a5fcfbd2b150923031ebc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 12, 1174, 1174], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0aa683d3aa5fa680ef173cf101688437(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cc152534cb774bf56bd0dc3ce4b18bdf
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 65536, 1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_056455902c08ae8d1681826073cf5d5a(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.softmax(input_0, 2)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 4, None, 100, 152], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_18022ea633e486614918934cc9cd57d5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_056455902c08ae8d1681826073cf5d5a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 17, 100, 152], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_174fe3ddce08f129eb02aa71ec388600(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1a8c185809c6fb1ad3a9f5d40475bbc5
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 8, 50, 50], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_7b2d2618957669de61cb72eb95eb2fdd(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.softmax(input_0, -1)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b138959f510755af483971b232266a11(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b2d2618957669de61cb72eb95eb2fdd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 21504, 1, 91], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9c309182caad0f9f9b5d924fee058d32(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b2d2618957669de61cb72eb95eb2fdd
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 4, 100, 100], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_8112a2a61c8821f20d9838f147258502(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b2d2618957669de61cb72eb95eb2fdd
-    def get_inputs(self):
-        return [
-            paddle.uniform([54, 3, 198, 198], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_48008080899aa32fd95d03343b107694(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b2d2618957669de61cb72eb95eb2fdd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3549, 4, 19], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1d17bbde074fe0f2fdb314abc06aed3a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b2d2618957669de61cb72eb95eb2fdd
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 4, 320, 320], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_21a92973d0a5a9a9a8178008eac96f97(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.softmax(input_0, 2)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3e1c77c7d1519847463221dfe1acb139(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21a92973d0a5a9a9a8178008eac96f97
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 19, 32768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_411462b5d9078439881fffc50101c32f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b2d2618957669de61cb72eb95eb2fdd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 7581, 4, 17], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_278ee7e743d5e1b8d1527d084173d307(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21a92973d0a5a9a9a8178008eac96f97
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 21, 16384], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e70f76d8ea25248afa9115c32383f63b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b2d2618957669de61cb72eb95eb2fdd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4725, 4, 17], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1b0db58ad9cee6b3db8a87c9653ecc1e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b2d2618957669de61cb72eb95eb2fdd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 12, 577, 577], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_aac7b8a19c82a07254fe0449e0495e04(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b2d2618957669de61cb72eb95eb2fdd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 16384, 1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_57977e2ca11432da9c1291fb58445c2f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b2d2618957669de61cb72eb95eb2fdd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8400, 4, 17], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f28fab682bcdae1651d35daa1ba69e02(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b2d2618957669de61cb72eb95eb2fdd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3549, 4, 17], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_6054281464e0a23e6f01acc85e0ccb75(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b2d2618957669de61cb72eb95eb2fdd
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 2, 640, 640], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c76a98a02cf940c1e2ebf63b56363ccd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b2d2618957669de61cb72eb95eb2fdd
-    def get_inputs(self):
-        return [
-            paddle.uniform([86, 3, 198, 198], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b57b030fcc93ad97d5fbc670dea110f8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b2d2618957669de61cb72eb95eb2fdd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8, 512, 512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_9c309182caad0f9f9b5d924fee058d32(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b2d2618957669de61cb72eb95eb2fdd
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 4, 100, 100], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_dbba7b512602012d3fea2179b3fdb500(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b2d2618957669de61cb72eb95eb2fdd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4116, 4, 17], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4471c7a94de6c3b580f04e3e430ecde2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b2d2618957669de61cb72eb95eb2fdd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 6069, 4, 17], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-class PrimitiveOp_2f5fc46e74c164239d7a0a133591d0c6(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, arg_0):
-        input_0 = arg_0
-        return paddle._C_ops.softmax(input_0, 2)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_a90dedb556a691801ca1537dc0f317bd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2f5fc46e74c164239d7a0a133591d0c6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 17, 13, 19], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fcc4ce2a04acf7b2e4ea771cd56e9bd1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b2d2618957669de61cb72eb95eb2fdd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 6, 1025, 1025], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_de09407970db844c2b2b9b14715885fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc3ce10c92dfeb516d11651d37229013
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4096, 4096], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d86b709e160e62e4a6270f650f13c264(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b2d2618957669de61cb72eb95eb2fdd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 5, 2048, 512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_39e6a655ceaf8ce55592cd1b4f522480(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b2d2618957669de61cb72eb95eb2fdd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8, 1024, 1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fce988f440299d516627dddd94391d18(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b2d2618957669de61cb72eb95eb2fdd
-    def get_inputs(self):
-        return [
-            paddle.uniform([54, 3, 197, 197], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f2bb9be6cab2bf738b81d9ac86052a80(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b2d2618957669de61cb72eb95eb2fdd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 65536, 1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1d17bbde074fe0f2fdb314abc06aed3a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b2d2618957669de61cb72eb95eb2fdd
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 4, 320, 320], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_537469be2517e04d1d1cb589d70badc5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b2d2618957669de61cb72eb95eb2fdd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 32768, 512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_fb5b2392c6a895ea3ca41d9d5ebc7dcd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b2d2618957669de61cb72eb95eb2fdd
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 2, 200, 200], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_7eefec0668f8a0bfac720f5ec9989369(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b2d2618957669de61cb72eb95eb2fdd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9261, 4, 17], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3b5815c8990ca932f6dfd7ba0a692225(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b2d2618957669de61cb72eb95eb2fdd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 8192, 512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_d86b709e160e62e4a6270f650f13c264(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b2d2618957669de61cb72eb95eb2fdd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 5, 2048, 512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_ff92ada830d588425cf6910408e3239d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b2d2618957669de61cb72eb95eb2fdd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2100, 4, 17], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_92508bf78afc2a166c942ebb4ab00916(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc3ce10c92dfeb516d11651d37229013
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8192, 8192], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e7919aa3411a7663af5be4055ee4db25(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b2d2618957669de61cb72eb95eb2fdd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 12, 1025, 1025], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0005acbefab17d0f816ebb9a36c604a6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc3ce10c92dfeb516d11651d37229013
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_39e6a655ceaf8ce55592cd1b4f522480(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b2d2618957669de61cb72eb95eb2fdd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8, 1024, 1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_1bd39adf8a112915b532c7986b7a7788(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b2d2618957669de61cb72eb95eb2fdd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 11109, 4, 17], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_4edb1f0eb61934586251249904163027(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2f5fc46e74c164239d7a0a133591d0c6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 17, 50, 76], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c7d5b31cadb08c8f6d8c6d7a786576de(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b2d2618957669de61cb72eb95eb2fdd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 5, 4096, 1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_c7d5b31cadb08c8f6d8c6d7a786576de(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b2d2618957669de61cb72eb95eb2fdd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 5, 4096, 1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_b57b030fcc93ad97d5fbc670dea110f8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b2d2618957669de61cb72eb95eb2fdd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8, 512, 512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_aac7b8a19c82a07254fe0449e0495e04(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b2d2618957669de61cb72eb95eb2fdd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 16384, 1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_3b5815c8990ca932f6dfd7ba0a692225(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b2d2618957669de61cb72eb95eb2fdd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 8192, 512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_e27d8f239f00cb2cd66998d00940d369(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b2d2618957669de61cb72eb95eb2fdd
-    def get_inputs(self):
-        return [
-            paddle.uniform([86, 3, 197, 197], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_537469be2517e04d1d1cb589d70badc5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b2d2618957669de61cb72eb95eb2fdd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 32768, 512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_0005acbefab17d0f816ebb9a36c604a6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc3ce10c92dfeb516d11651d37229013
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 512], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_609533c8660de59528ce984b64dea2ee(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b2d2618957669de61cb72eb95eb2fdd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3024, 4, 17], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_888153c39cc05c8e9b56d9d179a9cbb6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b2d2618957669de61cb72eb95eb2fdd
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 8, 160, 160], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_dcaa9420cc7161f8391af36522a0ad98(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b2d2618957669de61cb72eb95eb2fdd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 6, 1174, 1174], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_869bce00a8504c4d5b4bb8c8342e4530(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2f5fc46e74c164239d7a0a133591d0c6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 17, 25, 38], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f6489f9d4df742417528383c7ea2e78d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2f5fc46e74c164239d7a0a133591d0c6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 17, 7, 10], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_23b9787a142c506a7505a7e1e22ad1e0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b2d2618957669de61cb72eb95eb2fdd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 12, 1174, 1174], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_f2bb9be6cab2bf738b81d9ac86052a80(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b2d2618957669de61cb72eb95eb2fdd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 65536, 1024], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_bb9aefbdd62bee20160d5ef753c7bb9b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2f5fc46e74c164239d7a0a133591d0c6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 17, 100, 152], dtype='float32', min=0, max=0.5),
-        ]
-
-
-@unittest.skipIf(last_stage_failed, "last stage failed")
-class TestPrimitiveOp_78580366f10e57ccf73a4dd7fcaf6ebf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b2d2618957669de61cb72eb95eb2fdd
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 8, 50, 50], dtype='float32', min=0, max=0.5),
-        ]
-
-
-
-
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+if __name__ == "__main__":
+    sys.exit(table.main(__file__))